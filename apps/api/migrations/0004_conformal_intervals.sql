@@ -0,0 +1,13 @@
+-- Adds conformal intervals beside the normal ones on `translation_predictions`.
+-- Their half-widths are the quantiles of each direction's leave-one-player-out
+-- residuals, so a direction the pooled residual spread understates gets a wider
+-- interval rather than the same one.
+--
+-- Nullable, unlike `pi80_*` and `pi95_*`. A direction with too few movers has
+-- no finite conformal width at 95% (fourteen players cannot support one), and
+-- an invented number would be worse than a missing one. The normal interval is
+-- still always there, so no prediction is ever served without an interval.
+ALTER TABLE `translation_predictions` ADD `conformal80_low` real;
+ALTER TABLE `translation_predictions` ADD `conformal80_high` real;
+ALTER TABLE `translation_predictions` ADD `conformal95_low` real;
+ALTER TABLE `translation_predictions` ADD `conformal95_high` real;
@@ -0,0 +1,24 @@
+-- Adds comparables across eras and leagues beside the same-season ones.
+-- `scope` is `season`, `era` or `all`, and joins the primary key;
+-- `neighbour_season_id` says which season of the neighbour was matched, which
+-- only the same-season scope could leave implicit.
+--
+-- Recreated rather than altered, as `hypothetical_projections` was: SQLite
+-- cannot change a primary key in place, and every row here is derived and
+-- truncated by the loader before each insert.
+DROP TABLE IF EXISTS `player_comps`;
+
+CREATE TABLE `player_comps` (
+	`scope` text NOT NULL,
+	`season_id` text NOT NULL,
+	`person_id` text NOT NULL,
+	`rank` integer NOT NULL,
+	`neighbour_season_id` text NOT NULL,
+	`neighbour_person_id` text NOT NULL,
+	`distance` real NOT NULL,
+	`model_version` text NOT NULL,
+	PRIMARY KEY(`scope`, `season_id`, `person_id`, `rank`),
+	FOREIGN KEY (`person_id`) REFERENCES `persons`(`person_id`) ON UPDATE no action ON DELETE no action
+);
+
+CREATE INDEX `idx_comps_person` ON `player_comps` (`person_id`,`scope`);
@@ -153,6 +153,14 @@ export const translationPredictions = sqliteTable(
     pi80High: real("pi80_high").notNull(),
     pi95Low: real("pi95_low").notNull(),
     pi95High: real("pi95_high").notNull(),
+    /**
+     * Conformal intervals from the direction's leave-one-player-out residuals.
+     * Null where the direction has too few movers for a finite width.
+     */
+    conformal80Low: real("conformal80_low"),
+    conformal80High: real("conformal80_high"),
+    conformal95Low: real("conformal95_low"),
+    conformal95High: real("conformal95_high"),
     /** What actually happened, where the move is already in the past. */
     actualValue: real("actual_value"),
     baselineLeagueMean: real("baseline_league_mean").notNull(),
@@ -279,22 +287,29 @@ export const archetypeDefinitions = sqliteTable(
  * previous version scanned an entire season table and ran cosine similarity
  * per call — survivable against four hardcoded players, impossible against six
  * hundred real ones.
+ *
+ * `scope` says where a comparable may come from: `season` (contemporaries in
+ * the same league-season), `era` (any league, two seasons either way) or `all`
+ * (any league, any season). Outside `season` the neighbour's own season is
+ * what makes the row readable, so it is stored beside the neighbour.
  */
 export const playerComps = sqliteTable(
   "player_comps",
   {
+    scope: text("scope").notNull(),
     seasonId: text("season_id").notNull(),
     personId: text("person_id")
       .notNull()
       .references(() => persons.personId),
     rank: integer("rank").notNull(),
+    neighbourSeasonId: text("neighbour_season_id").notNull(),
     neighbourPersonId: text("neighbour_person_id").notNull(),
     distance: real("distance").notNull(),
     modelVersion: text("model_version").notNull(),
   },
   (table) => [
-    primaryKey({ columns: [table.seasonId, table.personId, table.rank] }),
-    index("idx_comps_person").on(table.personId),
+    primaryKey({ columns: [table.scope, table.seasonId, table.personId, table.rank] }),
+    index("idx_comps_person").on(table.personId, table.scope),
   ]
 );
 
@@ -139,7 +139,8 @@ export const ENDPOINTS: readonly Endpoint[] = [
     path: "/players/{playerId}/comps",
     state: "live",
     description:
-      "Comparables precomputed in whitened archetype space, with the distance metric stated.",
+      "Comparables precomputed in whitened archetype space, with the distance metric stated, " +
+      "within the same season or across eras and leagues (`scope=season|era|all`).",
   },
   {
     path: "/players/{playerId}/archetype",
@@ -77,6 +77,9 @@ rolesRoute.get("/players/:personId/archetype", async (c) => {
   return c.json(envelope(c, rows, { snapshot: await snapshotId(db) }));
 });
 
+/** The `scope` column of `player_comps`, narrowest first. */
+const COMP_SCOPES = ["season", "era", "all"] as const;
+
 /**
  * Precomputed comparables.
  *
@@ -84,21 +87,37 @@ rolesRoute.get("/players/:personId/archetype", async (c) => {
  * similarity in the Worker on every request. Distance is Euclidean in the
  * whitened archetype space, which is also the correct metric — cosine over
  * shares on a simplex was not.
+ *
+ * `scope` defaults to `season`, the contemporaries this route has always
+ * served; `era` and `all` widen the search across leagues and decades.
  */
 rolesRoute.get("/players/:personId/comps", async (c) => {
   const personId = c.req.param("personId");
   const season = c.req.query("season");
+  const scope = c.req.query("scope") ?? "season";
   const limit = Math.min(Number(c.req.query("limit") ?? 10) || 10, 25);
 
+  if (!(COMP_SCOPES as readonly string[]).includes(scope)) {
+    return problem(c, {
+      status: 422,
+      code: "INVALID_QUERY",
+      title: "Invalid comparables scope",
+      detail: `scope must be one of ${COMP_SCOPES.join(", ")}; got "${scope}".`,
+      extensions: { scopes: COMP_SCOPES },
+    });
+  }
+
   const db = createDb(c.env.DB);
-  const filters = [eq(schema.playerComps.personId, personId)];
+  const filters = [eq(schema.playerComps.personId, personId), eq(schema.playerComps.scope, scope)];
   if (season) filters.push(eq(schema.playerComps.seasonId, season));
 
   const rows = await db
     .select({
+      scope: schema.playerComps.scope,
       seasonId: schema.playerComps.seasonId,
       rank: schema.playerComps.rank,
       distance: schema.playerComps.distance,
+      neighbourSeasonId: schema.playerComps.neighbourSeasonId,
       neighbourPersonId: schema.playerComps.neighbourPersonId,
       neighbourName: schema.persons.displayName,
       modelVersion: schema.playerComps.modelVersion,
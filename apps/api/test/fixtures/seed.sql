@@ -28,48 +28,48 @@ INSERT INTO seasons ("season_id", "league", "start_year", "season_order", "label
 ('NBA_2007', 'NBA', 2007, 2007, '2007-08'),
 ('EL_2008', 'EL', 2008, 2008, '2008-09'),
 ('NBA_2008', 'NBA', 2008, 2008, '2008-09'),
-('NBA_2009', 'NBA', 2009, 2009, '2009-10'),
 ('EL_2009', 'EL', 2009, 2009, '2009-10'),
-('NBA_2010', 'NBA', 2010, 2010, '2010-11'),
+('NBA_2009', 'NBA', 2009, 2009, '2009-10'),
 ('EL_2010', 'EL', 2010, 2010, '2010-11'),
+('NBA_2010', 'NBA', 2010, 2010, '2010-11'),
 ('EL_2011', 'EL', 2011, 2011, '2011-12'),
 ('NBA_2011', 'NBA', 2011, 2011, '2011-12'),
-('NBA_2012', 'NBA', 2012, 2012, '2012-13'),
 ('EL_2012', 'EL', 2012, 2012, '2012-13'),
-('NBA_2013', 'NBA', 2013, 2013, '2013-14'),
+('NBA_2012', 'NBA', 2012, 2012, '2012-13'),
 ('EL_2013', 'EL', 2013, 2013, '2013-14'),
-('NBA_2014', 'NBA', 2014, 2014, '2014-15'),
+('NBA_2013', 'NBA', 2013, 2013, '2013-14'),
 ('EL_2014', 'EL', 2014, 2014, '2014-15'),
+('NBA_2014', 'NBA', 2014, 2014, '2014-15'),
 ('EL_2015', 'EL', 2015, 2015, '2015-16'),
 ('GL_2015', 'GL', 2015, 2015, '2015-16'),
 ('NBA_2015', 'NBA', 2015, 2015, '2015-16'),
 ('EL_2016', 'EL', 2016, 2016, '2016-17'),
 ('GL_2016', 'GL', 2016, 2016, '2016-17'),
 ('NBA_2016', 'NBA', 2016, 2016, '2016-17'),
-('GL_2017', 'GL', 2017, 2017, '2017-18'),
 ('EL_2017', 'EL', 2017, 2017, '2017-18'),
+('GL_2017', 'GL', 2017, 2017, '2017-18'),
 ('NBA_2017', 'NBA', 2017, 2017, '2017-18'),
 ('EL_2018', 'EL', 2018, 2018, '2018-19'),
-('NBA_2018', 'NBA', 2018, 2018, '2018-19'),
 ('GL_2018', 'GL', 2018, 2018, '2018-19'),
-('NBA_2019', 'NBA', 2019, 2019, '2019-20'),
+('NBA_2018', 'NBA', 2018, 2018, '2018-19'),
 ('EL_2019', 'EL', 2019, 2019, '2019-20'),
 ('GL_2019', 'GL', 2019, 2019, '2019-20'),
-('NBA_2020', 'NBA', 2020, 2020, '2020-21'),
-('GL_2020', 'GL', 2020, 2020, '2020-21'),
+('NBA_2019', 'NBA', 2019, 2019, '2019-20'),
 ('EL_2020', 'EL', 2020, 2020, '2020-21'),
-('NBA_2021', 'NBA', 2021, 2021, '2021-22'),
-('GL_2021', 'GL', 2021, 2021, '2021-22'),
+('GL_2020', 'GL', 2020, 2020, '2020-21'),
+('NBA_2020', 'NBA', 2020, 2020, '2020-21'),
 ('EL_2021', 'EL', 2021, 2021, '2021-22'),
+('GL_2021', 'GL', 2021, 2021, '2021-22'),
+('NBA_2021', 'NBA', 2021, 2021, '2021-22'),
 ('EL_2022', 'EL', 2022, 2022, '2022-23'),
 ('GL_2022', 'GL', 2022, 2022, '2022-23'),
 ('NBA_2022', 'NBA', 2022, 2022, '2022-23'),
+('EL_2023', 'EL', 2023, 2023, '2023-24'),
 ('GL_2023', 'GL', 2023, 2023, '2023-24'),
 ('NBA_2023', 'NBA', 2023, 2023, '2023-24'),
-('EL_2023', 'EL', 2023, 2023, '2023-24'),
-('NBA_2024', 'NBA', 2024, 2024, '2024-25'),
+('EL_2024', 'EL', 2024, 2024, '2024-25'),
 ('GL_2024', 'GL', 2024, 2024, '2024-25'),
-('EL_2024', 'EL', 2024, 2024, '2024-25');
+('NBA_2024', 'NBA', 2024, 2024, '2024-25');
 INSERT INTO persons ("person_id", "display_name", "name_normalized", "birth_year", "leagues") VALUES
 ('nba_101126', 'Nate Robinson', 'nate robinson', 1983, 'GL+NBA'),
 ('nba_101127', 'Jarrett Jack', 'jarrett jack', 1983, 'GL+NBA'),
@@ -875,175 +875,425 @@ INSERT INTO player_seasons ("season_id", "person_id", "league", "team_name", "ga
 ('NBA_2023', 'nba_203995', 'NBA', 'CHA', 60, 1175.7, 0.20225, 0.52357, 0.34844, 0.19721, 0.41622, 12.921, 8.022, 2.694, 30.0, 1, 'fixture01'),
 ('NBA_2024', 'nba_203995', 'NBA', 'PHX', 41, 784.9, 0.21016, 0.46214, 0.22772, 0.20922, 0.45788, 12.338, 5.871, 4.082, 31.0, 1, 'fixture01');
 INSERT INTO model_versions ("model_version", "model_name", "trained_at", "git_sha", "run_id", "seed", "primary_metric", "primary_value", "primary_ci_low", "primary_ci_high", "n_train", "n_evaluated", "card_path") VALUES
-('translation-v1.0', 'translation', '2026-08-17T08:03:30.256343+00:00', 'ea022f3', '20260817T080330Z', 20260810, 'mae_usg_pct', 0.03317018280468844, 0.030627066726663314, 0.0356634323153447, 414, 367, 'services/ml/src/hoopslab/configs/model_cards/translation.md');
-INSERT INTO translation_predictions ("person_id", "source_season_id", "target_season_id", "direction", "metric", "source_value", "predicted", "pi80_low", "pi80_high", "pi95_low", "pi95_high", "actual_value", "baseline_league_mean", "baseline_z_preservation", "baseline_folk_rule", "model_version") VALUES
-('nba_101141', 'NBA_2006', 'EL_2007', 'NBA->EL', 'usg_pct', 0.20706, 0.26432, 0.21957, 0.30907, 0.19589, 0.33276, 0.2106, 0.20512, 0.21067, 0.15529, 'translation-v1.0'),
-('nba_101212', 'NBA_2005', 'EL_2007', 'NBA->EL', 'usg_pct', 0.13021, 0.20613, 0.16138, 0.25088, 0.13769, 0.27456, 0.28824, 0.20512, 0.14817, 0.09766, 'translation-v1.0'),
-('nba_1531', 'NBA_2006', 'EL_2007', 'NBA->EL', 'usg_pct', 0.22363, 0.2609, 0.21615, 0.30565, 0.19247, 0.32934, 0.27938, 0.20512, 0.22453, 0.16772, 'translation-v1.0'),
-('nba_101137', 'NBA_2006', 'EL_2008', 'NBA->EL', 'usg_pct', 0.15096, 0.21376, 0.16623, 0.26128, 0.14108, 0.28644, 0.24173, 0.20596, 0.16201, 0.11322, 'translation-v1.0'),
-('nba_101146', 'EL_2007', 'NBA_2008', 'EL->NBA', 'usg_pct', 0.21745, 0.19566, 0.143, 0.24832, 0.11513, 0.27619, 0.21381, 0.20024, 0.21476, 0.16309, 'translation-v1.0'),
-('nba_101198', 'EL_2007', 'NBA_2008', 'EL->NBA', 'usg_pct', 0.24973, 0.21779, 0.16514, 0.27045, 0.13726, 0.29832, 0.28108, 0.20024, 0.25274, 0.18729, 'translation-v1.0'),
-('nba_101132', 'NBA_2008', 'EL_2009', 'NBA->EL', 'usg_pct', 0.20117, 0.25523, 0.21058, 0.29987, 0.18694, 0.32351, 0.25757, 0.20549, 0.20628, 0.15088, 'translation-v1.0'),
-('nba_101141', 'EL_2008', 'NBA_2009', 'EL->NBA', 'usg_pct', 0.25269, 0.22176, 0.16964, 0.27387, 0.14205, 0.30146, 0.21232, 0.20024, 0.2515, 0.18952, 'translation-v1.0'),
-('nba_101132', 'EL_2009', 'NBA_2010', 'EL->NBA', 'usg_pct', 0.25757, 0.22313, 0.16947, 0.27679, 0.14107, 0.3052, 0.21838, 0.20037, 0.26296, 0.19318, 'translation-v1.0'),
-('nba_101146', 'NBA_2008', 'EL_2010', 'NBA->EL', 'usg_pct', 0.21381, 0.24159, 0.19902, 0.28416, 0.17649, 0.3067, 0.22422, 0.20425, 0.21523, 0.16036, 'translation-v1.0'),
-('nba_101187', 'EL_2009', 'NBA_2011', 'EL->NBA', 'usg_pct', 0.26486, 0.20295, 0.14743, 0.25848, 0.11803, 0.28788, 0.19233, 0.20059, 0.27442, 0.19864, 'translation-v1.0'),
-('nba_101132', 'NBA_2011', 'EL_2013', 'NBA->EL', 'usg_pct', 0.23863, 0.24996, 0.20491, 0.29501, 0.18106, 0.31886, 0.22237, 0.20212, 0.23299, 0.17898, 'translation-v1.0'),
-('nba_101249', 'NBA_2013', 'GL_2015', 'NBA->GL', 'usg_pct', 0.17056, 0.21157, 0.16193, 0.26121, 0.13565, 0.28749, 0.21288, 0.19983, 0.17133, 0.12792, 'translation-v1.0'),
-('nba_1626246', 'EL_2014', 'NBA_2015', 'EL->NBA', 'usg_pct', 0.23506, 0.20485, 0.15103, 0.25867, 0.12254, 0.28717, 0.22838, 0.20033, 0.23725, 0.1763, 'translation-v1.0'),
-('nba_101126', 'NBA_2014', 'GL_2016', 'NBA->GL', 'usg_pct', 0.22296, 0.24558, 0.19231, 0.29885, 0.16411, 0.32705, 0.20954, 0.20043, 0.22294, 0.16722, 'translation-v1.0'),
-('nba_1626150', 'GL_2015', 'NBA_2016', 'GL->NBA', 'usg_pct', 0.25049, 0.19024, 0.13326, 0.24722, 0.10309, 0.27738, 0.16405, 0.20038, 0.25853, 0.18786, 'translation-v1.0'),
-('nba_1626262', 'GL_2015', 'EL_2016', 'GL->EL', 'usg_pct', 0.24508, 0.19507, 0.14679, 0.24335, 0.12123, 0.26891, 0.17221, 0.20047, 0.24449, 0.18381, 'translation-v1.0'),
-('nba_1627098', 'EL_2015', 'NBA_2016', 'EL->NBA', 'usg_pct', 0.23876, 0.20691, 0.14993, 0.26389, 0.11976, 0.29405, 0.18145, 0.20038, 0.24457, 0.17907, 'translation-v1.0'),
-('nba_1627851', 'EL_2015', 'NBA_2016', 'EL->NBA', 'usg_pct', 0.27828, 0.2389, 0.18192, 0.29588, 0.15176, 0.32604, 0.19184, 0.20038, 0.29303, 0.20871, 'translation-v1.0'),
-('nba_1626188', 'GL_2015', 'NBA_2017', 'GL->NBA', 'usg_pct', 0.25022, 0.16379, 0.10726, 0.22032, 0.07733, 0.25025, 0.1758, 0.2007, 0.25809, 0.18767, 'translation-v1.0'),
-('nba_1626203', 'GL_2015', 'NBA_2017', 'GL->NBA', 'usg_pct', 0.23444, 0.1544, 0.09787, 0.21093, 0.06794, 0.24086, 0.11342, 0.2007, 0.24011, 0.17583, 'translation-v1.0'),
-('nba_1626224', 'EL_2016', 'NBA_2017', 'EL->NBA', 'usg_pct', 0.18298, 0.17634, 0.11981, 0.23287, 0.08988, 0.2628, 0.1531, 0.2007, 0.18022, 0.13724, 'translation-v1.0'),
-('nba_1626253', 'GL_2016', 'EL_2017', 'GL->EL', 'usg_pct', 0.25446, 0.19846, 0.14771, 0.24921, 0.12085, 0.27607, 0.22313, 0.20184, 0.25331, 0.19085, 'translation-v1.0'),
-('nba_1626643', 'EL_2015', 'GL_2017', 'EL->GL', 'usg_pct', 0.29907, 0.26334, 0.21168, 0.315, 0.18433, 0.34235, 0.25301, 0.20041, 0.30754, 0.2243, 'translation-v1.0'),
-('nba_1627785', 'NBA_2016', 'GL_2017', 'NBA->GL', 'usg_pct', 0.18589, 0.25164, 0.19998, 0.3033, 0.17264, 0.33065, 0.35038, 0.20041, 0.18728, 0.13942, 'translation-v1.0'),
-('nba_1627790', 'EL_2016', 'GL_2017', 'EL->GL', 'usg_pct', 0.17891, 0.21585, 0.16419, 0.26752, 0.13685, 0.29486, 0.25862, 0.20041, 0.17734, 0.13418, 'translation-v1.0'),
-('nba_1627814', 'GL_2016', 'NBA_2017', 'GL->NBA', 'usg_pct', 0.21002, 0.16027, 0.10373, 0.2168, 0.07381, 0.24672, 0.19261, 0.2007, 0.21088, 0.15751, 'translation-v1.0'),
-('nba_1627820', 'GL_2016', 'NBA_2017', 'GL->NBA', 'usg_pct', 0.26462, 0.19533, 0.13879, 0.25186, 0.10887, 0.28178, 0.1663, 0.2007, 0.26882, 0.19846, 'translation-v1.0'),
-('nba_1627846', 'GL_2016', 'NBA_2017', 'GL->NBA', 'usg_pct', 0.29515, 0.21436, 0.15783, 0.27089, 0.1279, 0.30082, 0.17221, 0.2007, 0.30122, 0.22136, 'translation-v1.0'),
-('nba_1627851', 'NBA_2016', 'EL_2017', 'NBA->EL', 'usg_pct', 0.19184, 0.2513, 0.20055, 0.30205, 0.17369, 0.32891, 0.23906, 0.20184, 0.19424, 0.14388, 'translation-v1.0'),
-('nba_1627853', 'GL_2016', 'NBA_2017', 'GL->NBA', 'usg_pct', 0.11337, 0.0962, 0.03967, 0.15274, 0.00974, 0.18266, 0.08334, 0.2007, 0.10831, 0.08502, 'translation-v1.0'),
-('nba_1627858', 'GL_2016', 'NBA_2017', 'GL->NBA', 'usg_pct', 0.12242, 0.10013, 0.04359, 0.15666, 0.01367, 0.18658, 0.13601, 0.2007, 0.11791, 0.09181, 'translation-v1.0'),
-('nba_1626199', 'GL_2017', 'EL_2018', 'GL->EL', 'usg_pct', 0.31185, 0.23083, 0.18077, 0.2809, 0.15427, 0.3074, 0.23572, 0.20037, 0.30837, 0.23389, 'translation-v1.0'),
-('nba_1627790', 'EL_2016', 'NBA_2018', 'EL->NBA', 'usg_pct', 0.17891, 0.15398, 0.09759, 0.21037, 0.06774, 0.24023, 0.18222, 0.20041, 0.17522, 0.13418, 'translation-v1.0'),
-('nba_1627834', 'GL_2016', 'EL_2018', 'GL->EL', 'usg_pct', 0.19838, 0.15144, 0.10137, 0.2015, 0.07487, 0.228, 0.14682, 0.20037, 0.19844, 0.14879, 'translation-v1.0'),
-('nba_1629029', 'EL_2017', 'NBA_2018', 'EL->NBA', 'usg_pct', 0.28865, 0.25219, 0.19579, 0.30858, 0.16594, 0.33843, 0.30131, 0.20041, 0.29688, 0.21649, 'translation-v1.0'),
-('nba_101127', 'NBA_2017', 'GL_2019', 'NBA->GL', 'usg_pct', 0.16322, 0.20477, 0.15533, 0.25422, 0.12915, 0.28039, 0.27959, 0.20024, 0.16746, 0.12242, 'translation-v1.0'),
-('nba_1626147', 'NBA_2018', 'GL_2019', 'NBA->GL', 'usg_pct', 0.17296, 0.2418, 0.19236, 0.29124, 0.16618, 0.31742, 0.23139, 0.20024, 0.17617, 0.12972, 'translation-v1.0'),
-('nba_1626150', 'NBA_2017', 'GL_2019', 'NBA->GL', 'usg_pct', 0.19282, 0.2311, 0.18165, 0.28054, 0.15548, 0.30672, 0.2478, 0.20024, 0.19334, 0.14461, 'translation-v1.0'),
-('nba_1626166', 'NBA_2018', 'GL_2019', 'NBA->GL', 'usg_pct', 0.17593, 0.24345, 0.194, 0.29289, 0.16783, 0.31907, 0.32312, 0.20024, 0.17877, 0.13195, 'translation-v1.0'),
-('nba_1626170', 'NBA_2018', 'GL_2019', 'NBA->GL', 'usg_pct', 0.13414, 0.21794, 0.1685, 0.26739, 0.14232, 0.29356, 0.19297, 0.20024, 0.14213, 0.1006, 'translation-v1.0'),
-('nba_1626174', 'GL_2017', 'NBA_2019', 'GL->NBA', 'usg_pct', 0.26108, 0.16964, 0.11099, 0.22828, 0.07994, 0.25933, 0.24305, 0.20071, 0.26958, 0.19581, 'translation-v1.0'),
-('nba_1627098', 'NBA_2017', 'EL_2019', 'NBA->EL', 'usg_pct', 0.1682, 0.21552, 0.16563, 0.26541, 0.13922, 0.29182, 0.22748, 0.20288, 0.1742, 0.12615, 'translation-v1.0'),
-('nba_1627733', 'NBA_2018', 'GL_2019', 'NBA->GL', 'usg_pct', 0.1306, 0.22267, 0.17323, 0.27211, 0.14705, 0.29829, 0.26312, 0.20024, 0.13903, 0.09795, 'translation-v1.0'),
-('nba_1627735', 'GL_2018', 'EL_2019', 'GL->EL', 'usg_pct', 0.29307, 0.22873, 0.17884, 0.27862, 0.15243, 0.30503, 0.20706, 0.20288, 0.29553, 0.21981, 'translation-v1.0'),
-('nba_1627762', 'GL_2017', 'EL_2019', 'GL->EL', 'usg_pct', 0.19933, 0.14681, 0.09693, 0.1967, 0.07052, 0.22311, 0.1577, 0.20288, 0.20184, 0.1495, 'translation-v1.0'),
-('nba_1627789', 'NBA_2018', 'GL_2019', 'NBA->GL', 'usg_pct', 0.17039, 0.24064, 0.19119, 0.29008, 0.16502, 0.31625, 0.25895, 0.20024, 0.17392, 0.12779, 'translation-v1.0'),
-('nba_1627835', 'NBA_2017', 'EL_2019', 'NBA->EL', 'usg_pct', 0.15641, 0.215, 0.16511, 0.26489, 0.1387, 0.2913, 0.19733, 0.20288, 0.1638, 0.11731, 'translation-v1.0'),
-('nba_1629740', 'EL_2018', 'NBA_2019', 'EL->NBA', 'usg_pct', 0.1556, 0.14645, 0.0878, 0.2051, 0.05676, 0.23615, 0.15817, 0.20071, 0.14826, 0.1167, 'translation-v1.0'),
-('nba_1627733', 'NBA_2018', 'EL_2020', 'NBA->EL', 'usg_pct', 0.1306, 0.2043, 0.15008, 0.25852, 0.12137, 0.28723, 0.17161, 0.20188, 0.13475, 0.09795, 'translation-v1.0'),
-('nba_1627790', 'NBA_2018', 'EL_2020', 'NBA->EL', 'usg_pct', 0.18222, 0.23242, 0.17819, 0.28664, 0.14949, 0.31534, 0.21774, 0.20188, 0.18439, 0.13667, 'translation-v1.0'),
-('nba_1627812', 'NBA_2019', 'GL_2020', 'NBA->GL', 'usg_pct', 0.18889, 0.24891, 0.20343, 0.2944, 0.17935, 0.31848, 0.2455, 0.20505, 0.19588, 0.14167, 'translation-v1.0'),
-('nba_1627816', 'GL_2018', 'EL_2020', 'GL->EL', 'usg_pct', 0.29861, 0.20709, 0.15287, 0.26131, 0.12417, 0.29002, 0.22975, 0.20188, 0.30858, 0.22396, 'translation-v1.0'),
-('nba_1627820', 'NBA_2018', 'GL_2020', 'NBA->GL', 'usg_pct', 0.20098, 0.23718, 0.19169, 0.28266, 0.16762, 0.30674, 0.24888, 0.20505, 0.20551, 0.15073, 'translation-v1.0'),
-('nba_1630267', 'EL_2019', 'NBA_2020', 'EL->NBA', 'usg_pct', 0.22899, 0.19721, 0.13804, 0.25638, 0.10672, 0.28771, 0.12859, 0.20065, 0.23161, 0.17174, 'translation-v1.0'),
-('nba_1626170', 'GL_2019', 'EL_2021', 'GL->EL', 'usg_pct', 0.19297, 0.13598, 0.08467, 0.1873, 0.05751, 0.21446, 0.16056, 0.20183, 0.19429, 0.14473, 'translation-v1.0'),
-('nba_1626188', 'NBA_2019', 'GL_2021', 'NBA->GL', 'usg_pct', 0.2091, 0.23947, 0.18744, 0.29149, 0.1599, 0.31903, 0.27459, 0.20017, 0.20761, 0.15682, 'translation-v1.0'),
-('nba_1626203', 'NBA_2019', 'GL_2021', 'NBA->GL', 'usg_pct', 0.13694, 0.19965, 0.14762, 0.25167, 0.12009, 0.27921, 0.09673, 0.20017, 0.1436, 0.1027, 'translation-v1.0'),
-('nba_1626209', 'NBA_2019', 'EL_2021', 'NBA->EL', 'usg_pct', 0.13735, 0.20357, 0.15226, 0.25489, 0.12509, 0.28205, 0.25659, 0.20183, 0.1464, 0.10301, 'translation-v1.0'),
-('nba_1627739', 'NBA_2019', 'GL_2021', 'NBA->GL', 'usg_pct', 0.14685, 0.20417, 0.15215, 0.25619, 0.12461, 0.28373, 0.21217, 0.20017, 0.1524, 0.11014, 'translation-v1.0'),
-('nba_1627748', 'NBA_2019', 'GL_2021', 'NBA->GL', 'usg_pct', 0.1701, 0.22193, 0.16991, 0.27396, 0.14237, 0.3015, 0.16673, 0.20017, 0.17301, 0.12757, 'translation-v1.0'),
-('nba_1627756', 'NBA_2020', 'GL_2021', 'NBA->GL', 'usg_pct', 0.19151, 0.24997, 0.19795, 0.302, 0.17041, 0.32953, 0.22719, 0.20017, 0.19214, 0.14363, 'translation-v1.0'),
-('nba_1627767', 'NBA_2019', 'GL_2021', 'NBA->GL', 'usg_pct', 0.17011, 0.22329, 0.17127, 0.27531, 0.14373, 0.30285, 0.20879, 0.20017, 0.17303, 0.12759, 'translation-v1.0'),
-('nba_1627775', 'NBA_2019', 'GL_2021', 'NBA->GL', 'usg_pct', 0.09428, 0.17894, 0.12692, 0.23097, 0.09938, 0.25851, 0.10855, 0.20017, 0.10577, 0.07071, 'translation-v1.0'),
-('nba_1629740', 'NBA_2020', 'EL_2021', 'NBA->EL', 'usg_pct', 0.12774, 0.21656, 0.16525, 0.26788, 0.13809, 0.29504, 0.17211, 0.20183, 0.13861, 0.09581, 'translation-v1.0'),
-('nba_1626161', 'NBA_2020', 'GL_2022', 'NBA->GL', 'usg_pct', 0.11942, 0.19004, 0.1419, 0.23818, 0.11642, 0.26367, 0.11832, 0.19991, 0.13382, 0.08956, 'translation-v1.0'),
-('nba_1626208', 'NBA_2021', 'GL_2022', 'NBA->GL', 'usg_pct', 0.17208, 0.23645, 0.18831, 0.28459, 0.16282, 0.31007, 0.23251, 0.19991, 0.17592, 0.12906, 'translation-v1.0'),
-('nba_1627789', 'NBA_2021', 'EL_2022', 'NBA->EL', 'usg_pct', 0.14436, 0.22882, 0.17443, 0.28322, 0.14564, 0.31201, 0.25557, 0.20223, 0.1491, 0.10827, 'translation-v1.0'),
-('nba_1627822', 'GL_2021', 'EL_2022', 'GL->EL', 'usg_pct', 0.23265, 0.1836, 0.1292, 0.23799, 0.10041, 0.26678, 0.16235, 0.20223, 0.2362, 0.17449, 'translation-v1.0'),
-('nba_1626147', 'GL_2022', 'EL_2023', 'GL->EL', 'usg_pct', 0.23708, 0.18394, 0.12989, 0.23799, 0.10128, 0.2666, 0.16729, 0.20166, 0.24339, 0.17781, 'translation-v1.0'),
-('nba_1626159', 'NBA_2022', 'GL_2023', 'NBA->GL', 'usg_pct', 0.14043, 0.22346, 0.17329, 0.27363, 0.14673, 0.30019, 0.2579, 0.20014, 0.15082, 0.10532, 'translation-v1.0'),
-('nba_1626169', 'NBA_2022', 'GL_2023', 'NBA->GL', 'usg_pct', 0.15186, 0.23055, 0.18038, 0.28072, 0.15382, 0.30728, 0.21985, 0.20014, 0.16018, 0.1139, 'translation-v1.0'),
-('nba_1626195', 'NBA_2022', 'EL_2023', 'NBA->EL', 'usg_pct', 0.23591, 0.27859, 0.22455, 0.33264, 0.19594, 0.36125, 0.31183, 0.20166, 0.23274, 0.17693, 'translation-v1.0'),
-('nba_1627823', 'NBA_2022', 'EL_2023', 'NBA->EL', 'usg_pct', 0.0949, 0.20358, 0.14954, 0.25763, 0.12093, 0.28624, 0.15886, 0.20166, 0.10839, 0.07118, 'translation-v1.0'),
-('nba_1630267', 'NBA_2021', 'EL_2023', 'NBA->EL', 'usg_pct', 0.14684, 0.20123, 0.14719, 0.25528, 0.11858, 0.28389, 0.23119, 0.20166, 0.15118, 0.11013, 'translation-v1.0'),
-('nba_203995', 'EL_2022', 'NBA_2023', 'EL->NBA', 'usg_pct', 0.26555, 0.21994, 0.15897, 0.2809, 0.1267, 0.31318, 0.20225, 0.20074, 0.27171, 0.19916, 'translation-v1.0'),
-('nba_1626163', 'EL_2023', 'GL_2024', 'EL->GL', 'usg_pct', 0.22635, 0.23161, 0.1776, 0.28563, 0.149, 0.31423, 0.1977, 0.20033, 0.225, 0.16976, 'translation-v1.0'),
-('nba_1626224', 'NBA_2023', 'EL_2024', 'NBA->EL', 'usg_pct', 0.15025, 0.23088, 0.17273, 0.28903, 0.14194, 0.31981, 0.20534, 0.2013, 0.15315, 0.11269, 'translation-v1.0'),
-('nba_1627824', 'EL_2023', 'NBA_2024', 'EL->NBA', 'usg_pct', 0.16963, 0.15665, 0.0974, 0.21591, 0.06603, 0.24727, 0.15898, 0.20047, 0.16535, 0.12722, 'translation-v1.0'),
-('nba_101141', 'NBA_2006', 'EL_2007', 'NBA->EL', 'ts_pct', 0.4998, 0.55037, 0.47684, 0.62391, 0.43792, 0.66283, 0.44242, 0.57629, 0.52594, 0.37485, 'translation-v1.0'),
-('nba_101212', 'NBA_2005', 'EL_2007', 'NBA->EL', 'ts_pct', 0.48877, 0.59039, 0.51686, 0.66392, 0.47793, 0.70285, 0.60136, 0.57629, 0.5188, 0.36658, 'translation-v1.0'),
-('nba_1531', 'NBA_2006', 'EL_2007', 'NBA->EL', 'ts_pct', 0.47078, 0.52722, 0.45369, 0.60075, 0.41476, 0.63968, 0.58789, 0.57629, 0.48971, 0.35309, 'translation-v1.0'),
-('nba_101137', 'NBA_2006', 'EL_2008', 'NBA->EL', 'ts_pct', 0.49502, 0.58761, 0.51212, 0.66311, 0.47216, 0.70307, 0.51316, 0.58004, 0.52222, 0.37127, 'translation-v1.0'),
-('nba_101146', 'EL_2007', 'NBA_2008', 'EL->NBA', 'ts_pct', 0.56583, 0.51945, 0.46214, 0.57676, 0.4318, 0.6071, 0.42951, 0.54363, 0.53548, 0.42438, 'translation-v1.0'),
-('nba_101198', 'EL_2007', 'NBA_2008', 'EL->NBA', 'ts_pct', 0.59557, 0.52998, 0.47267, 0.58729, 0.44233, 0.61763, 0.51983, 0.54363, 0.55866, 0.44668, 'translation-v1.0'),
-('nba_101132', 'NBA_2008', 'EL_2009', 'NBA->EL', 'ts_pct', 0.55249, 0.5699, 0.49588, 0.64392, 0.4567, 0.6831, 0.58767, 0.58191, 0.59335, 0.41437, 'translation-v1.0'),
-('nba_101141', 'EL_2008', 'NBA_2009', 'EL->NBA', 'ts_pct', 0.57222, 0.52308, 0.46619, 0.57997, 0.43608, 0.61009, 0.52597, 0.54275, 0.53685, 0.42916, 'translation-v1.0'),
-('nba_101132', 'EL_2009', 'NBA_2010', 'EL->NBA', 'ts_pct', 0.58767, 0.51981, 0.46216, 0.57746, 0.43165, 0.60798, 0.50161, 0.54142, 0.5459, 0.44075, 'translation-v1.0'),
-('nba_101146', 'NBA_2008', 'EL_2010', 'NBA->EL', 'ts_pct', 0.42951, 0.52227, 0.45378, 0.59075, 0.41752, 0.62701, 0.57986, 0.55518, 0.4188, 0.32213, 'translation-v1.0'),
-('nba_101187', 'EL_2009', 'NBA_2011', 'EL->NBA', 'ts_pct', 0.56405, 0.52276, 0.45935, 0.58617, 0.42578, 0.61974, 0.51924, 0.52649, 0.51119, 0.42304, 'translation-v1.0'),
-('nba_101132', 'NBA_2011', 'EL_2013', 'NBA->EL', 'ts_pct', 0.52093, 0.58492, 0.51613, 0.65372, 0.47971, 0.69014, 0.58946, 0.56584, 0.55981, 0.39069, 'translation-v1.0'),
-('nba_101249', 'NBA_2013', 'GL_2015', 'NBA->GL', 'ts_pct', 0.40347, 0.53824, 0.4778, 0.59868, 0.44581, 0.63067, 0.56705, 0.55669, 0.41389, 0.3026, 'translation-v1.0'),
-('nba_1626246', 'EL_2014', 'NBA_2015', 'EL->NBA', 'ts_pct', 0.67157, 0.55091, 0.49643, 0.60539, 0.46759, 0.63423, 0.66247, 0.54099, 0.6168, 0.50368, 'translation-v1.0'),
-('nba_101126', 'NBA_2014', 'GL_2016', 'NBA->GL', 'ts_pct', 0.43235, 0.55115, 0.48865, 0.61365, 0.45556, 0.64674, 0.54727, 0.55334, 0.44482, 0.32426, 'translation-v1.0'),
-('nba_1626150', 'GL_2015', 'NBA_2016', 'GL->NBA', 'ts_pct', 0.57449, 0.50581, 0.44863, 0.56299, 0.41836, 0.59325, 0.47714, 0.551, 0.56783, 0.43087, 'translation-v1.0'),
-('nba_1626262', 'GL_2015', 'EL_2016', 'GL->EL', 'ts_pct', 0.63014, 0.56311, 0.49275, 0.63347, 0.45551, 0.67071, 0.49861, 0.57141, 0.65692, 0.47261, 'translation-v1.0'),
-('nba_1627098', 'EL_2015', 'NBA_2016', 'EL->NBA', 'ts_pct', 0.6123, 0.53541, 0.47823, 0.59259, 0.44796, 0.62285, 0.4558, 0.551, 0.58448, 0.45923, 'translation-v1.0'),
-('nba_1627851', 'EL_2015', 'NBA_2016', 'EL->NBA', 'ts_pct', 0.59258, 0.53902, 0.48185, 0.5962, 0.45158, 0.62647, 0.53269, 0.551, 0.56946, 0.44443, 'translation-v1.0'),
-('nba_1626188', 'GL_2015', 'NBA_2017', 'GL->NBA', 'ts_pct', 0.57404, 0.53741, 0.48116, 0.59366, 0.45139, 0.62344, 0.59316, 0.55663, 0.57278, 0.43053, 'translation-v1.0'),
-('nba_1626203', 'GL_2015', 'NBA_2017', 'GL->NBA', 'ts_pct', 0.5465, 0.52721, 0.47096, 0.58346, 0.44118, 0.61323, 0.55272, 0.55663, 0.54715, 0.40988, 'translation-v1.0'),
-('nba_1626224', 'EL_2016', 'NBA_2017', 'EL->NBA', 'ts_pct', 0.52826, 0.52018, 0.46393, 0.57643, 0.43416, 0.60621, 0.577, 0.55663, 0.52214, 0.39619, 'translation-v1.0'),
-('nba_1626253', 'GL_2016', 'EL_2017', 'GL->EL', 'ts_pct', 0.60673, 0.56796, 0.49374, 0.64219, 0.45445, 0.68148, 0.6038, 0.58615, 0.64956, 0.45505, 'translation-v1.0'),
-('nba_1626643', 'EL_2015', 'GL_2017', 'EL->GL', 'ts_pct', 0.54677, 0.56266, 0.49981, 0.62551, 0.46654, 0.65878, 0.51363, 0.55839, 0.54034, 0.41008, 'translation-v1.0'),
-('nba_1627785', 'NBA_2016', 'GL_2017', 'NBA->GL', 'ts_pct', 0.4868, 0.53454, 0.47169, 0.59739, 0.43841, 0.63066, 0.55328, 0.55839, 0.48783, 0.3651, 'translation-v1.0'),
-('nba_1627790', 'EL_2016', 'GL_2017', 'EL->GL', 'ts_pct', 0.66352, 0.58538, 0.52252, 0.64823, 0.48925, 0.6815, 0.62183, 0.55839, 0.64068, 0.49764, 'translation-v1.0'),
-('nba_1627814', 'GL_2016', 'NBA_2017', 'GL->NBA', 'ts_pct', 0.62434, 0.5461, 0.48985, 0.60235, 0.46007, 0.63212, 0.48859, 0.55663, 0.62054, 0.46826, 'translation-v1.0'),
-('nba_1627820', 'GL_2016', 'NBA_2017', 'GL->NBA', 'ts_pct', 0.51807, 0.49688, 0.44063, 0.55313, 0.41085, 0.58291, 0.5172, 0.55663, 0.52489, 0.38855, 'translation-v1.0'),
-('nba_1627846', 'GL_2016', 'NBA_2017', 'GL->NBA', 'ts_pct', 0.56676, 0.51214, 0.45589, 0.56839, 0.42611, 0.59817, 0.43934, 0.55663, 0.56871, 0.42507, 'translation-v1.0'),
-('nba_1627851', 'NBA_2016', 'EL_2017', 'NBA->EL', 'ts_pct', 0.53269, 0.56755, 0.49333, 0.64177, 0.45404, 0.68106, 0.57884, 0.58615, 0.56238, 0.39952, 'translation-v1.0'),
-('nba_1627853', 'GL_2016', 'NBA_2017', 'GL->NBA', 'ts_pct', 0.59617, 0.52403, 0.46778, 0.58028, 0.438, 0.61006, 0.54995, 0.55663, 0.59519, 0.44713, 'translation-v1.0'),
-('nba_1627858', 'GL_2016', 'NBA_2017', 'GL->NBA', 'ts_pct', 0.4707, 0.47825, 0.422, 0.5345, 0.39223, 0.56428, 0.4331, 0.55663, 0.48227, 0.35303, 'translation-v1.0'),
-('nba_1626199', 'GL_2017', 'EL_2018', 'GL->EL', 'ts_pct', 0.59719, 0.56116, 0.48764, 0.63467, 0.44873, 0.67359, 0.54025, 0.58771, 0.63308, 0.44789, 'translation-v1.0'),
-('nba_1627790', 'EL_2016', 'NBA_2018', 'EL->NBA', 'ts_pct', 0.66352, 0.60083, 0.54381, 0.65784, 0.51363, 0.68802, 0.58985, 0.55971, 0.63436, 0.49764, 'translation-v1.0'),
-('nba_1627834', 'GL_2016', 'EL_2018', 'GL->EL', 'ts_pct', 0.53429, 0.57226, 0.49875, 0.64578, 0.45983, 0.68469, 0.69115, 0.58771, 0.5653, 0.40072, 'translation-v1.0'),
-('nba_1629029', 'EL_2017', 'NBA_2018', 'EL->NBA', 'ts_pct', 0.61193, 0.54345, 0.48644, 0.60046, 0.45626, 0.63065, 0.54523, 0.55971, 0.57952, 0.45895, 'translation-v1.0'),
-('nba_101127', 'NBA_2017', 'GL_2019', 'NBA->GL', 'ts_pct', 0.4895, 0.58316, 0.51305, 0.65327, 0.47593, 0.69038, 0.62316, 0.58734, 0.50366, 0.36712, 'translation-v1.0'),
-('nba_1626147', 'NBA_2018', 'GL_2019', 'NBA->GL', 'ts_pct', 0.51624, 0.59124, 0.52113, 0.66135, 0.48402, 0.69847, 0.64167, 0.58734, 0.53388, 0.38718, 'translation-v1.0'),
-('nba_1626150', 'NBA_2017', 'GL_2019', 'NBA->GL', 'ts_pct', 0.53411, 0.61633, 0.54622, 0.68644, 0.50911, 0.72356, 0.60823, 0.58734, 0.55927, 0.40058, 'translation-v1.0'),
-('nba_1626166', 'NBA_2018', 'GL_2019', 'NBA->GL', 'ts_pct', 0.51859, 0.58585, 0.51574, 0.65596, 0.47862, 0.69307, 0.58327, 0.58734, 0.53677, 0.38894, 'translation-v1.0'),
-('nba_1626170', 'NBA_2018', 'GL_2019', 'NBA->GL', 'ts_pct', 0.52609, 0.58426, 0.51415, 0.65437, 0.47703, 0.69149, 0.63119, 0.58734, 0.546, 0.39457, 'translation-v1.0'),
-('nba_1626174', 'GL_2017', 'NBA_2019', 'GL->NBA', 'ts_pct', 0.63721, 0.56998, 0.50416, 0.6358, 0.46932, 0.67064, 0.65909, 0.56503, 0.64757, 0.47791, 'translation-v1.0'),
-('nba_1627098', 'NBA_2017', 'EL_2019', 'NBA->EL', 'ts_pct', 0.51923, 0.58447, 0.50911, 0.65982, 0.46922, 0.69972, 0.61088, 0.58285, 0.53274, 0.38942, 'translation-v1.0'),
-('nba_1627733', 'NBA_2018', 'GL_2019', 'NBA->GL', 'ts_pct', 0.52093, 0.58589, 0.51578, 0.656, 0.47866, 0.69311, 0.65209, 0.58734, 0.53965, 0.3907, 'translation-v1.0'),
-('nba_1627735', 'GL_2018', 'EL_2019', 'GL->EL', 'ts_pct', 0.54348, 0.5451, 0.46975, 0.62046, 0.42986, 0.66035, 0.50169, 0.58285, 0.56865, 0.40761, 'translation-v1.0'),
-('nba_1627762', 'GL_2017', 'EL_2019', 'GL->EL', 'ts_pct', 0.61375, 0.59811, 0.52276, 0.67347, 0.48286, 0.71336, 0.57243, 0.58285, 0.64922, 0.46031, 'translation-v1.0'),
-('nba_1627789', 'NBA_2018', 'GL_2019', 'NBA->GL', 'ts_pct', 0.48932, 0.57137, 0.50125, 0.64148, 0.46414, 0.67859, 0.5536, 0.58734, 0.50078, 0.36699, 'translation-v1.0'),
-('nba_1627835', 'NBA_2017', 'EL_2019', 'NBA->EL', 'ts_pct', 0.4449, 0.54815, 0.4728, 0.62351, 0.4329, 0.6634, 0.57026, 0.58285, 0.43316, 0.33367, 'translation-v1.0'),
-('nba_1629740', 'EL_2018', 'NBA_2019', 'EL->NBA', 'ts_pct', 0.55824, 0.52013, 0.45431, 0.58595, 0.41947, 0.62079, 0.55615, 0.56503, 0.53865, 0.41868, 'translation-v1.0'),
-('nba_1627733', 'NBA_2018', 'EL_2020', 'NBA->EL', 'ts_pct', 0.52093, 0.59994, 0.52834, 0.67154, 0.49044, 0.70944, 0.59273, 0.59135, 0.54265, 0.3907, 'translation-v1.0'),
-('nba_1627790', 'NBA_2018', 'EL_2020', 'NBA->EL', 'ts_pct', 0.58985, 0.6323, 0.5607, 0.70389, 0.5228, 0.74179, 0.6128, 0.59135, 0.6292, 0.44239, 'translation-v1.0'),
-('nba_1627812', 'NBA_2019', 'GL_2020', 'NBA->GL', 'ts_pct', 0.5279, 0.5797, 0.49992, 0.65947, 0.45769, 0.70171, 0.59511, 0.57216, 0.52714, 0.39592, 'translation-v1.0'),
-('nba_1627816', 'GL_2018', 'EL_2020', 'GL->EL', 'ts_pct', 0.56374, 0.59029, 0.51869, 0.66188, 0.48079, 0.69978, 0.61388, 0.59135, 0.60123, 0.42281, 'translation-v1.0'),
-('nba_1627820', 'NBA_2018', 'GL_2020', 'NBA->GL', 'ts_pct', 0.45026, 0.56594, 0.48616, 0.64572, 0.44393, 0.68795, 0.58759, 0.57216, 0.41901, 0.3377, 'translation-v1.0'),
-('nba_1630267', 'EL_2019', 'NBA_2020', 'EL->NBA', 'ts_pct', 0.57355, 0.54141, 0.47803, 0.6048, 0.44447, 0.63836, 0.55768, 0.57259, 0.56477, 0.43016, 'translation-v1.0'),
-('nba_1626170', 'GL_2019', 'EL_2021', 'GL->EL', 'ts_pct', 0.63119, 0.57458, 0.49703, 0.65212, 0.45599, 0.69316, 0.43494, 0.57393, 0.62243, 0.47339, 'translation-v1.0'),
-('nba_1626188', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ts_pct', 0.50872, 0.61851, 0.53893, 0.69809, 0.4968, 0.74022, 0.63618, 0.58542, 0.51733, 0.38154, 'translation-v1.0'),
-('nba_1626203', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ts_pct', 0.45567, 0.58011, 0.50053, 0.65969, 0.4584, 0.70182, 0.47137, 0.58542, 0.45319, 0.34175, 'translation-v1.0'),
-('nba_1626209', 'NBA_2019', 'EL_2021', 'NBA->EL', 'ts_pct', 0.52468, 0.58258, 0.50504, 0.66012, 0.46399, 0.70117, 0.555, 0.57393, 0.52639, 0.39351, 'translation-v1.0'),
-('nba_1627739', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ts_pct', 0.5099, 0.60252, 0.52294, 0.68211, 0.48081, 0.72423, 0.5467, 0.58542, 0.51875, 0.38242, 'translation-v1.0'),
-('nba_1627748', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ts_pct', 0.58202, 0.651, 0.57141, 0.73058, 0.52929, 0.77271, 0.55176, 0.58542, 0.60596, 0.43652, 'translation-v1.0'),
-('nba_1627756', 'NBA_2020', 'GL_2021', 'NBA->GL', 'ts_pct', 0.47936, 0.54922, 0.46964, 0.62881, 0.42751, 0.67094, 0.56272, 0.58542, 0.46836, 0.35952, 'translation-v1.0'),
-('nba_1627767', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ts_pct', 0.68799, 0.71533, 0.63575, 0.79491, 0.59362, 0.83704, 0.7258, 0.58542, 0.73409, 0.51599, 'translation-v1.0'),
-('nba_1627775', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ts_pct', 0.50024, 0.6049, 0.52532, 0.68448, 0.48319, 0.72661, 0.55272, 0.58542, 0.50707, 0.37518, 'translation-v1.0'),
-('nba_1629740', 'NBA_2020', 'EL_2021', 'NBA->EL', 'ts_pct', 0.44079, 0.50442, 0.42688, 0.58196, 0.38583, 0.62301, 0.5609, 0.57393, 0.4127, 0.33059, 'translation-v1.0'),
-('nba_1626161', 'NBA_2020', 'GL_2022', 'NBA->GL', 'ts_pct', 0.64719, 0.68033, 0.61473, 0.74593, 0.58001, 0.78065, 0.71624, 0.60455, 0.68175, 0.48539, 'translation-v1.0'),
-('nba_1626208', 'NBA_2021', 'GL_2022', 'NBA->GL', 'ts_pct', 0.45574, 0.57565, 0.51005, 0.64125, 0.47532, 0.67597, 0.5331, 0.60455, 0.48976, 0.34181, 'translation-v1.0'),
-('nba_1627789', 'NBA_2021', 'EL_2022', 'NBA->EL', 'ts_pct', 0.55626, 0.58317, 0.51242, 0.65392, 0.47496, 0.69138, 0.5382, 0.59022, 0.57702, 0.4172, 'translation-v1.0'),
-('nba_1627822', 'GL_2021', 'EL_2022', 'GL->EL', 'ts_pct', 0.61412, 0.55982, 0.48906, 0.63057, 0.45161, 0.66802, 0.65952, 0.59022, 0.61574, 0.46059, 'translation-v1.0'),
-('nba_1626147', 'GL_2022', 'EL_2023', 'GL->EL', 'ts_pct', 0.62888, 0.54555, 0.47076, 0.62034, 0.43117, 0.65993, 0.55154, 0.58451, 0.61225, 0.47166, 'translation-v1.0'),
-('nba_1626159', 'NBA_2022', 'GL_2023', 'NBA->GL', 'ts_pct', 0.46596, 0.55616, 0.48463, 0.62769, 0.44676, 0.66556, 0.56098, 0.59351, 0.46579, 0.34947, 'translation-v1.0'),
-('nba_1626169', 'NBA_2022', 'GL_2023', 'NBA->GL', 'ts_pct', 0.62518, 0.63987, 0.56834, 0.71141, 0.53048, 0.74927, 0.626, 0.59351, 0.64028, 0.46888, 'translation-v1.0'),
-('nba_1626195', 'NBA_2022', 'EL_2023', 'NBA->EL', 'ts_pct', 0.60998, 0.60252, 0.52773, 0.67731, 0.48814, 0.7169, 0.61645, 0.58451, 0.616, 0.45749, 'translation-v1.0'),
-('nba_1627823', 'NBA_2022', 'EL_2023', 'NBA->EL', 'ts_pct', 0.50397, 0.54623, 0.47144, 0.62101, 0.43185, 0.6606, 0.4925, 0.58451, 0.49453, 0.37797, 'translation-v1.0'),
-('nba_1630267', 'NBA_2021', 'EL_2023', 'NBA->EL', 'ts_pct', 0.50254, 0.57048, 0.49569, 0.64527, 0.4561, 0.68486, 0.59799, 0.58451, 0.50807, 0.37691, 'translation-v1.0'),
-('nba_203995', 'EL_2022', 'NBA_2023', 'EL->NBA', 'ts_pct', 0.59082, 0.54916, 0.48772, 0.6106, 0.4552, 0.64312, 0.52357, 0.58128, 0.5818, 0.44312, 'translation-v1.0'),
-('nba_1626163', 'EL_2023', 'GL_2024', 'EL->GL', 'ts_pct', 0.63778, 0.5942, 0.52545, 0.66294, 0.48906, 0.69934, 0.60795, 0.59027, 0.63924, 0.47833, 'translation-v1.0'),
-('nba_1626224', 'NBA_2023', 'EL_2024', 'NBA->EL', 'ts_pct', 0.60091, 0.59048, 0.51616, 0.6648, 0.47682, 0.70414, 0.61556, 0.59375, 0.6175, 0.45069, 'translation-v1.0'),
-('nba_1627824', 'EL_2023', 'NBA_2024', 'EL->NBA', 'ts_pct', 0.71746, 0.59813, 0.53682, 0.65944, 0.50436, 0.6919, 0.61566, 0.57732, 0.68632, 0.5381, 'translation-v1.0');
+('translation-v1.0', 'translation', '2026-10-18T13:21:41.429850+00:00', 'e8d7876', '20261018T132141Z', 20260810, 'mae_usg_pct', 0.03317018280468835, 0.030627066726663293, 0.03566343231534456, 414, 367, 'services/ml/src/hoopslab/configs/model_cards/translation.md');
+INSERT INTO translation_predictions ("person_id", "source_season_id", "target_season_id", "direction", "metric", "source_value", "predicted", "pi80_low", "pi80_high", "pi95_low", "pi95_high", "conformal80_low", "conformal80_high", "conformal95_low", "conformal95_high", "actual_value", "baseline_league_mean", "baseline_z_preservation", "baseline_folk_rule", "model_version") VALUES
+('nba_101141', 'NBA_2006', 'EL_2007', 'NBA->EL', 'usg_pct', 0.20706, 0.26432, 0.21957, 0.30907, 0.19589, 0.33276, 0.22127, 0.30737, 0.17155, 0.35709, 0.2106, 0.20512, 0.21067, 0.15529, 'translation-v1.0'),
+('nba_101212', 'NBA_2005', 'EL_2007', 'NBA->EL', 'usg_pct', 0.13021, 0.20613, 0.16138, 0.25088, 0.13769, 0.27456, 0.16308, 0.24918, 0.11335, 0.2989, 0.28824, 0.20512, 0.14817, 0.09766, 'translation-v1.0'),
+('nba_1531', 'NBA_2006', 'EL_2007', 'NBA->EL', 'usg_pct', 0.22363, 0.2609, 0.21615, 0.30565, 0.19247, 0.32934, 0.21785, 0.30395, 0.16813, 0.35367, 0.27938, 0.20512, 0.22453, 0.16772, 'translation-v1.0'),
+('nba_101137', 'NBA_2006', 'EL_2008', 'NBA->EL', 'usg_pct', 0.15096, 0.21376, 0.16623, 0.26128, 0.14108, 0.28644, 0.16803, 0.25948, 0.11523, 0.31229, 0.24173, 0.20596, 0.16201, 0.11322, 'translation-v1.0'),
+('nba_101146', 'EL_2007', 'NBA_2008', 'EL->NBA', 'usg_pct', 0.21745, 0.19566, 0.143, 0.24832, 0.11513, 0.27619, 0.14357, 0.24775, NULL, NULL, 0.21381, 0.20024, 0.21476, 0.16309, 'translation-v1.0'),
+('nba_101198', 'EL_2007', 'NBA_2008', 'EL->NBA', 'usg_pct', 0.24973, 0.21779, 0.16514, 0.27045, 0.13726, 0.29832, 0.1657, 0.26989, NULL, NULL, 0.28108, 0.20024, 0.25274, 0.18729, 'translation-v1.0'),
+('nba_101132', 'NBA_2008', 'EL_2009', 'NBA->EL', 'usg_pct', 0.20117, 0.25523, 0.21058, 0.29987, 0.18694, 0.32351, 0.21227, 0.29818, 0.16266, 0.34779, 0.25757, 0.20549, 0.20628, 0.15088, 'translation-v1.0'),
+('nba_101141', 'EL_2008', 'NBA_2009', 'EL->NBA', 'usg_pct', 0.25269, 0.22176, 0.16964, 0.27387, 0.14205, 0.30146, 0.1702, 0.27332, NULL, NULL, 0.21232, 0.20024, 0.2515, 0.18952, 'translation-v1.0'),
+('nba_101132', 'EL_2009', 'NBA_2010', 'EL->NBA', 'usg_pct', 0.25757, 0.22313, 0.16947, 0.27679, 0.14107, 0.3052, 0.17005, 0.27622, NULL, NULL, 0.21838, 0.20037, 0.26296, 0.19318, 'translation-v1.0'),
+('nba_101146', 'NBA_2008', 'EL_2010', 'NBA->EL', 'usg_pct', 0.21381, 0.24159, 0.19902, 0.28416, 0.17649, 0.3067, 0.20064, 0.28255, 0.15333, 0.32985, 0.22422, 0.20425, 0.21523, 0.16036, 'translation-v1.0'),
+('nba_101187', 'EL_2009', 'NBA_2011', 'EL->NBA', 'usg_pct', 0.26486, 0.20295, 0.14743, 0.25848, 0.11803, 0.28788, 0.14802, 0.25789, NULL, NULL, 0.19233, 0.20059, 0.27442, 0.19864, 'translation-v1.0'),
+('nba_101132', 'NBA_2011', 'EL_2013', 'NBA->EL', 'usg_pct', 0.23863, 0.24996, 0.20491, 0.29501, 0.18106, 0.31886, 0.20661, 0.29331, 0.15655, 0.34337, 0.22237, 0.20212, 0.23299, 0.17898, 'translation-v1.0'),
+('nba_101249', 'NBA_2013', 'GL_2015', 'NBA->GL', 'usg_pct', 0.17056, 0.21157, 0.16193, 0.26121, 0.13565, 0.28749, 0.12676, 0.29638, 0.10136, 0.32178, 0.21288, 0.19983, 0.17133, 0.12792, 'translation-v1.0'),
+('nba_1626246', 'EL_2014', 'NBA_2015', 'EL->NBA', 'usg_pct', 0.23506, 0.20485, 0.15103, 0.25867, 0.12254, 0.28717, 0.15161, 0.2581, NULL, NULL, 0.22838, 0.20033, 0.23725, 0.1763, 'translation-v1.0'),
+('nba_101126', 'NBA_2014', 'GL_2016', 'NBA->GL', 'usg_pct', 0.22296, 0.24558, 0.19231, 0.29885, 0.16411, 0.32705, 0.15456, 0.33659, 0.1273, 0.36386, 0.20954, 0.20043, 0.22294, 0.16722, 'translation-v1.0'),
+('nba_1626150', 'GL_2015', 'NBA_2016', 'GL->NBA', 'usg_pct', 0.25049, 0.19024, 0.13326, 0.24722, 0.10309, 0.27738, 0.13963, 0.24085, NULL, NULL, 0.16405, 0.20038, 0.25853, 0.18786, 'translation-v1.0'),
+('nba_1626262', 'GL_2015', 'EL_2016', 'GL->EL', 'usg_pct', 0.24508, 0.19507, 0.14679, 0.24335, 0.12123, 0.26891, 0.16864, 0.22149, NULL, NULL, 0.17221, 0.20047, 0.24449, 0.18381, 'translation-v1.0'),
+('nba_1627098', 'EL_2015', 'NBA_2016', 'EL->NBA', 'usg_pct', 0.23876, 0.20691, 0.14993, 0.26389, 0.11976, 0.29405, 0.15054, 0.26328, NULL, NULL, 0.18145, 0.20038, 0.24457, 0.17907, 'translation-v1.0'),
+('nba_1627851', 'EL_2015', 'NBA_2016', 'EL->NBA', 'usg_pct', 0.27828, 0.2389, 0.18192, 0.29588, 0.15176, 0.32604, 0.18253, 0.29527, NULL, NULL, 0.19184, 0.20038, 0.29303, 0.20871, 'translation-v1.0'),
+('nba_1626188', 'GL_2015', 'NBA_2017', 'GL->NBA', 'usg_pct', 0.25022, 0.16379, 0.10726, 0.22032, 0.07733, 0.25025, 0.11358, 0.21401, NULL, NULL, 0.1758, 0.2007, 0.25809, 0.18767, 'translation-v1.0'),
+('nba_1626203', 'GL_2015', 'NBA_2017', 'GL->NBA', 'usg_pct', 0.23444, 0.1544, 0.09787, 0.21093, 0.06794, 0.24086, 0.10419, 0.20462, NULL, NULL, 0.11342, 0.2007, 0.24011, 0.17583, 'translation-v1.0'),
+('nba_1626224', 'EL_2016', 'NBA_2017', 'EL->NBA', 'usg_pct', 0.18298, 0.17634, 0.11981, 0.23287, 0.08988, 0.2628, 0.12041, 0.23227, NULL, NULL, 0.1531, 0.2007, 0.18022, 0.13724, 'translation-v1.0'),
+('nba_1626253', 'GL_2016', 'EL_2017', 'GL->EL', 'usg_pct', 0.25446, 0.19846, 0.14771, 0.24921, 0.12085, 0.27607, 0.17069, 0.22624, NULL, NULL, 0.22313, 0.20184, 0.25331, 0.19085, 'translation-v1.0'),
+('nba_1626643', 'EL_2015', 'GL_2017', 'EL->GL', 'usg_pct', 0.29907, 0.26334, 0.21168, 0.315, 0.18433, 0.34235, NULL, NULL, NULL, NULL, 0.25301, 0.20041, 0.30754, 0.2243, 'translation-v1.0'),
+('nba_1627785', 'NBA_2016', 'GL_2017', 'NBA->GL', 'usg_pct', 0.18589, 0.25164, 0.19998, 0.3033, 0.17264, 0.33065, 0.16338, 0.3399, 0.13694, 0.36634, 0.35038, 0.20041, 0.18728, 0.13942, 'translation-v1.0'),
+('nba_1627790', 'EL_2016', 'GL_2017', 'EL->GL', 'usg_pct', 0.17891, 0.21585, 0.16419, 0.26752, 0.13685, 0.29486, NULL, NULL, NULL, NULL, 0.25862, 0.20041, 0.17734, 0.13418, 'translation-v1.0'),
+('nba_1627814', 'GL_2016', 'NBA_2017', 'GL->NBA', 'usg_pct', 0.21002, 0.16027, 0.10373, 0.2168, 0.07381, 0.24672, 0.11005, 0.21048, NULL, NULL, 0.19261, 0.2007, 0.21088, 0.15751, 'translation-v1.0'),
+('nba_1627820', 'GL_2016', 'NBA_2017', 'GL->NBA', 'usg_pct', 0.26462, 0.19533, 0.13879, 0.25186, 0.10887, 0.28178, 0.14511, 0.24554, NULL, NULL, 0.1663, 0.2007, 0.26882, 0.19846, 'translation-v1.0'),
+('nba_1627846', 'GL_2016', 'NBA_2017', 'GL->NBA', 'usg_pct', 0.29515, 0.21436, 0.15783, 0.27089, 0.1279, 0.30082, 0.16415, 0.26458, NULL, NULL, 0.17221, 0.2007, 0.30122, 0.22136, 'translation-v1.0'),
+('nba_1627851', 'NBA_2016', 'EL_2017', 'NBA->EL', 'usg_pct', 0.19184, 0.2513, 0.20055, 0.30205, 0.17369, 0.32891, 0.20247, 0.30013, 0.14609, 0.35652, 0.23906, 0.20184, 0.19424, 0.14388, 'translation-v1.0'),
+('nba_1627853', 'GL_2016', 'NBA_2017', 'GL->NBA', 'usg_pct', 0.11337, 0.0962, 0.03967, 0.15274, 0.00974, 0.18266, 0.04599, 0.14642, NULL, NULL, 0.08334, 0.2007, 0.10831, 0.08502, 'translation-v1.0'),
+('nba_1627858', 'GL_2016', 'NBA_2017', 'GL->NBA', 'usg_pct', 0.12242, 0.10013, 0.04359, 0.15666, 0.01367, 0.18658, 0.04991, 0.15034, NULL, NULL, 0.13601, 0.2007, 0.11791, 0.09181, 'translation-v1.0'),
+('nba_1626199', 'GL_2017', 'EL_2018', 'GL->EL', 'usg_pct', 0.31185, 0.23083, 0.18077, 0.2809, 0.15427, 0.3074, 0.20343, 0.25823, NULL, NULL, 0.23572, 0.20037, 0.30837, 0.23389, 'translation-v1.0'),
+('nba_1627790', 'EL_2016', 'NBA_2018', 'EL->NBA', 'usg_pct', 0.17891, 0.15398, 0.09759, 0.21037, 0.06774, 0.24023, 0.0982, 0.20977, NULL, NULL, 0.18222, 0.20041, 0.17522, 0.13418, 'translation-v1.0'),
+('nba_1627834', 'GL_2016', 'EL_2018', 'GL->EL', 'usg_pct', 0.19838, 0.15144, 0.10137, 0.2015, 0.07487, 0.228, 0.12404, 0.17884, NULL, NULL, 0.14682, 0.20037, 0.19844, 0.14879, 'translation-v1.0'),
+('nba_1629029', 'EL_2017', 'NBA_2018', 'EL->NBA', 'usg_pct', 0.28865, 0.25219, 0.19579, 0.30858, 0.16594, 0.33843, 0.1964, 0.30797, NULL, NULL, 0.30131, 0.20041, 0.29688, 0.21649, 'translation-v1.0'),
+('nba_101127', 'NBA_2017', 'GL_2019', 'NBA->GL', 'usg_pct', 0.16322, 0.20477, 0.15533, 0.25422, 0.12915, 0.28039, 0.1203, 0.28925, 0.09499, 0.31455, 0.27959, 0.20024, 0.16746, 0.12242, 'translation-v1.0'),
+('nba_1626147', 'NBA_2018', 'GL_2019', 'NBA->GL', 'usg_pct', 0.17296, 0.2418, 0.19236, 0.29124, 0.16618, 0.31742, 0.15732, 0.32628, 0.13202, 0.35158, 0.23139, 0.20024, 0.17617, 0.12972, 'translation-v1.0'),
+('nba_1626150', 'NBA_2017', 'GL_2019', 'NBA->GL', 'usg_pct', 0.19282, 0.2311, 0.18165, 0.28054, 0.15548, 0.30672, 0.14662, 0.31557, 0.12132, 0.34088, 0.2478, 0.20024, 0.19334, 0.14461, 'translation-v1.0'),
+('nba_1626166', 'NBA_2018', 'GL_2019', 'NBA->GL', 'usg_pct', 0.17593, 0.24345, 0.194, 0.29289, 0.16783, 0.31907, 0.15897, 0.32792, 0.13367, 0.35323, 0.32312, 0.20024, 0.17877, 0.13195, 'translation-v1.0'),
+('nba_1626170', 'NBA_2018', 'GL_2019', 'NBA->GL', 'usg_pct', 0.13414, 0.21794, 0.1685, 0.26739, 0.14232, 0.29356, 0.13347, 0.30242, 0.10816, 0.32772, 0.19297, 0.20024, 0.14213, 0.1006, 'translation-v1.0'),
+('nba_1626174', 'GL_2017', 'NBA_2019', 'GL->NBA', 'usg_pct', 0.26108, 0.16964, 0.11099, 0.22828, 0.07994, 0.25933, 0.11754, 0.22173, NULL, NULL, 0.24305, 0.20071, 0.26958, 0.19581, 'translation-v1.0'),
+('nba_1627098', 'NBA_2017', 'EL_2019', 'NBA->EL', 'usg_pct', 0.1682, 0.21552, 0.16563, 0.26541, 0.13922, 0.29182, 0.16752, 0.26352, 0.11209, 0.31895, 0.22748, 0.20288, 0.1742, 0.12615, 'translation-v1.0'),
+('nba_1627733', 'NBA_2018', 'GL_2019', 'NBA->GL', 'usg_pct', 0.1306, 0.22267, 0.17323, 0.27211, 0.14705, 0.29829, 0.13819, 0.30715, 0.11289, 0.33245, 0.26312, 0.20024, 0.13903, 0.09795, 'translation-v1.0'),
+('nba_1627735', 'GL_2018', 'EL_2019', 'GL->EL', 'usg_pct', 0.29307, 0.22873, 0.17884, 0.27862, 0.15243, 0.30503, 0.20143, 0.25603, NULL, NULL, 0.20706, 0.20288, 0.29553, 0.21981, 'translation-v1.0'),
+('nba_1627762', 'GL_2017', 'EL_2019', 'GL->EL', 'usg_pct', 0.19933, 0.14681, 0.09693, 0.1967, 0.07052, 0.22311, 0.11951, 0.17412, NULL, NULL, 0.1577, 0.20288, 0.20184, 0.1495, 'translation-v1.0'),
+('nba_1627789', 'NBA_2018', 'GL_2019', 'NBA->GL', 'usg_pct', 0.17039, 0.24064, 0.19119, 0.29008, 0.16502, 0.31625, 0.15616, 0.32511, 0.13086, 0.35041, 0.25895, 0.20024, 0.17392, 0.12779, 'translation-v1.0'),
+('nba_1627835', 'NBA_2017', 'EL_2019', 'NBA->EL', 'usg_pct', 0.15641, 0.215, 0.16511, 0.26489, 0.1387, 0.2913, 0.167, 0.263, 0.11157, 0.31843, 0.19733, 0.20288, 0.1638, 0.11731, 'translation-v1.0'),
+('nba_1629740', 'EL_2018', 'NBA_2019', 'EL->NBA', 'usg_pct', 0.1556, 0.14645, 0.0878, 0.2051, 0.05676, 0.23615, 0.08843, 0.20447, NULL, NULL, 0.15817, 0.20071, 0.14826, 0.1167, 'translation-v1.0'),
+('nba_1627733', 'NBA_2018', 'EL_2020', 'NBA->EL', 'usg_pct', 0.1306, 0.2043, 0.15008, 0.25852, 0.12137, 0.28723, 0.15213, 0.25647, 0.09188, 0.31672, 0.17161, 0.20188, 0.13475, 0.09795, 'translation-v1.0'),
+('nba_1627790', 'NBA_2018', 'EL_2020', 'NBA->EL', 'usg_pct', 0.18222, 0.23242, 0.17819, 0.28664, 0.14949, 0.31534, 0.18025, 0.28459, 0.12, 0.34483, 0.21774, 0.20188, 0.18439, 0.13667, 'translation-v1.0'),
+('nba_1627812', 'NBA_2019', 'GL_2020', 'NBA->GL', 'usg_pct', 0.18889, 0.24891, 0.20343, 0.2944, 0.17935, 0.31848, 0.1712, 0.32663, 0.14793, 0.3499, 0.2455, 0.20505, 0.19588, 0.14167, 'translation-v1.0'),
+('nba_1627816', 'GL_2018', 'EL_2020', 'GL->EL', 'usg_pct', 0.29861, 0.20709, 0.15287, 0.26131, 0.12417, 0.29002, 0.17742, 0.23677, NULL, NULL, 0.22975, 0.20188, 0.30858, 0.22396, 'translation-v1.0'),
+('nba_1627820', 'NBA_2018', 'GL_2020', 'NBA->GL', 'usg_pct', 0.20098, 0.23718, 0.19169, 0.28266, 0.16762, 0.30674, 0.15947, 0.31489, 0.13619, 0.33817, 0.24888, 0.20505, 0.20551, 0.15073, 'translation-v1.0'),
+('nba_1630267', 'EL_2019', 'NBA_2020', 'EL->NBA', 'usg_pct', 0.22899, 0.19721, 0.13804, 0.25638, 0.10672, 0.28771, 0.13868, 0.25575, NULL, NULL, 0.12859, 0.20065, 0.23161, 0.17174, 'translation-v1.0'),
+('nba_1626170', 'GL_2019', 'EL_2021', 'GL->EL', 'usg_pct', 0.19297, 0.13598, 0.08467, 0.1873, 0.05751, 0.21446, 0.1079, 0.16407, NULL, NULL, 0.16056, 0.20183, 0.19429, 0.14473, 'translation-v1.0'),
+('nba_1626188', 'NBA_2019', 'GL_2021', 'NBA->GL', 'usg_pct', 0.2091, 0.23947, 0.18744, 0.29149, 0.1599, 0.31903, 0.15059, 0.32835, 0.12396, 0.35497, 0.27459, 0.20017, 0.20761, 0.15682, 'translation-v1.0'),
+('nba_1626203', 'NBA_2019', 'GL_2021', 'NBA->GL', 'usg_pct', 0.13694, 0.19965, 0.14762, 0.25167, 0.12009, 0.27921, 0.11077, 0.28853, 0.08414, 0.31515, 0.09673, 0.20017, 0.1436, 0.1027, 'translation-v1.0'),
+('nba_1626209', 'NBA_2019', 'EL_2021', 'NBA->EL', 'usg_pct', 0.13735, 0.20357, 0.15226, 0.25489, 0.12509, 0.28205, 0.1542, 0.25294, 0.09718, 0.30996, 0.25659, 0.20183, 0.1464, 0.10301, 'translation-v1.0'),
+('nba_1627739', 'NBA_2019', 'GL_2021', 'NBA->GL', 'usg_pct', 0.14685, 0.20417, 0.15215, 0.25619, 0.12461, 0.28373, 0.11529, 0.29305, 0.08867, 0.31967, 0.21217, 0.20017, 0.1524, 0.11014, 'translation-v1.0'),
+('nba_1627748', 'NBA_2019', 'GL_2021', 'NBA->GL', 'usg_pct', 0.1701, 0.22193, 0.16991, 0.27396, 0.14237, 0.3015, 0.13305, 0.31082, 0.10643, 0.33744, 0.16673, 0.20017, 0.17301, 0.12757, 'translation-v1.0'),
+('nba_1627756', 'NBA_2020', 'GL_2021', 'NBA->GL', 'usg_pct', 0.19151, 0.24997, 0.19795, 0.302, 0.17041, 0.32953, 0.16109, 0.33885, 0.13447, 0.36548, 0.22719, 0.20017, 0.19214, 0.14363, 'translation-v1.0'),
+('nba_1627767', 'NBA_2019', 'GL_2021', 'NBA->GL', 'usg_pct', 0.17011, 0.22329, 0.17127, 0.27531, 0.14373, 0.30285, 0.13441, 0.31217, 0.10779, 0.3388, 0.20879, 0.20017, 0.17303, 0.12759, 'translation-v1.0'),
+('nba_1627775', 'NBA_2019', 'GL_2021', 'NBA->GL', 'usg_pct', 0.09428, 0.17894, 0.12692, 0.23097, 0.09938, 0.25851, 0.09006, 0.26783, 0.06344, 0.29445, 0.10855, 0.20017, 0.10577, 0.07071, 'translation-v1.0'),
+('nba_1629740', 'NBA_2020', 'EL_2021', 'NBA->EL', 'usg_pct', 0.12774, 0.21656, 0.16525, 0.26788, 0.13809, 0.29504, 0.16719, 0.26593, 0.11018, 0.32295, 0.17211, 0.20183, 0.13861, 0.09581, 'translation-v1.0'),
+('nba_1626161', 'NBA_2020', 'GL_2022', 'NBA->GL', 'usg_pct', 0.11942, 0.19004, 0.1419, 0.23818, 0.11642, 0.26367, 0.10779, 0.27229, 0.08316, 0.29693, 0.11832, 0.19991, 0.13382, 0.08956, 'translation-v1.0'),
+('nba_1626208', 'NBA_2021', 'GL_2022', 'NBA->GL', 'usg_pct', 0.17208, 0.23645, 0.18831, 0.28459, 0.16282, 0.31007, 0.1542, 0.31869, 0.12956, 0.34333, 0.23251, 0.19991, 0.17592, 0.12906, 'translation-v1.0'),
+('nba_1627789', 'NBA_2021', 'EL_2022', 'NBA->EL', 'usg_pct', 0.14436, 0.22882, 0.17443, 0.28322, 0.14564, 0.31201, 0.17649, 0.28116, 0.11605, 0.34159, 0.25557, 0.20223, 0.1491, 0.10827, 'translation-v1.0'),
+('nba_1627822', 'GL_2021', 'EL_2022', 'GL->EL', 'usg_pct', 0.23265, 0.1836, 0.1292, 0.23799, 0.10041, 0.26678, 0.15383, 0.21336, NULL, NULL, 0.16235, 0.20223, 0.2362, 0.17449, 'translation-v1.0'),
+('nba_1626147', 'GL_2022', 'EL_2023', 'GL->EL', 'usg_pct', 0.23708, 0.18394, 0.12989, 0.23799, 0.10128, 0.2666, 0.15436, 0.21352, NULL, NULL, 0.16729, 0.20166, 0.24339, 0.17781, 'translation-v1.0'),
+('nba_1626159', 'NBA_2022', 'GL_2023', 'NBA->GL', 'usg_pct', 0.14043, 0.22346, 0.17329, 0.27363, 0.14673, 0.30019, 0.13775, 0.30918, 0.11207, 0.33485, 0.2579, 0.20014, 0.15082, 0.10532, 'translation-v1.0'),
+('nba_1626169', 'NBA_2022', 'GL_2023', 'NBA->GL', 'usg_pct', 0.15186, 0.23055, 0.18038, 0.28072, 0.15382, 0.30728, 0.14484, 0.31627, 0.11916, 0.34194, 0.21985, 0.20014, 0.16018, 0.1139, 'translation-v1.0'),
+('nba_1626195', 'NBA_2022', 'EL_2023', 'NBA->EL', 'usg_pct', 0.23591, 0.27859, 0.22455, 0.33264, 0.19594, 0.36125, 0.22659, 0.33059, 0.16654, 0.39064, 0.31183, 0.20166, 0.23274, 0.17693, 'translation-v1.0'),
+('nba_1627823', 'NBA_2022', 'EL_2023', 'NBA->EL', 'usg_pct', 0.0949, 0.20358, 0.14954, 0.25763, 0.12093, 0.28624, 0.15159, 0.25558, 0.09153, 0.31564, 0.15886, 0.20166, 0.10839, 0.07118, 'translation-v1.0'),
+('nba_1630267', 'NBA_2021', 'EL_2023', 'NBA->EL', 'usg_pct', 0.14684, 0.20123, 0.14719, 0.25528, 0.11858, 0.28389, 0.14923, 0.25323, 0.08918, 0.31328, 0.23119, 0.20166, 0.15118, 0.11013, 'translation-v1.0'),
+('nba_203995', 'EL_2022', 'NBA_2023', 'EL->NBA', 'usg_pct', 0.26555, 0.21994, 0.15897, 0.2809, 0.1267, 0.31318, 0.15962, 0.28025, NULL, NULL, 0.20225, 0.20074, 0.27171, 0.19916, 'translation-v1.0'),
+('nba_1626163', 'EL_2023', 'GL_2024', 'EL->GL', 'usg_pct', 0.22635, 0.23161, 0.1776, 0.28563, 0.149, 0.31423, NULL, NULL, NULL, NULL, 0.1977, 0.20033, 0.225, 0.16976, 'translation-v1.0'),
+('nba_1626224', 'NBA_2023', 'EL_2024', 'NBA->EL', 'usg_pct', 0.15025, 0.23088, 0.17273, 0.28903, 0.14194, 0.31981, 0.17493, 0.28683, 0.11032, 0.35144, 0.20534, 0.2013, 0.15315, 0.11269, 'translation-v1.0'),
+('nba_1627824', 'EL_2023', 'NBA_2024', 'EL->NBA', 'usg_pct', 0.16963, 0.15665, 0.0974, 0.21591, 0.06603, 0.24727, 0.09803, 0.21527, NULL, NULL, 0.15898, 0.20047, 0.16535, 0.12722, 'translation-v1.0'),
+('nba_101141', 'NBA_2006', 'EL_2007', 'NBA->EL', 'ts_pct', 0.4998, 0.55037, 0.47684, 0.62391, 0.43792, 0.66283, 0.48434, 0.61641, 0.43413, 0.66662, 0.44242, 0.57629, 0.52594, 0.37485, 'translation-v1.0'),
+('nba_101212', 'NBA_2005', 'EL_2007', 'NBA->EL', 'ts_pct', 0.48877, 0.59039, 0.51686, 0.66392, 0.47793, 0.70285, 0.52435, 0.65643, 0.47414, 0.70664, 0.60136, 0.57629, 0.5188, 0.36658, 'translation-v1.0'),
+('nba_1531', 'NBA_2006', 'EL_2007', 'NBA->EL', 'ts_pct', 0.47078, 0.52722, 0.45369, 0.60075, 0.41476, 0.63968, 0.46118, 0.59326, 0.41097, 0.64347, 0.58789, 0.57629, 0.48971, 0.35309, 'translation-v1.0'),
+('nba_101137', 'NBA_2006', 'EL_2008', 'NBA->EL', 'ts_pct', 0.49502, 0.58761, 0.51212, 0.66311, 0.47216, 0.70307, 0.51982, 0.65541, 0.46827, 0.70696, 0.51316, 0.58004, 0.52222, 0.37127, 'translation-v1.0'),
+('nba_101146', 'EL_2007', 'NBA_2008', 'EL->NBA', 'ts_pct', 0.56583, 0.51945, 0.46214, 0.57676, 0.4318, 0.6071, 0.4313, 0.6076, NULL, NULL, 0.42951, 0.54363, 0.53548, 0.42438, 'translation-v1.0'),
+('nba_101198', 'EL_2007', 'NBA_2008', 'EL->NBA', 'ts_pct', 0.59557, 0.52998, 0.47267, 0.58729, 0.44233, 0.61763, 0.44183, 0.61813, NULL, NULL, 0.51983, 0.54363, 0.55866, 0.44668, 'translation-v1.0'),
+('nba_101132', 'NBA_2008', 'EL_2009', 'NBA->EL', 'ts_pct', 0.55249, 0.5699, 0.49588, 0.64392, 0.4567, 0.6831, 0.50343, 0.63637, 0.45289, 0.68691, 0.58767, 0.58191, 0.59335, 0.41437, 'translation-v1.0'),
+('nba_101141', 'EL_2008', 'NBA_2009', 'EL->NBA', 'ts_pct', 0.57222, 0.52308, 0.46619, 0.57997, 0.43608, 0.61009, 0.43558, 0.61059, NULL, NULL, 0.52597, 0.54275, 0.53685, 0.42916, 'translation-v1.0'),
+('nba_101132', 'EL_2009', 'NBA_2010', 'EL->NBA', 'ts_pct', 0.58767, 0.51981, 0.46216, 0.57746, 0.43165, 0.60798, 0.43114, 0.60848, NULL, NULL, 0.50161, 0.54142, 0.5459, 0.44075, 'translation-v1.0'),
+('nba_101146', 'NBA_2008', 'EL_2010', 'NBA->EL', 'ts_pct', 0.42951, 0.52227, 0.45378, 0.59075, 0.41752, 0.62701, 0.46076, 0.58377, 0.41399, 0.63054, 0.57986, 0.55518, 0.4188, 0.32213, 'translation-v1.0'),
+('nba_101187', 'EL_2009', 'NBA_2011', 'EL->NBA', 'ts_pct', 0.56405, 0.52276, 0.45935, 0.58617, 0.42578, 0.61974, 0.42523, 0.62029, NULL, NULL, 0.51924, 0.52649, 0.51119, 0.42304, 'translation-v1.0'),
+('nba_101132', 'NBA_2011', 'EL_2013', 'NBA->EL', 'ts_pct', 0.52093, 0.58492, 0.51613, 0.65372, 0.47971, 0.69014, 0.52314, 0.64671, 0.47616, 0.69369, 0.58946, 0.56584, 0.55981, 0.39069, 'translation-v1.0'),
+('nba_101249', 'NBA_2013', 'GL_2015', 'NBA->GL', 'ts_pct', 0.40347, 0.53824, 0.4778, 0.59868, 0.44581, 0.63067, 0.49058, 0.5859, 0.4499, 0.62658, 0.56705, 0.55669, 0.41389, 0.3026, 'translation-v1.0'),
+('nba_1626246', 'EL_2014', 'NBA_2015', 'EL->NBA', 'ts_pct', 0.67157, 0.55091, 0.49643, 0.60539, 0.46759, 0.63423, 0.46712, 0.63471, NULL, NULL, 0.66247, 0.54099, 0.6168, 0.50368, 'translation-v1.0'),
+('nba_101126', 'NBA_2014', 'GL_2016', 'NBA->GL', 'ts_pct', 0.43235, 0.55115, 0.48865, 0.61365, 0.45556, 0.64674, 0.50187, 0.60044, 0.45979, 0.64251, 0.54727, 0.55334, 0.44482, 0.32426, 'translation-v1.0'),
+('nba_1626150', 'GL_2015', 'NBA_2016', 'GL->NBA', 'ts_pct', 0.57449, 0.50581, 0.44863, 0.56299, 0.41836, 0.59325, 0.42172, 0.5899, NULL, NULL, 0.47714, 0.551, 0.56783, 0.43087, 'translation-v1.0'),
+('nba_1626262', 'GL_2015', 'EL_2016', 'GL->EL', 'ts_pct', 0.63014, 0.56311, 0.49275, 0.63347, 0.45551, 0.67071, 0.43156, 0.69466, NULL, NULL, 0.49861, 0.57141, 0.65692, 0.47261, 'translation-v1.0'),
+('nba_1627098', 'EL_2015', 'NBA_2016', 'EL->NBA', 'ts_pct', 0.6123, 0.53541, 0.47823, 0.59259, 0.44796, 0.62285, 0.44746, 0.62335, NULL, NULL, 0.4558, 0.551, 0.58448, 0.45923, 'translation-v1.0'),
+('nba_1627851', 'EL_2015', 'NBA_2016', 'EL->NBA', 'ts_pct', 0.59258, 0.53902, 0.48185, 0.5962, 0.45158, 0.62647, 0.45108, 0.62697, NULL, NULL, 0.53269, 0.551, 0.56946, 0.44443, 'translation-v1.0'),
+('nba_1626188', 'GL_2015', 'NBA_2017', 'GL->NBA', 'ts_pct', 0.57404, 0.53741, 0.48116, 0.59366, 0.45139, 0.62344, 0.45469, 0.62014, NULL, NULL, 0.59316, 0.55663, 0.57278, 0.43053, 'translation-v1.0'),
+('nba_1626203', 'GL_2015', 'NBA_2017', 'GL->NBA', 'ts_pct', 0.5465, 0.52721, 0.47096, 0.58346, 0.44118, 0.61323, 0.44448, 0.60993, NULL, NULL, 0.55272, 0.55663, 0.54715, 0.40988, 'translation-v1.0'),
+('nba_1626224', 'EL_2016', 'NBA_2017', 'EL->NBA', 'ts_pct', 0.52826, 0.52018, 0.46393, 0.57643, 0.43416, 0.60621, 0.43366, 0.6067, NULL, NULL, 0.577, 0.55663, 0.52214, 0.39619, 'translation-v1.0'),
+('nba_1626253', 'GL_2016', 'EL_2017', 'GL->EL', 'ts_pct', 0.60673, 0.56796, 0.49374, 0.64219, 0.45445, 0.68148, 0.42919, 0.70674, NULL, NULL, 0.6038, 0.58615, 0.64956, 0.45505, 'translation-v1.0'),
+('nba_1626643', 'EL_2015', 'GL_2017', 'EL->GL', 'ts_pct', 0.54677, 0.56266, 0.49981, 0.62551, 0.46654, 0.65878, NULL, NULL, NULL, NULL, 0.51363, 0.55839, 0.54034, 0.41008, 'translation-v1.0'),
+('nba_1627785', 'NBA_2016', 'GL_2017', 'NBA->GL', 'ts_pct', 0.4868, 0.53454, 0.47169, 0.59739, 0.43841, 0.63066, 0.48498, 0.5841, 0.44267, 0.62641, 0.55328, 0.55839, 0.48783, 0.3651, 'translation-v1.0'),
+('nba_1627790', 'EL_2016', 'GL_2017', 'EL->GL', 'ts_pct', 0.66352, 0.58538, 0.52252, 0.64823, 0.48925, 0.6815, NULL, NULL, NULL, NULL, 0.62183, 0.55839, 0.64068, 0.49764, 'translation-v1.0'),
+('nba_1627814', 'GL_2016', 'NBA_2017', 'GL->NBA', 'ts_pct', 0.62434, 0.5461, 0.48985, 0.60235, 0.46007, 0.63212, 0.46337, 0.62882, NULL, NULL, 0.48859, 0.55663, 0.62054, 0.46826, 'translation-v1.0'),
+('nba_1627820', 'GL_2016', 'NBA_2017', 'GL->NBA', 'ts_pct', 0.51807, 0.49688, 0.44063, 0.55313, 0.41085, 0.58291, 0.41415, 0.5796, NULL, NULL, 0.5172, 0.55663, 0.52489, 0.38855, 'translation-v1.0'),
+('nba_1627846', 'GL_2016', 'NBA_2017', 'GL->NBA', 'ts_pct', 0.56676, 0.51214, 0.45589, 0.56839, 0.42611, 0.59817, 0.42942, 0.59487, NULL, NULL, 0.43934, 0.55663, 0.56871, 0.42507, 'translation-v1.0'),
+('nba_1627851', 'NBA_2016', 'EL_2017', 'NBA->EL', 'ts_pct', 0.53269, 0.56755, 0.49333, 0.64177, 0.45404, 0.68106, 0.50089, 0.63421, 0.45021, 0.68489, 0.57884, 0.58615, 0.56238, 0.39952, 'translation-v1.0'),
+('nba_1627853', 'GL_2016', 'NBA_2017', 'GL->NBA', 'ts_pct', 0.59617, 0.52403, 0.46778, 0.58028, 0.438, 0.61006, 0.4413, 0.60675, NULL, NULL, 0.54995, 0.55663, 0.59519, 0.44713, 'translation-v1.0'),
+('nba_1627858', 'GL_2016', 'NBA_2017', 'GL->NBA', 'ts_pct', 0.4707, 0.47825, 0.422, 0.5345, 0.39223, 0.56428, 0.39553, 0.56098, NULL, NULL, 0.4331, 0.55663, 0.48227, 0.35303, 'translation-v1.0'),
+('nba_1626199', 'GL_2017', 'EL_2018', 'GL->EL', 'ts_pct', 0.59719, 0.56116, 0.48764, 0.63467, 0.44873, 0.67359, 0.4237, 0.69862, NULL, NULL, 0.54025, 0.58771, 0.63308, 0.44789, 'translation-v1.0'),
+('nba_1627790', 'EL_2016', 'NBA_2018', 'EL->NBA', 'ts_pct', 0.66352, 0.60083, 0.54381, 0.65784, 0.51363, 0.68802, 0.51313, 0.68852, NULL, NULL, 0.58985, 0.55971, 0.63436, 0.49764, 'translation-v1.0'),
+('nba_1627834', 'GL_2016', 'EL_2018', 'GL->EL', 'ts_pct', 0.53429, 0.57226, 0.49875, 0.64578, 0.45983, 0.68469, 0.4348, 0.70972, NULL, NULL, 0.69115, 0.58771, 0.5653, 0.40072, 'translation-v1.0'),
+('nba_1629029', 'EL_2017', 'NBA_2018', 'EL->NBA', 'ts_pct', 0.61193, 0.54345, 0.48644, 0.60046, 0.45626, 0.63065, 0.45576, 0.63114, NULL, NULL, 0.54523, 0.55971, 0.57952, 0.45895, 'translation-v1.0'),
+('nba_101127', 'NBA_2017', 'GL_2019', 'NBA->GL', 'ts_pct', 0.4895, 0.58316, 0.51305, 0.65327, 0.47593, 0.69038, 0.52787, 0.63844, 0.48068, 0.68564, 0.62316, 0.58734, 0.50366, 0.36712, 'translation-v1.0'),
+('nba_1626147', 'NBA_2018', 'GL_2019', 'NBA->GL', 'ts_pct', 0.51624, 0.59124, 0.52113, 0.66135, 0.48402, 0.69847, 0.53596, 0.64653, 0.48876, 0.69372, 0.64167, 0.58734, 0.53388, 0.38718, 'translation-v1.0'),
+('nba_1626150', 'NBA_2017', 'GL_2019', 'NBA->GL', 'ts_pct', 0.53411, 0.61633, 0.54622, 0.68644, 0.50911, 0.72356, 0.56105, 0.67162, 0.51385, 0.71881, 0.60823, 0.58734, 0.55927, 0.40058, 'translation-v1.0'),
+('nba_1626166', 'NBA_2018', 'GL_2019', 'NBA->GL', 'ts_pct', 0.51859, 0.58585, 0.51574, 0.65596, 0.47862, 0.69307, 0.53056, 0.64113, 0.48337, 0.68833, 0.58327, 0.58734, 0.53677, 0.38894, 'translation-v1.0'),
+('nba_1626170', 'NBA_2018', 'GL_2019', 'NBA->GL', 'ts_pct', 0.52609, 0.58426, 0.51415, 0.65437, 0.47703, 0.69149, 0.52897, 0.63954, 0.48178, 0.68674, 0.63119, 0.58734, 0.546, 0.39457, 'translation-v1.0'),
+('nba_1626174', 'GL_2017', 'NBA_2019', 'GL->NBA', 'ts_pct', 0.63721, 0.56998, 0.50416, 0.6358, 0.46932, 0.67064, 0.47318, 0.66678, NULL, NULL, 0.65909, 0.56503, 0.64757, 0.47791, 'translation-v1.0'),
+('nba_1627098', 'NBA_2017', 'EL_2019', 'NBA->EL', 'ts_pct', 0.51923, 0.58447, 0.50911, 0.65982, 0.46922, 0.69972, 0.51679, 0.65214, 0.46534, 0.7036, 0.61088, 0.58285, 0.53274, 0.38942, 'translation-v1.0'),
+('nba_1627733', 'NBA_2018', 'GL_2019', 'NBA->GL', 'ts_pct', 0.52093, 0.58589, 0.51578, 0.656, 0.47866, 0.69311, 0.5306, 0.64117, 0.48341, 0.68837, 0.65209, 0.58734, 0.53965, 0.3907, 'translation-v1.0'),
+('nba_1627735', 'GL_2018', 'EL_2019', 'GL->EL', 'ts_pct', 0.54348, 0.5451, 0.46975, 0.62046, 0.42986, 0.66035, 0.4042, 0.686, NULL, NULL, 0.50169, 0.58285, 0.56865, 0.40761, 'translation-v1.0'),
+('nba_1627762', 'GL_2017', 'EL_2019', 'GL->EL', 'ts_pct', 0.61375, 0.59811, 0.52276, 0.67347, 0.48286, 0.71336, 0.45721, 0.73901, NULL, NULL, 0.57243, 0.58285, 0.64922, 0.46031, 'translation-v1.0'),
+('nba_1627789', 'NBA_2018', 'GL_2019', 'NBA->GL', 'ts_pct', 0.48932, 0.57137, 0.50125, 0.64148, 0.46414, 0.67859, 0.51608, 0.62665, 0.46888, 0.67385, 0.5536, 0.58734, 0.50078, 0.36699, 'translation-v1.0'),
+('nba_1627835', 'NBA_2017', 'EL_2019', 'NBA->EL', 'ts_pct', 0.4449, 0.54815, 0.4728, 0.62351, 0.4329, 0.6634, 0.48048, 0.61583, 0.42902, 0.66728, 0.57026, 0.58285, 0.43316, 0.33367, 'translation-v1.0'),
+('nba_1629740', 'EL_2018', 'NBA_2019', 'EL->NBA', 'ts_pct', 0.55824, 0.52013, 0.45431, 0.58595, 0.41947, 0.62079, 0.41889, 0.62137, NULL, NULL, 0.55615, 0.56503, 0.53865, 0.41868, 'translation-v1.0'),
+('nba_1627733', 'NBA_2018', 'EL_2020', 'NBA->EL', 'ts_pct', 0.52093, 0.59994, 0.52834, 0.67154, 0.49044, 0.70944, 0.53564, 0.66424, 0.48675, 0.71313, 0.59273, 0.59135, 0.54265, 0.3907, 'translation-v1.0'),
+('nba_1627790', 'NBA_2018', 'EL_2020', 'NBA->EL', 'ts_pct', 0.58985, 0.6323, 0.5607, 0.70389, 0.5228, 0.74179, 0.568, 0.6966, 0.51911, 0.74548, 0.6128, 0.59135, 0.6292, 0.44239, 'translation-v1.0'),
+('nba_1627812', 'NBA_2019', 'GL_2020', 'NBA->GL', 'ts_pct', 0.5279, 0.5797, 0.49992, 0.65947, 0.45769, 0.70171, 0.51679, 0.6426, 0.46309, 0.69631, 0.59511, 0.57216, 0.52714, 0.39592, 'translation-v1.0'),
+('nba_1627816', 'GL_2018', 'EL_2020', 'GL->EL', 'ts_pct', 0.56374, 0.59029, 0.51869, 0.66188, 0.48079, 0.69978, 0.45641, 0.72416, NULL, NULL, 0.61388, 0.59135, 0.60123, 0.42281, 'translation-v1.0'),
+('nba_1627820', 'NBA_2018', 'GL_2020', 'NBA->GL', 'ts_pct', 0.45026, 0.56594, 0.48616, 0.64572, 0.44393, 0.68795, 0.50303, 0.62884, 0.44933, 0.68255, 0.58759, 0.57216, 0.41901, 0.3377, 'translation-v1.0'),
+('nba_1630267', 'EL_2019', 'NBA_2020', 'EL->NBA', 'ts_pct', 0.57355, 0.54141, 0.47803, 0.6048, 0.44447, 0.63836, 0.44392, 0.63891, NULL, NULL, 0.55768, 0.57259, 0.56477, 0.43016, 'translation-v1.0'),
+('nba_1626170', 'GL_2019', 'EL_2021', 'GL->EL', 'ts_pct', 0.63119, 0.57458, 0.49703, 0.65212, 0.45599, 0.69316, 0.42959, 0.71956, NULL, NULL, 0.43494, 0.57393, 0.62243, 0.47339, 'translation-v1.0'),
+('nba_1626188', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ts_pct', 0.50872, 0.61851, 0.53893, 0.69809, 0.4968, 0.74022, 0.55576, 0.68126, 0.50218, 0.73484, 0.63618, 0.58542, 0.51733, 0.38154, 'translation-v1.0'),
+('nba_1626203', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ts_pct', 0.45567, 0.58011, 0.50053, 0.65969, 0.4584, 0.70182, 0.51735, 0.64286, 0.46378, 0.69644, 0.47137, 0.58542, 0.45319, 0.34175, 'translation-v1.0'),
+('nba_1626209', 'NBA_2019', 'EL_2021', 'NBA->EL', 'ts_pct', 0.52468, 0.58258, 0.50504, 0.66012, 0.46399, 0.70117, 0.51294, 0.65222, 0.46, 0.70516, 0.555, 0.57393, 0.52639, 0.39351, 'translation-v1.0'),
+('nba_1627739', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ts_pct', 0.5099, 0.60252, 0.52294, 0.68211, 0.48081, 0.72423, 0.53977, 0.66528, 0.48619, 0.71885, 0.5467, 0.58542, 0.51875, 0.38242, 'translation-v1.0'),
+('nba_1627748', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ts_pct', 0.58202, 0.651, 0.57141, 0.73058, 0.52929, 0.77271, 0.58824, 0.71375, 0.53467, 0.76733, 0.55176, 0.58542, 0.60596, 0.43652, 'translation-v1.0'),
+('nba_1627756', 'NBA_2020', 'GL_2021', 'NBA->GL', 'ts_pct', 0.47936, 0.54922, 0.46964, 0.62881, 0.42751, 0.67094, 0.48647, 0.61198, 0.43289, 0.66555, 0.56272, 0.58542, 0.46836, 0.35952, 'translation-v1.0'),
+('nba_1627767', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ts_pct', 0.68799, 0.71533, 0.63575, 0.79491, 0.59362, 0.83704, 0.65258, 0.77808, 0.599, 0.83166, 0.7258, 0.58542, 0.73409, 0.51599, 'translation-v1.0'),
+('nba_1627775', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ts_pct', 0.50024, 0.6049, 0.52532, 0.68448, 0.48319, 0.72661, 0.54215, 0.66765, 0.48857, 0.72123, 0.55272, 0.58542, 0.50707, 0.37518, 'translation-v1.0'),
+('nba_1629740', 'NBA_2020', 'EL_2021', 'NBA->EL', 'ts_pct', 0.44079, 0.50442, 0.42688, 0.58196, 0.38583, 0.62301, 0.43478, 0.57406, 0.38184, 0.627, 0.5609, 0.57393, 0.4127, 0.33059, 'translation-v1.0'),
+('nba_1626161', 'NBA_2020', 'GL_2022', 'NBA->GL', 'ts_pct', 0.64719, 0.68033, 0.61473, 0.74593, 0.58001, 0.78065, 0.62861, 0.73206, 0.58445, 0.77622, 0.71624, 0.60455, 0.68175, 0.48539, 'translation-v1.0'),
+('nba_1626208', 'NBA_2021', 'GL_2022', 'NBA->GL', 'ts_pct', 0.45574, 0.57565, 0.51005, 0.64125, 0.47532, 0.67597, 0.52392, 0.62737, 0.47976, 0.67153, 0.5331, 0.60455, 0.48976, 0.34181, 'translation-v1.0'),
+('nba_1627789', 'NBA_2021', 'EL_2022', 'NBA->EL', 'ts_pct', 0.55626, 0.58317, 0.51242, 0.65392, 0.47496, 0.69138, 0.51963, 0.64671, 0.47132, 0.69502, 0.5382, 0.59022, 0.57702, 0.4172, 'translation-v1.0'),
+('nba_1627822', 'GL_2021', 'EL_2022', 'GL->EL', 'ts_pct', 0.61412, 0.55982, 0.48906, 0.63057, 0.45161, 0.66802, 0.42752, 0.69211, NULL, NULL, 0.65952, 0.59022, 0.61574, 0.46059, 'translation-v1.0'),
+('nba_1626147', 'GL_2022', 'EL_2023', 'GL->EL', 'ts_pct', 0.62888, 0.54555, 0.47076, 0.62034, 0.43117, 0.65993, 0.40571, 0.68539, NULL, NULL, 0.55154, 0.58451, 0.61225, 0.47166, 'translation-v1.0'),
+('nba_1626159', 'NBA_2022', 'GL_2023', 'NBA->GL', 'ts_pct', 0.46596, 0.55616, 0.48463, 0.62769, 0.44676, 0.66556, 0.49976, 0.61256, 0.4516, 0.66072, 0.56098, 0.59351, 0.46579, 0.34947, 'translation-v1.0'),
+('nba_1626169', 'NBA_2022', 'GL_2023', 'NBA->GL', 'ts_pct', 0.62518, 0.63987, 0.56834, 0.71141, 0.53048, 0.74927, 0.58347, 0.69628, 0.53532, 0.74443, 0.626, 0.59351, 0.64028, 0.46888, 'translation-v1.0'),
+('nba_1626195', 'NBA_2022', 'EL_2023', 'NBA->EL', 'ts_pct', 0.60998, 0.60252, 0.52773, 0.67731, 0.48814, 0.7169, 0.53535, 0.66968, 0.48428, 0.72075, 0.61645, 0.58451, 0.616, 0.45749, 'translation-v1.0'),
+('nba_1627823', 'NBA_2022', 'EL_2023', 'NBA->EL', 'ts_pct', 0.50397, 0.54623, 0.47144, 0.62101, 0.43185, 0.6606, 0.47906, 0.61339, 0.42799, 0.66446, 0.4925, 0.58451, 0.49453, 0.37797, 'translation-v1.0'),
+('nba_1630267', 'NBA_2021', 'EL_2023', 'NBA->EL', 'ts_pct', 0.50254, 0.57048, 0.49569, 0.64527, 0.4561, 0.68486, 0.50331, 0.63765, 0.45225, 0.68871, 0.59799, 0.58451, 0.50807, 0.37691, 'translation-v1.0'),
+('nba_203995', 'EL_2022', 'NBA_2023', 'EL->NBA', 'ts_pct', 0.59082, 0.54916, 0.48772, 0.6106, 0.4552, 0.64312, 0.45466, 0.64366, NULL, NULL, 0.52357, 0.58128, 0.5818, 0.44312, 'translation-v1.0'),
+('nba_1626163', 'EL_2023', 'GL_2024', 'EL->GL', 'ts_pct', 0.63778, 0.5942, 0.52545, 0.66294, 0.48906, 0.69934, NULL, NULL, NULL, NULL, 0.60795, 0.59027, 0.63924, 0.47833, 'translation-v1.0'),
+('nba_1626224', 'NBA_2023', 'EL_2024', 'NBA->EL', 'ts_pct', 0.60091, 0.59048, 0.51616, 0.6648, 0.47682, 0.70414, 0.52374, 0.65723, 0.47299, 0.70797, 0.61556, 0.59375, 0.6175, 0.45069, 'translation-v1.0'),
+('nba_1627824', 'EL_2023', 'NBA_2024', 'EL->NBA', 'ts_pct', 0.71746, 0.59813, 0.53682, 0.65944, 0.50436, 0.6919, 0.50382, 0.69243, NULL, NULL, 0.61566, 0.57732, 0.68632, 0.5381, 'translation-v1.0'),
+('nba_101141', 'NBA_2006', 'EL_2007', 'NBA->EL', 'ast_pct', 0.07651, 0.09504, 0.03172, 0.15835, -0.0018, 0.19187, 0.04224, 0.14783, -0.0201, 0.21017, 0.07272, 0.12392, 0.0723, 0.05739, 'translation-v1.0'),
+('nba_101212', 'NBA_2005', 'EL_2007', 'NBA->EL', 'ast_pct', 0.02098, 0.05983, -0.00349, 0.12314, -0.03701, 0.15666, 0.00703, 0.11262, -0.05531, 0.17496, 0.09567, 0.12392, 0.03054, 0.01573, 'translation-v1.0'),
+('nba_1531', 'NBA_2006', 'EL_2007', 'NBA->EL', 'ast_pct', 0.09561, 0.09506, 0.03175, 0.15838, -0.00177, 0.1919, 0.04227, 0.14786, -0.02007, 0.2102, 0.10314, 0.12392, 0.086, 0.07171, 'translation-v1.0'),
+('nba_101137', 'NBA_2006', 'EL_2008', 'NBA->EL', 'ast_pct', 0.19803, 0.17107, 0.10262, 0.23952, 0.06639, 0.27575, 0.114, 0.22814, 0.0466, 0.29554, 0.17721, 0.12384, 0.1623, 0.14852, 'translation-v1.0'),
+('nba_101146', 'EL_2007', 'NBA_2008', 'EL->NBA', 'ast_pct', 0.19271, 0.2253, 0.13935, 0.31124, 0.09385, 0.35674, 0.12641, 0.32419, NULL, NULL, 0.2716, 0.14365, 0.23701, 0.14453, 'translation-v1.0'),
+('nba_101198', 'EL_2007', 'NBA_2008', 'EL->NBA', 'ast_pct', 0.22689, 0.26467, 0.17873, 0.35062, 0.13323, 0.39612, 0.16578, 0.36356, NULL, NULL, 0.35244, 0.14365, 0.28342, 0.17017, 'translation-v1.0'),
+('nba_101132', 'NBA_2008', 'EL_2009', 'NBA->EL', 'ast_pct', 0.05737, 0.08489, 0.00739, 0.16239, -0.03364, 0.20341, 0.02026, 0.14951, -0.05604, 0.22581, 0.07379, 0.14425, 0.06645, 0.04303, 'translation-v1.0'),
+('nba_101141', 'EL_2008', 'NBA_2009', 'EL->NBA', 'ast_pct', 0.07158, 0.09173, 0.00643, 0.17703, -0.03873, 0.22219, -0.00642, 0.18988, NULL, NULL, 0.07658, 0.14302, 0.0779, 0.05369, 'translation-v1.0'),
+('nba_101132', 'EL_2009', 'NBA_2010', 'EL->NBA', 'ast_pct', 0.07379, 0.07148, -0.01912, 0.16209, -0.06708, 0.21005, -0.03277, 0.17574, NULL, NULL, 0.06235, 0.14635, 0.06397, 0.05534, 'translation-v1.0'),
+('nba_101146', 'NBA_2008', 'EL_2010', 'NBA->EL', 'ast_pct', 0.2716, 0.25173, 0.17632, 0.32714, 0.1364, 0.36705, 0.18885, 0.3146, 0.1146, 0.38885, 0.23596, 0.14032, 0.25259, 0.2037, 'translation-v1.0'),
+('nba_101187', 'EL_2009', 'NBA_2011', 'EL->NBA', 'ast_pct', 0.1595, 0.15638, 0.06208, 0.25068, 0.01217, 0.3006, 0.04788, 0.26488, NULL, NULL, 0.09907, 0.14631, 0.16487, 0.11963, 'translation-v1.0'),
+('nba_101132', 'NBA_2011', 'EL_2013', 'NBA->EL', 'ast_pct', 0.08166, 0.11079, 0.02632, 0.19527, -0.0184, 0.23999, 0.04035, 0.18123, -0.04282, 0.26441, 0.06757, 0.15167, 0.09375, 0.06124, 'translation-v1.0'),
+('nba_101249', 'NBA_2013', 'GL_2015', 'NBA->GL', 'ast_pct', 0.11081, 0.16303, 0.08754, 0.23851, 0.04759, 0.27847, 0.05161, 0.27445, -0.035, 0.36105, 0.2406, 0.13461, 0.10258, 0.08311, 'translation-v1.0'),
+('nba_1626246', 'EL_2014', 'NBA_2015', 'EL->NBA', 'ast_pct', 0.08048, 0.07824, -0.00903, 0.1655, -0.05523, 0.2117, -0.02218, 0.17865, NULL, NULL, 0.06672, 0.14829, 0.07448, 0.06036, 'translation-v1.0'),
+('nba_101126', 'NBA_2014', 'GL_2016', 'NBA->GL', 'ast_pct', 0.26443, 0.27892, 0.20064, 0.3572, 0.1592, 0.39863, 0.16337, 0.39446, 0.07356, 0.48427, 0.23714, 0.13247, 0.23335, 0.19832, 'translation-v1.0'),
+('nba_1626150', 'GL_2015', 'NBA_2016', 'GL->NBA', 'ast_pct', 0.2342, 0.17355, 0.08602, 0.26108, 0.03968, 0.30741, 0.10467, 0.24243, NULL, NULL, 0.19972, 0.14798, 0.26346, 0.17565, 'translation-v1.0'),
+('nba_1626262', 'GL_2015', 'EL_2016', 'GL->EL', 'ast_pct', 0.15848, 0.08447, -0.01012, 0.17907, -0.0602, 0.22915, -0.00303, 0.17198, NULL, NULL, 0.09492, 0.15492, 0.18482, 0.11886, 'translation-v1.0'),
+('nba_1627098', 'EL_2015', 'NBA_2016', 'EL->NBA', 'ast_pct', 0.31394, 0.25925, 0.17172, 0.34678, 0.12538, 0.39311, 0.15854, 0.35996, NULL, NULL, 0.22711, 0.14798, 0.28638, 0.23545, 'translation-v1.0'),
+('nba_1627851', 'EL_2015', 'NBA_2016', 'EL->NBA', 'ast_pct', 0.10769, 0.10022, 0.01269, 0.18775, -0.03364, 0.23409, -0.00049, 0.20094, NULL, NULL, 0.09978, 0.14798, 0.09697, 0.08077, 'translation-v1.0'),
+('nba_1626188', 'GL_2015', 'NBA_2017', 'GL->NBA', 'ast_pct', 0.26072, 0.19797, 0.11336, 0.28258, 0.06857, 0.32737, 0.13139, 0.26455, NULL, NULL, 0.16589, 0.14997, 0.29132, 0.19554, 'translation-v1.0'),
+('nba_1626203', 'GL_2015', 'NBA_2017', 'GL->NBA', 'ast_pct', 0.09067, 0.03376, -0.05084, 0.11837, -0.09563, 0.16316, -0.03282, 0.10035, NULL, NULL, 0.07813, 0.14997, 0.10072, 0.068, 'translation-v1.0'),
+('nba_1626224', 'EL_2016', 'NBA_2017', 'EL->NBA', 'ast_pct', 0.0663, 0.0835, -0.0011, 0.16811, -0.04589, 0.2129, -0.01385, 0.18086, NULL, NULL, 0.0817, 0.14997, 0.07071, 0.04973, 'translation-v1.0'),
+('nba_1626253', 'GL_2016', 'EL_2017', 'GL->EL', 'ast_pct', 0.20522, 0.13818, 0.04518, 0.23118, -0.00405, 0.28041, 0.05216, 0.22421, NULL, NULL, 0.05387, 0.15816, 0.24459, 0.15392, 'translation-v1.0'),
+('nba_1626643', 'EL_2015', 'GL_2017', 'EL->GL', 'ast_pct', 0.23354, 0.24705, 0.16529, 0.32881, 0.12201, 0.37209, NULL, NULL, NULL, NULL, 0.24956, 0.14031, 0.20062, 0.17515, 'translation-v1.0'),
+('nba_1627785', 'NBA_2016', 'GL_2017', 'NBA->GL', 'ast_pct', 0.18034, 0.2304, 0.14865, 0.31216, 0.10536, 0.35544, 0.10973, 0.35108, 0.01592, 0.44489, 0.24928, 0.14031, 0.17054, 0.13525, 'translation-v1.0'),
+('nba_1627790', 'EL_2016', 'GL_2017', 'EL->GL', 'ast_pct', 0.03015, 0.11437, 0.03261, 0.19613, -0.01067, 0.23941, NULL, NULL, NULL, NULL, 0.09898, 0.14031, 0.03248, 0.02261, 'translation-v1.0'),
+('nba_1627814', 'GL_2016', 'NBA_2017', 'GL->NBA', 'ast_pct', 0.16722, 0.11359, 0.02898, 0.1982, -0.01581, 0.24299, 0.04701, 0.18017, NULL, NULL, 0.11202, 0.14997, 0.18753, 0.12541, 'translation-v1.0'),
+('nba_1627820', 'GL_2016', 'NBA_2017', 'GL->NBA', 'ast_pct', 0.2363, 0.1753, 0.09069, 0.25991, 0.04591, 0.3047, 0.10872, 0.24189, NULL, NULL, 0.1171, 0.14997, 0.2622, 0.17722, 'translation-v1.0'),
+('nba_1627846', 'GL_2016', 'NBA_2017', 'GL->NBA', 'ast_pct', 0.21268, 0.15085, 0.06624, 0.23546, 0.02145, 0.28025, 0.08427, 0.21743, NULL, NULL, 0.07083, 0.14997, 0.23667, 0.15951, 'translation-v1.0'),
+('nba_1627851', 'NBA_2016', 'EL_2017', 'NBA->EL', 'ast_pct', 0.09978, 0.12436, 0.03136, 0.21735, -0.01787, 0.26658, 0.04681, 0.2019, -0.04475, 0.29346, 0.12323, 0.15816, 0.10694, 0.07483, 'translation-v1.0'),
+('nba_1627853', 'GL_2016', 'NBA_2017', 'GL->NBA', 'ast_pct', 0.18807, 0.12793, 0.04332, 0.21254, -0.00147, 0.25733, 0.06135, 0.19451, NULL, NULL, 0.15982, 0.14997, 0.21007, 0.14105, 'translation-v1.0'),
+('nba_1627858', 'GL_2016', 'NBA_2017', 'GL->NBA', 'ast_pct', 0.17826, 0.11778, 0.03318, 0.20239, -0.01161, 0.24718, 0.0512, 0.18437, NULL, NULL, 0.1654, 0.14997, 0.19947, 0.1337, 'translation-v1.0'),
+('nba_1626199', 'GL_2017', 'EL_2018', 'GL->EL', 'ast_pct', 0.22755, 0.13935, 0.04439, 0.23432, -0.00588, 0.28459, 0.05151, 0.2272, NULL, NULL, 0.09434, 0.15029, 0.25162, 0.17067, 'translation-v1.0'),
+('nba_1627790', 'EL_2016', 'NBA_2018', 'EL->NBA', 'ast_pct', 0.03015, 0.06758, -0.01527, 0.15044, -0.05913, 0.1943, -0.02775, 0.16292, NULL, NULL, 0.07667, 0.15303, 0.04376, 0.02261, 'translation-v1.0'),
+('nba_1627834', 'GL_2016', 'EL_2018', 'GL->EL', 'ast_pct', 0.02463, -0.04789, -0.14285, 0.04707, -0.19312, 0.09734, -0.13574, 0.03995, NULL, NULL, 0.02649, 0.15029, 0.01947, 0.01847, 'translation-v1.0'),
+('nba_1629029', 'EL_2017', 'NBA_2018', 'EL->NBA', 'ast_pct', 0.29778, 0.26827, 0.18541, 0.35112, 0.14155, 0.39498, 0.17293, 0.3636, NULL, NULL, 0.31034, 0.15303, 0.27743, 0.22334, 'translation-v1.0'),
+('nba_101127', 'NBA_2017', 'GL_2019', 'NBA->GL', 'ast_pct', 0.30745, 0.33288, 0.25202, 0.41374, 0.20922, 0.45655, 0.21353, 0.45223, 0.12076, 0.54501, 0.3441, 0.14988, 0.30039, 0.23059, 'translation-v1.0'),
+('nba_1626147', 'NBA_2018', 'GL_2019', 'NBA->GL', 'ast_pct', 0.06921, 0.14661, 0.06575, 0.22747, 0.02294, 0.27027, 0.02725, 0.26596, -0.06552, 0.35873, 0.12379, 0.14988, 0.06807, 0.0519, 'translation-v1.0'),
+('nba_1626150', 'NBA_2017', 'GL_2019', 'NBA->GL', 'ast_pct', 0.20853, 0.26178, 0.18092, 0.34264, 0.13812, 0.38544, 0.14243, 0.38113, 0.04965, 0.47391, 0.27644, 0.14988, 0.20585, 0.1564, 'translation-v1.0'),
+('nba_1626166', 'NBA_2018', 'GL_2019', 'NBA->GL', 'ast_pct', 0.22105, 0.274, 0.19314, 0.35486, 0.15034, 0.39766, 0.15465, 0.39335, 0.06187, 0.48613, 0.47041, 0.14988, 0.21627, 0.16579, 'translation-v1.0'),
+('nba_1626170', 'NBA_2018', 'GL_2019', 'NBA->GL', 'ast_pct', 0.22204, 0.27, 0.18914, 0.35086, 0.14634, 0.39367, 0.15065, 0.38935, 0.05788, 0.48213, 0.2427, 0.14988, 0.21723, 0.16653, 'translation-v1.0'),
+('nba_1626174', 'GL_2017', 'NBA_2019', 'GL->NBA', 'ast_pct', 0.11738, 0.0594, -0.02504, 0.14385, -0.06975, 0.18856, -0.00705, 0.12586, NULL, NULL, 0.08207, 0.15368, 0.12999, 0.08803, 'translation-v1.0'),
+('nba_1627098', 'NBA_2017', 'EL_2019', 'NBA->EL', 'ast_pct', 0.23429, 0.25218, 0.15257, 0.3518, 0.09984, 0.40453, 0.16912, 0.33524, 0.07105, 0.43332, 0.35882, 0.15626, 0.25553, 0.17572, 'translation-v1.0'),
+('nba_1627733', 'NBA_2018', 'GL_2019', 'NBA->GL', 'ast_pct', 0.0901, 0.1664, 0.08554, 0.24726, 0.04274, 0.29006, 0.04705, 0.28575, -0.04573, 0.37853, 0.12449, 0.14988, 0.08847, 0.06757, 'translation-v1.0'),
+('nba_1627735', 'GL_2018', 'EL_2019', 'GL->EL', 'ast_pct', 0.21953, 0.14423, 0.04462, 0.24384, -0.00811, 0.29658, 0.05209, 0.23638, NULL, NULL, 0.18237, 0.15626, 0.24883, 0.16465, 'translation-v1.0'),
+('nba_1627762', 'GL_2017', 'EL_2019', 'GL->EL', 'ast_pct', 0.06547, -0.02537, -0.12498, 0.07424, -0.17771, 0.12698, -0.11751, 0.06678, NULL, NULL, 0.04746, 0.15626, 0.06507, 0.0491, 'translation-v1.0'),
+('nba_1627789', 'NBA_2018', 'GL_2019', 'NBA->GL', 'ast_pct', 0.05586, 0.13385, 0.05299, 0.21471, 0.01019, 0.25752, 0.0145, 0.2532, -0.07827, 0.34598, 0.14771, 0.14988, 0.05505, 0.0419, 'translation-v1.0'),
+('nba_1627835', 'NBA_2017', 'EL_2019', 'NBA->EL', 'ast_pct', 0.08238, 0.10536, 0.00575, 0.20498, -0.04698, 0.25771, 0.02231, 0.18842, -0.07577, 0.2865, 0.09798, 0.15626, 0.07667, 0.06178, 'translation-v1.0'),
+('nba_1629740', 'EL_2018', 'NBA_2019', 'EL->NBA', 'ast_pct', 0.09679, 0.10262, 0.01817, 0.18707, -0.02653, 0.23177, 0.00545, 0.19979, NULL, NULL, 0.10509, 0.15368, 0.1061, 0.07259, 'translation-v1.0'),
+('nba_1627733', 'NBA_2018', 'EL_2020', 'NBA->EL', 'ast_pct', 0.0901, 0.11813, 0.02168, 0.21459, -0.02938, 0.26565, 0.03771, 0.19856, -0.05726, 0.29353, 0.06691, 0.15814, 0.08488, 0.06757, 'translation-v1.0'),
+('nba_1627790', 'NBA_2018', 'EL_2020', 'NBA->EL', 'ast_pct', 0.07667, 0.09989, 0.00343, 0.19634, -0.04763, 0.2474, 0.01946, 0.18031, -0.07551, 0.27528, 0.06833, 0.15814, 0.06924, 0.0575, 'translation-v1.0'),
+('nba_1627812', 'NBA_2019', 'GL_2020', 'NBA->GL', 'ast_pct', 0.18023, 0.2405, 0.16549, 0.3155, 0.12579, 0.3552, 0.12979, 0.3512, 0.04374, 0.43725, 0.25896, 0.16002, 0.1836, 0.13518, 'translation-v1.0'),
+('nba_1627816', 'GL_2018', 'EL_2020', 'GL->EL', 'ast_pct', 0.14294, 0.05809, -0.03836, 0.15455, -0.08942, 0.20561, -0.03113, 0.14732, NULL, NULL, 0.05944, 0.15814, 0.15385, 0.1072, 'translation-v1.0'),
+('nba_1627820', 'NBA_2018', 'GL_2020', 'NBA->GL', 'ast_pct', 0.10319, 0.18173, 0.10673, 0.25673, 0.06702, 0.29643, 0.07102, 0.29243, -0.01503, 0.37849, 0.16658, 0.16002, 0.11489, 0.07739, 'translation-v1.0'),
+('nba_1630267', 'EL_2019', 'NBA_2020', 'EL->NBA', 'ast_pct', 0.47024, 0.37434, 0.29157, 0.4571, 0.24776, 0.50091, 0.27911, 0.46957, NULL, NULL, 0.19821, 0.1546, 0.41548, 0.35268, 'translation-v1.0'),
+('nba_1626170', 'GL_2019', 'EL_2021', 'GL->EL', 'ast_pct', 0.2427, 0.14237, 0.05014, 0.2346, 0.00131, 0.28343, 0.05705, 0.22769, NULL, NULL, 0.10019, 0.15129, 0.25716, 0.18203, 'translation-v1.0'),
+('nba_1626188', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ast_pct', 0.13649, 0.20737, 0.12666, 0.28809, 0.08393, 0.33081, 0.08823, 0.32651, -0.00437, 0.41912, 0.28104, 0.15683, 0.1404, 0.10237, 'translation-v1.0'),
+('nba_1626203', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ast_pct', 0.06741, 0.14633, 0.06562, 0.22705, 0.02289, 0.26977, 0.0272, 0.26547, -0.06541, 0.35808, 0.07907, 0.15683, 0.07437, 0.05056, 'translation-v1.0'),
+('nba_1626209', 'NBA_2019', 'EL_2021', 'NBA->EL', 'ast_pct', 0.07248, 0.08897, -0.00326, 0.18121, -0.05209, 0.23003, 0.01207, 0.16588, -0.07874, 0.25669, 0.11407, 0.15129, 0.0626, 0.05436, 'translation-v1.0'),
+('nba_1627739', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ast_pct', 0.19456, 0.24995, 0.16924, 0.33067, 0.12651, 0.3734, 0.13082, 0.36909, 0.03821, 0.4617, 0.23163, 0.15683, 0.1959, 0.14592, 'translation-v1.0'),
+('nba_1627748', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ast_pct', 0.0853, 0.16689, 0.08617, 0.2476, 0.04345, 0.29033, 0.04775, 0.28603, -0.04486, 0.37863, 0.05529, 0.15683, 0.09148, 0.06398, 'translation-v1.0'),
+('nba_1627756', 'NBA_2020', 'GL_2021', 'NBA->GL', 'ast_pct', 0.13416, 0.19878, 0.11807, 0.2795, 0.07534, 0.32222, 0.07964, 0.31792, -0.01296, 0.41053, 0.31404, 0.15683, 0.13689, 0.10062, 'translation-v1.0'),
+('nba_1627767', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ast_pct', 0.06875, 0.15679, 0.07607, 0.2375, 0.03335, 0.28023, 0.03765, 0.27593, -0.05496, 0.36853, 0.07624, 0.15683, 0.07566, 0.05156, 'translation-v1.0'),
+('nba_1627775', 'NBA_2019', 'GL_2021', 'NBA->GL', 'ast_pct', 0.11464, 0.1886, 0.10789, 0.26932, 0.06516, 0.31204, 0.06946, 0.30774, -0.02314, 0.40035, 0.1052, 0.15683, 0.11952, 0.08598, 'translation-v1.0'),
+('nba_1629740', 'NBA_2020', 'EL_2021', 'NBA->EL', 'ast_pct', 0.09998, 0.11093, 0.01869, 0.20316, -0.03013, 0.25198, 0.03402, 0.18783, -0.05679, 0.27864, 0.09582, 0.15129, 0.09042, 0.07499, 'translation-v1.0'),
+('nba_1626161', 'NBA_2020', 'GL_2022', 'NBA->GL', 'ast_pct', 0.05281, 0.12638, 0.0511, 0.20166, 0.01125, 0.24151, 0.01527, 0.23749, -0.0711, 0.32387, 0.11247, 0.15076, 0.05818, 0.03961, 'translation-v1.0'),
+('nba_1626208', 'NBA_2021', 'GL_2022', 'NBA->GL', 'ast_pct', 0.15166, 0.20586, 0.13059, 0.28114, 0.09074, 0.32099, 0.09475, 0.31698, 0.00838, 0.40335, 0.36286, 0.15076, 0.14667, 0.11374, 'translation-v1.0'),
+('nba_1627789', 'NBA_2021', 'EL_2022', 'NBA->EL', 'ast_pct', 0.0773, 0.08861, -0.00852, 0.18574, -0.05993, 0.23715, 0.00762, 0.1696, -0.08801, 0.26523, 0.10234, 0.15261, 0.06205, 0.05797, 'translation-v1.0'),
+('nba_1627822', 'GL_2021', 'EL_2022', 'GL->EL', 'ast_pct', 0.14704, 0.04111, -0.05601, 0.13824, -0.10743, 0.18966, -0.04873, 0.13096, NULL, NULL, 0.05256, 0.15261, 0.14084, 0.11028, 'translation-v1.0'),
+('nba_1626147', 'GL_2022', 'EL_2023', 'GL->EL', 'ast_pct', 0.18639, 0.08662, -0.00898, 0.18223, -0.05959, 0.23284, -0.00181, 0.17506, NULL, NULL, 0.05779, 0.15325, 0.19849, 0.13979, 'translation-v1.0'),
+('nba_1626159', 'NBA_2022', 'GL_2023', 'NBA->GL', 'ast_pct', 0.16763, 0.23348, 0.15052, 0.31644, 0.10661, 0.36036, 0.11103, 0.35593, 0.01585, 0.45112, 0.1511, 0.15902, 0.17186, 0.12572, 'translation-v1.0'),
+('nba_1626169', 'NBA_2022', 'GL_2023', 'NBA->GL', 'ast_pct', 0.18774, 0.25499, 0.17203, 0.33795, 0.12811, 0.38186, 0.13253, 0.37744, 0.03735, 0.47262, 0.14503, 0.15902, 0.19198, 0.1408, 'translation-v1.0'),
+('nba_1626195', 'NBA_2022', 'EL_2023', 'NBA->EL', 'ast_pct', 0.10473, 0.11893, 0.02333, 0.21453, -0.02728, 0.26514, 0.03921, 0.19865, -0.05491, 0.29277, 0.04842, 0.15325, 0.09548, 0.07855, 'translation-v1.0'),
+('nba_1627823', 'NBA_2022', 'EL_2023', 'NBA->EL', 'ast_pct', 0.05146, 0.06501, -0.03059, 0.16062, -0.0812, 0.21123, -0.0147, 0.14473, -0.10883, 0.23886, 0.04944, 0.15325, 0.03404, 0.0386, 'translation-v1.0'),
+('nba_1630267', 'NBA_2021', 'EL_2023', 'NBA->EL', 'ast_pct', 0.23928, 0.2408, 0.1452, 0.3364, 0.09459, 0.38701, 0.16108, 0.32052, 0.06696, 0.41465, 0.41017, 0.15325, 0.24696, 0.17946, 'translation-v1.0'),
+('nba_203995', 'EL_2022', 'NBA_2023', 'EL->NBA', 'ast_pct', 0.29259, 0.25578, 0.17308, 0.33847, 0.12931, 0.38224, 0.16063, 0.35092, NULL, NULL, 0.34844, 0.16255, 0.28172, 0.21944, 'translation-v1.0'),
+('nba_1626163', 'EL_2023', 'GL_2024', 'EL->GL', 'ast_pct', 0.17027, 0.21688, 0.13599, 0.29778, 0.09317, 0.3406, NULL, NULL, NULL, NULL, 0.22963, 0.15387, 0.16827, 0.1277, 'translation-v1.0'),
+('nba_1626224', 'NBA_2023', 'EL_2024', 'NBA->EL', 'ast_pct', 0.12899, 0.13116, 0.03614, 0.22617, -0.01415, 0.27647, 0.05193, 0.21038, -0.04162, 0.30393, 0.05381, 0.158, 0.11945, 0.09674, 'translation-v1.0'),
+('nba_1627824', 'EL_2023', 'NBA_2024', 'EL->NBA', 'ast_pct', 0.06809, 0.09472, 0.01529, 0.17416, -0.02676, 0.21621, 0.00332, 0.18613, NULL, NULL, 0.11161, 0.16358, 0.09282, 0.05107, 'translation-v1.0'),
+('nba_101141', 'NBA_2006', 'EL_2007', 'NBA->EL', 'tov_rate', 0.11254, 0.13983, 0.09067, 0.18898, 0.06465, 0.215, 0.08092, 0.19873, 0.07465, 0.20501, 0.10623, 0.16282, 0.13096, 0.08441, 'translation-v1.0'),
+('nba_101212', 'NBA_2005', 'EL_2007', 'NBA->EL', 'tov_rate', 0.26889, 0.1939, 0.14475, 0.24305, 0.11873, 0.26907, 0.135, 0.25281, 0.12872, 0.25908, 0.17586, 0.16282, 0.32845, 0.20167, 'translation-v1.0'),
+('nba_1531', 'NBA_2006', 'EL_2007', 'NBA->EL', 'tov_rate', 0.13044, 0.15066, 0.10151, 0.19982, 0.07549, 0.22584, 0.09176, 0.20957, 0.08548, 0.21584, 0.1634, 0.16282, 0.15191, 0.09783, 'translation-v1.0'),
+('nba_101137', 'NBA_2006', 'EL_2008', 'NBA->EL', 'tov_rate', 0.21664, 0.17477, 0.12464, 0.22489, 0.09811, 0.25143, 0.1147, 0.23484, 0.1083, 0.24124, 0.163, 0.16282, 0.2546, 0.16248, 'translation-v1.0'),
+('nba_101146', 'EL_2007', 'NBA_2008', 'EL->NBA', 'tov_rate', 0.13417, 0.13772, 0.09803, 0.17741, 0.07702, 0.19842, 0.10105, 0.1744, NULL, NULL, 0.1462, 0.12997, 0.10683, 0.10063, 'translation-v1.0'),
+('nba_101198', 'EL_2007', 'NBA_2008', 'EL->NBA', 'tov_rate', 0.20207, 0.15558, 0.11589, 0.19526, 0.09488, 0.21628, 0.1189, 0.19225, NULL, NULL, 0.16158, 0.12997, 0.16166, 0.15155, 'translation-v1.0'),
+('nba_101132', 'NBA_2008', 'EL_2009', 'NBA->EL', 'tov_rate', 0.10027, 0.15086, 0.09866, 0.20305, 0.07103, 0.23068, 0.08831, 0.21341, 0.08164, 0.22007, 0.10091, 0.16549, 0.12644, 0.07521, 'translation-v1.0'),
+('nba_101141', 'EL_2008', 'NBA_2009', 'EL->NBA', 'tov_rate', 0.11368, 0.12895, 0.08732, 0.17058, 0.06528, 0.19262, 0.09048, 0.16741, NULL, NULL, 0.08165, 0.12947, 0.08866, 0.08526, 'translation-v1.0'),
+('nba_101132', 'EL_2009', 'NBA_2010', 'EL->NBA', 'tov_rate', 0.10091, 0.13183, 0.08797, 0.17569, 0.06476, 0.1989, 0.09131, 0.17235, NULL, NULL, 0.1301, 0.13027, 0.07601, 0.07568, 'translation-v1.0');
+INSERT INTO translation_predictions ("person_id", "source_season_id", "target_season_id", "direction", "metric", "source_value", "predicted", "pi80_low", "pi80_high", "pi95_low", "pi95_high", "conformal80_low", "conformal80_high", "conformal95_low", "conformal95_high", "actual_value", "baseline_league_mean", "baseline_z_preservation", "baseline_folk_rule", "model_version") VALUES
+('nba_101146', 'NBA_2008', 'EL_2010', 'NBA->EL', 'tov_rate', 0.1462, 0.15201, 0.10184, 0.20219, 0.07528, 0.22875, 0.09189, 0.21214, 0.08548, 0.21855, 0.09116, 0.1605, 0.18102, 0.10965, 'translation-v1.0'),
+('nba_101187', 'EL_2009', 'NBA_2011', 'EL->NBA', 'tov_rate', 0.20915, 0.16535, 0.11887, 0.21183, 0.09426, 0.23644, 0.1224, 0.2083, NULL, NULL, 0.13739, 0.13465, 0.17353, 0.15686, 'translation-v1.0'),
+('nba_101132', 'NBA_2011', 'EL_2013', 'NBA->EL', 'tov_rate', 0.12355, 0.1305, 0.08301, 0.178, 0.05787, 0.20314, 0.07359, 0.18742, 0.06753, 0.19348, 0.09246, 0.14557, 0.13423, 0.09266, 'translation-v1.0'),
+('nba_101249', 'NBA_2013', 'GL_2015', 'NBA->GL', 'tov_rate', 0.10044, 0.13093, 0.08787, 0.17399, 0.06508, 0.19679, 0.07968, 0.18219, 0.05, 0.21187, 0.08461, 0.14021, 0.10834, 0.07533, 'translation-v1.0'),
+('nba_1626246', 'EL_2014', 'NBA_2015', 'EL->NBA', 'tov_rate', 0.10021, 0.13291, 0.09168, 0.17414, 0.06985, 0.19597, 0.09481, 0.17101, NULL, NULL, 0.11455, 0.12803, 0.08691, 0.07515, 'translation-v1.0'),
+('nba_101126', 'NBA_2014', 'GL_2016', 'NBA->GL', 'tov_rate', 0.09828, 0.12777, 0.0844, 0.17114, 0.06144, 0.1941, 0.07614, 0.1794, 0.04625, 0.20929, 0.14472, 0.13766, 0.10401, 0.07371, 'translation-v1.0'),
+('nba_1626150', 'GL_2015', 'NBA_2016', 'GL->NBA', 'tov_rate', 0.16687, 0.14996, 0.1113, 0.18862, 0.09083, 0.20909, 0.0929, 0.20702, NULL, NULL, 0.16027, 0.1233, 0.14723, 0.12515, 'translation-v1.0'),
+('nba_1626262', 'GL_2015', 'EL_2016', 'GL->EL', 'tov_rate', 0.12999, 0.15574, 0.1085, 0.20298, 0.08349, 0.22799, 0.07089, 0.24059, NULL, NULL, 0.18054, 0.14713, 0.13591, 0.09749, 'translation-v1.0'),
+('nba_1627098', 'EL_2015', 'NBA_2016', 'EL->NBA', 'tov_rate', 0.16275, 0.14939, 0.11072, 0.18805, 0.09026, 0.20852, 0.11366, 0.18511, NULL, NULL, 0.18133, 0.1233, 0.13045, 0.12206, 'translation-v1.0'),
+('nba_1627851', 'EL_2015', 'NBA_2016', 'EL->NBA', 'tov_rate', 0.14028, 0.1336, 0.09494, 0.17226, 0.07447, 0.19273, 0.09788, 0.16932, NULL, NULL, 0.11335, 0.1233, 0.1129, 0.10521, 'translation-v1.0'),
+('nba_1626188', 'GL_2015', 'NBA_2017', 'GL->NBA', 'tov_rate', 0.11893, 0.13455, 0.09599, 0.17312, 0.07558, 0.19353, 0.07764, 0.19147, NULL, NULL, 0.10847, 0.12533, 0.10627, 0.0892, 'translation-v1.0'),
+('nba_1626203', 'GL_2015', 'NBA_2017', 'GL->NBA', 'tov_rate', 0.08822, 0.12462, 0.08606, 0.16318, 0.06564, 0.1836, 0.0677, 0.18154, NULL, NULL, 0.09855, 0.12533, 0.07876, 0.06616, 'translation-v1.0'),
+('nba_1626224', 'EL_2016', 'NBA_2017', 'EL->NBA', 'tov_rate', 0.0746, 0.12215, 0.08359, 0.16071, 0.06317, 0.18113, 0.08652, 0.15778, NULL, NULL, 0.13432, 0.12533, 0.06612, 0.05595, 'translation-v1.0'),
+('nba_1626253', 'GL_2016', 'EL_2017', 'GL->EL', 'tov_rate', 0.17208, 0.15918, 0.11489, 0.20348, 0.09144, 0.22692, 0.07963, 0.23874, NULL, NULL, 0.14499, 0.13769, 0.17284, 0.12906, 'translation-v1.0'),
+('nba_1626643', 'EL_2015', 'GL_2017', 'EL->GL', 'tov_rate', 0.16329, 0.14701, 0.10262, 0.1914, 0.07912, 0.2149, NULL, NULL, NULL, NULL, 0.14047, 0.14002, 0.14872, 0.12247, 'translation-v1.0'),
+('nba_1627785', 'NBA_2016', 'GL_2017', 'NBA->GL', 'tov_rate', 0.20294, 0.18773, 0.14334, 0.23212, 0.11984, 0.25562, 0.13489, 0.24057, 0.10429, 0.27117, 0.14538, 0.14002, 0.23146, 0.1522, 'translation-v1.0'),
+('nba_1627790', 'EL_2016', 'GL_2017', 'EL->GL', 'tov_rate', 0.15563, 0.14337, 0.09898, 0.18776, 0.07549, 0.21126, NULL, NULL, NULL, NULL, 0.14472, 0.14002, 0.148, 0.11672, 'translation-v1.0'),
+('nba_1627814', 'GL_2016', 'NBA_2017', 'GL->NBA', 'tov_rate', 0.11958, 0.12428, 0.08571, 0.16284, 0.0653, 0.18325, 0.06736, 0.18119, NULL, NULL, 0.07832, 0.12533, 0.10926, 0.08969, 'translation-v1.0'),
+('nba_1627820', 'GL_2016', 'NBA_2017', 'GL->NBA', 'tov_rate', 0.14771, 0.1409, 0.10233, 0.17946, 0.08192, 0.19987, 0.08398, 0.19781, NULL, NULL, 0.14054, 0.12533, 0.13426, 0.11078, 'translation-v1.0'),
+('nba_1627846', 'GL_2016', 'NBA_2017', 'GL->NBA', 'tov_rate', 0.16281, 0.14904, 0.11048, 0.1876, 0.09006, 0.20802, 0.09212, 0.20596, NULL, NULL, 0.16986, 0.12533, 0.14769, 0.12211, 'translation-v1.0'),
+('nba_1627851', 'NBA_2016', 'EL_2017', 'NBA->EL', 'tov_rate', 0.11335, 0.12444, 0.08014, 0.16873, 0.05669, 0.19218, 0.07135, 0.17752, 0.0657, 0.18317, 0.08956, 0.13769, 0.12629, 0.08502, 'translation-v1.0'),
+('nba_1627853', 'GL_2016', 'NBA_2017', 'GL->NBA', 'tov_rate', 0.23196, 0.16947, 0.1309, 0.20803, 0.11049, 0.22844, 0.11255, 0.22638, NULL, NULL, 0.22952, 0.12533, 0.20917, 0.17397, 'translation-v1.0'),
+('nba_1627858', 'GL_2016', 'NBA_2017', 'GL->NBA', 'tov_rate', 0.1573, 0.14356, 0.105, 0.18212, 0.08458, 0.20254, 0.08664, 0.20048, NULL, NULL, 0.1707, 0.12533, 0.14279, 0.11797, 'translation-v1.0'),
+('nba_1626199', 'GL_2017', 'EL_2018', 'GL->EL', 'tov_rate', 0.1547, 0.15757, 0.11005, 0.20508, 0.0849, 0.23023, 0.07223, 0.2429, NULL, NULL, 0.12678, 0.14132, 0.15703, 0.11602, 'translation-v1.0'),
+('nba_1627790', 'EL_2016', 'NBA_2018', 'EL->NBA', 'tov_rate', 0.15563, 0.13092, 0.0963, 0.16554, 0.07798, 0.18387, 0.09894, 0.16291, NULL, NULL, 0.13553, 0.1196, 0.12582, 0.11672, 'translation-v1.0'),
+('nba_1627834', 'GL_2016', 'EL_2018', 'GL->EL', 'tov_rate', 0.12952, 0.1416, 0.09408, 0.18911, 0.06893, 0.21426, 0.05626, 0.22693, NULL, NULL, 0.20842, 0.14132, 0.13241, 0.09714, 'translation-v1.0'),
+('nba_1629029', 'EL_2017', 'NBA_2018', 'EL->NBA', 'tov_rate', 0.14954, 0.14121, 0.10659, 0.17583, 0.08826, 0.19415, 0.10922, 0.1732, NULL, NULL, 0.15002, 0.1196, 0.12886, 0.11215, 'translation-v1.0'),
+('nba_101127', 'NBA_2017', 'GL_2019', 'NBA->GL', 'tov_rate', 0.19459, 0.18756, 0.14585, 0.22927, 0.12376, 0.25135, 0.13791, 0.23721, 0.10915, 0.26596, 0.18532, 0.14574, 0.22066, 0.14594, 'translation-v1.0'),
+('nba_1626147', 'NBA_2018', 'GL_2019', 'NBA->GL', 'tov_rate', 0.11771, 0.14301, 0.1013, 0.18472, 0.07922, 0.20681, 0.09336, 0.19266, 0.06461, 0.22142, 0.1414, 0.14574, 0.14347, 0.08828, 'translation-v1.0'),
+('nba_1626150', 'NBA_2017', 'GL_2019', 'NBA->GL', 'tov_rate', 0.13966, 0.16212, 0.12041, 0.20383, 0.09833, 0.22591, 0.11247, 0.21177, 0.08372, 0.24053, 0.17729, 0.14574, 0.16125, 0.10475, 'translation-v1.0'),
+('nba_1626166', 'NBA_2018', 'GL_2019', 'NBA->GL', 'tov_rate', 0.15732, 0.16517, 0.12346, 0.20689, 0.10138, 0.22897, 0.11552, 0.21482, 0.08677, 0.24358, 0.13107, 0.14574, 0.19119, 0.11799, 'translation-v1.0'),
+('nba_1626170', 'NBA_2018', 'GL_2019', 'NBA->GL', 'tov_rate', 0.17672, 0.17738, 0.13566, 0.21909, 0.11358, 0.24117, 0.12773, 0.22703, 0.09897, 0.25578, 0.15136, 0.14574, 0.21456, 0.13254, 'translation-v1.0'),
+('nba_1626174', 'GL_2017', 'NBA_2019', 'GL->NBA', 'tov_rate', 0.14358, 0.14013, 0.1015, 0.17876, 0.08104, 0.19921, 0.08311, 0.19714, NULL, NULL, 0.12026, 0.1231, 0.1262, 0.10769, 'translation-v1.0'),
+('nba_1627098', 'NBA_2017', 'EL_2019', 'NBA->EL', 'tov_rate', 0.16859, 0.1548, 0.10172, 0.20788, 0.07362, 0.23598, 0.09119, 0.21841, 0.08441, 0.22519, 0.21321, 0.14717, 0.20672, 0.12644, 'translation-v1.0'),
+('nba_1627733', 'NBA_2018', 'GL_2019', 'NBA->GL', 'tov_rate', 0.14354, 0.16135, 0.11964, 0.20307, 0.09756, 0.22515, 0.1117, 0.21101, 0.08295, 0.23976, 0.14647, 0.14574, 0.1746, 0.10766, 'translation-v1.0'),
+('nba_1627735', 'GL_2018', 'EL_2019', 'GL->EL', 'tov_rate', 0.11791, 0.13609, 0.083, 0.18917, 0.0549, 0.21727, 0.04075, 0.23142, NULL, NULL, 0.21614, 0.14717, 0.12344, 0.08843, 'translation-v1.0'),
+('nba_1627762', 'GL_2017', 'EL_2019', 'GL->EL', 'tov_rate', 0.117, 0.14731, 0.09423, 0.20039, 0.06613, 0.22849, 0.05198, 0.24265, NULL, NULL, 0.14628, 0.14717, 0.11964, 0.08775, 'translation-v1.0'),
+('nba_1627789', 'NBA_2018', 'GL_2019', 'NBA->GL', 'tov_rate', 0.0817, 0.13332, 0.09161, 0.17504, 0.06953, 0.19712, 0.08367, 0.18298, 0.05492, 0.21173, 0.14967, 0.14574, 0.10008, 0.06127, 'translation-v1.0'),
+('nba_1627835', 'NBA_2017', 'EL_2019', 'NBA->EL', 'tov_rate', 0.14931, 0.14065, 0.08757, 0.19373, 0.05947, 0.22183, 0.07704, 0.20426, 0.07026, 0.21104, 0.14061, 0.14717, 0.18018, 0.11198, 'translation-v1.0'),
+('nba_1629740', 'EL_2018', 'NBA_2019', 'EL->NBA', 'tov_rate', 0.13257, 0.14322, 0.10458, 0.18185, 0.08413, 0.2023, 0.10752, 0.17891, NULL, NULL, 0.11468, 0.1231, 0.11598, 0.09943, 'translation-v1.0'),
+('nba_1627733', 'NBA_2018', 'EL_2020', 'NBA->EL', 'tov_rate', 0.14354, 0.14815, 0.09611, 0.20019, 0.06857, 0.22774, 0.08579, 0.21052, 0.07915, 0.21716, 0.16314, 0.15362, 0.18961, 0.10766, 'translation-v1.0'),
+('nba_1627790', 'NBA_2018', 'EL_2020', 'NBA->EL', 'tov_rate', 0.13553, 0.14892, 0.09688, 0.20095, 0.06933, 0.2285, 0.08655, 0.21128, 0.07991, 0.21792, 0.15713, 0.15362, 0.17757, 0.10165, 'translation-v1.0'),
+('nba_1627812', 'NBA_2019', 'GL_2020', 'NBA->GL', 'tov_rate', 0.11941, 0.14306, 0.0971, 0.18902, 0.07277, 0.21335, 0.08836, 0.19777, 0.05668, 0.22944, 0.1459, 0.14417, 0.13979, 0.08956, 'translation-v1.0'),
+('nba_1627816', 'GL_2018', 'EL_2020', 'GL->EL', 'tov_rate', 0.14649, 0.15942, 0.10738, 0.21145, 0.07983, 0.239, 0.06595, 0.25288, NULL, NULL, 0.13804, 0.15362, 0.16686, 0.10987, 'translation-v1.0'),
+('nba_1627820', 'NBA_2018', 'GL_2020', 'NBA->GL', 'tov_rate', 0.12946, 0.14947, 0.10352, 0.19543, 0.07919, 0.21976, 0.09477, 0.20418, 0.06309, 0.23586, 0.21638, 0.14417, 0.15726, 0.09709, 'translation-v1.0'),
+('nba_1630267', 'EL_2019', 'NBA_2020', 'EL->NBA', 'tov_rate', 0.23213, 0.15815, 0.11999, 0.19631, 0.09979, 0.2165, 0.12289, 0.19341, NULL, NULL, 0.17054, 0.11924, 0.18031, 0.1741, 'translation-v1.0'),
+('nba_1626170', 'GL_2019', 'EL_2021', 'GL->EL', 'tov_rate', 0.15136, 0.15899, 0.11215, 0.20583, 0.08736, 0.23063, 0.07487, 0.24312, NULL, NULL, 0.16013, 0.14363, 0.14994, 0.11352, 'translation-v1.0'),
+('nba_1626188', 'NBA_2019', 'GL_2021', 'NBA->GL', 'tov_rate', 0.13035, 0.1349, 0.08737, 0.18243, 0.06221, 0.20759, 0.07832, 0.19148, 0.04556, 0.22424, 0.11711, 0.13395, 0.14288, 0.09776, 'translation-v1.0'),
+('nba_1626203', 'NBA_2019', 'GL_2021', 'NBA->GL', 'tov_rate', 0.09809, 0.13093, 0.0834, 0.17846, 0.05824, 0.20363, 0.07435, 0.18751, 0.04159, 0.22028, 0.16518, 0.13395, 0.10319, 0.07357, 'translation-v1.0'),
+('nba_1626209', 'NBA_2019', 'EL_2021', 'NBA->EL', 'tov_rate', 0.14687, 0.13885, 0.09201, 0.18569, 0.06721, 0.21048, 0.08271, 0.19498, 0.07673, 0.20096, 0.15315, 0.14363, 0.17246, 0.11016, 'translation-v1.0'),
+('nba_1627739', 'NBA_2019', 'GL_2021', 'NBA->GL', 'tov_rate', 0.15677, 0.1605, 0.11297, 0.20803, 0.08781, 0.2332, 0.10392, 0.21708, 0.07116, 0.24985, 0.16933, 0.13395, 0.17538, 0.11758, 'translation-v1.0'),
+('nba_1627748', 'NBA_2019', 'GL_2021', 'NBA->GL', 'tov_rate', 0.15712, 0.15217, 0.10464, 0.1997, 0.07948, 0.22486, 0.09559, 0.20875, 0.06283, 0.24151, 0.09886, 0.13395, 0.17582, 0.11784, 'translation-v1.0'),
+('nba_1627756', 'NBA_2020', 'GL_2021', 'NBA->GL', 'tov_rate', 0.09023, 0.1329, 0.08537, 0.18043, 0.06021, 0.2056, 0.07632, 0.18948, 0.04356, 0.22225, 0.21376, 0.13395, 0.09781, 0.06767, 'translation-v1.0'),
+('nba_1627767', 'NBA_2019', 'GL_2021', 'NBA->GL', 'tov_rate', 0.1674, 0.14865, 0.10112, 0.19618, 0.07595, 0.22134, 0.09207, 0.20523, 0.05931, 0.23799, 0.12364, 0.13395, 0.18846, 0.12555, 'translation-v1.0'),
+('nba_1627775', 'NBA_2019', 'GL_2021', 'NBA->GL', 'tov_rate', 0.14579, 0.15011, 0.10258, 0.19765, 0.07742, 0.22281, 0.09354, 0.20669, 0.06077, 0.23946, 0.15304, 0.13395, 0.16187, 0.10934, 'translation-v1.0'),
+('nba_1629740', 'NBA_2020', 'EL_2021', 'NBA->EL', 'tov_rate', 0.07317, 0.10611, 0.05927, 0.15295, 0.03448, 0.17775, 0.04998, 0.16224, 0.044, 0.16822, 0.13164, 0.14363, 0.08708, 0.05488, 'translation-v1.0'),
+('nba_1626161', 'NBA_2020', 'GL_2022', 'NBA->GL', 'tov_rate', 0.11821, 0.14193, 0.09954, 0.18432, 0.07711, 0.20676, 0.09148, 0.19239, 0.06226, 0.22161, 0.19138, 0.13583, 0.13469, 0.08866, 'translation-v1.0'),
+('nba_1626208', 'NBA_2021', 'GL_2022', 'NBA->GL', 'tov_rate', 0.14318, 0.14703, 0.10464, 0.18941, 0.0822, 0.21185, 0.09657, 0.19748, 0.06735, 0.2267, 0.14372, 0.13583, 0.16417, 0.10738, 'translation-v1.0'),
+('nba_1627789', 'NBA_2021', 'EL_2022', 'NBA->EL', 'tov_rate', 0.08927, 0.11702, 0.07241, 0.16163, 0.04879, 0.18525, 0.06356, 0.17048, 0.05786, 0.17618, 0.16999, 0.14348, 0.11104, 0.06695, 'translation-v1.0'),
+('nba_1627822', 'GL_2021', 'EL_2022', 'GL->EL', 'tov_rate', 0.1418, 0.15325, 0.10864, 0.19787, 0.08502, 0.22148, 0.07313, 0.23338, NULL, NULL, 0.08199, 0.14348, 0.15085, 0.10635, 'translation-v1.0'),
+('nba_1626147', 'GL_2022', 'EL_2023', 'GL->EL', 'tov_rate', 0.13037, 0.15155, 0.10708, 0.19603, 0.08354, 0.21957, 0.07168, 0.23143, NULL, NULL, 0.13075, 0.14091, 0.13517, 0.09777, 'translation-v1.0'),
+('nba_1626159', 'NBA_2022', 'GL_2023', 'NBA->GL', 'tov_rate', 0.16975, 0.16292, 0.11834, 0.2075, 0.09475, 0.2311, 0.10986, 0.21599, 0.07913, 0.24671, 0.16816, 0.13652, 0.1961, 0.12731, 'translation-v1.0'),
+('nba_1626169', 'NBA_2022', 'GL_2023', 'NBA->GL', 'tov_rate', 0.19168, 0.16433, 0.11975, 0.2089, 0.09615, 0.2325, 0.11126, 0.21739, 0.08053, 0.24812, 0.13771, 0.13652, 0.22264, 0.14376, 'translation-v1.0'),
+('nba_1626195', 'NBA_2022', 'EL_2023', 'NBA->EL', 'tov_rate', 0.15369, 0.1336, 0.08913, 0.17807, 0.06559, 0.20161, 0.0803, 0.18689, 0.07463, 0.19257, 0.14823, 0.14091, 0.18097, 0.11527, 'translation-v1.0'),
+('nba_1627823', 'NBA_2022', 'EL_2023', 'NBA->EL', 'tov_rate', 0.11026, 0.11966, 0.07519, 0.16413, 0.05165, 0.18768, 0.06637, 0.17296, 0.06069, 0.17863, 0.15524, 0.14091, 0.12855, 0.0827, 'translation-v1.0'),
+('nba_1630267', 'NBA_2021', 'EL_2023', 'NBA->EL', 'tov_rate', 0.16863, 0.15344, 0.10897, 0.19791, 0.08543, 0.22146, 0.10015, 0.20674, 0.09447, 0.21242, 0.20029, 0.14091, 0.19994, 0.12647, 'translation-v1.0'),
+('nba_203995', 'EL_2022', 'NBA_2023', 'EL->NBA', 'tov_rate', 0.16812, 0.14552, 0.10885, 0.18218, 0.08945, 0.20159, 0.11164, 0.17939, NULL, NULL, 0.19721, 0.11656, 0.13681, 0.12609, 'translation-v1.0'),
+('nba_1626163', 'EL_2023', 'GL_2024', 'EL->GL', 'tov_rate', 0.09118, 0.12395, 0.08222, 0.16568, 0.06013, 0.18777, NULL, NULL, NULL, NULL, 0.12883, 0.13513, 0.08846, 0.06838, 'translation-v1.0'),
+('nba_1626224', 'NBA_2023', 'EL_2024', 'NBA->EL', 'tov_rate', 0.10355, 0.1267, 0.07486, 0.17855, 0.04741, 0.206, 0.06457, 0.18884, 0.05795, 0.19546, 0.07585, 0.13937, 0.12096, 0.07766, 'translation-v1.0'),
+('nba_1627824', 'EL_2023', 'NBA_2024', 'EL->NBA', 'tov_rate', 0.10815, 0.12793, 0.08978, 0.16608, 0.06959, 0.18627, 0.09268, 0.16318, NULL, NULL, 0.12241, 0.11997, 0.09187, 0.08111, 'translation-v1.0'),
+('nba_101141', 'NBA_2006', 'EL_2007', 'NBA->EL', 'pts_per_75', 14.87399, 19.45699, 15.39745, 23.51654, 13.24845, 25.66553, 15.91764, 22.99635, 11.38792, 27.52607, 12.14451, 14.43435, 14.54812, 11.1555, 'translation-v1.0'),
+('nba_101212', 'NBA_2005', 'EL_2007', 'NBA->EL', 'pts_per_75', 7.34721, 14.67383, 10.61428, 18.73337, 8.46529, 20.88237, 11.13447, 18.21318, 6.60475, 22.7429, 20.96923, 14.43435, 8.22645, 5.51041, 'translation-v1.0'),
+('nba_1531', 'NBA_2006', 'EL_2007', 'NBA->EL', 'pts_per_75', 14.33495, 17.84583, 13.78629, 21.90538, 11.63729, 24.05437, 14.30648, 21.38519, 9.77676, 25.9149, 19.618, 14.43435, 14.06968, 10.75122, 'translation-v1.0'),
+('nba_101137', 'NBA_2006', 'EL_2008', 'NBA->EL', 'pts_per_75', 9.05177, 14.88464, 10.869, 18.90029, 8.74324, 21.02605, 11.38356, 18.38573, 6.90283, 22.86646, 15.56886, 14.38026, 9.381, 6.78883, 'translation-v1.0'),
+('nba_101146', 'EL_2007', 'NBA_2008', 'EL->NBA', 'pts_per_75', 15.46294, 13.23459, 8.7, 17.76918, 6.29953, 20.16965, 9.40538, 17.0638, NULL, NULL, 12.18165, 14.93024, 16.0792, 11.59721, 'translation-v1.0'),
+('nba_101198', 'EL_2007', 'NBA_2008', 'EL->NBA', 'pts_per_75', 17.42046, 14.51651, 9.98192, 19.0511, 7.58145, 21.45157, 10.6873, 18.34572, NULL, NULL, 18.38893, 14.93024, 18.26579, 13.06535, 'translation-v1.0'),
+('nba_101132', 'NBA_2008', 'EL_2009', 'NBA->EL', 'pts_per_75', 16.04529, 18.53319, 14.79384, 22.27254, 12.81435, 24.25203, 15.273, 21.79338, 11.10057, 25.96581, 20.30875, 14.21398, 15.13348, 12.03397, 'translation-v1.0'),
+('nba_101141', 'EL_2008', 'NBA_2009', 'EL->NBA', 'pts_per_75', 18.23979, 15.73369, 11.36692, 20.10046, 9.0553, 22.41208, 12.0462, 19.42118, NULL, NULL, 15.93519, 15.0007, 19.19771, 13.67984, 'translation-v1.0'),
+('nba_101132', 'EL_2009', 'NBA_2010', 'EL->NBA', 'pts_per_75', 20.30875, 16.81448, 12.40039, 21.22856, 10.06372, 23.56524, 13.08703, 20.54192, NULL, NULL, 15.20987, 14.86874, 22.06327, 15.23156, 'translation-v1.0'),
+('nba_101146', 'NBA_2008', 'EL_2010', 'NBA->EL', 'pts_per_75', 12.18165, 15.5752, 12.0103, 19.14011, 10.12315, 21.02726, 12.4671, 18.6833, 8.48931, 22.66109, 17.03688, 13.79696, 11.63613, 9.13623, 'translation-v1.0'),
+('nba_101187', 'EL_2009', 'NBA_2011', 'EL->NBA', 'pts_per_75', 17.31196, 12.84193, 8.24898, 17.43489, 5.81762, 19.86625, 8.96344, 16.72042, NULL, NULL, 12.73645, 14.40533, 18.21051, 12.98397, 'translation-v1.0'),
+('nba_101132', 'NBA_2011', 'EL_2013', 'NBA->EL', 'pts_per_75', 16.10878, 17.41519, 13.93985, 20.89053, 12.10012, 22.73026, 14.38518, 20.4452, 10.50733, 24.32305, 17.10821, 13.90223, 15.19117, 12.08158, 'translation-v1.0'),
+('nba_101249', 'NBA_2013', 'GL_2015', 'NBA->GL', 'pts_per_75', 9.67799, 16.15175, 11.46325, 20.84025, 8.98131, 23.32219, 9.15907, 23.14443, 5.87199, 26.43151, 18.25272, 15.99251, 10.31094, 7.25849, 'translation-v1.0'),
+('nba_1626246', 'EL_2014', 'NBA_2015', 'EL->NBA', 'pts_per_75', 21.87648, 18.07914, 13.48077, 22.67751, 11.04654, 25.11174, 14.19608, 21.9622, NULL, NULL, 21.05533, 15.3339, 24.35574, 16.40736, 'translation-v1.0'),
+('nba_101126', 'NBA_2014', 'GL_2016', 'NBA->GL', 'pts_per_75', 14.4991, 20.01437, 15.07676, 24.95199, 12.46295, 27.5658, 12.65015, 27.3786, 9.18842, 30.84033, 16.93104, 16.37801, 15.88604, 10.87432, 'translation-v1.0'),
+('nba_1626150', 'GL_2015', 'NBA_2016', 'GL->NBA', 'pts_per_75', 18.83918, 12.6307, 7.57863, 17.68276, 4.90423, 20.35717, 6.75808, 18.50332, NULL, NULL, 10.38081, 15.79159, 18.859, 14.12939, 'translation-v1.0'),
+('nba_1626262', 'GL_2015', 'EL_2016', 'GL->EL', 'pts_per_75', 22.41455, 14.12707, 10.25907, 17.99508, 8.21147, 20.04268, 9.58357, 18.67058, NULL, NULL, 10.14916, 14.29022, 19.58839, 16.81091, 'translation-v1.0'),
+('nba_1627098', 'EL_2015', 'NBA_2016', 'EL->NBA', 'pts_per_75', 17.59248, 15.14906, 10.09699, 20.20112, 7.42259, 22.87553, 10.88287, 19.41524, NULL, NULL, 11.28291, 15.79159, 20.40313, 13.19436, 'translation-v1.0'),
+('nba_1627851', 'EL_2015', 'NBA_2016', 'EL->NBA', 'pts_per_75', 20.32664, 18.03718, 12.98512, 23.08925, 10.31071, 25.76365, 13.771, 22.30337, NULL, NULL, 15.05449, 15.79159, 24.16603, 15.24498, 'translation-v1.0'),
+('nba_1626188', 'GL_2015', 'NBA_2017', 'GL->NBA', 'pts_per_75', 20.88557, 12.98087, 8.174, 17.78774, 5.6294, 20.33234, 7.39328, 18.56847, NULL, NULL, 15.16806, 15.95025, 20.96684, 15.66418, 'translation-v1.0'),
+('nba_1626203', 'GL_2015', 'NBA_2017', 'GL->NBA', 'pts_per_75', 18.62851, 11.70147, 6.8946, 16.50834, 4.35, 19.05294, 6.11388, 17.28907, NULL, NULL, 9.36412, 15.95025, 18.65279, 13.97138, 'translation-v1.0'),
+('nba_1626224', 'EL_2016', 'NBA_2017', 'EL->NBA', 'pts_per_75', 13.80493, 13.23076, 8.4239, 18.03763, 5.87929, 20.58223, 9.17164, 17.28989, NULL, NULL, 12.74065, 15.95025, 15.34717, 10.3537, 'translation-v1.0'),
+('nba_1626253', 'GL_2016', 'EL_2017', 'GL->EL', 'pts_per_75', 20.95384, 13.4057, 9.46733, 17.34407, 7.38249, 19.42892, 8.77955, 18.03185, NULL, NULL, 16.26975, 14.71615, 18.36596, 15.71538, 'translation-v1.0'),
+('nba_1626643', 'EL_2015', 'GL_2017', 'EL->GL', 'pts_per_75', 20.05944, 21.16348, 16.21981, 26.10716, 13.60279, 28.72418, NULL, NULL, NULL, NULL, 19.89308, 16.48451, 24.31944, 15.04458, 'translation-v1.0'),
+('nba_1627785', 'NBA_2016', 'GL_2017', 'NBA->GL', 'pts_per_75', 11.89433, 19.53647, 14.59279, 24.48014, 11.97577, 27.09716, 12.16321, 26.90973, 8.69723, 30.37571, 28.06043, 16.48451, 12.67088, 8.92075, 'translation-v1.0'),
+('nba_1627790', 'EL_2016', 'GL_2017', 'EL->GL', 'pts_per_75', 14.82611, 19.03919, 14.09552, 23.98287, 11.4785, 26.59989, NULL, NULL, NULL, NULL, 23.1335, 16.48451, 17.16944, 11.11959, 'translation-v1.0'),
+('nba_1627814', 'GL_2016', 'NBA_2017', 'GL->NBA', 'pts_per_75', 18.84563, 12.85706, 8.05019, 17.66393, 5.50559, 20.20853, 7.26946, 18.44465, NULL, NULL, 14.33193, 15.95025, 18.35253, 14.13422, 'translation-v1.0'),
+('nba_1627820', 'GL_2016', 'NBA_2017', 'GL->NBA', 'pts_per_75', 19.83782, 13.20617, 8.3993, 18.01304, 5.8547, 20.55764, 7.61858, 18.79376, NULL, NULL, 12.30755, 15.95025, 19.31845, 14.87837, 'translation-v1.0'),
+('nba_1627846', 'GL_2016', 'NBA_2017', 'GL->NBA', 'pts_per_75', 22.86181, 14.88732, 10.08046, 19.69419, 7.53585, 22.23879, 9.29973, 20.47492, NULL, NULL, 10.0781, 15.95025, 22.26236, 17.14635, 'translation-v1.0'),
+('nba_1627851', 'NBA_2016', 'EL_2017', 'NBA->EL', 'pts_per_75', 15.05449, 18.28184, 14.34347, 22.22021, 12.25862, 24.30505, 14.84813, 21.71554, 10.45362, 26.11005, 17.92969, 14.71615, 14.14154, 11.29086, 'translation-v1.0'),
+('nba_1627853', 'GL_2016', 'NBA_2017', 'GL->NBA', 'pts_per_75', 8.46478, 6.05916, 1.25229, 10.86603, -1.29231, 13.41063, 0.47157, 11.64676, NULL, NULL, 5.68194, 15.95025, 8.24656, 6.34858, 'translation-v1.0'),
+('nba_1627858', 'GL_2016', 'NBA_2017', 'GL->NBA', 'pts_per_75', 8.50228, 5.97335, 1.16649, 10.78022, -1.37812, 13.32482, 0.38576, 11.56095, NULL, NULL, 7.582, 15.95025, 8.28306, 6.37671, 'translation-v1.0'),
+('nba_1626199', 'GL_2017', 'EL_2018', 'GL->EL', 'pts_per_75', 26.17517, 15.66663, 11.87734, 19.45592, 9.87141, 21.46185, 11.21559, 20.11767, NULL, NULL, 16.52087, 14.57971, 22.00753, 19.63137, 'translation-v1.0'),
+('nba_1627790', 'EL_2016', 'NBA_2018', 'EL->NBA', 'pts_per_75', 14.82611, 14.19367, 9.16637, 19.22097, 6.50508, 21.88226, 9.9484, 18.43894, NULL, NULL, 15.27217, 16.63845, 17.33496, 11.11959, 'translation-v1.0'),
+('nba_1627834', 'GL_2016', 'EL_2018', 'GL->EL', 'pts_per_75', 15.39694, 10.61523, 6.82594, 14.40452, 4.82001, 16.41045, 6.16419, 15.06627, NULL, NULL, 11.90239, 14.57971, 13.8268, 11.5477, 'translation-v1.0'),
+('nba_1629029', 'EL_2017', 'NBA_2018', 'EL->NBA', 'pts_per_75', 22.24117, 20.64663, 15.61933, 25.67393, 12.95804, 28.33522, 16.40136, 24.8919, NULL, NULL, 23.7024, 16.63845, 26.24407, 16.68088, 'translation-v1.0'),
+('nba_101127', 'NBA_2017', 'GL_2019', 'NBA->GL', 'pts_per_75', 10.84023, 16.82382, 12.06036, 21.58729, 9.53873, 24.10892, 9.71934, 23.92831, 6.3797, 27.26795, 22.83683, 17.04129, 11.97742, 8.13017, 'translation-v1.0'),
+('nba_1626147', 'NBA_2018', 'GL_2019', 'NBA->GL', 'pts_per_75', 13.82509, 20.99587, 16.23241, 25.75934, 13.71078, 28.28097, 13.89139, 28.10036, 10.55175, 31.44, 22.08168, 17.04129, 14.37558, 10.36882, 'translation-v1.0'),
+('nba_1626150', 'NBA_2017', 'GL_2019', 'NBA->GL', 'pts_per_75', 14.46762, 20.33063, 15.56717, 25.0941, 13.04554, 27.61573, 13.22614, 27.43512, 9.88651, 30.77476, 20.60115, 17.04129, 15.57205, 10.85072, 'translation-v1.0'),
+('nba_1626166', 'NBA_2018', 'GL_2019', 'NBA->GL', 'pts_per_75', 12.63646, 20.14533, 15.38187, 24.9088, 12.86024, 27.43043, 13.04085, 27.24982, 9.70121, 30.58946, 28.33107, 17.04129, 13.24932, 9.47734, 'translation-v1.0'),
+('nba_1626170', 'NBA_2018', 'GL_2019', 'NBA->GL', 'pts_per_75', 9.58698, 17.87416, 13.1107, 22.63763, 10.58907, 25.15925, 10.76967, 24.97865, 7.43004, 28.31829, 17.67839, 17.04129, 10.35988, 7.19023, 'translation-v1.0'),
+('nba_1626174', 'GL_2017', 'NBA_2019', 'GL->NBA', 'pts_per_75', 25.37429, 16.14335, 10.81176, 21.47494, 7.98939, 24.29731, 9.94581, 22.34089, NULL, NULL, 22.01347, 16.73989, 26.32722, 19.03071, 'translation-v1.0'),
+('nba_1627098', 'NBA_2017', 'EL_2019', 'NBA->EL', 'pts_per_75', 11.99803, 15.59901, 11.53767, 19.66035, 9.38773, 21.81029, 12.05809, 19.13993, 7.52638, 23.67165, 16.39352, 14.71472, 11.37548, 8.99852, 'translation-v1.0'),
+('nba_1627733', 'NBA_2018', 'GL_2019', 'NBA->GL', 'pts_per_75', 10.02169, 18.95217, 14.1887, 23.71564, 11.66708, 26.23726, 11.84768, 26.05666, 8.50804, 29.39629, 25.57442, 17.04129, 10.77178, 7.51626, 'translation-v1.0'),
+('nba_1627735', 'GL_2018', 'EL_2019', 'GL->EL', 'pts_per_75', 24.72843, 15.90193, 11.8406, 19.96327, 9.69065, 22.11321, 11.13134, 20.67253, NULL, NULL, 11.69885, 14.71472, 21.60879, 18.54632, 'translation-v1.0'),
+('nba_1627762', 'GL_2017', 'EL_2019', 'GL->EL', 'pts_per_75', 17.73684, 10.75863, 6.69729, 14.81997, 4.54735, 16.96991, 5.98804, 15.52922, NULL, NULL, 11.61163, 14.71472, 15.74353, 13.30263, 'translation-v1.0'),
+('nba_1627789', 'NBA_2018', 'GL_2019', 'NBA->GL', 'pts_per_75', 12.42511, 20.05904, 15.29558, 24.82251, 12.77395, 27.34413, 12.95455, 27.16353, 9.61492, 30.50317, 21.1149, 17.04129, 13.04907, 9.31883, 'translation-v1.0'),
+('nba_1627835', 'NBA_2017', 'EL_2019', 'NBA->EL', 'pts_per_75', 9.52427, 14.9086, 10.84726, 18.96994, 8.69732, 21.11988, 11.36768, 18.44952, 6.83596, 22.98123, 13.78538, 14.71472, 9.28539, 7.1432, 'translation-v1.0'),
+('nba_1629740', 'EL_2018', 'NBA_2019', 'EL->NBA', 'pts_per_75', 10.13343, 8.97361, 3.64202, 14.3052, 0.81964, 17.12757, 4.47138, 13.47583, NULL, NULL, 13.64522, 16.73989, 10.48391, 7.60007, 'translation-v1.0'),
+('nba_1627733', 'NBA_2018', 'EL_2020', 'NBA->EL', 'pts_per_75', 10.02169, 15.09722, 10.91349, 19.28094, 8.69876, 21.49567, 11.4496, 18.74484, 6.78131, 23.41312, 12.45802, 14.43387, 8.92739, 7.51626, 'translation-v1.0'),
+('nba_1627790', 'NBA_2018', 'EL_2020', 'NBA->EL', 'pts_per_75', 15.27217, 17.55911, 13.37539, 21.74284, 11.16066, 23.95757, 13.91149, 21.20673, 9.24321, 25.87502, 16.45968, 14.43387, 13.29685, 11.45412, 'translation-v1.0'),
+('nba_1627812', 'NBA_2019', 'GL_2020', 'NBA->GL', 'pts_per_75', 14.81426, 20.77305, 16.27376, 25.27235, 13.89197, 27.65413, 14.06256, 27.48355, 10.90813, 30.63797, 19.62241, 16.792, 15.16697, 11.11069, 'translation-v1.0'),
+('nba_1627816', 'GL_2018', 'EL_2020', 'GL->EL', 'pts_per_75', 24.5279, 14.20497, 10.02125, 18.3887, 7.80651, 20.60343, 9.29062, 19.11932, NULL, NULL, 16.54024, 14.43387, 21.35976, 18.39592, 'translation-v1.0'),
+('nba_1627820', 'NBA_2018', 'GL_2020', 'NBA->GL', 'pts_per_75', 12.50242, 18.62463, 14.12533, 23.12392, 11.74355, 25.50571, 11.91413, 25.33512, 8.7597, 28.48955, 18.92831, 16.792, 13.09037, 9.37682, 'translation-v1.0'),
+('nba_1630267', 'EL_2019', 'NBA_2020', 'EL->NBA', 'pts_per_75', 14.90434, 13.24634, 7.87802, 18.61466, 5.0362, 21.45648, 8.71309, 17.77958, NULL, NULL, 10.00469, 16.81285, 17.0635, 11.17826, 'translation-v1.0'),
+('nba_1626170', 'GL_2019', 'EL_2021', 'GL->EL', 'pts_per_75', 17.67839, 9.44818, 5.52959, 13.36678, 3.45521, 15.44116, 4.84526, 14.0511, NULL, NULL, 8.15389, 14.02108, 14.54518, 13.2588, 'translation-v1.0'),
+('nba_1626188', 'NBA_2019', 'GL_2021', 'NBA->GL', 'pts_per_75', 15.87553, 21.03969, 15.93706, 26.14232, 13.23589, 28.84349, 13.42935, 28.65003, 9.85192, 32.22745, 24.0171, 16.95427, 16.12702, 11.90664, 'translation-v1.0'),
+('nba_1626203', 'NBA_2019', 'GL_2021', 'NBA->GL', 'pts_per_75', 9.41322, 16.84505, 11.74242, 21.94768, 9.04124, 24.64885, 9.23471, 24.45539, 5.65728, 28.03281, 6.4534, 16.95427, 9.94222, 7.05991, 'translation-v1.0'),
+('nba_1626209', 'NBA_2019', 'EL_2021', 'NBA->EL', 'pts_per_75', 10.57602, 14.51187, 10.59328, 18.43047, 8.5189, 20.50485, 11.09541, 17.92834, 6.72296, 22.30078, 17.30061, 14.02108, 9.49078, 7.93202, 'translation-v1.0'),
+('nba_1627739', 'NBA_2019', 'GL_2021', 'NBA->GL', 'pts_per_75', 10.58473, 17.33771, 12.23507, 22.44034, 9.5339, 25.14151, 9.72736, 24.94805, 6.14994, 28.52547, 15.75804, 16.95427, 11.06343, 7.93855, 'translation-v1.0'),
+('nba_1627748', 'NBA_2019', 'GL_2021', 'NBA->GL', 'pts_per_75', 13.03449, 19.60307, 14.50043, 24.7057, 11.79926, 27.40687, 11.99273, 27.21341, 8.4153, 30.79083, 14.05469, 16.95427, 13.40798, 9.77587, 'translation-v1.0'),
+('nba_1627756', 'NBA_2020', 'GL_2021', 'NBA->GL', 'pts_per_75', 14.11117, 20.54717, 15.44454, 25.6498, 12.74336, 28.35097, 12.93683, 28.15751, 9.3594, 31.73493, 16.73224, 16.95427, 14.3863, 10.58338, 'translation-v1.0'),
+('nba_1627767', 'NBA_2019', 'GL_2021', 'NBA->GL', 'pts_per_75', 16.47511, 22.01735, 16.91472, 27.11998, 14.21355, 29.82115, 14.40701, 29.62769, 10.82959, 33.20512, 23.17113, 16.95427, 16.70086, 12.35633, 'translation-v1.0'),
+('nba_1627775', 'NBA_2019', 'GL_2021', 'NBA->GL', 'pts_per_75', 6.73904, 15.53168, 10.42904, 20.63431, 7.72787, 23.33548, 7.92134, 23.14202, 4.34391, 26.71944, 8.6398, 16.95427, 7.38288, 5.05428, 'translation-v1.0'),
+('nba_1629740', 'NBA_2020', 'EL_2021', 'NBA->EL', 'pts_per_75', 8.52074, 14.16327, 10.24468, 18.08187, 8.1703, 20.15625, 10.74681, 17.57974, 6.37436, 21.95218, 11.65427, 14.02108, 7.96826, 6.39055, 'translation-v1.0'),
+('nba_1626161', 'NBA_2020', 'GL_2022', 'NBA->GL', 'pts_per_75', 11.12693, 18.01418, 13.22485, 22.80352, 10.68952, 25.33885, 10.87111, 25.15726, 7.51333, 28.51504, 11.77826, 17.26873, 12.19604, 8.3452, 'translation-v1.0'),
+('nba_1626208', 'NBA_2021', 'GL_2022', 'NBA->GL', 'pts_per_75', 11.44061, 19.32053, 14.53119, 24.10986, 11.99586, 26.64519, 12.17745, 26.4636, 8.81967, 29.82138, 17.55724, 17.26873, 12.325, 8.58046, 'translation-v1.0'),
+('nba_1627789', 'NBA_2021', 'EL_2022', 'NBA->EL', 'pts_per_75', 11.93321, 16.54766, 12.5215, 20.57382, 10.39018, 22.70514, 13.03742, 20.05791, 8.54495, 24.55038, 15.74151, 14.69066, 10.93038, 8.94991, 'translation-v1.0'),
+('nba_1627822', 'GL_2021', 'EL_2022', 'GL->EL', 'pts_per_75', 19.33212, 12.05068, 8.02452, 16.07684, 5.8932, 18.20816, 7.32141, 16.77995, NULL, NULL, 14.393, 14.69066, 16.56686, 14.49909, 'translation-v1.0'),
+('nba_1626147', 'GL_2022', 'EL_2023', 'GL->EL', 'pts_per_75', 22.0689, 12.89181, 8.51035, 17.27328, 6.19094, 19.59268, 7.74519, 18.03844, NULL, NULL, 11.80211, 14.76918, 19.16056, 16.55167, 'translation-v1.0'),
+('nba_1626159', 'NBA_2022', 'GL_2023', 'NBA->GL', 'pts_per_75', 9.09523, 17.71347, 12.84269, 22.58426, 10.26425, 25.1627, 10.44892, 24.97803, 7.03404, 28.39291, 20.27815, 17.00902, 9.94017, 6.82142, 'translation-v1.0'),
+('nba_1626169', 'NBA_2022', 'GL_2023', 'NBA->GL', 'pts_per_75', 13.342, 20.39613, 15.52534, 25.26691, 12.9469, 27.84535, 13.13157, 27.66068, 9.71669, 31.07556, 18.7883, 17.00902, 13.66251, 10.0065, 'translation-v1.0'),
+('nba_1626195', 'NBA_2022', 'EL_2023', 'NBA->EL', 'pts_per_75', 20.60911, 21.13322, 16.75176, 25.51468, 14.43235, 27.83409, 17.3132, 24.95324, 12.42428, 29.84216, 24.3903, 14.76918, 17.48867, 15.45683, 'translation-v1.0'),
+('nba_1627823', 'NBA_2022', 'EL_2023', 'NBA->EL', 'pts_per_75', 7.15898, 14.45985, 10.07839, 18.84132, 7.75898, 21.16073, 10.63983, 18.27988, 5.75091, 23.1688, 9.4861, 14.76918, 6.88383, 5.36924, 'translation-v1.0'),
+('nba_1630267', 'NBA_2021', 'EL_2023', 'NBA->EL', 'pts_per_75', 10.09417, 14.14065, 9.75919, 18.52212, 7.43978, 20.84152, 10.32063, 17.96068, 5.43171, 22.8496, 16.35052, 14.76918, 9.06954, 7.57063, 'translation-v1.0'),
+('nba_203995', 'EL_2022', 'NBA_2023', 'EL->NBA', 'pts_per_75', 18.44758, 16.28025, 10.73503, 21.82546, 7.79957, 24.76092, 11.59763, 20.96287, NULL, NULL, 12.92133, 17.13926, 22.31366, 13.83568, 'translation-v1.0'),
+('nba_1626163', 'EL_2023', 'GL_2024', 'EL->GL', 'pts_per_75', 18.61288, 20.19339, 15.10336, 25.28343, 12.40886, 27.97792, NULL, NULL, NULL, NULL, 17.28589, 16.92954, 21.39483, 13.95966, 'translation-v1.0'),
+('nba_1626224', 'NBA_2023', 'EL_2024', 'NBA->EL', 'pts_per_75', 13.87506, 17.79942, 13.16351, 22.43533, 10.7094, 24.88943, 13.75755, 21.84128, 8.58472, 27.01412, 17.46254, 15.24769, 12.51875, 10.40629, 'translation-v1.0'),
+('nba_1627824', 'EL_2023', 'NBA_2024', 'EL->NBA', 'pts_per_75', 16.05234, 14.37811, 9.0257, 19.73053, 6.19231, 22.56392, 9.85831, 18.89792, NULL, NULL, 14.592, 17.06619, 18.63369, 12.03925, 'translation-v1.0');
 INSERT INTO model_evaluations ("model_version", "metric", "fold", "n_evaluated", "mae", "mae_ci_low", "mae_ci_high", "baseline_name", "baseline_mae", "shuffled_mae", "beats_best_baseline", "skill_vs_best") VALUES
-('translation-v1.0', 'usg_pct', 'overall', 367, 0.03317018280468844, 0.030627066726663314, 0.0356634323153447, 'folk_0.75', 0.07487004469580645, 0.04268028943522802, 1, 0.2242),
-('translation-v1.0', 'usg_pct', 'overall', 367, 0.03317018280468844, 0.030627066726663314, 0.0356634323153447, 'league_mean', 0.04275529858724223, 0.04268028943522802, 1, 0.2242),
-('translation-v1.0', 'usg_pct', 'overall', 367, 0.03317018280468844, 0.030627066726663314, 0.0356634323153447, 'persistence_no_league', 0.050355274830231826, 0.04268028943522802, 1, 0.2242),
-('translation-v1.0', 'usg_pct', 'overall', 367, 0.03317018280468844, 0.030627066726663314, 0.0356634323153447, 'z_preservation', 0.05272444355311388, 0.04268028943522802, 1, 0.2242),
-('translation-v1.0', 'ts_pct', 'overall', 367, 0.047194520483316627, 0.04334213912261687, 0.051297461257732276, 'folk_0.75', 0.16169415990685118, 0.052261564862085566, 0, -0.0045),
-('translation-v1.0', 'ts_pct', 'overall', 367, 0.047194520483316627, 0.04334213912261687, 0.051297461257732276, 'league_mean', 0.04698529081382219, 0.052261564862085566, 0, -0.0045),
-('translation-v1.0', 'ts_pct', 'overall', 367, 0.047194520483316627, 0.04334213912261687, 0.051297461257732276, 'persistence_no_league', 0.050107648588384304, 0.052261564862085566, 0, -0.0045),
-('translation-v1.0', 'ts_pct', 'overall', 367, 0.047194520483316627, 0.04334213912261687, 0.051297461257732276, 'z_preservation', 0.06380385696277972, 0.052261564862085566, 0, -0.0045);
+('translation-v1.0', 'usg_pct', 'overall', 367, 0.03317018280468835, 0.030627066726663293, 0.03566343231534456, 'folk_0.75', 0.07487004469580645, 0.04268028943522802, 1, 0.2242),
+('translation-v1.0', 'usg_pct', 'overall', 367, 0.03317018280468835, 0.030627066726663293, 0.03566343231534456, 'league_mean', 0.04275529858724223, 0.04268028943522802, 1, 0.2242),
+('translation-v1.0', 'usg_pct', 'overall', 367, 0.03317018280468835, 0.030627066726663293, 0.03566343231534456, 'persistence_no_league', 0.05035527483023172, 0.04268028943522802, 1, 0.2242),
+('translation-v1.0', 'usg_pct', 'overall', 367, 0.03317018280468835, 0.030627066726663293, 0.03566343231534456, 'z_preservation', 0.05272444355311388, 0.04268028943522802, 1, 0.2242),
+('translation-v1.0', 'ts_pct', 'overall', 367, 0.04719452048331655, 0.04334213912261687, 0.05129746125773219, 'folk_0.75', 0.16169415990685118, 0.052261564862085566, 0, -0.0045),
+('translation-v1.0', 'ts_pct', 'overall', 367, 0.04719452048331655, 0.04334213912261687, 0.05129746125773219, 'league_mean', 0.04698529081382219, 0.052261564862085566, 0, -0.0045),
+('translation-v1.0', 'ts_pct', 'overall', 367, 0.04719452048331655, 0.04334213912261687, 0.05129746125773219, 'persistence_no_league', 0.05010764858838425, 0.052261564862085566, 0, -0.0045),
+('translation-v1.0', 'ts_pct', 'overall', 367, 0.04719452048331655, 0.04334213912261687, 0.05129746125773219, 'z_preservation', 0.06380385696277972, 0.052261564862085566, 0, -0.0045),
+('translation-v1.0', 'ast_pct', 'overall', 367, 0.04574986557564309, 0.04132121810515296, 0.050160216835495125, 'folk_0.75', 0.0621638400649216, 0.07465043700549227, 1, 0.1234),
+('translation-v1.0', 'ast_pct', 'overall', 367, 0.04574986557564309, 0.04132121810515296, 0.050160216835495125, 'league_mean', 0.07249462673167689, 0.07465043700549227, 1, 0.1234),
+('translation-v1.0', 'ast_pct', 'overall', 367, 0.04574986557564309, 0.04132121810515296, 0.050160216835495125, 'persistence_no_league', 0.05218816099918479, 0.07465043700549227, 1, 0.1234),
+('translation-v1.0', 'ast_pct', 'overall', 367, 0.04574986557564309, 0.04132121810515296, 0.050160216835495125, 'z_preservation', 0.054241177409239914, 0.07465043700549227, 1, 0.1234),
+('translation-v1.0', 'tov_rate', 'overall', 367, 0.02781516132100312, 0.025507528344128973, 0.030418815853192747, 'folk_0.75', 0.04238135552442148, 0.0406577952555552, 1, 0.1059),
+('translation-v1.0', 'tov_rate', 'overall', 367, 0.02781516132100312, 0.025507528344128973, 0.030418815853192747, 'league_mean', 0.032065579004668616, 0.0406577952555552, 1, 0.1059),
+('translation-v1.0', 'tov_rate', 'overall', 367, 0.02781516132100312, 0.025507528344128973, 0.030418815853192747, 'persistence_no_league', 0.03110945979904291, 0.0406577952555552, 1, 0.1059),
+('translation-v1.0', 'tov_rate', 'overall', 367, 0.02781516132100312, 0.025507528344128973, 0.030418815853192747, 'z_preservation', 0.03495337072617093, 0.0406577952555552, 1, 0.1059),
+('translation-v1.0', 'pts_per_75', 'overall', 367, 2.875674218510165, 2.6744699929653684, 3.0938544645229125, 'folk_0.75', 6.412841588572883, 4.005795475947805, 1, 0.2398),
+('translation-v1.0', 'pts_per_75', 'overall', 367, 2.875674218510165, 2.6744699929653684, 3.0938544645229125, 'league_mean', 3.7826630116878173, 4.005795475947805, 1, 0.2398),
+('translation-v1.0', 'pts_per_75', 'overall', 367, 2.875674218510165, 2.6744699929653684, 3.0938544645229125, 'persistence_no_league', 4.936207075889864, 4.005795475947805, 1, 0.2398),
+('translation-v1.0', 'pts_per_75', 'overall', 367, 2.875674218510165, 2.6744699929653684, 3.0938544645229125, 'z_preservation', 5.236153014353298, 4.005795475947805, 1, 0.2398);
 INSERT INTO selection_summaries ("model_version", "direction", "metric", "n_movers", "n_league", "mover_mean_z", "league_mean_z", "gap_sd") VALUES
 ('translation-v1.0', 'EL->GL', 'usg_pct', 14, 1573, 0.6901, -0.076, 0.766),
 ('translation-v1.0', 'EL->NBA', 'usg_pct', 61, 2874, 0.396, -0.0601, 0.4561),
@@ -1056,1156 +1306,1435 @@ INSERT INTO selection_summaries ("model_version", "direction", "metric", "n_move
 ('translation-v1.0', 'GL->EL', 'ts_pct', 45, 2748, 0.5862, -0.0625, 0.6487),
 ('translation-v1.0', 'GL->NBA', 'ts_pct', 45, 2748, -0.1947, -0.0625, -0.1322),
 ('translation-v1.0', 'NBA->EL', 'ts_pct', 115, 7540, -0.6795, -0.1687, -0.5108),
-('translation-v1.0', 'NBA->GL', 'ts_pct', 134, 4507, -0.8865, -0.1403, -0.7462);
+('translation-v1.0', 'NBA->GL', 'ts_pct', 134, 4507, -0.8865, -0.1403, -0.7462),
+('translation-v1.0', 'EL->GL', 'ast_pct', 14, 1573, 0.0253, -0.0829, 0.1082),
+('translation-v1.0', 'EL->NBA', 'ast_pct', 61, 2874, 0.1861, -0.0691, 0.2552),
+('translation-v1.0', 'GL->EL', 'ast_pct', 45, 2748, 0.4308, -0.067, 0.4978),
+('translation-v1.0', 'GL->NBA', 'ast_pct', 45, 2748, 0.2629, -0.067, 0.3299),
+('translation-v1.0', 'NBA->EL', 'ast_pct', 115, 7540, -0.3057, -0.1545, -0.1512),
+('translation-v1.0', 'NBA->GL', 'ast_pct', 134, 4507, -0.3266, -0.146, -0.1805),
+('translation-v1.0', 'EL->GL', 'tov_rate', 14, 1573, 0.0146, 0.0194, -0.0048),
+('translation-v1.0', 'EL->NBA', 'tov_rate', 61, 2874, -0.1064, 0.0233, -0.1297),
+('translation-v1.0', 'GL->EL', 'tov_rate', 45, 2748, 0.0303, 0.0401, -0.0097),
+('translation-v1.0', 'GL->NBA', 'tov_rate', 45, 2748, 0.098, 0.0401, 0.058),
+('translation-v1.0', 'NBA->EL', 'tov_rate', 115, 7540, 0.3548, 0.0887, 0.2662),
+('translation-v1.0', 'NBA->GL', 'tov_rate', 134, 4507, 0.3496, 0.0679, 0.2818),
+('translation-v1.0', 'EL->GL', 'pts_per_75', 14, 1573, 0.5553, -0.0922, 0.6475),
+('translation-v1.0', 'EL->NBA', 'pts_per_75', 61, 2874, 0.5111, -0.0778, 0.5889),
+('translation-v1.0', 'GL->EL', 'pts_per_75', 45, 2748, 0.5976, -0.0645, 0.6621),
+('translation-v1.0', 'GL->NBA', 'pts_per_75', 45, 2748, 0.0696, -0.0645, 0.1341),
+('translation-v1.0', 'NBA->EL', 'pts_per_75', 115, 7540, -0.7161, -0.2508, -0.4653),
+('translation-v1.0', 'NBA->GL', 'pts_per_75', 134, 4507, -0.8474, -0.2361, -0.6112);
 INSERT INTO player_archetypes ("season_id", "person_id", "league", "cluster", "model_version") VALUES
-('NBA_2005', 'nba_101126', 'NBA', 0, 'roles-v1.0'),
-('NBA_2006', 'nba_101126', 'NBA', 4, 'roles-v1.0'),
-('NBA_2007', 'nba_101126', 'NBA', 0, 'roles-v1.0'),
-('NBA_2008', 'nba_101126', 'NBA', 0, 'roles-v1.0'),
-('NBA_2009', 'nba_101126', 'NBA', 0, 'roles-v1.0'),
-('NBA_2010', 'nba_101126', 'NBA', 0, 'roles-v1.0'),
-('NBA_2011', 'nba_101126', 'NBA', 0, 'roles-v1.0'),
-('NBA_2012', 'nba_101126', 'NBA', 0, 'roles-v1.0'),
-('NBA_2013', 'nba_101126', 'NBA', 0, 'roles-v1.0'),
-('NBA_2014', 'nba_101126', 'NBA', 0, 'roles-v1.0'),
-('NBA_2005', 'nba_101127', 'NBA', 1, 'roles-v1.0'),
-('NBA_2006', 'nba_101127', 'NBA', 1, 'roles-v1.0'),
-('NBA_2007', 'nba_101127', 'NBA', 1, 'roles-v1.0'),
-('NBA_2008', 'nba_101127', 'NBA', 0, 'roles-v1.0'),
-('NBA_2009', 'nba_101127', 'NBA', 1, 'roles-v1.0'),
-('NBA_2010', 'nba_101127', 'NBA', 0, 'roles-v1.0'),
-('NBA_2011', 'nba_101127', 'NBA', 0, 'roles-v1.0'),
-('NBA_2012', 'nba_101127', 'NBA', 0, 'roles-v1.0'),
-('NBA_2013', 'nba_101127', 'NBA', 0, 'roles-v1.0'),
-('NBA_2014', 'nba_101127', 'NBA', 0, 'roles-v1.0'),
-('NBA_2015', 'nba_101127', 'NBA', 1, 'roles-v1.0'),
-('NBA_2017', 'nba_101127', 'NBA', 1, 'roles-v1.0'),
-('GL_2019', 'nba_101127', 'GL', 0, 'roles-v1.0'),
-('NBA_2005', 'nba_101132', 'NBA', 3, 'roles-v1.0'),
-('NBA_2006', 'nba_101132', 'NBA', 4, 'roles-v1.0'),
-('NBA_2007', 'nba_101132', 'NBA', 4, 'roles-v1.0'),
-('NBA_2008', 'nba_101132', 'NBA', 4, 'roles-v1.0'),
-('EL_2009', 'nba_101132', 'EL', 3, 'roles-v1.0'),
-('NBA_2010', 'nba_101132', 'NBA', 4, 'roles-v1.0'),
-('NBA_2011', 'nba_101132', 'NBA', 4, 'roles-v1.0'),
-('EL_2013', 'nba_101132', 'EL', 4, 'roles-v1.0'),
-('NBA_2005', 'nba_101137', 'NBA', 1, 'roles-v1.0'),
-('NBA_2006', 'nba_101137', 'NBA', 1, 'roles-v1.0'),
-('EL_2009', 'nba_101137', 'EL', 0, 'roles-v1.0'),
-('NBA_2006', 'nba_101141', 'NBA', 4, 'roles-v1.0'),
-('NBA_2009', 'nba_101141', 'NBA', 4, 'roles-v1.0'),
-('NBA_2010', 'nba_101141', 'NBA', 4, 'roles-v1.0'),
-('NBA_2011', 'nba_101141', 'NBA', 3, 'roles-v1.0'),
-('NBA_2012', 'nba_101141', 'NBA', 4, 'roles-v1.0'),
-('NBA_2013', 'nba_101141', 'NBA', 4, 'roles-v1.0'),
-('NBA_2014', 'nba_101141', 'NBA', 4, 'roles-v1.0'),
-('NBA_2015', 'nba_101141', 'NBA', 4, 'roles-v1.0'),
-('NBA_2016', 'nba_101141', 'NBA', 4, 'roles-v1.0'),
-('NBA_2017', 'nba_101141', 'NBA', 4, 'roles-v1.0'),
-('NBA_2018', 'nba_101141', 'NBA', 4, 'roles-v1.0'),
-('NBA_2019', 'nba_101141', 'NBA', 4, 'roles-v1.0'),
-('EL_2007', 'nba_101146', 'EL', 0, 'roles-v1.0'),
-('NBA_2008', 'nba_101146', 'NBA', 1, 'roles-v1.0'),
-('EL_2012', 'nba_101146', 'EL', 0, 'roles-v1.0'),
-('EL_2013', 'nba_101146', 'EL', 1, 'roles-v1.0'),
-('NBA_2005', 'nba_101187', 'NBA', 4, 'roles-v1.0'),
-('EL_2009', 'nba_101187', 'EL', 3, 'roles-v1.0'),
-('NBA_2012', 'nba_101187', 'NBA', 4, 'roles-v1.0'),
-('NBA_2013', 'nba_101187', 'NBA', 4, 'roles-v1.0'),
-('NBA_2014', 'nba_101187', 'NBA', 4, 'roles-v1.0'),
-('EL_2007', 'nba_101198', 'EL', 0, 'roles-v1.0'),
-('NBA_2008', 'nba_101198', 'NBA', 0, 'roles-v1.0'),
-('NBA_2009', 'nba_101198', 'NBA', 1, 'roles-v1.0'),
-('NBA_2010', 'nba_101198', 'NBA', 0, 'roles-v1.0'),
-('NBA_2011', 'nba_101198', 'NBA', 0, 'roles-v1.0'),
-('NBA_2012', 'nba_101198', 'NBA', 0, 'roles-v1.0'),
-('NBA_2013', 'nba_101198', 'NBA', 0, 'roles-v1.0'),
-('GL_2016', 'nba_101198', 'GL', 0, 'roles-v1.0'),
-('EL_2014', 'nba_101212', 'EL', 2, 'roles-v1.0'),
-('NBA_2011', 'nba_101249', 'NBA', 0, 'roles-v1.0'),
-('NBA_2012', 'nba_101249', 'NBA', 0, 'roles-v1.0'),
-('NBA_2013', 'nba_101249', 'NBA', 4, 'roles-v1.0'),
-('GL_2015', 'nba_101249', 'GL', 0, 'roles-v1.0'),
-('NBA_2000', 'nba_1531', 'NBA', 3, 'roles-v1.0'),
-('NBA_2002', 'nba_1531', 'NBA', 3, 'roles-v1.0'),
-('NBA_2003', 'nba_1531', 'NBA', 3, 'roles-v1.0'),
-('NBA_2004', 'nba_1531', 'NBA', 3, 'roles-v1.0'),
-('NBA_2005', 'nba_1531', 'NBA', 3, 'roles-v1.0'),
-('NBA_2006', 'nba_1531', 'NBA', 3, 'roles-v1.0'),
-('EL_2007', 'nba_1531', 'EL', 3, 'roles-v1.0'),
-('NBA_2015', 'nba_1626147', 'NBA', 4, 'roles-v1.0'),
-('NBA_2016', 'nba_1626147', 'NBA', 4, 'roles-v1.0'),
-('NBA_2017', 'nba_1626147', 'NBA', 4, 'roles-v1.0'),
-('GL_2019', 'nba_1626147', 'GL', 4, 'roles-v1.0'),
-('GL_2021', 'nba_1626147', 'GL', 0, 'roles-v1.0'),
-('GL_2022', 'nba_1626147', 'GL', 0, 'roles-v1.0'),
-('EL_2024', 'nba_1626147', 'EL', 4, 'roles-v1.0'),
-('GL_2015', 'nba_1626150', 'GL', 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1626150', 'NBA', 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1626150', 'NBA', 0, 'roles-v1.0'),
-('GL_2019', 'nba_1626150', 'GL', 0, 'roles-v1.0'),
-('NBA_2015', 'nba_1626159', 'NBA', 4, 'roles-v1.0'),
-('NBA_2016', 'nba_1626159', 'NBA', 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1626159', 'NBA', 4, 'roles-v1.0'),
-('NBA_2018', 'nba_1626159', 'NBA', 0, 'roles-v1.0'),
-('NBA_2020', 'nba_1626159', 'NBA', 4, 'roles-v1.0'),
-('NBA_2021', 'nba_1626159', 'NBA', 4, 'roles-v1.0'),
-('NBA_2022', 'nba_1626159', 'NBA', 1, 'roles-v1.0'),
-('GL_2023', 'nba_1626159', 'GL', 3, 'roles-v1.0'),
-('NBA_2015', 'nba_1626161', 'NBA', 2, 'roles-v1.0'),
-('NBA_2016', 'nba_1626161', 'NBA', 3, 'roles-v1.0'),
-('NBA_2017', 'nba_1626161', 'NBA', 3, 'roles-v1.0'),
-('NBA_2018', 'nba_1626161', 'NBA', 2, 'roles-v1.0'),
-('NBA_2019', 'nba_1626161', 'NBA', 2, 'roles-v1.0'),
-('NBA_2020', 'nba_1626161', 'NBA', 2, 'roles-v1.0'),
-('NBA_2015', 'nba_1626163', 'NBA', 4, 'roles-v1.0'),
-('NBA_2016', 'nba_1626163', 'NBA', 4, 'roles-v1.0'),
-('NBA_2017', 'nba_1626163', 'NBA', 4, 'roles-v1.0'),
-('NBA_2018', 'nba_1626163', 'NBA', 4, 'roles-v1.0'),
-('NBA_2019', 'nba_1626163', 'NBA', 4, 'roles-v1.0'),
-('NBA_2020', 'nba_1626163', 'NBA', 4, 'roles-v1.0'),
-('EL_2023', 'nba_1626163', 'EL', 4, 'roles-v1.0'),
-('GL_2024', 'nba_1626163', 'GL', 0, 'roles-v1.0'),
-('NBA_2015', 'nba_1626166', 'NBA', 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1626166', 'NBA', 0, 'roles-v1.0'),
-('NBA_2018', 'nba_1626166', 'NBA', 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1626166', 'NBA', 0, 'roles-v1.0'),
-('NBA_2021', 'nba_1626166', 'NBA', 0, 'roles-v1.0'),
-('NBA_2022', 'nba_1626166', 'NBA', 0, 'roles-v1.0'),
-('NBA_2023', 'nba_1626166', 'NBA', 0, 'roles-v1.0'),
-('NBA_2024', 'nba_1626166', 'NBA', 0, 'roles-v1.0'),
-('NBA_2015', 'nba_1626169', 'NBA', 4, 'roles-v1.0'),
-('NBA_2016', 'nba_1626169', 'NBA', 4, 'roles-v1.0'),
-('NBA_2017', 'nba_1626169', 'NBA', 4, 'roles-v1.0'),
-('NBA_2018', 'nba_1626169', 'NBA', 4, 'roles-v1.0'),
-('NBA_2020', 'nba_1626169', 'NBA', 1, 'roles-v1.0'),
-('NBA_2021', 'nba_1626169', 'NBA', 4, 'roles-v1.0'),
-('GL_2023', 'nba_1626169', 'GL', 4, 'roles-v1.0'),
-('GL_2024', 'nba_1626169', 'GL', 0, 'roles-v1.0'),
-('NBA_2015', 'nba_1626170', 'NBA', 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1626170', 'NBA', 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1626170', 'NBA', 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1626170', 'NBA', 1, 'roles-v1.0'),
-('GL_2019', 'nba_1626170', 'GL', 1, 'roles-v1.0'),
-('EL_2023', 'nba_1626170', 'EL', 1, 'roles-v1.0'),
-('EL_2024', 'nba_1626170', 'EL', 4, 'roles-v1.0'),
-('GL_2015', 'nba_1626174', 'GL', 3, 'roles-v1.0'),
-('GL_2016', 'nba_1626174', 'GL', 3, 'roles-v1.0'),
-('GL_2017', 'nba_1626174', 'GL', 3, 'roles-v1.0'),
-('GL_2018', 'nba_1626174', 'GL', 3, 'roles-v1.0'),
-('NBA_2019', 'nba_1626174', 'NBA', 3, 'roles-v1.0'),
-('NBA_2020', 'nba_1626174', 'NBA', 3, 'roles-v1.0'),
-('NBA_2021', 'nba_1626174', 'NBA', 3, 'roles-v1.0'),
-('NBA_2022', 'nba_1626174', 'NBA', 3, 'roles-v1.0'),
-('NBA_2023', 'nba_1626174', 'NBA', 3, 'roles-v1.0'),
-('GL_2015', 'nba_1626188', 'GL', 0, 'roles-v1.0'),
-('GL_2016', 'nba_1626188', 'GL', 0, 'roles-v1.0'),
-('GL_2017', 'nba_1626188', 'GL', 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1626188', 'NBA', 0, 'roles-v1.0'),
-('NBA_2018', 'nba_1626188', 'NBA', 4, 'roles-v1.0'),
-('NBA_2019', 'nba_1626188', 'NBA', 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1626195', 'NBA', 2, 'roles-v1.0'),
-('NBA_2018', 'nba_1626195', 'NBA', 3, 'roles-v1.0'),
-('NBA_2020', 'nba_1626195', 'NBA', 2, 'roles-v1.0'),
-('NBA_2021', 'nba_1626195', 'NBA', 3, 'roles-v1.0'),
-('EL_2023', 'nba_1626195', 'EL', 3, 'roles-v1.0'),
-('EL_2024', 'nba_1626195', 'EL', 2, 'roles-v1.0'),
-('GL_2017', 'nba_1626199', 'GL', 0, 'roles-v1.0'),
-('EL_2018', 'nba_1626199', 'EL', 4, 'roles-v1.0'),
-('EL_2019', 'nba_1626199', 'EL', 4, 'roles-v1.0'),
-('EL_2020', 'nba_1626199', 'EL', 4, 'roles-v1.0'),
-('GL_2015', 'nba_1626203', 'GL', 4, 'roles-v1.0'),
-('NBA_2017', 'nba_1626203', 'NBA', 4, 'roles-v1.0'),
-('NBA_2018', 'nba_1626203', 'NBA', 4, 'roles-v1.0'),
-('NBA_2019', 'nba_1626203', 'NBA', 4, 'roles-v1.0'),
-('GL_2015', 'nba_1626208', 'GL', 0, 'roles-v1.0'),
-('NBA_2021', 'nba_1626208', 'NBA', 1, 'roles-v1.0'),
-('GL_2022', 'nba_1626208', 'GL', 0, 'roles-v1.0'),
-('GL_2023', 'nba_1626208', 'GL', 1, 'roles-v1.0'),
-('NBA_2015', 'nba_1626209', 'NBA', 4, 'roles-v1.0'),
-('NBA_2016', 'nba_1626209', 'NBA', 4, 'roles-v1.0'),
-('NBA_2017', 'nba_1626209', 'NBA', 4, 'roles-v1.0'),
-('NBA_2018', 'nba_1626209', 'NBA', 4, 'roles-v1.0'),
-('NBA_2019', 'nba_1626209', 'NBA', 4, 'roles-v1.0'),
-('EL_2021', 'nba_1626209', 'EL', 3, 'roles-v1.0'),
-('EL_2022', 'nba_1626209', 'EL', 4, 'roles-v1.0'),
-('EL_2023', 'nba_1626209', 'EL', 4, 'roles-v1.0'),
-('EL_2024', 'nba_1626209', 'EL', 3, 'roles-v1.0'),
-('EL_2014', 'nba_1626224', 'EL', 4, 'roles-v1.0'),
-('EL_2016', 'nba_1626224', 'EL', 4, 'roles-v1.0'),
-('NBA_2017', 'nba_1626224', 'NBA', 4, 'roles-v1.0'),
-('NBA_2018', 'nba_1626224', 'NBA', 4, 'roles-v1.0'),
-('NBA_2019', 'nba_1626224', 'NBA', 4, 'roles-v1.0'),
-('NBA_2020', 'nba_1626224', 'NBA', 0, 'roles-v1.0'),
-('NBA_2021', 'nba_1626224', 'NBA', 4, 'roles-v1.0'),
-('NBA_2022', 'nba_1626224', 'NBA', 4, 'roles-v1.0'),
-('NBA_2023', 'nba_1626224', 'NBA', 4, 'roles-v1.0'),
-('EL_2024', 'nba_1626224', 'EL', 4, 'roles-v1.0'),
-('EL_2014', 'nba_1626246', 'EL', 2, 'roles-v1.0'),
-('NBA_2015', 'nba_1626246', 'NBA', 2, 'roles-v1.0'),
-('NBA_2018', 'nba_1626246', 'NBA', 2, 'roles-v1.0'),
-('GL_2015', 'nba_1626253', 'GL', 0, 'roles-v1.0'),
-('GL_2016', 'nba_1626253', 'GL', 0, 'roles-v1.0'),
-('EL_2017', 'nba_1626253', 'EL', 4, 'roles-v1.0'),
-('GL_2015', 'nba_1626262', 'GL', 3, 'roles-v1.0'),
-('EL_2018', 'nba_1626262', 'EL', 4, 'roles-v1.0'),
-('EL_2015', 'nba_1626643', 'EL', 0, 'roles-v1.0'),
-('EL_2013', 'nba_1627098', 'EL', 0, 'roles-v1.0'),
-('EL_2015', 'nba_1627098', 'EL', 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1627098', 'NBA', 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627098', 'NBA', 1, 'roles-v1.0'),
-('EL_2019', 'nba_1627098', 'EL', 1, 'roles-v1.0'),
-('EL_2020', 'nba_1627098', 'EL', 0, 'roles-v1.0'),
-('EL_2021', 'nba_1627098', 'EL', 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1627733', 'NBA', 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627733', 'NBA', 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1627733', 'NBA', 4, 'roles-v1.0'),
-('EL_2020', 'nba_1627733', 'EL', 4, 'roles-v1.0'),
-('GL_2016', 'nba_1627735', 'GL', 0, 'roles-v1.0'),
-('GL_2017', 'nba_1627735', 'GL', 0, 'roles-v1.0'),
-('EL_2020', 'nba_1627735', 'EL', 0, 'roles-v1.0'),
-('EL_2021', 'nba_1627735', 'EL', 0, 'roles-v1.0'),
-('EL_2022', 'nba_1627735', 'EL', 0, 'roles-v1.0'),
-('EL_2023', 'nba_1627735', 'EL', 0, 'roles-v1.0'),
-('EL_2024', 'nba_1627735', 'EL', 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1627739', 'NBA', 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627739', 'NBA', 0, 'roles-v1.0'),
-('NBA_2018', 'nba_1627739', 'NBA', 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1627739', 'NBA', 1, 'roles-v1.0'),
-('GL_2022', 'nba_1627739', 'GL', 1, 'roles-v1.0'),
-('NBA_2022', 'nba_1627739', 'NBA', 1, 'roles-v1.0'),
-('NBA_2023', 'nba_1627739', 'NBA', 1, 'roles-v1.0'),
-('NBA_2024', 'nba_1627739', 'NBA', 4, 'roles-v1.0'),
-('NBA_2016', 'nba_1627748', 'NBA', 4, 'roles-v1.0'),
-('NBA_2017', 'nba_1627748', 'NBA', 4, 'roles-v1.0'),
-('NBA_2018', 'nba_1627748', 'NBA', 4, 'roles-v1.0'),
-('NBA_2019', 'nba_1627748', 'NBA', 3, 'roles-v1.0'),
-('NBA_2016', 'nba_1627756', 'NBA', 4, 'roles-v1.0'),
-('NBA_2017', 'nba_1627756', 'NBA', 4, 'roles-v1.0'),
-('NBA_2020', 'nba_1627756', 'NBA', 4, 'roles-v1.0'),
-('GL_2022', 'nba_1627756', 'GL', 1, 'roles-v1.0'),
-('GL_2016', 'nba_1627762', 'GL', 3, 'roles-v1.0'),
-('GL_2017', 'nba_1627762', 'GL', 3, 'roles-v1.0'),
-('EL_2023', 'nba_1627762', 'EL', 2, 'roles-v1.0'),
-('GL_2016', 'nba_1627767', 'GL', 2, 'roles-v1.0'),
-('NBA_2017', 'nba_1627767', 'NBA', 2, 'roles-v1.0'),
-('NBA_2018', 'nba_1627767', 'NBA', 2, 'roles-v1.0'),
-('GL_2021', 'nba_1627767', 'GL', 2, 'roles-v1.0'),
-('NBA_2016', 'nba_1627775', 'NBA', 4, 'roles-v1.0'),
-('NBA_2017', 'nba_1627775', 'NBA', 4, 'roles-v1.0'),
-('NBA_2019', 'nba_1627775', 'NBA', 1, 'roles-v1.0'),
-('GL_2022', 'nba_1627775', 'GL', 4, 'roles-v1.0'),
-('GL_2023', 'nba_1627775', 'GL', 4, 'roles-v1.0'),
-('GL_2024', 'nba_1627775', 'GL', 4, 'roles-v1.0'),
-('NBA_2016', 'nba_1627785', 'NBA', 1, 'roles-v1.0'),
-('GL_2017', 'nba_1627785', 'GL', 0, 'roles-v1.0'),
-('GL_2018', 'nba_1627785', 'GL', 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1627789', 'NBA', 4, 'roles-v1.0'),
-('NBA_2017', 'nba_1627789', 'NBA', 4, 'roles-v1.0'),
-('NBA_2018', 'nba_1627789', 'NBA', 4, 'roles-v1.0'),
-('NBA_2019', 'nba_1627789', 'NBA', 4, 'roles-v1.0'),
-('NBA_2020', 'nba_1627789', 'NBA', 4, 'roles-v1.0'),
-('NBA_2021', 'nba_1627789', 'NBA', 4, 'roles-v1.0'),
-('EL_2022', 'nba_1627789', 'EL', 4, 'roles-v1.0'),
-('EL_2023', 'nba_1627789', 'EL', 4, 'roles-v1.0'),
-('EL_2024', 'nba_1627789', 'EL', 4, 'roles-v1.0'),
-('NBA_2018', 'nba_1627790', 'NBA', 2, 'roles-v1.0'),
-('EL_2020', 'nba_1627790', 'EL', 2, 'roles-v1.0'),
-('EL_2021', 'nba_1627790', 'EL', 2, 'roles-v1.0'),
-('GL_2016', 'nba_1627812', 'GL', 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1627812', 'NBA', 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1627812', 'NBA', 4, 'roles-v1.0'),
-('NBA_2018', 'nba_1627812', 'NBA', 0, 'roles-v1.0'),
-('NBA_2019', 'nba_1627812', 'NBA', 0, 'roles-v1.0'),
-('GL_2016', 'nba_1627814', 'GL', 4, 'roles-v1.0'),
-('GL_2017', 'nba_1627814', 'GL', 4, 'roles-v1.0'),
-('GL_2018', 'nba_1627814', 'GL', 4, 'roles-v1.0'),
-('NBA_2019', 'nba_1627814', 'NBA', 4, 'roles-v1.0'),
-('NBA_2020', 'nba_1627814', 'NBA', 4, 'roles-v1.0'),
-('NBA_2021', 'nba_1627814', 'NBA', 4, 'roles-v1.0'),
-('NBA_2022', 'nba_1627814', 'NBA', 4, 'roles-v1.0'),
-('GL_2016', 'nba_1627816', 'GL', 3, 'roles-v1.0'),
-('GL_2018', 'nba_1627816', 'GL', 3, 'roles-v1.0'),
-('EL_2020', 'nba_1627816', 'EL', 2, 'roles-v1.0'),
-('GL_2016', 'nba_1627820', 'GL', 0, 'roles-v1.0'),
-('GL_2017', 'nba_1627820', 'GL', 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1627820', 'NBA', 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1627820', 'NBA', 2, 'roles-v1.0'),
-('GL_2021', 'nba_1627820', 'GL', 0, 'roles-v1.0'),
-('GL_2021', 'nba_1627822', 'GL', 3, 'roles-v1.0'),
-('NBA_2016', 'nba_1627823', 'NBA', 4, 'roles-v1.0'),
-('NBA_2018', 'nba_1627823', 'NBA', 4, 'roles-v1.0'),
-('NBA_2019', 'nba_1627823', 'NBA', 4, 'roles-v1.0'),
-('NBA_2020', 'nba_1627823', 'NBA', 4, 'roles-v1.0'),
-('NBA_2022', 'nba_1627823', 'NBA', 4, 'roles-v1.0'),
-('EL_2023', 'nba_1627823', 'EL', 4, 'roles-v1.0'),
-('EL_2024', 'nba_1627823', 'EL', 4, 'roles-v1.0'),
-('EL_2020', 'nba_1627824', 'EL', 4, 'roles-v1.0'),
-('EL_2021', 'nba_1627824', 'EL', 4, 'roles-v1.0'),
-('EL_2022', 'nba_1627824', 'EL', 4, 'roles-v1.0'),
-('EL_2023', 'nba_1627824', 'EL', 4, 'roles-v1.0'),
-('NBA_2024', 'nba_1627824', 'NBA', 4, 'roles-v1.0'),
-('GL_2016', 'nba_1627834', 'GL', 2, 'roles-v1.0'),
-('EL_2020', 'nba_1627834', 'EL', 2, 'roles-v1.0'),
-('EL_2021', 'nba_1627834', 'EL', 2, 'roles-v1.0'),
-('EL_2022', 'nba_1627834', 'EL', 3, 'roles-v1.0'),
-('EL_2023', 'nba_1627834', 'EL', 4, 'roles-v1.0'),
-('NBA_2016', 'nba_1627835', 'NBA', 4, 'roles-v1.0'),
-('NBA_2017', 'nba_1627835', 'NBA', 4, 'roles-v1.0'),
-('EL_2019', 'nba_1627835', 'EL', 4, 'roles-v1.0'),
-('EL_2020', 'nba_1627835', 'EL', 4, 'roles-v1.0'),
-('GL_2016', 'nba_1627846', 'GL', 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1627846', 'NBA', 4, 'roles-v1.0'),
-('NBA_2018', 'nba_1627846', 'NBA', 4, 'roles-v1.0'),
-('NBA_2019', 'nba_1627846', 'NBA', 4, 'roles-v1.0'),
-('EL_2014', 'nba_1627851', 'EL', 4, 'roles-v1.0'),
-('NBA_2016', 'nba_1627851', 'NBA', 4, 'roles-v1.0'),
-('EL_2018', 'nba_1627851', 'EL', 4, 'roles-v1.0'),
-('GL_2016', 'nba_1627853', 'GL', 1, 'roles-v1.0'),
-('GL_2017', 'nba_1627853', 'GL', 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1627853', 'NBA', 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1627853', 'NBA', 4, 'roles-v1.0'),
-('GL_2016', 'nba_1627858', 'GL', 1, 'roles-v1.0'),
-('GL_2017', 'nba_1627858', 'GL', 1, 'roles-v1.0'),
-('GL_2018', 'nba_1627858', 'GL', 1, 'roles-v1.0'),
-('GL_2019', 'nba_1627858', 'GL', 3, 'roles-v1.0'),
-('EL_2016', 'nba_1629029', 'EL', 1, 'roles-v1.0'),
-('EL_2017', 'nba_1629029', 'EL', 0, 'roles-v1.0'),
-('NBA_2018', 'nba_1629029', 'NBA', 0, 'roles-v1.0'),
-('NBA_2019', 'nba_1629029', 'NBA', 0, 'roles-v1.0'),
-('NBA_2020', 'nba_1629029', 'NBA', 0, 'roles-v1.0'),
-('NBA_2021', 'nba_1629029', 'NBA', 0, 'roles-v1.0'),
-('NBA_2022', 'nba_1629029', 'NBA', 0, 'roles-v1.0'),
-('NBA_2023', 'nba_1629029', 'NBA', 0, 'roles-v1.0'),
-('NBA_2024', 'nba_1629029', 'NBA', 0, 'roles-v1.0'),
-('EL_2013', 'nba_1629740', 'EL', 4, 'roles-v1.0'),
-('EL_2015', 'nba_1629740', 'EL', 4, 'roles-v1.0'),
-('EL_2016', 'nba_1629740', 'EL', 3, 'roles-v1.0'),
-('EL_2017', 'nba_1629740', 'EL', 4, 'roles-v1.0'),
-('EL_2018', 'nba_1629740', 'EL', 4, 'roles-v1.0'),
-('NBA_2019', 'nba_1629740', 'NBA', 4, 'roles-v1.0'),
-('NBA_2020', 'nba_1629740', 'NBA', 4, 'roles-v1.0'),
-('EL_2021', 'nba_1629740', 'EL', 3, 'roles-v1.0'),
-('EL_2022', 'nba_1629740', 'EL', 4, 'roles-v1.0'),
-('EL_2023', 'nba_1629740', 'EL', 4, 'roles-v1.0'),
-('EL_2024', 'nba_1629740', 'EL', 4, 'roles-v1.0'),
-('EL_2017', 'nba_1630267', 'EL', 1, 'roles-v1.0'),
-('EL_2018', 'nba_1630267', 'EL', 1, 'roles-v1.0'),
-('EL_2019', 'nba_1630267', 'EL', 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1630267', 'NBA', 1, 'roles-v1.0'),
-('NBA_2021', 'nba_1630267', 'NBA', 1, 'roles-v1.0'),
-('EL_2023', 'nba_1630267', 'EL', 1, 'roles-v1.0'),
-('EL_2024', 'nba_1630267', 'EL', 1, 'roles-v1.0'),
-('EL_2017', 'nba_203995', 'EL', 1, 'roles-v1.0'),
-('EL_2018', 'nba_203995', 'EL', 1, 'roles-v1.0'),
-('EL_2019', 'nba_203995', 'EL', 0, 'roles-v1.0'),
-('EL_2020', 'nba_203995', 'EL', 0, 'roles-v1.0'),
-('EL_2021', 'nba_203995', 'EL', 0, 'roles-v1.0'),
-('EL_2022', 'nba_203995', 'EL', 0, 'roles-v1.0'),
-('NBA_2023', 'nba_203995', 'NBA', 1, 'roles-v1.0'),
-('NBA_2024', 'nba_203995', 'NBA', 1, 'roles-v1.0');
+('NBA_2005', 'nba_101126', 'NBA', 0, 'roles-v1.1'),
+('NBA_2006', 'nba_101126', 'NBA', 4, 'roles-v1.1'),
+('NBA_2007', 'nba_101126', 'NBA', 0, 'roles-v1.1'),
+('NBA_2008', 'nba_101126', 'NBA', 0, 'roles-v1.1'),
+('NBA_2009', 'nba_101126', 'NBA', 0, 'roles-v1.1'),
+('NBA_2010', 'nba_101126', 'NBA', 0, 'roles-v1.1'),
+('NBA_2011', 'nba_101126', 'NBA', 0, 'roles-v1.1'),
+('NBA_2012', 'nba_101126', 'NBA', 0, 'roles-v1.1'),
+('NBA_2013', 'nba_101126', 'NBA', 0, 'roles-v1.1'),
+('NBA_2014', 'nba_101126', 'NBA', 0, 'roles-v1.1'),
+('NBA_2005', 'nba_101127', 'NBA', 1, 'roles-v1.1'),
+('NBA_2006', 'nba_101127', 'NBA', 1, 'roles-v1.1'),
+('NBA_2007', 'nba_101127', 'NBA', 1, 'roles-v1.1'),
+('NBA_2008', 'nba_101127', 'NBA', 0, 'roles-v1.1'),
+('NBA_2009', 'nba_101127', 'NBA', 1, 'roles-v1.1'),
+('NBA_2010', 'nba_101127', 'NBA', 0, 'roles-v1.1'),
+('NBA_2011', 'nba_101127', 'NBA', 0, 'roles-v1.1'),
+('NBA_2012', 'nba_101127', 'NBA', 0, 'roles-v1.1'),
+('NBA_2013', 'nba_101127', 'NBA', 0, 'roles-v1.1'),
+('NBA_2014', 'nba_101127', 'NBA', 0, 'roles-v1.1'),
+('NBA_2015', 'nba_101127', 'NBA', 1, 'roles-v1.1'),
+('NBA_2017', 'nba_101127', 'NBA', 1, 'roles-v1.1'),
+('GL_2019', 'nba_101127', 'GL', 0, 'roles-v1.1'),
+('NBA_2005', 'nba_101132', 'NBA', 3, 'roles-v1.1'),
+('NBA_2006', 'nba_101132', 'NBA', 4, 'roles-v1.1'),
+('NBA_2007', 'nba_101132', 'NBA', 4, 'roles-v1.1'),
+('NBA_2008', 'nba_101132', 'NBA', 4, 'roles-v1.1'),
+('EL_2009', 'nba_101132', 'EL', 3, 'roles-v1.1'),
+('NBA_2010', 'nba_101132', 'NBA', 4, 'roles-v1.1'),
+('NBA_2011', 'nba_101132', 'NBA', 4, 'roles-v1.1'),
+('EL_2013', 'nba_101132', 'EL', 4, 'roles-v1.1'),
+('NBA_2005', 'nba_101137', 'NBA', 1, 'roles-v1.1'),
+('NBA_2006', 'nba_101137', 'NBA', 1, 'roles-v1.1'),
+('EL_2009', 'nba_101137', 'EL', 0, 'roles-v1.1'),
+('NBA_2006', 'nba_101141', 'NBA', 4, 'roles-v1.1'),
+('NBA_2009', 'nba_101141', 'NBA', 4, 'roles-v1.1'),
+('NBA_2010', 'nba_101141', 'NBA', 4, 'roles-v1.1'),
+('NBA_2011', 'nba_101141', 'NBA', 3, 'roles-v1.1'),
+('NBA_2012', 'nba_101141', 'NBA', 4, 'roles-v1.1'),
+('NBA_2013', 'nba_101141', 'NBA', 4, 'roles-v1.1'),
+('NBA_2014', 'nba_101141', 'NBA', 4, 'roles-v1.1'),
+('NBA_2015', 'nba_101141', 'NBA', 4, 'roles-v1.1'),
+('NBA_2016', 'nba_101141', 'NBA', 4, 'roles-v1.1'),
+('NBA_2017', 'nba_101141', 'NBA', 4, 'roles-v1.1'),
+('NBA_2018', 'nba_101141', 'NBA', 4, 'roles-v1.1'),
+('NBA_2019', 'nba_101141', 'NBA', 4, 'roles-v1.1'),
+('EL_2007', 'nba_101146', 'EL', 0, 'roles-v1.1'),
+('NBA_2008', 'nba_101146', 'NBA', 1, 'roles-v1.1'),
+('EL_2012', 'nba_101146', 'EL', 0, 'roles-v1.1'),
+('EL_2013', 'nba_101146', 'EL', 1, 'roles-v1.1'),
+('NBA_2005', 'nba_101187', 'NBA', 4, 'roles-v1.1'),
+('EL_2009', 'nba_101187', 'EL', 3, 'roles-v1.1'),
+('NBA_2012', 'nba_101187', 'NBA', 4, 'roles-v1.1'),
+('NBA_2013', 'nba_101187', 'NBA', 4, 'roles-v1.1'),
+('NBA_2014', 'nba_101187', 'NBA', 4, 'roles-v1.1'),
+('EL_2007', 'nba_101198', 'EL', 0, 'roles-v1.1'),
+('NBA_2008', 'nba_101198', 'NBA', 0, 'roles-v1.1'),
+('NBA_2009', 'nba_101198', 'NBA', 1, 'roles-v1.1'),
+('NBA_2010', 'nba_101198', 'NBA', 0, 'roles-v1.1'),
+('NBA_2011', 'nba_101198', 'NBA', 0, 'roles-v1.1'),
+('NBA_2012', 'nba_101198', 'NBA', 0, 'roles-v1.1'),
+('NBA_2013', 'nba_101198', 'NBA', 0, 'roles-v1.1'),
+('GL_2016', 'nba_101198', 'GL', 0, 'roles-v1.1'),
+('EL_2014', 'nba_101212', 'EL', 2, 'roles-v1.1'),
+('NBA_2011', 'nba_101249', 'NBA', 0, 'roles-v1.1'),
+('NBA_2012', 'nba_101249', 'NBA', 0, 'roles-v1.1'),
+('NBA_2013', 'nba_101249', 'NBA', 4, 'roles-v1.1'),
+('GL_2015', 'nba_101249', 'GL', 0, 'roles-v1.1'),
+('NBA_2000', 'nba_1531', 'NBA', 3, 'roles-v1.1'),
+('NBA_2002', 'nba_1531', 'NBA', 3, 'roles-v1.1'),
+('NBA_2003', 'nba_1531', 'NBA', 3, 'roles-v1.1'),
+('NBA_2004', 'nba_1531', 'NBA', 3, 'roles-v1.1'),
+('NBA_2005', 'nba_1531', 'NBA', 3, 'roles-v1.1'),
+('NBA_2006', 'nba_1531', 'NBA', 3, 'roles-v1.1'),
+('EL_2007', 'nba_1531', 'EL', 3, 'roles-v1.1'),
+('NBA_2015', 'nba_1626147', 'NBA', 4, 'roles-v1.1'),
+('NBA_2016', 'nba_1626147', 'NBA', 4, 'roles-v1.1'),
+('NBA_2017', 'nba_1626147', 'NBA', 4, 'roles-v1.1'),
+('GL_2019', 'nba_1626147', 'GL', 4, 'roles-v1.1'),
+('GL_2021', 'nba_1626147', 'GL', 0, 'roles-v1.1'),
+('GL_2022', 'nba_1626147', 'GL', 0, 'roles-v1.1'),
+('EL_2024', 'nba_1626147', 'EL', 4, 'roles-v1.1'),
+('GL_2015', 'nba_1626150', 'GL', 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1626150', 'NBA', 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1626150', 'NBA', 0, 'roles-v1.1'),
+('GL_2019', 'nba_1626150', 'GL', 0, 'roles-v1.1'),
+('NBA_2015', 'nba_1626159', 'NBA', 4, 'roles-v1.1'),
+('NBA_2016', 'nba_1626159', 'NBA', 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1626159', 'NBA', 4, 'roles-v1.1'),
+('NBA_2018', 'nba_1626159', 'NBA', 0, 'roles-v1.1'),
+('NBA_2020', 'nba_1626159', 'NBA', 4, 'roles-v1.1'),
+('NBA_2021', 'nba_1626159', 'NBA', 4, 'roles-v1.1'),
+('NBA_2022', 'nba_1626159', 'NBA', 1, 'roles-v1.1'),
+('GL_2023', 'nba_1626159', 'GL', 3, 'roles-v1.1'),
+('NBA_2015', 'nba_1626161', 'NBA', 2, 'roles-v1.1'),
+('NBA_2016', 'nba_1626161', 'NBA', 3, 'roles-v1.1'),
+('NBA_2017', 'nba_1626161', 'NBA', 3, 'roles-v1.1'),
+('NBA_2018', 'nba_1626161', 'NBA', 2, 'roles-v1.1'),
+('NBA_2019', 'nba_1626161', 'NBA', 2, 'roles-v1.1'),
+('NBA_2020', 'nba_1626161', 'NBA', 2, 'roles-v1.1'),
+('NBA_2015', 'nba_1626163', 'NBA', 4, 'roles-v1.1'),
+('NBA_2016', 'nba_1626163', 'NBA', 4, 'roles-v1.1'),
+('NBA_2017', 'nba_1626163', 'NBA', 4, 'roles-v1.1'),
+('NBA_2018', 'nba_1626163', 'NBA', 4, 'roles-v1.1'),
+('NBA_2019', 'nba_1626163', 'NBA', 4, 'roles-v1.1'),
+('NBA_2020', 'nba_1626163', 'NBA', 4, 'roles-v1.1'),
+('EL_2023', 'nba_1626163', 'EL', 4, 'roles-v1.1'),
+('GL_2024', 'nba_1626163', 'GL', 0, 'roles-v1.1'),
+('NBA_2015', 'nba_1626166', 'NBA', 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1626166', 'NBA', 0, 'roles-v1.1'),
+('NBA_2018', 'nba_1626166', 'NBA', 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1626166', 'NBA', 0, 'roles-v1.1'),
+('NBA_2021', 'nba_1626166', 'NBA', 0, 'roles-v1.1'),
+('NBA_2022', 'nba_1626166', 'NBA', 0, 'roles-v1.1'),
+('NBA_2023', 'nba_1626166', 'NBA', 0, 'roles-v1.1'),
+('NBA_2024', 'nba_1626166', 'NBA', 0, 'roles-v1.1'),
+('NBA_2015', 'nba_1626169', 'NBA', 4, 'roles-v1.1'),
+('NBA_2016', 'nba_1626169', 'NBA', 4, 'roles-v1.1'),
+('NBA_2017', 'nba_1626169', 'NBA', 4, 'roles-v1.1'),
+('NBA_2018', 'nba_1626169', 'NBA', 4, 'roles-v1.1'),
+('NBA_2020', 'nba_1626169', 'NBA', 1, 'roles-v1.1'),
+('NBA_2021', 'nba_1626169', 'NBA', 4, 'roles-v1.1'),
+('GL_2023', 'nba_1626169', 'GL', 4, 'roles-v1.1'),
+('GL_2024', 'nba_1626169', 'GL', 0, 'roles-v1.1'),
+('NBA_2015', 'nba_1626170', 'NBA', 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1626170', 'NBA', 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1626170', 'NBA', 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1626170', 'NBA', 1, 'roles-v1.1'),
+('GL_2019', 'nba_1626170', 'GL', 1, 'roles-v1.1'),
+('EL_2023', 'nba_1626170', 'EL', 1, 'roles-v1.1'),
+('EL_2024', 'nba_1626170', 'EL', 4, 'roles-v1.1'),
+('GL_2015', 'nba_1626174', 'GL', 3, 'roles-v1.1'),
+('GL_2016', 'nba_1626174', 'GL', 3, 'roles-v1.1'),
+('GL_2017', 'nba_1626174', 'GL', 3, 'roles-v1.1'),
+('GL_2018', 'nba_1626174', 'GL', 3, 'roles-v1.1'),
+('NBA_2019', 'nba_1626174', 'NBA', 3, 'roles-v1.1'),
+('NBA_2020', 'nba_1626174', 'NBA', 3, 'roles-v1.1'),
+('NBA_2021', 'nba_1626174', 'NBA', 3, 'roles-v1.1'),
+('NBA_2022', 'nba_1626174', 'NBA', 3, 'roles-v1.1'),
+('NBA_2023', 'nba_1626174', 'NBA', 3, 'roles-v1.1'),
+('GL_2015', 'nba_1626188', 'GL', 0, 'roles-v1.1'),
+('GL_2016', 'nba_1626188', 'GL', 0, 'roles-v1.1'),
+('GL_2017', 'nba_1626188', 'GL', 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1626188', 'NBA', 0, 'roles-v1.1'),
+('NBA_2018', 'nba_1626188', 'NBA', 4, 'roles-v1.1'),
+('NBA_2019', 'nba_1626188', 'NBA', 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1626195', 'NBA', 2, 'roles-v1.1'),
+('NBA_2018', 'nba_1626195', 'NBA', 3, 'roles-v1.1'),
+('NBA_2020', 'nba_1626195', 'NBA', 2, 'roles-v1.1'),
+('NBA_2021', 'nba_1626195', 'NBA', 3, 'roles-v1.1'),
+('EL_2023', 'nba_1626195', 'EL', 3, 'roles-v1.1'),
+('EL_2024', 'nba_1626195', 'EL', 2, 'roles-v1.1'),
+('GL_2017', 'nba_1626199', 'GL', 0, 'roles-v1.1'),
+('EL_2018', 'nba_1626199', 'EL', 4, 'roles-v1.1'),
+('EL_2019', 'nba_1626199', 'EL', 4, 'roles-v1.1'),
+('EL_2020', 'nba_1626199', 'EL', 4, 'roles-v1.1'),
+('GL_2015', 'nba_1626203', 'GL', 4, 'roles-v1.1'),
+('NBA_2017', 'nba_1626203', 'NBA', 4, 'roles-v1.1'),
+('NBA_2018', 'nba_1626203', 'NBA', 4, 'roles-v1.1'),
+('NBA_2019', 'nba_1626203', 'NBA', 4, 'roles-v1.1'),
+('GL_2015', 'nba_1626208', 'GL', 0, 'roles-v1.1'),
+('NBA_2021', 'nba_1626208', 'NBA', 1, 'roles-v1.1'),
+('GL_2022', 'nba_1626208', 'GL', 0, 'roles-v1.1'),
+('GL_2023', 'nba_1626208', 'GL', 1, 'roles-v1.1'),
+('NBA_2015', 'nba_1626209', 'NBA', 4, 'roles-v1.1'),
+('NBA_2016', 'nba_1626209', 'NBA', 4, 'roles-v1.1'),
+('NBA_2017', 'nba_1626209', 'NBA', 4, 'roles-v1.1'),
+('NBA_2018', 'nba_1626209', 'NBA', 4, 'roles-v1.1'),
+('NBA_2019', 'nba_1626209', 'NBA', 4, 'roles-v1.1'),
+('EL_2021', 'nba_1626209', 'EL', 3, 'roles-v1.1'),
+('EL_2022', 'nba_1626209', 'EL', 4, 'roles-v1.1'),
+('EL_2023', 'nba_1626209', 'EL', 4, 'roles-v1.1'),
+('EL_2024', 'nba_1626209', 'EL', 3, 'roles-v1.1'),
+('EL_2014', 'nba_1626224', 'EL', 4, 'roles-v1.1'),
+('EL_2016', 'nba_1626224', 'EL', 4, 'roles-v1.1'),
+('NBA_2017', 'nba_1626224', 'NBA', 4, 'roles-v1.1'),
+('NBA_2018', 'nba_1626224', 'NBA', 4, 'roles-v1.1'),
+('NBA_2019', 'nba_1626224', 'NBA', 4, 'roles-v1.1'),
+('NBA_2020', 'nba_1626224', 'NBA', 0, 'roles-v1.1'),
+('NBA_2021', 'nba_1626224', 'NBA', 4, 'roles-v1.1'),
+('NBA_2022', 'nba_1626224', 'NBA', 4, 'roles-v1.1'),
+('NBA_2023', 'nba_1626224', 'NBA', 4, 'roles-v1.1'),
+('EL_2024', 'nba_1626224', 'EL', 4, 'roles-v1.1'),
+('EL_2014', 'nba_1626246', 'EL', 2, 'roles-v1.1'),
+('NBA_2015', 'nba_1626246', 'NBA', 2, 'roles-v1.1'),
+('NBA_2018', 'nba_1626246', 'NBA', 2, 'roles-v1.1'),
+('GL_2015', 'nba_1626253', 'GL', 0, 'roles-v1.1'),
+('GL_2016', 'nba_1626253', 'GL', 0, 'roles-v1.1'),
+('EL_2017', 'nba_1626253', 'EL', 4, 'roles-v1.1'),
+('GL_2015', 'nba_1626262', 'GL', 3, 'roles-v1.1'),
+('EL_2018', 'nba_1626262', 'EL', 4, 'roles-v1.1'),
+('EL_2015', 'nba_1626643', 'EL', 0, 'roles-v1.1'),
+('EL_2013', 'nba_1627098', 'EL', 0, 'roles-v1.1'),
+('EL_2015', 'nba_1627098', 'EL', 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1627098', 'NBA', 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627098', 'NBA', 1, 'roles-v1.1'),
+('EL_2019', 'nba_1627098', 'EL', 1, 'roles-v1.1'),
+('EL_2020', 'nba_1627098', 'EL', 0, 'roles-v1.1'),
+('EL_2021', 'nba_1627098', 'EL', 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1627733', 'NBA', 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627733', 'NBA', 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1627733', 'NBA', 4, 'roles-v1.1'),
+('EL_2020', 'nba_1627733', 'EL', 4, 'roles-v1.1'),
+('GL_2016', 'nba_1627735', 'GL', 0, 'roles-v1.1'),
+('GL_2017', 'nba_1627735', 'GL', 0, 'roles-v1.1'),
+('EL_2020', 'nba_1627735', 'EL', 0, 'roles-v1.1'),
+('EL_2021', 'nba_1627735', 'EL', 0, 'roles-v1.1'),
+('EL_2022', 'nba_1627735', 'EL', 0, 'roles-v1.1'),
+('EL_2023', 'nba_1627735', 'EL', 0, 'roles-v1.1'),
+('EL_2024', 'nba_1627735', 'EL', 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1627739', 'NBA', 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627739', 'NBA', 0, 'roles-v1.1'),
+('NBA_2018', 'nba_1627739', 'NBA', 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1627739', 'NBA', 1, 'roles-v1.1'),
+('GL_2022', 'nba_1627739', 'GL', 1, 'roles-v1.1'),
+('NBA_2022', 'nba_1627739', 'NBA', 1, 'roles-v1.1'),
+('NBA_2023', 'nba_1627739', 'NBA', 1, 'roles-v1.1'),
+('NBA_2024', 'nba_1627739', 'NBA', 4, 'roles-v1.1'),
+('NBA_2016', 'nba_1627748', 'NBA', 4, 'roles-v1.1'),
+('NBA_2017', 'nba_1627748', 'NBA', 4, 'roles-v1.1'),
+('NBA_2018', 'nba_1627748', 'NBA', 4, 'roles-v1.1'),
+('NBA_2019', 'nba_1627748', 'NBA', 3, 'roles-v1.1'),
+('NBA_2016', 'nba_1627756', 'NBA', 4, 'roles-v1.1'),
+('NBA_2017', 'nba_1627756', 'NBA', 4, 'roles-v1.1'),
+('NBA_2020', 'nba_1627756', 'NBA', 4, 'roles-v1.1'),
+('GL_2022', 'nba_1627756', 'GL', 1, 'roles-v1.1'),
+('GL_2016', 'nba_1627762', 'GL', 3, 'roles-v1.1'),
+('GL_2017', 'nba_1627762', 'GL', 3, 'roles-v1.1'),
+('EL_2023', 'nba_1627762', 'EL', 2, 'roles-v1.1'),
+('GL_2016', 'nba_1627767', 'GL', 2, 'roles-v1.1'),
+('NBA_2017', 'nba_1627767', 'NBA', 2, 'roles-v1.1'),
+('NBA_2018', 'nba_1627767', 'NBA', 2, 'roles-v1.1'),
+('GL_2021', 'nba_1627767', 'GL', 2, 'roles-v1.1'),
+('NBA_2016', 'nba_1627775', 'NBA', 4, 'roles-v1.1'),
+('NBA_2017', 'nba_1627775', 'NBA', 4, 'roles-v1.1'),
+('NBA_2019', 'nba_1627775', 'NBA', 1, 'roles-v1.1'),
+('GL_2022', 'nba_1627775', 'GL', 4, 'roles-v1.1'),
+('GL_2023', 'nba_1627775', 'GL', 4, 'roles-v1.1'),
+('GL_2024', 'nba_1627775', 'GL', 4, 'roles-v1.1'),
+('NBA_2016', 'nba_1627785', 'NBA', 1, 'roles-v1.1'),
+('GL_2017', 'nba_1627785', 'GL', 0, 'roles-v1.1'),
+('GL_2018', 'nba_1627785', 'GL', 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1627789', 'NBA', 4, 'roles-v1.1'),
+('NBA_2017', 'nba_1627789', 'NBA', 4, 'roles-v1.1'),
+('NBA_2018', 'nba_1627789', 'NBA', 4, 'roles-v1.1'),
+('NBA_2019', 'nba_1627789', 'NBA', 4, 'roles-v1.1'),
+('NBA_2020', 'nba_1627789', 'NBA', 4, 'roles-v1.1'),
+('NBA_2021', 'nba_1627789', 'NBA', 4, 'roles-v1.1'),
+('EL_2022', 'nba_1627789', 'EL', 4, 'roles-v1.1'),
+('EL_2023', 'nba_1627789', 'EL', 4, 'roles-v1.1'),
+('EL_2024', 'nba_1627789', 'EL', 4, 'roles-v1.1'),
+('NBA_2018', 'nba_1627790', 'NBA', 2, 'roles-v1.1'),
+('EL_2020', 'nba_1627790', 'EL', 2, 'roles-v1.1'),
+('EL_2021', 'nba_1627790', 'EL', 2, 'roles-v1.1'),
+('GL_2016', 'nba_1627812', 'GL', 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1627812', 'NBA', 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1627812', 'NBA', 4, 'roles-v1.1'),
+('NBA_2018', 'nba_1627812', 'NBA', 0, 'roles-v1.1'),
+('NBA_2019', 'nba_1627812', 'NBA', 0, 'roles-v1.1'),
+('GL_2016', 'nba_1627814', 'GL', 4, 'roles-v1.1'),
+('GL_2017', 'nba_1627814', 'GL', 4, 'roles-v1.1'),
+('GL_2018', 'nba_1627814', 'GL', 4, 'roles-v1.1'),
+('NBA_2019', 'nba_1627814', 'NBA', 4, 'roles-v1.1'),
+('NBA_2020', 'nba_1627814', 'NBA', 4, 'roles-v1.1'),
+('NBA_2021', 'nba_1627814', 'NBA', 4, 'roles-v1.1'),
+('NBA_2022', 'nba_1627814', 'NBA', 4, 'roles-v1.1'),
+('GL_2016', 'nba_1627816', 'GL', 3, 'roles-v1.1'),
+('GL_2018', 'nba_1627816', 'GL', 3, 'roles-v1.1'),
+('EL_2020', 'nba_1627816', 'EL', 2, 'roles-v1.1'),
+('GL_2016', 'nba_1627820', 'GL', 0, 'roles-v1.1'),
+('GL_2017', 'nba_1627820', 'GL', 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1627820', 'NBA', 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1627820', 'NBA', 2, 'roles-v1.1'),
+('GL_2021', 'nba_1627820', 'GL', 0, 'roles-v1.1'),
+('GL_2021', 'nba_1627822', 'GL', 3, 'roles-v1.1'),
+('NBA_2016', 'nba_1627823', 'NBA', 4, 'roles-v1.1'),
+('NBA_2018', 'nba_1627823', 'NBA', 4, 'roles-v1.1'),
+('NBA_2019', 'nba_1627823', 'NBA', 4, 'roles-v1.1'),
+('NBA_2020', 'nba_1627823', 'NBA', 4, 'roles-v1.1'),
+('NBA_2022', 'nba_1627823', 'NBA', 4, 'roles-v1.1'),
+('EL_2023', 'nba_1627823', 'EL', 4, 'roles-v1.1'),
+('EL_2024', 'nba_1627823', 'EL', 4, 'roles-v1.1'),
+('EL_2020', 'nba_1627824', 'EL', 4, 'roles-v1.1'),
+('EL_2021', 'nba_1627824', 'EL', 4, 'roles-v1.1'),
+('EL_2022', 'nba_1627824', 'EL', 4, 'roles-v1.1'),
+('EL_2023', 'nba_1627824', 'EL', 4, 'roles-v1.1'),
+('NBA_2024', 'nba_1627824', 'NBA', 4, 'roles-v1.1'),
+('GL_2016', 'nba_1627834', 'GL', 2, 'roles-v1.1'),
+('EL_2020', 'nba_1627834', 'EL', 2, 'roles-v1.1'),
+('EL_2021', 'nba_1627834', 'EL', 2, 'roles-v1.1'),
+('EL_2022', 'nba_1627834', 'EL', 3, 'roles-v1.1'),
+('EL_2023', 'nba_1627834', 'EL', 4, 'roles-v1.1'),
+('NBA_2016', 'nba_1627835', 'NBA', 4, 'roles-v1.1'),
+('NBA_2017', 'nba_1627835', 'NBA', 4, 'roles-v1.1'),
+('EL_2019', 'nba_1627835', 'EL', 4, 'roles-v1.1'),
+('EL_2020', 'nba_1627835', 'EL', 4, 'roles-v1.1'),
+('GL_2016', 'nba_1627846', 'GL', 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1627846', 'NBA', 4, 'roles-v1.1'),
+('NBA_2018', 'nba_1627846', 'NBA', 4, 'roles-v1.1'),
+('NBA_2019', 'nba_1627846', 'NBA', 4, 'roles-v1.1'),
+('EL_2014', 'nba_1627851', 'EL', 4, 'roles-v1.1'),
+('NBA_2016', 'nba_1627851', 'NBA', 4, 'roles-v1.1'),
+('EL_2018', 'nba_1627851', 'EL', 4, 'roles-v1.1'),
+('GL_2016', 'nba_1627853', 'GL', 1, 'roles-v1.1'),
+('GL_2017', 'nba_1627853', 'GL', 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1627853', 'NBA', 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1627853', 'NBA', 4, 'roles-v1.1'),
+('GL_2016', 'nba_1627858', 'GL', 1, 'roles-v1.1'),
+('GL_2017', 'nba_1627858', 'GL', 1, 'roles-v1.1'),
+('GL_2018', 'nba_1627858', 'GL', 1, 'roles-v1.1'),
+('GL_2019', 'nba_1627858', 'GL', 3, 'roles-v1.1'),
+('EL_2016', 'nba_1629029', 'EL', 1, 'roles-v1.1'),
+('EL_2017', 'nba_1629029', 'EL', 0, 'roles-v1.1'),
+('NBA_2018', 'nba_1629029', 'NBA', 0, 'roles-v1.1'),
+('NBA_2019', 'nba_1629029', 'NBA', 0, 'roles-v1.1'),
+('NBA_2020', 'nba_1629029', 'NBA', 0, 'roles-v1.1'),
+('NBA_2021', 'nba_1629029', 'NBA', 0, 'roles-v1.1'),
+('NBA_2022', 'nba_1629029', 'NBA', 0, 'roles-v1.1'),
+('NBA_2023', 'nba_1629029', 'NBA', 0, 'roles-v1.1'),
+('NBA_2024', 'nba_1629029', 'NBA', 0, 'roles-v1.1'),
+('EL_2013', 'nba_1629740', 'EL', 4, 'roles-v1.1'),
+('EL_2015', 'nba_1629740', 'EL', 4, 'roles-v1.1'),
+('EL_2016', 'nba_1629740', 'EL', 3, 'roles-v1.1'),
+('EL_2017', 'nba_1629740', 'EL', 4, 'roles-v1.1'),
+('EL_2018', 'nba_1629740', 'EL', 4, 'roles-v1.1'),
+('NBA_2019', 'nba_1629740', 'NBA', 4, 'roles-v1.1'),
+('NBA_2020', 'nba_1629740', 'NBA', 4, 'roles-v1.1'),
+('EL_2021', 'nba_1629740', 'EL', 3, 'roles-v1.1'),
+('EL_2022', 'nba_1629740', 'EL', 4, 'roles-v1.1'),
+('EL_2023', 'nba_1629740', 'EL', 4, 'roles-v1.1'),
+('EL_2024', 'nba_1629740', 'EL', 4, 'roles-v1.1'),
+('EL_2017', 'nba_1630267', 'EL', 1, 'roles-v1.1'),
+('EL_2018', 'nba_1630267', 'EL', 1, 'roles-v1.1'),
+('EL_2019', 'nba_1630267', 'EL', 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1630267', 'NBA', 1, 'roles-v1.1'),
+('NBA_2021', 'nba_1630267', 'NBA', 1, 'roles-v1.1'),
+('EL_2023', 'nba_1630267', 'EL', 1, 'roles-v1.1'),
+('EL_2024', 'nba_1630267', 'EL', 1, 'roles-v1.1'),
+('EL_2017', 'nba_203995', 'EL', 1, 'roles-v1.1'),
+('EL_2018', 'nba_203995', 'EL', 1, 'roles-v1.1'),
+('EL_2019', 'nba_203995', 'EL', 0, 'roles-v1.1'),
+('EL_2020', 'nba_203995', 'EL', 0, 'roles-v1.1'),
+('EL_2021', 'nba_203995', 'EL', 0, 'roles-v1.1'),
+('EL_2022', 'nba_203995', 'EL', 0, 'roles-v1.1'),
+('NBA_2023', 'nba_203995', 'NBA', 1, 'roles-v1.1'),
+('NBA_2024', 'nba_203995', 'NBA', 1, 'roles-v1.1');
 INSERT INTO archetype_definitions ("model_version", "cluster", "n_members", "top_features", "exemplars", "stability_jaccard", "reportable") VALUES
-('roles-v1.0', 0, 2451, 'ast_pct+1.06, usg_pct+1.05, ast_per_75+0.95, reb_per_75-0.69', 'Allen Iverson, Michael Finley, Allen Iverson, Antoine Walker, Kobe Bryant', 0.548, 1),
-('roles-v1.0', 1, 1657, 'ast_per_75+1.34, ast_pct+1.19, tov_rate+1.17, reb_per_75-0.69', 'Lamar Odom, Eric Snow, Jason Terry, Monta Ellis, Deron Williams', 0.539, 1),
-('roles-v1.0', 2, 1862, 'clr_share_3pa-1.71, clr_share_fta+1.61, clr_share_2pa+1.60, reb_per_75+1.38', 'Dwight Howard, Ben Wallace, Dwight Howard, Dwight Howard, Ben Wallace', 0.525, 1),
-('roles-v1.0', 3, 1684, 'reb_per_75+0.98, clr_share_3pa-0.71, clr_share_2pa+0.71, clr_share_fta+0.63', 'Tim Duncan, Kevin Garnett, Shawn Marion, Anthony Mason, Shareef Abdur-Rahim', 0.424, 0),
-('roles-v1.0', 4, 4559, 'clr_share_3pa+0.63, clr_share_fta-0.60, clr_share_2pa-0.59, tov_rate-0.57', 'Shawn Marion, Antawn Jamison, Peja Stojakovic, Joe Johnson, Cuttino Mobley', 0.558, 1);
-INSERT INTO player_comps ("season_id", "person_id", "rank", "neighbour_person_id", "distance", "model_version") VALUES
-('EL_2022', 'nba_1626209', 7, 'nba_1627824', 1.28273, 'roles-v1.0'),
-('EL_2022', 'nba_1627735', 7, 'nba_203995', 1.44998, 'roles-v1.0'),
-('EL_2022', 'nba_1627824', 8, 'nba_1629740', 1.20719, 'roles-v1.0'),
-('EL_2022', 'nba_1627834', 2, 'nba_1629740', 1.18382, 'roles-v1.0'),
-('EL_2022', 'nba_1627834', 7, 'nba_1627824', 1.64968, 'roles-v1.0'),
-('EL_2022', 'nba_1629740', 8, 'nba_1627834', 1.18382, 'roles-v1.0'),
-('EL_2022', 'nba_1629740', 10, 'nba_1627824', 1.20719, 'roles-v1.0'),
-('EL_2022', 'nba_203995', 10, 'nba_1627735', 1.44998, 'roles-v1.0'),
-('EL_2020', 'nba_1626199', 7, 'nba_1627824', 1.95286, 'roles-v1.0'),
-('EL_2020', 'nba_1627098', 9, 'nba_203995', 1.35474, 'roles-v1.0'),
-('EL_2020', 'nba_1627733', 3, 'nba_1627824', 1.25358, 'roles-v1.0'),
-('EL_2020', 'nba_1627735', 7, 'nba_1627098', 2.00745, 'roles-v1.0'),
-('EL_2020', 'nba_1627790', 8, 'nba_1627816', 2.38845, 'roles-v1.0'),
-('EL_2020', 'nba_1627816', 2, 'nba_1627834', 1.24757, 'roles-v1.0'),
-('EL_2020', 'nba_1627824', 10, 'nba_1627733', 1.25358, 'roles-v1.0'),
-('EL_2020', 'nba_1627834', 1, 'nba_1627816', 1.24757, 'roles-v1.0'),
-('EL_2020', 'nba_203995', 3, 'nba_1627098', 1.35474, 'roles-v1.0'),
-('EL_2024', 'nba_1626147', 7, 'nba_1626224', 1.35388, 'roles-v1.0'),
-('EL_2024', 'nba_1626170', 5, 'nba_1626147', 1.55394, 'roles-v1.0'),
-('EL_2024', 'nba_1626224', 3, 'nba_1627823', 1.27993, 'roles-v1.0'),
-('EL_2024', 'nba_1626224', 5, 'nba_1626147', 1.35388, 'roles-v1.0'),
-('EL_2024', 'nba_1627823', 4, 'nba_1626224', 1.27993, 'roles-v1.0'),
-('EL_2024', 'nba_1629740', 9, 'nba_1627823', 1.73688, 'roles-v1.0'),
-('EL_2021', 'nba_1626209', 9, 'nba_1627824', 1.74301, 'roles-v1.0'),
-('EL_2021', 'nba_1627735', 6, 'nba_203995', 1.39645, 'roles-v1.0'),
-('EL_2021', 'nba_1627790', 1, 'nba_1627834', 1.91728, 'roles-v1.0'),
-('EL_2021', 'nba_1627834', 6, 'nba_1627790', 1.91728, 'roles-v1.0'),
-('EL_2021', 'nba_203995', 9, 'nba_1627735', 1.39645, 'roles-v1.0'),
-('NBA_2010', 'nba_101127', 9, 'nba_101198', 1.14098, 'roles-v1.0'),
-('NBA_2010', 'nba_101132', 3, 'nba_101141', 0.88257, 'roles-v1.0'),
-('NBA_2010', 'nba_101141', 2, 'nba_101132', 0.88257, 'roles-v1.0'),
-('NBA_2010', 'nba_101198', 10, 'nba_101127', 1.14098, 'roles-v1.0'),
-('NBA_2020', 'nba_1627756', 1, 'nba_1627789', 0.9309, 'roles-v1.0'),
-('NBA_2020', 'nba_1627756', 6, 'nba_1626224', 1.28706, 'roles-v1.0'),
-('NBA_2020', 'nba_1627756', 8, 'nba_1629740', 1.34793, 'roles-v1.0'),
-('NBA_2020', 'nba_1627789', 1, 'nba_1627756', 0.9309, 'roles-v1.0'),
-('NBA_2020', 'nba_1627789', 7, 'nba_1629740', 1.12077, 'roles-v1.0'),
-('NBA_2020', 'nba_1629740', 5, 'nba_1627789', 1.12077, 'roles-v1.0'),
-('NBA_2020', 'nba_1629740', 6, 'nba_1627756', 1.34793, 'roles-v1.0'),
-('NBA_2020', 'nba_1630267', 9, 'nba_1626169', 1.85579, 'roles-v1.0'),
-('NBA_2012', 'nba_101126', 9, 'nba_101127', 1.14494, 'roles-v1.0'),
-('NBA_2012', 'nba_101198', 7, 'nba_101127', 1.38201, 'roles-v1.0'),
-('NBA_2012', 'nba_101249', 4, 'nba_101187', 1.59014, 'roles-v1.0'),
-('GL_2018', 'nba_1626174', 7, 'nba_1627816', 2.234, 'roles-v1.0'),
-('GL_2021', 'nba_1626147', 4, 'nba_1627820', 1.42395, 'roles-v1.0'),
-('GL_2021', 'nba_1627820', 8, 'nba_1626147', 1.42395, 'roles-v1.0'),
-('GL_2015', 'nba_101249', 2, 'nba_1626188', 1.43966, 'roles-v1.0'),
-('GL_2015', 'nba_1626150', 5, 'nba_1626253', 1.09632, 'roles-v1.0'),
-('GL_2015', 'nba_1626150', 8, 'nba_1626188', 1.15115, 'roles-v1.0'),
-('GL_2015', 'nba_1626188', 5, 'nba_1626150', 1.15115, 'roles-v1.0'),
-('GL_2015', 'nba_1626253', 2, 'nba_1626150', 1.09632, 'roles-v1.0'),
-('GL_2016', 'nba_101198', 9, 'nba_1627735', 1.78879, 'roles-v1.0'),
-('GL_2016', 'nba_101198', 10, 'nba_1626188', 1.84792, 'roles-v1.0'),
-('GL_2016', 'nba_1626174', 7, 'nba_1627816', 1.62755, 'roles-v1.0'),
-('GL_2016', 'nba_1626188', 7, 'nba_1626253', 1.68383, 'roles-v1.0'),
-('GL_2016', 'nba_1626188', 9, 'nba_1627812', 1.71679, 'roles-v1.0'),
-('GL_2016', 'nba_1626253', 9, 'nba_1627846', 1.67425, 'roles-v1.0'),
-('GL_2016', 'nba_1627762', 4, 'nba_1627816', 1.82721, 'roles-v1.0'),
-('GL_2016', 'nba_1627767', 5, 'nba_1627834', 1.52044, 'roles-v1.0'),
-('GL_2016', 'nba_1627812', 10, 'nba_1626188', 1.71679, 'roles-v1.0'),
-('GL_2016', 'nba_1627834', 4, 'nba_1627767', 1.52044, 'roles-v1.0'),
-('GL_2016', 'nba_1627846', 8, 'nba_1626253', 1.67425, 'roles-v1.0'),
-('NBA_2016', 'nba_101141', 2, 'nba_1626147', 0.60196, 'roles-v1.0'),
-('NBA_2016', 'nba_1626147', 1, 'nba_101141', 0.60196, 'roles-v1.0'),
-('NBA_2016', 'nba_1626150', 6, 'nba_1627785', 0.95012, 'roles-v1.0'),
-('NBA_2016', 'nba_1626159', 4, 'nba_1626209', 2.00499, 'roles-v1.0'),
-('NBA_2016', 'nba_1626159', 9, 'nba_1626169', 2.1573, 'roles-v1.0'),
-('NBA_2016', 'nba_1626169', 1, 'nba_1626209', 0.92907, 'roles-v1.0'),
-('NBA_2016', 'nba_1626169', 3, 'nba_1627733', 1.38078, 'roles-v1.0'),
-('NBA_2016', 'nba_1626169', 9, 'nba_1627835', 1.62753, 'roles-v1.0'),
-('NBA_2016', 'nba_1626209', 2, 'nba_1626169', 0.92907, 'roles-v1.0'),
-('NBA_2016', 'nba_1627098', 1, 'nba_1627785', 1.00421, 'roles-v1.0'),
-('NBA_2016', 'nba_1627098', 2, 'nba_1626150', 1.0291, 'roles-v1.0'),
-('NBA_2016', 'nba_1627098', 6, 'nba_1627739', 1.26569, 'roles-v1.0'),
-('NBA_2016', 'nba_1627733', 1, 'nba_1626169', 1.38078, 'roles-v1.0'),
-('NBA_2016', 'nba_1627733', 2, 'nba_1627756', 1.45935, 'roles-v1.0'),
-('NBA_2016', 'nba_1627733', 4, 'nba_1626209', 1.62256, 'roles-v1.0'),
-('NBA_2016', 'nba_1627733', 5, 'nba_1627835', 1.81482, 'roles-v1.0'),
-('NBA_2016', 'nba_1627739', 4, 'nba_1627098', 1.26569, 'roles-v1.0'),
-('NBA_2016', 'nba_1627739', 5, 'nba_1627785', 1.38963, 'roles-v1.0'),
-('NBA_2016', 'nba_1627739', 9, 'nba_1626150', 1.85227, 'roles-v1.0'),
-('NBA_2016', 'nba_1627756', 3, 'nba_1627835', 1.3952, 'roles-v1.0'),
-('NBA_2016', 'nba_1627756', 4, 'nba_1627733', 1.45935, 'roles-v1.0'),
-('NBA_2016', 'nba_1627756', 10, 'nba_1626209', 1.61557, 'roles-v1.0'),
-('NBA_2016', 'nba_1627785', 4, 'nba_1626150', 0.95012, 'roles-v1.0'),
-('NBA_2016', 'nba_1627785', 6, 'nba_1627098', 1.00421, 'roles-v1.0'),
-('NBA_2021', 'nba_1627789', 8, 'nba_1627814', 0.80804, 'roles-v1.0'),
-('NBA_2021', 'nba_1627814', 4, 'nba_1627789', 0.80804, 'roles-v1.0'),
-('NBA_2018', 'nba_101141', 2, 'nba_1627748', 0.56821, 'roles-v1.0'),
-('NBA_2018', 'nba_1626159', 3, 'nba_1626166', 1.04369, 'roles-v1.0'),
-('NBA_2018', 'nba_1626161', 2, 'nba_1627790', 1.2044, 'roles-v1.0'),
-('NBA_2018', 'nba_1626166', 2, 'nba_1626159', 1.04369, 'roles-v1.0'),
-('NBA_2018', 'nba_1626166', 5, 'nba_1626170', 1.12368, 'roles-v1.0'),
-('NBA_2018', 'nba_1626169', 6, 'nba_1626209', 1.28798, 'roles-v1.0'),
-('NBA_2018', 'nba_1626169', 7, 'nba_1627733', 1.3432, 'roles-v1.0'),
-('NBA_2018', 'nba_1626170', 3, 'nba_1626166', 1.12368, 'roles-v1.0'),
-('NBA_2018', 'nba_1626203', 3, 'nba_1627789', 1.13192, 'roles-v1.0'),
-('NBA_2018', 'nba_1626209', 7, 'nba_1626169', 1.28798, 'roles-v1.0'),
-('NBA_2018', 'nba_1626246', 5, 'nba_1627767', 1.93343, 'roles-v1.0'),
-('NBA_2018', 'nba_1626246', 7, 'nba_1626195', 2.1233, 'roles-v1.0'),
-('NBA_2018', 'nba_1627733', 10, 'nba_1626169', 1.3432, 'roles-v1.0'),
-('NBA_2018', 'nba_1627739', 7, 'nba_1626166', 1.77447, 'roles-v1.0'),
-('NBA_2018', 'nba_1627739', 9, 'nba_1626159', 1.8402, 'roles-v1.0'),
-('NBA_2018', 'nba_1627748', 4, 'nba_101141', 0.56821, 'roles-v1.0'),
-('NBA_2018', 'nba_1627748', 6, 'nba_1627846', 0.61318, 'roles-v1.0'),
-('NBA_2018', 'nba_1627789', 5, 'nba_1627846', 0.96873, 'roles-v1.0'),
-('NBA_2018', 'nba_1627790', 7, 'nba_1626161', 1.2044, 'roles-v1.0'),
-('NBA_2018', 'nba_1627812', 9, 'nba_1626188', 1.16363, 'roles-v1.0'),
-('NBA_2018', 'nba_1627820', 7, 'nba_1626209', 2.1575, 'roles-v1.0'),
-('NBA_2018', 'nba_1627846', 3, 'nba_1627748', 0.61318, 'roles-v1.0'),
-('NBA_2018', 'nba_1627853', 7, 'nba_1627812', 1.41894, 'roles-v1.0'),
-('NBA_2017', 'nba_101127', 9, 'nba_1627739', 1.86034, 'roles-v1.0'),
-('NBA_2017', 'nba_101127', 10, 'nba_1627098', 1.88801, 'roles-v1.0'),
-('NBA_2017', 'nba_101141', 7, 'nba_1626209', 0.90558, 'roles-v1.0'),
-('NBA_2017', 'nba_1626147', 8, 'nba_1626163', 0.93883, 'roles-v1.0'),
-('NBA_2017', 'nba_1626159', 3, 'nba_1627820', 1.04933, 'roles-v1.0'),
-('NBA_2017', 'nba_1626159', 7, 'nba_1626169', 1.21776, 'roles-v1.0'),
-('NBA_2017', 'nba_1626166', 8, 'nba_1626170', 1.42073, 'roles-v1.0'),
-('NBA_2017', 'nba_1626169', 10, 'nba_1627789', 1.05408, 'roles-v1.0'),
-('NBA_2017', 'nba_1626170', 7, 'nba_1627098', 1.29881, 'roles-v1.0'),
-('NBA_2017', 'nba_1626170', 9, 'nba_1626150', 1.38714, 'roles-v1.0'),
-('NBA_2017', 'nba_1626170', 10, 'nba_1626166', 1.42073, 'roles-v1.0'),
-('NBA_2017', 'nba_1627098', 6, 'nba_1626150', 1.21091, 'roles-v1.0'),
-('NBA_2017', 'nba_1627098', 7, 'nba_1626170', 1.29881, 'roles-v1.0'),
-('NBA_2017', 'nba_1627748', 8, 'nba_1626169', 1.0915, 'roles-v1.0'),
-('NBA_2017', 'nba_1627775', 9, 'nba_1627835', 1.4659, 'roles-v1.0'),
-('NBA_2017', 'nba_1627789', 10, 'nba_1627812', 0.78361, 'roles-v1.0'),
-('NBA_2017', 'nba_1627812', 6, 'nba_1627789', 0.78361, 'roles-v1.0'),
-('NBA_2017', 'nba_1627820', 2, 'nba_1626159', 1.04933, 'roles-v1.0'),
-('NBA_2017', 'nba_1627835', 1, 'nba_1627846', 0.59559, 'roles-v1.0'),
-('NBA_2017', 'nba_1627835', 6, 'nba_1627775', 1.4659, 'roles-v1.0'),
-('NBA_2017', 'nba_1627835', 7, 'nba_1626169', 1.57084, 'roles-v1.0'),
-('NBA_2017', 'nba_1627846', 1, 'nba_1627835', 0.59559, 'roles-v1.0'),
-('NBA_2017', 'nba_1627846', 4, 'nba_1627775', 1.50193, 'roles-v1.0'),
-('NBA_2017', 'nba_1627846', 6, 'nba_1626159', 1.56499, 'roles-v1.0'),
-('NBA_2017', 'nba_1627846', 9, 'nba_1626169', 1.6991, 'roles-v1.0'),
-('EL_2019', 'nba_1627098', 1, 'nba_203995', 0.67771, 'roles-v1.0'),
-('EL_2019', 'nba_1627098', 5, 'nba_1630267', 1.84865, 'roles-v1.0'),
-('EL_2019', 'nba_1630267', 3, 'nba_1627098', 1.84865, 'roles-v1.0'),
-('EL_2019', 'nba_1630267', 5, 'nba_203995', 2.19515, 'roles-v1.0'),
-('EL_2019', 'nba_203995', 1, 'nba_1627098', 0.67771, 'roles-v1.0'),
-('EL_2017', 'nba_1626253', 5, 'nba_1629740', 1.01795, 'roles-v1.0'),
-('EL_2017', 'nba_1629740', 4, 'nba_1626253', 1.01795, 'roles-v1.0'),
-('EL_2017', 'nba_1630267', 1, 'nba_203995', 1.22568, 'roles-v1.0'),
-('EL_2017', 'nba_203995', 1, 'nba_1630267', 1.22568, 'roles-v1.0'),
-('GL_2017', 'nba_1626174', 8, 'nba_1627762', 1.92589, 'roles-v1.0'),
-('GL_2017', 'nba_1626199', 4, 'nba_1627785', 1.31307, 'roles-v1.0'),
-('GL_2017', 'nba_1627785', 2, 'nba_1626199', 1.31307, 'roles-v1.0'),
-('GL_2017', 'nba_1627785', 10, 'nba_1627820', 1.77727, 'roles-v1.0'),
-('GL_2017', 'nba_1627820', 4, 'nba_1627785', 1.77727, 'roles-v1.0'),
-('GL_2017', 'nba_1627820', 9, 'nba_1626199', 1.93418, 'roles-v1.0'),
-('EL_2018', 'nba_1626262', 3, 'nba_1629740', 1.1766, 'roles-v1.0'),
-('EL_2018', 'nba_1629740', 8, 'nba_1626262', 1.1766, 'roles-v1.0'),
-('EL_2018', 'nba_1630267', 1, 'nba_203995', 0.80953, 'roles-v1.0'),
-('EL_2018', 'nba_203995', 1, 'nba_1630267', 0.80953, 'roles-v1.0'),
-('EL_2023', 'nba_1626209', 6, 'nba_1626163', 1.53677, 'roles-v1.0'),
-('EL_2023', 'nba_1627762', 4, 'nba_1627834', 1.82841, 'roles-v1.0'),
-('EL_2023', 'nba_1627762', 6, 'nba_1627824', 1.93114, 'roles-v1.0'),
-('EL_2023', 'nba_1627789', 7, 'nba_1629740', 1.30046, 'roles-v1.0'),
-('EL_2023', 'nba_1627823', 5, 'nba_1629740', 2.03567, 'roles-v1.0'),
-('EL_2023', 'nba_1627824', 4, 'nba_1627834', 1.35292, 'roles-v1.0'),
-('EL_2023', 'nba_1627824', 8, 'nba_1627762', 1.93114, 'roles-v1.0'),
-('EL_2023', 'nba_1627834', 4, 'nba_1627824', 1.35292, 'roles-v1.0'),
-('EL_2023', 'nba_1629740', 8, 'nba_1627789', 1.30046, 'roles-v1.0'),
-('NBA_2023', 'nba_1627739', 8, 'nba_203995', 1.77577, 'roles-v1.0'),
-('NBA_2023', 'nba_203995', 6, 'nba_1627739', 1.77577, 'roles-v1.0'),
-('NBA_2011', 'nba_101126', 2, 'nba_101127', 0.96442, 'roles-v1.0'),
-('NBA_2011', 'nba_101127', 2, 'nba_101126', 0.96442, 'roles-v1.0'),
-('EL_2015', 'nba_1627098', 9, 'nba_1626643', 1.79889, 'roles-v1.0'),
-('EL_2014', 'nba_101212', 9, 'nba_1626246', 2.78515, 'roles-v1.0'),
-('EL_2014', 'nba_1626224', 6, 'nba_1627851', 1.13579, 'roles-v1.0'),
-('EL_2014', 'nba_1626246', 7, 'nba_101212', 2.78515, 'roles-v1.0'),
-('EL_2014', 'nba_1627851', 6, 'nba_1626224', 1.13579, 'roles-v1.0'),
-('NBA_2015', 'nba_101141', 2, 'nba_1626163', 0.6564, 'roles-v1.0'),
-('NBA_2015', 'nba_101141', 5, 'nba_1626147', 0.81298, 'roles-v1.0'),
-('NBA_2015', 'nba_1626147', 4, 'nba_1626163', 0.73442, 'roles-v1.0'),
-('NBA_2015', 'nba_1626147', 6, 'nba_101141', 0.81298, 'roles-v1.0'),
-('NBA_2015', 'nba_1626163', 3, 'nba_101141', 0.6564, 'roles-v1.0'),
-('NBA_2015', 'nba_1626163', 7, 'nba_1626147', 0.73442, 'roles-v1.0'),
-('NBA_2015', 'nba_1626166', 9, 'nba_1626170', 1.26778, 'roles-v1.0'),
-('NBA_2015', 'nba_1626170', 10, 'nba_1626166', 1.26778, 'roles-v1.0'),
-('EL_2009', 'nba_101132', 7, 'nba_101187', 3.02794, 'roles-v1.0'),
-('EL_2009', 'nba_101137', 4, 'nba_101187', 2.66572, 'roles-v1.0'),
-('EL_2009', 'nba_101187', 5, 'nba_101137', 2.66572, 'roles-v1.0'),
-('EL_2009', 'nba_101187', 7, 'nba_101132', 3.02794, 'roles-v1.0'),
-('NBA_2019', 'nba_1626163', 8, 'nba_1627814', 0.86308, 'roles-v1.0'),
-('NBA_2019', 'nba_1626224', 1, 'nba_1629740', 0.60902, 'roles-v1.0'),
-('NBA_2019', 'nba_1626224', 4, 'nba_1627814', 0.90271, 'roles-v1.0'),
-('NBA_2019', 'nba_1626224', 5, 'nba_1627853', 0.94107, 'roles-v1.0'),
-('NBA_2019', 'nba_1626224', 10, 'nba_1627846', 1.10231, 'roles-v1.0'),
-('NBA_2019', 'nba_1627775', 5, 'nba_1627853', 1.55999, 'roles-v1.0'),
-('NBA_2019', 'nba_1627789', 4, 'nba_1627846', 0.74819, 'roles-v1.0'),
-('NBA_2019', 'nba_1627814', 6, 'nba_1626163', 0.86308, 'roles-v1.0'),
-('NBA_2019', 'nba_1627814', 9, 'nba_1626224', 0.90271, 'roles-v1.0'),
-('NBA_2019', 'nba_1627846', 4, 'nba_1627789', 0.74819, 'roles-v1.0'),
-('NBA_2019', 'nba_1627846', 7, 'nba_1629740', 0.79665, 'roles-v1.0'),
-('NBA_2019', 'nba_1627853', 3, 'nba_1626224', 0.94107, 'roles-v1.0'),
-('NBA_2019', 'nba_1627853', 10, 'nba_1629740', 1.24014, 'roles-v1.0'),
-('NBA_2019', 'nba_1629740', 2, 'nba_1626224', 0.60902, 'roles-v1.0'),
-('NBA_2019', 'nba_1629740', 3, 'nba_1627846', 0.79665, 'roles-v1.0');
+('roles-v1.1', 0, 2451, 'ast_pct+1.06, usg_pct+1.05, ast_per_75+0.95, reb_per_75-0.69', 'Allen Iverson, Michael Finley, Allen Iverson, Antoine Walker, Kobe Bryant', 0.542, 1),
+('roles-v1.1', 1, 1657, 'ast_per_75+1.34, ast_pct+1.19, tov_rate+1.17, reb_per_75-0.69', 'Lamar Odom, Eric Snow, Jason Terry, Monta Ellis, Deron Williams', 0.53, 1),
+('roles-v1.1', 2, 1862, 'clr_share_3pa-1.71, clr_share_fta+1.61, clr_share_2pa+1.60, reb_per_75+1.38', 'Dwight Howard, Ben Wallace, Dwight Howard, Dwight Howard, Ben Wallace', 0.535, 1),
+('roles-v1.1', 3, 1684, 'reb_per_75+0.98, clr_share_3pa-0.71, clr_share_2pa+0.71, clr_share_fta+0.63', 'Tim Duncan, Kevin Garnett, Shawn Marion, Anthony Mason, Shareef Abdur-Rahim', 0.424, 0),
+('roles-v1.1', 4, 4559, 'clr_share_3pa+0.63, clr_share_fta-0.60, clr_share_2pa-0.59, tov_rate-0.57', 'Shawn Marion, Antawn Jamison, Peja Stojakovic, Joe Johnson, Cuttino Mobley', 0.555, 1);
+INSERT INTO player_comps ("scope", "season_id", "person_id", "rank", "neighbour_season_id", "neighbour_person_id", "distance", "model_version") VALUES
+('season', 'NBA_2011', 'nba_101126', 2, 'NBA_2011', 'nba_101127', 0.96442, 'roles-v1.1'),
+('season', 'NBA_2012', 'nba_101126', 9, 'NBA_2012', 'nba_101127', 1.14494, 'roles-v1.1'),
+('season', 'NBA_2010', 'nba_101127', 9, 'NBA_2010', 'nba_101198', 1.14098, 'roles-v1.1'),
+('season', 'NBA_2011', 'nba_101127', 2, 'NBA_2011', 'nba_101126', 0.96442, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_101127', 9, 'NBA_2017', 'nba_1627739', 1.86034, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_101127', 10, 'NBA_2017', 'nba_1627098', 1.88801, 'roles-v1.1'),
+('season', 'EL_2009', 'nba_101132', 7, 'EL_2009', 'nba_101187', 3.02794, 'roles-v1.1'),
+('season', 'NBA_2010', 'nba_101132', 3, 'NBA_2010', 'nba_101141', 0.88257, 'roles-v1.1'),
+('season', 'EL_2009', 'nba_101137', 4, 'EL_2009', 'nba_101187', 2.66572, 'roles-v1.1'),
+('season', 'NBA_2010', 'nba_101141', 2, 'NBA_2010', 'nba_101132', 0.88257, 'roles-v1.1'),
+('season', 'NBA_2015', 'nba_101141', 2, 'NBA_2015', 'nba_1626163', 0.6564, 'roles-v1.1'),
+('season', 'NBA_2015', 'nba_101141', 5, 'NBA_2015', 'nba_1626147', 0.81298, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_101141', 2, 'NBA_2016', 'nba_1626147', 0.60196, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_101141', 7, 'NBA_2017', 'nba_1626209', 0.90558, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_101141', 2, 'NBA_2018', 'nba_1627748', 0.56821, 'roles-v1.1'),
+('season', 'EL_2009', 'nba_101187', 5, 'EL_2009', 'nba_101137', 2.66572, 'roles-v1.1'),
+('season', 'EL_2009', 'nba_101187', 7, 'EL_2009', 'nba_101132', 3.02794, 'roles-v1.1'),
+('season', 'NBA_2010', 'nba_101198', 10, 'NBA_2010', 'nba_101127', 1.14098, 'roles-v1.1'),
+('season', 'NBA_2012', 'nba_101198', 7, 'NBA_2012', 'nba_101127', 1.38201, 'roles-v1.1'),
+('season', 'GL_2016', 'nba_101198', 9, 'GL_2016', 'nba_1627735', 1.78879, 'roles-v1.1'),
+('season', 'GL_2016', 'nba_101198', 10, 'GL_2016', 'nba_1626188', 1.84792, 'roles-v1.1'),
+('season', 'EL_2014', 'nba_101212', 9, 'EL_2014', 'nba_1626246', 2.78515, 'roles-v1.1'),
+('season', 'NBA_2012', 'nba_101249', 4, 'NBA_2012', 'nba_101187', 1.59014, 'roles-v1.1'),
+('season', 'GL_2015', 'nba_101249', 2, 'GL_2015', 'nba_1626188', 1.43966, 'roles-v1.1'),
+('season', 'NBA_2015', 'nba_1626147', 4, 'NBA_2015', 'nba_1626163', 0.73442, 'roles-v1.1'),
+('season', 'NBA_2015', 'nba_1626147', 6, 'NBA_2015', 'nba_101141', 0.81298, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1626147', 1, 'NBA_2016', 'nba_101141', 0.60196, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1626147', 8, 'NBA_2017', 'nba_1626163', 0.93883, 'roles-v1.1'),
+('season', 'GL_2021', 'nba_1626147', 4, 'GL_2021', 'nba_1627820', 1.42395, 'roles-v1.1'),
+('season', 'EL_2024', 'nba_1626147', 7, 'EL_2024', 'nba_1626224', 1.35388, 'roles-v1.1'),
+('season', 'GL_2015', 'nba_1626150', 5, 'GL_2015', 'nba_1626253', 1.09632, 'roles-v1.1'),
+('season', 'GL_2015', 'nba_1626150', 8, 'GL_2015', 'nba_1626188', 1.15115, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1626150', 6, 'NBA_2016', 'nba_1627785', 0.95012, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1626159', 4, 'NBA_2016', 'nba_1626209', 2.00499, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1626159', 9, 'NBA_2016', 'nba_1626169', 2.1573, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1626159', 3, 'NBA_2017', 'nba_1627820', 1.04933, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1626159', 7, 'NBA_2017', 'nba_1626169', 1.21776, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1626159', 3, 'NBA_2018', 'nba_1626166', 1.04369, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1626161', 2, 'NBA_2018', 'nba_1627790', 1.2044, 'roles-v1.1'),
+('season', 'NBA_2015', 'nba_1626163', 3, 'NBA_2015', 'nba_101141', 0.6564, 'roles-v1.1'),
+('season', 'NBA_2015', 'nba_1626163', 7, 'NBA_2015', 'nba_1626147', 0.73442, 'roles-v1.1'),
+('season', 'NBA_2019', 'nba_1626163', 8, 'NBA_2019', 'nba_1627814', 0.86308, 'roles-v1.1'),
+('season', 'NBA_2015', 'nba_1626166', 9, 'NBA_2015', 'nba_1626170', 1.26778, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1626166', 8, 'NBA_2017', 'nba_1626170', 1.42073, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1626166', 2, 'NBA_2018', 'nba_1626159', 1.04369, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1626166', 5, 'NBA_2018', 'nba_1626170', 1.12368, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1626169', 1, 'NBA_2016', 'nba_1626209', 0.92907, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1626169', 3, 'NBA_2016', 'nba_1627733', 1.38078, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1626169', 9, 'NBA_2016', 'nba_1627835', 1.62753, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1626169', 10, 'NBA_2017', 'nba_1627789', 1.05408, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1626169', 6, 'NBA_2018', 'nba_1626209', 1.28798, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1626169', 7, 'NBA_2018', 'nba_1627733', 1.3432, 'roles-v1.1'),
+('season', 'NBA_2015', 'nba_1626170', 10, 'NBA_2015', 'nba_1626166', 1.26778, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1626170', 7, 'NBA_2017', 'nba_1627098', 1.29881, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1626170', 9, 'NBA_2017', 'nba_1626150', 1.38714, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1626170', 10, 'NBA_2017', 'nba_1626166', 1.42073, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1626170', 3, 'NBA_2018', 'nba_1626166', 1.12368, 'roles-v1.1'),
+('season', 'EL_2024', 'nba_1626170', 5, 'EL_2024', 'nba_1626147', 1.55394, 'roles-v1.1'),
+('season', 'GL_2016', 'nba_1626174', 7, 'GL_2016', 'nba_1627816', 1.62755, 'roles-v1.1'),
+('season', 'GL_2017', 'nba_1626174', 8, 'GL_2017', 'nba_1627762', 1.92589, 'roles-v1.1'),
+('season', 'GL_2018', 'nba_1626174', 7, 'GL_2018', 'nba_1627816', 2.234, 'roles-v1.1'),
+('season', 'GL_2015', 'nba_1626188', 5, 'GL_2015', 'nba_1626150', 1.15115, 'roles-v1.1'),
+('season', 'GL_2016', 'nba_1626188', 7, 'GL_2016', 'nba_1626253', 1.68383, 'roles-v1.1'),
+('season', 'GL_2016', 'nba_1626188', 9, 'GL_2016', 'nba_1627812', 1.71679, 'roles-v1.1'),
+('season', 'GL_2017', 'nba_1626199', 4, 'GL_2017', 'nba_1627785', 1.31307, 'roles-v1.1'),
+('season', 'EL_2020', 'nba_1626199', 7, 'EL_2020', 'nba_1627824', 1.95286, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1626203', 3, 'NBA_2018', 'nba_1627789', 1.13192, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1626209', 2, 'NBA_2016', 'nba_1626169', 0.92907, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1626209', 7, 'NBA_2018', 'nba_1626169', 1.28798, 'roles-v1.1'),
+('season', 'EL_2021', 'nba_1626209', 9, 'EL_2021', 'nba_1627824', 1.74301, 'roles-v1.1'),
+('season', 'EL_2022', 'nba_1626209', 7, 'EL_2022', 'nba_1627824', 1.28273, 'roles-v1.1'),
+('season', 'EL_2023', 'nba_1626209', 6, 'EL_2023', 'nba_1626163', 1.53677, 'roles-v1.1'),
+('season', 'EL_2014', 'nba_1626224', 6, 'EL_2014', 'nba_1627851', 1.13579, 'roles-v1.1'),
+('season', 'NBA_2019', 'nba_1626224', 1, 'NBA_2019', 'nba_1629740', 0.60902, 'roles-v1.1'),
+('season', 'NBA_2019', 'nba_1626224', 4, 'NBA_2019', 'nba_1627814', 0.90271, 'roles-v1.1'),
+('season', 'NBA_2019', 'nba_1626224', 5, 'NBA_2019', 'nba_1627853', 0.94107, 'roles-v1.1'),
+('season', 'NBA_2019', 'nba_1626224', 10, 'NBA_2019', 'nba_1627846', 1.10231, 'roles-v1.1'),
+('season', 'EL_2024', 'nba_1626224', 3, 'EL_2024', 'nba_1627823', 1.27993, 'roles-v1.1'),
+('season', 'EL_2024', 'nba_1626224', 5, 'EL_2024', 'nba_1626147', 1.35388, 'roles-v1.1'),
+('season', 'EL_2014', 'nba_1626246', 7, 'EL_2014', 'nba_101212', 2.78515, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1626246', 5, 'NBA_2018', 'nba_1627767', 1.93343, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1626246', 7, 'NBA_2018', 'nba_1626195', 2.1233, 'roles-v1.1'),
+('season', 'GL_2015', 'nba_1626253', 2, 'GL_2015', 'nba_1626150', 1.09632, 'roles-v1.1'),
+('season', 'GL_2016', 'nba_1626253', 9, 'GL_2016', 'nba_1627846', 1.67425, 'roles-v1.1'),
+('season', 'EL_2017', 'nba_1626253', 5, 'EL_2017', 'nba_1629740', 1.01795, 'roles-v1.1'),
+('season', 'EL_2018', 'nba_1626262', 3, 'EL_2018', 'nba_1629740', 1.1766, 'roles-v1.1'),
+('season', 'EL_2015', 'nba_1627098', 9, 'EL_2015', 'nba_1626643', 1.79889, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1627098', 1, 'NBA_2016', 'nba_1627785', 1.00421, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1627098', 2, 'NBA_2016', 'nba_1626150', 1.0291, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1627098', 6, 'NBA_2016', 'nba_1627739', 1.26569, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1627098', 6, 'NBA_2017', 'nba_1626150', 1.21091, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1627098', 7, 'NBA_2017', 'nba_1626170', 1.29881, 'roles-v1.1'),
+('season', 'EL_2019', 'nba_1627098', 1, 'EL_2019', 'nba_203995', 0.67771, 'roles-v1.1'),
+('season', 'EL_2019', 'nba_1627098', 5, 'EL_2019', 'nba_1630267', 1.84865, 'roles-v1.1'),
+('season', 'EL_2020', 'nba_1627098', 9, 'EL_2020', 'nba_203995', 1.35474, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1627733', 1, 'NBA_2016', 'nba_1626169', 1.38078, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1627733', 2, 'NBA_2016', 'nba_1627756', 1.45935, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1627733', 4, 'NBA_2016', 'nba_1626209', 1.62256, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1627733', 5, 'NBA_2016', 'nba_1627835', 1.81482, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1627733', 10, 'NBA_2018', 'nba_1626169', 1.3432, 'roles-v1.1'),
+('season', 'EL_2020', 'nba_1627733', 3, 'EL_2020', 'nba_1627824', 1.25358, 'roles-v1.1'),
+('season', 'EL_2020', 'nba_1627735', 7, 'EL_2020', 'nba_1627098', 2.00745, 'roles-v1.1'),
+('season', 'EL_2021', 'nba_1627735', 6, 'EL_2021', 'nba_203995', 1.39645, 'roles-v1.1'),
+('season', 'EL_2022', 'nba_1627735', 7, 'EL_2022', 'nba_203995', 1.44998, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1627739', 4, 'NBA_2016', 'nba_1627098', 1.26569, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1627739', 5, 'NBA_2016', 'nba_1627785', 1.38963, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1627739', 9, 'NBA_2016', 'nba_1626150', 1.85227, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1627739', 7, 'NBA_2018', 'nba_1626166', 1.77447, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1627739', 9, 'NBA_2018', 'nba_1626159', 1.8402, 'roles-v1.1'),
+('season', 'NBA_2023', 'nba_1627739', 8, 'NBA_2023', 'nba_203995', 1.77577, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1627748', 8, 'NBA_2017', 'nba_1626169', 1.0915, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1627748', 4, 'NBA_2018', 'nba_101141', 0.56821, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1627748', 6, 'NBA_2018', 'nba_1627846', 0.61318, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1627756', 3, 'NBA_2016', 'nba_1627835', 1.3952, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1627756', 4, 'NBA_2016', 'nba_1627733', 1.45935, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1627756', 10, 'NBA_2016', 'nba_1626209', 1.61557, 'roles-v1.1'),
+('season', 'NBA_2020', 'nba_1627756', 1, 'NBA_2020', 'nba_1627789', 0.9309, 'roles-v1.1'),
+('season', 'NBA_2020', 'nba_1627756', 6, 'NBA_2020', 'nba_1626224', 1.28706, 'roles-v1.1'),
+('season', 'NBA_2020', 'nba_1627756', 8, 'NBA_2020', 'nba_1629740', 1.34793, 'roles-v1.1'),
+('season', 'GL_2016', 'nba_1627762', 4, 'GL_2016', 'nba_1627816', 1.82721, 'roles-v1.1'),
+('season', 'EL_2023', 'nba_1627762', 4, 'EL_2023', 'nba_1627834', 1.82841, 'roles-v1.1'),
+('season', 'EL_2023', 'nba_1627762', 6, 'EL_2023', 'nba_1627824', 1.93114, 'roles-v1.1'),
+('season', 'GL_2016', 'nba_1627767', 5, 'GL_2016', 'nba_1627834', 1.52044, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1627775', 9, 'NBA_2017', 'nba_1627835', 1.4659, 'roles-v1.1'),
+('season', 'NBA_2019', 'nba_1627775', 5, 'NBA_2019', 'nba_1627853', 1.55999, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1627785', 4, 'NBA_2016', 'nba_1626150', 0.95012, 'roles-v1.1'),
+('season', 'NBA_2016', 'nba_1627785', 6, 'NBA_2016', 'nba_1627098', 1.00421, 'roles-v1.1'),
+('season', 'GL_2017', 'nba_1627785', 2, 'GL_2017', 'nba_1626199', 1.31307, 'roles-v1.1'),
+('season', 'GL_2017', 'nba_1627785', 10, 'GL_2017', 'nba_1627820', 1.77727, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1627789', 10, 'NBA_2017', 'nba_1627812', 0.78361, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1627789', 5, 'NBA_2018', 'nba_1627846', 0.96873, 'roles-v1.1'),
+('season', 'NBA_2019', 'nba_1627789', 4, 'NBA_2019', 'nba_1627846', 0.74819, 'roles-v1.1'),
+('season', 'NBA_2020', 'nba_1627789', 1, 'NBA_2020', 'nba_1627756', 0.9309, 'roles-v1.1'),
+('season', 'NBA_2020', 'nba_1627789', 7, 'NBA_2020', 'nba_1629740', 1.12077, 'roles-v1.1'),
+('season', 'NBA_2021', 'nba_1627789', 8, 'NBA_2021', 'nba_1627814', 0.80804, 'roles-v1.1'),
+('season', 'EL_2023', 'nba_1627789', 7, 'EL_2023', 'nba_1629740', 1.30046, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1627790', 7, 'NBA_2018', 'nba_1626161', 1.2044, 'roles-v1.1'),
+('season', 'EL_2020', 'nba_1627790', 8, 'EL_2020', 'nba_1627816', 2.38845, 'roles-v1.1'),
+('season', 'EL_2021', 'nba_1627790', 1, 'EL_2021', 'nba_1627834', 1.91728, 'roles-v1.1'),
+('season', 'GL_2016', 'nba_1627812', 10, 'GL_2016', 'nba_1626188', 1.71679, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1627812', 6, 'NBA_2017', 'nba_1627789', 0.78361, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1627812', 9, 'NBA_2018', 'nba_1626188', 1.16363, 'roles-v1.1'),
+('season', 'NBA_2019', 'nba_1627814', 6, 'NBA_2019', 'nba_1626163', 0.86308, 'roles-v1.1'),
+('season', 'NBA_2019', 'nba_1627814', 9, 'NBA_2019', 'nba_1626224', 0.90271, 'roles-v1.1'),
+('season', 'NBA_2021', 'nba_1627814', 4, 'NBA_2021', 'nba_1627789', 0.80804, 'roles-v1.1'),
+('season', 'EL_2020', 'nba_1627816', 2, 'EL_2020', 'nba_1627834', 1.24757, 'roles-v1.1'),
+('season', 'GL_2017', 'nba_1627820', 4, 'GL_2017', 'nba_1627785', 1.77727, 'roles-v1.1'),
+('season', 'GL_2017', 'nba_1627820', 9, 'GL_2017', 'nba_1626199', 1.93418, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1627820', 2, 'NBA_2017', 'nba_1626159', 1.04933, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1627820', 7, 'NBA_2018', 'nba_1626209', 2.1575, 'roles-v1.1'),
+('season', 'GL_2021', 'nba_1627820', 8, 'GL_2021', 'nba_1626147', 1.42395, 'roles-v1.1'),
+('season', 'EL_2023', 'nba_1627823', 5, 'EL_2023', 'nba_1629740', 2.03567, 'roles-v1.1'),
+('season', 'EL_2024', 'nba_1627823', 4, 'EL_2024', 'nba_1626224', 1.27993, 'roles-v1.1'),
+('season', 'EL_2020', 'nba_1627824', 10, 'EL_2020', 'nba_1627733', 1.25358, 'roles-v1.1'),
+('season', 'EL_2022', 'nba_1627824', 8, 'EL_2022', 'nba_1629740', 1.20719, 'roles-v1.1'),
+('season', 'EL_2023', 'nba_1627824', 4, 'EL_2023', 'nba_1627834', 1.35292, 'roles-v1.1'),
+('season', 'EL_2023', 'nba_1627824', 8, 'EL_2023', 'nba_1627762', 1.93114, 'roles-v1.1'),
+('season', 'GL_2016', 'nba_1627834', 4, 'GL_2016', 'nba_1627767', 1.52044, 'roles-v1.1'),
+('season', 'EL_2020', 'nba_1627834', 1, 'EL_2020', 'nba_1627816', 1.24757, 'roles-v1.1'),
+('season', 'EL_2021', 'nba_1627834', 6, 'EL_2021', 'nba_1627790', 1.91728, 'roles-v1.1'),
+('season', 'EL_2022', 'nba_1627834', 2, 'EL_2022', 'nba_1629740', 1.18382, 'roles-v1.1'),
+('season', 'EL_2022', 'nba_1627834', 7, 'EL_2022', 'nba_1627824', 1.64968, 'roles-v1.1'),
+('season', 'EL_2023', 'nba_1627834', 4, 'EL_2023', 'nba_1627824', 1.35292, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1627835', 1, 'NBA_2017', 'nba_1627846', 0.59559, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1627835', 6, 'NBA_2017', 'nba_1627775', 1.4659, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1627835', 7, 'NBA_2017', 'nba_1626169', 1.57084, 'roles-v1.1'),
+('season', 'GL_2016', 'nba_1627846', 8, 'GL_2016', 'nba_1626253', 1.67425, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1627846', 1, 'NBA_2017', 'nba_1627835', 0.59559, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1627846', 4, 'NBA_2017', 'nba_1627775', 1.50193, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1627846', 6, 'NBA_2017', 'nba_1626159', 1.56499, 'roles-v1.1'),
+('season', 'NBA_2017', 'nba_1627846', 9, 'NBA_2017', 'nba_1626169', 1.6991, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1627846', 3, 'NBA_2018', 'nba_1627748', 0.61318, 'roles-v1.1'),
+('season', 'NBA_2019', 'nba_1627846', 4, 'NBA_2019', 'nba_1627789', 0.74819, 'roles-v1.1'),
+('season', 'NBA_2019', 'nba_1627846', 7, 'NBA_2019', 'nba_1629740', 0.79665, 'roles-v1.1'),
+('season', 'EL_2014', 'nba_1627851', 6, 'EL_2014', 'nba_1626224', 1.13579, 'roles-v1.1'),
+('season', 'NBA_2018', 'nba_1627853', 7, 'NBA_2018', 'nba_1627812', 1.41894, 'roles-v1.1'),
+('season', 'NBA_2019', 'nba_1627853', 3, 'NBA_2019', 'nba_1626224', 0.94107, 'roles-v1.1'),
+('season', 'NBA_2019', 'nba_1627853', 10, 'NBA_2019', 'nba_1629740', 1.24014, 'roles-v1.1'),
+('season', 'EL_2017', 'nba_1629740', 4, 'EL_2017', 'nba_1626253', 1.01795, 'roles-v1.1'),
+('season', 'EL_2018', 'nba_1629740', 8, 'EL_2018', 'nba_1626262', 1.1766, 'roles-v1.1'),
+('season', 'NBA_2019', 'nba_1629740', 2, 'NBA_2019', 'nba_1626224', 0.60902, 'roles-v1.1'),
+('season', 'NBA_2019', 'nba_1629740', 3, 'NBA_2019', 'nba_1627846', 0.79665, 'roles-v1.1'),
+('season', 'NBA_2020', 'nba_1629740', 5, 'NBA_2020', 'nba_1627789', 1.12077, 'roles-v1.1'),
+('season', 'NBA_2020', 'nba_1629740', 6, 'NBA_2020', 'nba_1627756', 1.34793, 'roles-v1.1'),
+('season', 'EL_2022', 'nba_1629740', 8, 'EL_2022', 'nba_1627834', 1.18382, 'roles-v1.1'),
+('season', 'EL_2022', 'nba_1629740', 10, 'EL_2022', 'nba_1627824', 1.20719, 'roles-v1.1'),
+('season', 'EL_2023', 'nba_1629740', 8, 'EL_2023', 'nba_1627789', 1.30046, 'roles-v1.1'),
+('season', 'EL_2024', 'nba_1629740', 9, 'EL_2024', 'nba_1627823', 1.73688, 'roles-v1.1'),
+('season', 'EL_2017', 'nba_1630267', 1, 'EL_2017', 'nba_203995', 1.22568, 'roles-v1.1'),
+('season', 'EL_2018', 'nba_1630267', 1, 'EL_2018', 'nba_203995', 0.80953, 'roles-v1.1'),
+('season', 'EL_2019', 'nba_1630267', 3, 'EL_2019', 'nba_1627098', 1.84865, 'roles-v1.1'),
+('season', 'EL_2019', 'nba_1630267', 5, 'EL_2019', 'nba_203995', 2.19515, 'roles-v1.1'),
+('season', 'NBA_2020', 'nba_1630267', 9, 'NBA_2020', 'nba_1626169', 1.85579, 'roles-v1.1'),
+('season', 'EL_2017', 'nba_203995', 1, 'EL_2017', 'nba_1630267', 1.22568, 'roles-v1.1'),
+('season', 'EL_2018', 'nba_203995', 1, 'EL_2018', 'nba_1630267', 0.80953, 'roles-v1.1'),
+('season', 'EL_2019', 'nba_203995', 1, 'EL_2019', 'nba_1627098', 0.67771, 'roles-v1.1'),
+('season', 'EL_2020', 'nba_203995', 3, 'EL_2020', 'nba_1627098', 1.35474, 'roles-v1.1'),
+('season', 'EL_2021', 'nba_203995', 9, 'EL_2021', 'nba_1627735', 1.39645, 'roles-v1.1'),
+('season', 'EL_2022', 'nba_203995', 10, 'EL_2022', 'nba_1627735', 1.44998, 'roles-v1.1'),
+('season', 'NBA_2023', 'nba_203995', 6, 'NBA_2023', 'nba_1627739', 1.77577, 'roles-v1.1'),
+('era', 'NBA_2014', 'nba_101126', 7, 'NBA_2015', 'nba_1626166', 1.38683, 'roles-v1.1'),
+('era', 'NBA_2012', 'nba_101127', 6, 'NBA_2010', 'nba_101198', 0.70323, 'roles-v1.1'),
+('era', 'NBA_2015', 'nba_101127', 8, 'NBA_2013', 'nba_101198', 0.85144, 'roles-v1.1'),
+('era', 'NBA_2015', 'nba_101127', 10, 'GL_2016', 'nba_1627735', 0.88885, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_101127', 5, 'EL_2017', 'nba_203995', 0.9797, 'roles-v1.1'),
+('era', 'NBA_2015', 'nba_101141', 6, 'NBA_2016', 'nba_1627748', 0.62737, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_101141', 7, 'NBA_2016', 'nba_1626147', 0.60196, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_101141', 10, 'EL_2014', 'nba_1627851', 0.63987, 'roles-v1.1'),
+('era', 'NBA_2018', 'nba_101141', 7, 'NBA_2019', 'nba_1627823', 0.54824, 'roles-v1.1'),
+('era', 'NBA_2018', 'nba_101141', 8, 'NBA_2018', 'nba_1627748', 0.56821, 'roles-v1.1'),
+('era', 'NBA_2019', 'nba_101141', 8, 'EL_2018', 'nba_1627851', 0.72459, 'roles-v1.1'),
+('era', 'EL_2013', 'nba_101146', 2, 'NBA_2013', 'nba_101249', 1.49377, 'roles-v1.1'),
+('era', 'EL_2013', 'nba_101146', 8, 'NBA_2014', 'nba_101126', 1.79075, 'roles-v1.1'),
+('era', 'NBA_2010', 'nba_101198', 4, 'NBA_2012', 'nba_101127', 0.70323, 'roles-v1.1'),
+('era', 'NBA_2010', 'nba_101198', 9, 'NBA_2011', 'nba_101127', 0.84422, 'roles-v1.1'),
+('era', 'NBA_2013', 'nba_101198', 5, 'NBA_2015', 'nba_101127', 0.85144, 'roles-v1.1'),
+('era', 'NBA_2011', 'nba_101249', 6, 'NBA_2009', 'nba_101126', 0.91317, 'roles-v1.1'),
+('era', 'NBA_2013', 'nba_101249', 7, 'EL_2013', 'nba_101146', 1.49377, 'roles-v1.1'),
+('era', 'GL_2015', 'nba_101249', 3, 'GL_2016', 'nba_1627812', 0.98777, 'roles-v1.1'),
+('era', 'GL_2015', 'nba_101249', 6, 'NBA_2013', 'nba_101126', 1.0798, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1626147', 2, 'NBA_2017', 'nba_1626209', 0.41892, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1626147', 8, 'NBA_2016', 'nba_101141', 0.60196, 'roles-v1.1'),
+('era', 'GL_2019', 'nba_1626147', 1, 'NBA_2018', 'nba_1626163', 0.30726, 'roles-v1.1'),
+('era', 'GL_2022', 'nba_1626147', 6, 'GL_2021', 'nba_1627820', 0.62657, 'roles-v1.1'),
+('era', 'GL_2015', 'nba_1626150', 2, 'EL_2013', 'nba_1627098', 0.41168, 'roles-v1.1'),
+('era', 'GL_2015', 'nba_1626150', 4, 'EL_2015', 'nba_1627098', 0.58723, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1626150', 1, 'NBA_2018', 'nba_1626166', 0.45974, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1626150', 2, 'NBA_2015', 'nba_1626170', 0.574, 'roles-v1.1'),
+('era', 'GL_2019', 'nba_1626150', 3, 'EL_2020', 'nba_203995', 0.41475, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1626159', 7, 'NBA_2018', 'nba_1627820', 1.70833, 'roles-v1.1'),
+('era', 'NBA_2020', 'nba_1626159', 6, 'NBA_2018', 'nba_1627820', 1.92038, 'roles-v1.1'),
+('era', 'NBA_2019', 'nba_1626161', 5, 'NBA_2018', 'nba_1627790', 0.95332, 'roles-v1.1'),
+('era', 'NBA_2018', 'nba_1626163', 1, 'GL_2019', 'nba_1626147', 0.30726, 'roles-v1.1'),
+('era', 'GL_2024', 'nba_1626163', 10, 'EL_2023', 'nba_1627789', 0.77296, 'roles-v1.1'),
+('era', 'NBA_2018', 'nba_1626166', 1, 'NBA_2017', 'nba_1627098', 0.41787, 'roles-v1.1'),
+('era', 'NBA_2018', 'nba_1626166', 3, 'NBA_2016', 'nba_1626150', 0.45974, 'roles-v1.1'),
+('era', 'NBA_2021', 'nba_1626166', 5, 'GL_2022', 'nba_1626208', 0.74275, 'roles-v1.1'),
+('era', 'NBA_2022', 'nba_1626166', 6, 'GL_2022', 'nba_1626208', 0.73044, 'roles-v1.1'),
+('era', 'NBA_2015', 'nba_1626169', 2, 'NBA_2016', 'nba_1626209', 0.48532, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1626169', 1, 'NBA_2017', 'nba_1627835', 0.67025, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1626169', 2, 'NBA_2017', 'nba_1627846', 0.71547, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1626169', 3, 'NBA_2016', 'nba_1626209', 0.92907, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1626169', 9, 'NBA_2017', 'nba_1627775', 1.09294, 'roles-v1.1'),
+('era', 'NBA_2018', 'nba_1626169', 6, 'NBA_2016', 'nba_1626209', 0.7202, 'roles-v1.1'),
+('era', 'NBA_2015', 'nba_1626170', 4, 'NBA_2016', 'nba_1626150', 0.574, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1626170', 8, 'NBA_2017', 'nba_1626188', 0.61752, 'roles-v1.1'),
+('era', 'NBA_2018', 'nba_1626170', 3, 'NBA_2020', 'nba_1630267', 0.76491, 'roles-v1.1'),
+('era', 'NBA_2018', 'nba_1626170', 7, 'NBA_2017', 'nba_1627098', 0.91076, 'roles-v1.1'),
+('era', 'NBA_2023', 'nba_1626174', 9, 'EL_2022', 'nba_1629740', 0.90789, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1626188', 7, 'NBA_2016', 'nba_1626170', 0.61752, 'roles-v1.1'),
+('era', 'NBA_2019', 'nba_1626188', 4, 'NBA_2020', 'nba_1626224', 0.52144, 'roles-v1.1'),
+('era', 'NBA_2020', 'nba_1626195', 10, 'EL_2020', 'nba_1627816', 1.02308, 'roles-v1.1'),
+('era', 'GL_2017', 'nba_1626199', 5, 'EL_2017', 'nba_1629029', 0.70671, 'roles-v1.1'),
+('era', 'GL_2017', 'nba_1626199', 9, 'GL_2016', 'nba_1627846', 0.8031, 'roles-v1.1'),
+('era', 'EL_2019', 'nba_1626199', 10, 'NBA_2017', 'nba_1626209', 0.69122, 'roles-v1.1'),
+('era', 'NBA_2019', 'nba_1626203', 2, 'NBA_2020', 'nba_1629740', 0.50307, 'roles-v1.1'),
+('era', 'NBA_2019', 'nba_1626203', 10, 'NBA_2017', 'nba_1626169', 0.86994, 'roles-v1.1'),
+('era', 'GL_2022', 'nba_1626208', 3, 'NBA_2022', 'nba_1626166', 0.73044, 'roles-v1.1'),
+('era', 'GL_2022', 'nba_1626208', 4, 'NBA_2021', 'nba_1626166', 0.74275, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1626209', 2, 'NBA_2015', 'nba_1626169', 0.48532, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1626209', 4, 'NBA_2018', 'nba_1626169', 0.7202, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1626209', 5, 'NBA_2017', 'nba_1627835', 0.83651, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1626209', 8, 'NBA_2017', 'nba_1627846', 0.92702, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1626209', 10, 'NBA_2016', 'nba_1626169', 0.92907, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1626209', 3, 'NBA_2016', 'nba_1626147', 0.41892, 'roles-v1.1'),
+('era', 'NBA_2019', 'nba_1626209', 5, 'NBA_2018', 'nba_1627733', 0.76594, 'roles-v1.1'),
+('era', 'EL_2014', 'nba_1626224', 10, 'NBA_2015', 'nba_1626163', 0.6764, 'roles-v1.1'),
+('era', 'EL_2016', 'nba_1626224', 2, 'NBA_2018', 'nba_1627789', 0.58609, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1626224', 4, 'NBA_2019', 'nba_1627846', 0.53197, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1626224', 7, 'EL_2017', 'nba_1629740', 0.57561, 'roles-v1.1'),
+('era', 'NBA_2018', 'nba_1626224', 3, 'NBA_2019', 'nba_1627814', 0.3351, 'roles-v1.1'),
+('era', 'NBA_2018', 'nba_1626224', 7, 'NBA_2016', 'nba_1627851', 0.44052, 'roles-v1.1'),
+('era', 'NBA_2020', 'nba_1626224', 5, 'NBA_2019', 'nba_1626188', 0.52144, 'roles-v1.1'),
+('era', 'EL_2018', 'nba_1626262', 6, 'NBA_2017', 'nba_1627748', 0.75798, 'roles-v1.1'),
+('era', 'EL_2013', 'nba_1627098', 1, 'GL_2015', 'nba_1626150', 0.41168, 'roles-v1.1'),
+('era', 'EL_2015', 'nba_1627098', 3, 'GL_2015', 'nba_1626150', 0.58723, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1627098', 1, 'NBA_2018', 'nba_1626166', 0.41787, 'roles-v1.1'),
+('era', 'EL_2019', 'nba_1627098', 2, 'EL_2019', 'nba_203995', 0.67771, 'roles-v1.1'),
+('era', 'EL_2019', 'nba_1627098', 3, 'EL_2018', 'nba_203995', 0.68508, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1627733', 1, 'NBA_2017', 'nba_1627835', 0.99615, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1627733', 8, 'NBA_2017', 'nba_1627846', 1.36723, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1627733', 9, 'NBA_2016', 'nba_1626169', 1.38078, 'roles-v1.1'),
+('era', 'NBA_2018', 'nba_1627733', 8, 'NBA_2019', 'nba_1626209', 0.76594, 'roles-v1.1'),
+('era', 'EL_2020', 'nba_1627733', 4, 'EL_2022', 'nba_1629740', 0.58991, 'roles-v1.1'),
+('era', 'GL_2016', 'nba_1627735', 10, 'NBA_2015', 'nba_101127', 0.88885, 'roles-v1.1'),
+('era', 'EL_2020', 'nba_1627735', 7, 'GL_2018', 'nba_1627785', 1.07878, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1627748', 7, 'NBA_2019', 'nba_1627823', 0.73628, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1627748', 8, 'EL_2018', 'nba_1626262', 0.75798, 'roles-v1.1'),
+('era', 'NBA_2020', 'nba_1627756', 5, 'NBA_2020', 'nba_1627789', 0.9309, 'roles-v1.1'),
+('era', 'GL_2016', 'nba_1627762', 9, 'NBA_2018', 'nba_1626195', 1.35083, 'roles-v1.1'),
+('era', 'NBA_2018', 'nba_1627789', 2, 'EL_2016', 'nba_1626224', 0.58609, 'roles-v1.1'),
+('era', 'GL_2016', 'nba_1627812', 8, 'GL_2015', 'nba_101249', 0.98777, 'roles-v1.1'),
+('era', 'NBA_2018', 'nba_1627812', 7, 'NBA_2016', 'nba_1626170', 0.69048, 'roles-v1.1'),
+('era', 'GL_2017', 'nba_1627814', 8, 'NBA_2018', 'nba_1626163', 0.72249, 'roles-v1.1'),
+('era', 'NBA_2019', 'nba_1627814', 1, 'NBA_2018', 'nba_1626224', 0.3351, 'roles-v1.1'),
+('era', 'EL_2020', 'nba_1627816', 9, 'NBA_2020', 'nba_1626195', 1.02308, 'roles-v1.1'),
+('era', 'GL_2017', 'nba_1627820', 9, 'GL_2019', 'nba_101127', 1.26373, 'roles-v1.1'),
+('era', 'GL_2021', 'nba_1627820', 4, 'GL_2022', 'nba_1626147', 0.62657, 'roles-v1.1'),
+('era', 'GL_2021', 'nba_1627822', 4, 'NBA_2021', 'nba_1626174', 0.88715, 'roles-v1.1'),
+('era', 'GL_2021', 'nba_1627822', 9, 'NBA_2022', 'nba_1626174', 1.07502, 'roles-v1.1'),
+('era', 'NBA_2019', 'nba_1627823', 7, 'NBA_2018', 'nba_101141', 0.54824, 'roles-v1.1'),
+('era', 'NBA_2019', 'nba_1627823', 8, 'NBA_2018', 'nba_1627748', 0.56963, 'roles-v1.1'),
+('era', 'NBA_2024', 'nba_1627824', 8, 'NBA_2022', 'nba_1627814', 0.68207, 'roles-v1.1'),
+('era', 'EL_2022', 'nba_1627834', 8, 'EL_2021', 'nba_1629740', 0.80446, 'roles-v1.1'),
+('era', 'EL_2023', 'nba_1627834', 7, 'NBA_2024', 'nba_1627824', 0.85141, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1627835', 8, 'EL_2018', 'nba_1629740', 0.67711, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1627835', 1, 'NBA_2017', 'nba_1627846', 0.59559, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1627835', 2, 'NBA_2016', 'nba_1626169', 0.67025, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1627835', 4, 'NBA_2016', 'nba_1626209', 0.83651, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1627835', 9, 'NBA_2016', 'nba_1627733', 0.99615, 'roles-v1.1'),
+('era', 'GL_2016', 'nba_1627846', 1, 'EL_2017', 'nba_1629029', 0.59346, 'roles-v1.1'),
+('era', 'GL_2016', 'nba_1627846', 5, 'GL_2017', 'nba_1626199', 0.8031, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1627846', 1, 'NBA_2017', 'nba_1627835', 0.59559, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1627846', 2, 'NBA_2016', 'nba_1626169', 0.71547, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1627846', 7, 'NBA_2016', 'nba_1626209', 0.92702, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1627846', 9, 'NBA_2018', 'nba_1626169', 0.96464, 'roles-v1.1'),
+('era', 'NBA_2017', 'nba_1627846', 10, 'NBA_2015', 'nba_1626169', 0.9845, 'roles-v1.1'),
+('era', 'NBA_2018', 'nba_1627846', 7, 'NBA_2018', 'nba_1627748', 0.61318, 'roles-v1.1'),
+('era', 'NBA_2019', 'nba_1627846', 4, 'NBA_2017', 'nba_1626224', 0.53197, 'roles-v1.1'),
+('era', 'EL_2014', 'nba_1627851', 9, 'NBA_2016', 'nba_101141', 0.63987, 'roles-v1.1'),
+('era', 'NBA_2016', 'nba_1627851', 3, 'NBA_2018', 'nba_1626224', 0.44052, 'roles-v1.1'),
+('era', 'GL_2017', 'nba_1627853', 9, 'EL_2019', 'nba_1627098', 1.31069, 'roles-v1.1'),
+('era', 'NBA_2018', 'nba_1627853', 7, 'NBA_2016', 'nba_1626170', 0.96774, 'roles-v1.1'),
+('era', 'EL_2017', 'nba_1629029', 2, 'GL_2016', 'nba_1627846', 0.59346, 'roles-v1.1'),
+('era', 'EL_2017', 'nba_1629029', 3, 'GL_2017', 'nba_1626199', 0.70671, 'roles-v1.1'),
+('era', 'EL_2017', 'nba_1629740', 5, 'NBA_2017', 'nba_1626224', 0.57561, 'roles-v1.1'),
+('era', 'NBA_2020', 'nba_1629740', 1, 'NBA_2019', 'nba_1626203', 0.50307, 'roles-v1.1'),
+('era', 'EL_2021', 'nba_1629740', 9, 'EL_2022', 'nba_1627834', 0.80446, 'roles-v1.1'),
+('era', 'EL_2022', 'nba_1629740', 7, 'EL_2020', 'nba_1627733', 0.58991, 'roles-v1.1'),
+('era', 'EL_2018', 'nba_1630267', 7, 'EL_2018', 'nba_203995', 0.80953, 'roles-v1.1'),
+('era', 'NBA_2020', 'nba_1630267', 2, 'NBA_2018', 'nba_1626170', 0.76491, 'roles-v1.1'),
+('era', 'EL_2018', 'nba_203995', 4, 'EL_2019', 'nba_1627098', 0.68508, 'roles-v1.1'),
+('era', 'EL_2018', 'nba_203995', 8, 'EL_2018', 'nba_1630267', 0.80953, 'roles-v1.1'),
+('era', 'EL_2019', 'nba_203995', 2, 'EL_2019', 'nba_1627098', 0.67771, 'roles-v1.1'),
+('era', 'EL_2019', 'nba_203995', 10, 'NBA_2020', 'nba_1626166', 0.87222, 'roles-v1.1'),
+('era', 'EL_2020', 'nba_203995', 3, 'GL_2019', 'nba_1626150', 0.41475, 'roles-v1.1'),
+('all', 'NBA_2012', 'nba_101126', 5, 'GL_2015', 'nba_1626188', 0.5167, 'roles-v1.1'),
+('all', 'NBA_2012', 'nba_101127', 2, 'NBA_2020', 'nba_1626166', 0.36657, 'roles-v1.1'),
+('all', 'NBA_2013', 'nba_101127', 3, 'EL_2009', 'nba_101137', 0.43335, 'roles-v1.1'),
+('all', 'NBA_2014', 'nba_101127', 8, 'EL_2007', 'nba_101198', 0.60291, 'roles-v1.1'),
+('all', 'GL_2019', 'nba_101127', 9, 'NBA_2008', 'nba_101198', 0.97905, 'roles-v1.1'),
+('all', 'NBA_2010', 'nba_101132', 3, 'NBA_2006', 'nba_101141', 0.457, 'roles-v1.1'),
+('all', 'NBA_2005', 'nba_101137', 5, 'NBA_2024', 'nba_1627739', 0.58048, 'roles-v1.1'),
+('all', 'NBA_2006', 'nba_101137', 3, 'NBA_2018', 'nba_1626170', 0.57885, 'roles-v1.1'),
+('all', 'EL_2009', 'nba_101137', 3, 'NBA_2013', 'nba_101127', 0.43335, 'roles-v1.1'),
+('all', 'EL_2009', 'nba_101137', 8, 'NBA_2018', 'nba_1626166', 0.53816, 'roles-v1.1'),
+('all', 'NBA_2006', 'nba_101141', 6, 'NBA_2010', 'nba_101132', 0.457, 'roles-v1.1'),
+('all', 'NBA_2009', 'nba_101141', 7, 'EL_2024', 'nba_1626209', 0.57428, 'roles-v1.1'),
+('all', 'NBA_2010', 'nba_101141', 10, 'EL_2020', 'nba_1627824', 0.5549, 'roles-v1.1'),
+('all', 'NBA_2012', 'nba_101141', 9, 'EL_2023', 'nba_1626209', 0.51996, 'roles-v1.1'),
+('all', 'NBA_2015', 'nba_101141', 3, 'NBA_2020', 'nba_1627823', 0.36063, 'roles-v1.1'),
+('all', 'NBA_2019', 'nba_101141', 2, 'EL_2024', 'nba_1627823', 0.43217, 'roles-v1.1'),
+('all', 'EL_2007', 'nba_101146', 10, 'NBA_2019', 'nba_1627812', 0.46617, 'roles-v1.1'),
+('all', 'NBA_2013', 'nba_101187', 3, 'NBA_2021', 'nba_1627789', 0.34578, 'roles-v1.1'),
+('all', 'EL_2007', 'nba_101198', 7, 'NBA_2014', 'nba_101127', 0.60291, 'roles-v1.1'),
+('all', 'NBA_2009', 'nba_101198', 8, 'NBA_2017', 'nba_1626170', 0.62649, 'roles-v1.1'),
+('all', 'NBA_2010', 'nba_101198', 10, 'NBA_2017', 'nba_1626170', 0.59845, 'roles-v1.1'),
+('all', 'NBA_2011', 'nba_101198', 7, 'EL_2024', 'nba_1627735', 0.62196, 'roles-v1.1'),
+('all', 'NBA_2015', 'nba_1626147', 1, 'NBA_2018', 'nba_1627748', 0.25258, 'roles-v1.1'),
+('all', 'NBA_2016', 'nba_1626147', 9, 'NBA_2017', 'nba_1626209', 0.41892, 'roles-v1.1'),
+('all', 'GL_2019', 'nba_1626147', 1, 'NBA_2018', 'nba_1626163', 0.30726, 'roles-v1.1'),
+('all', 'GL_2015', 'nba_1626150', 5, 'EL_2013', 'nba_1627098', 0.41168, 'roles-v1.1'),
+('all', 'GL_2015', 'nba_1626150', 6, 'EL_2020', 'nba_203995', 0.42478, 'roles-v1.1'),
+('all', 'NBA_2016', 'nba_1626150', 2, 'NBA_2018', 'nba_1626166', 0.45974, 'roles-v1.1'),
+('all', 'NBA_2016', 'nba_1626150', 9, 'NBA_2015', 'nba_1626170', 0.574, 'roles-v1.1'),
+('all', 'GL_2019', 'nba_1626150', 3, 'EL_2020', 'nba_203995', 0.41475, 'roles-v1.1'),
+('all', 'NBA_2016', 'nba_1626159', 10, 'EL_2013', 'nba_101146', 1.45116, 'roles-v1.1'),
+('all', 'NBA_2022', 'nba_1626159', 2, 'GL_2016', 'nba_1627858', 0.81474, 'roles-v1.1'),
+('all', 'NBA_2019', 'nba_1626161', 9, 'NBA_2018', 'nba_1627790', 0.95332, 'roles-v1.1'),
+('all', 'NBA_2018', 'nba_1626163', 1, 'GL_2019', 'nba_1626147', 0.30726, 'roles-v1.1'),
+('all', 'EL_2023', 'nba_1626163', 9, 'GL_2018', 'nba_1627814', 0.53368, 'roles-v1.1'),
+('all', 'NBA_2018', 'nba_1626166', 3, 'NBA_2017', 'nba_1627098', 0.41787, 'roles-v1.1'),
+('all', 'NBA_2018', 'nba_1626166', 6, 'NBA_2016', 'nba_1626150', 0.45974, 'roles-v1.1'),
+('all', 'NBA_2020', 'nba_1626166', 2, 'NBA_2012', 'nba_101127', 0.36657, 'roles-v1.1'),
+('all', 'NBA_2015', 'nba_1626169', 3, 'NBA_2016', 'nba_1626209', 0.48532, 'roles-v1.1'),
+('all', 'NBA_2015', 'nba_1626169', 4, 'EL_2024', 'nba_1627789', 0.51854, 'roles-v1.1'),
+('all', 'NBA_2016', 'nba_1626169', 3, 'NBA_2017', 'nba_1627835', 0.67025, 'roles-v1.1'),
+('all', 'NBA_2016', 'nba_1626169', 5, 'NBA_2017', 'nba_1627846', 0.71547, 'roles-v1.1'),
+('all', 'GL_2023', 'nba_1626169', 1, 'GL_2017', 'nba_1627814', 0.2638, 'roles-v1.1'),
+('all', 'GL_2023', 'nba_1626169', 9, 'NBA_2018', 'nba_1626163', 0.59585, 'roles-v1.1'),
+('all', 'GL_2024', 'nba_1626169', 6, 'NBA_2018', 'nba_1626159', 0.61875, 'roles-v1.1'),
+('all', 'NBA_2015', 'nba_1626170', 8, 'NBA_2016', 'nba_1626150', 0.574, 'roles-v1.1'),
+('all', 'NBA_2015', 'nba_1626170', 10, 'NBA_2018', 'nba_1626166', 0.60695, 'roles-v1.1'),
+('all', 'NBA_2017', 'nba_1626170', 8, 'NBA_2010', 'nba_101198', 0.59845, 'roles-v1.1'),
+('all', 'NBA_2018', 'nba_1626170', 4, 'NBA_2006', 'nba_101137', 0.57885, 'roles-v1.1'),
+('all', 'NBA_2018', 'nba_1626170', 8, 'NBA_2021', 'nba_1630267', 0.66301, 'roles-v1.1'),
+('all', 'EL_2023', 'nba_1626170', 4, 'NBA_2018', 'nba_1627853', 0.74545, 'roles-v1.1'),
+('all', 'GL_2015', 'nba_1626188', 5, 'NBA_2012', 'nba_101126', 0.5167, 'roles-v1.1'),
+('all', 'NBA_2018', 'nba_1626188', 1, 'NBA_2021', 'nba_1626224', 0.28448, 'roles-v1.1'),
+('all', 'EL_2024', 'nba_1626195', 6, 'NBA_2017', 'nba_1627767', 0.74004, 'roles-v1.1'),
+('all', 'GL_2017', 'nba_1626199', 10, 'EL_2017', 'nba_1629029', 0.70671, 'roles-v1.1'),
+('all', 'NBA_2019', 'nba_1626203', 3, 'NBA_2020', 'nba_1629740', 0.50307, 'roles-v1.1'),
+('all', 'GL_2022', 'nba_1626208', 6, 'NBA_2022', 'nba_1626166', 0.73044, 'roles-v1.1'),
+('all', 'GL_2022', 'nba_1626208', 7, 'NBA_2021', 'nba_1626166', 0.74275, 'roles-v1.1'),
+('all', 'GL_2023', 'nba_1626208', 2, 'EL_2012', 'nba_101146', 0.80852, 'roles-v1.1'),
+('all', 'NBA_2016', 'nba_1626209', 4, 'NBA_2015', 'nba_1626169', 0.48532, 'roles-v1.1'),
+('all', 'NBA_2016', 'nba_1626209', 7, 'NBA_2018', 'nba_1626169', 0.7202, 'roles-v1.1'),
+('all', 'NBA_2017', 'nba_1626209', 6, 'NBA_2016', 'nba_1626147', 0.41892, 'roles-v1.1'),
+('all', 'EL_2023', 'nba_1626209', 7, 'NBA_2012', 'nba_101141', 0.51996, 'roles-v1.1'),
+('all', 'EL_2024', 'nba_1626209', 8, 'NBA_2009', 'nba_101141', 0.57428, 'roles-v1.1');
+INSERT INTO player_comps ("scope", "season_id", "person_id", "rank", "neighbour_season_id", "neighbour_person_id", "distance", "model_version") VALUES
+('all', 'EL_2014', 'nba_1626224', 5, 'NBA_2019', 'nba_1627823', 0.47257, 'roles-v1.1'),
+('all', 'NBA_2017', 'nba_1626224', 1, 'NBA_2022', 'nba_1627814', 0.24104, 'roles-v1.1'),
+('all', 'NBA_2018', 'nba_1626224', 4, 'NBA_2019', 'nba_1627814', 0.3351, 'roles-v1.1'),
+('all', 'NBA_2020', 'nba_1626224', 7, 'NBA_2019', 'nba_1626188', 0.52144, 'roles-v1.1'),
+('all', 'NBA_2021', 'nba_1626224', 4, 'NBA_2018', 'nba_1626188', 0.28448, 'roles-v1.1'),
+('all', 'EL_2024', 'nba_1626224', 10, 'NBA_2016', 'nba_1627748', 0.542, 'roles-v1.1'),
+('all', 'EL_2014', 'nba_1626246', 2, 'GL_2021', 'nba_1627767', 1.05109, 'roles-v1.1'),
+('all', 'NBA_2015', 'nba_1626246', 2, 'GL_2021', 'nba_1627767', 1.2233, 'roles-v1.1'),
+('all', 'EL_2013', 'nba_1627098', 3, 'GL_2015', 'nba_1626150', 0.41168, 'roles-v1.1'),
+('all', 'EL_2015', 'nba_1627098', 10, 'GL_2015', 'nba_1626150', 0.58723, 'roles-v1.1'),
+('all', 'NBA_2017', 'nba_1627098', 3, 'NBA_2018', 'nba_1626166', 0.41787, 'roles-v1.1'),
+('all', 'NBA_2016', 'nba_1627733', 4, 'NBA_2017', 'nba_1627835', 0.99615, 'roles-v1.1'),
+('all', 'EL_2020', 'nba_1627733', 10, 'EL_2022', 'nba_1629740', 0.58991, 'roles-v1.1'),
+('all', 'EL_2024', 'nba_1627735', 9, 'NBA_2011', 'nba_101198', 0.62196, 'roles-v1.1'),
+('all', 'NBA_2017', 'nba_1627739', 9, 'NBA_2021', 'nba_1626166', 0.80847, 'roles-v1.1'),
+('all', 'NBA_2019', 'nba_1627739', 7, 'NBA_2016', 'nba_1626150', 0.65869, 'roles-v1.1'),
+('all', 'NBA_2024', 'nba_1627739', 8, 'NBA_2005', 'nba_101137', 0.58048, 'roles-v1.1'),
+('all', 'NBA_2018', 'nba_1627748', 2, 'NBA_2015', 'nba_1626147', 0.25258, 'roles-v1.1'),
+('all', 'NBA_2019', 'nba_1627748', 3, 'EL_2015', 'nba_1629740', 0.53623, 'roles-v1.1'),
+('all', 'NBA_2017', 'nba_1627767', 2, 'EL_2021', 'nba_1627834', 0.58947, 'roles-v1.1'),
+('all', 'NBA_2017', 'nba_1627767', 7, 'EL_2024', 'nba_1626195', 0.74004, 'roles-v1.1'),
+('all', 'GL_2021', 'nba_1627767', 8, 'EL_2014', 'nba_1626246', 1.05109, 'roles-v1.1'),
+('all', 'NBA_2018', 'nba_1627789', 9, 'EL_2016', 'nba_1626224', 0.58609, 'roles-v1.1'),
+('all', 'NBA_2021', 'nba_1627789', 3, 'NBA_2013', 'nba_101187', 0.34578, 'roles-v1.1'),
+('all', 'EL_2024', 'nba_1627789', 3, 'NBA_2015', 'nba_1626169', 0.51854, 'roles-v1.1'),
+('all', 'NBA_2019', 'nba_1627812', 6, 'EL_2007', 'nba_101146', 0.46617, 'roles-v1.1'),
+('all', 'GL_2017', 'nba_1627814', 1, 'GL_2023', 'nba_1626169', 0.2638, 'roles-v1.1'),
+('all', 'GL_2018', 'nba_1627814', 8, 'EL_2023', 'nba_1626163', 0.53368, 'roles-v1.1'),
+('all', 'NBA_2019', 'nba_1627814', 2, 'NBA_2018', 'nba_1626224', 0.3351, 'roles-v1.1'),
+('all', 'NBA_2022', 'nba_1627814', 1, 'NBA_2017', 'nba_1626224', 0.24104, 'roles-v1.1'),
+('all', 'GL_2021', 'nba_1627822', 8, 'NBA_2021', 'nba_1626174', 0.88715, 'roles-v1.1'),
+('all', 'NBA_2016', 'nba_1627823', 6, 'NBA_2019', 'nba_1627789', 0.61231, 'roles-v1.1'),
+('all', 'NBA_2019', 'nba_1627823', 10, 'EL_2014', 'nba_1626224', 0.47257, 'roles-v1.1'),
+('all', 'NBA_2020', 'nba_1627823', 1, 'NBA_2015', 'nba_101141', 0.36063, 'roles-v1.1'),
+('all', 'EL_2024', 'nba_1627823', 1, 'NBA_2019', 'nba_101141', 0.43217, 'roles-v1.1'),
+('all', 'EL_2020', 'nba_1627824', 1, 'EL_2014', 'nba_1627851', 0.33285, 'roles-v1.1'),
+('all', 'NBA_2024', 'nba_1627824', 2, 'EL_2017', 'nba_1629740', 0.28669, 'roles-v1.1'),
+('all', 'EL_2021', 'nba_1627834', 4, 'NBA_2017', 'nba_1627767', 0.58947, 'roles-v1.1'),
+('all', 'EL_2022', 'nba_1627834', 10, 'EL_2021', 'nba_1629740', 0.80446, 'roles-v1.1'),
+('all', 'NBA_2017', 'nba_1627835', 2, 'NBA_2017', 'nba_1627846', 0.59559, 'roles-v1.1'),
+('all', 'NBA_2017', 'nba_1627835', 5, 'NBA_2016', 'nba_1626169', 0.67025, 'roles-v1.1'),
+('all', 'GL_2016', 'nba_1627846', 5, 'EL_2017', 'nba_1629029', 0.59346, 'roles-v1.1'),
+('all', 'NBA_2017', 'nba_1627846', 1, 'NBA_2017', 'nba_1627835', 0.59559, 'roles-v1.1'),
+('all', 'NBA_2017', 'nba_1627846', 3, 'NBA_2016', 'nba_1626169', 0.71547, 'roles-v1.1'),
+('all', 'EL_2014', 'nba_1627851', 1, 'EL_2020', 'nba_1627824', 0.33285, 'roles-v1.1'),
+('all', 'NBA_2016', 'nba_1627851', 6, 'NBA_2018', 'nba_1626224', 0.44052, 'roles-v1.1'),
+('all', 'GL_2016', 'nba_1627858', 6, 'NBA_2022', 'nba_1626159', 0.81474, 'roles-v1.1'),
+('all', 'EL_2017', 'nba_1629029', 4, 'GL_2016', 'nba_1627846', 0.59346, 'roles-v1.1'),
+('all', 'EL_2017', 'nba_1629029', 7, 'GL_2017', 'nba_1626199', 0.70671, 'roles-v1.1'),
+('all', 'EL_2015', 'nba_1629740', 5, 'NBA_2019', 'nba_1627748', 0.53623, 'roles-v1.1'),
+('all', 'EL_2017', 'nba_1629740', 3, 'NBA_2024', 'nba_1627824', 0.28669, 'roles-v1.1'),
+('all', 'NBA_2020', 'nba_1629740', 1, 'NBA_2019', 'nba_1626203', 0.50307, 'roles-v1.1'),
+('all', 'EL_2024', 'nba_1629740', 5, 'EL_2020', 'nba_1627733', 0.59095, 'roles-v1.1'),
+('all', 'EL_2018', 'nba_1630267', 10, 'NBA_2015', 'nba_101127', 0.71524, 'roles-v1.1'),
+('all', 'NBA_2020', 'nba_1630267', 9, 'NBA_2018', 'nba_1626170', 0.76491, 'roles-v1.1'),
+('all', 'NBA_2021', 'nba_1630267', 9, 'NBA_2018', 'nba_1626170', 0.66301, 'roles-v1.1'),
+('all', 'EL_2018', 'nba_203995', 9, 'EL_2019', 'nba_1627098', 0.68508, 'roles-v1.1'),
+('all', 'EL_2020', 'nba_203995', 6, 'GL_2019', 'nba_1626150', 0.41475, 'roles-v1.1'),
+('all', 'EL_2020', 'nba_203995', 7, 'GL_2015', 'nba_1626150', 0.42478, 'roles-v1.1'),
+('all', 'NBA_2024', 'nba_203995', 10, 'NBA_2016', 'nba_1627098', 0.94568, 'roles-v1.1');
 INSERT INTO player_shooting ("season_id", "person_id", "fg3a", "fg3a_per_75", "fg3_pct_raw", "fg3_pct_shrunk", "shrinkage_weight", "prior_mean", "spacing_score", "reportable", "model_version") VALUES
-('EL_2021', 'nba_1626170', 37.0, 4.133, 0.2432, 0.3223, 0.301, 0.3563, 1.3319, 1, 'roles-v1.0'),
-('EL_2021', 'nba_1626199', 122.0, 9.041, 0.3852, 0.3733, 0.5868, 0.3563, 3.3748, 1, 'roles-v1.0'),
-('EL_2021', 'nba_1626209', 129.0, 6.269, 0.3488, 0.3518, 0.6003, 0.3563, 2.2056, 1, 'roles-v1.0'),
-('EL_2021', 'nba_1627098', 119.0, 6.316, 0.3277, 0.3397, 0.5808, 0.3563, 2.1456, 1, 'roles-v1.0'),
-('EL_2021', 'nba_1627735', 100.0, 4.278, 0.34, 0.3475, 0.5379, 0.3563, 1.4868, 1, 'roles-v1.0'),
-('EL_2021', 'nba_1627762', 23.0, 2.285, 0.2609, 0.3362, 0.2112, 0.3563, 0.7683, 1, 'roles-v1.0'),
-('EL_2021', 'nba_1627790', 0.0, 0.0, NULL, 0.3563, 0.0, 0.3563, 0.0, 0, 'roles-v1.0'),
-('EL_2021', 'nba_1627812', 8.0, 7.203, 0.25, 0.3473, 0.0852, 0.3563, 2.5013, 0, 'roles-v1.0'),
-('EL_2021', 'nba_1627816', 2.0, 0.155, 0.0, 0.3482, 0.0228, 0.3563, 0.054, 0, 'roles-v1.0'),
-('EL_2021', 'nba_1627824', 132.0, 4.784, 0.4015, 0.3837, 0.6058, 0.3563, 1.8355, 1, 'roles-v1.0'),
-('EL_2021', 'nba_1627834', 0.0, 0.0, NULL, 0.3563, 0.0, 0.3563, 0.0, 0, 'roles-v1.0'),
-('EL_2021', 'nba_1627835', 3.0, 5.051, 0.3333, 0.3555, 0.0337, 0.3563, 1.7957, 0, 'roles-v1.0'),
-('EL_2021', 'nba_1627851', 35.0, 4.59, 0.3714, 0.3607, 0.2895, 0.3563, 1.6555, 1, 'roles-v1.0'),
-('EL_2021', 'nba_1629740', 48.0, 2.16, 0.2917, 0.3331, 0.3585, 0.3563, 0.7195, 1, 'roles-v1.0'),
-('EL_2021', 'nba_203995', 224.0, 7.852, 0.3393, 0.344, 0.7228, 0.3563, 2.7012, 1, 'roles-v1.0'),
-('NBA_2005', 'nba_101126', 146.0, 3.405, 0.3973, 0.3815, 0.6584, 0.3511, 1.2989, 1, 'roles-v1.0'),
-('NBA_2005', 'nba_101127', 76.0, 1.711, 0.2632, 0.307, 0.5009, 0.3511, 0.5254, 1, 'roles-v1.0'),
-('NBA_2005', 'nba_101132', 13.0, 0.902, 0.1538, 0.3222, 0.1465, 0.3511, 0.2906, 0, 'roles-v1.0'),
-('NBA_2005', 'nba_101137', 78.0, 2.891, 0.2821, 0.3161, 0.5074, 0.3511, 0.9138, 1, 'roles-v1.0'),
-('NBA_2005', 'nba_101187', 58.0, 3.705, 0.4138, 0.3783, 0.4337, 0.3511, 1.4014, 1, 'roles-v1.0'),
-('NBA_2005', 'nba_101198', 9.0, 1.996, 0.2222, 0.3374, 0.1062, 0.3511, 0.6735, 0, 'roles-v1.0'),
-('NBA_2005', 'nba_101212', 1.0, 0.073, 0.0, 0.3465, 0.013, 0.3511, 0.0252, 0, 'roles-v1.0'),
-('NBA_2005', 'nba_101249', 9.0, 3.038, 0.2222, 0.3374, 0.1062, 0.3511, 1.0251, 0, 'roles-v1.0'),
-('NBA_2005', 'nba_1531', 2.0, 0.07, 0.5, 0.3549, 0.0257, 0.3511, 0.0249, 0, 'roles-v1.0'),
-('NBA_2021', 'nba_1626147', 59.0, 6.725, 0.2542, 0.3098, 0.3836, 0.3444, 2.0834, 1, 'roles-v1.0'),
-('NBA_2021', 'nba_1626159', 66.0, 3.067, 0.2273, 0.2963, 0.4104, 0.3444, 0.9089, 1, 'roles-v1.0'),
-('NBA_2021', 'nba_1626161', 2.0, 0.394, 0.5, 0.3476, 0.0207, 0.3444, 0.1369, 0, 'roles-v1.0'),
-('NBA_2021', 'nba_1626163', 15.0, 2.984, 0.3333, 0.3429, 0.1366, 0.3444, 1.0233, 0, 'roles-v1.0'),
-('NBA_2021', 'nba_1626166', 211.0, 5.946, 0.3365, 0.3389, 0.69, 0.3444, 2.0152, 1, 'roles-v1.0'),
-('NBA_2021', 'nba_1626169', 105.0, 3.454, 0.3143, 0.3286, 0.5255, 0.3444, 1.1349, 1, 'roles-v1.0'),
-('NBA_2021', 'nba_1626174', 336.0, 5.778, 0.3899, 0.3799, 0.7799, 0.3444, 2.1947, 1, 'roles-v1.0'),
-('NBA_2021', 'nba_1626195', 12.0, 0.515, 0.3333, 0.3432, 0.1123, 0.3444, 0.1767, 0, 'roles-v1.0'),
-('NBA_2021', 'nba_1626208', 90.0, 5.72, 0.3, 0.3228, 0.487, 0.3444, 1.8464, 1, 'roles-v1.0'),
-('NBA_2021', 'nba_1626224', 359.0, 8.841, 0.3565, 0.354, 0.7911, 0.3444, 3.1299, 1, 'roles-v1.0'),
-('NBA_2021', 'nba_1626246', 4.0, 1.125, 0.25, 0.3406, 0.0405, 0.3444, 0.3833, 0, 'roles-v1.0'),
-('NBA_2021', 'nba_1627739', 11.0, 1.177, 0.0909, 0.318, 0.104, 0.3444, 0.3745, 0, 'roles-v1.0'),
-('NBA_2021', 'nba_1627756', 47.0, 7.622, 0.4043, 0.3642, 0.3314, 0.3444, 2.7761, 1, 'roles-v1.0'),
-('NBA_2021', 'nba_1627767', 0.0, 0.0, NULL, 0.3444, 0.0, 0.3444, 0.0, 0, 'roles-v1.0'),
-('NBA_2021', 'nba_1627789', 122.0, 6.413, 0.3607, 0.3535, 0.5627, 0.3444, 2.2674, 1, 'roles-v1.0'),
-('NBA_2021', 'nba_1627814', 187.0, 5.358, 0.3369, 0.3394, 0.6636, 0.3444, 1.8185, 1, 'roles-v1.0'),
-('NBA_2021', 'nba_1627820', 8.0, 3.844, 0.25, 0.337, 0.0778, 0.3444, 1.2956, 0, 'roles-v1.0'),
-('NBA_2021', 'nba_1627822', 8.0, 7.586, 0.125, 0.3273, 0.0778, 0.3444, 2.4831, 0, 'roles-v1.0'),
-('NBA_2021', 'nba_1627823', 69.0, 5.588, 0.3478, 0.3458, 0.4212, 0.3444, 1.9324, 1, 'roles-v1.0'),
-('NBA_2021', 'nba_1627846', 14.0, 3.47, 0.2857, 0.3368, 0.1287, 0.3444, 1.1689, 0, 'roles-v1.0'),
-('NBA_2021', 'nba_1627853', 9.0, 4.249, 0.4444, 0.3531, 0.0867, 0.3444, 1.5002, 0, 'roles-v1.0'),
-('NBA_2021', 'nba_1629029', 569.0, 8.903, 0.3533, 0.352, 0.8572, 0.3444, 3.1338, 1, 'roles-v1.0'),
-('NBA_2021', 'nba_1630267', 193.0, 5.868, 0.3005, 0.315, 0.6706, 0.3444, 1.8483, 1, 'roles-v1.0'),
-('EL_2019', 'nba_1626199', 136.0, 8.941, 0.4118, 0.4031, 0.7249, 0.3802, 3.6041, 1, 'roles-v1.0'),
-('EL_2019', 'nba_1626208', 44.0, 7.011, 0.3636, 0.3726, 0.4602, 0.3802, 2.6123, 1, 'roles-v1.0'),
-('EL_2019', 'nba_1627098', 128.0, 7.889, 0.4297, 0.4155, 0.7127, 0.3802, 3.2775, 1, 'roles-v1.0'),
-('EL_2019', 'nba_1627735', 30.0, 2.679, 0.2667, 0.3385, 0.3676, 0.3802, 0.9068, 1, 'roles-v1.0'),
-('EL_2019', 'nba_1627762', 40.0, 3.16, 0.325, 0.3561, 0.4367, 0.3802, 1.1251, 1, 'roles-v1.0'),
-('EL_2019', 'nba_1627824', 10.0, 7.795, 0.4, 0.3834, 0.1623, 0.3802, 2.9887, 0, 'roles-v1.0'),
-('EL_2019', 'nba_1627834', 2.0, 0.152, 0.0, 0.366, 0.0373, 0.3802, 0.0556, 0, 'roles-v1.0'),
-('EL_2019', 'nba_1627835', 62.0, 3.606, 0.4032, 0.3928, 0.5458, 0.3802, 1.4164, 1, 'roles-v1.0'),
-('EL_2019', 'nba_1627851', 11.0, 5.158, 0.2727, 0.3613, 0.1757, 0.3802, 1.8638, 0, 'roles-v1.0'),
-('EL_2019', 'nba_1630267', 113.0, 6.08, 0.3097, 0.3318, 0.6865, 0.3802, 2.0175, 1, 'roles-v1.0'),
-('EL_2019', 'nba_203995', 131.0, 6.426, 0.3969, 0.3922, 0.7174, 0.3802, 2.5203, 1, 'roles-v1.0'),
-('EL_2011', 'nba_101141', 17.0, 3.694, 0.3529, 0.3665, 0.1975, 0.3699, 1.354, 0, 'roles-v1.0'),
-('EL_2011', 'nba_101146', 41.0, 3.518, 0.2927, 0.3411, 0.3724, 0.3699, 1.2001, 1, 'roles-v1.0'),
-('EL_2011', 'nba_101212', 0.0, 0.0, NULL, 0.3699, 0.0, 0.3699, 0.0, 0, 'roles-v1.0'),
-('EL_2011', 'nba_1627851', 7.0, 2.497, 0.1429, 0.349, 0.092, 0.3699, 0.8713, 0, 'roles-v1.0'),
-('EL_2011', 'nba_1629740', 9.0, 3.213, 0.3333, 0.3657, 0.1152, 0.3699, 1.1749, 0, 'roles-v1.0'),
-('EL_2020', 'nba_1626199', 150.0, 7.519, 0.3267, 0.3444, 0.688, 0.3836, 2.59, 1, 'roles-v1.0'),
-('EL_2020', 'nba_1626208', 10.0, 7.513, 0.3, 0.3729, 0.1282, 0.3836, 2.8017, 0, 'roles-v1.0'),
-('EL_2020', 'nba_1626209', 41.0, 8.128, 0.3659, 0.3769, 0.3761, 0.3836, 3.064, 1, 'roles-v1.0'),
-('EL_2020', 'nba_1627098', 134.0, 6.049, 0.3881, 0.3866, 0.6633, 0.3836, 2.3382, 1, 'roles-v1.0'),
-('EL_2020', 'nba_1627733', 84.0, 4.651, 0.3452, 0.3624, 0.5526, 0.3836, 1.6856, 1, 'roles-v1.0'),
-('EL_2020', 'nba_1627735', 130.0, 4.397, 0.2846, 0.3186, 0.6565, 0.3836, 1.401, 1, 'roles-v1.0'),
-('EL_2020', 'nba_1627762', 16.0, 1.361, 0.25, 0.3582, 0.1904, 0.3836, 0.4876, 0, 'roles-v1.0'),
-('EL_2020', 'nba_1627790', 0.0, 0.0, NULL, 0.3836, 0.0, 0.3836, 0.0, 0, 'roles-v1.0'),
-('EL_2020', 'nba_1627816', 7.0, 0.419, 0.0, 0.3478, 0.0933, 0.3836, 0.1459, 0, 'roles-v1.0'),
-('EL_2020', 'nba_1627824', 112.0, 5.348, 0.3839, 0.3838, 0.6222, 0.3836, 2.0525, 1, 'roles-v1.0'),
-('EL_2020', 'nba_1627834', 8.0, 0.411, 0.125, 0.3564, 0.1052, 0.3836, 0.1466, 0, 'roles-v1.0'),
-('EL_2020', 'nba_1627835', 137.0, 5.752, 0.438, 0.4199, 0.6682, 0.3836, 2.4156, 1, 'roles-v1.0'),
-('EL_2020', 'nba_1630267', 51.0, 7.128, 0.2745, 0.3369, 0.4285, 0.3836, 2.4013, 1, 'roles-v1.0'),
-('EL_2020', 'nba_203995', 193.0, 5.792, 0.3886, 0.3873, 0.7394, 0.3836, 2.2431, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_101141', 41.0, 10.004, 0.439, 0.3848, 0.3302, 0.358, 3.8493, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1626159', 54.0, 3.834, 0.1852, 0.29, 0.3937, 0.358, 1.1118, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1626161', 11.0, 0.437, 0.0909, 0.3268, 0.1168, 0.358, 0.1429, 0, 'roles-v1.0'),
-('NBA_2020', 'nba_1626163', 85.0, 4.281, 0.3647, 0.3614, 0.5054, 0.358, 1.5471, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1626166', 166.0, 5.536, 0.4398, 0.4125, 0.6662, 0.358, 2.2836, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1626169', 137.0, 4.905, 0.3285, 0.3396, 0.6223, 0.358, 1.6658, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1626174', 206.0, 5.593, 0.3738, 0.3693, 0.7124, 0.358, 2.0653, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1626188', 26.0, 5.948, 0.4231, 0.3735, 0.2382, 0.358, 2.2218, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1626195', 10.0, 0.425, 0.1, 0.3303, 0.1073, 0.358, 0.1405, 0, 'roles-v1.0'),
-('NBA_2020', 'nba_1626224', 324.0, 7.722, 0.3056, 0.3163, 0.7957, 0.358, 2.4422, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1626246', 8.0, 1.061, 0.125, 0.3376, 0.0878, 0.358, 0.3583, 0, 'roles-v1.0'),
-('NBA_2020', 'nba_1626253', 2.0, 1.176, 0.5, 0.3614, 0.0235, 0.358, 0.425, 0, 'roles-v1.0'),
-('NBA_2020', 'nba_1627739', 2.0, 1.586, 0.0, 0.3496, 0.0235, 0.358, 0.5543, 0, 'roles-v1.0'),
-('NBA_2020', 'nba_1627748', 2.0, 0.942, 0.0, 0.3496, 0.0235, 0.358, 0.3292, 0, 'roles-v1.0'),
-('NBA_2020', 'nba_1627756', 242.0, 8.411, 0.3306, 0.3376, 0.7442, 0.358, 2.8396, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1627775', 0.0, 0.0, NULL, 0.358, 0.0, 0.358, 0.0, 0, 'roles-v1.0'),
-('NBA_2020', 'nba_1627789', 239.0, 8.192, 0.3138, 0.3252, 0.7418, 0.358, 2.6643, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1627812', 28.0, 7.359, 0.3214, 0.3488, 0.2519, 0.358, 2.5667, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1627814', 194.0, 6.473, 0.3969, 0.3852, 0.6999, 0.358, 2.4935, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1627823', 168.0, 6.72, 0.3274, 0.3375, 0.6689, 0.358, 2.2681, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1627846', 43.0, 4.357, 0.4186, 0.3787, 0.3408, 0.358, 1.6501, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1627853', 67.0, 5.355, 0.3731, 0.3648, 0.4462, 0.358, 1.9533, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1629029', 548.0, 8.72, 0.3504, 0.3514, 0.8682, 0.358, 3.064, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1629740', 85.0, 5.405, 0.2706, 0.3138, 0.5054, 0.358, 1.6962, 1, 'roles-v1.0'),
-('NBA_2020', 'nba_1630267', 216.0, 5.457, 0.3519, 0.3536, 0.722, 0.358, 1.9295, 1, 'roles-v1.0'),
-('NBA_2014', 'nba_101126', 112.0, 6.823, 0.2768, 0.3059, 0.5616, 0.3431, 2.087, 1, 'roles-v1.0'),
-('NBA_2014', 'nba_101127', 146.0, 2.346, 0.2671, 0.2956, 0.6255, 0.3431, 0.6933, 1, 'roles-v1.0'),
-('NBA_2014', 'nba_101141', 190.0, 5.186, 0.3895, 0.3749, 0.6849, 0.3431, 1.944, 1, 'roles-v1.0'),
-('NBA_2014', 'nba_101187', 210.0, 4.334, 0.3476, 0.3463, 0.7061, 0.3431, 1.5009, 1, 'roles-v1.0'),
-('NBA_2014', 'nba_101198', 9.0, 4.859, 0.0, 0.3111, 0.0933, 0.3431, 1.5116, 0, 'roles-v1.0'),
-('NBA_2014', 'nba_101249', 29.0, 3.842, 0.3103, 0.335, 0.2491, 0.3431, 1.287, 1, 'roles-v1.0'),
-('NBA_2008', 'nba_101126', 385.0, 6.276, 0.3247, 0.3304, 0.831, 0.3583, 2.0732, 1, 'roles-v1.0'),
-('NBA_2008', 'nba_101127', 221.0, 2.929, 0.3529, 0.3543, 0.7384, 0.3583, 1.0378, 1, 'roles-v1.0'),
-('NBA_2008', 'nba_101132', 267.0, 5.269, 0.3258, 0.3332, 0.7733, 0.3583, 1.7558, 1, 'roles-v1.0'),
-('NBA_2008', 'nba_101146', 62.0, 2.509, 0.1774, 0.2784, 0.442, 0.3583, 0.6985, 1, 'roles-v1.0'),
-('NBA_2008', 'nba_101198', 19.0, 0.852, 0.1579, 0.3192, 0.1953, 0.3583, 0.272, 0, 'roles-v1.0'),
-('GL_2023', 'nba_1626159', 77.0, 4.689, 0.2987, 0.3235, 0.5229, 0.3506, 1.5168, 1, 'roles-v1.0'),
-('GL_2023', 'nba_1626169', 146.0, 6.249, 0.411, 0.3914, 0.6751, 0.3506, 2.4454, 1, 'roles-v1.0'),
-('GL_2023', 'nba_1626203', 16.0, 3.964, 0.0625, 0.2972, 0.1855, 0.3506, 1.1781, 0, 'roles-v1.0'),
-('GL_2023', 'nba_1626208', 64.0, 3.844, 0.2656, 0.3101, 0.4767, 0.3506, 1.1922, 1, 'roles-v1.0'),
-('GL_2023', 'nba_1627775', 113.0, 4.67, 0.3805, 0.3691, 0.6166, 0.3506, 1.7236, 1, 'roles-v1.0'),
-('GL_2023', 'nba_1627853', 64.0, 6.893, 0.2969, 0.325, 0.4767, 0.3506, 2.2405, 1, 'roles-v1.0'),
-('NBA_2015', 'nba_101126', 1.0, 1.545, 0.0, 0.3452, 0.0099, 0.3486, 0.5334, 0, 'roles-v1.0'),
-('NBA_2015', 'nba_101127', 102.0, 3.577, 0.3039, 0.3261, 0.5045, 0.3486, 1.1662, 1, 'roles-v1.0'),
-('NBA_2015', 'nba_101141', 259.0, 4.959, 0.3707, 0.3645, 0.7211, 0.3486, 1.8074, 1, 'roles-v1.0'),
-('NBA_2015', 'nba_101187', 37.0, 6.931, 0.3243, 0.3421, 0.2697, 0.3486, 2.3707, 1, 'roles-v1.0'),
-('NBA_2015', 'nba_1626147', 83.0, 4.619, 0.2651, 0.3107, 0.4531, 0.3486, 1.4354, 1, 'roles-v1.0'),
-('NBA_2015', 'nba_1626159', 116.0, 1.871, 0.2759, 0.3096, 0.5366, 0.3486, 0.5792, 1, 'roles-v1.0'),
-('NBA_2015', 'nba_1626161', 2.0, 0.051, 0.0, 0.3418, 0.0196, 0.3486, 0.0174, 0, 'roles-v1.0'),
-('NBA_2015', 'nba_1626163', 202.0, 4.259, 0.3366, 0.3406, 0.6685, 0.3486, 1.4505, 1, 'roles-v1.0'),
-('NBA_2015', 'nba_1626166', 111.0, 5.728, 0.3243, 0.3358, 0.5256, 0.3486, 1.9237, 1, 'roles-v1.0'),
-('NBA_2015', 'nba_1626169', 205.0, 4.374, 0.3073, 0.3209, 0.6717, 0.3486, 1.4036, 1, 'roles-v1.0'),
-('NBA_2015', 'nba_1626170', 100.0, 2.846, 0.22, 0.2844, 0.4995, 0.3486, 0.8094, 1, 'roles-v1.0'),
-('NBA_2015', 'nba_1626174', 11.0, 2.735, 0.3636, 0.3501, 0.0989, 0.3486, 0.9574, 0, 'roles-v1.0'),
-('NBA_2015', 'nba_1626199', 50.0, 4.7, 0.38, 0.3591, 0.3329, 0.3486, 1.6874, 1, 'roles-v1.0'),
-('NBA_2015', 'nba_1626209', 192.0, 4.892, 0.349, 0.3488, 0.6571, 0.3486, 1.7066, 1, 'roles-v1.0'),
-('NBA_2015', 'nba_1626246', 0.0, 0.0, NULL, 0.3486, 0.0, 0.3486, 0.0, 0, 'roles-v1.0'),
-('NBA_2015', 'nba_1626253', 40.0, 4.715, 0.325, 0.3419, 0.2853, 0.3486, 1.6118, 1, 'roles-v1.0'),
-('NBA_2015', 'nba_1626262', 2.0, 12.41, 1.0, 0.3613, 0.0196, 0.3486, 4.4844, 0, 'roles-v1.0'),
-('EL_2010', 'nba_101137', 35.0, 4.13, 0.2857, 0.3326, 0.3579, 0.3588, 1.3738, 1, 'roles-v1.0'),
-('EL_2010', 'nba_101146', 43.0, 3.96, 0.4186, 0.3831, 0.4065, 0.3588, 1.517, 1, 'roles-v1.0'),
-('EL_2010', 'nba_101187', 33.0, 4.367, 0.4545, 0.3918, 0.3445, 0.3588, 1.7109, 1, 'roles-v1.0'),
-('EL_2010', 'nba_101212', 1.0, 0.183, 0.0, 0.3531, 0.0157, 0.3588, 0.0646, 0, 'roles-v1.0'),
-('EL_2010', 'nba_1626246', 0.0, 0.0, NULL, 0.3588, 0.0, 0.3588, 0.0, 0, 'roles-v1.0'),
-('EL_2010', 'nba_1627851', 6.0, 3.957, 0.1667, 0.342, 0.0872, 0.3588, 1.3534, 0, 'roles-v1.0'),
-('EL_2010', 'nba_1629740', 10.0, 3.249, 0.3, 0.3507, 0.1374, 0.3588, 1.1394, 0, 'roles-v1.0'),
-('EL_2017', 'nba_1626253', 40.0, 2.769, 0.375, 0.3789, 0.4397, 0.382, 1.0494, 1, 'roles-v1.0'),
-('EL_2017', 'nba_1627851', 37.0, 4.336, 0.4324, 0.4032, 0.4206, 0.382, 1.7483, 1, 'roles-v1.0'),
-('EL_2017', 'nba_1629029', 173.0, 7.274, 0.3295, 0.3414, 0.7724, 0.382, 2.4834, 1, 'roles-v1.0'),
-('EL_2017', 'nba_1629740', 79.0, 2.985, 0.4304, 0.4114, 0.6078, 0.382, 1.2282, 1, 'roles-v1.0'),
-('EL_2017', 'nba_1630267', 109.0, 5.659, 0.3761, 0.378, 0.6814, 0.382, 2.1391, 1, 'roles-v1.0'),
-('EL_2017', 'nba_203995', 62.0, 2.767, 0.3548, 0.3671, 0.5488, 0.382, 1.0157, 1, 'roles-v1.0'),
-('EL_2008', 'nba_101137', 84.0, 6.707, 0.381, 0.3759, 0.4679, 0.3714, 2.5207, 1, 'roles-v1.0'),
-('EL_2008', 'nba_101141', 77.0, 6.054, 0.4026, 0.3853, 0.4463, 0.3714, 2.3326, 1, 'roles-v1.0'),
-('EL_2008', 'nba_101187', 33.0, 4.731, 0.3939, 0.3772, 0.2567, 0.3714, 1.7846, 1, 'roles-v1.0'),
-('EL_2008', 'nba_101212', 0.0, 0.0, NULL, 0.3714, 0.0, 0.3714, 0.0, 0, 'roles-v1.0'),
-('NBA_2024', 'nba_1626166', 256.0, 8.455, 0.3633, 0.3607, 0.7104, 0.3543, 3.0497, 1, 'roles-v1.0'),
-('NBA_2024', 'nba_1627739', 224.0, 4.523, 0.3348, 0.341, 0.6822, 0.3543, 1.5424, 1, 'roles-v1.0'),
-('NBA_2024', 'nba_1627814', 37.0, 9.249, 0.2432, 0.3253, 0.2618, 0.3543, 3.0082, 1, 'roles-v1.0'),
-('NBA_2024', 'nba_1627824', 274.0, 5.206, 0.3796, 0.3726, 0.7242, 0.3543, 1.9398, 1, 'roles-v1.0'),
-('NBA_2024', 'nba_1629029', 481.0, 9.791, 0.368, 0.3655, 0.8217, 0.3543, 3.5791, 1, 'roles-v1.0'),
-('NBA_2024', 'nba_203995', 125.0, 5.733, 0.36, 0.3574, 0.5451, 0.3543, 2.0492, 1, 'roles-v1.0'),
-('NBA_2023', 'nba_1626166', 267.0, 7.371, 0.3895, 0.3816, 0.7419, 0.3587, 2.8124, 1, 'roles-v1.0'),
-('NBA_2023', 'nba_1626174', 114.0, 4.707, 0.307, 0.3302, 0.551, 0.3587, 1.5543, 1, 'roles-v1.0'),
-('NBA_2023', 'nba_1626224', 221.0, 6.271, 0.3891, 0.3801, 0.704, 0.3587, 2.3838, 1, 'roles-v1.0'),
-('NBA_2023', 'nba_1626246', 2.0, 1.015, 0.0, 0.3512, 0.0211, 0.3587, 0.3566, 0, 'roles-v1.0'),
-('NBA_2023', 'nba_1627739', 111.0, 3.199, 0.3694, 0.3645, 0.5444, 0.3587, 1.1661, 1, 'roles-v1.0'),
-('NBA_2023', 'nba_1627853', 6.0, 4.784, 0.0, 0.337, 0.0607, 0.3587, 1.6119, 0, 'roles-v1.0'),
-('NBA_2023', 'nba_1629029', 744.0, 10.207, 0.3817, 0.3792, 0.889, 0.3587, 3.8702, 1, 'roles-v1.0'),
-('NBA_2023', 'nba_203995', 154.0, 4.715, 0.2792, 0.3091, 0.6237, 0.3587, 1.4577, 1, 'roles-v1.0'),
-('EL_2016', 'nba_1626224', 106.0, 5.877, 0.3396, 0.3526, 0.6473, 0.3764, 2.0721, 1, 'roles-v1.0'),
-('EL_2016', 'nba_1626262', 21.0, 2.478, 0.381, 0.3776, 0.2667, 0.3764, 0.9358, 1, 'roles-v1.0'),
-('EL_2016', 'nba_1627790', 0.0, 0.0, NULL, 0.3764, 0.0, 0.3764, 0.0, 0, 'roles-v1.0'),
-('EL_2016', 'nba_1629029', 105.0, 5.429, 0.3714, 0.3732, 0.6451, 0.3764, 2.0261, 1, 'roles-v1.0'),
-('EL_2016', 'nba_1629740', 83.0, 3.408, 0.4337, 0.4102, 0.5897, 0.3764, 1.398, 1, 'roles-v1.0'),
-('NBA_2013', 'nba_101126', 154.0, 6.401, 0.3766, 0.3683, 0.6024, 0.3556, 2.3573, 1, 'roles-v1.0'),
-('NBA_2013', 'nba_101127', 185.0, 2.957, 0.3405, 0.3459, 0.6454, 0.3556, 1.0228, 1, 'roles-v1.0'),
-('NBA_2013', 'nba_101141', 131.0, 3.19, 0.2824, 0.3144, 0.5631, 0.3556, 1.0028, 1, 'roles-v1.0'),
-('NBA_2013', 'nba_101187', 248.0, 5.037, 0.3387, 0.3436, 0.7093, 0.3556, 1.7308, 1, 'roles-v1.0'),
-('NBA_2013', 'nba_101198', 62.0, 2.117, 0.3226, 0.3431, 0.3789, 0.3556, 0.7264, 1, 'roles-v1.0'),
-('NBA_2013', 'nba_101249', 84.0, 5.113, 0.2976, 0.3294, 0.4525, 0.3556, 1.684, 1, 'roles-v1.0'),
-('GL_2017', 'nba_101187', 62.0, 6.191, 0.3548, 0.3512, 0.4249, 0.3485, 2.1742, 1, 'roles-v1.0'),
-('GL_2017', 'nba_1626166', 19.0, 9.569, 0.3158, 0.3425, 0.1846, 0.3485, 3.2768, 0, 'roles-v1.0'),
-('GL_2017', 'nba_1626174', 163.0, 3.943, 0.319, 0.329, 0.6602, 0.3485, 1.2973, 1, 'roles-v1.0'),
-('GL_2017', 'nba_1626188', 189.0, 6.53, 0.4392, 0.4113, 0.6925, 0.3485, 2.6856, 1, 'roles-v1.0'),
-('GL_2017', 'nba_1626199', 199.0, 7.001, 0.402, 0.3861, 0.7034, 0.3485, 2.7034, 1, 'roles-v1.0'),
-('GL_2017', 'nba_1626224', 10.0, 9.226, 0.2, 0.3327, 0.1065, 0.3485, 3.0694, 0, 'roles-v1.0'),
-('GL_2017', 'nba_1626643', 94.0, 8.5, 0.3085, 0.3274, 0.5283, 0.3485, 2.7825, 1, 'roles-v1.0'),
-('GL_2017', 'nba_1627735', 71.0, 4.46, 0.2394, 0.2985, 0.4583, 0.3485, 1.3313, 1, 'roles-v1.0'),
-('GL_2017', 'nba_1627762', 47.0, 1.698, 0.3191, 0.338, 0.359, 0.3485, 0.5738, 1, 'roles-v1.0'),
-('GL_2017', 'nba_1627775', 10.0, 6.163, 0.2, 0.3327, 0.1065, 0.3485, 2.0502, 0, 'roles-v1.0'),
-('GL_2017', 'nba_1627785', 172.0, 7.204, 0.3605, 0.3565, 0.6721, 0.3485, 2.5683, 1, 'roles-v1.0'),
-('GL_2017', 'nba_1627790', 1.0, 0.079, 0.0, 0.3444, 0.0118, 0.3485, 0.0271, 0, 'roles-v1.0'),
-('GL_2017', 'nba_1627814', 164.0, 5.228, 0.3049, 0.3196, 0.6615, 0.3485, 1.671, 1, 'roles-v1.0'),
-('GL_2017', 'nba_1627816', 22.0, 3.329, 0.2273, 0.3233, 0.2077, 0.3485, 1.0761, 1, 'roles-v1.0'),
-('GL_2017', 'nba_1627820', 60.0, 2.504, 0.25, 0.3074, 0.4169, 0.3485, 0.7699, 1, 'roles-v1.0'),
-('GL_2017', 'nba_1627824', 88.0, 6.391, 0.3636, 0.3562, 0.5119, 0.3485, 2.2769, 1, 'roles-v1.0'),
-('GL_2017', 'nba_1627834', 1.0, 0.133, 0.0, 0.3444, 0.0118, 0.3485, 0.0458, 0, 'roles-v1.0'),
-('GL_2017', 'nba_1627835', 12.0, 5.635, 0.3333, 0.3466, 0.1251, 0.3485, 1.953, 0, 'roles-v1.0'),
-('GL_2017', 'nba_1627846', 22.0, 5.358, 0.4091, 0.3611, 0.2077, 0.3485, 1.9346, 1, 'roles-v1.0'),
-('GL_2017', 'nba_1627853', 164.0, 4.035, 0.4512, 0.4164, 0.6615, 0.3485, 1.6803, 1, 'roles-v1.0'),
-('GL_2017', 'nba_1627858', 41.0, 2.071, 0.3171, 0.3382, 0.3282, 0.3485, 0.7005, 1, 'roles-v1.0'),
-('GL_2018', 'nba_101127', 3.0, 3.681, 0.3333, 0.343, 0.0435, 0.3434, 1.2626, 0, 'roles-v1.0'),
-('GL_2018', 'nba_1626174', 98.0, 3.571, 0.2653, 0.2967, 0.5978, 0.3434, 1.0596, 1, 'roles-v1.0'),
-('GL_2018', 'nba_1626203', 5.0, 6.998, 0.4, 0.3474, 0.0705, 0.3434, 2.4314, 0, 'roles-v1.0'),
-('GL_2018', 'nba_1627735', 56.0, 4.482, 0.3571, 0.3497, 0.4592, 0.3434, 1.5673, 1, 'roles-v1.0'),
-('GL_2018', 'nba_1627785', 114.0, 5.607, 0.2982, 0.3148, 0.6335, 0.3434, 1.7651, 1, 'roles-v1.0'),
-('GL_2018', 'nba_1627814', 123.0, 5.859, 0.3984, 0.3792, 0.651, 0.3434, 2.2216, 1, 'roles-v1.0'),
-('GL_2018', 'nba_1627816', 71.0, 4.078, 0.2958, 0.3187, 0.5185, 0.3434, 1.2999, 1, 'roles-v1.0'),
-('GL_2018', 'nba_1627824', 6.0, 7.828, 0.1667, 0.3287, 0.0834, 0.3434, 2.573, 0, 'roles-v1.0'),
-('GL_2018', 'nba_1627846', 19.0, 7.647, 0.2632, 0.3255, 0.2237, 0.3434, 2.4889, 0, 'roles-v1.0'),
-('GL_2018', 'nba_1627858', 59.0, 2.439, 0.322, 0.3333, 0.4722, 0.3434, 0.8129, 1, 'roles-v1.0'),
-('GL_2024', 'nba_1626159', 43.0, 5.575, 0.3488, 0.3514, 0.3525, 0.3528, 1.9589, 1, 'roles-v1.0'),
-('GL_2024', 'nba_1626163', 106.0, 6.19, 0.3491, 0.3506, 0.573, 0.3528, 2.1706, 1, 'roles-v1.0'),
-('GL_2024', 'nba_1626169', 104.0, 6.574, 0.3077, 0.3272, 0.5683, 0.3528, 2.1508, 1, 'roles-v1.0'),
-('GL_2024', 'nba_1627748', 25.0, 6.788, 0.16, 0.3064, 0.2404, 0.3528, 2.0802, 1, 'roles-v1.0'),
-('GL_2024', 'nba_1627775', 109.0, 3.843, 0.2752, 0.3078, 0.5798, 0.3528, 1.183, 1, 'roles-v1.0'),
-('GL_2024', 'nba_1627853', 31.0, 5.904, 0.2258, 0.317, 0.2818, 0.3528, 1.8714, 1, 'roles-v1.0'),
-('NBA_2009', 'nba_101126', 223.0, 7.195, 0.3901, 0.3791, 0.7513, 0.3458, 2.7274, 1, 'roles-v1.0'),
-('NBA_2009', 'nba_101127', 199.0, 3.193, 0.4121, 0.3941, 0.7294, 0.3458, 1.2586, 1, 'roles-v1.0'),
-('NBA_2009', 'nba_101141', 241.0, 4.572, 0.3361, 0.3384, 0.7655, 0.3458, 1.547, 1, 'roles-v1.0'),
-('NBA_2009', 'nba_101146', 12.0, 4.456, 0.25, 0.3324, 0.1398, 0.3458, 1.4811, 0, 'roles-v1.0'),
-('NBA_2009', 'nba_101198', 55.0, 1.188, 0.2182, 0.2913, 0.427, 0.3458, 0.3461, 1, 'roles-v1.0'),
-('EL_2007', 'nba_101141', 58.0, 5.257, 0.2414, 0.3025, 0.5232, 0.3695, 1.59, 1, 'roles-v1.0'),
-('EL_2007', 'nba_101146', 77.0, 4.94, 0.3506, 0.3583, 0.593, 0.3695, 1.7703, 1, 'roles-v1.0'),
-('EL_2007', 'nba_101187', 20.0, 3.099, 0.25, 0.3367, 0.2745, 0.3695, 1.0433, 1, 'roles-v1.0'),
-('EL_2007', 'nba_101198', 70.0, 4.801, 0.3571, 0.3625, 0.5698, 0.3695, 1.7402, 1, 'roles-v1.0'),
-('EL_2007', 'nba_101212', 1.0, 0.085, 1.0, 0.3812, 0.0186, 0.3695, 0.0322, 0, 'roles-v1.0'),
-('EL_2007', 'nba_1531', 26.0, 1.695, 0.4231, 0.3872, 0.3297, 0.3695, 0.6561, 1, 'roles-v1.0'),
-('GL_2021', 'nba_1626147', 225.0, 9.779, 0.3956, 0.3828, 0.7535, 0.3439, 3.7436, 1, 'roles-v1.0'),
-('GL_2021', 'nba_1626150', 8.0, 6.558, 0.125, 0.3224, 0.098, 0.3439, 2.1145, 0, 'roles-v1.0'),
-('GL_2021', 'nba_1626188', 75.0, 6.955, 0.44, 0.3924, 0.5047, 0.3439, 2.729, 1, 'roles-v1.0'),
-('GL_2021', 'nba_1626203', 45.0, 3.585, 0.3111, 0.3315, 0.3794, 0.3439, 1.1883, 1, 'roles-v1.0'),
-('GL_2021', 'nba_1627739', 32.0, 2.849, 0.25, 0.3154, 0.303, 0.3439, 0.8987, 1, 'roles-v1.0'),
-('GL_2021', 'nba_1627748', 47.0, 3.863, 0.2128, 0.2928, 0.3897, 0.3439, 1.1311, 1, 'roles-v1.0'),
-('GL_2021', 'nba_1627756', 89.0, 8.366, 0.3596, 0.3525, 0.5473, 0.3439, 2.9487, 1, 'roles-v1.0'),
-('GL_2021', 'nba_1627767', 6.0, 0.3, 0.1667, 0.3305, 0.0754, 0.3439, 0.0993, 0, 'roles-v1.0'),
-('GL_2021', 'nba_1627775', 57.0, 4.735, 0.3333, 0.3393, 0.4364, 0.3439, 1.6066, 1, 'roles-v1.0'),
-('GL_2021', 'nba_1627820', 109.0, 6.118, 0.4312, 0.396, 0.5969, 0.3439, 2.4228, 1, 'roles-v1.0'),
-('GL_2021', 'nba_1627822', 150.0, 6.502, 0.3667, 0.3592, 0.6708, 0.3439, 2.3353, 1, 'roles-v1.0'),
-('GL_2021', 'nba_1627853', 5.0, 5.07, 0.0, 0.322, 0.0636, 0.3439, 1.6328, 0, 'roles-v1.0'),
-('EL_2012', 'nba_101137', 36.0, 4.806, 0.3611, 0.3636, 0.3415, 0.3649, 1.7475, 1, 'roles-v1.0'),
-('EL_2012', 'nba_101146', 85.0, 4.045, 0.3059, 0.3324, 0.5505, 0.3649, 1.3447, 1, 'roles-v1.0'),
-('EL_2012', 'nba_101212', 0.0, 0.0, NULL, 0.3649, 0.0, 0.3649, 0.0, 0, 'roles-v1.0'),
-('EL_2012', 'nba_1626195', 0.0, 0.0, NULL, 0.3649, 0.0, 0.3649, 0.0, 0, 'roles-v1.0'),
-('EL_2012', 'nba_1626209', 0.0, 0.0, NULL, 0.3649, 0.0, 0.3649, 0.0, 0, 'roles-v1.0'),
-('EL_2012', 'nba_1627851', 34.0, 3.76, 0.3235, 0.3513, 0.3288, 0.3649, 1.3208, 1, 'roles-v1.0'),
-('EL_2012', 'nba_1629740', 24.0, 5.512, 0.25, 0.3354, 0.2569, 0.3649, 1.8485, 1, 'roles-v1.0'),
-('EL_2018', 'nba_1626150', 15.0, 6.059, 0.4667, 0.3931, 0.1614, 0.3789, 2.3817, 0, 'roles-v1.0'),
-('EL_2018', 'nba_1626199', 121.0, 6.247, 0.3223, 0.3445, 0.6083, 0.3789, 2.1519, 1, 'roles-v1.0'),
-('EL_2018', 'nba_1626253', 72.0, 7.331, 0.3611, 0.3703, 0.4803, 0.3789, 2.715, 1, 'roles-v1.0'),
-('EL_2018', 'nba_1626262', 36.0, 2.038, 0.4167, 0.3908, 0.316, 0.3789, 0.7965, 1, 'roles-v1.0'),
-('EL_2018', 'nba_1627762', 13.0, 1.792, 0.4615, 0.3907, 0.143, 0.3789, 0.7, 0, 'roles-v1.0'),
-('EL_2018', 'nba_1627834', 0.0, 0.0, NULL, 0.3789, 0.0, 0.3789, 0.0, 0, 'roles-v1.0'),
-('EL_2018', 'nba_1627851', 64.0, 4.503, 0.4688, 0.4194, 0.451, 0.3789, 1.8888, 1, 'roles-v1.0'),
-('EL_2018', 'nba_1629740', 96.0, 3.699, 0.3854, 0.3825, 0.552, 0.3789, 1.4148, 1, 'roles-v1.0'),
-('EL_2018', 'nba_1630267', 115.0, 5.157, 0.3739, 0.3759, 0.5961, 0.3789, 1.9385, 1, 'roles-v1.0'),
-('EL_2018', 'nba_203995', 178.0, 6.141, 0.3708, 0.3733, 0.6956, 0.3789, 2.2921, 1, 'roles-v1.0'),
-('EL_2022', 'nba_1626199', 94.0, 7.848, 0.4468, 0.4122, 0.5671, 0.3668, 3.2346, 1, 'roles-v1.0'),
-('EL_2022', 'nba_1626209', 178.0, 8.0, 0.4326, 0.4137, 0.7127, 0.3668, 3.3096, 1, 'roles-v1.0'),
-('EL_2022', 'nba_1627735', 196.0, 7.397, 0.3265, 0.3373, 0.732, 0.3668, 2.4952, 1, 'roles-v1.0'),
-('EL_2022', 'nba_1627762', 4.0, 0.364, 0.5, 0.3739, 0.0528, 0.3668, 0.136, 0, 'roles-v1.0'),
-('EL_2022', 'nba_1627789', 72.0, 5.015, 0.3333, 0.35, 0.5009, 0.3668, 1.7555, 1, 'roles-v1.0'),
-('EL_2022', 'nba_1627790', 0.0, 0.0, NULL, 0.3668, 0.0, 0.3668, 0.0, 0, 'roles-v1.0'),
-('EL_2022', 'nba_1627816', 10.0, 1.008, 0.2, 0.3464, 0.1223, 0.3668, 0.349, 0, 'roles-v1.0'),
-('EL_2022', 'nba_1627822', 86.0, 6.447, 0.3953, 0.3824, 0.5452, 0.3668, 2.4651, 1, 'roles-v1.0'),
-('EL_2022', 'nba_1627824', 76.0, 3.965, 0.4211, 0.3947, 0.5144, 0.3668, 1.5651, 1, 'roles-v1.0'),
-('EL_2022', 'nba_1627834', 37.0, 1.701, 0.4865, 0.4075, 0.3403, 0.3668, 0.6932, 1, 'roles-v1.0'),
-('EL_2022', 'nba_1627835', 33.0, 6.255, 0.4242, 0.3849, 0.3151, 0.3668, 2.4075, 1, 'roles-v1.0'),
-('EL_2022', 'nba_1629740', 69.0, 3.068, 0.3623, 0.3646, 0.4903, 0.3668, 1.1187, 1, 'roles-v1.0'),
-('EL_2022', 'nba_1630267', 54.0, 7.562, 0.3333, 0.3524, 0.4295, 0.3668, 2.665, 1, 'roles-v1.0'),
-('EL_2022', 'nba_203995', 210.0, 7.795, 0.3571, 0.3596, 0.7454, 0.3668, 2.803, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_101127', 1.0, 1.088, 0.0, 0.3451, 0.0112, 0.349, 0.3755, 0, 'roles-v1.0'),
-('NBA_2016', 'nba_101141', 402.0, 6.755, 0.3532, 0.3525, 0.8202, 0.349, 2.381, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_101187', 44.0, 5.137, 0.3182, 0.3388, 0.333, 0.349, 1.7401, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_101249', 1.0, 3.371, 0.0, 0.3451, 0.0112, 0.349, 1.1633, 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1626147', 194.0, 5.691, 0.299, 0.3146, 0.6876, 0.349, 1.7904, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1626150', 156.0, 3.81, 0.2756, 0.3021, 0.639, 0.349, 1.1512, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1626159', 35.0, 2.015, 0.2, 0.3067, 0.2842, 0.349, 0.6179, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1626161', 2.0, 0.051, 0.0, 0.3413, 0.0222, 0.349, 0.0173, 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1626163', 354.0, 6.522, 0.3277, 0.3319, 0.8007, 0.349, 2.1649, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1626166', 86.0, 6.7, 0.314, 0.3317, 0.4939, 0.349, 2.2226, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1626169', 154.0, 4.045, 0.2922, 0.3129, 0.636, 0.349, 1.2656, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1626170', 134.0, 4.691, 0.3657, 0.3591, 0.6032, 0.349, 1.6843, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1626174', 5.0, 1.683, 0.0, 0.3303, 0.0537, 0.349, 0.5557, 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1626188', 26.0, 4.993, 0.4231, 0.3659, 0.2278, 0.349, 1.8269, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1626195', 15.0, 0.408, 0.2667, 0.337, 0.1454, 0.349, 0.1374, 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1626199', 46.0, 4.346, 0.2609, 0.3188, 0.3429, 0.349, 1.3856, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1626203', 15.0, 2.859, 0.6, 0.3855, 0.1454, 0.349, 1.1021, 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1626209', 144.0, 5.398, 0.2986, 0.3178, 0.6203, 0.349, 1.7154, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1626246', 0.0, 0.0, NULL, 0.349, 0.0, 0.349, 0.0, 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1626253', 4.0, 3.034, 0.25, 0.3447, 0.0434, 0.349, 1.0459, 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1627098', 110.0, 3.174, 0.2364, 0.2865, 0.5552, 0.349, 0.9093, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1627733', 101.0, 6.338, 0.2772, 0.3107, 0.534, 0.349, 1.9693, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1627735', 22.0, 1.956, 0.1364, 0.3065, 0.1998, 0.349, 0.5995, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1627739', 73.0, 1.971, 0.2877, 0.3212, 0.453, 0.349, 0.6333, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1627748', 74.0, 4.739, 0.3784, 0.3624, 0.4564, 0.349, 1.7174, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1627756', 208.0, 7.668, 0.351, 0.3504, 0.7024, 0.349, 2.6867, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1627762', 4.0, 2.741, 0.25, 0.3447, 0.0434, 0.349, 0.9449, 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1627767', 0.0, 0.0, NULL, 0.349, 0.0, 0.349, 0.0, 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1627775', 123.0, 4.123, 0.3333, 0.3399, 0.5826, 0.349, 1.4013, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1627785', 149.0, 3.264, 0.2953, 0.3153, 0.6283, 0.349, 1.029, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1627789', 161.0, 4.871, 0.3106, 0.3242, 0.6462, 0.349, 1.579, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1627812', 176.0, 5.293, 0.3864, 0.3739, 0.6663, 0.349, 1.9791, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1627816', 19.0, 4.361, 0.3158, 0.3431, 0.1773, 0.349, 1.4965, 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1627823', 113.0, 4.832, 0.4071, 0.3816, 0.5618, 0.349, 1.8441, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1627834', 2.0, 0.203, 0.0, 0.3413, 0.0222, 0.349, 0.0692, 0, 'roles-v1.0'),
-('NBA_2016', 'nba_1627835', 99.0, 4.226, 0.3333, 0.3407, 0.529, 0.349, 1.4399, 1, 'roles-v1.0'),
-('NBA_2016', 'nba_1627851', 168.0, 5.951, 0.3214, 0.3309, 0.6559, 0.349, 1.9693, 1, 'roles-v1.0'),
-('NBA_2004', 'nba_1531', 2.0, 0.037, 0.0, 0.3395, 0.0251, 0.3483, 0.0124, 0, 'roles-v1.0'),
-('NBA_2022', 'nba_1626159', 45.0, 2.088, 0.3111, 0.3412, 0.2963, 0.3538, 0.7124, 1, 'roles-v1.0'),
-('NBA_2022', 'nba_1626163', 33.0, 5.058, 0.3939, 0.3633, 0.236, 0.3538, 1.8376, 1, 'roles-v1.0'),
-('NBA_2022', 'nba_1626166', 185.0, 6.878, 0.3676, 0.3625, 0.6339, 0.3538, 2.4935, 1, 'roles-v1.0'),
-('NBA_2022', 'nba_1626169', 40.0, 3.067, 0.45, 0.38, 0.2724, 0.3538, 1.1655, 1, 'roles-v1.0'),
-('NBA_2022', 'nba_1626174', 279.0, 5.778, 0.3763, 0.3701, 0.7231, 0.3538, 2.1384, 1, 'roles-v1.0'),
-('NBA_2022', 'nba_1626195', 11.0, 0.865, 0.2727, 0.3462, 0.0933, 0.3538, 0.2996, 0, 'roles-v1.0'),
-('NBA_2022', 'nba_1626224', 312.0, 7.254, 0.3718, 0.3672, 0.7449, 0.3538, 2.6638, 1, 'roles-v1.0'),
-('NBA_2022', 'nba_1626246', 1.0, 0.21, 0.0, 0.3505, 0.0093, 0.3538, 0.0738, 0, 'roles-v1.0'),
-('NBA_2022', 'nba_1627739', 36.0, 2.284, 0.4722, 0.3837, 0.252, 0.3538, 0.8761, 1, 'roles-v1.0'),
-('NBA_2022', 'nba_1627814', 247.0, 5.903, 0.4453, 0.4177, 0.698, 0.3538, 2.4658, 1, 'roles-v1.0'),
-('NBA_2022', 'nba_1627823', 67.0, 3.932, 0.2537, 0.3152, 0.3854, 0.3538, 1.2394, 1, 'roles-v1.0'),
-('NBA_2022', 'nba_1627853', 23.0, 4.804, 0.3478, 0.3528, 0.1771, 0.3538, 1.6946, 1, 'roles-v1.0'),
-('NBA_2022', 'nba_1629029', 541.0, 8.147, 0.342, 0.3439, 0.8351, 0.3538, 2.802, 1, 'roles-v1.0'),
-('NBA_2022', 'nba_1630267', 11.0, 7.592, 0.2727, 0.3462, 0.0933, 0.3538, 2.6286, 0, 'roles-v1.0'),
-('NBA_2010', 'nba_101126', 200.0, 7.106, 0.325, 0.3356, 0.6761, 0.3579, 2.3851, 1, 'roles-v1.0'),
-('NBA_2010', 'nba_101127', 108.0, 2.258, 0.3056, 0.3301, 0.5299, 0.3579, 0.7453, 1, 'roles-v1.0'),
-('NBA_2010', 'nba_101132', 131.0, 4.57, 0.2977, 0.3231, 0.5776, 0.3579, 1.4766, 1, 'roles-v1.0'),
-('NBA_2010', 'nba_101141', 121.0, 2.894, 0.2975, 0.3242, 0.5581, 0.3579, 0.9381, 1, 'roles-v1.0'),
-('NBA_2010', 'nba_101198', 50.0, 1.6, 0.32, 0.3449, 0.3429, 0.3579, 0.5517, 1, 'roles-v1.0'),
-('NBA_2010', 'nba_101249', 1.0, 3.562, 0.0, 0.3542, 0.0103, 0.3579, 1.2616, 0, 'roles-v1.0'),
-('NBA_2018', 'nba_101141', 160.0, 4.678, 0.3625, 0.3566, 0.5838, 0.3483, 1.6682, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1626147', 77.0, 5.981, 0.3117, 0.3336, 0.403, 0.3483, 1.9949, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1626150', 25.0, 4.844, 0.2, 0.3217, 0.1798, 0.3483, 1.5583, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1626159', 256.0, 4.703, 0.375, 0.3668, 0.6918, 0.3483, 1.7251, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1626161', 2.0, 0.033, 0.5, 0.3509, 0.0172, 0.3483, 0.0114, 0, 'roles-v1.0'),
-('NBA_2018', 'nba_1626163', 139.0, 6.631, 0.3597, 0.3546, 0.5493, 0.3483, 2.3511, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1626166', 84.0, 4.246, 0.2976, 0.3268, 0.4241, 0.3483, 1.3877, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1626169', 215.0, 6.411, 0.2884, 0.3092, 0.6534, 0.3483, 1.9819, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1626170', 110.0, 4.218, 0.3636, 0.3558, 0.4909, 0.3483, 1.5011, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1626174', 26.0, 3.739, 0.3462, 0.3479, 0.1856, 0.3483, 1.3011, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1626188', 200.0, 6.799, 0.405, 0.3844, 0.6368, 0.3483, 2.6139, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1626195', 39.0, 1.729, 0.3846, 0.3576, 0.2548, 0.3483, 0.6184, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1626203', 128.0, 6.441, 0.2969, 0.3211, 0.5288, 0.3483, 2.0685, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1626209', 152.0, 4.536, 0.2763, 0.3072, 0.5713, 0.3483, 1.3935, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1626224', 374.0, 5.509, 0.3476, 0.3478, 0.7663, 0.3483, 1.9159, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1626246', 10.0, 0.529, 0.4, 0.3525, 0.0806, 0.3483, 0.1864, 0, 'roles-v1.0'),
-('NBA_2018', 'nba_1627733', 101.0, 4.401, 0.2178, 0.287, 0.4696, 0.3483, 1.2632, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1627735', 9.0, 3.46, 0.2222, 0.3391, 0.0731, 0.3483, 1.1732, 0, 'roles-v1.0'),
-('NBA_2018', 'nba_1627739', 96.0, 2.487, 0.3542, 0.351, 0.457, 0.3483, 0.8731, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1627748', 153.0, 5.665, 0.3203, 0.3323, 0.5729, 0.3483, 1.8822, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1627767', 4.0, 0.161, 0.25, 0.345, 0.0339, 0.3483, 0.0555, 0, 'roles-v1.0'),
-('NBA_2018', 'nba_1627775', 28.0, 2.537, 0.3214, 0.343, 0.1971, 0.3483, 0.8703, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1627789', 116.0, 6.239, 0.3103, 0.3292, 0.5042, 0.3483, 2.0539, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1627790', 0.0, 0.0, NULL, 0.3483, 0.0, 0.3483, 0.0, 0, 'roles-v1.0'),
-('NBA_2018', 'nba_1627812', 149.0, 5.029, 0.3624, 0.3563, 0.5664, 0.3483, 1.7918, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1627814', 68.0, 6.525, 0.3971, 0.3665, 0.3735, 0.3483, 2.3915, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1627816', 23.0, 2.716, 0.3913, 0.3555, 0.1678, 0.3483, 0.9655, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1627820', 19.0, 1.09, 0.2105, 0.3287, 0.1428, 0.3483, 0.3581, 0, 'roles-v1.0'),
-('NBA_2018', 'nba_1627823', 181.0, 4.798, 0.3646, 0.3583, 0.6134, 0.3483, 1.7192, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1627824', 28.0, 4.019, 0.3214, 0.343, 0.1971, 0.3483, 1.3787, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1627846', 100.0, 5.19, 0.32, 0.3351, 0.4671, 0.3483, 1.7391, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1627853', 217.0, 3.983, 0.3733, 0.3647, 0.6555, 0.3483, 1.4525, 1, 'roles-v1.0'),
-('NBA_2018', 'nba_1629029', 514.0, 7.984, 0.3268, 0.3308, 0.8184, 0.3483, 2.6406, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_101141', 137.0, 5.0, 0.365, 0.3585, 0.5996, 0.3489, 1.7928, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1626147', 29.0, 9.727, 0.2069, 0.3147, 0.2407, 0.3489, 3.0615, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1626159', 27.0, 2.759, 0.2222, 0.3201, 0.2279, 0.3489, 0.8832, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1626161', 1.0, 0.033, 0.0, 0.3452, 0.0108, 0.3489, 0.0113, 0, 'roles-v1.0'),
-('NBA_2019', 'nba_1626163', 124.0, 5.742, 0.3306, 0.3384, 0.5754, 0.3489, 1.9432, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1626166', 29.0, 5.7, 0.5172, 0.3894, 0.2407, 0.3489, 2.2198, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1626169', 24.0, 5.771, 0.2917, 0.337, 0.2078, 0.3489, 1.9449, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1626170', 8.0, 3.584, 0.25, 0.341, 0.0804, 0.3489, 1.2221, 0, 'roles-v1.0'),
-('NBA_2019', 'nba_1626174', 140.0, 3.805, 0.3857, 0.3712, 0.6048, 0.3489, 1.4123, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1626188', 85.0, 6.024, 0.3647, 0.3565, 0.4816, 0.3489, 2.1478, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1626195', 22.0, 2.111, 0.2273, 0.3253, 0.1938, 0.3489, 0.6867, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1626203', 120.0, 4.649, 0.275, 0.307, 0.5674, 0.3489, 1.427, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1626209', 78.0, 3.222, 0.3077, 0.33, 0.4602, 0.3489, 1.0632, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1626224', 321.0, 6.049, 0.3832, 0.3756, 0.7782, 0.3489, 2.2719, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1626246', 17.0, 1.451, 0.2353, 0.3311, 0.1567, 0.3489, 0.4803, 0, 'roles-v1.0'),
-('NBA_2019', 'nba_1627733', 43.0, 5.421, 0.3488, 0.3489, 0.3197, 0.3489, 1.8914, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1627739', 112.0, 3.178, 0.2589, 0.2994, 0.5504, 0.3489, 0.9516, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1627748', 64.0, 2.969, 0.3438, 0.3468, 0.4116, 0.3489, 1.0295, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1627756', 137.0, 10.109, 0.3358, 0.341, 0.5996, 0.3489, 3.4475, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1627767', 3.0, 0.226, 0.3333, 0.3484, 0.0317, 0.3489, 0.0786, 0, 'roles-v1.0'),
-('NBA_2019', 'nba_1627775', 71.0, 2.815, 0.3239, 0.338, 0.4369, 0.3489, 0.9514, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1627789', 160.0, 6.755, 0.3875, 0.3735, 0.6362, 0.3489, 2.5229, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1627790', 0.0, 0.0, NULL, 0.3489, 0.0, 0.3489, 0.0, 0, 'roles-v1.0'),
-('NBA_2019', 'nba_1627812', 79.0, 5.368, 0.3038, 0.328, 0.4634, 0.3489, 1.761, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1627814', 239.0, 6.048, 0.3556, 0.3538, 0.7232, 0.3489, 2.1398, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1627820', 15.0, 3.367, 0.0667, 0.3092, 0.1409, 0.3489, 1.041, 0, 'roles-v1.0'),
-('NBA_2019', 'nba_1627823', 129.0, 5.572, 0.3411, 0.3443, 0.5851, 0.3489, 1.9185, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1627846', 128.0, 5.315, 0.375, 0.3641, 0.5832, 0.3489, 1.9354, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1627853', 138.0, 5.342, 0.3913, 0.3744, 0.6013, 0.3489, 2.0001, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1629029', 541.0, 9.513, 0.3161, 0.3208, 0.8553, 0.3489, 3.0522, 1, 'roles-v1.0'),
-('NBA_2019', 'nba_1629740', 206.0, 7.116, 0.335, 0.3393, 0.6925, 0.3489, 2.4142, 1, 'roles-v1.0'),
-('EL_2013', 'nba_101132', 59.0, 4.154, 0.3051, 0.34, 0.4907, 0.3737, 1.4124, 1, 'roles-v1.0'),
-('EL_2013', 'nba_101146', 69.0, 3.823, 0.2464, 0.3062, 0.5298, 0.3737, 1.1708, 1, 'roles-v1.0'),
-('EL_2013', 'nba_1626209', 8.0, 3.364, 0.25, 0.3594, 0.1155, 0.3737, 1.2092, 0, 'roles-v1.0'),
-('EL_2013', 'nba_1626224', 21.0, 4.997, 0.5238, 0.412, 0.2554, 0.3737, 2.059, 1, 'roles-v1.0'),
-('EL_2013', 'nba_1626246', 0.0, 0.0, NULL, 0.3737, 0.0, 0.3737, 0.0, 0, 'roles-v1.0'),
-('EL_2013', 'nba_1626253', 7.0, 1.674, 0.1429, 0.35, 0.1026, 0.3737, 0.586, 0, 'roles-v1.0'),
-('EL_2013', 'nba_1626643', 44.0, 9.573, 0.3409, 0.36, 0.4181, 0.3737, 3.4462, 1, 'roles-v1.0'),
-('EL_2013', 'nba_1627098', 109.0, 5.782, 0.3853, 0.3811, 0.6403, 0.3737, 2.2037, 1, 'roles-v1.0'),
-('EL_2013', 'nba_1627835', 3.0, 2.812, 0.3333, 0.3718, 0.0467, 0.3737, 1.0457, 0, 'roles-v1.0');
+('EL_2007', 'nba_101141', 58.0, 5.257, 0.2414, 0.3025, 0.5232, 0.3695, 1.59, 1, 'roles-v1.1'),
+('EL_2007', 'nba_101146', 77.0, 4.94, 0.3506, 0.3583, 0.593, 0.3695, 1.7703, 1, 'roles-v1.1'),
+('EL_2007', 'nba_101187', 20.0, 3.099, 0.25, 0.3367, 0.2745, 0.3695, 1.0433, 1, 'roles-v1.1'),
+('EL_2007', 'nba_101198', 70.0, 4.801, 0.3571, 0.3625, 0.5698, 0.3695, 1.7402, 1, 'roles-v1.1'),
+('EL_2007', 'nba_101212', 1.0, 0.085, 1.0, 0.3812, 0.0186, 0.3695, 0.0322, 0, 'roles-v1.1'),
+('EL_2007', 'nba_1531', 26.0, 1.695, 0.4231, 0.3872, 0.3297, 0.3695, 0.6561, 1, 'roles-v1.1'),
+('EL_2008', 'nba_101137', 84.0, 6.707, 0.381, 0.3759, 0.4679, 0.3714, 2.5207, 1, 'roles-v1.1'),
+('EL_2008', 'nba_101141', 77.0, 6.054, 0.4026, 0.3853, 0.4463, 0.3714, 2.3326, 1, 'roles-v1.1'),
+('EL_2008', 'nba_101187', 33.0, 4.731, 0.3939, 0.3772, 0.2567, 0.3714, 1.7846, 1, 'roles-v1.1'),
+('EL_2008', 'nba_101212', 0.0, 0.0, NULL, 0.3714, 0.0, 0.3714, 0.0, 0, 'roles-v1.1'),
+('EL_2009', 'nba_101132', 86.0, 4.633, 0.3488, 0.3569, 0.5895, 0.3686, 1.6536, 1, 'roles-v1.1'),
+('EL_2009', 'nba_101137', 84.0, 5.435, 0.3929, 0.3828, 0.5837, 0.3686, 2.0802, 1, 'roles-v1.1'),
+('EL_2009', 'nba_101146', 3.0, 3.759, 0.3333, 0.3669, 0.0477, 0.3686, 1.3791, 0, 'roles-v1.1'),
+('EL_2009', 'nba_101187', 62.0, 3.932, 0.3387, 0.3534, 0.5086, 0.3686, 1.3894, 1, 'roles-v1.1'),
+('EL_2010', 'nba_101137', 35.0, 4.13, 0.2857, 0.3326, 0.3579, 0.3588, 1.3738, 1, 'roles-v1.1'),
+('EL_2010', 'nba_101146', 43.0, 3.96, 0.4186, 0.3831, 0.4065, 0.3588, 1.517, 1, 'roles-v1.1'),
+('EL_2010', 'nba_101187', 33.0, 4.367, 0.4545, 0.3918, 0.3445, 0.3588, 1.7109, 1, 'roles-v1.1'),
+('EL_2010', 'nba_101212', 1.0, 0.183, 0.0, 0.3531, 0.0157, 0.3588, 0.0646, 0, 'roles-v1.1'),
+('EL_2010', 'nba_1626246', 0.0, 0.0, NULL, 0.3588, 0.0, 0.3588, 0.0, 0, 'roles-v1.1'),
+('EL_2010', 'nba_1627851', 6.0, 3.957, 0.1667, 0.342, 0.0872, 0.3588, 1.3534, 0, 'roles-v1.1'),
+('EL_2010', 'nba_1629740', 10.0, 3.249, 0.3, 0.3507, 0.1374, 0.3588, 1.1394, 0, 'roles-v1.1'),
+('EL_2011', 'nba_101141', 17.0, 3.694, 0.3529, 0.3665, 0.1975, 0.3699, 1.354, 0, 'roles-v1.1'),
+('EL_2011', 'nba_101146', 41.0, 3.518, 0.2927, 0.3411, 0.3724, 0.3699, 1.2001, 1, 'roles-v1.1'),
+('EL_2011', 'nba_101212', 0.0, 0.0, NULL, 0.3699, 0.0, 0.3699, 0.0, 0, 'roles-v1.1'),
+('EL_2011', 'nba_1627851', 7.0, 2.497, 0.1429, 0.349, 0.092, 0.3699, 0.8713, 0, 'roles-v1.1'),
+('EL_2011', 'nba_1629740', 9.0, 3.213, 0.3333, 0.3657, 0.1152, 0.3699, 1.1749, 0, 'roles-v1.1'),
+('EL_2012', 'nba_101137', 36.0, 4.806, 0.3611, 0.3636, 0.3415, 0.3649, 1.7475, 1, 'roles-v1.1'),
+('EL_2012', 'nba_101146', 85.0, 4.045, 0.3059, 0.3324, 0.5505, 0.3649, 1.3447, 1, 'roles-v1.1'),
+('EL_2012', 'nba_101212', 0.0, 0.0, NULL, 0.3649, 0.0, 0.3649, 0.0, 0, 'roles-v1.1'),
+('EL_2012', 'nba_1626195', 0.0, 0.0, NULL, 0.3649, 0.0, 0.3649, 0.0, 0, 'roles-v1.1'),
+('EL_2012', 'nba_1626209', 0.0, 0.0, NULL, 0.3649, 0.0, 0.3649, 0.0, 0, 'roles-v1.1'),
+('EL_2012', 'nba_1627851', 34.0, 3.76, 0.3235, 0.3513, 0.3288, 0.3649, 1.3208, 1, 'roles-v1.1'),
+('EL_2012', 'nba_1629740', 24.0, 5.512, 0.25, 0.3354, 0.2569, 0.3649, 1.8485, 1, 'roles-v1.1'),
+('EL_2013', 'nba_101132', 59.0, 4.154, 0.3051, 0.34, 0.4907, 0.3737, 1.4124, 1, 'roles-v1.1'),
+('EL_2013', 'nba_101146', 69.0, 3.823, 0.2464, 0.3062, 0.5298, 0.3737, 1.1708, 1, 'roles-v1.1'),
+('EL_2013', 'nba_1626209', 8.0, 3.364, 0.25, 0.3594, 0.1155, 0.3737, 1.2092, 0, 'roles-v1.1'),
+('EL_2013', 'nba_1626224', 21.0, 4.997, 0.5238, 0.412, 0.2554, 0.3737, 2.059, 1, 'roles-v1.1'),
+('EL_2013', 'nba_1626246', 0.0, 0.0, NULL, 0.3737, 0.0, 0.3737, 0.0, 0, 'roles-v1.1'),
+('EL_2013', 'nba_1626253', 7.0, 1.674, 0.1429, 0.35, 0.1026, 0.3737, 0.586, 0, 'roles-v1.1'),
+('EL_2013', 'nba_1626643', 44.0, 9.573, 0.3409, 0.36, 0.4181, 0.3737, 3.4462, 1, 'roles-v1.1'),
+('EL_2013', 'nba_1627098', 109.0, 5.782, 0.3853, 0.3811, 0.6403, 0.3737, 2.2037, 1, 'roles-v1.1'),
+('EL_2013', 'nba_1627835', 3.0, 2.812, 0.3333, 0.3718, 0.0467, 0.3737, 1.0457, 0, 'roles-v1.1'),
+('EL_2013', 'nba_1627851', 35.0, 3.685, 0.3143, 0.3521, 0.3637, 0.3737, 1.2974, 1, 'roles-v1.1'),
+('EL_2013', 'nba_1629740', 48.0, 3.025, 0.3333, 0.356, 0.4394, 0.3737, 1.0769, 1, 'roles-v1.1'),
+('EL_2014', 'nba_101132', 91.0, 6.99, 0.3516, 0.3546, 0.5985, 0.3589, 2.4784, 1, 'roles-v1.1'),
+('EL_2014', 'nba_101146', 32.0, 6.433, 0.2812, 0.3322, 0.3439, 0.3589, 2.1373, 1, 'roles-v1.1'),
+('EL_2014', 'nba_101212', 0.0, 0.0, NULL, 0.3589, 0.0, 0.3589, 0.0, 0, 'roles-v1.1'),
+('EL_2014', 'nba_1626209', 76.0, 7.519, 0.3816, 0.3715, 0.5545, 0.3589, 2.7931, 1, 'roles-v1.1'),
+('EL_2014', 'nba_1626224', 66.0, 4.556, 0.303, 0.3299, 0.5195, 0.3589, 1.5031, 1, 'roles-v1.1'),
+('EL_2014', 'nba_1626246', 0.0, 0.0, NULL, 0.3589, 0.0, 0.3589, 0.0, 0, 'roles-v1.1'),
+('EL_2014', 'nba_1627835', 4.0, 3.796, 0.5, 0.3676, 0.0615, 0.3589, 1.3955, 0, 'roles-v1.1'),
+('EL_2014', 'nba_1627851', 69.0, 4.75, 0.2754, 0.3146, 0.5305, 0.3589, 1.4942, 1, 'roles-v1.1'),
+('EL_2014', 'nba_1629740', 60.0, 4.325, 0.3333, 0.3462, 0.4956, 0.3589, 1.4974, 1, 'roles-v1.1'),
+('EL_2014', 'nba_1630267', 11.0, 4.177, 0.3636, 0.3597, 0.1527, 0.3589, 1.5023, 0, 'roles-v1.1'),
+('EL_2014', 'nba_203995', 10.0, 3.335, 0.2, 0.3366, 0.1407, 0.3589, 1.1224, 0, 'roles-v1.1'),
+('EL_2015', 'nba_1626195', 0.0, 0.0, NULL, 0.3675, 0.0, 0.3675, 0.0, 0, 'roles-v1.1'),
+('EL_2015', 'nba_1626224', 71.0, 5.564, 0.3803, 0.3747, 0.5667, 0.3675, 2.0852, 1, 'roles-v1.1'),
+('EL_2015', 'nba_1626643', 137.0, 8.456, 0.3285, 0.3395, 0.7162, 0.3675, 2.8711, 1, 'roles-v1.1'),
+('EL_2015', 'nba_1627098', 174.0, 6.074, 0.4023, 0.394, 0.7622, 0.3675, 2.3931, 1, 'roles-v1.1'),
+('EL_2015', 'nba_1627733', 8.0, 3.903, 0.25, 0.3524, 0.1284, 0.3675, 1.3756, 0, 'roles-v1.1'),
+('EL_2015', 'nba_1627834', 0.0, 0.0, NULL, 0.3675, 0.0, 0.3675, 0.0, 0, 'roles-v1.1'),
+('EL_2015', 'nba_1627835', 18.0, 4.257, 0.2778, 0.3452, 0.249, 0.3675, 1.4694, 0, 'roles-v1.1'),
+('EL_2015', 'nba_1627851', 77.0, 5.671, 0.3766, 0.3729, 0.5865, 0.3675, 2.1144, 1, 'roles-v1.1'),
+('EL_2015', 'nba_1629029', 16.0, 4.33, 0.3125, 0.355, 0.2276, 0.3675, 1.537, 0, 'roles-v1.1'),
+('EL_2015', 'nba_1629740', 53.0, 2.857, 0.4528, 0.4097, 0.494, 0.3675, 1.1704, 1, 'roles-v1.1'),
+('EL_2015', 'nba_203995', 40.0, 4.47, 0.325, 0.3495, 0.4242, 0.3675, 1.5621, 1, 'roles-v1.1'),
+('EL_2016', 'nba_1626224', 106.0, 5.877, 0.3396, 0.3526, 0.6473, 0.3764, 2.0721, 1, 'roles-v1.1'),
+('EL_2016', 'nba_1626262', 21.0, 2.478, 0.381, 0.3776, 0.2667, 0.3764, 0.9358, 1, 'roles-v1.1'),
+('EL_2016', 'nba_1627790', 0.0, 0.0, NULL, 0.3764, 0.0, 0.3764, 0.0, 0, 'roles-v1.1'),
+('EL_2016', 'nba_1629029', 105.0, 5.429, 0.3714, 0.3732, 0.6451, 0.3764, 2.0261, 1, 'roles-v1.1'),
+('EL_2016', 'nba_1629740', 83.0, 3.408, 0.4337, 0.4102, 0.5897, 0.3764, 1.398, 1, 'roles-v1.1'),
+('EL_2017', 'nba_1626253', 40.0, 2.769, 0.375, 0.3789, 0.4397, 0.382, 1.0494, 1, 'roles-v1.1'),
+('EL_2017', 'nba_1627851', 37.0, 4.336, 0.4324, 0.4032, 0.4206, 0.382, 1.7483, 1, 'roles-v1.1'),
+('EL_2017', 'nba_1629029', 173.0, 7.274, 0.3295, 0.3414, 0.7724, 0.382, 2.4834, 1, 'roles-v1.1'),
+('EL_2017', 'nba_1629740', 79.0, 2.985, 0.4304, 0.4114, 0.6078, 0.382, 1.2282, 1, 'roles-v1.1'),
+('EL_2017', 'nba_1630267', 109.0, 5.659, 0.3761, 0.378, 0.6814, 0.382, 2.1391, 1, 'roles-v1.1'),
+('EL_2017', 'nba_203995', 62.0, 2.767, 0.3548, 0.3671, 0.5488, 0.382, 1.0157, 1, 'roles-v1.1'),
+('EL_2018', 'nba_1626150', 15.0, 6.059, 0.4667, 0.3931, 0.1614, 0.3789, 2.3817, 0, 'roles-v1.1'),
+('EL_2018', 'nba_1626199', 121.0, 6.247, 0.3223, 0.3445, 0.6083, 0.3789, 2.1519, 1, 'roles-v1.1'),
+('EL_2018', 'nba_1626253', 72.0, 7.331, 0.3611, 0.3703, 0.4803, 0.3789, 2.715, 1, 'roles-v1.1'),
+('EL_2018', 'nba_1626262', 36.0, 2.038, 0.4167, 0.3908, 0.316, 0.3789, 0.7965, 1, 'roles-v1.1'),
+('EL_2018', 'nba_1627762', 13.0, 1.792, 0.4615, 0.3907, 0.143, 0.3789, 0.7, 0, 'roles-v1.1'),
+('EL_2018', 'nba_1627834', 0.0, 0.0, NULL, 0.3789, 0.0, 0.3789, 0.0, 0, 'roles-v1.1'),
+('EL_2018', 'nba_1627851', 64.0, 4.503, 0.4688, 0.4194, 0.451, 0.3789, 1.8888, 1, 'roles-v1.1'),
+('EL_2018', 'nba_1629740', 96.0, 3.699, 0.3854, 0.3825, 0.552, 0.3789, 1.4148, 1, 'roles-v1.1'),
+('EL_2018', 'nba_1630267', 115.0, 5.157, 0.3739, 0.3759, 0.5961, 0.3789, 1.9385, 1, 'roles-v1.1'),
+('EL_2018', 'nba_203995', 178.0, 6.141, 0.3708, 0.3733, 0.6956, 0.3789, 2.2921, 1, 'roles-v1.1'),
+('EL_2019', 'nba_1626199', 136.0, 8.941, 0.4118, 0.4031, 0.7249, 0.3802, 3.6041, 1, 'roles-v1.1'),
+('EL_2019', 'nba_1626208', 44.0, 7.011, 0.3636, 0.3726, 0.4602, 0.3802, 2.6123, 1, 'roles-v1.1'),
+('EL_2019', 'nba_1627098', 128.0, 7.889, 0.4297, 0.4155, 0.7127, 0.3802, 3.2775, 1, 'roles-v1.1'),
+('EL_2019', 'nba_1627735', 30.0, 2.679, 0.2667, 0.3385, 0.3676, 0.3802, 0.9068, 1, 'roles-v1.1'),
+('EL_2019', 'nba_1627762', 40.0, 3.16, 0.325, 0.3561, 0.4367, 0.3802, 1.1251, 1, 'roles-v1.1'),
+('EL_2019', 'nba_1627824', 10.0, 7.795, 0.4, 0.3834, 0.1623, 0.3802, 2.9887, 0, 'roles-v1.1'),
+('EL_2019', 'nba_1627834', 2.0, 0.152, 0.0, 0.366, 0.0373, 0.3802, 0.0556, 0, 'roles-v1.1'),
+('EL_2019', 'nba_1627835', 62.0, 3.606, 0.4032, 0.3928, 0.5458, 0.3802, 1.4164, 1, 'roles-v1.1'),
+('EL_2019', 'nba_1627851', 11.0, 5.158, 0.2727, 0.3613, 0.1757, 0.3802, 1.8638, 0, 'roles-v1.1'),
+('EL_2019', 'nba_1630267', 113.0, 6.08, 0.3097, 0.3318, 0.6865, 0.3802, 2.0175, 1, 'roles-v1.1'),
+('EL_2019', 'nba_203995', 131.0, 6.426, 0.3969, 0.3922, 0.7174, 0.3802, 2.5203, 1, 'roles-v1.1'),
+('EL_2020', 'nba_1626199', 150.0, 7.519, 0.3267, 0.3444, 0.688, 0.3836, 2.59, 1, 'roles-v1.1'),
+('EL_2020', 'nba_1626208', 10.0, 7.513, 0.3, 0.3729, 0.1282, 0.3836, 2.8017, 0, 'roles-v1.1'),
+('EL_2020', 'nba_1626209', 41.0, 8.128, 0.3659, 0.3769, 0.3761, 0.3836, 3.064, 1, 'roles-v1.1'),
+('EL_2020', 'nba_1627098', 134.0, 6.049, 0.3881, 0.3866, 0.6633, 0.3836, 2.3382, 1, 'roles-v1.1'),
+('EL_2020', 'nba_1627733', 84.0, 4.651, 0.3452, 0.3624, 0.5526, 0.3836, 1.6856, 1, 'roles-v1.1'),
+('EL_2020', 'nba_1627735', 130.0, 4.397, 0.2846, 0.3186, 0.6565, 0.3836, 1.401, 1, 'roles-v1.1'),
+('EL_2020', 'nba_1627762', 16.0, 1.361, 0.25, 0.3582, 0.1904, 0.3836, 0.4876, 0, 'roles-v1.1'),
+('EL_2020', 'nba_1627790', 0.0, 0.0, NULL, 0.3836, 0.0, 0.3836, 0.0, 0, 'roles-v1.1'),
+('EL_2020', 'nba_1627816', 7.0, 0.419, 0.0, 0.3478, 0.0933, 0.3836, 0.1459, 0, 'roles-v1.1'),
+('EL_2020', 'nba_1627824', 112.0, 5.348, 0.3839, 0.3838, 0.6222, 0.3836, 2.0525, 1, 'roles-v1.1'),
+('EL_2020', 'nba_1627834', 8.0, 0.411, 0.125, 0.3564, 0.1052, 0.3836, 0.1466, 0, 'roles-v1.1'),
+('EL_2020', 'nba_1627835', 137.0, 5.752, 0.438, 0.4199, 0.6682, 0.3836, 2.4156, 1, 'roles-v1.1'),
+('EL_2020', 'nba_1630267', 51.0, 7.128, 0.2745, 0.3369, 0.4285, 0.3836, 2.4013, 1, 'roles-v1.1'),
+('EL_2020', 'nba_203995', 193.0, 5.792, 0.3886, 0.3873, 0.7394, 0.3836, 2.2431, 1, 'roles-v1.1'),
+('EL_2021', 'nba_1626170', 37.0, 4.133, 0.2432, 0.3223, 0.301, 0.3563, 1.3319, 1, 'roles-v1.1'),
+('EL_2021', 'nba_1626199', 122.0, 9.041, 0.3852, 0.3733, 0.5868, 0.3563, 3.3748, 1, 'roles-v1.1'),
+('EL_2021', 'nba_1626209', 129.0, 6.269, 0.3488, 0.3518, 0.6003, 0.3563, 2.2056, 1, 'roles-v1.1'),
+('EL_2021', 'nba_1627098', 119.0, 6.316, 0.3277, 0.3397, 0.5808, 0.3563, 2.1456, 1, 'roles-v1.1'),
+('EL_2021', 'nba_1627735', 100.0, 4.278, 0.34, 0.3475, 0.5379, 0.3563, 1.4868, 1, 'roles-v1.1'),
+('EL_2021', 'nba_1627762', 23.0, 2.285, 0.2609, 0.3362, 0.2112, 0.3563, 0.7683, 1, 'roles-v1.1'),
+('EL_2021', 'nba_1627790', 0.0, 0.0, NULL, 0.3563, 0.0, 0.3563, 0.0, 0, 'roles-v1.1'),
+('EL_2021', 'nba_1627812', 8.0, 7.203, 0.25, 0.3473, 0.0852, 0.3563, 2.5013, 0, 'roles-v1.1'),
+('EL_2021', 'nba_1627816', 2.0, 0.155, 0.0, 0.3482, 0.0228, 0.3563, 0.054, 0, 'roles-v1.1'),
+('EL_2021', 'nba_1627824', 132.0, 4.784, 0.4015, 0.3837, 0.6058, 0.3563, 1.8355, 1, 'roles-v1.1'),
+('EL_2021', 'nba_1627834', 0.0, 0.0, NULL, 0.3563, 0.0, 0.3563, 0.0, 0, 'roles-v1.1'),
+('EL_2021', 'nba_1627835', 3.0, 5.051, 0.3333, 0.3555, 0.0337, 0.3563, 1.7957, 0, 'roles-v1.1'),
+('EL_2021', 'nba_1627851', 35.0, 4.59, 0.3714, 0.3607, 0.2895, 0.3563, 1.6555, 1, 'roles-v1.1'),
+('EL_2021', 'nba_1629740', 48.0, 2.16, 0.2917, 0.3331, 0.3585, 0.3563, 0.7195, 1, 'roles-v1.1'),
+('EL_2021', 'nba_203995', 224.0, 7.852, 0.3393, 0.344, 0.7228, 0.3563, 2.7012, 1, 'roles-v1.1'),
+('EL_2022', 'nba_1626199', 94.0, 7.848, 0.4468, 0.4122, 0.5671, 0.3668, 3.2346, 1, 'roles-v1.1'),
+('EL_2022', 'nba_1626209', 178.0, 8.0, 0.4326, 0.4137, 0.7127, 0.3668, 3.3096, 1, 'roles-v1.1'),
+('EL_2022', 'nba_1627735', 196.0, 7.397, 0.3265, 0.3373, 0.732, 0.3668, 2.4952, 1, 'roles-v1.1'),
+('EL_2022', 'nba_1627762', 4.0, 0.364, 0.5, 0.3739, 0.0528, 0.3668, 0.136, 0, 'roles-v1.1'),
+('EL_2022', 'nba_1627789', 72.0, 5.015, 0.3333, 0.35, 0.5009, 0.3668, 1.7555, 1, 'roles-v1.1'),
+('EL_2022', 'nba_1627790', 0.0, 0.0, NULL, 0.3668, 0.0, 0.3668, 0.0, 0, 'roles-v1.1'),
+('EL_2022', 'nba_1627816', 10.0, 1.008, 0.2, 0.3464, 0.1223, 0.3668, 0.349, 0, 'roles-v1.1'),
+('EL_2022', 'nba_1627822', 86.0, 6.447, 0.3953, 0.3824, 0.5452, 0.3668, 2.4651, 1, 'roles-v1.1'),
+('EL_2022', 'nba_1627824', 76.0, 3.965, 0.4211, 0.3947, 0.5144, 0.3668, 1.5651, 1, 'roles-v1.1'),
+('EL_2022', 'nba_1627834', 37.0, 1.701, 0.4865, 0.4075, 0.3403, 0.3668, 0.6932, 1, 'roles-v1.1'),
+('EL_2022', 'nba_1627835', 33.0, 6.255, 0.4242, 0.3849, 0.3151, 0.3668, 2.4075, 1, 'roles-v1.1'),
+('EL_2022', 'nba_1629740', 69.0, 3.068, 0.3623, 0.3646, 0.4903, 0.3668, 1.1187, 1, 'roles-v1.1'),
+('EL_2022', 'nba_1630267', 54.0, 7.562, 0.3333, 0.3524, 0.4295, 0.3668, 2.665, 1, 'roles-v1.1'),
+('EL_2022', 'nba_203995', 210.0, 7.795, 0.3571, 0.3596, 0.7454, 0.3668, 2.803, 1, 'roles-v1.1'),
+('EL_2023', 'nba_1626147', 45.0, 4.828, 0.3333, 0.3553, 0.3984, 0.3698, 1.7154, 1, 'roles-v1.1'),
+('EL_2023', 'nba_1626163', 64.0, 4.462, 0.4062, 0.3875, 0.485, 0.3698, 1.7288, 1, 'roles-v1.1'),
+('EL_2023', 'nba_1626170', 113.0, 3.597, 0.4159, 0.3986, 0.6245, 0.3698, 1.4337, 1, 'roles-v1.1'),
+('EL_2023', 'nba_1626195', 11.0, 0.642, 0.3636, 0.369, 0.1393, 0.3698, 0.2368, 0, 'roles-v1.1'),
+('EL_2023', 'nba_1626209', 195.0, 7.926, 0.4308, 0.415, 0.7416, 0.3698, 3.2894, 1, 'roles-v1.1'),
+('EL_2023', 'nba_1627735', 110.0, 4.791, 0.3909, 0.3829, 0.6181, 0.3698, 1.8342, 1, 'roles-v1.1'),
+('EL_2023', 'nba_1627762', 27.0, 1.156, 0.3333, 0.3595, 0.2844, 0.3698, 0.4155, 1, 'roles-v1.1'),
+('EL_2023', 'nba_1627789', 93.0, 4.25, 0.3763, 0.3736, 0.5778, 0.3698, 1.5877, 1, 'roles-v1.1'),
+('EL_2023', 'nba_1627790', 0.0, 0.0, NULL, 0.3698, 0.0, 0.3698, 0.0, 0, 'roles-v1.1'),
+('EL_2023', 'nba_1627816', 5.0, 0.466, 0.2, 0.3582, 0.0685, 0.3698, 0.1671, 0, 'roles-v1.1'),
+('EL_2023', 'nba_1627822', 42.0, 5.444, 0.3333, 0.3559, 0.382, 0.3698, 1.9376, 1, 'roles-v1.1'),
+('EL_2023', 'nba_1627823', 72.0, 5.097, 0.2639, 0.3153, 0.5145, 0.3698, 1.6072, 1, 'roles-v1.1'),
+('EL_2023', 'nba_1627824', 76.0, 4.296, 0.4605, 0.4177, 0.528, 0.3698, 1.7944, 1, 'roles-v1.1'),
+('EL_2023', 'nba_1627834', 41.0, 2.431, 0.4878, 0.4142, 0.3763, 0.3698, 1.0071, 1, 'roles-v1.1'),
+('EL_2023', 'nba_1629740', 75.0, 3.251, 0.3867, 0.3787, 0.5247, 0.3698, 1.231, 1, 'roles-v1.1'),
+('EL_2023', 'nba_1630267', 149.0, 5.732, 0.3221, 0.3371, 0.6868, 0.3698, 1.9323, 1, 'roles-v1.1'),
+('EL_2024', 'nba_1626147', 75.0, 3.729, 0.4133, 0.3925, 0.552, 0.3669, 1.4637, 1, 'roles-v1.1'),
+('EL_2024', 'nba_1626169', 15.0, 4.048, 0.1333, 0.3207, 0.1977, 0.3669, 1.2985, 0, 'roles-v1.1'),
+('EL_2024', 'nba_1626170', 114.0, 3.726, 0.4298, 0.4079, 0.6519, 0.3669, 1.5199, 1, 'roles-v1.1'),
+('EL_2024', 'nba_1626195', 1.0, 0.067, 0.0, 0.361, 0.0162, 0.3669, 0.0241, 0, 'roles-v1.1'),
+('EL_2024', 'nba_1626209', 232.0, 8.122, 0.3147, 0.3255, 0.7922, 0.3669, 2.6438, 1, 'roles-v1.1'),
+('EL_2024', 'nba_1626224', 138.0, 6.426, 0.3768, 0.3738, 0.6939, 0.3669, 2.402, 1, 'roles-v1.1'),
+('EL_2024', 'nba_1626246', 1.0, 0.596, 0.0, 0.361, 0.0162, 0.3669, 0.215, 0, 'roles-v1.1'),
+('EL_2024', 'nba_1627735', 81.0, 4.458, 0.3086, 0.3336, 0.571, 0.3669, 1.4875, 1, 'roles-v1.1'),
+('EL_2024', 'nba_1627762', 8.0, 0.659, 0.375, 0.3679, 0.1162, 0.3669, 0.2425, 0, 'roles-v1.1'),
+('EL_2024', 'nba_1627789', 101.0, 5.607, 0.3366, 0.348, 0.624, 0.3669, 1.9514, 1, 'roles-v1.1'),
+('EL_2024', 'nba_1627790', 0.0, 0.0, NULL, 0.3669, 0.0, 0.3669, 0.0, 0, 'roles-v1.1'),
+('EL_2024', 'nba_1627820', 2.0, 3.221, 0.0, 0.3552, 0.0318, 0.3669, 1.1444, 0, 'roles-v1.1'),
+('EL_2024', 'nba_1627822', 12.0, 2.569, 0.25, 0.3477, 0.1647, 0.3669, 0.8931, 0, 'roles-v1.1'),
+('EL_2024', 'nba_1627823', 142.0, 4.678, 0.4296, 0.4108, 0.7, 0.3669, 1.9215, 1, 'roles-v1.1'),
+('EL_2024', 'nba_1627834', 28.0, 2.106, 0.3929, 0.3751, 0.3151, 0.3669, 0.7898, 1, 'roles-v1.1'),
+('EL_2024', 'nba_1629740', 83.0, 4.551, 0.3735, 0.3707, 0.5769, 0.3669, 1.6872, 1, 'roles-v1.1'),
+('EL_2024', 'nba_1630267', 154.0, 5.523, 0.3377, 0.346, 0.7167, 0.3669, 1.9106, 1, 'roles-v1.1'),
+('GL_2015', 'nba_101249', 115.0, 6.58, 0.3565, 0.3557, 0.6228, 0.3543, 2.3404, 1, 'roles-v1.1'),
+('GL_2015', 'nba_1626147', 48.0, 6.446, 0.3333, 0.3457, 0.408, 0.3543, 2.2286, 1, 'roles-v1.1'),
+('GL_2015', 'nba_1626150', 208.0, 4.615, 0.3654, 0.3626, 0.7492, 0.3543, 1.6736, 1, 'roles-v1.1'),
+('GL_2015', 'nba_1626166', 14.0, 7.413, 0.4286, 0.3667, 0.1674, 0.3543, 2.7185, 0, 'roles-v1.1'),
+('GL_2015', 'nba_1626174', 87.0, 3.396, 0.2529, 0.298, 0.5554, 0.3543, 1.0117, 1, 'roles-v1.1'),
+('GL_2015', 'nba_1626188', 225.0, 5.581, 0.3822, 0.3756, 0.7636, 0.3543, 2.0963, 1, 'roles-v1.1'),
+('GL_2015', 'nba_1626199', 25.0, 9.137, 0.44, 0.3769, 0.2642, 0.3543, 3.444, 1, 'roles-v1.1'),
+('GL_2015', 'nba_1626203', 207.0, 5.333, 0.3285, 0.335, 0.7483, 0.3543, 1.7867, 1, 'roles-v1.1'),
+('GL_2015', 'nba_1626208', 92.0, 2.138, 0.3152, 0.332, 0.5692, 0.3543, 0.71, 1, 'roles-v1.1'),
+('GL_2015', 'nba_1626246', 0.0, 0.0, NULL, 0.3543, 0.0, 0.3543, 0.0, 0, 'roles-v1.1'),
+('GL_2015', 'nba_1626253', 115.0, 4.362, 0.313, 0.3286, 0.6228, 0.3543, 1.4334, 1, 'roles-v1.1'),
+('GL_2015', 'nba_1626262', 187.0, 5.846, 0.4064, 0.3923, 0.7287, 0.3543, 2.2932, 1, 'roles-v1.1'),
+('GL_2016', 'nba_101126', 62.0, 5.071, 0.4194, 0.3855, 0.5176, 0.3492, 1.9549, 1, 'roles-v1.1'),
+('GL_2016', 'nba_101198', 87.0, 5.268, 0.2989, 0.3189, 0.6009, 0.3492, 1.6803, 1, 'roles-v1.1'),
+('GL_2016', 'nba_1626166', 38.0, 10.471, 0.3158, 0.3359, 0.3968, 0.3492, 3.5175, 1, 'roles-v1.1'),
+('GL_2016', 'nba_1626169', 8.0, 7.694, 0.375, 0.3523, 0.1216, 0.3492, 2.7106, 0, 'roles-v1.1'),
+('GL_2016', 'nba_1626170', 10.0, 4.33, 0.3, 0.3419, 0.1475, 0.3492, 1.4804, 0, 'roles-v1.1'),
+('GL_2016', 'nba_1626174', 51.0, 3.4, 0.2353, 0.2958, 0.4689, 0.3492, 1.0057, 1, 'roles-v1.1'),
+('GL_2016', 'nba_1626188', 261.0, 6.257, 0.3716, 0.3676, 0.8188, 0.3492, 2.2998, 1, 'roles-v1.1'),
+('GL_2016', 'nba_1626199', 32.0, 8.438, 0.4062, 0.3695, 0.3564, 0.3492, 3.1178, 1, 'roles-v1.1'),
+('GL_2016', 'nba_1626253', 104.0, 3.77, 0.3462, 0.3472, 0.6429, 0.3492, 1.3092, 1, 'roles-v1.1'),
+('GL_2016', 'nba_1627735', 74.0, 2.858, 0.3108, 0.3276, 0.5616, 0.3492, 0.9363, 1, 'roles-v1.1'),
+('GL_2016', 'nba_1627756', 39.0, 11.87, 0.5385, 0.4255, 0.403, 0.3492, 5.0501, 1, 'roles-v1.1'),
+('GL_2016', 'nba_1627762', 47.0, 2.049, 0.4681, 0.4025, 0.4486, 0.3492, 0.8249, 1, 'roles-v1.1'),
+('GL_2016', 'nba_1627767', 4.0, 0.199, 0.0, 0.3266, 0.0648, 0.3492, 0.0649, 0, 'roles-v1.1'),
+('GL_2016', 'nba_1627775', 10.0, 5.087, 0.2, 0.3272, 0.1475, 0.3492, 1.6644, 0, 'roles-v1.1'),
+('GL_2016', 'nba_1627789', 6.0, 2.654, 0.5, 0.3634, 0.0941, 0.3492, 0.9646, 0, 'roles-v1.1'),
+('GL_2016', 'nba_1627812', 123.0, 6.898, 0.3984, 0.3827, 0.6804, 0.3492, 2.6397, 1, 'roles-v1.1'),
+('GL_2016', 'nba_1627814', 88.0, 5.819, 0.4659, 0.4196, 0.6037, 0.3492, 2.4419, 1, 'roles-v1.1'),
+('GL_2016', 'nba_1627816', 77.0, 1.939, 0.4026, 0.3797, 0.5713, 0.3492, 0.7362, 1, 'roles-v1.1'),
+('GL_2016', 'nba_1627820', 62.0, 2.189, 0.2419, 0.2937, 0.5176, 0.3492, 0.6427, 1, 'roles-v1.1'),
+('GL_2016', 'nba_1627823', 5.0, 6.936, 0.2, 0.3373, 0.0797, 0.3492, 2.3396, 0, 'roles-v1.1'),
+('GL_2016', 'nba_1627824', 6.0, 4.036, 0.6667, 0.3791, 0.0941, 0.3492, 1.5297, 0, 'roles-v1.1'),
+('GL_2016', 'nba_1627834', 6.0, 0.292, 0.5, 0.3634, 0.0941, 0.3492, 0.1062, 0, 'roles-v1.1'),
+('GL_2016', 'nba_1627835', 11.0, 3.728, 0.3636, 0.3515, 0.1599, 0.3492, 1.3102, 0, 'roles-v1.1'),
+('GL_2016', 'nba_1627846', 285.0, 7.656, 0.3474, 0.3477, 0.8315, 0.3492, 2.6619, 1, 'roles-v1.1'),
+('GL_2016', 'nba_1627853', 95.0, 2.645, 0.4211, 0.3939, 0.6218, 0.3492, 1.0419, 1, 'roles-v1.1'),
+('GL_2016', 'nba_1627858', 42.0, 1.539, 0.2857, 0.3225, 0.4209, 0.3492, 0.4963, 1, 'roles-v1.1'),
+('GL_2017', 'nba_101187', 62.0, 6.191, 0.3548, 0.3512, 0.4249, 0.3485, 2.1742, 1, 'roles-v1.1'),
+('GL_2017', 'nba_1626166', 19.0, 9.569, 0.3158, 0.3425, 0.1846, 0.3485, 3.2768, 0, 'roles-v1.1'),
+('GL_2017', 'nba_1626174', 163.0, 3.943, 0.319, 0.329, 0.6602, 0.3485, 1.2973, 1, 'roles-v1.1'),
+('GL_2017', 'nba_1626188', 189.0, 6.53, 0.4392, 0.4113, 0.6925, 0.3485, 2.6856, 1, 'roles-v1.1'),
+('GL_2017', 'nba_1626199', 199.0, 7.001, 0.402, 0.3861, 0.7034, 0.3485, 2.7034, 1, 'roles-v1.1'),
+('GL_2017', 'nba_1626224', 10.0, 9.226, 0.2, 0.3327, 0.1065, 0.3485, 3.0694, 0, 'roles-v1.1'),
+('GL_2017', 'nba_1626643', 94.0, 8.5, 0.3085, 0.3274, 0.5283, 0.3485, 2.7825, 1, 'roles-v1.1'),
+('GL_2017', 'nba_1627735', 71.0, 4.46, 0.2394, 0.2985, 0.4583, 0.3485, 1.3313, 1, 'roles-v1.1'),
+('GL_2017', 'nba_1627762', 47.0, 1.698, 0.3191, 0.338, 0.359, 0.3485, 0.5738, 1, 'roles-v1.1'),
+('GL_2017', 'nba_1627775', 10.0, 6.163, 0.2, 0.3327, 0.1065, 0.3485, 2.0502, 0, 'roles-v1.1'),
+('GL_2017', 'nba_1627785', 172.0, 7.204, 0.3605, 0.3565, 0.6721, 0.3485, 2.5683, 1, 'roles-v1.1'),
+('GL_2017', 'nba_1627790', 1.0, 0.079, 0.0, 0.3444, 0.0118, 0.3485, 0.0271, 0, 'roles-v1.1'),
+('GL_2017', 'nba_1627814', 164.0, 5.228, 0.3049, 0.3196, 0.6615, 0.3485, 1.671, 1, 'roles-v1.1'),
+('GL_2017', 'nba_1627816', 22.0, 3.329, 0.2273, 0.3233, 0.2077, 0.3485, 1.0761, 1, 'roles-v1.1'),
+('GL_2017', 'nba_1627820', 60.0, 2.504, 0.25, 0.3074, 0.4169, 0.3485, 0.7699, 1, 'roles-v1.1'),
+('GL_2017', 'nba_1627824', 88.0, 6.391, 0.3636, 0.3562, 0.5119, 0.3485, 2.2769, 1, 'roles-v1.1'),
+('GL_2017', 'nba_1627834', 1.0, 0.133, 0.0, 0.3444, 0.0118, 0.3485, 0.0458, 0, 'roles-v1.1'),
+('GL_2017', 'nba_1627835', 12.0, 5.635, 0.3333, 0.3466, 0.1251, 0.3485, 1.953, 0, 'roles-v1.1'),
+('GL_2017', 'nba_1627846', 22.0, 5.358, 0.4091, 0.3611, 0.2077, 0.3485, 1.9346, 1, 'roles-v1.1'),
+('GL_2017', 'nba_1627853', 164.0, 4.035, 0.4512, 0.4164, 0.6615, 0.3485, 1.6803, 1, 'roles-v1.1'),
+('GL_2017', 'nba_1627858', 41.0, 2.071, 0.3171, 0.3382, 0.3282, 0.3485, 0.7005, 1, 'roles-v1.1'),
+('GL_2018', 'nba_101127', 3.0, 3.681, 0.3333, 0.343, 0.0435, 0.3434, 1.2626, 0, 'roles-v1.1'),
+('GL_2018', 'nba_1626174', 98.0, 3.571, 0.2653, 0.2967, 0.5978, 0.3434, 1.0596, 1, 'roles-v1.1'),
+('GL_2018', 'nba_1626203', 5.0, 6.998, 0.4, 0.3474, 0.0705, 0.3434, 2.4314, 0, 'roles-v1.1'),
+('GL_2018', 'nba_1627735', 56.0, 4.482, 0.3571, 0.3497, 0.4592, 0.3434, 1.5673, 1, 'roles-v1.1'),
+('GL_2018', 'nba_1627785', 114.0, 5.607, 0.2982, 0.3148, 0.6335, 0.3434, 1.7651, 1, 'roles-v1.1'),
+('GL_2018', 'nba_1627814', 123.0, 5.859, 0.3984, 0.3792, 0.651, 0.3434, 2.2216, 1, 'roles-v1.1'),
+('GL_2018', 'nba_1627816', 71.0, 4.078, 0.2958, 0.3187, 0.5185, 0.3434, 1.2999, 1, 'roles-v1.1'),
+('GL_2018', 'nba_1627824', 6.0, 7.828, 0.1667, 0.3287, 0.0834, 0.3434, 2.573, 0, 'roles-v1.1'),
+('GL_2018', 'nba_1627846', 19.0, 7.647, 0.2632, 0.3255, 0.2237, 0.3434, 2.4889, 0, 'roles-v1.1'),
+('GL_2018', 'nba_1627858', 59.0, 2.439, 0.322, 0.3333, 0.4722, 0.3434, 0.8129, 1, 'roles-v1.1'),
+('GL_2019', 'nba_101127', 53.0, 3.111, 0.3019, 0.3252, 0.404, 0.3411, 1.012, 1, 'roles-v1.1'),
+('GL_2019', 'nba_1626147', 237.0, 8.19, 0.3544, 0.3511, 0.7519, 0.3411, 2.8756, 1, 'roles-v1.1'),
+('GL_2019', 'nba_1626150', 227.0, 7.742, 0.3612, 0.3561, 0.7438, 0.3411, 2.7568, 1, 'roles-v1.1'),
+('GL_2019', 'nba_1626166', 115.0, 9.362, 0.3652, 0.3554, 0.5953, 0.3411, 3.3277, 1, 'roles-v1.1'),
+('GL_2019', 'nba_1626169', 25.0, 8.764, 0.24, 0.3166, 0.2423, 0.3411, 2.7745, 1, 'roles-v1.1'),
+('GL_2019', 'nba_1626170', 147.0, 4.08, 0.4354, 0.4026, 0.6528, 0.3411, 1.6426, 1, 'roles-v1.1'),
+('GL_2019', 'nba_1627733', 74.0, 7.115, 0.3784, 0.3592, 0.4862, 0.3411, 2.5556, 1, 'roles-v1.1'),
+('GL_2019', 'nba_1627756', 9.0, 10.007, 0.4444, 0.3517, 0.1032, 0.3411, 3.5199, 0, 'roles-v1.1'),
+('GL_2019', 'nba_1627789', 69.0, 7.471, 0.2899, 0.3171, 0.4688, 0.3411, 2.3689, 1, 'roles-v1.1'),
+('GL_2019', 'nba_1627820', 18.0, 5.857, 0.4444, 0.3604, 0.1871, 0.3411, 2.1108, 0, 'roles-v1.1'),
+('GL_2019', 'nba_1627858', 38.0, 2.04, 0.3158, 0.3328, 0.327, 0.3411, 0.6788, 1, 'roles-v1.1'),
+('GL_2020', 'nba_101127', 42.0, 4.066, 0.3571, 0.3511, 0.4087, 0.347, 1.4278, 1, 'roles-v1.1'),
+('GL_2020', 'nba_1626253', 44.0, 5.547, 0.3864, 0.3635, 0.42, 0.347, 2.0162, 1, 'roles-v1.1'),
+('GL_2020', 'nba_1627812', 80.0, 7.268, 0.3875, 0.37, 0.5683, 0.347, 2.689, 1, 'roles-v1.1'),
+('GL_2020', 'nba_1627820', 42.0, 4.344, 0.2857, 0.3219, 0.4087, 0.347, 1.3985, 1, 'roles-v1.1'),
+('GL_2021', 'nba_1626147', 225.0, 9.779, 0.3956, 0.3828, 0.7535, 0.3439, 3.7436, 1, 'roles-v1.1'),
+('GL_2021', 'nba_1626150', 8.0, 6.558, 0.125, 0.3224, 0.098, 0.3439, 2.1145, 0, 'roles-v1.1'),
+('GL_2021', 'nba_1626188', 75.0, 6.955, 0.44, 0.3924, 0.5047, 0.3439, 2.729, 1, 'roles-v1.1'),
+('GL_2021', 'nba_1626203', 45.0, 3.585, 0.3111, 0.3315, 0.3794, 0.3439, 1.1883, 1, 'roles-v1.1'),
+('GL_2021', 'nba_1627739', 32.0, 2.849, 0.25, 0.3154, 0.303, 0.3439, 0.8987, 1, 'roles-v1.1'),
+('GL_2021', 'nba_1627748', 47.0, 3.863, 0.2128, 0.2928, 0.3897, 0.3439, 1.1311, 1, 'roles-v1.1'),
+('GL_2021', 'nba_1627756', 89.0, 8.366, 0.3596, 0.3525, 0.5473, 0.3439, 2.9487, 1, 'roles-v1.1'),
+('GL_2021', 'nba_1627767', 6.0, 0.3, 0.1667, 0.3305, 0.0754, 0.3439, 0.0993, 0, 'roles-v1.1'),
+('GL_2021', 'nba_1627775', 57.0, 4.735, 0.3333, 0.3393, 0.4364, 0.3439, 1.6066, 1, 'roles-v1.1'),
+('GL_2021', 'nba_1627820', 109.0, 6.118, 0.4312, 0.396, 0.5969, 0.3439, 2.4228, 1, 'roles-v1.1'),
+('GL_2021', 'nba_1627822', 150.0, 6.502, 0.3667, 0.3592, 0.6708, 0.3439, 2.3353, 1, 'roles-v1.1'),
+('GL_2021', 'nba_1627853', 5.0, 5.07, 0.0, 0.322, 0.0636, 0.3439, 1.6328, 0, 'roles-v1.1'),
+('GL_2022', 'nba_1626147', 194.0, 6.223, 0.3247, 0.3335, 0.7101, 0.3551, 2.0756, 1, 'roles-v1.1'),
+('GL_2022', 'nba_1626161', 17.0, 1.741, 0.2941, 0.3443, 0.1767, 0.3551, 0.5995, 0, 'roles-v1.1'),
+('GL_2022', 'nba_1626203', 33.0, 5.066, 0.3333, 0.3487, 0.2941, 0.3551, 1.7667, 1, 'roles-v1.1'),
+('GL_2022', 'nba_1626208', 139.0, 5.411, 0.2878, 0.3122, 0.637, 0.3551, 1.6895, 1, 'roles-v1.1'),
+('GL_2022', 'nba_1627739', 51.0, 3.124, 0.4118, 0.3773, 0.3917, 0.3551, 1.1787, 1, 'roles-v1.1'),
+('GL_2022', 'nba_1627756', 160.0, 8.691, 0.3875, 0.3768, 0.6689, 0.3551, 3.2746, 1, 'roles-v1.1'),
+('GL_2022', 'nba_1627775', 93.0, 5.211, 0.3011, 0.3259, 0.5401, 0.3551, 1.6983, 1, 'roles-v1.1'),
+('GL_2023', 'nba_1626159', 77.0, 4.689, 0.2987, 0.3235, 0.5229, 0.3506, 1.5168, 1, 'roles-v1.1'),
+('GL_2023', 'nba_1626169', 146.0, 6.249, 0.411, 0.3914, 0.6751, 0.3506, 2.4454, 1, 'roles-v1.1'),
+('GL_2023', 'nba_1626203', 16.0, 3.964, 0.0625, 0.2972, 0.1855, 0.3506, 1.1781, 0, 'roles-v1.1'),
+('GL_2023', 'nba_1626208', 64.0, 3.844, 0.2656, 0.3101, 0.4767, 0.3506, 1.1922, 1, 'roles-v1.1'),
+('GL_2023', 'nba_1627775', 113.0, 4.67, 0.3805, 0.3691, 0.6166, 0.3506, 1.7236, 1, 'roles-v1.1'),
+('GL_2023', 'nba_1627853', 64.0, 6.893, 0.2969, 0.325, 0.4767, 0.3506, 2.2405, 1, 'roles-v1.1'),
+('GL_2024', 'nba_1626159', 43.0, 5.575, 0.3488, 0.3514, 0.3525, 0.3528, 1.9589, 1, 'roles-v1.1'),
+('GL_2024', 'nba_1626163', 106.0, 6.19, 0.3491, 0.3506, 0.573, 0.3528, 2.1706, 1, 'roles-v1.1'),
+('GL_2024', 'nba_1626169', 104.0, 6.574, 0.3077, 0.3272, 0.5683, 0.3528, 2.1508, 1, 'roles-v1.1'),
+('GL_2024', 'nba_1627748', 25.0, 6.788, 0.16, 0.3064, 0.2404, 0.3528, 2.0802, 1, 'roles-v1.1'),
+('GL_2024', 'nba_1627775', 109.0, 3.843, 0.2752, 0.3078, 0.5798, 0.3528, 1.183, 1, 'roles-v1.1'),
+('GL_2024', 'nba_1627853', 31.0, 5.904, 0.2258, 0.317, 0.2818, 0.3528, 1.8714, 1, 'roles-v1.1'),
+('NBA_2000', 'nba_1531', 23.0, 0.588, 0.2174, 0.3213, 0.2239, 0.3512, 0.189, 1, 'roles-v1.1'),
+('NBA_2001', 'nba_1531', 1.0, 0.072, 0.0, 0.3435, 0.0161, 0.3492, 0.0248, 0, 'roles-v1.1'),
+('NBA_2002', 'nba_1531', 1.0, 0.035, 1.0, 0.3535, 0.0082, 0.3482, 0.0122, 0, 'roles-v1.1'),
+('NBA_2003', 'nba_1531', 1.0, 0.06, 0.0, 0.345, 0.0101, 0.3485, 0.0208, 0, 'roles-v1.1'),
+('NBA_2004', 'nba_1531', 2.0, 0.037, 0.0, 0.3395, 0.0251, 0.3483, 0.0124, 0, 'roles-v1.1'),
+('NBA_2005', 'nba_101126', 146.0, 3.405, 0.3973, 0.3815, 0.6584, 0.3511, 1.2989, 1, 'roles-v1.1'),
+('NBA_2005', 'nba_101127', 76.0, 1.711, 0.2632, 0.307, 0.5009, 0.3511, 0.5254, 1, 'roles-v1.1'),
+('NBA_2005', 'nba_101132', 13.0, 0.902, 0.1538, 0.3222, 0.1465, 0.3511, 0.2906, 0, 'roles-v1.1'),
+('NBA_2005', 'nba_101137', 78.0, 2.891, 0.2821, 0.3161, 0.5074, 0.3511, 0.9138, 1, 'roles-v1.1'),
+('NBA_2005', 'nba_101187', 58.0, 3.705, 0.4138, 0.3783, 0.4337, 0.3511, 1.4014, 1, 'roles-v1.1'),
+('NBA_2005', 'nba_101198', 9.0, 1.996, 0.2222, 0.3374, 0.1062, 0.3511, 0.6735, 0, 'roles-v1.1'),
+('NBA_2005', 'nba_101212', 1.0, 0.073, 0.0, 0.3465, 0.013, 0.3511, 0.0252, 0, 'roles-v1.1'),
+('NBA_2005', 'nba_101249', 9.0, 3.038, 0.2222, 0.3374, 0.1062, 0.3511, 1.0251, 0, 'roles-v1.1'),
+('NBA_2005', 'nba_1531', 2.0, 0.07, 0.5, 0.3549, 0.0257, 0.3511, 0.0249, 0, 'roles-v1.1'),
+('NBA_2006', 'nba_101126', 213.0, 5.656, 0.3897, 0.3792, 0.7058, 0.354, 2.1446, 1, 'roles-v1.1'),
+('NBA_2006', 'nba_101127', 180.0, 2.445, 0.35, 0.3513, 0.6696, 0.354, 0.8588, 1, 'roles-v1.1'),
+('NBA_2006', 'nba_101132', 221.0, 5.347, 0.3756, 0.3694, 0.7134, 0.354, 1.975, 1, 'roles-v1.1'),
+('NBA_2006', 'nba_101137', 44.0, 2.225, 0.3182, 0.3421, 0.3313, 0.354, 0.7612, 1, 'roles-v1.1'),
+('NBA_2006', 'nba_101141', 148.0, 5.476, 0.3649, 0.3608, 0.625, 0.354, 1.9757, 1, 'roles-v1.1'),
+('NBA_2006', 'nba_101187', 20.0, 2.817, 0.25, 0.3349, 0.1838, 0.354, 0.9432, 1, 'roles-v1.1'),
+('NBA_2006', 'nba_101212', 0.0, 0.0, NULL, 0.354, 0.0, 0.354, 0.0, 0, 'roles-v1.1'),
+('NBA_2006', 'nba_101249', 59.0, 5.539, 0.2542, 0.3142, 0.3992, 0.354, 1.7402, 1, 'roles-v1.1'),
+('NBA_2006', 'nba_1531', 1.0, 0.035, 0.0, 0.3501, 0.0111, 0.354, 0.0123, 0, 'roles-v1.1'),
+('NBA_2007', 'nba_101126', 292.0, 5.583, 0.3322, 0.3371, 0.768, 0.3534, 1.8821, 1, 'roles-v1.1'),
+('NBA_2007', 'nba_101127', 190.0, 3.068, 0.3421, 0.3457, 0.6829, 0.3534, 1.0606, 1, 'roles-v1.1'),
+('NBA_2007', 'nba_101132', 277.0, 5.279, 0.3394, 0.3427, 0.7584, 0.3534, 1.8094, 1, 'roles-v1.1'),
+('NBA_2008', 'nba_101126', 385.0, 6.276, 0.3247, 0.3304, 0.831, 0.3583, 2.0732, 1, 'roles-v1.1'),
+('NBA_2008', 'nba_101127', 221.0, 2.929, 0.3529, 0.3543, 0.7384, 0.3583, 1.0378, 1, 'roles-v1.1'),
+('NBA_2008', 'nba_101132', 267.0, 5.269, 0.3258, 0.3332, 0.7733, 0.3583, 1.7558, 1, 'roles-v1.1'),
+('NBA_2008', 'nba_101146', 62.0, 2.509, 0.1774, 0.2784, 0.442, 0.3583, 0.6985, 1, 'roles-v1.1'),
+('NBA_2008', 'nba_101198', 19.0, 0.852, 0.1579, 0.3192, 0.1953, 0.3583, 0.272, 0, 'roles-v1.1'),
+('NBA_2009', 'nba_101126', 223.0, 7.195, 0.3901, 0.3791, 0.7513, 0.3458, 2.7274, 1, 'roles-v1.1'),
+('NBA_2009', 'nba_101127', 199.0, 3.193, 0.4121, 0.3941, 0.7294, 0.3458, 1.2586, 1, 'roles-v1.1'),
+('NBA_2009', 'nba_101141', 241.0, 4.572, 0.3361, 0.3384, 0.7655, 0.3458, 1.547, 1, 'roles-v1.1'),
+('NBA_2009', 'nba_101146', 12.0, 4.456, 0.25, 0.3324, 0.1398, 0.3458, 1.4811, 0, 'roles-v1.1'),
+('NBA_2009', 'nba_101198', 55.0, 1.188, 0.2182, 0.2913, 0.427, 0.3458, 0.3461, 1, 'roles-v1.1'),
+('NBA_2010', 'nba_101126', 200.0, 7.106, 0.325, 0.3356, 0.6761, 0.3579, 2.3851, 1, 'roles-v1.1'),
+('NBA_2010', 'nba_101127', 108.0, 2.258, 0.3056, 0.3301, 0.5299, 0.3579, 0.7453, 1, 'roles-v1.1'),
+('NBA_2010', 'nba_101132', 131.0, 4.57, 0.2977, 0.3231, 0.5776, 0.3579, 1.4766, 1, 'roles-v1.1'),
+('NBA_2010', 'nba_101141', 121.0, 2.894, 0.2975, 0.3242, 0.5581, 0.3579, 0.9381, 1, 'roles-v1.1'),
+('NBA_2010', 'nba_101198', 50.0, 1.6, 0.32, 0.3449, 0.3429, 0.3579, 0.5517, 1, 'roles-v1.1'),
+('NBA_2010', 'nba_101249', 1.0, 3.562, 0.0, 0.3542, 0.0103, 0.3579, 1.2616, 0, 'roles-v1.1'),
+('NBA_2011', 'nba_101126', 181.0, 5.465, 0.3646, 0.3593, 0.7207, 0.3454, 1.9633, 1, 'roles-v1.1'),
+('NBA_2011', 'nba_101127', 112.0, 2.635, 0.3482, 0.3471, 0.6149, 0.3454, 0.9146, 1, 'roles-v1.1'),
+('NBA_2011', 'nba_101132', 179.0, 6.096, 0.3464, 0.3461, 0.7185, 0.3454, 2.1098, 1, 'roles-v1.1'),
+('NBA_2011', 'nba_101141', 112.0, 2.436, 0.4554, 0.413, 0.6149, 0.3454, 1.0062, 1, 'roles-v1.1'),
+('NBA_2011', 'nba_101187', 61.0, 4.766, 0.3934, 0.3677, 0.4651, 0.3454, 1.7528, 1, 'roles-v1.1'),
+('NBA_2011', 'nba_101198', 29.0, 2.032, 0.2414, 0.315, 0.2925, 0.3454, 0.6401, 1, 'roles-v1.1'),
+('NBA_2011', 'nba_101249', 140.0, 6.947, 0.3929, 0.377, 0.6662, 0.3454, 2.619, 1, 'roles-v1.1'),
+('NBA_2012', 'nba_101126', 348.0, 6.005, 0.4052, 0.3937, 0.7867, 0.3512, 2.3639, 1, 'roles-v1.1'),
+('NBA_2012', 'nba_101127', 203.0, 3.112, 0.4039, 0.3872, 0.6827, 0.3512, 1.2049, 1, 'roles-v1.1'),
+('NBA_2012', 'nba_101132', 66.0, 6.32, 0.303, 0.3314, 0.4116, 0.3512, 2.0942, 1, 'roles-v1.1'),
+('NBA_2012', 'nba_101141', 214.0, 3.829, 0.4439, 0.4156, 0.694, 0.3512, 1.591, 1, 'roles-v1.1'),
+('NBA_2012', 'nba_101187', 285.0, 6.863, 0.3333, 0.3378, 0.7513, 0.3512, 2.3181, 1, 'roles-v1.1'),
+('NBA_2012', 'nba_101198', 76.0, 2.244, 0.3158, 0.3354, 0.4462, 0.3512, 0.7527, 1, 'roles-v1.1'),
+('NBA_2012', 'nba_101249', 151.0, 6.572, 0.3775, 0.3674, 0.6155, 0.3512, 2.4144, 1, 'roles-v1.1'),
+('NBA_2013', 'nba_101126', 154.0, 6.401, 0.3766, 0.3683, 0.6024, 0.3556, 2.3573, 1, 'roles-v1.1'),
+('NBA_2013', 'nba_101127', 185.0, 2.957, 0.3405, 0.3459, 0.6454, 0.3556, 1.0228, 1, 'roles-v1.1'),
+('NBA_2013', 'nba_101141', 131.0, 3.19, 0.2824, 0.3144, 0.5631, 0.3556, 1.0028, 1, 'roles-v1.1'),
+('NBA_2013', 'nba_101187', 248.0, 5.037, 0.3387, 0.3436, 0.7093, 0.3556, 1.7308, 1, 'roles-v1.1'),
+('NBA_2013', 'nba_101198', 62.0, 2.117, 0.3226, 0.3431, 0.3789, 0.3556, 0.7264, 1, 'roles-v1.1'),
+('NBA_2013', 'nba_101249', 84.0, 5.113, 0.2976, 0.3294, 0.4525, 0.3556, 1.684, 1, 'roles-v1.1'),
+('NBA_2014', 'nba_101126', 112.0, 6.823, 0.2768, 0.3059, 0.5616, 0.3431, 2.087, 1, 'roles-v1.1'),
+('NBA_2014', 'nba_101127', 146.0, 2.346, 0.2671, 0.2956, 0.6255, 0.3431, 0.6933, 1, 'roles-v1.1'),
+('NBA_2014', 'nba_101141', 190.0, 5.186, 0.3895, 0.3749, 0.6849, 0.3431, 1.944, 1, 'roles-v1.1'),
+('NBA_2014', 'nba_101187', 210.0, 4.334, 0.3476, 0.3463, 0.7061, 0.3431, 1.5009, 1, 'roles-v1.1'),
+('NBA_2014', 'nba_101198', 9.0, 4.859, 0.0, 0.3111, 0.0933, 0.3431, 1.5116, 0, 'roles-v1.1'),
+('NBA_2014', 'nba_101249', 29.0, 3.842, 0.3103, 0.335, 0.2491, 0.3431, 1.287, 1, 'roles-v1.1'),
+('NBA_2015', 'nba_101126', 1.0, 1.545, 0.0, 0.3452, 0.0099, 0.3486, 0.5334, 0, 'roles-v1.1'),
+('NBA_2015', 'nba_101127', 102.0, 3.577, 0.3039, 0.3261, 0.5045, 0.3486, 1.1662, 1, 'roles-v1.1'),
+('NBA_2015', 'nba_101141', 259.0, 4.959, 0.3707, 0.3645, 0.7211, 0.3486, 1.8074, 1, 'roles-v1.1'),
+('NBA_2015', 'nba_101187', 37.0, 6.931, 0.3243, 0.3421, 0.2697, 0.3486, 2.3707, 1, 'roles-v1.1'),
+('NBA_2015', 'nba_1626147', 83.0, 4.619, 0.2651, 0.3107, 0.4531, 0.3486, 1.4354, 1, 'roles-v1.1'),
+('NBA_2015', 'nba_1626159', 116.0, 1.871, 0.2759, 0.3096, 0.5366, 0.3486, 0.5792, 1, 'roles-v1.1'),
+('NBA_2015', 'nba_1626161', 2.0, 0.051, 0.0, 0.3418, 0.0196, 0.3486, 0.0174, 0, 'roles-v1.1'),
+('NBA_2015', 'nba_1626163', 202.0, 4.259, 0.3366, 0.3406, 0.6685, 0.3486, 1.4505, 1, 'roles-v1.1'),
+('NBA_2015', 'nba_1626166', 111.0, 5.728, 0.3243, 0.3358, 0.5256, 0.3486, 1.9237, 1, 'roles-v1.1'),
+('NBA_2015', 'nba_1626169', 205.0, 4.374, 0.3073, 0.3209, 0.6717, 0.3486, 1.4036, 1, 'roles-v1.1'),
+('NBA_2015', 'nba_1626170', 100.0, 2.846, 0.22, 0.2844, 0.4995, 0.3486, 0.8094, 1, 'roles-v1.1'),
+('NBA_2015', 'nba_1626174', 11.0, 2.735, 0.3636, 0.3501, 0.0989, 0.3486, 0.9574, 0, 'roles-v1.1'),
+('NBA_2015', 'nba_1626199', 50.0, 4.7, 0.38, 0.3591, 0.3329, 0.3486, 1.6874, 1, 'roles-v1.1'),
+('NBA_2015', 'nba_1626209', 192.0, 4.892, 0.349, 0.3488, 0.6571, 0.3486, 1.7066, 1, 'roles-v1.1'),
+('NBA_2015', 'nba_1626246', 0.0, 0.0, NULL, 0.3486, 0.0, 0.3486, 0.0, 0, 'roles-v1.1'),
+('NBA_2015', 'nba_1626253', 40.0, 4.715, 0.325, 0.3419, 0.2853, 0.3486, 1.6118, 1, 'roles-v1.1'),
+('NBA_2015', 'nba_1626262', 2.0, 12.41, 1.0, 0.3613, 0.0196, 0.3486, 4.4844, 0, 'roles-v1.1'),
+('NBA_2016', 'nba_101127', 1.0, 1.088, 0.0, 0.3451, 0.0112, 0.349, 0.3755, 0, 'roles-v1.1'),
+('NBA_2016', 'nba_101141', 402.0, 6.755, 0.3532, 0.3525, 0.8202, 0.349, 2.381, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_101187', 44.0, 5.137, 0.3182, 0.3388, 0.333, 0.349, 1.7401, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_101249', 1.0, 3.371, 0.0, 0.3451, 0.0112, 0.349, 1.1633, 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1626147', 194.0, 5.691, 0.299, 0.3146, 0.6876, 0.349, 1.7904, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1626150', 156.0, 3.81, 0.2756, 0.3021, 0.639, 0.349, 1.1512, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1626159', 35.0, 2.015, 0.2, 0.3067, 0.2842, 0.349, 0.6179, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1626161', 2.0, 0.051, 0.0, 0.3413, 0.0222, 0.349, 0.0173, 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1626163', 354.0, 6.522, 0.3277, 0.3319, 0.8007, 0.349, 2.1649, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1626166', 86.0, 6.7, 0.314, 0.3317, 0.4939, 0.349, 2.2226, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1626169', 154.0, 4.045, 0.2922, 0.3129, 0.636, 0.349, 1.2656, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1626170', 134.0, 4.691, 0.3657, 0.3591, 0.6032, 0.349, 1.6843, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1626174', 5.0, 1.683, 0.0, 0.3303, 0.0537, 0.349, 0.5557, 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1626188', 26.0, 4.993, 0.4231, 0.3659, 0.2278, 0.349, 1.8269, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1626195', 15.0, 0.408, 0.2667, 0.337, 0.1454, 0.349, 0.1374, 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1626199', 46.0, 4.346, 0.2609, 0.3188, 0.3429, 0.349, 1.3856, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1626203', 15.0, 2.859, 0.6, 0.3855, 0.1454, 0.349, 1.1021, 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1626209', 144.0, 5.398, 0.2986, 0.3178, 0.6203, 0.349, 1.7154, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1626246', 0.0, 0.0, NULL, 0.349, 0.0, 0.349, 0.0, 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1626253', 4.0, 3.034, 0.25, 0.3447, 0.0434, 0.349, 1.0459, 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1627098', 110.0, 3.174, 0.2364, 0.2865, 0.5552, 0.349, 0.9093, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1627733', 101.0, 6.338, 0.2772, 0.3107, 0.534, 0.349, 1.9693, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1627735', 22.0, 1.956, 0.1364, 0.3065, 0.1998, 0.349, 0.5995, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1627739', 73.0, 1.971, 0.2877, 0.3212, 0.453, 0.349, 0.6333, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1627748', 74.0, 4.739, 0.3784, 0.3624, 0.4564, 0.349, 1.7174, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1627756', 208.0, 7.668, 0.351, 0.3504, 0.7024, 0.349, 2.6867, 1, 'roles-v1.1');
 INSERT INTO player_shooting ("season_id", "person_id", "fg3a", "fg3a_per_75", "fg3_pct_raw", "fg3_pct_shrunk", "shrinkage_weight", "prior_mean", "spacing_score", "reportable", "model_version") VALUES
-('EL_2013', 'nba_1627851', 35.0, 3.685, 0.3143, 0.3521, 0.3637, 0.3737, 1.2974, 1, 'roles-v1.0'),
-('EL_2013', 'nba_1629740', 48.0, 3.025, 0.3333, 0.356, 0.4394, 0.3737, 1.0769, 1, 'roles-v1.0'),
-('EL_2014', 'nba_101132', 91.0, 6.99, 0.3516, 0.3546, 0.5985, 0.3589, 2.4784, 1, 'roles-v1.0'),
-('EL_2014', 'nba_101146', 32.0, 6.433, 0.2812, 0.3322, 0.3439, 0.3589, 2.1373, 1, 'roles-v1.0'),
-('EL_2014', 'nba_101212', 0.0, 0.0, NULL, 0.3589, 0.0, 0.3589, 0.0, 0, 'roles-v1.0'),
-('EL_2014', 'nba_1626209', 76.0, 7.519, 0.3816, 0.3715, 0.5545, 0.3589, 2.7931, 1, 'roles-v1.0'),
-('EL_2014', 'nba_1626224', 66.0, 4.556, 0.303, 0.3299, 0.5195, 0.3589, 1.5031, 1, 'roles-v1.0'),
-('EL_2014', 'nba_1626246', 0.0, 0.0, NULL, 0.3589, 0.0, 0.3589, 0.0, 0, 'roles-v1.0'),
-('EL_2014', 'nba_1627835', 4.0, 3.796, 0.5, 0.3676, 0.0615, 0.3589, 1.3955, 0, 'roles-v1.0'),
-('EL_2014', 'nba_1627851', 69.0, 4.75, 0.2754, 0.3146, 0.5305, 0.3589, 1.4942, 1, 'roles-v1.0'),
-('EL_2014', 'nba_1629740', 60.0, 4.325, 0.3333, 0.3462, 0.4956, 0.3589, 1.4974, 1, 'roles-v1.0'),
-('EL_2014', 'nba_1630267', 11.0, 4.177, 0.3636, 0.3597, 0.1527, 0.3589, 1.5023, 0, 'roles-v1.0'),
-('EL_2014', 'nba_203995', 10.0, 3.335, 0.2, 0.3366, 0.1407, 0.3589, 1.1224, 0, 'roles-v1.0'),
-('EL_2023', 'nba_1626147', 45.0, 4.828, 0.3333, 0.3553, 0.3984, 0.3698, 1.7154, 1, 'roles-v1.0'),
-('EL_2023', 'nba_1626163', 64.0, 4.462, 0.4062, 0.3875, 0.485, 0.3698, 1.7288, 1, 'roles-v1.0'),
-('EL_2023', 'nba_1626170', 113.0, 3.597, 0.4159, 0.3986, 0.6245, 0.3698, 1.4337, 1, 'roles-v1.0'),
-('EL_2023', 'nba_1626195', 11.0, 0.642, 0.3636, 0.369, 0.1393, 0.3698, 0.2368, 0, 'roles-v1.0'),
-('EL_2023', 'nba_1626209', 195.0, 7.926, 0.4308, 0.415, 0.7416, 0.3698, 3.2894, 1, 'roles-v1.0'),
-('EL_2023', 'nba_1627735', 110.0, 4.791, 0.3909, 0.3829, 0.6181, 0.3698, 1.8342, 1, 'roles-v1.0'),
-('EL_2023', 'nba_1627762', 27.0, 1.156, 0.3333, 0.3595, 0.2844, 0.3698, 0.4155, 1, 'roles-v1.0'),
-('EL_2023', 'nba_1627789', 93.0, 4.25, 0.3763, 0.3736, 0.5778, 0.3698, 1.5877, 1, 'roles-v1.0'),
-('EL_2023', 'nba_1627790', 0.0, 0.0, NULL, 0.3698, 0.0, 0.3698, 0.0, 0, 'roles-v1.0'),
-('EL_2023', 'nba_1627816', 5.0, 0.466, 0.2, 0.3582, 0.0685, 0.3698, 0.1671, 0, 'roles-v1.0'),
-('EL_2023', 'nba_1627822', 42.0, 5.444, 0.3333, 0.3559, 0.382, 0.3698, 1.9376, 1, 'roles-v1.0'),
-('EL_2023', 'nba_1627823', 72.0, 5.097, 0.2639, 0.3153, 0.5145, 0.3698, 1.6072, 1, 'roles-v1.0'),
-('EL_2023', 'nba_1627824', 76.0, 4.296, 0.4605, 0.4177, 0.528, 0.3698, 1.7944, 1, 'roles-v1.0'),
-('EL_2023', 'nba_1627834', 41.0, 2.431, 0.4878, 0.4142, 0.3763, 0.3698, 1.0071, 1, 'roles-v1.0'),
-('EL_2023', 'nba_1629740', 75.0, 3.251, 0.3867, 0.3787, 0.5247, 0.3698, 1.231, 1, 'roles-v1.0'),
-('EL_2023', 'nba_1630267', 149.0, 5.732, 0.3221, 0.3371, 0.6868, 0.3698, 1.9323, 1, 'roles-v1.0'),
-('EL_2009', 'nba_101132', 86.0, 4.633, 0.3488, 0.3569, 0.5895, 0.3686, 1.6536, 1, 'roles-v1.0'),
-('EL_2009', 'nba_101137', 84.0, 5.435, 0.3929, 0.3828, 0.5837, 0.3686, 2.0802, 1, 'roles-v1.0'),
-('EL_2009', 'nba_101146', 3.0, 3.759, 0.3333, 0.3669, 0.0477, 0.3686, 1.3791, 0, 'roles-v1.0'),
-('EL_2009', 'nba_101187', 62.0, 3.932, 0.3387, 0.3534, 0.5086, 0.3686, 1.3894, 1, 'roles-v1.0'),
-('NBA_2003', 'nba_1531', 1.0, 0.06, 0.0, 0.345, 0.0101, 0.3485, 0.0208, 0, 'roles-v1.0'),
-('GL_2015', 'nba_101249', 115.0, 6.58, 0.3565, 0.3557, 0.6228, 0.3543, 2.3404, 1, 'roles-v1.0'),
-('GL_2015', 'nba_1626147', 48.0, 6.446, 0.3333, 0.3457, 0.408, 0.3543, 2.2286, 1, 'roles-v1.0'),
-('GL_2015', 'nba_1626150', 208.0, 4.615, 0.3654, 0.3626, 0.7492, 0.3543, 1.6736, 1, 'roles-v1.0'),
-('GL_2015', 'nba_1626166', 14.0, 7.413, 0.4286, 0.3667, 0.1674, 0.3543, 2.7185, 0, 'roles-v1.0'),
-('GL_2015', 'nba_1626174', 87.0, 3.396, 0.2529, 0.298, 0.5554, 0.3543, 1.0117, 1, 'roles-v1.0'),
-('GL_2015', 'nba_1626188', 225.0, 5.581, 0.3822, 0.3756, 0.7636, 0.3543, 2.0963, 1, 'roles-v1.0'),
-('GL_2015', 'nba_1626199', 25.0, 9.137, 0.44, 0.3769, 0.2642, 0.3543, 3.444, 1, 'roles-v1.0'),
-('GL_2015', 'nba_1626203', 207.0, 5.333, 0.3285, 0.335, 0.7483, 0.3543, 1.7867, 1, 'roles-v1.0'),
-('GL_2015', 'nba_1626208', 92.0, 2.138, 0.3152, 0.332, 0.5692, 0.3543, 0.71, 1, 'roles-v1.0'),
-('GL_2015', 'nba_1626246', 0.0, 0.0, NULL, 0.3543, 0.0, 0.3543, 0.0, 0, 'roles-v1.0'),
-('GL_2015', 'nba_1626253', 115.0, 4.362, 0.313, 0.3286, 0.6228, 0.3543, 1.4334, 1, 'roles-v1.0'),
-('GL_2015', 'nba_1626262', 187.0, 5.846, 0.4064, 0.3923, 0.7287, 0.3543, 2.2932, 1, 'roles-v1.0'),
-('EL_2015', 'nba_1626195', 0.0, 0.0, NULL, 0.3675, 0.0, 0.3675, 0.0, 0, 'roles-v1.0'),
-('EL_2015', 'nba_1626224', 71.0, 5.564, 0.3803, 0.3747, 0.5667, 0.3675, 2.0852, 1, 'roles-v1.0'),
-('EL_2015', 'nba_1626643', 137.0, 8.456, 0.3285, 0.3395, 0.7162, 0.3675, 2.8711, 1, 'roles-v1.0'),
-('EL_2015', 'nba_1627098', 174.0, 6.074, 0.4023, 0.394, 0.7622, 0.3675, 2.3931, 1, 'roles-v1.0'),
-('EL_2015', 'nba_1627733', 8.0, 3.903, 0.25, 0.3524, 0.1284, 0.3675, 1.3756, 0, 'roles-v1.0'),
-('EL_2015', 'nba_1627834', 0.0, 0.0, NULL, 0.3675, 0.0, 0.3675, 0.0, 0, 'roles-v1.0'),
-('EL_2015', 'nba_1627835', 18.0, 4.257, 0.2778, 0.3452, 0.249, 0.3675, 1.4694, 0, 'roles-v1.0'),
-('EL_2015', 'nba_1627851', 77.0, 5.671, 0.3766, 0.3729, 0.5865, 0.3675, 2.1144, 1, 'roles-v1.0'),
-('EL_2015', 'nba_1629029', 16.0, 4.33, 0.3125, 0.355, 0.2276, 0.3675, 1.537, 0, 'roles-v1.0'),
-('EL_2015', 'nba_1629740', 53.0, 2.857, 0.4528, 0.4097, 0.494, 0.3675, 1.1704, 1, 'roles-v1.0'),
-('EL_2015', 'nba_203995', 40.0, 4.47, 0.325, 0.3495, 0.4242, 0.3675, 1.5621, 1, 'roles-v1.0'),
-('GL_2019', 'nba_101127', 53.0, 3.111, 0.3019, 0.3252, 0.404, 0.3411, 1.012, 1, 'roles-v1.0'),
-('GL_2019', 'nba_1626147', 237.0, 8.19, 0.3544, 0.3511, 0.7519, 0.3411, 2.8756, 1, 'roles-v1.0'),
-('GL_2019', 'nba_1626150', 227.0, 7.742, 0.3612, 0.3561, 0.7438, 0.3411, 2.7568, 1, 'roles-v1.0'),
-('GL_2019', 'nba_1626166', 115.0, 9.362, 0.3652, 0.3554, 0.5953, 0.3411, 3.3277, 1, 'roles-v1.0'),
-('GL_2019', 'nba_1626169', 25.0, 8.764, 0.24, 0.3166, 0.2423, 0.3411, 2.7745, 1, 'roles-v1.0'),
-('GL_2019', 'nba_1626170', 147.0, 4.08, 0.4354, 0.4026, 0.6528, 0.3411, 1.6426, 1, 'roles-v1.0'),
-('GL_2019', 'nba_1627733', 74.0, 7.115, 0.3784, 0.3592, 0.4862, 0.3411, 2.5556, 1, 'roles-v1.0'),
-('GL_2019', 'nba_1627756', 9.0, 10.007, 0.4444, 0.3517, 0.1032, 0.3411, 3.5199, 0, 'roles-v1.0'),
-('GL_2019', 'nba_1627789', 69.0, 7.471, 0.2899, 0.3171, 0.4688, 0.3411, 2.3689, 1, 'roles-v1.0'),
-('GL_2019', 'nba_1627820', 18.0, 5.857, 0.4444, 0.3604, 0.1871, 0.3411, 2.1108, 0, 'roles-v1.0'),
-('GL_2019', 'nba_1627858', 38.0, 2.04, 0.3158, 0.3328, 0.327, 0.3411, 0.6788, 1, 'roles-v1.0'),
-('NBA_2012', 'nba_101126', 348.0, 6.005, 0.4052, 0.3937, 0.7867, 0.3512, 2.3639, 1, 'roles-v1.0'),
-('NBA_2012', 'nba_101127', 203.0, 3.112, 0.4039, 0.3872, 0.6827, 0.3512, 1.2049, 1, 'roles-v1.0'),
-('NBA_2012', 'nba_101132', 66.0, 6.32, 0.303, 0.3314, 0.4116, 0.3512, 2.0942, 1, 'roles-v1.0'),
-('NBA_2012', 'nba_101141', 214.0, 3.829, 0.4439, 0.4156, 0.694, 0.3512, 1.591, 1, 'roles-v1.0'),
-('NBA_2012', 'nba_101187', 285.0, 6.863, 0.3333, 0.3378, 0.7513, 0.3512, 2.3181, 1, 'roles-v1.0'),
-('NBA_2012', 'nba_101198', 76.0, 2.244, 0.3158, 0.3354, 0.4462, 0.3512, 0.7527, 1, 'roles-v1.0'),
-('NBA_2012', 'nba_101249', 151.0, 6.572, 0.3775, 0.3674, 0.6155, 0.3512, 2.4144, 1, 'roles-v1.0'),
-('GL_2020', 'nba_101127', 42.0, 4.066, 0.3571, 0.3511, 0.4087, 0.347, 1.4278, 1, 'roles-v1.0'),
-('GL_2020', 'nba_1626253', 44.0, 5.547, 0.3864, 0.3635, 0.42, 0.347, 2.0162, 1, 'roles-v1.0'),
-('GL_2020', 'nba_1627812', 80.0, 7.268, 0.3875, 0.37, 0.5683, 0.347, 2.689, 1, 'roles-v1.0'),
-('GL_2020', 'nba_1627820', 42.0, 4.344, 0.2857, 0.3219, 0.4087, 0.347, 1.3985, 1, 'roles-v1.0'),
-('GL_2016', 'nba_101126', 62.0, 5.071, 0.4194, 0.3855, 0.5176, 0.3492, 1.9549, 1, 'roles-v1.0'),
-('GL_2016', 'nba_101198', 87.0, 5.268, 0.2989, 0.3189, 0.6009, 0.3492, 1.6803, 1, 'roles-v1.0'),
-('GL_2016', 'nba_1626166', 38.0, 10.471, 0.3158, 0.3359, 0.3968, 0.3492, 3.5175, 1, 'roles-v1.0'),
-('GL_2016', 'nba_1626169', 8.0, 7.694, 0.375, 0.3523, 0.1216, 0.3492, 2.7106, 0, 'roles-v1.0'),
-('GL_2016', 'nba_1626170', 10.0, 4.33, 0.3, 0.3419, 0.1475, 0.3492, 1.4804, 0, 'roles-v1.0'),
-('GL_2016', 'nba_1626174', 51.0, 3.4, 0.2353, 0.2958, 0.4689, 0.3492, 1.0057, 1, 'roles-v1.0'),
-('GL_2016', 'nba_1626188', 261.0, 6.257, 0.3716, 0.3676, 0.8188, 0.3492, 2.2998, 1, 'roles-v1.0'),
-('GL_2016', 'nba_1626199', 32.0, 8.438, 0.4062, 0.3695, 0.3564, 0.3492, 3.1178, 1, 'roles-v1.0'),
-('GL_2016', 'nba_1626253', 104.0, 3.77, 0.3462, 0.3472, 0.6429, 0.3492, 1.3092, 1, 'roles-v1.0'),
-('GL_2016', 'nba_1627735', 74.0, 2.858, 0.3108, 0.3276, 0.5616, 0.3492, 0.9363, 1, 'roles-v1.0'),
-('GL_2016', 'nba_1627756', 39.0, 11.87, 0.5385, 0.4255, 0.403, 0.3492, 5.0501, 1, 'roles-v1.0'),
-('GL_2016', 'nba_1627762', 47.0, 2.049, 0.4681, 0.4025, 0.4486, 0.3492, 0.8249, 1, 'roles-v1.0'),
-('GL_2016', 'nba_1627767', 4.0, 0.199, 0.0, 0.3266, 0.0648, 0.3492, 0.0649, 0, 'roles-v1.0'),
-('GL_2016', 'nba_1627775', 10.0, 5.087, 0.2, 0.3272, 0.1475, 0.3492, 1.6644, 0, 'roles-v1.0'),
-('GL_2016', 'nba_1627789', 6.0, 2.654, 0.5, 0.3634, 0.0941, 0.3492, 0.9646, 0, 'roles-v1.0'),
-('GL_2016', 'nba_1627812', 123.0, 6.898, 0.3984, 0.3827, 0.6804, 0.3492, 2.6397, 1, 'roles-v1.0'),
-('GL_2016', 'nba_1627814', 88.0, 5.819, 0.4659, 0.4196, 0.6037, 0.3492, 2.4419, 1, 'roles-v1.0'),
-('GL_2016', 'nba_1627816', 77.0, 1.939, 0.4026, 0.3797, 0.5713, 0.3492, 0.7362, 1, 'roles-v1.0'),
-('GL_2016', 'nba_1627820', 62.0, 2.189, 0.2419, 0.2937, 0.5176, 0.3492, 0.6427, 1, 'roles-v1.0'),
-('GL_2016', 'nba_1627823', 5.0, 6.936, 0.2, 0.3373, 0.0797, 0.3492, 2.3396, 0, 'roles-v1.0'),
-('GL_2016', 'nba_1627824', 6.0, 4.036, 0.6667, 0.3791, 0.0941, 0.3492, 1.5297, 0, 'roles-v1.0'),
-('GL_2016', 'nba_1627834', 6.0, 0.292, 0.5, 0.3634, 0.0941, 0.3492, 0.1062, 0, 'roles-v1.0'),
-('GL_2016', 'nba_1627835', 11.0, 3.728, 0.3636, 0.3515, 0.1599, 0.3492, 1.3102, 0, 'roles-v1.0'),
-('GL_2016', 'nba_1627846', 285.0, 7.656, 0.3474, 0.3477, 0.8315, 0.3492, 2.6619, 1, 'roles-v1.0'),
-('GL_2016', 'nba_1627853', 95.0, 2.645, 0.4211, 0.3939, 0.6218, 0.3492, 1.0419, 1, 'roles-v1.0'),
-('GL_2016', 'nba_1627858', 42.0, 1.539, 0.2857, 0.3225, 0.4209, 0.3492, 0.4963, 1, 'roles-v1.0'),
-('NBA_2007', 'nba_101126', 292.0, 5.583, 0.3322, 0.3371, 0.768, 0.3534, 1.8821, 1, 'roles-v1.0'),
-('NBA_2007', 'nba_101127', 190.0, 3.068, 0.3421, 0.3457, 0.6829, 0.3534, 1.0606, 1, 'roles-v1.0'),
-('NBA_2007', 'nba_101132', 277.0, 5.279, 0.3394, 0.3427, 0.7584, 0.3534, 1.8094, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_101127', 86.0, 2.001, 0.2907, 0.3244, 0.4627, 0.3534, 0.649, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_101141', 253.0, 5.266, 0.3597, 0.3579, 0.717, 0.3534, 1.8847, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1626147', 103.0, 7.142, 0.3301, 0.3416, 0.5077, 0.3534, 2.4398, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1626150', 142.0, 3.854, 0.331, 0.3403, 0.5871, 0.3534, 1.3115, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1626159', 129.0, 2.764, 0.3798, 0.3683, 0.5637, 0.3534, 1.0179, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1626161', 12.0, 0.211, 0.25, 0.3424, 0.1073, 0.3534, 0.0724, 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1626163', 274.0, 5.375, 0.3796, 0.3726, 0.7329, 0.3534, 2.0026, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1626166', 91.0, 5.633, 0.3846, 0.3683, 0.4768, 0.3534, 2.0749, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1626169', 234.0, 4.449, 0.2863, 0.3064, 0.7009, 0.3534, 1.3631, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1626170', 187.0, 3.992, 0.3262, 0.3357, 0.6519, 0.3534, 1.3401, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1626188', 104.0, 5.056, 0.4423, 0.3988, 0.5102, 0.3534, 2.0162, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1626195', 12.0, 0.874, 0.4167, 0.3602, 0.1073, 0.3534, 0.3148, 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1626199', 6.0, 2.269, 0.0, 0.3334, 0.0567, 0.3534, 0.7565, 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1626203', 97.0, 3.327, 0.4124, 0.3825, 0.4927, 0.3534, 1.2726, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1626209', 267.0, 5.801, 0.3371, 0.3415, 0.7278, 0.3534, 1.9811, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1626224', 87.0, 4.657, 0.3678, 0.3601, 0.4656, 0.3534, 1.6773, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1626246', 0.0, 0.0, NULL, 0.3534, 0.0, 0.3534, 0.0, 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1626643', 1.0, 5.918, 0.0, 0.3499, 0.0099, 0.3534, 2.0709, 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1627098', 124.0, 4.402, 0.371, 0.3632, 0.5539, 0.3534, 1.5985, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627733', 322.0, 5.602, 0.3665, 0.3634, 0.7633, 0.3534, 2.0355, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627735', 5.0, 2.237, 0.8, 0.3747, 0.0477, 0.3534, 0.8381, 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1627739', 134.0, 3.164, 0.3209, 0.3348, 0.573, 0.3534, 1.0592, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627748', 104.0, 3.025, 0.2981, 0.3252, 0.5102, 0.3534, 0.9836, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627756', 370.0, 6.358, 0.3865, 0.3795, 0.7875, 0.3534, 2.4125, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627762', 1.0, 0.956, 0.0, 0.3499, 0.0099, 0.3534, 0.3345, 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1627767', 0.0, 0.0, NULL, 0.3534, 0.0, 0.3534, 0.0, 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1627775', 80.0, 2.996, 0.2375, 0.3019, 0.4448, 0.3534, 0.9046, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627785', 18.0, 3.607, 0.3889, 0.3589, 0.1527, 0.3534, 1.2944, 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1627789', 158.0, 7.052, 0.3354, 0.3424, 0.6127, 0.3534, 2.4148, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627790', 0.0, 0.0, NULL, 0.3534, 0.0, 0.3534, 0.0, 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1627812', 359.0, 5.665, 0.3733, 0.3689, 0.7824, 0.3534, 2.09, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627814', 60.0, 5.341, 0.25, 0.3146, 0.3753, 0.3534, 1.6804, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627816', 11.0, 3.803, 0.3636, 0.3545, 0.0992, 0.3534, 1.3481, 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1627820', 40.0, 1.692, 0.25, 0.3239, 0.286, 0.3534, 0.5479, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627823', 50.0, 6.496, 0.28, 0.3289, 0.3337, 0.3534, 2.1369, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627824', 37.0, 5.667, 0.3243, 0.3456, 0.2704, 0.3534, 1.9583, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627834', 0.0, 0.0, NULL, 0.3534, 0.0, 0.3534, 0.0, 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1627835', 110.0, 4.806, 0.3364, 0.3445, 0.5242, 0.3534, 1.6556, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627846', 65.0, 4.487, 0.3538, 0.3536, 0.3943, 0.3534, 1.5866, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627851', 0.0, 0.0, NULL, 0.3534, 0.0, 0.3534, 0.0, 0, 'roles-v1.0'),
-('NBA_2017', 'nba_1627853', 31.0, 3.67, 0.2903, 0.3385, 0.2369, 0.3534, 1.2421, 1, 'roles-v1.0'),
-('NBA_2017', 'nba_1627858', 17.0, 1.276, 0.2353, 0.3363, 0.1455, 0.3534, 0.4291, 0, 'roles-v1.0'),
-('NBA_2011', 'nba_101126', 181.0, 5.465, 0.3646, 0.3593, 0.7207, 0.3454, 1.9633, 1, 'roles-v1.0'),
-('NBA_2011', 'nba_101127', 112.0, 2.635, 0.3482, 0.3471, 0.6149, 0.3454, 0.9146, 1, 'roles-v1.0'),
-('NBA_2011', 'nba_101132', 179.0, 6.096, 0.3464, 0.3461, 0.7185, 0.3454, 2.1098, 1, 'roles-v1.0'),
-('NBA_2011', 'nba_101141', 112.0, 2.436, 0.4554, 0.413, 0.6149, 0.3454, 1.0062, 1, 'roles-v1.0'),
-('NBA_2011', 'nba_101187', 61.0, 4.766, 0.3934, 0.3677, 0.4651, 0.3454, 1.7528, 1, 'roles-v1.0'),
-('NBA_2011', 'nba_101198', 29.0, 2.032, 0.2414, 0.315, 0.2925, 0.3454, 0.6401, 1, 'roles-v1.0'),
-('NBA_2011', 'nba_101249', 140.0, 6.947, 0.3929, 0.377, 0.6662, 0.3454, 2.619, 1, 'roles-v1.0'),
-('EL_2024', 'nba_1626147', 75.0, 3.729, 0.4133, 0.3925, 0.552, 0.3669, 1.4637, 1, 'roles-v1.0'),
-('EL_2024', 'nba_1626169', 15.0, 4.048, 0.1333, 0.3207, 0.1977, 0.3669, 1.2985, 0, 'roles-v1.0'),
-('EL_2024', 'nba_1626170', 114.0, 3.726, 0.4298, 0.4079, 0.6519, 0.3669, 1.5199, 1, 'roles-v1.0'),
-('EL_2024', 'nba_1626195', 1.0, 0.067, 0.0, 0.361, 0.0162, 0.3669, 0.0241, 0, 'roles-v1.0'),
-('EL_2024', 'nba_1626209', 232.0, 8.122, 0.3147, 0.3255, 0.7922, 0.3669, 2.6438, 1, 'roles-v1.0'),
-('EL_2024', 'nba_1626224', 138.0, 6.426, 0.3768, 0.3738, 0.6939, 0.3669, 2.402, 1, 'roles-v1.0'),
-('EL_2024', 'nba_1626246', 1.0, 0.596, 0.0, 0.361, 0.0162, 0.3669, 0.215, 0, 'roles-v1.0'),
-('EL_2024', 'nba_1627735', 81.0, 4.458, 0.3086, 0.3336, 0.571, 0.3669, 1.4875, 1, 'roles-v1.0'),
-('EL_2024', 'nba_1627762', 8.0, 0.659, 0.375, 0.3679, 0.1162, 0.3669, 0.2425, 0, 'roles-v1.0'),
-('EL_2024', 'nba_1627789', 101.0, 5.607, 0.3366, 0.348, 0.624, 0.3669, 1.9514, 1, 'roles-v1.0'),
-('EL_2024', 'nba_1627790', 0.0, 0.0, NULL, 0.3669, 0.0, 0.3669, 0.0, 0, 'roles-v1.0'),
-('EL_2024', 'nba_1627820', 2.0, 3.221, 0.0, 0.3552, 0.0318, 0.3669, 1.1444, 0, 'roles-v1.0'),
-('EL_2024', 'nba_1627822', 12.0, 2.569, 0.25, 0.3477, 0.1647, 0.3669, 0.8931, 0, 'roles-v1.0'),
-('EL_2024', 'nba_1627823', 142.0, 4.678, 0.4296, 0.4108, 0.7, 0.3669, 1.9215, 1, 'roles-v1.0'),
-('EL_2024', 'nba_1627834', 28.0, 2.106, 0.3929, 0.3751, 0.3151, 0.3669, 0.7898, 1, 'roles-v1.0'),
-('EL_2024', 'nba_1629740', 83.0, 4.551, 0.3735, 0.3707, 0.5769, 0.3669, 1.6872, 1, 'roles-v1.0'),
-('EL_2024', 'nba_1630267', 154.0, 5.523, 0.3377, 0.346, 0.7167, 0.3669, 1.9106, 1, 'roles-v1.0'),
-('NBA_2001', 'nba_1531', 1.0, 0.072, 0.0, 0.3435, 0.0161, 0.3492, 0.0248, 0, 'roles-v1.0'),
-('NBA_2000', 'nba_1531', 23.0, 0.588, 0.2174, 0.3213, 0.2239, 0.3512, 0.189, 1, 'roles-v1.0'),
-('NBA_2006', 'nba_101126', 213.0, 5.656, 0.3897, 0.3792, 0.7058, 0.354, 2.1446, 1, 'roles-v1.0'),
-('NBA_2006', 'nba_101127', 180.0, 2.445, 0.35, 0.3513, 0.6696, 0.354, 0.8588, 1, 'roles-v1.0'),
-('NBA_2006', 'nba_101132', 221.0, 5.347, 0.3756, 0.3694, 0.7134, 0.354, 1.975, 1, 'roles-v1.0'),
-('NBA_2006', 'nba_101137', 44.0, 2.225, 0.3182, 0.3421, 0.3313, 0.354, 0.7612, 1, 'roles-v1.0'),
-('NBA_2006', 'nba_101141', 148.0, 5.476, 0.3649, 0.3608, 0.625, 0.354, 1.9757, 1, 'roles-v1.0'),
-('NBA_2006', 'nba_101187', 20.0, 2.817, 0.25, 0.3349, 0.1838, 0.354, 0.9432, 1, 'roles-v1.0'),
-('NBA_2006', 'nba_101212', 0.0, 0.0, NULL, 0.354, 0.0, 0.354, 0.0, 0, 'roles-v1.0'),
-('NBA_2006', 'nba_101249', 59.0, 5.539, 0.2542, 0.3142, 0.3992, 0.354, 1.7402, 1, 'roles-v1.0'),
-('NBA_2006', 'nba_1531', 1.0, 0.035, 0.0, 0.3501, 0.0111, 0.354, 0.0123, 0, 'roles-v1.0'),
-('GL_2022', 'nba_1626147', 194.0, 6.223, 0.3247, 0.3335, 0.7101, 0.3551, 2.0756, 1, 'roles-v1.0'),
-('GL_2022', 'nba_1626161', 17.0, 1.741, 0.2941, 0.3443, 0.1767, 0.3551, 0.5995, 0, 'roles-v1.0'),
-('GL_2022', 'nba_1626203', 33.0, 5.066, 0.3333, 0.3487, 0.2941, 0.3551, 1.7667, 1, 'roles-v1.0'),
-('GL_2022', 'nba_1626208', 139.0, 5.411, 0.2878, 0.3122, 0.637, 0.3551, 1.6895, 1, 'roles-v1.0'),
-('GL_2022', 'nba_1627739', 51.0, 3.124, 0.4118, 0.3773, 0.3917, 0.3551, 1.1787, 1, 'roles-v1.0'),
-('GL_2022', 'nba_1627756', 160.0, 8.691, 0.3875, 0.3768, 0.6689, 0.3551, 3.2746, 1, 'roles-v1.0'),
-('GL_2022', 'nba_1627775', 93.0, 5.211, 0.3011, 0.3259, 0.5401, 0.3551, 1.6983, 1, 'roles-v1.0'),
-('NBA_2002', 'nba_1531', 1.0, 0.035, 1.0, 0.3535, 0.0082, 0.3482, 0.0122, 0, 'roles-v1.0');
+('NBA_2016', 'nba_1627762', 4.0, 2.741, 0.25, 0.3447, 0.0434, 0.349, 0.9449, 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1627767', 0.0, 0.0, NULL, 0.349, 0.0, 0.349, 0.0, 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1627775', 123.0, 4.123, 0.3333, 0.3399, 0.5826, 0.349, 1.4013, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1627785', 149.0, 3.264, 0.2953, 0.3153, 0.6283, 0.349, 1.029, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1627789', 161.0, 4.871, 0.3106, 0.3242, 0.6462, 0.349, 1.579, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1627812', 176.0, 5.293, 0.3864, 0.3739, 0.6663, 0.349, 1.9791, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1627816', 19.0, 4.361, 0.3158, 0.3431, 0.1773, 0.349, 1.4965, 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1627823', 113.0, 4.832, 0.4071, 0.3816, 0.5618, 0.349, 1.8441, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1627834', 2.0, 0.203, 0.0, 0.3413, 0.0222, 0.349, 0.0692, 0, 'roles-v1.1'),
+('NBA_2016', 'nba_1627835', 99.0, 4.226, 0.3333, 0.3407, 0.529, 0.349, 1.4399, 1, 'roles-v1.1'),
+('NBA_2016', 'nba_1627851', 168.0, 5.951, 0.3214, 0.3309, 0.6559, 0.349, 1.9693, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_101127', 86.0, 2.001, 0.2907, 0.3244, 0.4627, 0.3534, 0.649, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_101141', 253.0, 5.266, 0.3597, 0.3579, 0.717, 0.3534, 1.8847, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1626147', 103.0, 7.142, 0.3301, 0.3416, 0.5077, 0.3534, 2.4398, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1626150', 142.0, 3.854, 0.331, 0.3403, 0.5871, 0.3534, 1.3115, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1626159', 129.0, 2.764, 0.3798, 0.3683, 0.5637, 0.3534, 1.0179, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1626161', 12.0, 0.211, 0.25, 0.3424, 0.1073, 0.3534, 0.0724, 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1626163', 274.0, 5.375, 0.3796, 0.3726, 0.7329, 0.3534, 2.0026, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1626166', 91.0, 5.633, 0.3846, 0.3683, 0.4768, 0.3534, 2.0749, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1626169', 234.0, 4.449, 0.2863, 0.3064, 0.7009, 0.3534, 1.3631, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1626170', 187.0, 3.992, 0.3262, 0.3357, 0.6519, 0.3534, 1.3401, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1626188', 104.0, 5.056, 0.4423, 0.3988, 0.5102, 0.3534, 2.0162, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1626195', 12.0, 0.874, 0.4167, 0.3602, 0.1073, 0.3534, 0.3148, 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1626199', 6.0, 2.269, 0.0, 0.3334, 0.0567, 0.3534, 0.7565, 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1626203', 97.0, 3.327, 0.4124, 0.3825, 0.4927, 0.3534, 1.2726, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1626209', 267.0, 5.801, 0.3371, 0.3415, 0.7278, 0.3534, 1.9811, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1626224', 87.0, 4.657, 0.3678, 0.3601, 0.4656, 0.3534, 1.6773, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1626246', 0.0, 0.0, NULL, 0.3534, 0.0, 0.3534, 0.0, 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1626643', 1.0, 5.918, 0.0, 0.3499, 0.0099, 0.3534, 2.0709, 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1627098', 124.0, 4.402, 0.371, 0.3632, 0.5539, 0.3534, 1.5985, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627733', 322.0, 5.602, 0.3665, 0.3634, 0.7633, 0.3534, 2.0355, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627735', 5.0, 2.237, 0.8, 0.3747, 0.0477, 0.3534, 0.8381, 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1627739', 134.0, 3.164, 0.3209, 0.3348, 0.573, 0.3534, 1.0592, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627748', 104.0, 3.025, 0.2981, 0.3252, 0.5102, 0.3534, 0.9836, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627756', 370.0, 6.358, 0.3865, 0.3795, 0.7875, 0.3534, 2.4125, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627762', 1.0, 0.956, 0.0, 0.3499, 0.0099, 0.3534, 0.3345, 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1627767', 0.0, 0.0, NULL, 0.3534, 0.0, 0.3534, 0.0, 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1627775', 80.0, 2.996, 0.2375, 0.3019, 0.4448, 0.3534, 0.9046, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627785', 18.0, 3.607, 0.3889, 0.3589, 0.1527, 0.3534, 1.2944, 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1627789', 158.0, 7.052, 0.3354, 0.3424, 0.6127, 0.3534, 2.4148, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627790', 0.0, 0.0, NULL, 0.3534, 0.0, 0.3534, 0.0, 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1627812', 359.0, 5.665, 0.3733, 0.3689, 0.7824, 0.3534, 2.09, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627814', 60.0, 5.341, 0.25, 0.3146, 0.3753, 0.3534, 1.6804, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627816', 11.0, 3.803, 0.3636, 0.3545, 0.0992, 0.3534, 1.3481, 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1627820', 40.0, 1.692, 0.25, 0.3239, 0.286, 0.3534, 0.5479, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627823', 50.0, 6.496, 0.28, 0.3289, 0.3337, 0.3534, 2.1369, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627824', 37.0, 5.667, 0.3243, 0.3456, 0.2704, 0.3534, 1.9583, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627834', 0.0, 0.0, NULL, 0.3534, 0.0, 0.3534, 0.0, 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1627835', 110.0, 4.806, 0.3364, 0.3445, 0.5242, 0.3534, 1.6556, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627846', 65.0, 4.487, 0.3538, 0.3536, 0.3943, 0.3534, 1.5866, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627851', 0.0, 0.0, NULL, 0.3534, 0.0, 0.3534, 0.0, 0, 'roles-v1.1'),
+('NBA_2017', 'nba_1627853', 31.0, 3.67, 0.2903, 0.3385, 0.2369, 0.3534, 1.2421, 1, 'roles-v1.1'),
+('NBA_2017', 'nba_1627858', 17.0, 1.276, 0.2353, 0.3363, 0.1455, 0.3534, 0.4291, 0, 'roles-v1.1'),
+('NBA_2018', 'nba_101141', 160.0, 4.678, 0.3625, 0.3566, 0.5838, 0.3483, 1.6682, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1626147', 77.0, 5.981, 0.3117, 0.3336, 0.403, 0.3483, 1.9949, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1626150', 25.0, 4.844, 0.2, 0.3217, 0.1798, 0.3483, 1.5583, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1626159', 256.0, 4.703, 0.375, 0.3668, 0.6918, 0.3483, 1.7251, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1626161', 2.0, 0.033, 0.5, 0.3509, 0.0172, 0.3483, 0.0114, 0, 'roles-v1.1'),
+('NBA_2018', 'nba_1626163', 139.0, 6.631, 0.3597, 0.3546, 0.5493, 0.3483, 2.3511, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1626166', 84.0, 4.246, 0.2976, 0.3268, 0.4241, 0.3483, 1.3877, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1626169', 215.0, 6.411, 0.2884, 0.3092, 0.6534, 0.3483, 1.9819, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1626170', 110.0, 4.218, 0.3636, 0.3558, 0.4909, 0.3483, 1.5011, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1626174', 26.0, 3.739, 0.3462, 0.3479, 0.1856, 0.3483, 1.3011, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1626188', 200.0, 6.799, 0.405, 0.3844, 0.6368, 0.3483, 2.6139, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1626195', 39.0, 1.729, 0.3846, 0.3576, 0.2548, 0.3483, 0.6184, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1626203', 128.0, 6.441, 0.2969, 0.3211, 0.5288, 0.3483, 2.0685, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1626209', 152.0, 4.536, 0.2763, 0.3072, 0.5713, 0.3483, 1.3935, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1626224', 374.0, 5.509, 0.3476, 0.3478, 0.7663, 0.3483, 1.9159, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1626246', 10.0, 0.529, 0.4, 0.3525, 0.0806, 0.3483, 0.1864, 0, 'roles-v1.1'),
+('NBA_2018', 'nba_1627733', 101.0, 4.401, 0.2178, 0.287, 0.4696, 0.3483, 1.2632, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1627735', 9.0, 3.46, 0.2222, 0.3391, 0.0731, 0.3483, 1.1732, 0, 'roles-v1.1'),
+('NBA_2018', 'nba_1627739', 96.0, 2.487, 0.3542, 0.351, 0.457, 0.3483, 0.8731, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1627748', 153.0, 5.665, 0.3203, 0.3323, 0.5729, 0.3483, 1.8822, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1627767', 4.0, 0.161, 0.25, 0.345, 0.0339, 0.3483, 0.0555, 0, 'roles-v1.1'),
+('NBA_2018', 'nba_1627775', 28.0, 2.537, 0.3214, 0.343, 0.1971, 0.3483, 0.8703, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1627789', 116.0, 6.239, 0.3103, 0.3292, 0.5042, 0.3483, 2.0539, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1627790', 0.0, 0.0, NULL, 0.3483, 0.0, 0.3483, 0.0, 0, 'roles-v1.1'),
+('NBA_2018', 'nba_1627812', 149.0, 5.029, 0.3624, 0.3563, 0.5664, 0.3483, 1.7918, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1627814', 68.0, 6.525, 0.3971, 0.3665, 0.3735, 0.3483, 2.3915, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1627816', 23.0, 2.716, 0.3913, 0.3555, 0.1678, 0.3483, 0.9655, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1627820', 19.0, 1.09, 0.2105, 0.3287, 0.1428, 0.3483, 0.3581, 0, 'roles-v1.1'),
+('NBA_2018', 'nba_1627823', 181.0, 4.798, 0.3646, 0.3583, 0.6134, 0.3483, 1.7192, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1627824', 28.0, 4.019, 0.3214, 0.343, 0.1971, 0.3483, 1.3787, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1627846', 100.0, 5.19, 0.32, 0.3351, 0.4671, 0.3483, 1.7391, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1627853', 217.0, 3.983, 0.3733, 0.3647, 0.6555, 0.3483, 1.4525, 1, 'roles-v1.1'),
+('NBA_2018', 'nba_1629029', 514.0, 7.984, 0.3268, 0.3308, 0.8184, 0.3483, 2.6406, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_101141', 137.0, 5.0, 0.365, 0.3585, 0.5996, 0.3489, 1.7928, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1626147', 29.0, 9.727, 0.2069, 0.3147, 0.2407, 0.3489, 3.0615, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1626159', 27.0, 2.759, 0.2222, 0.3201, 0.2279, 0.3489, 0.8832, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1626161', 1.0, 0.033, 0.0, 0.3452, 0.0108, 0.3489, 0.0113, 0, 'roles-v1.1'),
+('NBA_2019', 'nba_1626163', 124.0, 5.742, 0.3306, 0.3384, 0.5754, 0.3489, 1.9432, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1626166', 29.0, 5.7, 0.5172, 0.3894, 0.2407, 0.3489, 2.2198, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1626169', 24.0, 5.771, 0.2917, 0.337, 0.2078, 0.3489, 1.9449, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1626170', 8.0, 3.584, 0.25, 0.341, 0.0804, 0.3489, 1.2221, 0, 'roles-v1.1'),
+('NBA_2019', 'nba_1626174', 140.0, 3.805, 0.3857, 0.3712, 0.6048, 0.3489, 1.4123, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1626188', 85.0, 6.024, 0.3647, 0.3565, 0.4816, 0.3489, 2.1478, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1626195', 22.0, 2.111, 0.2273, 0.3253, 0.1938, 0.3489, 0.6867, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1626203', 120.0, 4.649, 0.275, 0.307, 0.5674, 0.3489, 1.427, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1626209', 78.0, 3.222, 0.3077, 0.33, 0.4602, 0.3489, 1.0632, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1626224', 321.0, 6.049, 0.3832, 0.3756, 0.7782, 0.3489, 2.2719, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1626246', 17.0, 1.451, 0.2353, 0.3311, 0.1567, 0.3489, 0.4803, 0, 'roles-v1.1'),
+('NBA_2019', 'nba_1627733', 43.0, 5.421, 0.3488, 0.3489, 0.3197, 0.3489, 1.8914, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1627739', 112.0, 3.178, 0.2589, 0.2994, 0.5504, 0.3489, 0.9516, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1627748', 64.0, 2.969, 0.3438, 0.3468, 0.4116, 0.3489, 1.0295, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1627756', 137.0, 10.109, 0.3358, 0.341, 0.5996, 0.3489, 3.4475, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1627767', 3.0, 0.226, 0.3333, 0.3484, 0.0317, 0.3489, 0.0786, 0, 'roles-v1.1'),
+('NBA_2019', 'nba_1627775', 71.0, 2.815, 0.3239, 0.338, 0.4369, 0.3489, 0.9514, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1627789', 160.0, 6.755, 0.3875, 0.3735, 0.6362, 0.3489, 2.5229, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1627790', 0.0, 0.0, NULL, 0.3489, 0.0, 0.3489, 0.0, 0, 'roles-v1.1'),
+('NBA_2019', 'nba_1627812', 79.0, 5.368, 0.3038, 0.328, 0.4634, 0.3489, 1.761, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1627814', 239.0, 6.048, 0.3556, 0.3538, 0.7232, 0.3489, 2.1398, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1627820', 15.0, 3.367, 0.0667, 0.3092, 0.1409, 0.3489, 1.041, 0, 'roles-v1.1'),
+('NBA_2019', 'nba_1627823', 129.0, 5.572, 0.3411, 0.3443, 0.5851, 0.3489, 1.9185, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1627846', 128.0, 5.315, 0.375, 0.3641, 0.5832, 0.3489, 1.9354, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1627853', 138.0, 5.342, 0.3913, 0.3744, 0.6013, 0.3489, 2.0001, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1629029', 541.0, 9.513, 0.3161, 0.3208, 0.8553, 0.3489, 3.0522, 1, 'roles-v1.1'),
+('NBA_2019', 'nba_1629740', 206.0, 7.116, 0.335, 0.3393, 0.6925, 0.3489, 2.4142, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_101141', 41.0, 10.004, 0.439, 0.3848, 0.3302, 0.358, 3.8493, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1626159', 54.0, 3.834, 0.1852, 0.29, 0.3937, 0.358, 1.1118, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1626161', 11.0, 0.437, 0.0909, 0.3268, 0.1168, 0.358, 0.1429, 0, 'roles-v1.1'),
+('NBA_2020', 'nba_1626163', 85.0, 4.281, 0.3647, 0.3614, 0.5054, 0.358, 1.5471, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1626166', 166.0, 5.536, 0.4398, 0.4125, 0.6662, 0.358, 2.2836, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1626169', 137.0, 4.905, 0.3285, 0.3396, 0.6223, 0.358, 1.6658, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1626174', 206.0, 5.593, 0.3738, 0.3693, 0.7124, 0.358, 2.0653, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1626188', 26.0, 5.948, 0.4231, 0.3735, 0.2382, 0.358, 2.2218, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1626195', 10.0, 0.425, 0.1, 0.3303, 0.1073, 0.358, 0.1405, 0, 'roles-v1.1'),
+('NBA_2020', 'nba_1626224', 324.0, 7.722, 0.3056, 0.3163, 0.7957, 0.358, 2.4422, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1626246', 8.0, 1.061, 0.125, 0.3376, 0.0878, 0.358, 0.3583, 0, 'roles-v1.1'),
+('NBA_2020', 'nba_1626253', 2.0, 1.176, 0.5, 0.3614, 0.0235, 0.358, 0.425, 0, 'roles-v1.1'),
+('NBA_2020', 'nba_1627739', 2.0, 1.586, 0.0, 0.3496, 0.0235, 0.358, 0.5543, 0, 'roles-v1.1'),
+('NBA_2020', 'nba_1627748', 2.0, 0.942, 0.0, 0.3496, 0.0235, 0.358, 0.3292, 0, 'roles-v1.1'),
+('NBA_2020', 'nba_1627756', 242.0, 8.411, 0.3306, 0.3376, 0.7442, 0.358, 2.8396, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1627775', 0.0, 0.0, NULL, 0.358, 0.0, 0.358, 0.0, 0, 'roles-v1.1'),
+('NBA_2020', 'nba_1627789', 239.0, 8.192, 0.3138, 0.3252, 0.7418, 0.358, 2.6643, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1627812', 28.0, 7.359, 0.3214, 0.3488, 0.2519, 0.358, 2.5667, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1627814', 194.0, 6.473, 0.3969, 0.3852, 0.6999, 0.358, 2.4935, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1627823', 168.0, 6.72, 0.3274, 0.3375, 0.6689, 0.358, 2.2681, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1627846', 43.0, 4.357, 0.4186, 0.3787, 0.3408, 0.358, 1.6501, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1627853', 67.0, 5.355, 0.3731, 0.3648, 0.4462, 0.358, 1.9533, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1629029', 548.0, 8.72, 0.3504, 0.3514, 0.8682, 0.358, 3.064, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1629740', 85.0, 5.405, 0.2706, 0.3138, 0.5054, 0.358, 1.6962, 1, 'roles-v1.1'),
+('NBA_2020', 'nba_1630267', 216.0, 5.457, 0.3519, 0.3536, 0.722, 0.358, 1.9295, 1, 'roles-v1.1'),
+('NBA_2021', 'nba_1626147', 59.0, 6.725, 0.2542, 0.3098, 0.3836, 0.3444, 2.0834, 1, 'roles-v1.1'),
+('NBA_2021', 'nba_1626159', 66.0, 3.067, 0.2273, 0.2963, 0.4104, 0.3444, 0.9089, 1, 'roles-v1.1'),
+('NBA_2021', 'nba_1626161', 2.0, 0.394, 0.5, 0.3476, 0.0207, 0.3444, 0.1369, 0, 'roles-v1.1'),
+('NBA_2021', 'nba_1626163', 15.0, 2.984, 0.3333, 0.3429, 0.1366, 0.3444, 1.0233, 0, 'roles-v1.1'),
+('NBA_2021', 'nba_1626166', 211.0, 5.946, 0.3365, 0.3389, 0.69, 0.3444, 2.0152, 1, 'roles-v1.1'),
+('NBA_2021', 'nba_1626169', 105.0, 3.454, 0.3143, 0.3286, 0.5255, 0.3444, 1.1349, 1, 'roles-v1.1'),
+('NBA_2021', 'nba_1626174', 336.0, 5.778, 0.3899, 0.3799, 0.7799, 0.3444, 2.1947, 1, 'roles-v1.1'),
+('NBA_2021', 'nba_1626195', 12.0, 0.515, 0.3333, 0.3432, 0.1123, 0.3444, 0.1767, 0, 'roles-v1.1'),
+('NBA_2021', 'nba_1626208', 90.0, 5.72, 0.3, 0.3228, 0.487, 0.3444, 1.8464, 1, 'roles-v1.1'),
+('NBA_2021', 'nba_1626224', 359.0, 8.841, 0.3565, 0.354, 0.7911, 0.3444, 3.1299, 1, 'roles-v1.1'),
+('NBA_2021', 'nba_1626246', 4.0, 1.125, 0.25, 0.3406, 0.0405, 0.3444, 0.3833, 0, 'roles-v1.1'),
+('NBA_2021', 'nba_1627739', 11.0, 1.177, 0.0909, 0.318, 0.104, 0.3444, 0.3745, 0, 'roles-v1.1'),
+('NBA_2021', 'nba_1627756', 47.0, 7.622, 0.4043, 0.3642, 0.3314, 0.3444, 2.7761, 1, 'roles-v1.1'),
+('NBA_2021', 'nba_1627767', 0.0, 0.0, NULL, 0.3444, 0.0, 0.3444, 0.0, 0, 'roles-v1.1'),
+('NBA_2021', 'nba_1627789', 122.0, 6.413, 0.3607, 0.3535, 0.5627, 0.3444, 2.2674, 1, 'roles-v1.1'),
+('NBA_2021', 'nba_1627814', 187.0, 5.358, 0.3369, 0.3394, 0.6636, 0.3444, 1.8185, 1, 'roles-v1.1'),
+('NBA_2021', 'nba_1627820', 8.0, 3.844, 0.25, 0.337, 0.0778, 0.3444, 1.2956, 0, 'roles-v1.1'),
+('NBA_2021', 'nba_1627822', 8.0, 7.586, 0.125, 0.3273, 0.0778, 0.3444, 2.4831, 0, 'roles-v1.1'),
+('NBA_2021', 'nba_1627823', 69.0, 5.588, 0.3478, 0.3458, 0.4212, 0.3444, 1.9324, 1, 'roles-v1.1'),
+('NBA_2021', 'nba_1627846', 14.0, 3.47, 0.2857, 0.3368, 0.1287, 0.3444, 1.1689, 0, 'roles-v1.1'),
+('NBA_2021', 'nba_1627853', 9.0, 4.249, 0.4444, 0.3531, 0.0867, 0.3444, 1.5002, 0, 'roles-v1.1'),
+('NBA_2021', 'nba_1629029', 569.0, 8.903, 0.3533, 0.352, 0.8572, 0.3444, 3.1338, 1, 'roles-v1.1'),
+('NBA_2021', 'nba_1630267', 193.0, 5.868, 0.3005, 0.315, 0.6706, 0.3444, 1.8483, 1, 'roles-v1.1'),
+('NBA_2022', 'nba_1626159', 45.0, 2.088, 0.3111, 0.3412, 0.2963, 0.3538, 0.7124, 1, 'roles-v1.1'),
+('NBA_2022', 'nba_1626163', 33.0, 5.058, 0.3939, 0.3633, 0.236, 0.3538, 1.8376, 1, 'roles-v1.1'),
+('NBA_2022', 'nba_1626166', 185.0, 6.878, 0.3676, 0.3625, 0.6339, 0.3538, 2.4935, 1, 'roles-v1.1'),
+('NBA_2022', 'nba_1626169', 40.0, 3.067, 0.45, 0.38, 0.2724, 0.3538, 1.1655, 1, 'roles-v1.1'),
+('NBA_2022', 'nba_1626174', 279.0, 5.778, 0.3763, 0.3701, 0.7231, 0.3538, 2.1384, 1, 'roles-v1.1'),
+('NBA_2022', 'nba_1626195', 11.0, 0.865, 0.2727, 0.3462, 0.0933, 0.3538, 0.2996, 0, 'roles-v1.1'),
+('NBA_2022', 'nba_1626224', 312.0, 7.254, 0.3718, 0.3672, 0.7449, 0.3538, 2.6638, 1, 'roles-v1.1'),
+('NBA_2022', 'nba_1626246', 1.0, 0.21, 0.0, 0.3505, 0.0093, 0.3538, 0.0738, 0, 'roles-v1.1'),
+('NBA_2022', 'nba_1627739', 36.0, 2.284, 0.4722, 0.3837, 0.252, 0.3538, 0.8761, 1, 'roles-v1.1'),
+('NBA_2022', 'nba_1627814', 247.0, 5.903, 0.4453, 0.4177, 0.698, 0.3538, 2.4658, 1, 'roles-v1.1'),
+('NBA_2022', 'nba_1627823', 67.0, 3.932, 0.2537, 0.3152, 0.3854, 0.3538, 1.2394, 1, 'roles-v1.1'),
+('NBA_2022', 'nba_1627853', 23.0, 4.804, 0.3478, 0.3528, 0.1771, 0.3538, 1.6946, 1, 'roles-v1.1'),
+('NBA_2022', 'nba_1629029', 541.0, 8.147, 0.342, 0.3439, 0.8351, 0.3538, 2.802, 1, 'roles-v1.1'),
+('NBA_2022', 'nba_1630267', 11.0, 7.592, 0.2727, 0.3462, 0.0933, 0.3538, 2.6286, 0, 'roles-v1.1'),
+('NBA_2023', 'nba_1626166', 267.0, 7.371, 0.3895, 0.3816, 0.7419, 0.3587, 2.8124, 1, 'roles-v1.1'),
+('NBA_2023', 'nba_1626174', 114.0, 4.707, 0.307, 0.3302, 0.551, 0.3587, 1.5543, 1, 'roles-v1.1'),
+('NBA_2023', 'nba_1626224', 221.0, 6.271, 0.3891, 0.3801, 0.704, 0.3587, 2.3838, 1, 'roles-v1.1'),
+('NBA_2023', 'nba_1626246', 2.0, 1.015, 0.0, 0.3512, 0.0211, 0.3587, 0.3566, 0, 'roles-v1.1'),
+('NBA_2023', 'nba_1627739', 111.0, 3.199, 0.3694, 0.3645, 0.5444, 0.3587, 1.1661, 1, 'roles-v1.1'),
+('NBA_2023', 'nba_1627853', 6.0, 4.784, 0.0, 0.337, 0.0607, 0.3587, 1.6119, 0, 'roles-v1.1'),
+('NBA_2023', 'nba_1629029', 744.0, 10.207, 0.3817, 0.3792, 0.889, 0.3587, 3.8702, 1, 'roles-v1.1'),
+('NBA_2023', 'nba_203995', 154.0, 4.715, 0.2792, 0.3091, 0.6237, 0.3587, 1.4577, 1, 'roles-v1.1'),
+('NBA_2024', 'nba_1626166', 256.0, 8.455, 0.3633, 0.3607, 0.7104, 0.3543, 3.0497, 1, 'roles-v1.1'),
+('NBA_2024', 'nba_1627739', 224.0, 4.523, 0.3348, 0.341, 0.6822, 0.3543, 1.5424, 1, 'roles-v1.1'),
+('NBA_2024', 'nba_1627814', 37.0, 9.249, 0.2432, 0.3253, 0.2618, 0.3543, 3.0082, 1, 'roles-v1.1'),
+('NBA_2024', 'nba_1627824', 274.0, 5.206, 0.3796, 0.3726, 0.7242, 0.3543, 1.9398, 1, 'roles-v1.1'),
+('NBA_2024', 'nba_1629029', 481.0, 9.791, 0.368, 0.3655, 0.8217, 0.3543, 3.5791, 1, 'roles-v1.1'),
+('NBA_2024', 'nba_203995', 125.0, 5.733, 0.36, 0.3574, 0.5451, 0.3543, 2.0492, 1, 'roles-v1.1');
 INSERT INTO hypothetical_projections ("person_id", "source_season_id", "source_season_order", "source_league", "target_season_id", "direction", "metric", "source_value", "z_source", "predicted", "pi80_low", "pi80_high", "pi95_low", "pi95_high", "in_support", "moved_before", "minutes", "age", "support_n_movers", "model_version", "snapshot_id") VALUES
 ('nba_1626643', 'EL_2015', 2015, 'EL', 'NBA_2024', 'EL->NBA', 'usg_pct', 0.29907, 2.2418, 0.25623, 0.19697, 0.31548, 0.1656, 0.34685, 0, 1, 583.3, 26.0, 15, 'translation-v1.0', 'fixture01'),
 ('nba_1531', 'EL_2007', 2007, 'EL', 'NBA_2024', 'EL->NBA', 'usg_pct', 0.27938, 1.7942, 0.23504, 0.17578, 0.29429, 0.14442, 0.32566, 1, 1, 552.4, 32.0, 15, 'translation-v1.0', 'fixture01'),
@@ -99,6 +99,34 @@ describe("GET /players/:personId/comps", () => {
 
     expect(rows.every((r) => r.neighbourPersonId !== personId)).toBe(true);
   });
+
+  it("serves the same-season scope unless asked for another", async () => {
+    const { body } = await get(`/players/${await anyPersonId()}/comps`);
+    const rows = (
+      body as never as { data: { scope: string; seasonId: string; neighbourSeasonId: string }[] }
+    ).data;
+
+    expect(rows.every((r) => r.scope === "season" && r.neighbourSeasonId === r.seasonId)).toBe(
+      true
+    );
+  });
+
+  it("draws comparables across eras without the player's own other seasons", async () => {
+    const personId = await anyPersonId();
+    const { res, body } = await get(`/players/${personId}/comps?scope=all`);
+    const rows = (body as never as { data: { scope: string; neighbourPersonId: string }[] }).data;
+
+    expect(res.status).toBe(200);
+    expect(rows.length).toBeGreaterThan(0);
+    expect(rows.every((r) => r.scope === "all" && r.neighbourPersonId !== personId)).toBe(true);
+  });
+
+  it("rejects a scope that does not exist", async () => {
+    const { res, body } = await get(`/players/${await anyPersonId()}/comps?scope=decade`);
+
+    expect(res.status).toBe(422);
+    expect((body as never as { code: string }).code).toBe("INVALID_QUERY");
+  });
 });
 
 describe("GET /players/:personId/shooting", () => {
@@ -75,7 +75,7 @@ export default async function ArchetypesPage() {
         <p className="text-sm text-slate-300">
           Two criteria disagreed. Held-out log-likelihood keeps improving as clusters are added but
           flattens after five; bootstrap stability collapses from a mean Jaccard of 0.52 at k=5 to
-          0.40 at k=6. Where they disagree the smaller k wins, so k=5 — and the resulting mean
+          0.43 at k=6. Where they disagree the smaller k wins, so k=5 — and the resulting mean
           stability of 0.52 is <strong>moderate</strong>, meaning real structure rather than a crisp
           taxonomy.
         </p>
@@ -27,11 +27,12 @@ type PlayerDetail = {
 export default async function PlayerPage({ params }: { params: Promise<{ personId: string }> }) {
   const { personId } = await params;
 
-  const [detail, translation, shooting, comps, report] = await Promise.all([
+  const [detail, translation, shooting, comps, eraComps, report] = await Promise.all([
     apiGetOptional<PlayerDetail>(`/players/${personId}`),
     apiGetOptional<TranslationPrediction[]>(`/players/${personId}/translation`),
     apiGetOptional<ShootingRow[]>(`/players/${personId}/shooting`),
     apiGetOptional<CompRow[]>(`/players/${personId}/comps?limit=6`),
+    apiGetOptional<CompRow[]>(`/players/${personId}/comps?scope=all&limit=6`),
     apiGetOptional<ScoutingReportResponse>(`/players/${personId}/report`),
   ]);
 
@@ -158,6 +159,25 @@ export default async function PlayerPage({ params }: { params: Promise<{ personI
         </Card>
       ) : null}
 
+      {!isProblem(eraComps) && eraComps.data.length > 0 ? (
+        <Card
+          title="Comparables across eras"
+          subtitle="Nearest seasons in any league and any year, each standardised within its own season."
+        >
+          <Table
+            caption="Most similar seasons anywhere"
+            headers={["Season", "Rank", "Player", "Their season", "Distance"]}
+            rows={eraComps.data.map((row) => [
+              row.seasonId,
+              `#${row.rank}`,
+              row.neighbourName ?? row.neighbourPersonId,
+              row.neighbourSeasonId,
+              decimal(row.distance, 3),
+            ])}
+          />
+        </Card>
+      ) : null}
+
       <Provenance
         snapshot={detail.meta.snapshot}
         model={!isProblem(translation) ? translation.meta.model : undefined}
@@ -174,6 +174,11 @@ export type TranslationPrediction = {
   pi80High: number;
   pi95Low: number;
   pi95High: number;
+  /** Conformal intervals; null where a direction has too few movers for one. */
+  conformal80Low: number | null;
+  conformal80High: number | null;
+  conformal95Low: number | null;
+  conformal95High: number | null;
   actualValue: number | null;
   baselineLeagueMean: number;
   baselineZPreservation: number;
@@ -301,9 +306,11 @@ export type ScoutingReportResponse = {
 };
 
 export type CompRow = {
+  scope: "season" | "era" | "all";
   seasonId: string;
   rank: number;
   distance: number;
+  neighbourSeasonId: string;
   neighbourPersonId: string;
   neighbourName: string | null;
 };
@@ -58,6 +58,8 @@ export function metricLabel(metric: string): string {
     usg_pct: "Usage rate",
     ts_pct: "True shooting",
     ast_pct: "Assist rate",
+    tov_rate: "Turnover rate",
+    pts_per_75: "Points per 75",
   };
   return names[metric] ?? metric;
 }
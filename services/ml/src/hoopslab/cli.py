@@ -68,7 +68,9 @@ def config() -> None:
 @app.command()
 def ingest(
     refresh: bool = typer.Option(
-        False, "--refresh", help="Refetch even when a payload is already cached."
+        False,
+        "--refresh",
+        help="Revalidate cached payloads; only those that changed are rewritten.",
     ),
     skip_nba: bool = typer.Option(False, "--skip-nba", help="Skip stats.nba.com."),
     skip_euroleague: bool = typer.Option(False, "--skip-euroleague"),
@@ -91,7 +93,13 @@ def ingest(
 
     paths = DataPaths.discover()
     console.print(f"[bold]Ingesting into[/bold] {paths.bronze}")
-    console.print(f"Rate limit: {settings.nba_stats_rate_limit_rps} req/s\n")
+    if settings.adaptive_rate_limit:
+        console.print(
+            f"Rate limit: adaptive from {settings.nba_stats_rate_limit_rps} req/s "
+            f"(or last run's rate), at most {settings.rate_limit_max_rps} req/s\n"
+        )
+    else:
+        console.print(f"Rate limit: {settings.nba_stats_rate_limit_rps} req/s\n")
 
     report = run_ingest(
         paths,
@@ -107,30 +115,83 @@ def ingest(
         raise typer.Exit(code=1)
 
 
+@app.command(name="bronze-compact")
+def bronze_compact() -> None:
+    """Fold superseded entries out of the bronze manifest index.
+
+    Only the SQLite index shrinks. ``manifest.jsonl`` is the audit log and keeps
+    every fetch ever made.
+    """
+    from hoopslab.io.bronze import BronzeCache
+
+    cache = BronzeCache(DataPaths.discover().bronze)
+    dropped = cache.index.compact()
+    console.print(f"Dropped {dropped} superseded entries; {len(cache.index)} remain indexed.")
+
+
 @app.command()
 def build(
     write_contracts: bool = typer.Option(
         True, "--contracts/--no-contracts", help="Regenerate the contract sidecars."
     ),
+    full: bool = typer.Option(
+        False, "--full", help="Ignore the recorded build state and rebuild everything."
+    ),
+    verify_incremental: bool = typer.Option(
+        False,
+        "--verify-incremental",
+        help="Also rebuild in full, and fail unless every table's content hash matches.",
+    ),
+    match_policy: str | None = typer.Option(
+        None,
+        "--match-policy",
+        help="How EuroLeague players are matched: 'default' (exact names, NBA persons; "
+        "the committed gold) or 'wide' (adds G League careers and near-spellings). "
+        "Defaults to the HOOPSLAB_MATCH_POLICY setting.",
+    ),
 ) -> None:
     """Build silver and gold from cached bronze payloads.
 
     Runs entirely offline. Nothing here touches a data source, so the transform
-    logic can be changed and re-run freely.
+    logic can be changed and re-run freely. Only the league-seasons whose bronze
+    changed since the last build are recomputed, unless ``--full`` is given.
     """
     import logging
 
     from hoopslab.transform.build import build_gold, write_gold
+    from hoopslab.transform.crosswalk import MATCH_POLICIES
+    from hoopslab.transform.incremental import compare_builds
 
     settings = load_settings()
     logging.basicConfig(level=settings.log_level, format="%(levelname)s %(message)s")
 
+    name = match_policy or settings.match_policy
+    if name not in MATCH_POLICIES:
+        raise typer.BadParameter(
+            f"expected one of {', '.join(MATCH_POLICIES)}", param_hint="--match-policy"
+        )
+    policy = MATCH_POLICIES[name]
+
     paths = DataPaths.discover()
-    result = build_gold(paths)
+    result = build_gold(paths, full=full, policy=policy)
+    if result.plan is not None:
+        console.print("\n[bold]Build plan[/bold]")
+        console.print(result.plan.render())
+
+    if verify_incremental:
+        reference = build_gold(paths, full=True, save_state=False, policy=policy)
+        differences = compare_builds(result.tables, reference.tables)
+        if differences:
+            for line in differences:
+                console.print(f"[red]{line}[/red]")
+            raise typer.Exit(code=1)
+        console.print("[green]incremental build matches a full rebuild, table for table[/green]")
 
     console.print("\n[bold]Identity resolution[/bold]")
     console.print(result.id_space.render())
     console.print(result.crosswalk_report.render())
+    if result.identity_update is not None:
+        console.print(result.identity_update.diff.render())
 
     write_gold(result, paths, write_contracts=write_contracts)
 
@@ -152,6 +213,9 @@ def train(
         "--verify",
         help="Refit and fail if any metric differs from the committed run log.",
     ),
+    workers: int = typer.Option(
+        1, "--workers", help="Processes to share the shuffled-target controls across."
+    ),
 ) -> None:
     """Fit the translation model, backtest it, and record the run.
 
@@ -172,7 +236,7 @@ def train(
     logging.basicConfig(level=settings.log_level, format="%(levelname)s %(message)s")
 
     paths = DataPaths.discover()
-    run, results = train_all(paths, seed=settings.seed)
+    run, results = train_all(paths, seed=settings.seed, refit=verify_only, workers=workers)
 
     console.print(f"[bold]{run.model_version}[/bold]  seed={run.seed}  git={run.git_sha}")
     for result in results:
@@ -363,6 +427,45 @@ def report_eval(
         raise typer.Exit(code=1)
 
 
+@app.command()
+def run(
+    stages: list[str] = typer.Option(
+        None,
+        "--stage",
+        help="Bring only this stage, and what it depends on, up to date. Repeatable.",
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Rerun every selected stage even if its inputs are unchanged."
+    ),
+    workers: int = typer.Option(4, "--workers", help="Stages allowed to run at once."),
+) -> None:
+    """Build, train, fit roles, export and evaluate, skipping what has not changed.
+
+    Each stage records a hash of its inputs; one whose inputs match its last
+    run, and whose outputs are still on disk, is skipped. Stages that do not
+    depend on each other run at the same time.
+    """
+    import logging
+
+    from hoopslab.pipeline import Context, run_pipeline
+
+    settings = load_settings()
+    logging.basicConfig(level=settings.log_level, format="%(levelname)s %(message)s")
+
+    context = Context(
+        paths=DataPaths.discover(), seed=settings.seed, match_policy=settings.match_policy
+    )
+    try:
+        result = run_pipeline(context, targets=stages or None, force=force, workers=workers)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--stage") from exc
+
+    console.print("[bold]Pipeline[/bold]")
+    console.print(result.render())
+    if not result.succeeded:
+        raise typer.Exit(code=1)
+
+
 @app.command(name="report-prune")
 def report_prune(
     delete: bool = typer.Option(False, "--delete", help="Actually remove the stale responses."),
@@ -420,13 +523,29 @@ def _first_transition(source: object, person_id: str) -> str:
 
 
 @app.command()
-def verify() -> None:
+def verify(
+    fast: bool = typer.Option(
+        False,
+        "--fast",
+        help="Check only the parquet footers: row counts, schema, null counts and ranges.",
+    ),
+    timings: bool = typer.Option(
+        False, "--timings", help="Show how long each table's scan and each integrity rule took."
+    ),
+) -> None:
     """Check committed gold against its contracts and integrity rules.
 
     Runs with no network access, so it works on a fresh clone and in CI. Exits
     non-zero when a table's contents no longer match the checksums committed
     alongside it, making silent data drift a failed build rather than a quietly
     changed number in the README.
+
+    ``--fast`` reads nothing but the parquet footers and skips the integrity
+    rules, so it costs the same however large gold grows. It cannot see a value
+    that changed inside its column's range; the full check can.
+
+    The integrity rules read each table once, together; ``--timings`` also
+    times each rule on its own, to find the one to blame when verify slows.
     """
     import polars as pl
 
@@ -441,25 +560,39 @@ def verify() -> None:
         )
         raise typer.Exit(code=1)
 
-    console.print("[bold]Contracts[/bold]")
-    problems = verify_gold(paths)
+    console.print("[bold]Contracts[/bold]" + (" (footers only)" if fast else ""))
+    problems = verify_gold(paths, full=not fast)
     if problems:
         for problem in problems:
             console.print(f"  [red]{problem}[/red]")
     else:
         console.print("  all tables match their committed contracts")
 
+    if fast:
+        if problems:
+            raise typer.Exit(code=1)
+        console.print("\n[green]Gold footers verified.[/green]")
+        return
+
     tables = {
-        name: pl.read_parquet(paths.gold / f"{name}.parquet")
+        name: pl.scan_parquet(paths.gold / f"{name}.parquet")
         for name in GOLD_TABLES
         if (paths.gold / f"{name}.parquet").is_file()
     }
 
     console.print("\n[bold]Integrity[/bold]")
-    results = checks.run_all(tables) if len(tables) == len(GOLD_TABLES) else []
+    report = (
+        checks.run_checks(tables, time_checks=timings)
+        if len(tables) == len(GOLD_TABLES)
+        else checks.CheckReport(results=[])
+    )
+    results = report.results
     for result in results:
         colour = "green" if result.passed else "red"
         console.print(f"  [{colour}]{result.render()}[/{colour}]")
+    if timings and report.table_seconds:
+        console.print("\n[bold]Timings[/bold]")
+        console.print(report.render_timings(), markup=False)
 
     failed = [r for r in results if not r.passed]
     if problems or failed:
@@ -53,6 +53,11 @@ SEED = 20260810
 #: risks an IP block that costs far more than the time saved.
 NBA_STATS_RATE_LIMIT_RPS = 0.67
 
+#: Ceiling for the adaptive limiter. It starts from the configured rate (or the
+#: rate the previous run learned) and never ramps past this, however long the
+#: host stays quiet.
+RATE_LIMIT_MAX_RPS = 2.0
+
 
 class Settings(BaseSettings):
     """Process configuration, read from the environment and ``.env``."""
@@ -75,6 +80,15 @@ class Settings(BaseSettings):
     #: Ingestion politeness. Overridable for local experiments, but the default
     #: is the one that has to hold in practice.
     nba_stats_rate_limit_rps: float = Field(default=NBA_STATS_RATE_LIMIT_RPS, gt=0, le=5)
+    rate_limit_max_rps: float = Field(default=RATE_LIMIT_MAX_RPS, gt=0, le=5)
+    #: Off restores the fixed limiter at ``nba_stats_rate_limit_rps``.
+    adaptive_rate_limit: bool = True
+
+    #: How ``hoopslab build`` and ``hoopslab run`` match EuroLeague players:
+    #: ``default`` is exact names against NBA persons, which the committed gold
+    #: is built with; ``wide`` adds G League careers and near-spellings. See
+    #: :data:`hoopslab.transform.crosswalk.MATCH_POLICIES`.
+    match_policy: Literal["default", "wide"] = "default"
 
 
 def load_settings() -> Settings:
@@ -9,14 +9,23 @@ percentage points, which is a quantity people have intuitions about.
 from __future__ import annotations
 
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 
 import numpy as np
 import polars as pl
 
 from hoopslab.eval.leakage import assert_no_entity_overlap, assert_temporal_disjoint
+from hoopslab.eval.resample import person_codes, resample_counts
 from hoopslab.models import baselines
-from hoopslab.models.translation import PersistenceModel, fit_translation
+from hoopslab.models.translation import (
+    NormalEquations,
+    PersistenceModel,
+    TranslationModel,
+    transition_design,
+)
 
 log = logging.getLogger(__name__)
 
@@ -29,6 +38,10 @@ MIN_FOLD_SIZE = 5
 #: model on folds that no plausible training set can support.
 FIRST_EVALUATED_SEASON = 2012
 
+#: The prediction interval whose out-of-fold coverage is reported. The 80%
+#: interval is the one the site leads with, so it is the one held to account.
+COVERAGE_LEVEL = 0.80
+
 
 @dataclass
 class FoldResult:
@@ -36,6 +49,7 @@ class FoldResult:
     n_test: int
     n_train: int
     errors: np.ndarray
+    covered: np.ndarray
     baseline_errors: dict[str, np.ndarray] = field(default_factory=dict)
 
 
@@ -46,7 +60,20 @@ class BacktestResult:
     model_errors: np.ndarray
     baseline_errors: dict[str, np.ndarray]
     person_ids: list[str]
-    shuffled_mae: float
+    #: Whether each evaluated row's actual value fell inside the fold model's
+    #: ``COVERAGE_LEVEL`` prediction interval.
+    covered: np.ndarray
+    #: Out-of-fold MAE of each shuffled-target control, the first being the
+    #: permutation a single control uses.
+    shuffled_maes: np.ndarray
+
+    @property
+    def shuffled_mae(self) -> float:
+        return float(self.shuffled_maes[0]) if self.shuffled_maes.size else float("nan")
+
+    @property
+    def coverage(self) -> float:
+        return float(self.covered.mean())
 
     @property
     def n(self) -> int:
@@ -56,6 +83,10 @@ class BacktestResult:
     def mae(self) -> float:
         return float(np.abs(self.model_errors).mean())
 
+    @property
+    def rmse(self) -> float:
+        return float(np.sqrt(np.square(self.model_errors).mean()))
+
     def baseline_mae(self) -> dict[str, float]:
         return {name: float(np.abs(errors).mean()) for name, errors in self.baseline_errors.items()}
 
@@ -75,6 +106,8 @@ def walk_forward(
     seed: int,
     first_season: int = FIRST_EVALUATED_SEASON,
     run_shuffled_control: bool = True,
+    n_permutations: int = 1,
+    workers: int = 1,
 ) -> BacktestResult:
     """Leave-one-target-season-out, grouped by player.
 
@@ -82,76 +115,134 @@ def walk_forward(
     who appear in the test fold handles the fact that roughly a third of this
     cohort transitions more than once, so a season split alone would let a
     player's own later move inform his earlier one.
-    """
-    seasons = sorted(
-        s
-        for s in transitions["target_season_order"].unique().to_list()
-        if s is not None and s >= first_season
-    )
-
-    folds: list[FoldResult] = []
-    all_errors: list[np.ndarray] = []
-    all_baseline_errors: dict[str, list[np.ndarray]] = {}
-    all_persons: list[str] = []
-
-    for season in seasons:
-        test = transitions.filter(pl.col("target_season_order") == season)
-        if test.height < MIN_FOLD_SIZE:
-            continue
-
-        test_persons = set(test["person_id"].to_list())
-        train = transitions.filter(
-            (pl.col("target_season_order") < season)
-            & ~pl.col("person_id").is_in(list(test_persons))
-        )
-        if train.height < 40:
-            continue
-
-        # Asserted here, on real folds, rather than assumed by a test elsewhere.
-        assert_temporal_disjoint(train, test)
-        assert_no_entity_overlap(train, test)
-
-        model = fit_translation(train, persistence, metric)
-        predicted = model.predict_rate(test)
-        actual = test["target_value"].to_numpy()
-        errors = predicted - actual
-
-        fold_baselines = _baseline_errors(test, model, actual)
-
-        folds.append(
-            FoldResult(
-                target_season=int(season),
-                n_test=test.height,
-                n_train=train.height,
-                errors=errors,
-                baseline_errors=fold_baselines,
-            )
-        )
-        all_errors.append(errors)
-        all_persons.extend(test["person_id"].to_list())
-        for name, values in fold_baselines.items():
-            all_baseline_errors.setdefault(name, []).append(values)
 
+    ``n_permutations`` shuffled controls are run alongside, across ``workers``
+    processes when there is more than one.
+    """
+    folds = _folds(transitions, persistence, metric, first_season)
     if not folds:
         raise ValueError(f"no evaluable folds for {metric}")
 
     return BacktestResult(
         metric=metric,
-        folds=folds,
-        model_errors=np.concatenate(all_errors),
-        baseline_errors={k: np.concatenate(v) for k, v in all_baseline_errors.items()},
-        person_ids=all_persons,
-        # The control re-enters this function on permuted data, so it must not
-        # ask for a control of its own.
-        shuffled_mae=(
-            _shuffled_control(transitions, persistence, metric, seed=seed)
+        folds=[fold for fold, _ in folds],
+        model_errors=np.concatenate([fold.errors for fold, _ in folds]),
+        baseline_errors={
+            name: np.concatenate([fold.baseline_errors[name] for fold, _ in folds])
+            for name in folds[0][0].baseline_errors
+        },
+        person_ids=[person for _, persons in folds for person in persons],
+        covered=np.concatenate([fold.covered for fold, _ in folds]),
+        shuffled_maes=(
+            _shuffled_controls(
+                transitions,
+                persistence,
+                metric,
+                seed=seed,
+                first_season=first_season,
+                n_permutations=n_permutations,
+                workers=workers,
+            )
             if run_shuffled_control
-            else float("nan")
+            else np.array([])
         ),
     )
 
 
-def _baseline_errors(test: pl.DataFrame, model, actual: np.ndarray) -> dict[str, np.ndarray]:  # type: ignore[no-untyped-def]
+def _folds(
+    transitions: pl.DataFrame, persistence: PersistenceModel, metric: str, first_season: int
+) -> list[tuple[FoldResult, list[str]]]:
+    """Every evaluable fold, with the players it scored.
+
+    The training set of a fold is every earlier season less the fold's own
+    players. Its normal equations are kept as a running sum over seasons, and
+    per player, so a fold costs one subtraction and a solve of a system the
+    size of the coefficient vector however long the history grows.
+    """
+    directions = sorted(transitions["direction"].unique().to_list())
+    design, _ = transition_design(transitions, directions, persistence)
+    response = transitions["z_target"].to_numpy()
+    codes, n_people = person_codes(transitions["person_id"].to_list())
+    order = transitions["target_season_order"].to_numpy()
+    # Only the columns the leakage assertions read, so a fold's training frame
+    # costs a mask rather than a filter of the whole table.
+    keys = transitions.select("person_id", "target_season_order")
+
+    k = design.shape[1]
+    total = NormalEquations(directions, np.zeros((k, k)), np.zeros(k), 0.0, 0)
+    by_person_xtx = np.zeros((n_people, k, k))
+    by_person_xty = np.zeros((n_people, k))
+    by_person_yty = np.zeros(n_people)
+    by_person_n = np.zeros(n_people, dtype=np.int64)
+    seen = np.zeros(transitions.height, dtype=bool)
+
+    folds: list[tuple[FoldResult, list[str]]] = []
+    for season in sorted(
+        s for s in keys["target_season_order"].unique().to_list() if s is not None
+    ):
+        rows = np.flatnonzero(order == season)
+
+        if season >= first_season and rows.size >= MIN_FOLD_SIZE:
+            movers = np.unique(codes[rows])
+            equations = total - NormalEquations(
+                directions,
+                by_person_xtx[movers].sum(axis=0),
+                by_person_xty[movers].sum(axis=0),
+                float(by_person_yty[movers].sum()),
+                int(by_person_n[movers].sum()),
+            )
+            if equations.n >= 40:
+                train = keys.filter(seen & ~np.isin(codes, movers))
+                test = transitions[rows]
+                # Asserted here, on the rows the fold's statistics were summed
+                # from, rather than assumed by a test elsewhere.
+                assert_temporal_disjoint(train, test)
+                assert_no_entity_overlap(train, test)
+                if train.height != equations.n:
+                    raise AssertionError(
+                        f"fold {season}: statistics cover {equations.n} rows, "
+                        f"the training set {train.height}"
+                    )
+
+                model = equations.solve(persistence, metric)
+                folds.append(
+                    (_score(model, test, int(season), equations.n), test["person_id"].to_list())
+                )
+
+        outer = design[rows, :, None] * design[rows, None, :]
+        np.add.at(by_person_xtx, codes[rows], outer)
+        np.add.at(by_person_xty, codes[rows], design[rows] * response[rows, None])
+        np.add.at(by_person_yty, codes[rows], response[rows] ** 2)
+        np.add.at(by_person_n, codes[rows], 1)
+        total = total + NormalEquations(
+            directions,
+            outer.sum(axis=0),
+            design[rows].T @ response[rows],
+            float(response[rows] @ response[rows]),
+            int(rows.size),
+        )
+        seen[rows] = True
+
+    return folds
+
+
+def _score(model: TranslationModel, test: pl.DataFrame, season: int, n_train: int) -> FoldResult:
+    predicted = model.predict_rate(test)
+    actual = test["target_value"].to_numpy()
+    interval = model.prediction_interval(test, level=COVERAGE_LEVEL)
+    return FoldResult(
+        target_season=season,
+        n_test=test.height,
+        n_train=n_train,
+        errors=predicted - actual,
+        covered=(actual >= interval[:, 0]) & (actual <= interval[:, 1]),
+        baseline_errors=_baseline_errors(test, model, actual),
+    )
+
+
+def _baseline_errors(
+    test: pl.DataFrame, model: TranslationModel, actual: np.ndarray
+) -> dict[str, np.ndarray]:
     persisted = model.persist(test)
     candidates = [
         baselines.target_league_mean(test),
@@ -162,26 +253,61 @@ def _baseline_errors(test: pl.DataFrame, model, actual: np.ndarray) -> dict[str,
     return {b.name: b.predictions - actual for b in candidates}
 
 
-def _shuffled_control(
-    transitions: pl.DataFrame, persistence: PersistenceModel, metric: str, *, seed: int
-) -> float:
+def _shuffled_controls(
+    transitions: pl.DataFrame,
+    persistence: PersistenceModel,
+    metric: str,
+    *,
+    seed: int,
+    first_season: int,
+    n_permutations: int,
+    workers: int,
+) -> np.ndarray:
     """Negative control: permute the response and refit.
 
     Reported alongside the real score in every results table. If shuffling the
     target does not collapse performance to roughly the league-mean baseline,
     something is leaking, and the headline number is measuring the leak.
+
+    Every permutation is drawn here, in order, from one generator, so the first
+    is the one a single control has always used and the set does not depend on
+    how many processes score it.
     """
     rng = np.random.default_rng(seed)
+    z_target = transitions["z_target"].to_numpy()
+    target_value = transitions["target_value"].to_numpy()
+    permutations = [
+        (rng.permutation(z_target), rng.permutation(target_value)) for _ in range(n_permutations)
+    ]
+    score = partial(_shuffled_mae, transitions, persistence, metric, first_season)
+
+    if workers <= 1 or n_permutations <= 1:
+        return np.array([score(permutation) for permutation in permutations])
+    # Spawned, not forked: a fork taken while polars' thread pool is running
+    # can inherit a held lock and never finish.
+    context = multiprocessing.get_context("spawn")
+    workers = min(workers, n_permutations)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        # One batch per process, so the frame is sent to each once.
+        chunk = -(-n_permutations // workers)
+        return np.array(list(pool.map(score, permutations, chunksize=chunk)))
+
+
+def _shuffled_mae(
+    transitions: pl.DataFrame,
+    persistence: PersistenceModel,
+    metric: str,
+    first_season: int,
+    permutation: tuple[np.ndarray, np.ndarray],
+) -> float:
+    z_target, target_value = permutation
     shuffled = transitions.with_columns(
-        pl.Series("z_target", rng.permutation(transitions["z_target"].to_numpy())),
-        pl.Series("target_value", rng.permutation(transitions["target_value"].to_numpy())),
+        pl.Series("z_target", z_target), pl.Series("target_value", target_value)
     )
-
-    try:
-        result = walk_forward(shuffled, persistence, metric, seed=seed, run_shuffled_control=False)
-    except ValueError:
+    folds = _folds(shuffled, persistence, metric, first_season)
+    if not folds:
         return float("nan")
-    return result.mae
+    return float(np.abs(np.concatenate([fold.errors for fold, _ in folds])).mean())
 
 
 def cluster_bootstrap_ci(
@@ -198,22 +324,52 @@ def cluster_bootstrap_ci(
     observations and produce an interval that is too narrow. Players are the
     unit that repeats, so players are the unit that is resampled.
     """
-    rng = np.random.default_rng(seed)
-    absolute = np.abs(errors)
+    return cluster_bootstrap(errors, person_ids, seed=seed, n_boot=n_boot, level=level)["mae"]
 
-    by_person: dict[str, list[float]] = {}
-    for person, value in zip(person_ids, absolute, strict=True):
-        by_person.setdefault(person, []).append(float(value))
 
-    people = list(by_person)
-    if len(people) < 2:
-        return (float("nan"), float("nan"))
+def cluster_bootstrap(
+    errors: np.ndarray,
+    person_ids: list[str],
+    *,
+    seed: int,
+    covered: np.ndarray | None = None,
+    n_boot: int = 2000,
+    level: float = 0.95,
+) -> dict[str, tuple[float, float]]:
+    """Player-clustered intervals for MAE, RMSE and, given ``covered``, coverage.
 
-    draws = np.empty(n_boot)
-    for i in range(n_boot):
-        sampled = rng.choice(len(people), size=len(people), replace=True)
-        pooled = [v for index in sampled for v in by_person[people[index]]]
-        draws[i] = float(np.mean(pooled))
+    Each statistic is a ratio of weighted per-player sums, so every statistic
+    of every draw is one matrix product of the resample counts against sums
+    taken once. Adding a statistic adds a column, not a pass.
+    """
+    codes, n_people = person_codes(person_ids)
+    if n_people < 2:
+        return dict.fromkeys(_statistics(covered), (float("nan"), float("nan")))
+
+    columns = {
+        "n": np.ones(codes.size),
+        "absolute": np.abs(errors),
+        "squared": np.square(errors),
+    }
+    if covered is not None:
+        columns["covered"] = covered.astype(float)
+    sums = np.column_stack(
+        [np.bincount(codes, weights=column, minlength=n_people) for column in columns.values()]
+    )
+
+    totals = np.vstack([counts @ sums for counts in resample_counts(n_people, n_boot, seed=seed)])
+
+    means = {name: totals[:, j] / totals[:, 0] for j, name in enumerate(columns)}
+    draws = {"mae": means["absolute"], "rmse": np.sqrt(means["squared"])}
+    if covered is not None:
+        draws["coverage"] = means["covered"]
 
     tail = (1.0 - level) / 2
-    return (float(np.quantile(draws, tail)), float(np.quantile(draws, 1 - tail)))
+    return {
+        name: (float(np.quantile(values, tail)), float(np.quantile(values, 1 - tail)))
+        for name, values in draws.items()
+    }
+
+
+def _statistics(covered: np.ndarray | None) -> tuple[str, ...]:
+    return ("mae", "rmse") if covered is None else ("mae", "rmse", "coverage")
@@ -0,0 +1,46 @@
+"""Player-clustered resampling, as count matrices.
+
+A bootstrap resample of players changes nothing about any player's rows, only
+how many times each player is counted. So rather than materialise resampled
+rows, every bootstrap here draws a matrix of per-player counts and combines
+it with per-player quantities taken once: sums of errors for an interval on
+accuracy, blocks of ``X'X`` and ``X'y`` for an interval on coefficients.
+
+The counts are built from the same generator calls, in the same order, as
+drawing one resample of player indices at a time with
+``rng.choice(n_people, n_people)`` — so a seed means the same resamples it
+meant before any of this was vectorised.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+
+import numpy as np
+
+#: Resamples drawn per block. Bounds the count matrix to a few megabytes
+#: however many draws are asked for; the draws themselves do not depend on it.
+BOOTSTRAP_BLOCK = 1_000
+
+
+def person_codes(person_ids: Sequence[str]) -> tuple[np.ndarray, int]:
+    """An integer per row, numbering players in the order they first appear."""
+    people, first, inverse = np.unique(
+        np.asarray(person_ids, dtype=object), return_index=True, return_inverse=True
+    )
+    rank = np.empty(people.size, dtype=np.int64)
+    rank[np.argsort(first)] = np.arange(people.size)
+    return rank[inverse.ravel()], int(people.size)
+
+
+def resample_counts(
+    n_people: int, n_boot: int, *, seed: int, block: int = BOOTSTRAP_BLOCK
+) -> Iterator[np.ndarray]:
+    """Blocks of a ``(n_boot, n_people)`` matrix of how often each player is drawn."""
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_boot, block):
+        size = min(block, n_boot - start)
+        sampled = rng.integers(0, n_people, size=(size, n_people))
+        offsets = np.arange(size)[:, None] * n_people
+        counts = np.bincount((sampled + offsets).ravel(), minlength=size * n_people)
+        yield counts.reshape(size, n_people)
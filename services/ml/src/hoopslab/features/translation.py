@@ -19,16 +19,23 @@ and the league effect would be inseparable from ordinary year-to-year change.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 
 import polars as pl
 
 log = logging.getLogger(__name__)
 
-#: Metrics the model estimates a translation coefficient for. These are
-#: primitives, never composites: each can be checked against what the player
-#: actually did. The previous version served an "nba_equivalent_rating" that
-#: was unfalsifiable by construction.
-TARGET_METRICS = ("usg_pct", "ts_pct")
+#: Metrics the model estimates a translation coefficient for: every rate gold
+#: standardises within league-season. These are primitives, never composites:
+#: each can be checked against what the player actually did. The previous
+#: version served an "nba_equivalent_rating" that was unfalsifiable by
+#: construction.
+TARGET_METRICS = ("usg_pct", "ts_pct", "ast_pct", "tov_rate", "pts_per_75")
+
+#: The metrics a scouting report is written around. Evidence bundles carry
+#: these and no others, so a report reads the same however many metrics the
+#: model is fitted for.
+HEADLINE_METRICS = ("usg_pct", "ts_pct")
 
 #: Minimum minutes for a season to enter the stage-1 persistence fit.
 MIN_PERSISTENCE_MINUTES = 500
@@ -45,10 +52,26 @@ def build_persistence_frame(
     Pairs are strictly within one league. A player's move year is excluded here
     by construction, because that is the effect stage 2 exists to measure.
     """
+    return persistence_view(
+        build_persistence_panel(player_seasons, (metric,), min_minutes=min_minutes), metric
+    )
+
+
+def build_persistence_panel(
+    player_seasons: pl.DataFrame,
+    metrics: Sequence[str],
+    *,
+    min_minutes: int = MIN_PERSISTENCE_MINUTES,
+) -> pl.DataFrame:
+    """Consecutive same-league season pairs, carrying every metric side by side.
+
+    One join serves all ``metrics``: ``z_from_<metric>`` and ``z_to_<metric>``
+    per metric, null where that season has no value. :func:`persistence_view`
+    takes one metric's rows back out.
+    """
     eligible = player_seasons.filter(
         pl.col("person_id").is_not_null()
         & (pl.col("minutes") >= min_minutes)
-        & pl.col(f"z_{metric}").is_not_null()
         & pl.col("age").is_not_null()
     ).select(
         "person_id",
@@ -56,26 +79,40 @@ def build_persistence_frame(
         "season_order",
         "minutes",
         "age",
-        pl.col(f"z_{metric}").alias("z_from"),
+        *(pl.col(f"z_{metric}").alias(f"z_from_{metric}") for metric in metrics),
     )
 
     following = eligible.select(
         "person_id",
         "league",
         (pl.col("season_order") - 1).alias("season_order"),
-        pl.col("z_from").alias("z_to"),
+        *(pl.col(f"z_from_{metric}").alias(f"z_to_{metric}") for metric in metrics),
     )
 
     return (
         eligible.join(following, on=["person_id", "league", "season_order"], how="inner")
-        .with_columns(
-            pl.col("minutes").log().alias("log_minutes"),
-            pl.lit(metric).alias("metric"),
-        )
+        .with_columns(pl.col("minutes").log().alias("log_minutes"))
         .sort(["person_id", "season_order"])
     )
 
 
+def persistence_view(panel: pl.DataFrame, metric: str) -> pl.DataFrame:
+    """One metric's rows of a persistence panel, in the single-metric shape."""
+    return panel.filter(
+        pl.col(f"z_from_{metric}").is_not_null() & pl.col(f"z_to_{metric}").is_not_null()
+    ).select(
+        "person_id",
+        "league",
+        "season_order",
+        "minutes",
+        "age",
+        pl.col(f"z_from_{metric}").alias("z_from"),
+        pl.col(f"z_to_{metric}").alias("z_to"),
+        "log_minutes",
+        pl.lit(metric).alias("metric"),
+    )
+
+
 def build_transition_frame(
     pairs: pl.DataFrame, player_seasons: pl.DataFrame, metric: str
 ) -> pl.DataFrame:
@@ -86,36 +123,76 @@ def build_transition_frame(
     identity model is required for. Under the previous schema, where a player
     who changed league became two unrelated rows, this join had no key.
     """
+    return transition_view(build_transition_panel(pairs, player_seasons, (metric,)), metric)
+
+
+def build_transition_panel(
+    pairs: pl.DataFrame, player_seasons: pl.DataFrame, metrics: Sequence[str]
+) -> pl.DataFrame:
+    """Every observed league switch, with both sides of the move for every metric.
+
+    The pair columns come first and ``age_at_source`` is the first column
+    added, which is how :func:`transition_view` tells them apart.
+    """
     source_cols = player_seasons.select(
         "person_id",
         pl.col("season_id").alias("source_season_id"),
-        pl.col(f"z_{metric}").alias("z_source"),
-        pl.col(metric).alias("source_value"),
         pl.col("age").alias("age_at_source"),
+        *(pl.col(f"z_{metric}").alias(f"z_source_{metric}") for metric in metrics),
+        *(pl.col(metric).alias(f"source_value_{metric}") for metric in metrics),
     )
     target_cols = player_seasons.select(
         "person_id",
         pl.col("season_id").alias("target_season_id"),
-        pl.col(f"z_{metric}").alias("z_target"),
-        pl.col(metric).alias("target_value"),
+        *(pl.col(f"z_{metric}").alias(f"z_target_{metric}") for metric in metrics),
+        *(pl.col(metric).alias(f"target_value_{metric}") for metric in metrics),
     )
 
     return (
         pairs.join(source_cols, on=["person_id", "source_season_id"], how="inner")
         .join(target_cols, on=["person_id", "target_season_id"], how="inner")
-        .filter(
-            pl.col("z_source").is_not_null()
-            & pl.col("z_target").is_not_null()
-            & pl.col("age_at_source").is_not_null()
-        )
-        .with_columns(
-            pl.col("source_minutes").log().alias("log_source_minutes"),
-            pl.lit(metric).alias("metric"),
-        )
+        .filter(pl.col("age_at_source").is_not_null())
+        .with_columns(pl.col("source_minutes").log().alias("log_source_minutes"))
         .sort(["target_season_order", "person_id"])
     )
 
 
+def transition_view(panel: pl.DataFrame, metric: str) -> pl.DataFrame:
+    """One metric's rows of a transition panel, in the single-metric shape."""
+    pair_columns = panel.columns[: panel.columns.index("age_at_source")]
+    return panel.filter(
+        pl.col(f"z_source_{metric}").is_not_null() & pl.col(f"z_target_{metric}").is_not_null()
+    ).select(
+        *pair_columns,
+        pl.col(f"z_source_{metric}").alias("z_source"),
+        pl.col(f"source_value_{metric}").alias("source_value"),
+        "age_at_source",
+        pl.col(f"z_target_{metric}").alias("z_target"),
+        pl.col(f"target_value_{metric}").alias("target_value"),
+        "log_source_minutes",
+        pl.lit(metric).alias("metric"),
+    )
+
+
+def transition_frames(
+    pairs: pl.DataFrame, player_seasons: pl.DataFrame, metrics: Sequence[str] = TARGET_METRICS
+) -> dict[str, pl.DataFrame]:
+    """The fitted transition frame of each metric, from one pair of joins.
+
+    Each carries its target season's moments, and loses the rows whose target
+    season has no spread to map a standardised prediction back through.
+    """
+    panel = build_transition_panel(pairs, player_seasons, metrics)
+    return {
+        metric: attach_moments(
+            transition_view(panel, metric),
+            league_season_moments(player_seasons, metric),
+            "target_season_id",
+        ).filter(pl.col("target_sd").is_not_null() & (pl.col("target_sd") > 0))
+        for metric in metrics
+    }
+
+
 def league_season_moments(player_seasons: pl.DataFrame, metric: str) -> pl.DataFrame:
     """Mean and standard deviation per league-season, for mapping z back to rates.
 
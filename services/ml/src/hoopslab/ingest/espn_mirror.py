@@ -8,19 +8,28 @@ season* against an endpoint that rate-limits.
 This is also the only NBA source in the project that works from CI, because it
 is a static file on GitHub releases rather than `stats.nba.com`, which refuses
 datacenter IP ranges.
+
+Assets are streamed to disk and resumed rather than held in memory (see
+:mod:`hoopslab.io.download`), and parsed only once their size and digest have
+been checked. A refresh revalidates each asset with its stored ``ETag`` and
+``Last-Modified`` first, so seasons that have not changed cost no download.
+One pooled HTTP client is shared by every worker the ingest
+scheduler runs for this source, so player and team files for all seasons
+download side by side over at most ``max_connections`` connections.
 """
 
 from __future__ import annotations
 
-import io
 import logging
+from pathlib import Path
 from typing import Any
 
 import httpx
 import pandas as pd
 
 from hoopslab.ingest.retry import with_retries
-from hoopslab.io.bronze import BronzeCache
+from hoopslab.io.bronze import BronzeCache, FetchResult, Payload
+from hoopslab.io.download import DownloadIntegrityError, download
 from hoopslab.seasons import Season
 
 log = logging.getLogger(__name__)
@@ -41,14 +50,41 @@ DATASETS: dict[str, str] = {
 
 DOWNLOAD_TIMEOUT = 180
 
+#: Concurrent downloads. Matches the ingest scheduler's worker count for this
+#: source; more connections than workers would sit idle.
+MAX_CONNECTIONS = 4
+
+#: Parquet files open and close with these four bytes. A file missing either
+#: was truncated or is an HTML error page served with a 200.
+PARQUET_MAGIC = b"PAR1"
+
 
 class ESPNMirrorClient:
     """Bulk season files. No rate limiter: these are static release assets."""
 
-    def __init__(self, cache: BronzeCache) -> None:
+    def __init__(
+        self,
+        cache: BronzeCache,
+        *,
+        client: httpx.Client | None = None,
+        max_connections: int = MAX_CONNECTIONS,
+    ) -> None:
         self.cache = cache
+        self.client = client or httpx.Client(
+            follow_redirects=True,
+            timeout=DOWNLOAD_TIMEOUT,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+
+    @property
+    def downloads(self) -> Path:
+        """Where assets land while downloading. Partial files here are resumed."""
+        return self.cache.root / SOURCE / "_downloads"
+
+    def close(self) -> None:
+        self.client.close()
 
-    def season_file(self, dataset: str, season: Season, *, refresh: bool = False) -> pd.DataFrame:
+    def season_file(self, dataset: str, season: Season, *, refresh: bool = False) -> FetchResult:
         """Fetch one dataset for one season.
 
         ESPN keys seasons by the year they *end*, so the 2023-24 NBA season is
@@ -63,16 +99,34 @@ class ESPNMirrorClient:
         url = f"{RELEASE_BASE}/{DATASETS[dataset]}/{dataset}_{espn_year}.parquet"
         params = {"dataset": dataset, "espn_season": espn_year}
 
-        def call() -> pd.DataFrame:
-            response = httpx.get(url, follow_redirects=True, timeout=DOWNLOAD_TIMEOUT)
-            response.raise_for_status()
-            return pd.read_parquet(io.BytesIO(response.content))
+        dest = self.downloads / f"{dataset}_{espn_year}.parquet"
+        previous = self.cache.validators(SOURCE, dataset, params) if refresh else None
+
+        def call() -> Payload:
+            fetched = download(
+                url,
+                dest,
+                client=self.client,
+                etag=previous.etag if previous else None,
+                last_modified=previous.last_modified if previous else None,
+            )
+            if fetched.not_modified:
+                return Payload(frame=None)
+            try:
+                _check_parquet(dest)
+                frame = pd.read_parquet(dest)
+            finally:
+                # The cache writes its own copy; this one has served its purpose,
+                # and a bad one must not be mistaken for a partial to resume.
+                dest.unlink(missing_ok=True)
+            log.debug("downloaded %s (%d bytes, sha256 %s)", url, fetched.n_bytes, fetched.sha256)
+            return Payload(frame=frame, etag=fetched.etag, last_modified=fetched.last_modified)
 
         return self._fetch(dataset, params, call, refresh=refresh)
 
     def _fetch(
         self, endpoint: str, params: dict[str, Any], call: Any, *, refresh: bool
-    ) -> pd.DataFrame:
+    ) -> FetchResult:
         guarded = with_retries()(call)
         result = self.cache.fetch(
             source=SOURCE,
@@ -82,5 +136,15 @@ class ESPNMirrorClient:
             refresh=refresh,
         )
         if not result.from_cache:
-            log.info("fetched ESPN %s %s (%d rows)", endpoint, params, len(result.frame))
-        return result.frame
+            log.info("ESPN %s %s %s (%d rows)", endpoint, params, result.status, len(result.frame))
+        return result
+
+
+def _check_parquet(path: Path) -> None:
+    size = path.stat().st_size
+    with path.open("rb") as handle:
+        head = handle.read(4)
+        handle.seek(max(0, size - 4))
+        tail = handle.read(4)
+    if head != PARQUET_MAGIC or tail != PARQUET_MAGIC:
+        raise DownloadIntegrityError(f"{path.name} is not a complete parquet file")
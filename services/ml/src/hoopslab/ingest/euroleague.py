@@ -23,7 +23,7 @@ from typing import Any
 import pandas as pd
 
 from hoopslab.ingest.retry import with_retries
-from hoopslab.io.bronze import BronzeCache
+from hoopslab.io.bronze import BronzeCache, FetchResult
 from hoopslab.io.rate_limit import RateLimiter
 from hoopslab.seasons import Season
 
@@ -37,7 +37,7 @@ class EuroLeagueClient:
         self.cache = cache
         self.limiter = limiter
 
-    def player_season_stats(self, season: Season, *, refresh: bool = False) -> pd.DataFrame:
+    def player_season_stats(self, season: Season, *, refresh: bool = False) -> FetchResult:
         """Accumulated traditional statistics for every player in a season.
 
         One request. Returns roughly 300 players per season with counting
@@ -64,7 +64,7 @@ class EuroLeagueClient:
 
         return self._fetch("player_season_stats", params, call, refresh=refresh)
 
-    def team_season_stats(self, season: Season, *, refresh: bool = False) -> pd.DataFrame:
+    def team_season_stats(self, season: Season, *, refresh: bool = False) -> FetchResult:
         params = {"season": season.euroleague_season, "statistic_mode": "Accumulated"}
 
         def call() -> pd.DataFrame:
@@ -85,8 +85,8 @@ class EuroLeagueClient:
 
     def _fetch(
         self, endpoint: str, params: dict[str, Any], call: Any, *, refresh: bool
-    ) -> pd.DataFrame:
-        guarded = with_retries()(call)
+    ) -> FetchResult:
+        guarded = with_retries(limiter=self.limiter)(call)
         result = self.cache.fetch(
             source=SOURCE,
             endpoint=endpoint,
@@ -95,5 +95,7 @@ class EuroLeagueClient:
             refresh=refresh,
         )
         if not result.from_cache:
-            log.info("fetched EuroLeague %s %s (%d rows)", endpoint, params, len(result.frame))
-        return result.frame
+            log.info(
+                "EuroLeague %s %s %s (%d rows)", endpoint, params, result.status, len(result.frame)
+            )
+        return result
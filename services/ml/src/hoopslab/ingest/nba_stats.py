@@ -18,7 +18,7 @@ from typing import Any, Literal
 import pandas as pd
 
 from hoopslab.ingest.retry import with_retries
-from hoopslab.io.bronze import BronzeCache
+from hoopslab.io.bronze import BronzeCache, FetchResult
 from hoopslab.io.rate_limit import RateLimiter
 from hoopslab.seasons import Season
 
@@ -47,7 +47,7 @@ class NBAStatsClient:
 
     def player_season_stats(
         self, season: Season, measure_type: MeasureType, *, refresh: bool = False
-    ) -> pd.DataFrame:
+    ) -> FetchResult:
         """Per-player totals or advanced rates for one league-season."""
         league_id = LEAGUE_IDS[season.league]
         params = {
@@ -75,7 +75,7 @@ class NBAStatsClient:
 
     def team_season_stats(
         self, season: Season, measure_type: MeasureType, *, refresh: bool = False
-    ) -> pd.DataFrame:
+    ) -> FetchResult:
         league_id = LEAGUE_IDS[season.league]
         params = {
             "season": season.nba_stats_season,
@@ -100,7 +100,7 @@ class NBAStatsClient:
 
         return self._fetch("team_season_stats", params, call, refresh=refresh)
 
-    def player_registry(self, season: Season, *, refresh: bool = False) -> pd.DataFrame:
+    def player_registry(self, season: Season, *, refresh: bool = False) -> FetchResult:
         """Every player known to the league as of a season.
 
         Carries ``PERSON_ID``, display name, and the first and last season each
@@ -125,7 +125,7 @@ class NBAStatsClient:
 
         return self._fetch("player_registry", params, call, refresh=refresh)
 
-    def player_bio_stats(self, season: Season, *, refresh: bool = False) -> pd.DataFrame:
+    def player_bio_stats(self, season: Season, *, refresh: bool = False) -> FetchResult:
         """Age, height, weight, country and draft position for a whole season.
 
         One request per season rather than one per player. The obvious route to
@@ -175,8 +175,8 @@ class NBAStatsClient:
         call: Any,
         *,
         refresh: bool,
-    ) -> pd.DataFrame:
-        guarded = with_retries()(call)
+    ) -> FetchResult:
+        guarded = with_retries(limiter=self.limiter)(call)
         result = self.cache.fetch(
             source=SOURCE,
             endpoint=endpoint,
@@ -185,8 +185,8 @@ class NBAStatsClient:
             refresh=refresh,
         )
         if not result.from_cache:
-            log.info("fetched %s %s (%d rows)", endpoint, params, len(result.frame))
-        return result.frame
+            log.info("%s %s %s (%d rows)", endpoint, params, result.status, len(result.frame))
+        return result
 
 
 def _first_frame(endpoint: Any) -> pd.DataFrame:
@@ -5,27 +5,51 @@ The rule that matters: **retry transport failures and 429/5xx, never other
 in a bare ``@retry``, so a 404 for a season that does not exist was retried
 four times with exponential backoff before failing anyway — turning a fast,
 clear "no such season" into a slow, confusing one.
+
+Given a limiter, every attempt's outcome is reported back to it: successes let
+an adaptive limiter speed up, and a 429 or a timeout slows it down and honours
+any ``Retry-After`` the host sent. Backing off one call without telling the
+pacing is how the next call walks straight into the same wall.
 """
 
 from __future__ import annotations
 
+import functools
 import logging
+import time
+from collections.abc import Callable
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 from tenacity import (
+    RetryCallState,
     retry,
     retry_if_exception,
     stop_after_attempt,
     wait_exponential_jitter,
 )
 
+from hoopslab.io.download import DownloadIntegrityError
+from hoopslab.io.rate_limit import RateLimiter
+
 log = logging.getLogger(__name__)
 
 RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
 
+#: Statuses that mean "you are asking too fast", as opposed to "I am broken".
+THROTTLE_STATUS = frozenset({408, 429})
+
+#: Upper bound on an honoured ``Retry-After``. A misconfigured proxy asking for
+#: a day should fail the fetch, not hang the run.
+MAX_RETRY_AFTER_SECONDS = 300.0
+
 
 def is_retryable(exc: BaseException) -> bool:
     """True for transport errors and the status codes worth trying again."""
+    if isinstance(exc, DownloadIntegrityError):
+        # A short or corrupt download; the next attempt resumes or restarts.
+        return True
+
     status = _status_of(exc)
     if status is not None:
         return status in RETRYABLE_STATUS
@@ -47,12 +71,75 @@ def _status_of(exc: BaseException) -> int | None:
     return int(status) if isinstance(status, int) else None
 
 
-def with_retries(attempts: int = 4) -> Any:
-    """Decorator applying the shared policy."""
+def is_throttle(exc: BaseException) -> bool:
+    """True for a 429, a 408, or a transport timeout."""
+    status = _status_of(exc)
+    if status is not None:
+        return status in THROTTLE_STATUS
+    return "Timeout" in type(exc).__name__
+
+
+def retry_after_of(exc: BaseException) -> float | None:
+    """Seconds asked for by a ``Retry-After`` header, in either of its forms."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is None:
+        return None
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(str(value))
+        except (TypeError, ValueError):
+            return None
+        seconds = when.timestamp() - time.time()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+class _WaitRetryAfter:
+    """Exponential jitter, but never shorter than what the host asked for."""
+
+    def __init__(self) -> None:
+        self.fallback = wait_exponential_jitter(initial=2, max=45)
+
+    def __call__(self, state: RetryCallState) -> float:
+        backoff = self.fallback(state)
+        exc = state.outcome.exception() if state.outcome else None
+        asked = retry_after_of(exc) if exc is not None else None
+        return max(backoff, asked or 0.0)
+
+
+def with_retries(attempts: int = 4, *, limiter: RateLimiter | None = None) -> Any:
+    """Decorator applying the shared policy, reporting outcomes to ``limiter``."""
+    policy = _policy(attempts)
+    if limiter is None:
+        return policy
+
+    def decorate(fn: Callable[..., Any]) -> Any:
+        @functools.wraps(fn)
+        def observed(*args: Any, **kwargs: Any) -> Any:
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as exc:
+                if is_throttle(exc):
+                    limiter.throttled(retry_after_of(exc))
+                raise
+            limiter.succeeded()
+            return result
+
+        return policy(observed)
+
+    return decorate
+
+
+def _policy(attempts: int) -> Any:
     return retry(
         retry=retry_if_exception(is_retryable),
         stop=stop_after_attempt(attempts),
-        wait=wait_exponential_jitter(initial=2, max=45),
+        wait=_WaitRetryAfter(),
         reraise=True,
         before_sleep=lambda state: log.warning(
             "retrying %s (attempt %d) after %s",
@@ -17,6 +17,13 @@ Cost, at the configured 0.67 requests per second:
 Roughly 180 requests against rate-limited hosts: about five minutes, not the
 hour the per-player bio route would have cost.
 
+The three sources run side by side, each on its own worker pool with its own
+limiter (see :mod:`hoopslab.ingest.scheduler`), so a full refresh takes about
+as long as its slowest source rather than all three added together.
+
+The rate-limited sources pace themselves adaptively, starting from whatever
+rate the previous run ended on (see :mod:`hoopslab.io.rate_limit`).
+
 Everything is cached content-addressed, so re-running is free and an
 interrupted run resumes where it stopped.
 """
@@ -24,32 +31,54 @@ interrupted run resumes where it stopped.
 from __future__ import annotations
 
 import logging
+import threading
 from dataclasses import dataclass, field
+from functools import partial
 
 from hoopslab.config import Settings
+from hoopslab.ingest import euroleague, nba_stats
 from hoopslab.ingest.espn_mirror import DATASETS, ESPNMirrorClient
 from hoopslab.ingest.euroleague import EuroLeagueClient
-from hoopslab.ingest.nba_stats import NBAStatsClient
-from hoopslab.io.bronze import BronzeCache
-from hoopslab.io.rate_limit import RateLimiter
+from hoopslab.ingest.nba_stats import MeasureType, NBAStatsClient
+from hoopslab.ingest.scheduler import FetchTask, SourcePlan, SourceStats, run_concurrently
+from hoopslab.io.bronze import BronzeCache, FetchResult
+from hoopslab.io.rate_limit import RATES_NAME, AdaptiveRateLimiter, LearnedRates, RateLimiter
 from hoopslab.paths import DataPaths
 from hoopslab.seasons import seasons_for
 
 log = logging.getLogger(__name__)
 
+MEASURES: tuple[MeasureType, ...] = ("Base", "Advanced")
+
+#: Workers per source. One for each rate-limited host: a second worker would
+#: only overlap latency under the same limiter, and that host's patience is not
+#: worth testing. The ESPN release assets are static files with no limit, so
+#: they are fetched a few at a time.
+WORKERS = {"nba": 1, "euroleague": 1, "espn": 4}
+
 
 @dataclass
 class IngestReport:
-    """What a run actually did. Printed, and useful when a source misbehaves."""
+    """What a run actually did. Printed, and useful when a source misbehaves.
+
+    Written to from every source's workers at once, so each append is locked.
+    """
 
     fetched: list[str] = field(default_factory=list)
+    #: Refetched on ``--refresh`` and found identical, so not rewritten.
+    unchanged: list[str] = field(default_factory=list)
     failed: list[tuple[str, str]] = field(default_factory=list)
+    sources: list[SourceStats] = field(default_factory=list)
+    rates: dict[str, float] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
-    def ok(self, what: str) -> None:
-        self.fetched.append(what)
+    def ok(self, what: str, *, unchanged: bool = False) -> None:
+        with self._lock:
+            (self.unchanged if unchanged else self.fetched).append(what)
 
     def error(self, what: str, why: str) -> None:
-        self.failed.append((what, why))
+        with self._lock:
+            self.failed.append((what, why))
         log.error("ingest failed for %s: %s", what, why)
 
     @property
@@ -66,26 +95,69 @@ def run_ingest(
     include_nba: bool = True,
     include_euroleague: bool = True,
 ) -> IngestReport:
-    """Populate bronze from every configured source."""
+    """Populate bronze from every configured source, all sources concurrently."""
     cache = BronzeCache(paths.bronze)
-    limiter = RateLimiter(settings.nba_stats_rate_limit_rps)
+    learned = LearnedRates(paths.bronze / RATES_NAME)
     report = IngestReport()
+    plans: list[SourcePlan] = []
+    limiters: dict[str, RateLimiter] = {}
 
     if include_nba:
-        _ingest_nba(NBAStatsClient(cache, limiter), report, refresh=refresh)
+        limiter = limiters[nba_stats.SOURCE] = _limiter(nba_stats.SOURCE, settings, learned)
+        plans.append(
+            SourcePlan(
+                "nba",
+                _nba_tasks(NBAStatsClient(cache, limiter), refresh=refresh),
+                workers=WORKERS["nba"],
+            )
+        )
 
     if include_euroleague:
         # A separate limiter: the EuroLeague live API is a different host with
         # its own budget, and it returned 429 during probing.
-        el_limiter = RateLimiter(settings.nba_stats_rate_limit_rps)
-        _ingest_euroleague(EuroLeagueClient(cache, el_limiter), report, refresh=refresh)
+        el_limiter = limiters[euroleague.SOURCE] = _limiter(euroleague.SOURCE, settings, learned)
+        plans.append(
+            SourcePlan(
+                "euroleague",
+                _euroleague_tasks(EuroLeagueClient(cache, el_limiter), refresh=refresh),
+                workers=WORKERS["euroleague"],
+            )
+        )
 
+    espn: ESPNMirrorClient | None = None
     if include_espn:
-        _ingest_espn(ESPNMirrorClient(cache), report, refresh=refresh)
+        espn = ESPNMirrorClient(cache, max_connections=WORKERS["espn"])
+        plans.append(
+            SourcePlan("espn", _espn_tasks(espn, refresh=refresh), workers=WORKERS["espn"])
+        )
 
+    try:
+        report.sources = run_concurrently(plans, lambda task: _guard(report, task.what, task.call))
+    finally:
+        if espn is not None:
+            espn.close()
+
+    for source, limiter in limiters.items():
+        report.rates[source] = limiter.requests_per_second
+        if isinstance(limiter, AdaptiveRateLimiter):
+            learned.put(source, limiter)
     return report
 
 
+def _limiter(source: str, settings: Settings, learned: LearnedRates) -> RateLimiter:
+    """The source's limiter, resuming from the rate its last run learned."""
+    if not settings.adaptive_rate_limit:
+        return RateLimiter(settings.nba_stats_rate_limit_rps)
+
+    start = learned.get(source) or settings.nba_stats_rate_limit_rps
+    log.info("%s starting at %.2f req/s", source, start)
+    return AdaptiveRateLimiter(
+        start,
+        min_rps=min(0.1, settings.nba_stats_rate_limit_rps),
+        max_rps=max(settings.rate_limit_max_rps, settings.nba_stats_rate_limit_rps),
+    )
+
+
 def _guard(report: IngestReport, what: str, call) -> None:  # type: ignore[no-untyped-def]
     """Run one fetch, recording success or failure without ending the run.
 
@@ -94,86 +166,107 @@ def _guard(report: IngestReport, what: str, call) -> None:  # type: ignore[no-un
     caller exits non-zero.
     """
     try:
-        call()
-        report.ok(what)
+        result = call()
+        report.ok(what, unchanged=isinstance(result, FetchResult) and result.unchanged)
     except Exception as exc:
         report.error(what, f"{type(exc).__name__}: {exc}")
 
 
-def _ingest_nba(client: NBAStatsClient, report: IngestReport, *, refresh: bool) -> None:
+def _nba_tasks(client: NBAStatsClient, *, refresh: bool) -> list[FetchTask]:
     nba_seasons = seasons_for("NBA")
     latest = nba_seasons[-1]
 
-    _guard(
-        report,
-        "nba/player_registry",
-        lambda: client.player_registry(latest, refresh=refresh),
-    )
+    tasks = [
+        FetchTask(
+            "nba/player_registry",
+            partial(client.player_registry, latest, refresh=refresh),
+        )
+    ]
 
     for season in nba_seasons:
-        for measure in ("Base", "Advanced"):
-            _guard(
-                report,
-                f"nba/player_season_stats/{season.season_id}/{measure}",
-                lambda s=season, m=measure: client.player_season_stats(s, m, refresh=refresh),
+        for measure in MEASURES:
+            tasks.append(
+                FetchTask(
+                    f"nba/player_season_stats/{season.season_id}/{measure}",
+                    partial(client.player_season_stats, season, measure, refresh=refresh),
+                )
+            )
+            tasks.append(
+                FetchTask(
+                    f"nba/team_season_stats/{season.season_id}/{measure}",
+                    partial(client.team_season_stats, season, measure, refresh=refresh),
+                )
             )
-            _guard(
-                report,
-                f"nba/team_season_stats/{season.season_id}/{measure}",
-                lambda s=season, m=measure: client.team_season_stats(s, m, refresh=refresh),
+        tasks.append(
+            FetchTask(
+                f"nba/player_bio_stats/{season.season_id}",
+                partial(client.player_bio_stats, season, refresh=refresh),
             )
-        _guard(
-            report,
-            f"nba/player_bio_stats/{season.season_id}",
-            lambda s=season: client.player_bio_stats(s, refresh=refresh),
         )
 
     for season in seasons_for("GL"):
-        for measure in ("Base", "Advanced"):
-            _guard(
-                report,
-                f"gl/player_season_stats/{season.season_id}/{measure}",
-                lambda s=season, m=measure: client.player_season_stats(s, m, refresh=refresh),
+        for measure in MEASURES:
+            tasks.append(
+                FetchTask(
+                    f"gl/player_season_stats/{season.season_id}/{measure}",
+                    partial(client.player_season_stats, season, measure, refresh=refresh),
+                )
             )
         # The G League reports age through the same bio endpoint as the NBA.
         # Without this a G League player who never reached the NBA has no age
         # anywhere, and every model that takes age as a covariate drops him.
-        _guard(
-            report,
-            f"gl/player_bio_stats/{season.season_id}",
-            lambda s=season: client.player_bio_stats(s, refresh=refresh),
+        tasks.append(
+            FetchTask(
+                f"gl/player_bio_stats/{season.season_id}",
+                partial(client.player_bio_stats, season, refresh=refresh),
+            )
         )
 
+    return tasks
+
 
-def _ingest_euroleague(client: EuroLeagueClient, report: IngestReport, *, refresh: bool) -> None:
+def _euroleague_tasks(client: EuroLeagueClient, *, refresh: bool) -> list[FetchTask]:
+    tasks: list[FetchTask] = []
     for season in seasons_for("EL"):
-        _guard(
-            report,
-            f"el/player_season_stats/{season.season_id}",
-            lambda s=season: client.player_season_stats(s, refresh=refresh),
+        tasks.append(
+            FetchTask(
+                f"el/player_season_stats/{season.season_id}",
+                partial(client.player_season_stats, season, refresh=refresh),
+            )
         )
-        _guard(
-            report,
-            f"el/team_season_stats/{season.season_id}",
-            lambda s=season: client.team_season_stats(s, refresh=refresh),
+        tasks.append(
+            FetchTask(
+                f"el/team_season_stats/{season.season_id}",
+                partial(client.team_season_stats, season, refresh=refresh),
+            )
         )
+    return tasks
 
 
-def _ingest_espn(client: ESPNMirrorClient, report: IngestReport, *, refresh: bool) -> None:
-    for season in seasons_for("NBA", game_grain=True):
-        for dataset in DATASETS:
-            _guard(
-                report,
-                f"espn/{dataset}/{season.season_id}",
-                lambda d=dataset, s=season: client.season_file(d, s, refresh=refresh),
-            )
+def _espn_tasks(client: ESPNMirrorClient, *, refresh: bool) -> list[FetchTask]:
+    return [
+        FetchTask(
+            f"espn/{dataset}/{season.season_id}",
+            partial(client.season_file, dataset, season, refresh=refresh),
+        )
+        for season in seasons_for("NBA", game_grain=True)
+        for dataset in DATASETS
+    ]
 
 
 def summarise(report: IngestReport) -> str:
     lines = [f"fetched {len(report.fetched)} payloads"]
+    if report.unchanged:
+        lines.append(f"unchanged {len(report.unchanged)} (revalidated, not rewritten)")
     if report.failed:
         lines.append(f"FAILED {len(report.failed)}:")
         lines.extend(f"  {what}: {why}" for what, why in report.failed[:20])
         if len(report.failed) > 20:
             lines.append(f"  ... and {len(report.failed) - 20} more")
+    if report.sources:
+        lines.append("per source:")
+        lines.extend(stats.render() for stats in report.sources)
+    if report.rates:
+        lines.append("ending rates:")
+        lines.extend(f"  {source:<12} {rps:.2f} req/s" for source, rps in report.rates.items())
     return "\n".join(lines)
@@ -11,22 +11,37 @@ in use hands back a parsed table, and keeping the parsed form is materially
 more useful than keeping bytes we would only ever re-parse the same way. The
 manifest records the row count and content hash so the fidelity of that choice
 stays checkable.
+
+A refresh moves only what changed. Each manifest entry keeps the validators the
+source sent (``ETag``, ``Last-Modified``) beside the content digest. A fetcher
+whose transport can send a conditional request gets them back through
+:meth:`BronzeCache.validators` and may answer "not modified" without a body;
+for one that cannot, the fresh frame's digest is compared with the recorded one
+and an identical payload is not rewritten. Either way the entry is recorded as
+``unchanged``, so a refresh says exactly which payloads moved.
+
+Lookups by payload go through an SQLite index derived from the manifest (see
+:mod:`hoopslab.io.manifest`) rather than a scan of the whole log.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import pandas as pd
+import polars as pl
 import pyarrow as pa
 
+from hoopslab.io.manifest import ManifestIndex
+
 MANIFEST_NAME = "manifest.jsonl"
 
 
@@ -51,11 +66,42 @@ def frame_digest(frame: pd.DataFrame) -> str:
     return hashlib.sha256(hashed.tobytes()).hexdigest()[:16]
 
 
+#: Outcomes of :meth:`BronzeCache.fetch`. ``cached`` involved no network at all;
+#: the other three each made a request.
+FetchStatus = Literal["cached", "new", "changed", "unchanged"]
+
+
+@dataclass(frozen=True)
+class Validators:
+    """What the previous fetch of a payload looked like, for a conditional request."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    digest: str | None = None
+
+
+@dataclass(frozen=True)
+class Payload:
+    """A fetcher's answer when its transport reports validators.
+
+    ``frame`` is ``None`` when the source answered "not modified".
+    """
+
+    frame: pd.DataFrame | None
+    etag: str | None = None
+    last_modified: str | None = None
+
+
 @dataclass(frozen=True)
 class FetchResult:
     frame: pd.DataFrame
     from_cache: bool
     key: str
+    status: FetchStatus = "cached"
+
+    @property
+    def unchanged(self) -> bool:
+        return self.status == "unchanged"
 
 
 class BronzeCache:
@@ -64,6 +110,10 @@ class BronzeCache:
     def __init__(self, root: Path) -> None:
         self.root = root
         self.manifest_path = root / MANIFEST_NAME
+        # Ingest fetches from several sources at once through one cache, and
+        # interleaved appends would corrupt a manifest line.
+        self._manifest_lock = threading.Lock()
+        self.index = ManifestIndex(self.manifest_path)
 
     def path_for(self, source: str, endpoint: str, key: str) -> Path:
         return self.root / source / endpoint / f"{key}.parquet"
@@ -74,22 +124,46 @@ class BronzeCache:
         source: str,
         endpoint: str,
         params: dict[str, Any],
-        fetcher: Callable[[], pd.DataFrame],
+        fetcher: Callable[[], pd.DataFrame | Payload],
         refresh: bool = False,
     ) -> FetchResult:
-        """Return a cached payload, or call ``fetcher`` and cache the result."""
+        """Return a cached payload, or call ``fetcher`` and cache the result.
+
+        On a refresh the payload is rewritten only if it actually changed.
+        """
         key = cache_key(source, endpoint, params)
         path = self.path_for(source, endpoint, key)
 
         if path.is_file() and not refresh:
             return FetchResult(frame=pd.read_parquet(path), from_cache=True, key=key)
 
+        previous = self.latest(source, endpoint, key) if path.is_file() else None
+
         started = time.monotonic()
-        frame = fetcher()
+        answer = fetcher()
         elapsed_ms = int((time.monotonic() - started) * 1000)
 
-        path.parent.mkdir(parents=True, exist_ok=True)
-        _write_parquet(frame, path)
+        payload = answer if isinstance(answer, Payload) else Payload(frame=answer)
+        if payload.frame is None:
+            if previous is None:
+                raise RuntimeError(f"{source}/{endpoint}: 'not modified' with nothing cached")
+            frame = pd.read_parquet(path)
+            digest = previous["digest"]
+        else:
+            frame = payload.frame
+            digest = frame_digest(frame)
+
+        status: FetchStatus
+        if previous is None:
+            status = "new"
+        elif digest == previous.get("digest"):
+            status = "unchanged"
+        else:
+            status = "changed"
+
+        if status != "unchanged":
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write_parquet(frame, path)
 
         self._record(
             {
@@ -98,15 +172,42 @@ class BronzeCache:
                 "params": params,
                 "key": key,
                 "fetched_at": datetime.now(UTC).isoformat(),
+                "status": status,
                 "n_rows": len(frame),
                 "n_cols": int(frame.shape[1]),
-                "digest": frame_digest(frame),
+                "digest": digest,
+                # A 304 carries no validators of its own; the previous ones
+                # still describe the payload on disk.
+                "etag": payload.etag or (previous or {}).get("etag"),
+                "last_modified": payload.last_modified or (previous or {}).get("last_modified"),
                 "elapsed_ms": elapsed_ms,
                 "path": str(path.relative_to(self.root)).replace("\\", "/"),
             }
         )
 
-        return FetchResult(frame=frame, from_cache=False, key=key)
+        return FetchResult(frame=frame, from_cache=False, key=key, status=status)
+
+    def latest(self, source: str, endpoint: str, key: str) -> dict[str, Any] | None:
+        """The most recent manifest entry for one payload."""
+        return self.index.latest(source, endpoint, key)
+
+    def history(self, source: str, endpoint: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+        """Every manifest entry still indexed for one payload, oldest first."""
+        return self.index.history(source, endpoint, cache_key(source, endpoint, params))
+
+    def validators(self, source: str, endpoint: str, params: dict[str, Any]) -> Validators | None:
+        """Validators for a conditional request, or ``None`` if nothing is cached."""
+        key = cache_key(source, endpoint, params)
+        if not self.path_for(source, endpoint, key).is_file():
+            return None
+        entry = self.latest(source, endpoint, key)
+        if entry is None:
+            return None
+        return Validators(
+            etag=entry.get("etag"),
+            last_modified=entry.get("last_modified"),
+            digest=entry.get("digest"),
+        )
 
     def load(self, source: str, endpoint: str, params: dict[str, Any]) -> pd.DataFrame | None:
         """Read a cached payload without any possibility of fetching it.
@@ -119,12 +220,33 @@ class BronzeCache:
         path = self.path_for(source, endpoint, cache_key(source, endpoint, params))
         return pd.read_parquet(path) if path.is_file() else None
 
+    def load_polars(
+        self, source: str, endpoint: str, params: dict[str, Any]
+    ) -> pl.DataFrame | None:
+        """:meth:`load`, straight into polars.
+
+        Pandas is only ever needed at the ingest boundary, where the client
+        libraries hand it back. Reading through it here copied every payload
+        twice and turned each string column into Python objects on the way.
+        The file is memory-mapped rather than read into a buffer.
+        """
+        path = self.path_for(source, endpoint, cache_key(source, endpoint, params))
+        return pl.read_parquet(path, memory_map=True) if path.is_file() else None
+
+    def scan(self, source: str, endpoint: str, params: dict[str, Any]) -> pl.LazyFrame | None:
+        """A lazy read of one payload, so a caller's ``select`` prunes columns at the file."""
+        path = self.path_for(source, endpoint, cache_key(source, endpoint, params))
+        return pl.scan_parquet(path) if path.is_file() else None
+
     def _record(self, entry: dict[str, Any]) -> None:
-        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.manifest_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(entry, default=str) + "\n")
+        line = json.dumps(entry, default=str) + "\n"
+        with self._manifest_lock:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.manifest_path.open("a", encoding="utf-8") as handle:
+                handle.write(line)
 
     def manifest(self) -> list[dict[str, Any]]:
+        """The full audit log, every entry ever appended, in order."""
         if not self.manifest_path.is_file():
             return []
         with self.manifest_path.open(encoding="utf-8") as handle:
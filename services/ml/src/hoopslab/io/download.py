@@ -0,0 +1,231 @@
+"""Streaming, resumable file downloads.
+
+The ESPN bulk mirror serves each season as a single release asset, and the
+client used to hold the whole body in memory and parse it from there: peak
+memory was the file plus the frame built from it, and a connection dropped at
+ninety percent started again from byte zero.
+
+Here the body is written to a ``.part`` file in fixed-size chunks. A retry, or
+the next run, finds the partial file and asks only for the rest with an HTTP
+``Range`` request. The range is conditional: the validator of the response the
+partial bytes came from (a strong ETag, else ``Last-Modified``) is kept beside
+the ``.part`` file and sent as ``If-Range``, so a release asset replaced
+between attempts comes back whole rather than spliced onto the old version's
+first half. A partial file with no validator, or a server that answers the
+range with a full 200, gets a clean restart. Nothing is handed on until it has
+been checked: the size against what the server said it was sending, and the
+content against an MD5 when the server publishes one (GitHub's release storage
+does) or a SHA-256 when the caller knows it. Only a file that passes is renamed
+into place.
+
+Given the validators of a previous download, the request is conditional
+(``If-None-Match`` / ``If-Modified-Since``), and an unchanged asset costs one
+round trip and no body at all.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+log = logging.getLogger(__name__)
+
+#: Bytes per write. Large enough that per-chunk overhead is negligible, small
+#: enough that memory stays flat whatever the asset size.
+CHUNK_SIZE = 1 << 20
+
+#: Header carrying a base64 MD5 of the whole stored object, even on a range
+#: response. ``Content-MD5`` describes only the body sent, so it is trusted on a
+#: full response alone.
+BLOB_MD5_HEADER = "x-ms-blob-content-md5"
+
+
+class DownloadIntegrityError(RuntimeError):
+    """The bytes on disk are not the file the server described.
+
+    Retryable: a short file resumes where it stopped, a corrupt one is deleted
+    and fetched again from the start.
+    """
+
+
+@dataclass(frozen=True)
+class Download:
+    path: Path
+    n_bytes: int
+    sha256: str
+    resumed_from: int = 0
+    etag: str | None = None
+    last_modified: str | None = None
+    #: The server answered 304 to a conditional request; nothing was written.
+    not_modified: bool = False
+
+
+def part_path(dest: Path) -> Path:
+    return dest.with_name(dest.name + ".part")
+
+
+def validator_path(dest: Path) -> Path:
+    """Which version of the object the ``.part`` bytes belong to, as ``If-Range`` takes it."""
+    return dest.with_name(dest.name + ".part.validator")
+
+
+def download(
+    url: str,
+    dest: Path,
+    *,
+    client: httpx.Client,
+    expected_sha256: str | None = None,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Download:
+    """Stream ``url`` to ``dest``, resuming any partial download left behind.
+
+    ``etag`` and ``last_modified`` make the request conditional. They are not
+    sent while resuming: a partial file means the previous copy is already
+    being replaced.
+    """
+    part = part_path(dest)
+    part.parent.mkdir(parents=True, exist_ok=True)
+    validator_file = validator_path(dest)
+    offset = part.stat().st_size if part.is_file() else 0
+    validator = (
+        validator_file.read_text(encoding="utf-8").strip() if validator_file.is_file() else ""
+    )
+    if offset and not validator:
+        # Nothing records which version these bytes are from, so nothing
+        # can say that the rest of the object still matches them.
+        log.info("%s: partial download has no validator, restarting", url)
+        offset = 0
+
+    headers: dict[str, str] = {}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = validator
+    else:
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    with client.stream("GET", url, headers=headers) as response:
+        if response.status_code == 304:
+            return Download(
+                path=dest,
+                n_bytes=0,
+                sha256="",
+                etag=etag,
+                last_modified=last_modified,
+                not_modified=True,
+            )
+        if response.status_code == 416:
+            # The partial file is already as long as the object, or longer.
+            # Either way it cannot be trusted to be this object.
+            _discard(dest)
+            raise DownloadIntegrityError(f"{url}: stale partial download discarded")
+        response.raise_for_status()
+
+        if offset and response.status_code != 206:
+            log.info("%s: object changed or range ignored, restarting", url)
+            offset = 0
+        current = _validator(response)
+        if offset and current is not None and current != validator:
+            # A server that honours Range but not If-Range.
+            _discard(dest)
+            raise DownloadIntegrityError(f"{url}: object changed while resuming")
+        if not offset:
+            # Recorded before the first byte, so an interruption at any point
+            # leaves a partial file that knows what it is part of.
+            if current is None:
+                validator_file.unlink(missing_ok=True)
+            else:
+                validator_file.write_text(current, encoding="utf-8")
+        total = _total_size(response, offset)
+        expected_md5 = _md5_header(response)
+
+        with part.open("ab" if offset else "wb") as handle:
+            for chunk in response.iter_bytes(chunk_size):
+                handle.write(chunk)
+
+    n_bytes = part.stat().st_size
+    if total is not None and n_bytes != total:
+        if n_bytes > total:
+            _discard(dest)
+        raise DownloadIntegrityError(f"{url}: have {n_bytes} bytes, expected {total}")
+
+    sha256, md5 = _digests(part, chunk_size)
+    for label, expected, actual in (
+        ("md5", expected_md5, md5),
+        ("sha256", expected_sha256, sha256),
+    ):
+        if expected is not None and actual != expected:
+            _discard(dest)
+            raise DownloadIntegrityError(f"{url}: {label} {actual} does not match {expected}")
+
+    part.replace(dest)
+    validator_file.unlink(missing_ok=True)
+    if offset:
+        log.info("%s: resumed from byte %d of %d", url, offset, n_bytes)
+    return Download(
+        path=dest,
+        n_bytes=n_bytes,
+        sha256=sha256,
+        resumed_from=offset,
+        etag=response.headers.get("etag"),
+        last_modified=response.headers.get("last-modified"),
+    )
+
+
+def _discard(dest: Path) -> None:
+    part_path(dest).unlink(missing_ok=True)
+    validator_path(dest).unlink(missing_ok=True)
+
+
+def _validator(response: httpx.Response) -> str | None:
+    """What ``If-Range`` can carry for this response: a strong ETag, else ``Last-Modified``."""
+    etag = response.headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("last-modified")
+
+
+def _total_size(response: httpx.Response, offset: int) -> int | None:
+    """Full object size, from ``Content-Range`` on a 206 or ``Content-Length``."""
+    content_range = response.headers.get("content-range")
+    if response.status_code == 206 and content_range and "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        return int(total) if total.isdigit() else None
+
+    length = response.headers.get("content-length")
+    # A compressed transfer reports the compressed length; the file on disk is
+    # the decoded body, so the header says nothing about it.
+    if length is None or response.headers.get("content-encoding"):
+        return None
+    return offset + int(length) if response.status_code == 206 else int(length)
+
+
+def _md5_header(response: httpx.Response) -> str | None:
+    value = response.headers.get(BLOB_MD5_HEADER)
+    if value is None and response.status_code == 200:
+        value = response.headers.get("content-md5")
+    if not value:
+        return None
+    try:
+        return base64.b64decode(value, validate=True).hex()
+    except ValueError:
+        return None
+
+
+def _digests(path: Path, chunk_size: int) -> tuple[str, str]:
+    sha256 = hashlib.sha256()
+    md5 = hashlib.md5(usedforsecurity=False)
+    with path.open("rb") as handle:
+        while chunk := handle.read(chunk_size):
+            sha256.update(chunk)
+            md5.update(chunk)
+    return sha256.hexdigest(), md5.hexdigest()
@@ -0,0 +1,194 @@
+"""Indexed view of the bronze manifest.
+
+``manifest.jsonl`` is the audit log: every fetch appends a line and nothing is
+ever rewritten, which is exactly right for answering "what did we pull, and
+when" after the fact. It is exactly wrong for "what is the latest entry for this
+payload", which a conditional refresh asks once per request — every question
+re-read and re-parsed the whole file, and the file only grows.
+
+The index is an SQLite sidecar keyed on ``(source, endpoint, key)``. It is
+derived entirely from the JSONL: it remembers how many bytes of the log it has
+folded in, reads only what was appended since, and rebuilds itself from zero if
+it is deleted or the log is replaced. A replacement is recognised by content,
+not size: the index keeps a fingerprint of the log's first line and of the last
+line it folded in, and a log restored from a backup that is as long as the old
+one, or longer, no longer matches them. It is therefore as disposable as the rest
+of bronze. :meth:`ManifestIndex.compact` folds superseded entries out of the
+index, keeping the latest per payload; the log itself keeps everything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+INDEX_NAME = "manifest.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    seq        INTEGER PRIMARY KEY,
+    source     TEXT NOT NULL,
+    endpoint   TEXT NOT NULL,
+    key        TEXT NOT NULL,
+    fetched_at TEXT,
+    entry      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_by_payload ON entries (source, endpoint, key, seq);
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+
+class ManifestIndex:
+    """Point lookups and per-payload history over one ``manifest.jsonl``."""
+
+    def __init__(self, log_path: Path, index_path: Path | None = None) -> None:
+        self.log_path = log_path
+        self.path = index_path or log_path.with_name(INDEX_NAME)
+        self._lock = threading.Lock()
+
+    def latest(self, source: str, endpoint: str, key: str) -> dict[str, Any] | None:
+        with self._synced() as db:
+            row = db.execute(
+                "SELECT entry FROM entries WHERE source = ? AND endpoint = ? AND key = ?"
+                " ORDER BY seq DESC LIMIT 1",
+                (source, endpoint, key),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def history(self, source: str, endpoint: str, key: str) -> list[dict[str, Any]]:
+        """Every indexed entry for one payload, oldest first."""
+        with self._synced() as db:
+            rows = db.execute(
+                "SELECT entry FROM entries WHERE source = ? AND endpoint = ? AND key = ?"
+                " ORDER BY seq",
+                (source, endpoint, key),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def __len__(self) -> int:
+        with self._synced() as db:
+            return int(db.execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+    def compact(self) -> int:
+        """Drop every entry superseded by a later one for the same payload.
+
+        Returns how many were dropped. The JSONL is untouched, so nothing is
+        lost that an audit could want; only the index gets smaller.
+        """
+        with self._synced() as db:
+            dropped = db.execute(
+                "DELETE FROM entries WHERE seq NOT IN ("
+                " SELECT MAX(seq) FROM entries GROUP BY source, endpoint, key)"
+            ).rowcount
+            db.commit()
+            db.execute("VACUUM")
+        log.info("compacted the bronze manifest index: %d superseded entries dropped", dropped)
+        return int(dropped)
+
+    def sync(self) -> None:
+        """Fold in whatever the log gained since the last look."""
+        with self._synced():
+            pass
+
+    @contextmanager
+    def _synced(self) -> Iterator[sqlite3.Connection]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, closing(sqlite3.connect(self.path)) as db:
+            db.executescript(_SCHEMA)
+            self._catch_up(db)
+            yield db
+
+    def _catch_up(self, db: sqlite3.Connection) -> None:
+        meta = {name: int(value) for name, value in db.execute("SELECT name, value FROM meta")}
+        offset = meta.get("offset", 0)
+        size = self.log_path.stat().st_size if self.log_path.is_file() else 0
+        if offset and not self._continues(meta, size):
+            # The log was replaced or truncated; the index describes a file
+            # that no longer exists.
+            log.info("bronze manifest was replaced; rebuilding its index")
+            db.execute("DELETE FROM entries")
+            db.execute("DELETE FROM meta")
+            offset = 0
+            meta = {}
+        if size == offset:
+            return
+
+        rows, offset, tail_start = self._read_from(offset)
+        if rows or offset != meta.get("offset", 0):
+            meta = {**meta, "offset": offset}
+            if tail_start is not None:
+                meta["tail_start"] = tail_start
+                meta["tail"] = self._fingerprint_at(tail_start, offset)
+            meta["head"] = self._head()
+
+        db.executemany(
+            "INSERT INTO entries (source, endpoint, key, fetched_at, entry) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        db.executemany(
+            "INSERT INTO meta (name, value) VALUES (?, ?)"
+            " ON CONFLICT (name) DO UPDATE SET value = excluded.value",
+            meta.items(),
+        )
+        db.commit()
+
+    def _continues(self, meta: dict[str, int], size: int) -> bool:
+        """Whether the log still begins with the bytes the index was built from."""
+        offset = meta["offset"]
+        if size < offset or "head" not in meta or "tail" not in meta:
+            return False
+        return meta["head"] == self._head() and meta["tail"] == self._fingerprint_at(
+            meta["tail_start"], offset
+        )
+
+    def _head(self) -> int:
+        with self.log_path.open("rb") as handle:
+            return _fingerprint(handle.readline())
+
+    def _fingerprint_at(self, start: int, end: int) -> int:
+        with self.log_path.open("rb") as handle:
+            handle.seek(start)
+            return _fingerprint(handle.read(end - start))
+
+    def _read_from(
+        self, offset: int
+    ) -> tuple[list[tuple[str, str, str, str | None, str]], int, int | None]:
+        """Complete lines after ``offset``, the new offset, and where the last one began."""
+        rows = []
+        last_start = None
+        with self.log_path.open("rb") as handle:
+            handle.seek(offset)
+            for raw in handle:
+                if not raw.endswith(b"\n"):
+                    # A line still being written. Leave it for the next look.
+                    break
+                last_start = offset
+                offset += len(raw)
+                line = raw.decode("utf-8").strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                rows.append(
+                    (
+                        entry["source"],
+                        entry["endpoint"],
+                        entry["key"],
+                        entry.get("fetched_at"),
+                        line,
+                    )
+                )
+        return rows, offset, last_start
+
+
+def _fingerprint(data: bytes) -> int:
+    """A 64-bit digest of ``data``, small enough for the integer ``meta`` table."""
+    return int.from_bytes(hashlib.sha256(data).digest()[:8], "big", signed=True)
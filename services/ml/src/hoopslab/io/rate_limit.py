@@ -7,13 +7,31 @@ HTTP 429 during source probing after roughly 170 sequential requests.
 The previous version's NBA client slept *before* each request, which meant the
 first call paid the delay for nothing and consecutive calls were not actually
 spaced by elapsed work time. This spaces on the real clock instead.
+
+A fixed rate has to be set for the worst afternoon the host has ever had, and
+a full pull pays that price on every run. :class:`AdaptiveRateLimiter` starts
+from the rate the last run ended on, creeps upwards while responses keep
+succeeding and halves on a 429 or a timeout (additive increase, multiplicative
+decrease, the same rule TCP uses for the same problem). A ``Retry-After`` is
+obeyed as given, by every worker sharing the limiter. The learned rate is kept
+per source in :class:`LearnedRates` between runs.
 """
 
 from __future__ import annotations
 
+import json
+import logging
 import threading
 import time
 from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+#: File beside the bronze manifest holding each source's learned rate.
+RATES_NAME = "rate_limits.json"
 
 
 @dataclass
@@ -48,3 +66,105 @@ class RateLimiter:
         if wait > 0:
             time.sleep(wait)
         return wait
+
+    def succeeded(self) -> None:
+        """A request went through. A fixed limiter has nothing to learn from it."""
+
+    def throttled(self, retry_after: float | None = None) -> None:
+        """The host pushed back. Hold every caller off for ``retry_after`` seconds.
+
+        The pause is applied to the shared schedule rather than to the one
+        caller that saw the response, because the host's patience is per
+        client, not per thread.
+        """
+        if retry_after is None or retry_after <= 0:
+            return
+        with self._lock:
+            self._next_allowed_at = max(self._next_allowed_at, time.monotonic() + retry_after)
+
+
+@dataclass
+class AdaptiveRateLimiter(RateLimiter):
+    """A :class:`RateLimiter` whose rate follows the host's responses.
+
+    ``requests_per_second`` is the starting rate and, afterwards, the current
+    one. Each success adds ``increase_rps`` up to ``max_rps``; each throttle
+    multiplies by ``decrease_factor`` down to ``min_rps``. The increase is small
+    on purpose: it takes about a hundred clean responses to add one request per
+    second, while a single 429 gives back half.
+    """
+
+    min_rps: float = 0.1
+    max_rps: float = 2.0
+    increase_rps: float = 0.01
+    decrease_factor: float = 0.5
+    n_throttled: int = field(default=0, repr=False)
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        if not 0 < self.min_rps <= self.max_rps:
+            raise ValueError("need 0 < min_rps <= max_rps")
+        if not 0 < self.decrease_factor < 1:
+            raise ValueError("decrease_factor must be in (0, 1)")
+        self.requests_per_second = _clamp(self.requests_per_second, self.min_rps, self.max_rps)
+
+    def succeeded(self) -> None:
+        with self._lock:
+            self.requests_per_second = min(
+                self.max_rps, self.requests_per_second + self.increase_rps
+            )
+
+    def throttled(self, retry_after: float | None = None) -> None:
+        with self._lock:
+            before = self.requests_per_second
+            self.requests_per_second = max(self.min_rps, before * self.decrease_factor)
+            self.n_throttled += 1
+        log.warning(
+            "throttled: %.2f -> %.2f req/s%s",
+            before,
+            self.requests_per_second,
+            f", pausing {retry_after:.0f} s" if retry_after else "",
+        )
+        super().throttled(retry_after)
+
+
+class LearnedRates:
+    """Per-source rates carried from one ingest run to the next.
+
+    Readable JSON beside the bronze manifest, regenerable like the rest of
+    bronze: delete it and the next run starts from the configured rate.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def load(self) -> dict[str, dict[str, Any]]:
+        if not self.path.is_file():
+            return {}
+        try:
+            loaded = json.loads(self.path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            log.warning("ignoring unreadable %s", self.path)
+            return {}
+        return loaded if isinstance(loaded, dict) else {}
+
+    def get(self, source: str) -> float | None:
+        entry = self.load().get(source)
+        if not isinstance(entry, dict):
+            return None
+        rate = entry.get("requests_per_second")
+        return float(rate) if isinstance(rate, int | float) and rate > 0 else None
+
+    def put(self, source: str, limiter: RateLimiter) -> None:
+        rates = self.load()
+        rates[source] = {
+            "requests_per_second": round(limiter.requests_per_second, 4),
+            "n_throttled": getattr(limiter, "n_throttled", 0),
+            "updated_at": datetime.now(UTC).isoformat(),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(rates, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    return min(high, max(low, value))
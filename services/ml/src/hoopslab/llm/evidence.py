@@ -36,18 +36,18 @@ import numpy as np
 import polars as pl
 
 from hoopslab.features.translation import (
-    TARGET_METRICS,
+    HEADLINE_METRICS,
     attach_moments,
-    build_persistence_frame,
     build_transition_frame,
     league_season_moments,
 )
 from hoopslab.llm.schemas import EvidenceBundle, Fact, Unit
 from hoopslab.models import baselines
+from hoopslab.models.store import FittedModelStore, load_or_fit
 from hoopslab.models.train import latest_run
-from hoopslab.models.translation import fit_persistence, fit_translation
 from hoopslab.paths import DataPaths
 from hoopslab.seasons import Season
+from hoopslab.transform.keys import load_gold
 
 log = logging.getLogger(__name__)
 
@@ -88,22 +88,26 @@ class ScoredTransition:
 
 
 def score_transitions(
-    player_seasons: pl.DataFrame, pairs: pl.DataFrame, metric: str
+    player_seasons: pl.DataFrame,
+    pairs: pl.DataFrame,
+    metric: str,
+    *,
+    store: FittedModelStore | None = None,
 ) -> list[ScoredTransition]:
-    """Refit and score every observed transition for one metric.
+    """Score every observed transition for one metric.
 
     The same public functions the export and the backtest use, called in the
-    same order. Scoring is refit rather than read back from D1 so the bundle
-    never depends on a database being loaded — the report layer works on a
-    fresh clone with nothing but committed parquet.
+    same order, and the same fitted-model store the export reads. Scoring is
+    fitted locally rather than read back from D1 so the bundle never depends on
+    a database being loaded — the report layer works on a fresh clone with
+    nothing but committed parquet.
     """
     moments = league_season_moments(player_seasons, metric)
     transitions = attach_moments(
         build_transition_frame(pairs, player_seasons, metric), moments, "target_season_id"
     ).filter(pl.col("target_sd").is_not_null() & (pl.col("target_sd") > 0))
 
-    persistence = fit_persistence(build_persistence_frame(player_seasons, metric), metric)
-    model = fit_translation(transitions, persistence, metric)
+    model = load_or_fit(player_seasons, transitions, metric, store=store)
 
     predicted = model.predict_rate(transitions)
     pi80 = model.prediction_interval(transitions, level=0.80)
@@ -136,9 +140,9 @@ class BundleSource:
     scored: dict[str, dict[tuple[str, str], ScoredTransition]]
 
     @classmethod
-    def load(cls, paths: DataPaths) -> BundleSource:
-        player_seasons = pl.read_parquet(paths.gold / "player_seasons.parquet")
-        pairs = pl.read_parquet(paths.gold / "transition_pairs.parquet")
+    def load(cls, paths: DataPaths, *, store: FittedModelStore | None = None) -> BundleSource:
+        """Gold, the latest run and both headline fits; ``store`` defaults to ``paths.models``."""
+        player_seasons, pairs = load_gold(paths, "player_seasons", "transition_pairs")
 
         run = latest_run(paths)
         if run is None:
@@ -147,18 +151,20 @@ class BundleSource:
                 "a report quoting a model's error needs that error to have been measured."
             )
 
+        if store is None:
+            store = FittedModelStore.for_paths(paths, model_version=run["model_version"])
         scored: dict[str, dict[tuple[str, str], ScoredTransition]] = {}
-        for metric in TARGET_METRICS:
+        for metric in HEADLINE_METRICS:
             scored[metric] = {
                 (t.record["person_id"], t.record["target_season_id"]): t
-                for t in score_transitions(player_seasons, pairs, metric)
+                for t in score_transitions(player_seasons, pairs, metric, store=store)
             }
         return cls(player_seasons=player_seasons, pairs=pairs, run=run, scored=scored)
 
     def transitions(self) -> list[tuple[str, str]]:
         """Keys of every transition that both headline metrics could score."""
-        keys = set(self.scored[TARGET_METRICS[0]])
-        for metric in TARGET_METRICS[1:]:
+        keys = set(self.scored[HEADLINE_METRICS[0]])
+        for metric in HEADLINE_METRICS[1:]:
             keys &= set(self.scored[metric])
         return sorted(keys)
 
@@ -171,7 +177,7 @@ def build_bundle(
     anonymized: bool = True,
 ) -> EvidenceBundle:
     """Assemble the admissible fact set for one transition."""
-    headline = source.scored[TARGET_METRICS[0]].get((person_id, target_season_id))
+    headline = source.scored[HEADLINE_METRICS[0]].get((person_id, target_season_id))
     if headline is None:
         raise KeyError(
             f"No scored transition for {person_id} into {target_season_id}. "
@@ -191,7 +197,7 @@ def build_bundle(
             record, source_season, counter, anonymized=anonymized, source_label=source_label
         )
     )
-    for metric in TARGET_METRICS:
+    for metric in HEADLINE_METRICS:
         facts.extend(
             _metric_facts(
                 metric,
@@ -227,7 +233,7 @@ def build_bundle(
 def actual_outcome(source: BundleSource, person_id: str, target_season_id: str) -> dict[str, float]:
     """What actually happened, held back from the bundle and shown beside it."""
     outcome: dict[str, float] = {}
-    for metric in TARGET_METRICS:
+    for metric in HEADLINE_METRICS:
         scored = source.scored[metric].get((person_id, target_season_id))
         if scored is not None and scored.record.get("target_value") is not None:
             outcome[metric] = float(scored.record["target_value"])
@@ -456,7 +462,7 @@ def _model_quality_facts(run: dict[str, Any], direction: str, ids: _IdCounter) -
     exactly the miscalibration the judge rubric is looking for.
     """
     facts: list[Fact] = []
-    for metric in TARGET_METRICS:
+    for metric in HEADLINE_METRICS:
         metrics = run["metrics"].get(metric)
         if metrics is None:
             continue
@@ -529,7 +535,7 @@ def _cohort_facts(source: BundleSource, record: dict[str, Any], ids: _IdCounter)
     ]
 
     for row in source.run.get("selection", []):
-        if row["direction"] == direction and row["metric"] == TARGET_METRICS[0]:
+        if row["direction"] == direction and row["metric"] == HEADLINE_METRICS[0]:
             facts.append(
                 Fact(
                     id=ids.next(),
@@ -21,11 +21,19 @@ method finds is "which era is this" — true, and useless.
 from __future__ import annotations
 
 import logging
+import multiprocessing
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING
 
 import numpy as np
 import polars as pl
 
+if TYPE_CHECKING:
+    from sklearn.mixture import GaussianMixture
+
 log = logging.getLogger(__name__)
 
 #: Role features. Deliberately excludes raw volume: an archetype is *how* a
@@ -44,6 +52,10 @@ CLR_PSEUDOCOUNT = 0.005
 MIN_MINUTES_ARCHETYPE = 500
 PCA_VARIANCE_TARGET = 0.90
 
+#: Added to the diagonal of each warm-start covariance, as ``GaussianMixture``
+#: adds its own ``reg_covar``, so a thin cluster still has a precision matrix.
+WARM_START_REGULARISATION = 1e-6
+
 
 @dataclass
 class ArchetypeModel:
@@ -98,39 +110,47 @@ def clr_transform(shares: np.ndarray, pseudocount: float = CLR_PSEUDOCOUNT) -> n
     return log_shares - log_shares.mean(axis=1, keepdims=True)
 
 
-def standardize_within_season(frame: pl.DataFrame, columns: list[str]) -> np.ndarray:
-    """Z-score each feature within its own league-season."""
-    out = np.zeros((frame.height, len(columns)))
-    seasons = frame["season_id"].to_numpy()
+def clr_expressions(columns: Sequence[str], pseudocount: float = CLR_PSEUDOCOUNT) -> list[pl.Expr]:
+    """:func:`clr_transform` as expressions, one ``clr_<column>`` per share."""
+    padded = [pl.col(c).cast(pl.Float64) + pseudocount for c in columns]
+    total = pl.sum_horizontal(padded)
+    logs = [(share / total).log() for share in padded]
+    centre = pl.mean_horizontal(logs)
+    return [(log - centre).alias(f"clr_{c}") for log, c in zip(logs, columns, strict=True)]
 
-    for index, column in enumerate(columns):
-        values = frame[column].to_numpy().astype(float)
-        standardized = np.zeros_like(values)
 
-        for season in np.unique(seasons):
-            mask = seasons == season
-            block = values[mask]
-            spread = block.std()
-            standardized[mask] = (block - block.mean()) / spread if spread > 0 else 0.0
+def within_season_z(value: pl.Expr) -> pl.Expr:
+    """Z-score within each ``season_id``; a season with no spread becomes zero."""
+    spread = value.std(ddof=0).over("season_id")
+    return (
+        pl.when(spread > 0).then((value - value.mean().over("season_id")) / spread).otherwise(0.0)
+    )
 
-        out[:, index] = standardized
 
-    return out
+def standardize_within_season(frame: pl.DataFrame, columns: list[str]) -> np.ndarray:
+    """Z-score each feature within its own league-season."""
+    return frame.select(
+        within_season_z(pl.col(c).cast(pl.Float64)).alias(c) for c in columns
+    ).to_numpy(order="c")
 
 
 def design_matrix(frame: pl.DataFrame) -> tuple[np.ndarray, list[str]]:
-    role = standardize_within_season(frame, list(ROLE_FEATURES))
-
-    shares = np.column_stack([frame[c].to_numpy().astype(float) for c in SHOT_MIX_FEATURES])
-    clr = clr_transform(shares)
-    clr_columns = [f"_clr_{i}" for i in range(clr.shape[1])]
-    clr_frame = frame.with_columns(
-        [pl.Series(name, clr[:, i]) for i, name in enumerate(clr_columns)]
-    )
-    clr_standardized = standardize_within_season(clr_frame, clr_columns)
+    """Standardised role features and shot-mix log-ratios, as one contiguous matrix.
 
+    Built in a single select: every column is grouped by season with
+    ``over``, so there is one pass over the rows, not one per season.
+    """
     names = [*ROLE_FEATURES, *(f"clr_{c}" for c in SHOT_MIX_FEATURES)]
-    return np.column_stack([role, clr_standardized]), names
+    design = frame.select(
+        *(within_season_z(pl.col(c).cast(pl.Float64)).alias(c) for c in ROLE_FEATURES),
+        *(
+            within_season_z(clr).alias(name)
+            for clr, name in zip(
+                clr_expressions(SHOT_MIX_FEATURES), names[len(ROLE_FEATURES) :], strict=True
+            )
+        ),
+    )
+    return design.to_numpy(order="c"), names
 
 
 def fit(frame: pl.DataFrame, *, k: int, seed: int) -> tuple[np.ndarray, np.ndarray, float]:
@@ -142,9 +162,20 @@ def fit(frame: pl.DataFrame, *, k: int, seed: int) -> tuple[np.ndarray, np.ndarr
 
     Returns ``(hard labels, whitened coordinates, explained variance)``.
     """
-    from sklearn.decomposition import PCA
     from sklearn.mixture import GaussianMixture
 
+    reduced, explained = _reduce(frame, seed=seed)
+
+    mixture = GaussianMixture(n_components=k, covariance_type="full", random_state=seed, n_init=5)
+    labels = mixture.fit_predict(reduced)
+
+    return labels, reduced, explained
+
+
+def _reduce(frame: pl.DataFrame, *, seed: int) -> tuple[np.ndarray, float]:
+    """The design, scaled and reduced by PCA to the variance target."""
+    from sklearn.decomposition import PCA
+
     design, _ = design_matrix(frame)
     scales = design.std(axis=0)
     scales[scales == 0] = 1.0
@@ -152,11 +183,7 @@ def fit(frame: pl.DataFrame, *, k: int, seed: int) -> tuple[np.ndarray, np.ndarr
 
     pca = PCA(n_components=PCA_VARIANCE_TARGET, random_state=seed)
     reduced = pca.fit_transform(scaled)
-
-    mixture = GaussianMixture(n_components=k, covariance_type="full", random_state=seed, n_init=5)
-    labels = mixture.fit_predict(reduced)
-
-    return labels, reduced, float(pca.explained_variance_ratio_.sum())
+    return reduced, float(pca.explained_variance_ratio_.sum())
 
 
 def out_of_sample_log_likelihood(
@@ -198,41 +225,128 @@ def out_of_sample_log_likelihood(
 
 
 def cluster_stability(
-    frame: pl.DataFrame, *, k: int, seed: int, n_boot: int = 30
+    frame: pl.DataFrame,
+    *,
+    k: int,
+    seed: int,
+    n_boot: int = 30,
+    workers: int = 1,
+    warm_start: bool = False,
 ) -> dict[int, float]:
     """Per-cluster Jaccard stability under bootstrap resampling.
 
     Published per cluster, including the unstable ones. Rim-running centres
     hold together; a "combo forward" bucket usually does not, and a reader
     deserves to know which of the labels shown to them means anything.
+
+    Replicates are seeded by spawning from ``seed``, so the answer does not
+    depend on how many ``workers`` processes share them or in what order they
+    finish.
+
+    ``warm_start`` starts each replicate's mixture from the reference partition
+    of the rows it drew, in place of five cold starts. It is several times
+    cheaper but answers a narrower question: whether the reference clusters
+    survive a resample, not whether a fresh search finds them again. A cold
+    search often settles in a worse optimum, and that is part of what the
+    published stability and the choice of ``k`` measure. So the floor applies
+    to cold starts only.
     """
-    rng = np.random.default_rng(seed)
     reference_labels, _, _ = fit(frame, k=k, seed=seed)
-    reference_sets = {c: set(np.flatnonzero(reference_labels == c).tolist()) for c in range(k)}
-    scores: dict[int, list[float]] = {c: [] for c in range(k)}
-
-    for _ in range(n_boot):
-        sample = rng.choice(frame.height, size=frame.height, replace=True)
-        try:
-            labels, _, _ = fit(frame[sample.tolist()], k=k, seed=seed)
-        except (ValueError, np.linalg.LinAlgError):
-            continue
-
-        boot_sets = [
-            {int(sample[i]) for i in np.flatnonzero(labels == c).tolist()} for c in range(k)
-        ]
-
-        for cluster, reference in reference_sets.items():
-            if not reference:
-                continue
-            scores[cluster].append(
-                max(
-                    len(reference & b) / len(reference | b) if (reference | b) else 0.0
-                    for b in boot_sets
-                )
+    replicate = partial(_stability_replicate, frame, reference_labels, k, warm_start)
+    seeds = np.random.SeedSequence(seed).spawn(n_boot)
+
+    if workers <= 1 or n_boot <= 1:
+        overlaps = [replicate(child) for child in seeds]
+    else:
+        # Spawned, not forked: a fork taken while polars' thread pool is running
+        # can inherit a held lock and never finish.
+        context = multiprocessing.get_context("spawn")
+        workers = min(workers, n_boot)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            # One batch per process, so the frame is sent to each once.
+            chunk = -(-n_boot // workers)
+            overlaps = list(pool.map(replicate, seeds, chunksize=chunk))
+
+    scored = [o for o in overlaps if o is not None]
+    if not scored:
+        return dict.fromkeys(range(k), 0.0)
+    draws = np.vstack(scored)
+    return {
+        c: float(np.nanmean(draws[:, c])) if np.isfinite(draws[:, c]).any() else 0.0
+        for c in range(k)
+    }
+
+
+def _stability_replicate(
+    frame: pl.DataFrame,
+    reference_labels: np.ndarray,
+    k: int,
+    warm_start: bool,
+    seed: np.random.SeedSequence,
+) -> np.ndarray | None:
+    """Best Jaccard overlap of each reference cluster with one bootstrap refit."""
+    from sklearn.mixture import GaussianMixture
+
+    rng = np.random.default_rng(seed)
+    sample = rng.integers(0, frame.height, size=frame.height)
+    random_state = int(rng.integers(2**31 - 1))
+    try:
+        reduced, _ = _reduce(frame[sample], seed=random_state)
+        mixture = (
+            _warm_started_mixture(reduced, reference_labels[sample], k, random_state=random_state)
+            if warm_start
+            else GaussianMixture(
+                n_components=k, covariance_type="full", random_state=random_state, n_init=5
             )
+        )
+        labels = mixture.fit_predict(reduced)
+    except (ValueError, np.linalg.LinAlgError):
+        return None
+    return best_jaccard(reference_labels, sample, labels, k)
+
+
+def _warm_started_mixture(
+    reduced: np.ndarray, labels: np.ndarray, k: int, *, random_state: int
+) -> GaussianMixture:
+    """A mixture whose EM starts from the weights, means and covariances of ``labels``."""
+    from sklearn.mixture import GaussianMixture
 
-    return {c: float(np.mean(v)) if v else 0.0 for c, v in scores.items()}
+    sizes = np.bincount(labels, minlength=k)
+    if (sizes <= reduced.shape[1]).any():
+        raise ValueError("a reference cluster is too thin in this resample to start from")
+
+    means = np.stack([reduced[labels == c].mean(axis=0) for c in range(k)])
+    ridge = WARM_START_REGULARISATION * np.eye(reduced.shape[1])
+    covariances = np.stack([np.cov(reduced[labels == c], rowvar=False) + ridge for c in range(k)])
+    return GaussianMixture(
+        n_components=k,
+        covariance_type="full",
+        weights_init=sizes / sizes.sum(),
+        means_init=means,
+        precisions_init=np.linalg.inv(covariances),
+        random_state=random_state,
+    )
+
+
+def best_jaccard(
+    reference_labels: np.ndarray, sample: np.ndarray, labels: np.ndarray, k: int
+) -> np.ndarray:
+    """For each reference cluster, its best Jaccard index against a resample's clusters.
+
+    The sets are of original rows: a bootstrap cluster is the distinct rows
+    drawn into it, a reference cluster every row labelled with it. All ``k x k``
+    intersections come from one ``bincount`` of label pairs over the distinct
+    rows drawn. Since the reference clusters keep the rows a resample never
+    drew, perfect agreement scores the share drawn, about 0.63, not 1. A
+    reference cluster with no rows scores NaN.
+    """
+    drawn, first = np.unique(sample, return_index=True)
+    boot = labels[first]
+    overlap = np.bincount(reference_labels[drawn] * k + boot, minlength=k * k).reshape(k, k)
+    reference_sizes = np.bincount(reference_labels, minlength=k)
+    union = reference_sizes[:, None] + np.bincount(boot, minlength=k)[None, :] - overlap
+    jaccard = overlap / np.maximum(union, 1)
+    return np.where(reference_sizes > 0, jaccard.max(axis=1), np.nan)
 
 
 def describe_clusters(
@@ -276,48 +390,3 @@ def describe_clusters(
         )
 
     return pl.DataFrame(rows)
-
-
-def nearest_neighbours(
-    frame: pl.DataFrame, coordinates: np.ndarray, *, top_k: int = 10
-) -> pl.DataFrame:
-    """Precomputed comparables in the reduced archetype space.
-
-    Computed here rather than in the Worker. The previous version scanned a
-    whole season table and ran cosine similarity per request, inside a runtime
-    capped at 10 ms of CPU — survivable against four hardcoded players,
-    impossible against six hundred real ones. Euclidean distance in the whitened
-    space is also the right metric; cosine on a simplex was not.
-    """
-    from sklearn.neighbors import NearestNeighbors
-
-    # Compare within a season, so a comparable is a contemporary rather than
-    # someone playing a different sport twenty years earlier.
-    rows = []
-    for season in frame["season_id"].unique().to_list():
-        mask = (frame["season_id"] == season).to_numpy()
-        block = frame.filter(pl.col("season_id") == season)
-        if block.height < 3:
-            continue
-
-        coords = coordinates[mask]
-        neighbours = min(top_k + 1, block.height)
-        finder = NearestNeighbors(n_neighbors=neighbours).fit(coords)
-        distances, indices = finder.kneighbors(coords)
-
-        persons = block["person_id"].to_list()
-        for i, person in enumerate(persons):
-            for rank, (distance, j) in enumerate(zip(distances[i], indices[i], strict=True)):
-                if int(j) == i:
-                    continue  # a player is not his own comparable
-                rows.append(
-                    {
-                        "season_id": season,
-                        "person_id": person,
-                        "rank": rank,
-                        "neighbour_person_id": persons[int(j)],
-                        "distance": round(float(distance), 5),
-                    }
-                )
-
-    return pl.DataFrame(rows) if rows else pl.DataFrame()
@@ -0,0 +1,159 @@
+"""Comparables in the archetype space, within a season or across eras and leagues.
+
+The previous version fitted a nearest-neighbour search per season and could
+answer one question: which contemporaries in the same league play like this
+player. The question scouts ask as often is the other one — who, in any league
+and any decade, had a season like this — and a per-season search cannot get
+there.
+
+So the archetype coordinates of every qualified player-season are kept as one
+index, saved with the roles result and rebuilt only when the roles model
+version changes. A :class:`ComparableScope` says which of those player-seasons a
+comparable may be drawn from, and the same search serves all of them. The
+coordinates are already standardised within season, so a 2003 season and a 2023
+one are compared on where each stood in its own league rather than on raw rates
+from two different sports.
+
+A player is never his own comparable, in any season: across eras the nearest
+neighbour of almost every season is the same player a year earlier, which is
+true and tells a reader nothing.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import polars as pl
+
+#: Comparables kept per player-season and scope.
+COMPARABLES_TOP_K = 10
+
+#: Columns identifying a row of the index; the coordinates follow as ``axis_<i>``.
+KEY_COLUMNS = ("season_id", "person_id", "league", "season_order")
+
+
+@dataclass(frozen=True)
+class ComparableScope:
+    """Which player-seasons a comparable may be drawn from."""
+
+    name: str
+    #: Seasons either side of the player's own; ``None`` for any era.
+    season_window: int | None
+    same_league: bool
+
+
+#: Served as the ``scope`` column of ``player_comps``. ``season`` is the
+#: original contemporaries-only search, kept as the default.
+COMPARABLE_SCOPES = (
+    ComparableScope("season", season_window=0, same_league=True),
+    ComparableScope("era", season_window=2, same_league=False),
+    ComparableScope("all", season_window=None, same_league=False),
+)
+
+
+@dataclass
+class ComparablesIndex:
+    """Every qualified player-season, positioned in the archetype space."""
+
+    keys: pl.DataFrame
+    coordinates: np.ndarray
+
+    @classmethod
+    def build(cls, frame: pl.DataFrame, coordinates: np.ndarray) -> ComparablesIndex:
+        """From the archetype feature frame and the coordinates ``archetypes.fit`` gave it."""
+        return cls(
+            keys=frame.select(KEY_COLUMNS),
+            coordinates=np.ascontiguousarray(coordinates, dtype=np.float64),
+        )
+
+    @classmethod
+    def from_frame(cls, frame: pl.DataFrame) -> ComparablesIndex:
+        """Read back what :meth:`to_frame` wrote."""
+        axes = [c for c in frame.columns if c.startswith("axis_")]
+        return cls(keys=frame.select(KEY_COLUMNS), coordinates=frame.select(axes).to_numpy())
+
+    def to_frame(self) -> pl.DataFrame:
+        """Keys and coordinates as one frame, which is what is saved."""
+        axes = pl.DataFrame(
+            self.coordinates, schema=[f"axis_{i}" for i in range(self.coordinates.shape[1])]
+        )
+        return self.keys.hstack(axes)
+
+    def query(self, scope: ComparableScope, *, top_k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Row positions and distances of each row's ``top_k`` comparables under ``scope``.
+
+        Both come back ``(n, top_k)``, nearest first. Slots a small candidate
+        pool cannot fill hold -1 and ``inf``.
+
+        Rows that share a league (when the scope needs one) and a season (when
+        it has a window) share a candidate pool, so there is one search per
+        pool rather than one per row. Each asks for as many extra neighbours as
+        any one player has rows in the pool, which is the most the own-player
+        exclusion can remove, so what is left is still the exact top ``k``.
+        """
+        from sklearn.neighbors import KDTree
+
+        n = self.coordinates.shape[0]
+        positions = np.full((n, top_k), -1, dtype=np.int64)
+        distances = np.full((n, top_k), np.inf)
+
+        _, persons = np.unique(self.keys["person_id"].to_numpy(), return_inverse=True)
+        leagues = self.keys["league"].to_numpy()
+        orders = self.keys["season_order"].to_numpy()
+
+        pools = pl.DataFrame(
+            {
+                "league": leagues if scope.same_league else np.full(n, ""),
+                "order": orders if scope.season_window is not None else np.zeros(n, np.int64),
+            }
+        ).with_row_index("row")
+        for (league, order), group in pools.group_by("league", "order"):
+            rows = group["row"].to_numpy()
+            eligible = np.ones(n, dtype=bool)
+            if scope.same_league:
+                eligible &= leagues == league
+            if scope.season_window is not None:
+                eligible &= np.abs(orders - order) <= scope.season_window
+            candidates = np.flatnonzero(eligible)
+
+            k = min(top_k + int(np.bincount(persons[candidates]).max()), candidates.size)
+            found_distances, found = KDTree(self.coordinates[candidates]).query(
+                self.coordinates[rows], k=k
+            )
+            found = candidates[found]
+            found_distances[persons[found] == persons[rows][:, None]] = np.inf
+
+            nearest = np.argsort(found_distances, axis=1, kind="stable")[:, :top_k]
+            chosen = np.take_along_axis(found, nearest, axis=1)
+            chosen_distances = np.take_along_axis(found_distances, nearest, axis=1)
+            chosen[np.isinf(chosen_distances)] = -1
+            positions[rows, : nearest.shape[1]] = chosen
+            distances[rows, : nearest.shape[1]] = chosen_distances
+
+        return positions, distances
+
+    def comparables(
+        self,
+        scopes: tuple[ComparableScope, ...] = COMPARABLE_SCOPES,
+        *,
+        top_k: int = COMPARABLES_TOP_K,
+    ) -> pl.DataFrame:
+        """The serving frame: one row per player-season, scope and rank."""
+        frames = []
+        for scope in scopes:
+            positions, distances = self.query(scope, top_k=top_k)
+            row, slot = np.nonzero(positions >= 0)
+            neighbour = self.keys[positions[row, slot]]
+            frames.append(
+                self.keys[row]
+                .select("season_id", "person_id")
+                .with_columns(
+                    pl.lit(scope.name).alias("scope"),
+                    pl.Series("rank", slot + 1, dtype=pl.Int64),
+                    neighbour["season_id"].alias("neighbour_season_id"),
+                    neighbour["person_id"].alias("neighbour_person_id"),
+                    pl.Series("distance", np.round(distances[row, slot], 5)),
+                )
+            )
+        return pl.concat(frames)
@@ -40,12 +40,8 @@ from dataclasses import dataclass
 import numpy as np
 import polars as pl
 
-from hoopslab.features.translation import (
-    build_persistence_frame,
-    build_transition_frame,
-    league_season_moments,
-)
-from hoopslab.models.translation import fit_persistence, fit_translation
+from hoopslab.features.translation import build_transition_frame, league_season_moments
+from hoopslab.models.store import FittedModelStore, load_or_fit
 from hoopslab.transform.gold import MIN_SOURCE_MINUTES
 
 log = logging.getLogger(__name__)
@@ -165,7 +161,9 @@ def build_counterfactual_frame(
         pl.col(f"z_{metric}").alias("z_source"),
     ).with_columns(
         pl.lit(direction).alias("direction"),
-        pl.lit(target_season_id).alias("target_season_id"),
+        pl.lit(target_season_id, dtype=player_seasons.schema["season_id"]).alias(
+            "target_season_id"
+        ),
         pl.lit(ASSUMED_GAP_SEASONS).alias("gap_seasons"),
         pl.lit(target_mean).alias("target_mean"),
         pl.lit(target_sd).alias("target_sd"),
@@ -181,12 +179,14 @@ def score_counterfactuals(
     direction: str,
     target_season_id: str,
     metric: str,
+    store: FittedModelStore | None = None,
 ) -> pl.DataFrame:
     """Project every eligible non-mover, with support and mover flags attached.
 
-    The model is refitted here on the observed transfers rather than loaded, so
-    a projection can never be served against coefficients that no longer match
-    the committed data.
+    The model is fitted here on the observed transfers, or read from ``store``,
+    which is keyed on the committed contract hashes. Either way a projection
+    can never be served against coefficients that no longer match the
+    committed data.
     """
     moments = league_season_moments(player_seasons, metric)
     transitions = (
@@ -201,8 +201,7 @@ def score_counterfactuals(
         .filter(pl.col("target_sd").is_not_null() & (pl.col("target_sd") > 0))
     )
 
-    persistence = fit_persistence(build_persistence_frame(player_seasons, metric), metric)
-    model = fit_translation(transitions, persistence, metric)
+    model = load_or_fit(player_seasons, transitions, metric, store=store)
     support = support_range(transitions, direction, metric)
 
     frame = build_counterfactual_frame(
@@ -214,8 +213,11 @@ def score_counterfactuals(
     # Anyone with an observed transfer in this direction already has a real
     # prediction; a hypothetical one for them would be a duplicate wearing a
     # different name.
-    moved = set(pairs.filter(pl.col("direction") == direction)["person_id"].to_list())
-    frame = frame.filter(~pl.col("person_id").is_in(list(moved)) if moved else pl.lit(True))
+    frame = frame.join(
+        pairs.filter(pl.col("direction") == direction).select("person_id"),
+        on="person_id",
+        how="anti",
+    )
     if frame.is_empty():
         return frame
 
@@ -227,7 +229,12 @@ def score_counterfactuals(
     # Anyone who moved in *some* other direction is still a different case from
     # a player with no cross-league history at all, and the distinction is worth
     # serving: the first has been signed abroad before.
-    any_move = set(pairs["person_id"].to_list())
+    frame = frame.join(
+        pairs.select("person_id").unique().with_columns(pl.lit(True).alias("moved_before")),
+        on="person_id",
+        how="left",
+        maintain_order="left",
+    ).with_columns(pl.col("moved_before").fill_null(False))
 
     return frame.with_columns(
         pl.Series("predicted", predicted),
@@ -236,9 +243,6 @@ def score_counterfactuals(
         pl.Series("pi95_low", pi95[:, 0]),
         pl.Series("pi95_high", pi95[:, 1]),
         pl.Series("in_support", in_support),
-        pl.col("person_id").is_in(list(any_move)).alias("moved_before")
-        if any_move
-        else pl.lit(False).alias("moved_before"),
         pl.lit(support.z_min).alias("support_z_min"),
         pl.lit(support.z_max).alias("support_z_max"),
         pl.lit(support.n_movers).alias("support_n_movers"),
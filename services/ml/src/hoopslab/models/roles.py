@@ -8,8 +8,12 @@ forecast anything.
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+import shutil
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 import numpy as np
@@ -17,17 +21,18 @@ import polars as pl
 
 from hoopslab.config import SEED
 from hoopslab.models import archetypes, shooting
+from hoopslab.models.comparables import COMPARABLE_SCOPES, ComparablesIndex
 
 log = logging.getLogger(__name__)
 
 MODEL_NAME = "roles"
-MODEL_VERSION = "roles-v1.0"
+MODEL_VERSION = "roles-v1.1"
 
 #: Chosen deliberately, and the reasoning is on the record.
 #:
 #: Out-of-sample held-out log-likelihood improves monotonically with k but
 #: almost flattens after 5 (-6.428 at k=5 against -6.401 at k=10), while
-#: bootstrap stability falls off a cliff: mean Jaccard 0.52 at k=5 against 0.40
+#: bootstrap stability falls off a cliff: mean Jaccard 0.52 at k=5 against 0.43
 #: at k=6. Where the criteria disagree the smaller k wins, so k=5.
 ARCHETYPE_K = 5
 
@@ -36,6 +41,16 @@ ARCHETYPE_K = 5
 #: the crisp taxonomy a labelled diagram would imply.
 STABILITY_FLOOR = 0.45
 
+#: Bootstrap replicates behind each cluster's stability. Enough that the
+#: Monte Carlo error is small beside the distance of any cluster to the floor.
+STABILITY_BOOTSTRAP = 200
+
+#: The frames of a :class:`RolesResult`, each saved as its own parquet file.
+#: ``embedding`` is the comparables index, saved so that it is built once per
+#: model version rather than once per reader.
+RESULT_FRAMES = ("assignments", "neighbours", "cluster_descriptions", "shooting", "embedding")
+SUMMARY_NAME = "summary.json"
+
 
 @dataclass
 class RolesResult:
@@ -43,10 +58,15 @@ class RolesResult:
     neighbours: pl.DataFrame
     cluster_descriptions: pl.DataFrame
     shooting: pl.DataFrame
+    embedding: pl.DataFrame
     explained_variance: float
     stability: dict[int, float] = field(default_factory=dict)
     k_selection: dict[int, float] = field(default_factory=dict)
 
+    @property
+    def comparables_index(self) -> ComparablesIndex:
+        return ComparablesIndex.from_frame(self.embedding)
+
     @property
     def mean_stability(self) -> float:
         return float(np.mean(list(self.stability.values()))) if self.stability else 0.0
@@ -64,12 +84,22 @@ class RolesResult:
                 f"  clusters below {STABILITY_FLOOR}: {sorted(unstable)} "
                 "- report these as unclassified rather than as types"
             )
-        lines.append(f"  neighbours         {self.neighbours.height:,} precomputed comparables")
+        lines.append(
+            f"  neighbours         {self.neighbours.height:,} precomputed comparables "
+            f"over {len(COMPARABLE_SCOPES)} scopes"
+        )
         lines.append(f"  shooting           {self.shooting.height:,} shrunk 3PT rows")
         return "\n".join(lines)
 
 
-def fit_roles(player_seasons: pl.DataFrame, *, seed: int = SEED) -> RolesResult:
+def fit_roles(
+    player_seasons: pl.DataFrame, *, seed: int = SEED, workers: int | None = None
+) -> RolesResult:
+    """Archetypes, comparables and shooting from one set of player-seasons.
+
+    ``workers`` processes share the stability bootstrap, every core by default.
+    Each replicate has its own spawned seed, so the result does not depend on it.
+    """
     frame = archetypes.build_feature_frame(player_seasons)
     if frame.height < 1000:
         raise ValueError(
@@ -79,8 +109,15 @@ def fit_roles(player_seasons: pl.DataFrame, *, seed: int = SEED) -> RolesResult:
 
     k_selection = archetypes.out_of_sample_log_likelihood(frame, seed=seed)
     labels, coordinates, explained = archetypes.fit(frame, k=ARCHETYPE_K, seed=seed)
-    stability = archetypes.cluster_stability(frame, k=ARCHETYPE_K, seed=seed, n_boot=12)
+    stability = archetypes.cluster_stability(
+        frame,
+        k=ARCHETYPE_K,
+        seed=seed,
+        n_boot=STABILITY_BOOTSTRAP,
+        workers=(os.cpu_count() or 1) if workers is None else workers,
+    )
 
+    index = ComparablesIndex.build(frame, coordinates)
     assignments = frame.select("season_id", "person_id", "league").with_columns(
         pl.Series("cluster", labels.astype(int)),
         pl.lit(MODEL_VERSION).alias("model_version"),
@@ -88,9 +125,10 @@ def fit_roles(player_seasons: pl.DataFrame, *, seed: int = SEED) -> RolesResult:
 
     return RolesResult(
         assignments=assignments,
-        neighbours=archetypes.nearest_neighbours(frame, coordinates),
+        neighbours=index.comparables(),
         cluster_descriptions=archetypes.describe_clusters(frame, labels, stability),
         shooting=shooting.shrink_three_point(player_seasons),
+        embedding=index.to_frame(),
         explained_variance=explained,
         stability={int(k): float(v) for k, v in stability.items()},
         k_selection={int(k): float(v) for k, v in k_selection.items()},
@@ -110,3 +148,45 @@ def to_run_payload(result: RolesResult) -> dict[str, Any]:
         "n_neighbours": result.neighbours.height,
         "n_shooting_rows": result.shooting.height,
     }
+
+
+def save_roles(result: RolesResult, directory: Path) -> Path:
+    """Write a fitted result so a later step can serve it without refitting.
+
+    One parquet file per frame plus a JSON summary, written aside and swapped
+    in whole, so a reader never sees frames from two different fits.
+    """
+    staging = directory.with_name(directory.name + ".staging")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    for name in RESULT_FRAMES:
+        getattr(result, name).write_parquet(staging / f"{name}.parquet")
+    summary = {
+        "model_version": MODEL_VERSION,
+        "explained_variance": result.explained_variance,
+        "stability": {str(k): v for k, v in result.stability.items()},
+        "k_selection": {str(k): v for k, v in result.k_selection.items()},
+    }
+    (staging / SUMMARY_NAME).write_text(
+        json.dumps(summary, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    shutil.rmtree(directory, ignore_errors=True)
+    staging.rename(directory)
+    return directory
+
+
+def load_roles(directory: Path) -> RolesResult | None:
+    """A result written by :func:`save_roles`, or ``None`` if absent or from another version."""
+    summary_path = directory / SUMMARY_NAME
+    if not summary_path.is_file():
+        return None
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    if summary.get("model_version") != MODEL_VERSION:
+        return None
+    frames = {name: pl.read_parquet(directory / f"{name}.parquet") for name in RESULT_FRAMES}
+    return RolesResult(
+        **frames,
+        explained_variance=float(summary["explained_variance"]),
+        stability={int(k): float(v) for k, v in summary["stability"].items()},
+        k_selection={int(k): float(v) for k, v in summary["k_selection"].items()},
+    )
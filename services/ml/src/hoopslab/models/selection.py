@@ -126,14 +126,18 @@ def inverse_mills_ratio(
     if pool.height < 100 or movers.height < 20:
         return None
 
-    moved_keys = set(
-        zip(movers["person_id"].to_list(), movers["source_season_id"].to_list(), strict=True)
-    )
-    moved = np.array(
-        [
-            1.0 if (p, s) in moved_keys else 0.0
-            for p, s in zip(pool["person_id"].to_list(), pool["season_id"].to_list(), strict=True)
-        ]
+    key = ["person_id", "season_id"]
+    mover_keys = movers.select("person_id", pl.col("source_season_id").alias("season_id"))
+    moved = (
+        pool.select(key)
+        .join(
+            mover_keys.unique().with_columns(pl.lit(1.0).alias("moved")),
+            on=key,
+            how="left",
+            maintain_order="left",
+        )["moved"]
+        .fill_null(0.0)
+        .to_numpy()
     )
     if moved.sum() < 10:
         return None
@@ -157,17 +161,13 @@ def inverse_mills_ratio(
     index = np.asarray(fitted.predict(design, linear=True), dtype=float)
     ratio = norm.pdf(index) / np.maximum(norm.cdf(index), 1e-9)
 
-    lookup = {
-        (p, s): float(r)
-        for p, s, r in zip(
-            pool["person_id"].to_list(), pool["season_id"].to_list(), ratio, strict=True
-        )
-    }
-    return np.array(
-        [
-            lookup.get((p, s), 0.0)
-            for p, s in zip(
-                movers["person_id"].to_list(), movers["source_season_id"].to_list(), strict=True
-            )
-        ]
+    ratios = (
+        pool.select(key)
+        .with_columns(pl.Series("ratio", ratio))
+        .unique(key, keep="last", maintain_order=True)
+    )
+    return (
+        mover_keys.join(ratios, on=key, how="left", maintain_order="left")["ratio"]
+        .fill_null(0.0)
+        .to_numpy()
     )
@@ -0,0 +1,207 @@
+"""Content-addressed store of fitted translation models.
+
+The export, the evidence bundles, the counterfactual projections and the
+training driver all need the same two-stage fit for each metric on the same
+committed gold, and each used to refit it from scratch. One export followed by
+one ``report`` refitted identical models five or more times.
+
+Entries are keyed on the gold contract hashes, the metric and the model
+version. The contract hashes are the same fingerprint ``snapshot_id`` is built
+from, so the rule that a projection is never served against coefficients that
+no longer match the committed data still holds: change a gold table, rebuild
+its contract, and every key moves. Entries written under a previous snapshot
+are removed the next time anything is stored, so the directory cannot
+accumulate models nobody can ask for.
+
+Only callers fitting on the committed gold *as a whole* may use a store. A fit
+on a slice — the Worker fixture scores a sixty-player subset of the pairs —
+would be keyed identically and describe something else, so those callers pass
+no store and fit directly.
+
+Stored as readable JSON rather than a pickle, for the same reason the response
+cache is: a reviewer can open an entry and read the coefficients.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from hoopslab.features.translation import build_persistence_panel
+from hoopslab.models.translation import (
+    PersistenceModel,
+    TranslationModel,
+    fit_persistence_all,
+    fit_translation_all,
+)
+from hoopslab.paths import DataPaths
+from hoopslab.validate.contracts import committed_hashes
+
+log = logging.getLogger(__name__)
+
+#: Bumped when the stored shape or the fitting procedure changes, so entries
+#: written by older code are ignored rather than misread. Part of the key.
+STORE_VERSION = 1
+
+
+def model_key(*, metric: str, model_version: str, contract_hashes: dict[str, str]) -> str:
+    """Hash of every input that determines a fit."""
+    payload = json.dumps(
+        {
+            "version": STORE_VERSION,
+            "metric": metric,
+            "model_version": model_version,
+            "contract_hashes": contract_hashes,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=True,
+    )
+    return hashlib.sha256(payload.encode("ascii")).hexdigest()[:24]
+
+
+def model_to_json(model: TranslationModel) -> dict[str, Any]:
+    return asdict(model)
+
+
+def model_from_json(payload: dict[str, Any]) -> TranslationModel:
+    persistence = PersistenceModel(**payload["persistence"])
+    return TranslationModel(**{**payload, "persistence": persistence})
+
+
+class FittedModelStore:
+    """A directory of fitted models for one gold snapshot and model version."""
+
+    def __init__(
+        self, directory: Path, *, contract_hashes: dict[str, str], model_version: str
+    ) -> None:
+        self.directory = Path(directory)
+        self.contract_hashes = dict(contract_hashes)
+        self.model_version = model_version
+        self._memo: dict[str, TranslationModel] = {}
+
+    @classmethod
+    def for_paths(cls, paths: DataPaths, *, model_version: str) -> FittedModelStore:
+        return cls(
+            paths.models,
+            contract_hashes=committed_hashes(paths.contracts),
+            model_version=model_version,
+        )
+
+    def key_for(self, metric: str) -> str:
+        return model_key(
+            metric=metric,
+            model_version=self.model_version,
+            contract_hashes=self.contract_hashes,
+        )
+
+    def path_for(self, metric: str) -> Path:
+        return self.directory / f"{self.key_for(metric)}.json"
+
+    def get(self, metric: str) -> TranslationModel | None:
+        key = self.key_for(metric)
+        if key in self._memo:
+            return self._memo[key]
+
+        path = self.path_for(metric)
+        if not path.is_file():
+            return None
+        model = model_from_json(json.loads(path.read_text(encoding="utf-8"))["model"])
+        self._memo[key] = model
+        return model
+
+    def put(self, model: TranslationModel) -> Path:
+        self.prune()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        key = self.key_for(model.metric)
+        path = self.directory / f"{key}.json"
+        entry = {
+            "key": key,
+            "metric": model.metric,
+            "model_version": self.model_version,
+            "contract_hashes": self.contract_hashes,
+            "created_at": datetime.now(UTC).isoformat(),
+            "model": model_to_json(model),
+        }
+        # Written aside and renamed into place: ``prune`` in a concurrent
+        # pipeline stage reads every entry, and would take a half-written one
+        # for a stale snapshot and delete it.
+        staging = path.with_suffix(".tmp")
+        staging.write_text(json.dumps(entry, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        staging.replace(path)
+        self._memo[key] = model
+        return path
+
+    def prune(self) -> list[Path]:
+        """Delete entries fitted on a snapshot other than this one."""
+        if not self.directory.is_dir():
+            return []
+
+        stale: list[Path] = []
+        for path in sorted(self.directory.glob("*.json")):
+            try:
+                recorded = json.loads(path.read_text(encoding="utf-8")).get("contract_hashes")
+            except json.JSONDecodeError:
+                recorded = None
+            if recorded != self.contract_hashes:
+                path.unlink(missing_ok=True)
+                stale.append(path)
+
+        if stale:
+            log.info("removed %d fitted models from a previous gold snapshot", len(stale))
+        return stale
+
+
+def load_or_fit(
+    player_seasons: pl.DataFrame,
+    transitions: pl.DataFrame,
+    metric: str,
+    *,
+    store: FittedModelStore | None = None,
+    refit: bool = False,
+) -> TranslationModel:
+    """The two-stage fit for one metric, read from ``store`` when it holds one.
+
+    ``transitions`` must be the moment-attached transition frame built from the
+    same gold the store is keyed on; without a store this is simply the fit.
+    ``refit`` fits regardless and overwrites the stored entry.
+    """
+    return load_or_fit_all(player_seasons, {metric: transitions}, store=store, refit=refit)[metric]
+
+
+def load_or_fit_all(
+    player_seasons: pl.DataFrame,
+    transitions: dict[str, pl.DataFrame],
+    *,
+    store: FittedModelStore | None = None,
+    refit: bool = False,
+) -> dict[str, TranslationModel]:
+    """:func:`load_or_fit` for several metrics, fitting every missing one together.
+
+    Metrics the store already holds are read back; the rest are fitted in one
+    batch, sharing one persistence panel and one factorisation per stage.
+    """
+    models: dict[str, TranslationModel] = {}
+    if store is not None and not refit:
+        for metric in transitions:
+            cached = store.get(metric)
+            if cached is not None:
+                models[metric] = cached
+
+    missing = [metric for metric in transitions if metric not in models]
+    if missing:
+        persistence = fit_persistence_all(build_persistence_panel(player_seasons, missing), missing)
+        fitted = fit_translation_all({m: transitions[m] for m in missing}, persistence)
+        for model in fitted.values():
+            if store is not None:
+                store.put(model)
+        models.update(fitted)
+
+    return {metric: models[metric] for metric in transitions}
@@ -19,24 +19,18 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-import polars as pl
+import numpy as np
 
 from hoopslab.config import SEED
-from hoopslab.eval.backtest import cluster_bootstrap_ci, walk_forward
-from hoopslab.features.translation import (
-    TARGET_METRICS,
-    attach_moments,
-    build_persistence_frame,
-    build_transition_frame,
-    league_season_moments,
-)
+from hoopslab.eval.backtest import cluster_bootstrap, walk_forward
+from hoopslab.eval.diagnostics import interval_diagnostics
+from hoopslab.features.translation import TARGET_METRICS, transition_frames
 from hoopslab.models.selection import summarise_selection
-from hoopslab.models.translation import (
-    fit_direction_specific_slopes,
-    fit_persistence,
-    fit_translation,
-)
+from hoopslab.models.store import FittedModelStore, load_or_fit_all
+from hoopslab.models.translation import bootstrap_translation, fit_direction_specific_slopes
 from hoopslab.paths import DataPaths
+from hoopslab.transform.keys import load_gold
+from hoopslab.validate.contracts import committed_hashes
 
 log = logging.getLogger(__name__)
 
@@ -48,6 +42,10 @@ MODEL_VERSION_MAJOR_MINOR = "v1.0"
 #: real modelling difference would produce.
 VERIFY_TOLERANCE = 1e-6
 
+#: Shuffled-target controls per metric. One permutation can land anywhere;
+#: the spread of many says how far from chance the real score actually is.
+SHUFFLED_PERMUTATIONS = 100
+
 
 @dataclass
 class MetricResult:
@@ -62,9 +60,22 @@ class MetricResult:
     mae_ci: tuple[float, float]
     baseline_mae: dict[str, float]
     shuffled_mae: float
+    #: 5th and 95th percentiles of the control's MAE over every permutation.
+    shuffled_mae_band: tuple[float, float]
+    n_permutations: int
     n_evaluated: int
     n_folds: int
     residual_sd: float
+    rmse: float
+    rmse_ci: tuple[float, float]
+    #: Out-of-fold share of actual values inside the 80% prediction interval.
+    coverage80: float
+    coverage80_ci: tuple[float, float]
+    #: Player-clustered bootstrap distribution of every stage-2 coefficient.
+    coefficient_bootstrap: dict[str, dict[str, float]]
+    #: Leave-one-player-out coverage of the served intervals, and the conformal
+    #: half-widths that would cover, per direction and in z units.
+    interval_coverage: list[dict[str, Any]]
 
     @property
     def best_baseline(self) -> tuple[str, float]:
@@ -92,14 +103,24 @@ class MetricResult:
             f"  {self.metric}",
             f"    pairs fitted            {self.n_pairs}",
             f"    persistence rows        {self.n_persistence} (R^2 {self.persistence_r2:.3f})",
-            f"    shared slope (beta)     {self.beta:+.3f}",
+            f"    shared slope (beta)     {self.beta:+.3f}{self._bootstrap_interval('beta')}",
             f"    out-of-fold MAE         {self.mae:.4f}  "
             f"95% CI [{self.mae_ci[0]:.4f}, {self.mae_ci[1]:.4f}]  n={self.n_evaluated}",
+            f"    out-of-fold RMSE        {self.rmse:.4f}  "
+            f"95% CI [{self.rmse_ci[0]:.4f}, {self.rmse_ci[1]:.4f}]",
+            f"    80% interval coverage   {self.coverage80:.1%}  "
+            f"95% CI [{self.coverage80_ci[0]:.1%}, {self.coverage80_ci[1]:.1%}]",
         ]
         for name, value in sorted(self.baseline_mae.items(), key=lambda kv: kv[1]):
             delta = (value - self.mae) / value * 100 if value else 0.0
             lines.append(f"      vs {name:<22} {value:.4f}  ({delta:+.1f}% better)")
-        lines.append(f"    shuffled-target control {self.shuffled_mae:.4f} (must be worse)")
+        lines.append(
+            f"    shuffled-target control {self.shuffled_mae:.4f} (must be worse)  "
+            f"{self.n_permutations} permutations 90% [{self.shuffled_mae_band[0]:.4f}, "
+            f"{self.shuffled_mae_band[1]:.4f}]"
+        )
+
+        lines.extend(self._coverage_lines())
 
         name, value = self.best_baseline
         verdict = (
@@ -115,6 +136,33 @@ class MetricResult:
             lines.append(f"    {self.slope_agreement_note()}")
         return "\n".join(lines)
 
+    def _bootstrap_interval(self, column: str) -> str:
+        quantiles = self.coefficient_bootstrap.get(column)
+        if not quantiles:
+            return ""
+        return (
+            f"  95% CI [{quantiles['q0.025']:+.3f}, {quantiles['q0.975']:+.3f}] (player bootstrap)"
+        )
+
+    def _coverage_lines(self) -> list[str]:
+        def cell(value: float | None, spec: str) -> str:
+            return "-" if value is None else format(value, spec)
+
+        lines = ["    leave one player out     n  pi80 covers  width  pi95 covers  width"]
+        for row in self.interval_coverage:
+            lines.append(
+                f"      {row['direction']:<10} {row['n_held_out']:>6}"
+                f"  {cell(row['coverage80'], '.1%'):>11}  {cell(row['conformal_width80'], '.2f'):>5}"
+                f"  {cell(row['coverage95'], '.1%'):>11}  {cell(row['conformal_width95'], '.2f'):>5}"
+            )
+        if self.interval_coverage:
+            pooled = self.interval_coverage[0]
+            lines.append(
+                f"      (conformal half-widths in sd; the normal ones are "
+                f"{pooled['normal_width80']:.2f} and {pooled['normal_width95']:.2f})"
+            )
+        return lines
+
     def slope_agreement_note(self) -> str:
         """State plainly whether the shared-slope restriction is supported.
 
@@ -156,26 +204,45 @@ class RunLog:
         return json.dumps(asdict(self), indent=2, sort_keys=True) + "\n"
 
 
-def train_all(paths: DataPaths, *, seed: int = SEED) -> tuple[RunLog, list[MetricResult]]:
-    player_seasons = pl.read_parquet(paths.gold / "player_seasons.parquet")
-    pairs = pl.read_parquet(paths.gold / "transition_pairs.parquet")
+def train_all(
+    paths: DataPaths, *, seed: int = SEED, refit: bool = False, workers: int = 1
+) -> tuple[RunLog, list[MetricResult]]:
+    """Fit, backtest and summarise every target metric.
+
+    Full-sample fits are shared through the fitted-model store with the export
+    and the report layer. ``refit`` ignores whatever the store holds and
+    replaces it, which is what ``--verify`` needs: a reproduction check that
+    reads back its own previous answer proves nothing. ``workers`` processes
+    share the shuffled-target controls.
+    """
+    player_seasons, pairs = load_gold(paths, "player_seasons", "transition_pairs")
+
+    store = FittedModelStore.for_paths(
+        paths, model_version=f"{MODEL_NAME}-{MODEL_VERSION_MAJOR_MINOR}"
+    )
 
     results: list[MetricResult] = []
     selection_rows: list[dict[str, Any]] = []
 
-    for metric in TARGET_METRICS:
-        moments = league_season_moments(player_seasons, metric)
-        persistence_frame = build_persistence_frame(player_seasons, metric)
-        transitions = build_transition_frame(pairs, player_seasons, metric)
-        transitions = attach_moments(transitions, moments, "target_season_id").filter(
-            pl.col("target_sd").is_not_null() & (pl.col("target_sd") > 0)
+    frames = transition_frames(pairs, player_seasons, TARGET_METRICS)
+    models = load_or_fit_all(player_seasons, frames, store=store, refit=refit)
+
+    for metric, transitions in frames.items():
+        model = models[metric]
+        persistence = model.persistence
+        backtest = walk_forward(
+            transitions,
+            persistence,
+            metric,
+            seed=seed,
+            n_permutations=SHUFFLED_PERMUTATIONS,
+            workers=workers,
         )
 
-        persistence = fit_persistence(persistence_frame, metric)
-        model = fit_translation(transitions, persistence, metric)
-        backtest = walk_forward(transitions, persistence, metric, seed=seed)
-
-        low, high = cluster_bootstrap_ci(backtest.model_errors, backtest.person_ids, seed=seed)
+        coefficients = bootstrap_translation(transitions, persistence, seed=seed)
+        intervals = cluster_bootstrap(
+            backtest.model_errors, backtest.person_ids, covered=backtest.covered, seed=seed
+        )
 
         results.append(
             MetricResult(
@@ -187,12 +254,23 @@ def train_all(paths: DataPaths, *, seed: int = SEED) -> tuple[RunLog, list[Metri
                 intercepts=model.intercepts,
                 direction_slopes=fit_direction_specific_slopes(transitions, persistence),
                 mae=backtest.mae,
-                mae_ci=(low, high),
+                mae_ci=intervals["mae"],
                 baseline_mae=backtest.baseline_mae(),
                 shuffled_mae=backtest.shuffled_mae,
+                shuffled_mae_band=(
+                    float(np.nanquantile(backtest.shuffled_maes, 0.05)),
+                    float(np.nanquantile(backtest.shuffled_maes, 0.95)),
+                ),
+                n_permutations=backtest.shuffled_maes.size,
                 n_evaluated=backtest.n,
                 n_folds=len(backtest.folds),
                 residual_sd=model.residual_sd,
+                rmse=backtest.rmse,
+                rmse_ci=intervals["rmse"],
+                coverage80=backtest.coverage,
+                coverage80_ci=intervals["coverage"],
+                coefficient_bootstrap=coefficients.summary(),
+                interval_coverage=interval_diagnostics(transitions, model).records(),
             )
         )
         selection_rows.extend(
@@ -256,12 +334,7 @@ def compare_to_committed(results: list[MetricResult], committed: dict[str, Any])
 
 
 def _contract_hashes(paths: DataPaths) -> dict[str, str]:
-    hashes: dict[str, str] = {}
-    if paths.contracts.is_dir():
-        for sidecar in sorted(paths.contracts.glob("*.json")):
-            payload = json.loads(sidecar.read_text(encoding="utf-8"))
-            hashes[sidecar.stem] = payload.get("content_hash", "")
-    return hashes
+    return committed_hashes(paths.contracts)
 
 
 def _git(*args: str) -> str:
@@ -22,11 +22,14 @@ sophisticated and be less true.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 import numpy as np
 import polars as pl
 
+from hoopslab.eval.resample import person_codes, resample_counts
+
 log = logging.getLogger(__name__)
 
 #: Age is modelled with a quadratic rather than a natural cubic spline. Over
@@ -35,6 +38,10 @@ log = logging.getLogger(__name__)
 #: which matters when the second stage has a few hundred rows.
 AGE_REFERENCE = 27.0
 
+#: Quantiles kept of each coefficient's bootstrap distribution: enough to read
+#: any conventional interval, and its skew, straight from the run log.
+BOOTSTRAP_QUANTILES = (0.005, 0.025, 0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95, 0.975, 0.995)
+
 
 @dataclass
 class PersistenceModel:
@@ -174,7 +181,7 @@ def fit_translation(
         directions=sorted(transitions["direction"].unique().to_list()),
     )
 
-    design, columns = _transition_design(transitions, model.directions, persistence)
+    design, columns = transition_design(transitions, model.directions, persistence)
     response = transitions["z_target"].to_numpy()
 
     coefficients, *_ = np.linalg.lstsq(design, response, rcond=None)
@@ -194,7 +201,324 @@ def fit_translation(
     return model
 
 
-def _transition_design(
+def fit_persistence_all(panel: pl.DataFrame, metrics: Sequence[str]) -> dict[str, PersistenceModel]:
+    """Stage 1 for every metric at once, from one persistence panel.
+
+    Each metric's design is the same four columns — intercept, age, its
+    square, log minutes — plus the metric's own standing, so the shared four
+    are factorised once and every metric is solved against that one
+    factorisation. The answer is each metric's own least-squares fit, as
+    :func:`fit_persistence` gives it.
+    """
+    models: dict[str, PersistenceModel] = {}
+    masks = _row_masks(
+        panel,
+        {
+            metric: pl.col(f"z_from_{metric}").is_not_null()
+            & pl.col(f"z_to_{metric}").is_not_null()
+            for metric in metrics
+        },
+    )
+    for mask, group in masks:
+        frame = panel.filter(pl.Series(mask))
+        if frame.height < 100:
+            raise ValueError(
+                f"persistence fit for {group[0]} has only {frame.height} rows; "
+                "the two-stage design depends on this stage being large"
+            )
+
+        log_minutes = frame["log_minutes"].to_numpy()
+        log_minutes_mean = float(log_minutes.mean())
+        centred_age = frame["age"].to_numpy() - AGE_REFERENCE
+        shared = np.column_stack(
+            [np.ones(frame.height), centred_age, centred_age**2, log_minutes - log_minutes_mean]
+        )
+        response = np.column_stack([frame[f"z_to_{m}"].to_numpy() for m in group])
+        slopes, coefficients, residual_ss = _solve_with_shared_columns(
+            shared, np.column_stack([frame[f"z_from_{m}"].to_numpy() for m in group]), response
+        )
+        total_ss = ((response - response.mean(axis=0)) ** 2).sum(axis=0)
+
+        for j, metric in enumerate(group):
+            models[metric] = PersistenceModel(
+                metric=metric,
+                coefficients={
+                    "intercept": float(coefficients[0, j]),
+                    "z": float(slopes[j]),
+                    "age": float(coefficients[1, j]),
+                    "age_sq": float(coefficients[2, j]),
+                    "log_minutes": float(coefficients[3, j]),
+                    "log_minutes_mean": log_minutes_mean,
+                },
+                n_train=frame.height,
+                r_squared=1.0 - residual_ss[j] / total_ss[j] if total_ss[j] > 0 else 0.0,
+            )
+    return models
+
+
+def fit_translation_all(
+    transitions: dict[str, pl.DataFrame], persistence: dict[str, PersistenceModel]
+) -> dict[str, TranslationModel]:
+    """Stage 2 for every metric at once, one factorisation per set of rows.
+
+    The direction intercepts, log minutes and gap are the same columns for
+    every metric fitted on the same transitions; only the persisted standing
+    and the response are the metric's own. Metrics whose frames hold the same
+    transitions share a factorisation, and each gets exactly the fit
+    :func:`fit_translation` would give it.
+    """
+    key = ["person_id", "source_season_id", "target_season_id"]
+    groups: list[tuple[pl.DataFrame, dict[str, pl.DataFrame]]] = []
+    for metric, frame in transitions.items():
+        ordered = frame.sort(key)
+        for rows, members in groups:
+            if rows.equals(ordered.select(key)):
+                members[metric] = ordered
+                break
+        else:
+            groups.append((ordered.select(key), {metric: ordered}))
+
+    models: dict[str, TranslationModel] = {}
+    for _, members in groups:
+        first = next(iter(members.values()))
+        directions = sorted(first["direction"].unique().to_list())
+        observed = first["direction"].to_list()
+        shared = np.column_stack(
+            [
+                *(
+                    np.array([d == direction for d in observed], dtype=float)
+                    for direction in directions
+                ),
+                first["log_source_minutes"].to_numpy(),
+                first["gap_seasons"].to_numpy().astype(float),
+            ]
+        )
+        persisted = np.column_stack(
+            [
+                persistence[metric].predict(
+                    frame["z_source"].to_numpy(),
+                    frame["age_at_source"].to_numpy(),
+                    frame["log_source_minutes"].to_numpy(),
+                )
+                for metric, frame in members.items()
+            ]
+        )
+        response = np.column_stack([frame["z_target"].to_numpy() for frame in members.values()])
+        slopes, coefficients, residual_ss = _solve_with_shared_columns(shared, persisted, response)
+
+        # Degrees-of-freedom corrected, as in ``fit_translation``.
+        dof = max(first.height - (shared.shape[1] + 1), 1)
+        for j, metric in enumerate(members):
+            models[metric] = TranslationModel(
+                metric=metric,
+                persistence=persistence[metric],
+                directions=directions,
+                intercepts={d: float(coefficients[i, j]) for i, d in enumerate(directions)},
+                beta=float(slopes[j]),
+                gamma_log_minutes=float(coefficients[len(directions), j]),
+                eta_gap=float(coefficients[len(directions) + 1, j]),
+                residual_sd=float(np.sqrt(residual_ss[j] / dof)),
+                n_train=first.height,
+            )
+    return {metric: models[metric] for metric in transitions}
+
+
+def _solve_with_shared_columns(
+    shared: np.ndarray, own: np.ndarray, response: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Least squares of each response column on ``shared`` plus its own column of ``own``.
+
+    ``shared`` is factorised once. Projecting it out of every ``own`` and
+    ``response`` column in one product leaves a one-regressor fit per column
+    (Frisch-Waugh-Lovell), and the shared coefficients follow from the same
+    factor. Returns the own slopes, the shared coefficients with one column per
+    response, and the residual sums of squares.
+
+    A rank-deficient design (a subset whose gaps are all one season, say, or
+    whose ages do not vary) has no unique solution for the factor to give. It
+    is fitted column by column with ``lstsq`` instead, which returns the same
+    minimum-norm solution the single-metric fits do.
+    """
+    q, r = np.linalg.qr(shared)
+    own_off = own - q @ (q.T @ own)
+    own_ss = (own_off**2).sum(axis=0)
+    eps = np.finfo(np.float64).eps
+    if np.linalg.cond(r) * eps < 1 and np.all(own_ss > eps * (own**2).sum(axis=0)):
+        response_off = response - q @ (q.T @ response)
+        slopes = (own_off * response_off).sum(axis=0) / own_ss
+        coefficients = np.linalg.solve(r, q.T @ (response - own * slopes))
+        residual_ss = ((response_off - own_off * slopes) ** 2).sum(axis=0)
+        return slopes, coefficients, residual_ss
+
+    slopes = np.empty(response.shape[1])
+    coefficients = np.empty((shared.shape[1], response.shape[1]))
+    residual_ss = np.empty(response.shape[1])
+    for j in range(response.shape[1]):
+        design = np.column_stack([own[:, j], shared])
+        solution, *_ = np.linalg.lstsq(design, response[:, j], rcond=None)
+        slopes[j], coefficients[:, j] = solution[0], solution[1:]
+        residual_ss[j] = ((response[:, j] - design @ solution) ** 2).sum()
+    return slopes, coefficients, residual_ss
+
+
+def _row_masks(
+    frame: pl.DataFrame, conditions: dict[str, pl.Expr]
+) -> list[tuple[np.ndarray, list[str]]]:
+    """Metrics grouped by which rows of ``frame`` they keep."""
+    masks = frame.select(condition.alias(name) for name, condition in conditions.items())
+    groups: dict[bytes, tuple[np.ndarray, list[str]]] = {}
+    for name in conditions:
+        mask = masks[name].to_numpy()
+        groups.setdefault(mask.tobytes(), (mask, []))[1].append(name)
+    return list(groups.values())
+
+
+@dataclass
+class CoefficientBootstrap:
+    """Player-clustered bootstrap distribution of the stage-2 coefficients."""
+
+    columns: list[str]
+    #: Full-sample estimates, in ``columns`` order.
+    estimates: np.ndarray
+    #: One row per resample. An intercept is NaN in a resample that drew no
+    #: player from its direction, since it is not estimable there.
+    draws: np.ndarray
+
+    def interval(self, column: str, level: float = 0.95) -> tuple[float, float]:
+        values = self.draws[:, self.columns.index(column)]
+        tail = (1.0 - level) / 2
+        return (
+            float(np.nanquantile(values, tail)),
+            float(np.nanquantile(values, 1 - tail)),
+        )
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Per coefficient: estimate, bootstrap spread and quantiles, for the run log."""
+        summary: dict[str, dict[str, float]] = {}
+        for j, column in enumerate(self.columns):
+            values = self.draws[:, j]
+            values = values[~np.isnan(values)]
+            summary[column] = {
+                "estimate": float(self.estimates[j]),
+                "n_draws": int(values.size),
+                "mean": float(values.mean()),
+                "sd": float(values.std(ddof=1)),
+                **{
+                    f"q{q:g}": float(v)
+                    for q, v in zip(
+                        BOOTSTRAP_QUANTILES, np.quantile(values, BOOTSTRAP_QUANTILES), strict=True
+                    )
+                },
+            }
+        return summary
+
+
+def bootstrap_translation(
+    transitions: pl.DataFrame,
+    persistence: PersistenceModel,
+    *,
+    seed: int,
+    n_boot: int = 2000,
+) -> CoefficientBootstrap:
+    """The cluster bootstrap this module's docstring argues for, resampling players.
+
+    Refitting least squares on thousands of resampled frames is unnecessary: a
+    resample only reweights players, so each player's ``X'X`` and ``X'y`` are
+    summed once, and each replicate is a weighted sum of those blocks and a
+    solve of a system the size of the coefficient vector. The result is the
+    fit ``fit_translation`` would give on the resampled rows.
+
+    Stage 1 is held fixed. It is estimated from thousands of same-league pairs
+    and its uncertainty is small beside stage 2's few hundred switches.
+    """
+    directions = sorted(transitions["direction"].unique().to_list())
+    design, columns = transition_design(transitions, directions, persistence)
+    response = transitions["z_target"].to_numpy()
+    codes, n_people = person_codes(transitions["person_id"].to_list())
+
+    gram = np.zeros((n_people, len(columns), len(columns)))
+    np.add.at(gram, codes, design[:, :, None] * design[:, None, :])
+    moment = np.zeros((n_people, len(columns)))
+    np.add.at(moment, codes, design * response[:, None])
+
+    n_directions = len(directions)
+    blocks: list[np.ndarray] = []
+    for counts in resample_counts(n_people, n_boot, seed=seed):
+        weights = counts.astype(float)
+        xtx = np.tensordot(weights, gram, axes=1)
+        xty = weights @ moment
+        # The pseudo-inverse gives the least-squares answer even when a
+        # resample leaves a direction's indicator column empty.
+        solution = (np.linalg.pinv(xtx, hermitian=True) @ xty[:, :, None])[:, :, 0]
+        absent = np.diagonal(xtx, axis1=1, axis2=2)[:, :n_directions] == 0
+        solution[:, :n_directions][absent] = np.nan
+        blocks.append(solution)
+
+    estimates, *_ = np.linalg.lstsq(design, response, rcond=None)
+    return CoefficientBootstrap(columns=columns, estimates=estimates, draws=np.vstack(blocks))
+
+
+@dataclass
+class NormalEquations:
+    """Stage 2's sufficient statistics: ``X'X``, ``X'y``, ``y'y`` and the row count.
+
+    Every field is a sum over rows, so the statistics of two disjoint row sets
+    add and those of a subset subtract. A walk-forward backtest can therefore
+    grow one training set a season at a time and take each fold's players out
+    of it, instead of rebuilding and refitting a design per fold.
+    """
+
+    directions: list[str]
+    xtx: np.ndarray
+    xty: np.ndarray
+    yty: float
+    n: int
+
+    def __add__(self, other: NormalEquations) -> NormalEquations:
+        return NormalEquations(
+            self.directions,
+            self.xtx + other.xtx,
+            self.xty + other.xty,
+            self.yty + other.yty,
+            self.n + other.n,
+        )
+
+    def __sub__(self, other: NormalEquations) -> NormalEquations:
+        return NormalEquations(
+            self.directions,
+            self.xtx - other.xtx,
+            self.xty - other.xty,
+            self.yty - other.yty,
+            self.n - other.n,
+        )
+
+    def solve(self, persistence: PersistenceModel, metric: str) -> TranslationModel:
+        """The model ``fit_translation`` would fit on the rows summed here.
+
+        Directions with no rows get no intercept, exactly as a direction absent
+        from ``fit_translation``'s input does.
+        """
+        present = np.diagonal(self.xtx)[: len(self.directions)] > 0
+        kept = np.concatenate([present, np.ones(self.xtx.shape[0] - present.size, dtype=bool)])
+        coefficients = np.linalg.solve(self.xtx[np.ix_(kept, kept)], self.xty[kept])
+        residual_ss = max(self.yty - float(coefficients @ self.xty[kept]), 0.0)
+
+        directions = [d for d, on in zip(self.directions, present, strict=True) if on]
+        alphas, (beta, gamma_log_minutes, eta_gap) = coefficients[:-3], coefficients[-3:]
+        return TranslationModel(
+            metric=metric,
+            persistence=persistence,
+            directions=directions,
+            intercepts={d: float(a) for d, a in zip(directions, alphas, strict=True)},
+            beta=float(beta),
+            gamma_log_minutes=float(gamma_log_minutes),
+            eta_gap=float(eta_gap),
+            residual_sd=float(np.sqrt(residual_ss / max(self.n - len(coefficients), 1))),
+            n_train=self.n,
+        )
+
+
+def transition_design(
     transitions: pl.DataFrame, directions: list[str], persistence: PersistenceModel
 ) -> tuple[np.ndarray, list[str]]:
     persisted = persistence.predict(
@@ -59,6 +59,21 @@ class DataPaths:
         """Per-table row counts, dtypes, null rates and content hashes."""
         return self.gold / "_contracts"
 
+    @property
+    def identity_store(self) -> Path:
+        """Every identity resolution, versioned. Committed with gold so it survives a clone."""
+        return self.gold / "_identity_store"
+
+    @property
+    def models(self) -> Path:
+        """Fitted models keyed on the gold contract hashes. Gitignored, regenerable."""
+        return self.data / "models"
+
+    @property
+    def pipeline(self) -> Path:
+        """State and reports of ``hoopslab run``. Gitignored, regenerable."""
+        return self.data / "pipeline"
+
     @property
     def crosswalk(self) -> Path:
         """Manual player-identity overrides that automated matching cannot resolve."""
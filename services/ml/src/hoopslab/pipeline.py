@@ -0,0 +1,464 @@
+"""One command from bronze to a servable artefact, redoing only what changed.
+
+The path to an export is ``build`` → ``train`` → ``export``, with
+``report-eval`` alongside, and each is its own CLI command that re-reads gold
+and redoes whatever upstream work it needs: the export refits the archetypes
+even when nothing they read has moved. ``hoopslab run`` models the same steps
+as a graph of stages instead, each declaring
+
+* what it runs **after** — the stages whose outputs it reads;
+* its **inputs**, as a small JSON-able fingerprint: content hashes of the
+  tables, run logs and code it depends on, and the seed;
+* its **outputs**, the files it wrote, returned by the stage itself.
+
+A stage is skipped when the hash of its inputs matches the one recorded the
+last time it ran and every output it wrote then is still on disk. Inputs are
+fingerprinted when the stage is about to start, after its upstream has
+finished, so a stage whose upstream reran but produced identical content is
+still skipped — the contract hashes are over content, not timestamps.
+
+Stages whose upstream is done run concurrently on a thread pool. The heavy
+work inside them is numpy and polars, both of which release the GIL, so the
+archetype fit genuinely runs alongside the translation fits rather than
+taking turns with them. A failed stage blocks everything downstream of it and
+nothing else.
+
+The graph is not the straight line the commands suggest. The archetypes read
+only ``player_seasons`` and never the translation fits, so ``roles`` hangs off
+``build`` directly; ``report-eval`` reads the run log and the fitted models but
+not the SQL artefact, so it runs beside ``export`` rather than after it.
+
+State is one readable JSON file under ``data/pipeline``. Deleting it only
+costs the next run its skips.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from collections.abc import Callable, Collection
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal
+
+from hoopslab.config import SEED
+from hoopslab.paths import DataPaths
+
+log = logging.getLogger(__name__)
+
+#: Bumped when the state layout changes; an older file is then ignored.
+STATE_VERSION = 1
+
+STATE_NAME = "state.json"
+
+#: The widest point of the real graph is two stages; a little headroom costs
+#: nothing and lets a larger graph use it.
+DEFAULT_WORKERS = 4
+
+StageStatus = Literal["ran", "skipped", "failed", "blocked"]
+
+#: Outcomes that stop everything downstream.
+_BROKEN = ("failed", "blocked")
+
+
+@dataclass(frozen=True)
+class Context:
+    """What every stage is handed."""
+
+    paths: DataPaths
+    seed: int = SEED
+    #: A key of ``crosswalk.MATCH_POLICIES``.
+    match_policy: str = "default"
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One step of the pipeline.
+
+    ``run`` returns the paths it wrote. ``unavailable``, when given, returns a
+    reason the stage cannot run in this checkout; it is then skipped and
+    whatever it would have written is used as it stands.
+    """
+
+    name: str
+    run: Callable[[Context], list[Path]]
+    inputs: Callable[[Context], dict[str, Any]]
+    after: tuple[str, ...] = ()
+    unavailable: Callable[[Context], str | None] | None = None
+
+
+@dataclass
+class StageOutcome:
+    name: str
+    status: StageStatus
+    seconds: float = 0.0
+    input_hash: str | None = None
+    detail: str = ""
+
+    def render(self) -> str:
+        line = f"  {self.name:<12} {self.status:<8} {self.seconds:>7.1f}s"
+        return f"{line}  {self.detail}" if self.detail else line
+
+
+@dataclass
+class PipelineReport:
+    outcomes: list[StageOutcome]
+    seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return all(o.status in ("ran", "skipped") for o in self.outcomes)
+
+    def status(self, name: str) -> StageStatus:
+        return next(o.status for o in self.outcomes if o.name == name)
+
+    def render(self) -> str:
+        lines = [outcome.render() for outcome in self.outcomes]
+        ran = sum(o.status == "ran" for o in self.outcomes)
+        skipped = sum(o.status == "skipped" for o in self.outcomes)
+        lines.append(f"  {ran} ran, {skipped} skipped in {self.seconds:.1f}s wall clock")
+        return "\n".join(lines)
+
+
+def input_hash(inputs: dict[str, Any]) -> str:
+    payload = json.dumps(inputs, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class PipelineState:
+    """The input hash and outputs of each stage's last successful run."""
+
+    def __init__(self, path: Path, root: Path) -> None:
+        self.path = path
+        self.root = root
+        self.stages: dict[str, dict[str, Any]] = {}
+        if path.is_file():
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            if payload.get("version") == STATE_VERSION:
+                self.stages = payload["stages"]
+
+    @classmethod
+    def for_paths(cls, paths: DataPaths) -> PipelineState:
+        return cls(paths.pipeline / STATE_NAME, paths.root)
+
+    def is_current(self, name: str, digest: str) -> bool:
+        entry = self.stages.get(name)
+        if entry is None or entry["input_hash"] != digest:
+            return False
+        return all((self.root / output).exists() for output in entry["outputs"])
+
+    def record(self, name: str, digest: str, outputs: list[Path], seconds: float) -> None:
+        self.stages[name] = {
+            "input_hash": digest,
+            "outputs": sorted(self._relative(p) for p in outputs),
+            "finished_at": datetime.now(UTC).isoformat(),
+            "seconds": round(seconds, 2),
+        }
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        staging = self.path.with_suffix(".tmp")
+        payload = {"version": STATE_VERSION, "stages": self.stages}
+        staging.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        staging.replace(self.path)
+
+    def _relative(self, path: Path) -> str:
+        try:
+            return path.resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            return str(path)
+
+
+def order_stages(stages: list[Stage], targets: Collection[str] | None = None) -> list[Stage]:
+    """The stages needed for ``targets`` (all of them by default), upstream first.
+
+    Raises ``ValueError`` on an unknown name or a cycle.
+    """
+    by_name = {stage.name: stage for stage in stages}
+    unknown = sorted({*(targets or ()), *(d for s in stages for d in s.after)} - by_name.keys())
+    if unknown:
+        raise ValueError(f"unknown pipeline stages: {', '.join(unknown)}")
+
+    ordered: list[Stage] = []
+    visiting: set[str] = set()
+
+    def visit(name: str) -> None:
+        if any(stage.name == name for stage in ordered):
+            return
+        if name in visiting:
+            raise ValueError(f"pipeline stages form a cycle through {name}")
+        visiting.add(name)
+        for upstream in by_name[name].after:
+            visit(upstream)
+        visiting.discard(name)
+        ordered.append(by_name[name])
+
+    for name in targets or by_name:
+        visit(name)
+    return ordered
+
+
+def run_pipeline(
+    context: Context,
+    stages: list[Stage] | None = None,
+    *,
+    targets: Collection[str] | None = None,
+    force: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    state: PipelineState | None = None,
+) -> PipelineReport:
+    """Bring ``targets`` and everything upstream of them up to date.
+
+    ``force`` reruns every selected stage whatever its recorded inputs.
+    """
+    started = time.perf_counter()
+    selected = order_stages(STAGES if stages is None else stages, targets)
+    state = state or PipelineState.for_paths(context.paths)
+
+    pending = list(selected)
+    done: dict[str, StageOutcome] = {}
+    running: dict[Future[tuple[StageOutcome, list[Path]]], Stage] = {}
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="stage") as pool:
+        while pending or running:
+            # ``pending`` is in dependency order, so one sweep settles every
+            # stage a failure blocks, however far downstream.
+            for stage in list(pending):
+                upstream = [done.get(name) for name in stage.after]
+                if any(outcome is None for outcome in upstream):
+                    continue
+                pending.remove(stage)
+                broken = [o.name for o in upstream if o is not None and o.status in _BROKEN]
+                if broken:
+                    done[stage.name] = StageOutcome(
+                        stage.name, "blocked", detail=f"after {', '.join(broken)}"
+                    )
+                    continue
+                future = pool.submit(_execute, stage, context, state, force)
+                running[future] = stage
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                outcome, outputs = future.result()
+                if outcome.status == "ran" and outcome.input_hash is not None:
+                    state.record(stage.name, outcome.input_hash, outputs, outcome.seconds)
+                    state.save()
+                done[stage.name] = outcome
+
+    return PipelineReport(
+        outcomes=[done[stage.name] for stage in selected],
+        seconds=time.perf_counter() - started,
+    )
+
+
+def _execute(
+    stage: Stage, context: Context, state: PipelineState, force: bool
+) -> tuple[StageOutcome, list[Path]]:
+    started = time.perf_counter()
+    digest: str | None = None
+    try:
+        reason = stage.unavailable(context) if stage.unavailable is not None else None
+        if reason:
+            return StageOutcome(stage.name, "skipped", detail=reason), []
+
+        digest = input_hash(stage.inputs(context))
+        if not force and state.is_current(stage.name, digest):
+            return StageOutcome(
+                stage.name, "skipped", input_hash=digest, detail="inputs unchanged"
+            ), []
+
+        log.info("running stage %s", stage.name)
+        outputs = stage.run(context)
+    except Exception as exc:
+        log.exception("stage %s failed", stage.name)
+        failed = StageOutcome(stage.name, "failed", input_hash=digest, detail=f"{exc!r}")
+        failed.seconds = time.perf_counter() - started
+        return failed, []
+
+    seconds = time.perf_counter() - started
+    return StageOutcome(stage.name, "ran", seconds, digest), outputs
+
+
+# ---------------------------------------------------------------- fingerprints
+
+_PACKAGE_ROOT = Path(__file__).parent
+
+
+def source_digest(*packages: str, exclude: tuple[str, ...] = ()) -> str:
+    """Fingerprint of the Python source under the named ``hoopslab`` subpackages.
+
+    With no names it covers the whole package, less the subpackages and
+    top-level modules named in ``exclude``. The later stages use that: each
+    runs code from most of the package (gold keys, contracts, names, the
+    diagnostics), and a list of subpackages kept by hand falls behind it.
+    """
+    roots = [_PACKAGE_ROOT / package for package in packages] or [_PACKAGE_ROOT]
+    digest = hashlib.sha256()
+    for root in roots:
+        for path in sorted(root.rglob("*.py")):
+            relative = path.relative_to(_PACKAGE_ROOT)
+            if relative.parts[0] in exclude:
+                continue
+            digest.update(relative.as_posix().encode("utf-8"))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def tree_digest(directory: Path) -> str | None:
+    """Fingerprint of every file under ``directory``, or ``None`` if it is absent."""
+    if not directory.is_dir():
+        return None
+    digest = hashlib.sha256()
+    for path in sorted(p for p in directory.rglob("*") if p.is_file()):
+        digest.update(path.relative_to(directory).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _gold_hashes(context: Context) -> dict[str, str]:
+    from hoopslab.validate.contracts import committed_hashes
+
+    return committed_hashes(context.paths.contracts)
+
+
+def _run_digest(context: Context) -> str | None:
+    from hoopslab.models.train import latest_run
+
+    run = latest_run(context.paths)
+    return None if run is None else input_hash(run)
+
+
+def _roles_dir(paths: DataPaths) -> Path:
+    return paths.models / "roles"
+
+
+# ---------------------------------------------------------------------- stages
+
+
+def _no_bronze(context: Context) -> str | None:
+    bronze = context.paths.bronze
+    if bronze.is_dir() and any(
+        not path.relative_to(bronze).parts[0].startswith("_")
+        for path in bronze.glob("*/*/*.parquet")
+    ):
+        return None
+    return "no bronze payloads; committed gold is used as it stands"
+
+
+def _build_inputs(context: Context) -> dict[str, Any]:
+    from hoopslab.io.bronze import BronzeCache
+    from hoopslab.transform import incremental
+
+    overrides = context.paths.crosswalk / "overrides.csv"
+    return {
+        "bronze": incremental.season_signatures(BronzeCache(context.paths.bronze)),
+        "overrides": (
+            hashlib.sha256(overrides.read_bytes()).hexdigest() if overrides.is_file() else None
+        ),
+        "code": incremental.code_digest(),
+        "match_policy": context.match_policy,
+    }
+
+
+def _build(context: Context) -> list[Path]:
+    from hoopslab.transform.build import GOLD_TABLES, build_gold, write_gold
+    from hoopslab.transform.crosswalk import MATCH_POLICIES
+
+    paths = context.paths
+    result = build_gold(paths, policy=MATCH_POLICIES[context.match_policy])
+    write_gold(result, paths)
+    return [
+        *(paths.gold / f"{name}.parquet" for name in GOLD_TABLES),
+        *(paths.contracts / f"{name}.json" for name in GOLD_TABLES),
+    ]
+
+
+def _train_inputs(context: Context) -> dict[str, Any]:
+    return {
+        "gold": _gold_hashes(context),
+        "seed": context.seed,
+        "code": source_digest(exclude=("serve", "cli.py")),
+    }
+
+
+def _train(context: Context) -> list[Path]:
+    from hoopslab.models.train import train_all, write_run
+
+    run, _ = train_all(context.paths, seed=context.seed)
+    return [write_run(run, context.paths)]
+
+
+def _roles_inputs(context: Context) -> dict[str, Any]:
+    return {
+        "player_seasons": _gold_hashes(context).get("player_seasons"),
+        "seed": context.seed,
+        "code": source_digest("models"),
+    }
+
+
+def _roles(context: Context) -> list[Path]:
+    import polars as pl
+
+    from hoopslab.models.roles import fit_roles, save_roles
+
+    player_seasons = pl.read_parquet(context.paths.gold / "player_seasons.parquet")
+    result = fit_roles(player_seasons, seed=context.seed)
+    return [save_roles(result, _roles_dir(context.paths))]
+
+
+def _export_inputs(context: Context) -> dict[str, Any]:
+    return {
+        "gold": _gold_hashes(context),
+        "run": _run_digest(context),
+        "roles": tree_digest(_roles_dir(context.paths)),
+        "llm_cache": tree_digest(context.paths.llm_cache),
+        "code": source_digest(exclude=("cli.py",)),
+    }
+
+
+def _export(context: Context) -> list[Path]:
+    from hoopslab.models.roles import load_roles
+    from hoopslab.serve.d1_export import build_export
+
+    roles = load_roles(_roles_dir(context.paths))
+    return [build_export(context.paths, roles=roles).path]
+
+
+def _report_eval_inputs(context: Context) -> dict[str, Any]:
+    return {
+        "gold": _gold_hashes(context),
+        "run": _run_digest(context),
+        "llm_cache": tree_digest(context.paths.llm_cache),
+        "code": source_digest(exclude=("serve", "cli.py")),
+    }
+
+
+def _report_eval(context: Context) -> list[Path]:
+    from hoopslab.llm.harness import run_harness
+
+    report = run_harness(context.paths)
+    if not report.records:
+        raise RuntimeError(
+            "nothing to score; populate the response cache with "
+            "`hoopslab report-eval --refresh-cache`"
+        )
+    path = context.paths.pipeline / "report-eval.txt"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(report.render() + "\n", encoding="utf-8")
+    return [path]
+
+
+STAGES: list[Stage] = [
+    Stage("build", _build, _build_inputs, unavailable=_no_bronze),
+    Stage("train", _train, _train_inputs, after=("build",)),
+    Stage("roles", _roles, _roles_inputs, after=("build",)),
+    Stage("export", _export, _export_inputs, after=("train", "roles")),
+    Stage("report-eval", _report_eval, _report_eval_inputs, after=("train",)),
+]
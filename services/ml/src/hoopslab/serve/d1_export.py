@@ -22,21 +22,18 @@ from typing import Any
 import numpy as np
 import polars as pl
 
-from hoopslab.features.translation import (
-    TARGET_METRICS,
-    attach_moments,
-    build_persistence_frame,
-    build_transition_frame,
-    league_season_moments,
-)
+from hoopslab.eval.diagnostics import interval_diagnostics
+from hoopslab.features.translation import TARGET_METRICS, transition_frames
 from hoopslab.models import baselines
 from hoopslab.models.roles import MODEL_VERSION as ROLES_VERSION
 from hoopslab.models.roles import STABILITY_FLOOR, RolesResult, fit_roles
+from hoopslab.models.store import FittedModelStore, load_or_fit_all
 from hoopslab.models.train import MODEL_NAME, latest_run
-from hoopslab.models.translation import fit_persistence, fit_translation
 from hoopslab.paths import DataPaths
 from hoopslab.seasons import Season
 from hoopslab.serve import sql
+from hoopslab.transform.keys import decode, load_gold
+from hoopslab.validate.contracts import committed_hashes
 
 log = logging.getLogger(__name__)
 
@@ -79,23 +76,28 @@ def snapshot_id(paths: DataPaths) -> str:
     unchanged data yields the same id and every cache key stays valid.
     """
     digest = hashlib.sha256()
-    for sidecar in sorted(paths.contracts.glob("*.json")):
-        payload = json.loads(sidecar.read_text(encoding="utf-8"))
-        digest.update(payload.get("content_hash", "").encode("ascii"))
+    for content_hash in committed_hashes(paths.contracts).values():
+        digest.update(content_hash.encode("ascii"))
     return digest.hexdigest()[:12]
 
 
-def build_export(paths: DataPaths) -> ExportResult:
-    player_seasons = pl.read_parquet(paths.gold / "player_seasons.parquet")
-    persons = pl.read_parquet(paths.gold / "persons.parquet")
-    identities = pl.read_parquet(paths.gold / "player_identities.parquet")
-    pairs = pl.read_parquet(paths.gold / "transition_pairs.parquet")
+def build_export(paths: DataPaths, *, roles: RolesResult | None = None) -> ExportResult:
+    """Write ``data/d1/load.sql`` from committed gold and the latest run.
+
+    ``roles`` is an archetype fit already made on this gold, which the pipeline
+    runner passes in so the export does not repeat it; without one the roles
+    are fitted here.
+    """
+    player_seasons, persons, identities, pairs = load_gold(
+        paths, "player_seasons", "persons", "player_identities", "transition_pairs"
+    )
 
     run = latest_run(paths)
     if run is None:
         raise FileNotFoundError("No committed run log. Run `hoopslab train` first.")
 
     snapshot = snapshot_id(paths)
+    store = FittedModelStore.for_paths(paths, model_version=run["model_version"])
     statements: list[str] = [f"DELETE FROM {t};" for t in reversed(TABLES_IN_LOAD_ORDER)]
     counts: dict[str, int] = {}
 
@@ -131,21 +133,22 @@ def build_export(paths: DataPaths) -> ExportResult:
     emit("player_seasons", *_player_season_rows(player_seasons, snapshot))
 
     model_rows, prediction_rows, evaluation_rows, selection_rows = _model_rows(
-        player_seasons, pairs, run
+        player_seasons, pairs, run, store=store
     )
     emit("model_versions", *model_rows)
     emit("translation_predictions", *prediction_rows)
     emit("model_evaluations", *evaluation_rows)
     emit("selection_summaries", *selection_rows)
 
-    roles = fit_roles(player_seasons)
+    if roles is None:
+        roles = fit_roles(player_seasons)
     for table, columns, rows in _roles_rows(roles, persons):
         emit(table, columns, rows)
 
     emit("player_reports", *_report_rows(paths, snapshot))
     emit(
         "hypothetical_projections",
-        *_hypothetical_rows(player_seasons, pairs, run["model_version"], snapshot),
+        *_hypothetical_rows(player_seasons, pairs, run["model_version"], snapshot, store=store),
     )
 
     out_dir = paths.data / "d1"
@@ -161,7 +164,7 @@ def _season_rows(player_seasons: pl.DataFrame) -> tuple[list[str], list[list[Any
     for record in (
         player_seasons.select("season_id", "league", "start_year", "season_order")
         .unique()
-        .sort("season_order")
+        .sort("season_order", "season_id")
         .iter_rows(named=True)
     ):
         season = Season.parse(record["season_id"])
@@ -253,8 +256,14 @@ def _model_rows(
     player_seasons: pl.DataFrame,
     pairs: pl.DataFrame,
     run: dict[str, Any],
+    *,
+    store: FittedModelStore | None = None,
 ) -> tuple[tuple[list[str], list[list[Any]]], ...]:
-    """Refit and score every observed transition, so predictions carry intervals."""
+    """Score every observed transition, so predictions carry intervals.
+
+    Fits come from ``store`` when one is given. The fixture passes none,
+    because it scores a slice of the pairs that the store's key cannot express.
+    """
     model_version = run["model_version"]
 
     version_rows: list[list[Any]] = []
@@ -280,18 +289,18 @@ def _model_rows(
         ]
     )
 
-    for metric in TARGET_METRICS:
-        moments = league_season_moments(player_seasons, metric)
-        transitions = attach_moments(
-            build_transition_frame(pairs, player_seasons, metric), moments, "target_season_id"
-        ).filter(pl.col("target_sd").is_not_null() & (pl.col("target_sd") > 0))
+    frames = transition_frames(pairs, player_seasons, TARGET_METRICS)
+    models = load_or_fit_all(player_seasons, frames, store=store)
 
-        persistence = fit_persistence(build_persistence_frame(player_seasons, metric), metric)
-        model = fit_translation(transitions, persistence, metric)
+    for metric, transitions in frames.items():
+        model = models[metric]
 
         predicted = model.predict_rate(transitions)
         pi80 = model.prediction_interval(transitions, level=0.80)
         pi95 = model.prediction_interval(transitions, level=0.95)
+        diagnostics = interval_diagnostics(transitions, model)
+        conformal80 = diagnostics.conformal_interval(transitions, model, level=0.80)
+        conformal95 = diagnostics.conformal_interval(transitions, model, level=0.95)
 
         league_mean = baselines.target_league_mean(transitions).predictions
         z_preserve = baselines.z_preservation(transitions).predictions
@@ -311,6 +320,10 @@ def _model_rows(
                     _round(float(pi80[i, 1]), 5),
                     _round(float(pi95[i, 0]), 5),
                     _round(float(pi95[i, 1]), 5),
+                    _round(float(conformal80[i, 0]), 5),
+                    _round(float(conformal80[i, 1]), 5),
+                    _round(float(conformal95[i, 0]), 5),
+                    _round(float(conformal95[i, 1]), 5),
                     _round(record["target_value"], 5),
                     _round(float(league_mean[i]), 5),
                     _round(float(z_preserve[i]), 5),
@@ -388,6 +401,10 @@ def _model_rows(
                 "pi80_high",
                 "pi95_low",
                 "pi95_high",
+                "conformal80_low",
+                "conformal80_high",
+                "conformal95_low",
+                "conformal95_high",
                 "actual_value",
                 "baseline_league_mean",
                 "baseline_z_preservation",
@@ -473,10 +490,9 @@ def build_fixture(paths: DataPaths, out_path: Path, *, n_persons: int = 60) -> d
     the author's assumptions about the data; a real slice encodes the data, and
     the previous version of this project is a long argument for the difference.
     """
-    player_seasons = pl.read_parquet(paths.gold / "player_seasons.parquet")
-    persons = pl.read_parquet(paths.gold / "persons.parquet")
-    identities = pl.read_parquet(paths.gold / "player_identities.parquet")
-    pairs = pl.read_parquet(paths.gold / "transition_pairs.parquet")
+    player_seasons, persons, identities, pairs = load_gold(
+        paths, "player_seasons", "persons", "player_identities", "transition_pairs"
+    )
 
     run = latest_run(paths)
     if run is None:
@@ -703,6 +719,8 @@ def _hypothetical_rows(
     pairs: pl.DataFrame,
     model_version: str,
     snapshot: str,
+    *,
+    store: FittedModelStore | None = None,
 ) -> tuple[list[str], list[list[Any]]]:
     """Projections for players who have *not* made the move.
 
@@ -733,6 +751,7 @@ def _hypothetical_rows(
             direction=direction,
             target_season_id=target_season_id,
             metric="usg_pct",
+            store=store,
         )
         if frame.is_empty():
             continue
@@ -796,17 +815,26 @@ def _roles_rows(
         for r in roles.cluster_descriptions.iter_rows(named=True)
     ]
 
+    # Three scopes of ten for every player-season: filtered and laid out as
+    # columns, not assembled a row at a time.
     comps = [
-        [
-            r["season_id"],
-            r["person_id"],
-            int(r["rank"]),
-            r["neighbour_person_id"],
-            float(r["distance"]),
-            ROLES_VERSION,
-        ]
-        for r in roles.neighbours.iter_rows(named=True)
-        if r["person_id"] in known and r["neighbour_person_id"] in known
+        list(row)
+        for row in decode(roles.neighbours)
+        .filter(
+            pl.col("person_id").is_in(list(known))
+            & pl.col("neighbour_person_id").is_in(list(known))
+        )
+        .select(
+            "scope",
+            "season_id",
+            "person_id",
+            pl.col("rank").cast(pl.Int64),
+            "neighbour_season_id",
+            "neighbour_person_id",
+            pl.col("distance").cast(pl.Float64),
+            pl.lit(ROLES_VERSION),
+        )
+        .rows()
     ]
 
     shooting = [
@@ -849,9 +877,11 @@ def _roles_rows(
         (
             "player_comps",
             [
+                "scope",
                 "season_id",
                 "person_id",
                 "rank",
+                "neighbour_season_id",
                 "neighbour_person_id",
                 "distance",
                 "model_version",
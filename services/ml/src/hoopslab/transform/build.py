@@ -7,13 +7,14 @@ change to the transform logic without touching a single source.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import polars as pl
 
 from hoopslab.io.bronze import BronzeCache
 from hoopslab.paths import DataPaths
-from hoopslab.transform import crosswalk, gold, silver
+from hoopslab.transform import crosswalk, gold, identity_store, incremental, silver
 from hoopslab.validate import contracts
 
 log = logging.getLogger(__name__)
@@ -36,20 +37,60 @@ class BuildResult:
     tables: dict[str, pl.DataFrame]
     crosswalk_report: crosswalk.CrosswalkReport
     id_space: crosswalk.SharedIdSpaceEvidence
+    plan: incremental.BuildPlan | None = None
+    #: Identities resolved by this build, committed to the store with gold.
+    identity_update: identity_store.Resolution | None = None
+    #: What the incremental state records, saved only once gold is written.
+    state: incremental.PendingState | None = None
 
     def row_counts(self) -> dict[str, int]:
         return {name: frame.height for name, frame in self.tables.items()}
 
 
-def build_gold(paths: DataPaths) -> BuildResult:
+def build_gold(
+    paths: DataPaths,
+    *,
+    full: bool = False,
+    save_state: bool = True,
+    policy: crosswalk.MatchPolicy = crosswalk.DEFAULT_POLICY,
+) -> BuildResult:
+    """Build gold, recomputing only what changed in bronze since the last build.
+
+    ``policy`` is how EuroLeague players are matched; the committed gold is
+    built with the default.
+
+    The state that makes this possible is kept beside silver; see
+    :mod:`hoopslab.transform.incremental`. ``full`` ignores it. Nothing is
+    recorded here: :func:`write_gold` saves the state after the identity store
+    and gold, so a build that is checked and rejected, or fails before it is
+    written, leaves the last state standing. ``save_state=False`` gives a
+    result that never records it.
+    """
     cache = BronzeCache(paths.bronze)
+    state = None if full else incremental.BuildState.load(paths.silver)
+    signatures = incremental.season_signatures(cache)
+    dirty = state.dirty_seasons(signatures) if state is not None else None
+    plan = incremental.BuildPlan(n_seasons=len(signatures), dirty_seasons=dirty)
 
     log.info("reading silver from bronze")
-    nba_players = silver.nba_player_seasons(cache, "NBA")
-    gl_players = silver.nba_player_seasons(cache, "GL")
-    el_players = silver.euroleague_player_seasons(cache)
-
-    official = silver.nba_official_rates(cache, "NBA")
+    silver_frames = {
+        "nba_player_seasons": incremental.refresh_silver(
+            state, "nba_player_seasons", dirty, lambda s: silver.nba_player_seasons(cache, "NBA", s)
+        ),
+        "gl_player_seasons": incremental.refresh_silver(
+            state, "gl_player_seasons", dirty, lambda s: silver.nba_player_seasons(cache, "GL", s)
+        ),
+        "el_player_seasons": incremental.refresh_silver(
+            state, "el_player_seasons", dirty, lambda s: silver.euroleague_player_seasons(cache, s)
+        ),
+        "official_rates": incremental.refresh_silver(
+            state, "official_rates", dirty, lambda s: silver.nba_official_rates(cache, "NBA", s)
+        ),
+    }
+    nba_players = silver_frames["nba_player_seasons"]
+    gl_players = silver_frames["gl_player_seasons"]
+    el_players = silver_frames["el_player_seasons"]
+    official = silver_frames["official_rates"]
 
     log.info(
         "silver: NBA %d, G League %d, EuroLeague %d player-seasons",
@@ -61,19 +102,45 @@ def build_gold(paths: DataPaths) -> BuildResult:
     evidence = crosswalk.verify_shared_id_space(nba_players, gl_players)
 
     overrides = _load_overrides(paths)
-    persons, identities, report = crosswalk.build_crosswalk(
-        nba_players, gl_players, el_players, overrides
+    crosswalk_input = incremental.crosswalk_input_hash(
+        [nba_players, gl_players, el_players], overrides, policy
     )
+    if state is not None and state.crosswalk_input == crosswalk_input:
+        persons = state.gold("persons")
+        identities = state.gold("player_identities")
+        report = state.report()
+        plan.crosswalk_reused = True
+        identity_update = None
+    else:
+        people = crosswalk.People.from_player_seasons(nba_players, gl_players, el_players)
+        store = identity_store.IdentityStore.open(paths.identity_store, policy)
+        identity_update = store.resolve(people, overrides, full=full)
+        persons = identity_update.persons
+        identities = identity_update.identities
+        report = identity_update.report
+        plan.identities_resolved = identity_update.diff.n_resolved
 
     all_players = pl.concat([nba_players, gl_players, el_players], how="vertical_relaxed")
-    # One definition of a team total, for every league, derived from the same
-    # player rows that supply the numerator of each rate.
-    all_teams = silver.team_seasons_from_players(all_players)
 
-    player_seasons = gold.build_player_seasons(all_players, all_teams, identities, official)
-    player_seasons = gold.standardize_within_league_season(player_seasons, STANDARDIZED_METRICS)
+    if (
+        state is not None
+        and dirty is not None
+        and contracts.content_hash(identities) == state.identities
+    ):
+        all_teams, player_seasons, pairs, n_persons = incremental.update_gold(
+            state, all_players, identities, official, dirty, STANDARDIZED_METRICS
+        )
+        plan.gold_incremental = True
+        plan.n_persons_rebuilt = n_persons
+    else:
+        # One definition of a team total, for every league, derived from the same
+        # player rows that supply the numerator of each rate.
+        all_teams = silver.team_seasons_from_players(all_players)
 
-    pairs = gold.build_transition_pairs(player_seasons)
+        player_seasons = gold.build_player_seasons(all_players, all_teams, identities, official)
+        player_seasons = gold.standardize_within_league_season(player_seasons, STANDARDIZED_METRICS)
+
+        pairs = gold.build_transition_pairs(player_seasons)
 
     tables = {
         "persons": persons,
@@ -82,11 +149,24 @@ def build_gold(paths: DataPaths) -> BuildResult:
         "team_seasons": all_teams,
         "transition_pairs": pairs,
     }
-    return BuildResult(tables=tables, crosswalk_report=report, id_space=evidence)
+    return BuildResult(
+        tables=tables,
+        crosswalk_report=report,
+        id_space=evidence,
+        plan=plan,
+        identity_update=identity_update,
+        state=(
+            incremental.PendingState(signatures, crosswalk_input, silver_frames)
+            if save_state
+            else None
+        ),
+    )
 
 
 def write_gold(result: BuildResult, paths: DataPaths, *, write_contracts: bool = True) -> None:
     paths.gold.mkdir(parents=True, exist_ok=True)
+    if result.identity_update is not None:
+        result.identity_update.commit()
 
     for name in GOLD_TABLES:
         frame = result.tables[name]
@@ -98,10 +178,28 @@ def write_gold(result: BuildResult, paths: DataPaths, *, write_contracts: bool =
 
         log.info("wrote %s (%d rows, %.1f KB)", name, frame.height, target.stat().st_size / 1024)
 
+    if result.state is not None:
+        incremental.save_state(
+            paths.silver,
+            signatures=result.state.signatures,
+            crosswalk_input=result.state.crosswalk_input,
+            report=result.crosswalk_report,
+            silver_frames=result.state.silver_frames,
+            tables=result.tables,
+        )
+
+
+def verify_gold(paths: DataPaths, *, full: bool = True, workers: int = 4) -> list[str]:
+    """Re-derive every contract and report differences. Empty means clean.
 
-def verify_gold(paths: DataPaths) -> list[str]:
-    """Re-derive every contract and report differences. Empty means clean."""
+    Footers first: a changed row count, schema, null count or range is found
+    from the parquet metadata alone, and reported without reading a row. Only
+    when every footer agrees, and ``full`` is set, are the tables scanned and
+    hashed — concurrently, since polars and pyarrow do that work outside the
+    GIL.
+    """
     problems: list[str] = []
+    expected: dict[str, contracts.TableContract] = {}
 
     for name in GOLD_TABLES:
         parquet = paths.gold / f"{name}.parquet"
@@ -114,10 +212,20 @@ def verify_gold(paths: DataPaths) -> list[str]:
             problems.append(f"{name}: contract sidecar missing")
             continue
 
-        expected = contracts.TableContract.from_json(sidecar.read_text(encoding="utf-8"))
-        actual = contracts.derive(name, pl.read_parquet(parquet))
-        problems.extend(f"{name}: {issue}" for issue in contracts.compare(expected, actual))
+        expected[name] = contracts.TableContract.from_json(sidecar.read_text(encoding="utf-8"))
+        footer = contracts.derive_footer(name, parquet)
+        problems.extend(f"{name}: {issue}" for issue in contracts.compare(expected[name], footer))
+
+    if problems or not full:
+        return problems
+
+    def scan(name: str) -> list[str]:
+        actual = contracts.derive_file(name, paths.gold / f"{name}.parquet")
+        return [f"{name}: {issue}" for issue in contracts.compare(expected[name], actual)]
 
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for issues in pool.map(scan, expected):
+            problems.extend(issues)
     return problems
 
 
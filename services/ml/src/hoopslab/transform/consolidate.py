@@ -0,0 +1,185 @@
+"""Bronze republished as one hive-partitioned dataset per endpoint.
+
+Bronze is content-addressed: one small parquet file per request, named by a
+hash of its parameters. That is the right shape for a cache and the wrong one
+for a transform. Silver used to rebuild every table by looping over seasons and
+issuing one read per season, endpoint and measure type — dozens of file opens,
+each followed by an eager per-season ``select``, then a ``concat`` at the end.
+
+Here each endpoint's payloads are gathered once into a single dataset under
+``bronze/_datasets``, partitioned ``league=…/season_id=…`` (and
+``measure_type=…`` where the endpoint has one), so silver becomes one lazy
+``scan_parquet`` per table: partition filters prune whole directories and
+projection pushdown reads only the columns a table uses.
+
+A dataset is republished only when the payloads behind it change. Its stamp is
+the size and modification time of every contributing file, which the bronze
+cache leaves alone on an unchanged refresh, so an unchanged bronze costs a
+directory of ``stat`` calls and nothing more. Like the rest of bronze it is
+regenerable: delete ``_datasets`` and the next read rebuilds it.
+
+Two columns are added to every row: ``start_year``, and ``_row``, the row's
+position within its payload. Sorting on those two restores exactly the order
+the per-season loop produced, which the crosswalk's tie-breaking depends on.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import shutil
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from hoopslab.io.bronze import BronzeCache, cache_key
+from hoopslab.seasons import League, Season, seasons_for
+
+log = logging.getLogger(__name__)
+
+#: Bumped when the published layout changes, so old datasets are rebuilt.
+DATASET_VERSION = 1
+
+DATASETS_DIR = "_datasets"
+STAMP_NAME = "_stamp.json"
+
+#: Columns carried on every published row so the original order is recoverable.
+ORDER_COLUMNS = ["start_year", "_row"]
+
+_NBA_LEAGUE_IDS = {"NBA": "00", "GL": "20"}
+
+
+def _nba_params(season: Season, measure: str | None) -> dict[str, Any]:
+    params: dict[str, Any] = {"season": season.nba_stats_season}
+    if measure is not None:
+        params["measure_type"] = measure
+    params["league_id"] = _NBA_LEAGUE_IDS[season.league]
+    return params
+
+
+def _euroleague_params(season: Season, _measure: str | None) -> dict[str, Any]:
+    return {"season": season.euroleague_season, "statistic_mode": "Accumulated"}
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Which bronze payloads make up one published dataset."""
+
+    source: str
+    endpoint: str
+    leagues: tuple[League, ...]
+    params: Callable[[Season, str | None], dict[str, Any]]
+    measures: tuple[str, ...] = ()
+
+    @property
+    def partition_keys(self) -> list[str]:
+        return [*(["measure_type"] if self.measures else []), "league", "season_id"]
+
+    def payloads(self) -> list[tuple[Season, str | None, dict[str, Any]]]:
+        return [
+            (season, measure, self.params(season, measure))
+            for measure in (self.measures or (None,))
+            for league in self.leagues
+            for season in seasons_for(league)
+        ]
+
+
+DATASETS: dict[str, DatasetSpec] = {
+    "nba_player_stats": DatasetSpec(
+        "nba_stats", "player_season_stats", ("NBA", "GL"), _nba_params, ("Base", "Advanced")
+    ),
+    "nba_player_bio": DatasetSpec("nba_stats", "player_bio_stats", ("NBA", "GL"), _nba_params),
+    "nba_team_stats": DatasetSpec(
+        "nba_stats", "team_season_stats", ("NBA", "GL"), _nba_params, ("Base", "Advanced")
+    ),
+    "euroleague_player_stats": DatasetSpec(
+        "euroleague", "player_season_stats", ("EL",), _euroleague_params
+    ),
+}
+
+
+def dataset_path(cache: BronzeCache, name: str) -> Path:
+    spec = DATASETS[name]
+    return cache.root / DATASETS_DIR / spec.source / spec.endpoint
+
+
+def scan(cache: BronzeCache, name: str) -> pl.LazyFrame | None:
+    """The named dataset as a lazy frame, republished first if bronze moved.
+
+    ``None`` when bronze holds no payload for it at all.
+    """
+    publish(cache, name)
+    directory = dataset_path(cache, name)
+    if not any(directory.glob("**/*.parquet")):
+        return None
+    return pl.scan_parquet(
+        directory / "**" / "*.parquet",
+        hive_partitioning=True,
+        hive_schema=dict.fromkeys(DATASETS[name].partition_keys, pl.Utf8),
+    )
+
+
+def publish(cache: BronzeCache, name: str, *, force: bool = False) -> bool:
+    """Republish one dataset if its payloads changed. Returns whether it did."""
+    spec = DATASETS[name]
+    directory = dataset_path(cache, name)
+    sources = [
+        (season, measure, cache.path_for(spec.source, spec.endpoint, key))
+        for season, measure, params in spec.payloads()
+        for key in [cache_key(spec.source, spec.endpoint, params)]
+    ]
+    present = [(season, measure, path) for season, measure, path in sources if path.is_file()]
+    stamp = _stamp(present)
+
+    stamp_path = directory / STAMP_NAME
+    if not force and stamp_path.is_file() and stamp_path.read_text(encoding="utf-8") == stamp:
+        return False
+
+    frames = []
+    for season, measure, path in present:
+        frame = pl.read_parquet(path, memory_map=True)
+        if frame.is_empty():
+            continue
+        frames.append(
+            frame.with_columns(
+                pl.lit(season.league).alias("league"),
+                pl.lit(season.season_id).alias("season_id"),
+                pl.lit(season.start_year, dtype=pl.Int64).alias("start_year"),
+                pl.int_range(pl.len(), dtype=pl.Int64).alias("_row"),
+                *([pl.lit(measure).alias("measure_type")] if measure is not None else []),
+            )
+        )
+
+    staging = directory.with_name(directory.name + ".staging")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    if frames:
+        # Seasons disagree on dtypes now and then (a column that is all-null
+        # one year, string-coerced another); relaxing to the supertype gives
+        # every partition one schema, which a single scan requires.
+        pl.concat(frames, how="diagonal_relaxed").write_parquet(
+            staging, partition_by=spec.partition_keys, compression="zstd"
+        )
+    (staging / STAMP_NAME).write_text(stamp, encoding="utf-8")
+
+    shutil.rmtree(directory, ignore_errors=True)
+    staging.rename(directory)
+    log.info("published bronze dataset %s from %d payloads", name, len(frames))
+    return True
+
+
+def publish_all(cache: BronzeCache, *, force: bool = False) -> list[str]:
+    """Bring every dataset up to date. Returns the names that were republished."""
+    return [name for name in DATASETS if publish(cache, name, force=force)]
+
+
+def _stamp(present: list[tuple[Season, str | None, Path]]) -> str:
+    files = [[path.name, path.stat().st_size, path.stat().st_mtime_ns] for _, _, path in present]
+    digest = hashlib.sha256(
+        json.dumps({"version": DATASET_VERSION, "files": files}).encode("utf-8")
+    ).hexdigest()
+    return json.dumps({"version": DATASET_VERSION, "digest": digest}, sort_keys=True)
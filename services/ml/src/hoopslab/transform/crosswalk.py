@@ -21,6 +21,16 @@ match invents a career that never happened and silently corrupts the estimate.
 So candidates are generated generously and accepted conservatively, every link
 records how it was made, and low-confidence links are kept but flagged rather
 than quietly promoted.
+
+Matching is a handful of joins rather than a loop over players, and a further
+European league is one more call to :func:`match_players`. Exact ``match_key``
+hits against NBA persons decide a link, with the tiers they always had; that is
+what the committed gold is built with. A :class:`MatchPolicy` can widen it (see
+``hoopslab build --match-policy``): the
+registry can take in G League careers that never reached the NBA, and a player
+left unmatched can be tried against near-spellings — one transliterated letter
+is otherwise a missed career — by blocking on shared name trigrams within the
+birth-year window and scoring with trigram similarity, all inside polars.
 """
 
 from __future__ import annotations
@@ -44,11 +54,60 @@ CONFIDENCE = {
     "shared_nba_person_id": 1.00,
     "name_and_age": 0.95,
     "name_only_unique": 0.70,
+    "fuzzy_name_and_age": 0.60,
     "name_ambiguous": 0.30,
 }
 
 MODELLING_CONFIDENCE_FLOOR = 0.80
 
+#: Trigram Dice similarity at which an unmatched player's name counts as a
+#: near-spelling of a registry name. Calibrated on the committed gold: the
+#: twelve EuroLeague-only persons at or above it with agreeing birth years are
+#: transliterations and short forms (Sergey/Sergei, Viktor/Victor,
+#: Matthew/Matt, a dropped Lithuanian diminutive) with one doubtful pair,
+#: while the band below it is dominated by shared surnames with unrelated
+#: first names. Hence the tier's confidence: found and reported, but below the
+#: modelling floor until someone writes the override.
+FUZZY_SIMILARITY_FLOOR = 0.75
+
+
+@dataclass(frozen=True)
+class MatchPolicy:
+    """What a player from another league may be matched to, and how loosely."""
+
+    #: Whether G League persons who never reached the NBA are in the registry.
+    gleague_registry: bool = False
+    #: Similarity floor of the near-spelling pass; ``None`` leaves it off.
+    fuzzy_floor: float | None = None
+
+
+#: NBA persons, exact name keys only: the policy the committed gold is built with.
+DEFAULT_POLICY = MatchPolicy()
+
+#: G League careers and near-spellings as well. On the committed gold this
+#: relinks 68 EuroLeague players — 53 matched on name and age to a G League
+#: career, one on name alone, 13 on a near-spelling, and one name-only match
+#: made ambiguous by a G League namesake — persons fall from 5,347 to 5,281,
+#: and 1,315 G League-only persons gain a birth year. Adopting it means
+#: rebuilding gold, contracts and the run log with it.
+WIDE_POLICY = MatchPolicy(gleague_registry=True, fuzzy_floor=FUZZY_SIMILARITY_FLOOR)
+
+#: The policies a build can be asked for by name, as ``hoopslab build
+#: --match-policy`` and the ``HOOPSLAB_MATCH_POLICY`` setting do.
+MATCH_POLICIES = {"default": DEFAULT_POLICY, "wide": WIDE_POLICY}
+
+#: Match method of a player with no counterpart, per league. A league not
+#: listed gets ``<league>_only``.
+UNMATCHED_METHOD = {"EL": "euroleague_only"}
+
+IDENTITY_SCHEMA = {
+    "person_id": pl.Utf8,
+    "league": pl.Utf8,
+    "source_player_id": pl.Utf8,
+    "match_method": pl.Utf8,
+    "confidence": pl.Float64,
+}
+
 
 @dataclass(frozen=True)
 class CrosswalkReport:
@@ -61,15 +120,17 @@ class CrosswalkReport:
     n_ambiguous: int
     n_euroleague_only: int
     n_manual_overrides: int
+    n_matched_fuzzy: int = 0
 
     def render(self) -> str:
-        matched = self.n_matched_name_and_age + self.n_matched_name_only
+        matched = self.n_matched_name_and_age + self.n_matched_name_only + self.n_matched_fuzzy
         rate = matched / self.n_euroleague_players if self.n_euroleague_players else 0.0
         return (
             f"NBA/G League persons:        {self.n_nba_persons:>6}\n"
             f"EuroLeague players:          {self.n_euroleague_players:>6}\n"
             f"  matched on name and age:   {self.n_matched_name_and_age:>6}\n"
             f"  matched on name only:      {self.n_matched_name_only:>6}\n"
+            f"  matched on a near-spelling:{self.n_matched_fuzzy:>6}\n"
             f"  ambiguous (not accepted):  {self.n_ambiguous:>6}\n"
             f"  EuroLeague only:           {self.n_euroleague_only:>6}\n"
             f"  manual overrides applied:  {self.n_manual_overrides:>6}\n"
@@ -149,11 +210,62 @@ def verify_shared_id_space(nba: pl.DataFrame, gleague: pl.DataFrame) -> SharedId
     )
 
 
+@dataclass(frozen=True)
+class People:
+    """One row per source player in each league, with an implied birth year."""
+
+    nba: pl.DataFrame
+    gleague: pl.DataFrame
+    euroleague: pl.DataFrame
+
+    @classmethod
+    def from_player_seasons(
+        cls, nba: pl.DataFrame, gleague: pl.DataFrame, euroleague: pl.DataFrame
+    ) -> People:
+        nba = _ensure_player_columns(nba)
+        gleague = _ensure_player_columns(gleague)
+        euroleague = _ensure_player_columns(euroleague)
+
+        # Diagonal rather than vertical: the frames need not carry identical
+        # columns, which matters when a league is absent and only the minimal
+        # schema is present.
+        birth_years = implied_birth_year(
+            pl.concat(
+                [
+                    f.select("league", "source_player_id", "start_year", "age")
+                    for f in (nba, gleague, euroleague)
+                ],
+                how="diagonal_relaxed",
+            )
+        )
+
+        # The G League shares the NBA identifier space, so no matching is required.
+        evidence = verify_shared_id_space(nba, gleague)
+        log.info("shared id space: %s", evidence.render())
+        if not evidence.confirmed:
+            log.warning(
+                "The NBA/G League shared-identifier assumption did not hold. "
+                "Every G League identity below depends on it."
+            )
+
+        return cls(
+            nba=_attach_birth_year(_distinct_players(nba), birth_years, "NBA"),
+            gleague=_attach_birth_year(_distinct_players(gleague), birth_years, "GL"),
+            euroleague=_attach_birth_year(_distinct_players(euroleague), birth_years, "EL"),
+        )
+
+    def registry(self, policy: MatchPolicy = DEFAULT_POLICY) -> pl.DataFrame:
+        """Everyone a player from another league can be matched to under ``policy``."""
+        return registry(self.nba, self.gleague) if policy.gleague_registry else self.nba
+
+
 def build_crosswalk(
     nba: pl.DataFrame,
     gleague: pl.DataFrame,
     euroleague: pl.DataFrame,
     overrides: pl.DataFrame | None = None,
+    *,
+    policy: MatchPolicy = DEFAULT_POLICY,
 ) -> tuple[pl.DataFrame, pl.DataFrame, CrosswalkReport]:
     """Resolve identities.
 
@@ -164,153 +276,283 @@ def build_crosswalk(
     confidence so a consumer can decide what to trust — and so a reviewer can
     see that the decision was made rather than assumed.
     """
-    nba = _ensure_player_columns(nba)
-    euroleague = _ensure_player_columns(euroleague)
-    nba_people = _distinct_players(nba)
-    el_people = _distinct_players(euroleague)
-
-    # Diagonal rather than vertical: the two frames need not carry identical
-    # columns, which matters when a league is absent and only the minimal
-    # schema is present.
-    birth_years = implied_birth_year(
-        pl.concat(
-            [
-                f.select("league", "source_player_id", "start_year", "age")
-                for f in (nba, euroleague)
-            ],
-            how="diagonal_relaxed",
-        )
+    people = People.from_player_seasons(nba, gleague, euroleague)
+    matched = match_players(
+        people.euroleague,
+        people.registry(policy),
+        override_links(overrides),
+        league="EL",
+        fuzzy_floor=policy.fuzzy_floor,
     )
-    nba_people = _attach_birth_year(nba_people, birth_years)
-    el_people = _attach_birth_year(el_people, birth_years)
+    return assemble(people, matched, policy)
+
 
+def override_links(overrides: pl.DataFrame | None) -> pl.DataFrame:
+    """The overrides file as ``source_player_id`` → ``nba_player_id`` links."""
     overrides = overrides if overrides is not None else _empty_overrides()
-    override_map = dict(
-        zip(
-            overrides["euroleague_player_id"].to_list(),
-            overrides["nba_player_id"].to_list(),
-            strict=True,
-        )
+    return overrides.select(
+        pl.col("euroleague_player_id").alias("source_player_id"), "nba_player_id"
     )
 
-    identities: list[dict[str, object]] = []
-
-    # NBA is the anchor: every NBA player is a person, by definition.
-    for row in nba_people.iter_rows(named=True):
-        identities.append(
-            {
-                "person_id": _person_id_for_nba(row["source_player_id"]),
-                "league": "NBA",
-                "source_player_id": row["source_player_id"],
-                "match_method": "anchor",
-                "confidence": 1.0,
-            }
+
+def assemble(
+    people: People, matched: pl.DataFrame, policy: MatchPolicy = DEFAULT_POLICY
+) -> tuple[pl.DataFrame, pl.DataFrame, CrosswalkReport]:
+    """Persons, identities and the report, from the EuroLeague links in ``matched``."""
+    identity_frame = pl.concat(
+        [
+            # NBA is the anchor: every NBA player is a person, by definition.
+            people.nba.select(
+                _nba_person_id(pl.col("source_player_id")).alias("person_id"),
+                pl.lit("NBA").alias("league"),
+                "source_player_id",
+                pl.lit("anchor").alias("match_method"),
+                pl.lit(1.0).alias("confidence"),
+            ),
+            people.gleague.select(
+                _nba_person_id(pl.col("source_player_id")).alias("person_id"),
+                pl.lit("GL").alias("league"),
+                "source_player_id",
+                pl.lit("shared_nba_person_id").alias("match_method"),
+                pl.lit(CONFIDENCE["shared_nba_person_id"]).alias("confidence"),
+            ),
+            matched.select(list(IDENTITY_SCHEMA)),
+        ],
+        how="vertical_relaxed",
+    ).cast(IDENTITY_SCHEMA)  # type: ignore[arg-type]
+
+    gl_people = people.gleague
+    if not policy.gleague_registry:
+        # G League ages are evidence only once G League careers can be matched;
+        # until then a G League-only person has no birth year, as in the
+        # committed gold.
+        gl_people = gl_people.with_columns(pl.lit(None, dtype=pl.Float64).alias("birth_year"))
+    persons = _build_persons(identity_frame, people.nba, gl_people, people.euroleague)
+
+    methods = matched["match_method"].value_counts()
+    counts = dict(zip(methods["match_method"].to_list(), methods["count"].to_list(), strict=True))
+    report = CrosswalkReport(
+        n_nba_persons=people.nba.height,
+        n_euroleague_players=people.euroleague.height,
+        n_matched_name_and_age=counts.get("name_and_age", 0),
+        n_matched_name_only=counts.get("name_only_unique", 0),
+        n_ambiguous=counts.get("name_ambiguous", 0),
+        n_euroleague_only=counts.get("euroleague_only", 0),
+        n_manual_overrides=counts.get("manual_override", 0),
+        n_matched_fuzzy=counts.get("fuzzy_name_and_age", 0),
+    )
+    return persons, identity_frame, report
+
+
+def registry(nba_people: pl.DataFrame, gl_people: pl.DataFrame) -> pl.DataFrame:
+    """The NBA and G League together, for :attr:`MatchPolicy.gleague_registry`.
+
+    One row per ``stats.nba.com`` person id. A player seen in both keeps his
+    NBA row; a G League player who never reached the NBA is still a person
+    with a career a European player may have had.
+    """
+    gl_only = gl_people.join(
+        nba_people.select("source_player_id"), on="source_player_id", how="anti"
+    )
+    return pl.concat([nba_people, gl_only], how="diagonal_relaxed")
+
+
+def match_players(
+    people: pl.DataFrame,
+    registry: pl.DataFrame,
+    overrides: pl.DataFrame | None = None,
+    *,
+    league: str,
+    fuzzy_floor: float | None = None,
+    claimed: pl.Series | None = None,
+) -> pl.DataFrame:
+    """Link one league's players to the registry, one identity row per player.
+
+    ``people`` and ``registry`` hold one row per source player with a
+    ``match_key`` and a ``birth_year``; ``overrides`` maps ``source_player_id``
+    to ``nba_player_id`` and beats everything. Nothing here is specific to the
+    EuroLeague, so another league is one more call with its own ``league``.
+
+    Exact name keys are tried first, with the tiers they always had. Only a
+    player those leave unmatched is tried fuzzily, and only against registry
+    persons no other player of this league has already claimed; ``claimed``
+    adds registry ids linked by players resolved elsewhere, as the identity
+    store's settled links are. The fuzzy pass runs only when ``fuzzy_floor``
+    is given.
+    """
+    unmatched = UNMATCHED_METHOD.get(league, f"{league.lower()}_only")
+    if overrides is None:
+        overrides = pl.DataFrame(schema={"source_player_id": pl.Utf8, "nba_player_id": pl.Utf8})
+    # Later rows win, as they did when the overrides were read into a dict.
+    overrides = overrides.unique("source_player_id", keep="last", maintain_order=True).select(
+        "source_player_id", pl.col("nba_player_id").alias("_override")
+    )
+
+    players = people.select("source_player_id", "match_key", "birth_year").join(
+        overrides, on="source_player_id", how="left"
+    )
+    exact = (
+        players.join(
+            registry.select(
+                pl.col("source_player_id").alias("_candidate"),
+                "match_key",
+                pl.col("birth_year").alias("_candidate_birth_year"),
+            ),
+            on="match_key",
+            how="left",
         )
+        .group_by("source_player_id", maintain_order=True)
+        .agg(
+            pl.col("_candidate").count().alias("_n_candidates"),
+            pl.col("_candidate").filter(_ages_agree).alias("_corroborated"),
+            pl.col("_candidate").first().alias("_only"),
+        )
+    )
+
+    n_candidates = pl.col("_n_candidates")
+    n_corroborated = pl.col("_corroborated").list.len()
+    resolved = players.join(exact, on="source_player_id", how="left").with_columns(
+        pl.when(pl.col("_override").is_not_null())
+        .then(pl.lit("manual_override"))
+        .when(n_corroborated == 1)
+        .then(pl.lit("name_and_age"))
+        # A single name match with no usable age on either side. Accepted,
+        # but below the modelling floor so it cannot enter the cohort without
+        # someone deciding to lower the threshold.
+        .when((n_candidates == 1) & (n_corroborated == 0))
+        .then(pl.lit("name_only_unique"))
+        # Two people share a name and age cannot separate them. Recorded so
+        # it can be resolved by hand, never guessed.
+        .when(n_candidates > 1)
+        .then(pl.lit("name_ambiguous"))
+        .otherwise(pl.lit(unmatched))
+        .alias("match_method"),
+        pl.when(pl.col("_override").is_not_null())
+        .then(pl.col("_override"))
+        .when(n_corroborated == 1)
+        .then(pl.col("_corroborated").list.first())
+        .when((n_candidates == 1) & (n_corroborated == 0))
+        .then(pl.col("_only"))
+        .alias("nba_player_id"),
+    )
 
-    # The G League shares the NBA identifier space, so no matching is required.
-    gleague = _ensure_player_columns(gleague)
-    evidence = verify_shared_id_space(nba, gleague)
-    log.info("shared id space: %s", evidence.render())
-    if not evidence.confirmed:
-        log.warning(
-            "The NBA/G League shared-identifier assumption did not hold. "
-            "Every G League identity below depends on it."
+    if fuzzy_floor is not None:
+        open_players = resolved.filter(pl.col("match_method") == unmatched)
+        taken = resolved.select(pl.col("nba_player_id").alias("source_player_id"))
+        if claimed is not None:
+            taken = pl.concat([taken, claimed.cast(pl.Utf8).alias("source_player_id").to_frame()])
+        unclaimed = registry.join(taken.drop_nulls(), on="source_player_id", how="anti")
+        # Accepted only when the pairing is unique from both ends; two
+        # near-spellings competing for one person is exactly the case a
+        # false match comes from.
+        accepted = fuzzy_candidates(open_players, unclaimed, floor=fuzzy_floor).filter(
+            (pl.len().over("source_player_id") == 1) & (pl.len().over("_candidate") == 1)
         )
-    for source_id in gleague["source_player_id"].unique().to_list():
-        identities.append(
-            {
-                "person_id": _person_id_for_nba(source_id),
-                "league": "GL",
-                "source_player_id": source_id,
-                "match_method": "shared_nba_person_id",
-                "confidence": CONFIDENCE["shared_nba_person_id"],
-            }
+        if not accepted.is_empty():
+            log.info("%d %s players matched on a near-spelling", accepted.height, league)
+        resolved = resolved.update(
+            accepted.select(
+                "source_player_id",
+                pl.col("_candidate").alias("nba_player_id"),
+                pl.lit("fuzzy_name_and_age").alias("match_method"),
+            ),
+            on="source_player_id",
         )
 
-    counts = {"name_and_age": 0, "name_only": 0, "ambiguous": 0, "el_only": 0, "override": 0}
+    return resolved.select(
+        pl.when(pl.col("nba_player_id").is_not_null())
+        .then(_nba_person_id(pl.col("nba_player_id")))
+        .otherwise(pl.lit(f"{league.lower()}_") + pl.col("source_player_id"))
+        .alias("person_id"),
+        pl.lit(league).alias("league"),
+        "source_player_id",
+        "match_method",
+        pl.col("match_method")
+        .replace_strict({**CONFIDENCE, unmatched: 1.0}, return_dtype=pl.Float64)
+        .alias("confidence"),
+    )
 
-    nba_by_key: dict[str, list[dict[str, object]]] = {}
-    for row in nba_people.iter_rows(named=True):
-        nba_by_key.setdefault(str(row["match_key"]), []).append(row)
 
-    for el_row in el_people.iter_rows(named=True):
-        el_id = str(el_row["source_player_id"])
+def name_trigrams(people: pl.DataFrame) -> pl.DataFrame:
+    """The distinct character trigrams of each player's ``match_key``.
 
-        if el_id in override_map:
-            identities.append(
-                {
-                    "person_id": _person_id_for_nba(override_map[el_id]),
-                    "league": "EL",
-                    "source_player_id": el_id,
-                    "match_method": "manual_override",
-                    "confidence": CONFIDENCE["manual_override"],
-                }
-            )
-            counts["override"] += 1
-            continue
-
-        candidates = nba_by_key.get(str(el_row["match_key"]), [])
-        corroborated = [c for c in candidates if _ages_agree(el_row, c)]
-
-        if len(corroborated) == 1:
-            method, confidence = "name_and_age", CONFIDENCE["name_and_age"]
-            chosen = corroborated[0]
-            counts["name_and_age"] += 1
-        elif len(candidates) == 1 and not corroborated:
-            # A single name match with no usable age on either side. Accepted,
-            # but below the modelling floor so it cannot enter the cohort
-            # without someone deciding to lower the threshold.
-            method, confidence = "name_only_unique", CONFIDENCE["name_only_unique"]
-            chosen = candidates[0]
-            counts["name_only"] += 1
-        elif len(candidates) > 1:
-            # Two people share a name and age cannot separate them. Recorded so
-            # it can be resolved by hand, never guessed.
-            method, confidence = "name_ambiguous", CONFIDENCE["name_ambiguous"]
-            chosen = None
-            counts["ambiguous"] += 1
-        else:
-            method, confidence, chosen = "euroleague_only", 1.0, None
-            counts["el_only"] += 1
-
-        identities.append(
-            {
-                "person_id": (
-                    _person_id_for_nba(chosen["source_player_id"])
-                    if chosen is not None
-                    else f"el_{el_id}"
-                ),
-                "league": "EL",
-                "source_player_id": el_id,
-                "match_method": method,
-                "confidence": confidence,
-            }
+    Padded with a space at each end so a first and a last letter count too.
+    Players with no key or no birth year have nothing to be blocked on and are
+    left out.
+    """
+    padded = pl.lit(" ") + pl.col("match_key") + pl.lit(" ")
+    named = people.filter(pl.col("birth_year").is_not_null() & (pl.col("match_key") != "")).select(
+        "source_player_id", "birth_year", padded.alias("_padded")
+    )
+    if named.is_empty():
+        return named.select(
+            "source_player_id",
+            "birth_year",
+            pl.col("_padded").alias("_trigram"),
+            pl.lit(0, dtype=pl.UInt32).alias("_n_trigrams"),
         )
-
-    identity_frame = pl.DataFrame(
-        identities,
-        schema={
-            "person_id": pl.Utf8,
-            "league": pl.Utf8,
-            "source_player_id": pl.Utf8,
-            "match_method": pl.Utf8,
-            "confidence": pl.Float64,
-        },
+    # One row per trigram start, by a join against the offsets rather than by
+    # exploding a per-row range.
+    longest = int(named.select(pl.col("_padded").str.len_chars().max()).item())
+    offsets = pl.DataFrame({"_at": list(range(longest - 2))})
+    return (
+        named.join(offsets, how="cross")
+        .filter(pl.col("_at") < pl.col("_padded").str.len_chars() - 2)
+        .select(
+            "source_player_id",
+            "birth_year",
+            pl.col("_padded").str.slice(pl.col("_at"), 3).alias("_trigram"),
+        )
+        .unique()
+        .with_columns(pl.len().over("source_player_id").alias("_n_trigrams"))
     )
 
-    gl_people = _attach_birth_year(_distinct_players(gleague), birth_years)
-    persons = _build_persons(identity_frame, nba_people, gl_people, el_people)
 
-    report = CrosswalkReport(
-        n_nba_persons=nba_people.height,
-        n_euroleague_players=el_people.height,
-        n_matched_name_and_age=counts["name_and_age"],
-        n_matched_name_only=counts["name_only"],
-        n_ambiguous=counts["ambiguous"],
-        n_euroleague_only=counts["el_only"],
-        n_manual_overrides=counts["override"],
+def fuzzy_candidates(
+    people: pl.DataFrame, registry: pl.DataFrame, *, floor: float = FUZZY_SIMILARITY_FLOOR
+) -> pl.DataFrame:
+    """Pairs whose names are near-spellings and whose birth years agree.
+
+    Blocked rather than compared all against all: a pair is only ever formed
+    by an equi-join on a shared trigram *and* a shared birth-year bucket, the
+    registry side copied into the neighbouring buckets so the tolerance window
+    is covered. What survives is scored by the Dice coefficient of the two
+    trigram sets, counted in the same join. Returns ``source_player_id``,
+    ``_candidate`` and ``similarity``.
+    """
+    bucket = pl.col("birth_year").floor().cast(pl.Int64)
+    left = name_trigrams(people).with_columns(bucket.alias("_bucket"))
+    # |a - b| <= 1 implies the floors differ by at most one.
+    shifts = pl.DataFrame({"_shift": list(range(-BIRTH_YEAR_TOLERANCE, BIRTH_YEAR_TOLERANCE + 1))})
+    right = (
+        name_trigrams(registry)
+        .join(shifts, how="cross")
+        .select(
+            pl.col("source_player_id").alias("_candidate"),
+            pl.col("birth_year").alias("_candidate_birth_year"),
+            "_trigram",
+            (bucket + pl.col("_shift")).alias("_bucket"),
+            pl.col("_n_trigrams").alias("_candidate_n_trigrams"),
+        )
+    )
+    return (
+        left.join(right, on=["_trigram", "_bucket"])
+        .filter(_ages_agree)
+        .group_by("source_player_id", "_candidate")
+        .agg(
+            pl.len().alias("_shared"),
+            pl.first("_n_trigrams"),
+            pl.first("_candidate_n_trigrams"),
+        )
+        .with_columns(
+            (
+                2 * pl.col("_shared") / (pl.col("_n_trigrams") + pl.col("_candidate_n_trigrams"))
+            ).alias("similarity")
+        )
+        .filter(pl.col("similarity") >= floor)
+        .select("source_player_id", "_candidate", "similarity")
+        .sort("source_player_id", "_candidate")
     )
-    return persons, identity_frame, report
 
 
 def _ensure_player_columns(frame: pl.DataFrame) -> pl.DataFrame:
@@ -335,20 +577,16 @@ def _ensure_player_columns(frame: pl.DataFrame) -> pl.DataFrame:
     )
 
 
-def _person_id_for_nba(source_player_id: object) -> str:
-    return f"nba_{source_player_id}"
-
+def _nba_person_id(source_player_id: pl.Expr) -> pl.Expr:
+    return pl.lit("nba_") + source_player_id
 
-def _ages_agree(left: dict[str, object], right: dict[str, object]) -> bool:
-    """Whether two implied birth years are close enough to be one person.
 
-    Missing age on either side means "not corroborated", never "assume yes" —
-    an unverified match is downgraded to name-only rather than accepted.
-    """
-    a, b = left.get("birth_year"), right.get("birth_year")
-    if not isinstance(a, int | float) or not isinstance(b, int | float):
-        return False
-    return abs(float(a) - float(b)) <= BIRTH_YEAR_TOLERANCE
+#: Whether two implied birth years are close enough to be one person. Missing
+#: age on either side means "not corroborated", never "assume yes" — an
+#: unverified match is downgraded to name-only rather than accepted.
+_ages_agree = (
+    (pl.col("birth_year") - pl.col("_candidate_birth_year")).abs() <= BIRTH_YEAR_TOLERANCE
+).fill_null(False)
 
 
 def _distinct_players(player_seasons: pl.DataFrame) -> pl.DataFrame:
@@ -367,7 +605,7 @@ def _distinct_players(player_seasons: pl.DataFrame) -> pl.DataFrame:
 
     return (
         player_seasons.sort("start_year")
-        .group_by("source_player_id")
+        .group_by("source_player_id", maintain_order=True)
         .agg(
             pl.last("player_name").alias("player_name"),
             pl.last("normalized_name").alias("normalized_name"),
@@ -378,11 +616,13 @@ def _distinct_players(player_seasons: pl.DataFrame) -> pl.DataFrame:
     )
 
 
-def _attach_birth_year(people: pl.DataFrame, birth_years: pl.DataFrame) -> pl.DataFrame:
+def _attach_birth_year(
+    people: pl.DataFrame, birth_years: pl.DataFrame, league: str
+) -> pl.DataFrame:
     if people.is_empty():
         return people.with_columns(pl.lit(None).cast(pl.Float64).alias("birth_year"))
     return people.join(
-        birth_years.select("source_player_id", "birth_year"),
+        birth_years.filter(pl.col("league") == league).select("source_player_id", "birth_year"),
         on="source_player_id",
         how="left",
     )
@@ -14,7 +14,7 @@ import logging
 
 import polars as pl
 
-from hoopslab.transform import rates
+from hoopslab.transform import keys, rates
 from hoopslab.transform.crosswalk import MODELLING_CONFIDENCE_FLOOR
 
 log = logging.getLogger(__name__)
@@ -200,8 +200,12 @@ def build_transition_pairs(player_seasons: pl.DataFrame) -> pl.DataFrame:
     EuroLeague to NBA would leave far too few pairs to fit anything, and the
     reverse direction is selected in the opposite way, which is what makes the
     selection effect measurable rather than merely acknowledged.
+
+    Every join and window below is on person and season, so they run on
+    integer keys and the strings are restored on the way out.
     """
-    eligible = player_seasons.filter(
+    eligible = keys.GoldKeys.from_frames(player_seasons).encode(player_seasons)
+    eligible = eligible.filter(
         pl.col("person_id").is_not_null()
         & (pl.col("confidence") >= MODELLING_CONFIDENCE_FLOOR)
         & pl.col("minutes").is_not_null()
@@ -281,7 +285,7 @@ def build_transition_pairs(player_seasons: pl.DataFrame) -> pl.DataFrame:
     # career (NBA -> EuroLeague -> NBA) to appear as its own pair.
     pairs = _greedy_match(pairs)
 
-    return (
+    return keys.decode(
         pairs.with_columns(
             (pl.col("source_league") + "->" + pl.col("target_league")).alias("direction"),
             pl.col("gap_seasons_raw").alias("gap_seasons"),
@@ -297,32 +301,42 @@ def _greedy_match(candidates: pl.DataFrame) -> pl.DataFrame:
     Sorted by smallest gap first, so the move is attributed to the season
     immediately preceding it rather than to an older one that happens to also
     qualify.
+
+    The assignment is the greedy one — walk the sorted candidates, keep each
+    whose source and target are both still free — but computed in rounds over
+    the whole frame rather than row by row. A round keeps every candidate that
+    comes first among the remaining ones for its source *and* for its target;
+    nothing earlier can claim either, so the walk would keep it too. Whatever
+    shares a source or target with a kept candidate is then dropped, as the
+    walk would drop it. Chains of conflicts are at most a couple of seasons
+    long, so a handful of rounds settles any number of people.
     """
     if candidates.is_empty():
         return candidates
 
     ordered = candidates.sort(
         ["person_id", "source_league", "target_league", "gap_seasons_raw", "target_season_order"]
-    )
-
-    used_sources: set[tuple[str, str, str]] = set()
-    used_targets: set[tuple[str, str, str]] = set()
-    keep: list[bool] = []
-
-    for row in ordered.iter_rows(named=True):
-        direction = (row["person_id"], row["source_league"], row["target_league"])
-        source_key = (*direction, row["source_season_id"])
-        target_key = (*direction, row["target_season_id"])
-
-        if source_key in used_sources or target_key in used_targets:
-            keep.append(False)
-            continue
-
-        used_sources.add(source_key)  # type: ignore[arg-type]
-        used_targets.add(target_key)  # type: ignore[arg-type]
-        keep.append(True)
+    ).with_row_index("_rank")
+
+    direction = ["person_id", "source_league", "target_league"]
+    source_key = [*direction, "source_season_id"]
+    target_key = [*direction, "target_season_id"]
+
+    remaining = ordered.select("_rank", *direction, "source_season_id", "target_season_id")
+    kept: list[pl.DataFrame] = []
+    while not remaining.is_empty():
+        first = remaining.filter(
+            (pl.col("_rank") == pl.col("_rank").min().over(source_key))
+            & (pl.col("_rank") == pl.col("_rank").min().over(target_key))
+        )
+        kept.append(first.select("_rank"))
+        remaining = (
+            remaining.join(first.select("_rank"), on="_rank", how="anti")
+            .join(first.select(source_key), on=source_key, how="anti")
+            .join(first.select(target_key), on=target_key, how="anti")
+        )
 
-    return ordered.filter(pl.Series("_keep", keep))
+    return ordered.join(pl.concat(kept), on="_rank", how="semi").sort("_rank").drop("_rank")
 
 
 def summarise_pairs(pairs: pl.DataFrame) -> pl.DataFrame:
@@ -0,0 +1,478 @@
+"""Resolved identities, kept and versioned, so a build resolves only what moved.
+
+Identities are stable once resolved: a EuroLeague player matched to his NBA
+self in 2019 is still that person in 2025. Re-running the whole crosswalk
+every build cost little when there was one league to match, but it also meant
+nothing recorded *when* a link appeared or changed, and a refresh that moved a
+link left no trace beyond a different content hash.
+
+The store lives beside gold, and is committed with it:
+
+* ``identities.parquet`` — the current ``player_identities``, every league;
+* ``inputs.parquet`` — what each matched player, and each registry person,
+  looked like when last resolved: ``match_key`` and ``birth_year``;
+* ``overrides.parquet`` — the manual links in force at the time;
+* ``changes.parquet`` — every row ever added, removed or relinked, tagged with
+  the version that did it, from which any earlier version is replayed;
+* ``store.json`` — the version list, a digest of the matching rules and the
+  :class:`~hoopslab.transform.crosswalk.MatchPolicy` they ran under.
+
+A new build puts a EuroLeague player through matching again only when
+
+1. the ``(league, source_player_id)`` pair has never been seen;
+2. it was left ``name_ambiguous``, which new evidence may settle;
+3. its own name key or birth year moved, or its manual override did;
+4. a registry person it is linked to, or could match exactly or as a
+   near-spelling, before or after this build, is new or has changed;
+5. it shares such a registry person with a player resolved again under any
+   of these rules.
+
+Everyone else keeps the link they have. Players only affect each other
+through the registry persons they could claim, so rules 4 and 5 are what keep
+this equal to a from-scratch resolution: a new NBA player who shares an already
+matched name and birth year makes that match ambiguous here exactly as it would
+in a full run, and a near-spelling link is given up, or newly granted, when a
+player who competes for the same person arrives, moves or leaves. A change to
+the rules themselves — ``crosswalk.py`` or ``names.py`` — invalidates every
+link, and the next build resolves everyone and reports the difference.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import shutil
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from hoopslab.transform import crosswalk, names
+
+log = logging.getLogger(__name__)
+
+#: Bumped when the stored layout changes; an older store is then started afresh.
+STORE_LAYOUT = 1
+
+STATE_NAME = "store.json"
+
+#: Fingerprint of the rules a link was made under.
+RULES_DIGEST = hashlib.sha256(
+    Path(crosswalk.__file__).read_bytes() + Path(names.__file__).read_bytes()
+).hexdigest()[:16]
+
+_KEY = ["league", "source_player_id"]
+_INPUT_SCHEMA = {
+    "kind": pl.Utf8,
+    "league": pl.Utf8,
+    "source_player_id": pl.Utf8,
+    "match_key": pl.Utf8,
+    "birth_year": pl.Float64,
+}
+_CHANGE_SCHEMA = {
+    "version": pl.Int64,
+    "change": pl.Utf8,
+    "league": pl.Utf8,
+    "source_player_id": pl.Utf8,
+    "person_id_before": pl.Utf8,
+    "person_id_after": pl.Utf8,
+    "match_method_before": pl.Utf8,
+    "match_method_after": pl.Utf8,
+    "confidence_before": pl.Float64,
+    "confidence_after": pl.Float64,
+}
+_OVERRIDE_SCHEMA = {"source_player_id": pl.Utf8, "nba_player_id": pl.Utf8}
+
+
+@dataclass
+class IdentityDiff:
+    """How one resolution differs from the version before it."""
+
+    version: int
+    previous_version: int
+    n_identities: int
+    n_matched: int
+    n_resolved: int
+    changes: pl.DataFrame
+    full: bool = False
+
+    def count(self, change: str) -> int:
+        return int((self.changes["change"] == change).sum())
+
+    @property
+    def empty(self) -> bool:
+        return self.changes.is_empty()
+
+    def render(self, limit: int = 20) -> str:
+        scope = "every" if self.full else f"{self.n_resolved:,} of"
+        lines = [
+            f"identity store v{self.version} (from v{self.previous_version}): "
+            f"{self.n_identities:,} identities",
+            f"  resolved {scope} {self.n_matched:,} matched-league players",
+            f"  added {self.count('added'):,}, removed {self.count('removed'):,}, "
+            f"relinked {self.count('changed'):,}",
+        ]
+        relinked = self.changes.filter(pl.col("change") != "added")
+        for row in relinked.head(limit).iter_rows(named=True):
+            lines.append(
+                f"    {row['change']:<8} {row['league']} {row['source_player_id']:<10} "
+                f"{row['person_id_before'] or '-'} -> {row['person_id_after'] or '-'}  "
+                f"({row['match_method_before'] or '-'} -> {row['match_method_after'] or '-'})"
+            )
+        if relinked.height > limit:
+            lines.append(f"    ... and {relinked.height - limit:,} more")
+        return "\n".join(lines)
+
+
+@dataclass
+class Resolution:
+    """A resolution waiting to be committed as the store's next version."""
+
+    store: IdentityStore
+    persons: pl.DataFrame
+    identities: pl.DataFrame
+    report: crosswalk.CrosswalkReport
+    diff: IdentityDiff
+    inputs: pl.DataFrame
+    overrides: pl.DataFrame
+
+    def commit(self) -> bool:
+        """Record this as a new version. Returns whether anything changed."""
+        return self.store.commit(self)
+
+
+@dataclass
+class IdentityStore:
+    """The versioned store in one directory; empty until first committed."""
+
+    directory: Path
+    versions: list[dict[str, Any]] = field(default_factory=list)
+    identities: pl.DataFrame | None = None
+    inputs: pl.DataFrame | None = None
+    overrides: pl.DataFrame | None = None
+    #: Whether the stored links were made under the current rules and policy.
+    trusted: bool = False
+    policy: crosswalk.MatchPolicy = crosswalk.DEFAULT_POLICY
+
+    @classmethod
+    def open(
+        cls, directory: Path, policy: crosswalk.MatchPolicy = crosswalk.DEFAULT_POLICY
+    ) -> IdentityStore:
+        store = cls(directory, policy=policy)
+        state_path = directory / STATE_NAME
+        if not state_path.is_file():
+            return store
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+        if state.get("layout") != STORE_LAYOUT:
+            log.info("identity store has an older layout; starting a new one")
+            return store
+        store.versions = state["versions"]
+        store.identities = pl.read_parquet(directory / "identities.parquet")
+        store.inputs = pl.read_parquet(directory / "inputs.parquet")
+        store.overrides = pl.read_parquet(directory / "overrides.parquet")
+        # History is kept either way, and a rule change is still reported as
+        # a diff, but no link made under other rules is reused.
+        store.trusted = state.get("rules") == RULES_DIGEST and state.get("policy") == asdict(policy)
+        if not store.trusted:
+            log.info("matching rules changed since the identity store was written")
+        return store
+
+    @property
+    def version(self) -> int:
+        return int(self.versions[-1]["version"]) if self.versions else 0
+
+    def changes(self) -> pl.DataFrame:
+        path = self.directory / "changes.parquet"
+        if not path.is_file():
+            return pl.DataFrame(schema=_CHANGE_SCHEMA)
+        return pl.read_parquet(path)
+
+    def at(self, version: int) -> pl.DataFrame:
+        """``player_identities`` as it stood after ``version``, replayed from the log."""
+        current = pl.read_parquet(self.directory / "identities.parquet")
+        undo = self.changes().filter(pl.col("version") > version)
+        if undo.is_empty():
+            return current.sort(_KEY)
+        # Undoing from the newest version back, each row's state before its
+        # earliest later change is the state at ``version``.
+        earliest = undo.sort("version").unique(_KEY, keep="first", maintain_order=True)
+        restored = earliest.filter(pl.col("change") != "added").select(
+            pl.col("person_id_before").alias("person_id"),
+            "league",
+            "source_player_id",
+            pl.col("match_method_before").alias("match_method"),
+            pl.col("confidence_before").alias("confidence"),
+        )
+        return pl.concat([current.join(earliest.select(_KEY), on=_KEY, how="anti"), restored]).sort(
+            _KEY
+        )
+
+    def resolve(
+        self, people: crosswalk.People, overrides: pl.DataFrame | None, *, full: bool = False
+    ) -> Resolution:
+        """Resolve ``people`` against what the store already knows.
+
+        ``full`` resolves every player from scratch, and still reports the
+        difference from the stored version.
+        """
+        links = crosswalk.override_links(overrides).cast(_OVERRIDE_SCHEMA)  # type: ignore[arg-type]
+        inputs = _inputs(people, self.policy)
+        league_people = people.euroleague
+        registry = people.registry(self.policy)
+        fuzzy_floor = self.policy.fuzzy_floor
+
+        full = full or not self.trusted or self.identities is None
+        if full:
+            matched = crosswalk.match_players(
+                league_people, registry, links, league="EL", fuzzy_floor=fuzzy_floor
+            )
+            n_resolved = league_people.height
+        else:
+            assert self.identities is not None
+            dirty = self._dirty(inputs, links)
+            previous = self.identities.filter(pl.col("league") == "EL")
+            settled = previous.join(
+                league_people.select("source_player_id"), on="source_player_id", how="semi"
+            ).join(dirty, on="source_player_id", how="anti")
+            fresh = crosswalk.match_players(
+                league_people.join(dirty, on="source_player_id", how="semi"),
+                registry,
+                links,
+                league="EL",
+                fuzzy_floor=fuzzy_floor,
+                claimed=settled.filter(pl.col("person_id").str.starts_with("nba_"))[
+                    "person_id"
+                ].str.strip_prefix("nba_"),
+            )
+            # Back into the order a full resolution produces.
+            matched = league_people.select("source_player_id").join(
+                pl.concat([settled.select(fresh.columns), fresh]),
+                on="source_player_id",
+                how="left",
+            )
+            matched = matched.select(fresh.columns)
+            n_resolved = fresh.height
+            log.info(
+                "resolved %d of %d EuroLeague players; %d kept their link",
+                n_resolved,
+                league_people.height,
+                settled.height,
+            )
+
+        persons, identities, report = crosswalk.assemble(people, matched, self.policy)
+        previous_identities = (
+            self.identities
+            if self.identities is not None
+            else pl.DataFrame(schema=crosswalk.IDENTITY_SCHEMA)
+        )
+        diff = IdentityDiff(
+            version=self.version + 1,
+            previous_version=self.version,
+            n_identities=identities.height,
+            n_matched=league_people.height,
+            n_resolved=n_resolved,
+            changes=diff_identities(previous_identities, identities, version=self.version + 1),
+            full=full,
+        )
+        return Resolution(self, persons, identities, report, diff, inputs, links)
+
+    def _dirty(self, inputs: pl.DataFrame, links: pl.DataFrame) -> pl.DataFrame:
+        """Matched-league players whose link must be worked out again.
+
+        Those that moved themselves, then, until nothing more is added, every
+        player sharing a registry person with one of them or with a registry
+        person that moved.
+        """
+        assert self.identities is not None and self.inputs is not None
+        assert self.overrides is not None
+        previous = self.identities.filter(pl.col("league") == "EL")
+
+        moved = _symmetric_difference(inputs, self.inputs)
+        dirty = pl.concat(
+            [
+                moved.filter(pl.col("kind") == "player").select("source_player_id"),
+                _symmetric_difference(links, self.overrides).select("source_player_id"),
+                previous.filter(pl.col("match_method") == "name_ambiguous").select(
+                    "source_player_id"
+                ),
+            ]
+        ).unique()
+        touched = moved.filter(pl.col("kind") == "registry").select(
+            pl.col("source_player_id").alias("_candidate")
+        )
+
+        linked = previous.filter(pl.col("person_id").str.starts_with("nba_")).select(
+            "source_player_id", pl.col("person_id").str.strip_prefix("nba_").alias("_candidate")
+        )
+        claims = pl.concat(
+            [
+                _claims(inputs, self.policy),
+                _claims(self.inputs, self.policy),
+                linked,
+                *(
+                    frame.select("source_player_id", pl.col("nba_player_id").alias("_candidate"))
+                    for frame in (links, self.overrides)
+                ),
+            ]
+        ).unique()
+
+        while True:
+            touched = pl.concat(
+                [
+                    touched,
+                    claims.join(dirty, on="source_player_id", how="semi").select("_candidate"),
+                ]
+            ).unique()
+            grown = pl.concat(
+                [
+                    dirty,
+                    claims.join(touched, on="_candidate", how="semi").select("source_player_id"),
+                ]
+            ).unique()
+            if grown.height == dirty.height:
+                return dirty
+            dirty = grown
+
+    def commit(self, resolution: Resolution) -> bool:
+        if resolution.diff.empty and self.trusted:
+            # Same links, but the evidence behind them may have moved; record
+            # it so the next build does not re-resolve the same players again.
+            assert self.inputs is not None and self.overrides is not None
+            if not (
+                _symmetric_difference(resolution.inputs, self.inputs).is_empty()
+                and _symmetric_difference(resolution.overrides, self.overrides).is_empty()
+            ):
+                resolution.inputs.write_parquet(self.directory / "inputs.parquet")
+                resolution.overrides.write_parquet(self.directory / "overrides.parquet")
+                self.inputs, self.overrides = resolution.inputs, resolution.overrides
+            return False
+
+        staging = self.directory.with_name(self.directory.name + ".staging")
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        resolution.identities.write_parquet(staging / "identities.parquet")
+        resolution.inputs.write_parquet(staging / "inputs.parquet")
+        resolution.overrides.write_parquet(staging / "overrides.parquet")
+        pl.concat([self.changes(), resolution.diff.changes]).write_parquet(
+            staging / "changes.parquet"
+        )
+
+        diff = resolution.diff
+        versions = [
+            *self.versions,
+            {
+                "version": diff.version,
+                "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+                "n_identities": diff.n_identities,
+                "n_resolved": diff.n_resolved,
+                "full": diff.full,
+                "added": diff.count("added"),
+                "removed": diff.count("removed"),
+                "changed": diff.count("changed"),
+            },
+        ]
+        state = {
+            "layout": STORE_LAYOUT,
+            "rules": RULES_DIGEST,
+            "policy": asdict(self.policy),
+            "versions": versions,
+        }
+        (staging / STATE_NAME).write_text(
+            json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+
+        shutil.rmtree(self.directory, ignore_errors=True)
+        staging.rename(self.directory)
+        self.versions = versions
+        self.identities = resolution.identities
+        self.inputs = resolution.inputs
+        self.overrides = resolution.overrides
+        self.trusted = True
+        log.info("identity store now at v%d", diff.version)
+        return True
+
+
+def diff_identities(before: pl.DataFrame, after: pl.DataFrame, *, version: int) -> pl.DataFrame:
+    """Rows added, removed or relinked between two ``player_identities`` frames."""
+    columns = ["person_id", "match_method", "confidence"]
+    joined = before.select(*_KEY, *columns).join(
+        after.select(*_KEY, *columns), on=_KEY, how="full", coalesce=True, suffix="_after"
+    )
+    joined = joined.rename({c: f"{c}_before" for c in columns})
+    in_before = pl.col("match_method_before").is_not_null()
+    in_after = pl.col("match_method_after").is_not_null()
+    moved = pl.any_horizontal(
+        pl.col(f"{c}_before").ne_missing(pl.col(f"{c}_after")) for c in columns
+    )
+    return (
+        joined.with_columns(
+            pl.when(~in_before)
+            .then(pl.lit("added"))
+            .when(~in_after)
+            .then(pl.lit("removed"))
+            .when(moved)
+            .then(pl.lit("changed"))
+            .alias("change"),
+            pl.lit(version, dtype=pl.Int64).alias("version"),
+        )
+        .filter(pl.col("change").is_not_null())
+        .select(list(_CHANGE_SCHEMA))
+        .cast(_CHANGE_SCHEMA)  # type: ignore[arg-type]
+        .sort("change", *_KEY)
+    )
+
+
+def _inputs(people: crosswalk.People, policy: crosswalk.MatchPolicy) -> pl.DataFrame:
+    """What matching reads about each player and registry person."""
+    return pl.concat(
+        [
+            frame.select(
+                pl.lit(kind).alias("kind"),
+                pl.lit(league, dtype=pl.Utf8).alias("league"),
+                "source_player_id",
+                "match_key",
+                "birth_year",
+            )
+            for kind, league, frame in (
+                ("player", "EL", people.euroleague),
+                ("registry", None, people.registry(policy)),
+            )
+        ],
+        how="vertical_relaxed",
+    ).cast(_INPUT_SCHEMA)  # type: ignore[arg-type]
+
+
+def _claims(inputs: pl.DataFrame, policy: crosswalk.MatchPolicy) -> pl.DataFrame:
+    """Every registry person each player in ``inputs`` could be matched to.
+
+    Exact name-key candidates whatever their age, and near-spellings when the
+    policy tries them: between them, every person whose claim by someone else
+    could change the player's link.
+    """
+    players = inputs.filter(pl.col("kind") == "player")
+    registry = inputs.filter(pl.col("kind") == "registry")
+    exact = players.join(
+        registry.select(pl.col("source_player_id").alias("_candidate"), "match_key"),
+        on="match_key",
+    ).select("source_player_id", "_candidate")
+    if policy.fuzzy_floor is None:
+        return exact
+    near = crosswalk.fuzzy_candidates(players, registry, floor=policy.fuzzy_floor)
+    return pl.concat([exact, near.select("source_player_id", "_candidate")])
+
+
+def _symmetric_difference(left: pl.DataFrame, right: pl.DataFrame) -> pl.DataFrame:
+    """Rows in exactly one of two same-shaped frames, nulls comparing equal."""
+    columns = left.columns
+    # A join never matches nulls, so each column is compared through a
+    # sentinel-filled copy instead.
+    sentinel = [pl.col(c).cast(pl.Utf8).fill_null("\x00").alias(f"_{c}") for c in columns]
+    keys = [f"_{c}" for c in columns]
+    a = left.with_columns(sentinel)
+    b = right.select(columns).with_columns(sentinel)
+    return pl.concat([a.join(b, on=keys, how="anti"), b.join(a, on=keys, how="anti")]).select(
+        columns
+    )
@@ -0,0 +1,357 @@
+"""Incremental gold builds, driven by the digests of the bronze behind each season.
+
+A full build re-reads every season of every league, re-resolves every
+identity and recomputes every rate, z-score and transition pair. During a
+season, though, the only bronze that moves is the current season's, and a
+rebuild that touches 25 years of data to absorb one changed payload is mostly
+waste.
+
+So a build records what it was made from, and the next one does only the work
+that inputs have invalidated:
+
+* **Silver, per league-season.** Each league-season is signed by the digests
+  of the bronze payloads behind it. A season whose signature moved is re-read
+  (partition pruning means only its files are opened) and spliced into the
+  silver kept from last time; the rest is reused as-is.
+* **The crosswalk, all or nothing.** Identity resolution is global — one new
+  EuroLeague season can change who matches whom — so it is re-run whenever
+  the silver columns it reads change, and reused otherwise.
+* **Gold, per person and season.** If the resolved identities came out the
+  same, only the rows of changed seasons are rebuilt, together with every row
+  of a person who appears in one (an age seen in one season fills another).
+  Z-scores are recomputed for the seasons those rows sit in, and transition
+  pairs for those people. If the identities changed, gold is rebuilt in full.
+
+Anything the state cannot vouch for — a different version of the transform
+code, a missing file — means a full build, which then records state for the
+next one. The result is meant to be indistinguishable from a full rebuild,
+and ``hoopslab build --verify-incremental`` checks exactly that, table by
+table, with :func:`hoopslab.validate.contracts.content_hash`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Callable, Collection
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from hoopslab import seasons as seasons_module
+from hoopslab.io.bronze import BronzeCache, cache_key
+from hoopslab.transform import consolidate, crosswalk, gold, silver
+from hoopslab.validate import contracts
+
+log = logging.getLogger(__name__)
+
+#: Bumped when the recorded state changes shape, so old state is ignored.
+STATE_VERSION = 1
+
+STATE_DIR = "_incremental"
+STATE_NAME = "state.json"
+
+#: The published datasets silver reads. Team stats are absent on purpose: the
+#: build derives team totals from player rows, so they cannot dirty a season.
+SILVER_DATASETS = ("nba_player_stats", "nba_player_bio", "euroleague_player_stats")
+
+#: Silver frames kept between builds, by file stem.
+SILVER_FRAMES = ("nba_player_seasons", "gl_player_seasons", "el_player_seasons", "official_rates")
+
+#: The silver columns identity resolution reads; nothing else can change it.
+CROSSWALK_COLUMNS = [
+    "league",
+    "source_player_id",
+    "start_year",
+    "age",
+    "player_name",
+    "normalized_name",
+    "match_key",
+]
+
+_PLAYER_SEASON_ORDER = ["person_id", "season_order", "league"]
+_PAIR_ORDER = ["direction", "source_season_order", "person_id"]
+
+
+def code_digest() -> str:
+    """Fingerprint of the code that turns bronze into gold."""
+    sources = [*sorted(Path(__file__).parent.glob("*.py")), Path(seasons_module.__file__)]
+    digest = hashlib.sha256()
+    for path in sources:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def season_signatures(cache: BronzeCache) -> dict[str, str]:
+    """One signature per league-season, over the bronze payloads silver reads for it.
+
+    A payload is identified by the content digest its manifest entry records,
+    falling back to size and modification time for one with no entry.
+    """
+    parts: dict[str, list[list[Any]]] = {}
+    for name in SILVER_DATASETS:
+        spec = consolidate.DATASETS[name]
+        for season, measure, params in spec.payloads():
+            key = cache_key(spec.source, spec.endpoint, params)
+            path = cache.path_for(spec.source, spec.endpoint, key)
+            token: str | None = None
+            if path.is_file():
+                entry = cache.latest(spec.source, spec.endpoint, key)
+                stat = path.stat()
+                token = (entry or {}).get("digest") or f"{stat.st_size}:{stat.st_mtime_ns}"
+            parts.setdefault(season.season_id, []).append([name, measure, token])
+    return {
+        season_id: hashlib.sha256(json.dumps(payloads).encode("utf-8")).hexdigest()[:16]
+        for season_id, payloads in parts.items()
+    }
+
+
+def crosswalk_input_hash(
+    frames: list[pl.DataFrame],
+    overrides: pl.DataFrame,
+    policy: crosswalk.MatchPolicy = crosswalk.DEFAULT_POLICY,
+) -> str:
+    parts = [contracts.content_hash(frame.select(CROSSWALK_COLUMNS)) for frame in frames]
+    parts.append(contracts.content_hash(overrides))
+    parts.append(json.dumps(asdict(policy), sort_keys=True))
+    return hashlib.sha256("|".join(parts).encode("ascii")).hexdigest()[:32]
+
+
+@dataclass
+class BuildPlan:
+    """What an incremental build decided to recompute, for the CLI to show."""
+
+    n_seasons: int
+    dirty_seasons: list[str] | None
+    crosswalk_reused: bool = False
+    gold_incremental: bool = False
+    n_persons_rebuilt: int | None = None
+    #: Players put through matching when the crosswalk was re-run.
+    identities_resolved: int | None = None
+
+    @property
+    def full(self) -> bool:
+        return self.dirty_seasons is None
+
+    def render(self) -> str:
+        if self.dirty_seasons is None:
+            return f"full build of {self.n_seasons} league-seasons (no usable build state)"
+        changed = ", ".join(self.dirty_seasons) if self.dirty_seasons else "none"
+        lines = [
+            f"league-seasons changed:  {len(self.dirty_seasons)} of {self.n_seasons} ({changed})",
+            f"crosswalk:               {'reused' if self.crosswalk_reused else 're-run'}",
+        ]
+        if self.identities_resolved is not None:
+            lines[-1] += f" ({self.identities_resolved:,} players matched)"
+        if self.gold_incremental:
+            lines.append(f"gold:                    rebuilt for {self.n_persons_rebuilt} persons")
+        else:
+            lines.append("gold:                    rebuilt in full (identities changed)")
+        return "\n".join(lines)
+
+
+@dataclass
+class BuildState:
+    """What the last build was made from, and what it produced."""
+
+    directory: Path
+    code: str
+    seasons: dict[str, str]
+    crosswalk_input: str
+    identities: str
+    crosswalk_report: dict[str, int]
+    tables: list[str]
+
+    @classmethod
+    def load(cls, silver_dir: Path) -> BuildState | None:
+        """The recorded state, or ``None`` if it is absent, stale or incomplete."""
+        directory = silver_dir / STATE_DIR
+        path = directory / STATE_NAME
+        if not path.is_file():
+            return None
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        if raw.pop("version", None) != STATE_VERSION or raw.get("code") != code_digest():
+            log.info("build state was recorded by other transform code; building in full")
+            return None
+        expected = [silver_dir / f"{n}.parquet" for n in SILVER_FRAMES]
+        expected += [directory / f"{n}.parquet" for n in raw.get("tables", [])]
+        if not all(p.is_file() for p in expected):
+            return None
+        return cls(directory=directory, **raw)
+
+    def silver(self, name: str) -> pl.DataFrame:
+        return pl.read_parquet(self.directory.parent / f"{name}.parquet")
+
+    def gold(self, name: str) -> pl.DataFrame:
+        return pl.read_parquet(self.directory / f"{name}.parquet")
+
+    def report(self) -> crosswalk.CrosswalkReport:
+        return crosswalk.CrosswalkReport(**self.crosswalk_report)
+
+    def dirty_seasons(self, signatures: dict[str, str]) -> list[str]:
+        return sorted(
+            season_id
+            for season_id in signatures.keys() | self.seasons.keys()
+            if signatures.get(season_id) != self.seasons.get(season_id)
+        )
+
+
+@dataclass(frozen=True)
+class PendingState:
+    """What a build will record as its state, once its gold has been written."""
+
+    signatures: dict[str, str]
+    crosswalk_input: str
+    silver_frames: dict[str, pl.DataFrame]
+
+
+def save_state(
+    silver_dir: Path,
+    *,
+    signatures: dict[str, str],
+    crosswalk_input: str,
+    report: crosswalk.CrosswalkReport,
+    silver_frames: dict[str, pl.DataFrame],
+    tables: dict[str, pl.DataFrame],
+) -> None:
+    directory = silver_dir / STATE_DIR
+    directory.mkdir(parents=True, exist_ok=True)
+    state_path = directory / STATE_NAME
+    # The state file goes last and comes out first, so a build interrupted
+    # halfway through saving leaves no state rather than a mismatched one.
+    state_path.unlink(missing_ok=True)
+
+    for name in SILVER_FRAMES:
+        silver_frames[name].write_parquet(silver_dir / f"{name}.parquet")
+    for name, frame in tables.items():
+        frame.write_parquet(directory / f"{name}.parquet")
+
+    state = {
+        "version": STATE_VERSION,
+        "code": code_digest(),
+        "seasons": signatures,
+        "crosswalk_input": crosswalk_input,
+        "identities": contracts.content_hash(tables["player_identities"]),
+        "crosswalk_report": asdict(report),
+        "tables": sorted(tables),
+    }
+    state_path.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def refresh_silver(
+    state: BuildState | None,
+    name: str,
+    dirty: list[str] | None,
+    read: Callable[[Collection[str] | None], pl.DataFrame],
+) -> pl.DataFrame:
+    """A silver frame with only the dirty seasons re-read from bronze.
+
+    Rows are kept in season order, and in payload order within a season,
+    exactly as a full read returns them.
+    """
+    if state is None or dirty is None:
+        return read(None)
+    previous = state.silver(name)
+    if not dirty:
+        return previous
+    fresh = read(dirty)
+    kept = previous.filter(~pl.col("season_id").is_in(dirty))
+    if fresh.is_empty():
+        return kept
+    # Each frame holds one league, so season ids sort in season order.
+    return pl.concat([kept, fresh.select(kept.columns)], how="vertical_relaxed").sort(
+        "season_id", maintain_order=True
+    )
+
+
+def update_gold(
+    state: BuildState,
+    players: pl.DataFrame,
+    identities: pl.DataFrame,
+    official: pl.DataFrame,
+    dirty: list[str],
+    metrics: list[str],
+) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame, int]:
+    """Team seasons, player seasons and pairs, rebuilt only where ``dirty`` reaches.
+
+    Only valid when the identities are the ones the state was built with.
+    Returns the three tables and how many persons were rebuilt.
+    """
+    in_dirty = pl.col("season_id").is_in(dirty)
+
+    previous_teams = state.gold("team_seasons")
+    fresh_teams = silver.team_seasons_from_players(players.filter(in_dirty))
+    teams = previous_teams.filter(~in_dirty)
+    if not fresh_teams.is_empty():
+        teams = pl.concat([teams, fresh_teams.select(teams.columns)], how="vertical_relaxed")
+
+    previous = state.gold("player_seasons")
+    keyed = players.join(
+        identities.select("league", "source_player_id", "person_id"),
+        on=["league", "source_player_id"],
+        how="left",
+    )
+    affected = (
+        pl.concat(
+            [
+                keyed.filter(in_dirty).select("person_id"),
+                previous.filter(in_dirty).select("person_id"),
+            ]
+        )
+        .drop_nulls()
+        .unique()["person_id"]
+        .to_list()
+    )
+    touched = in_dirty | pl.col("person_id").is_in(affected).fill_null(False)
+
+    rebuilt = gold.build_player_seasons(
+        keyed.filter(touched).drop("person_id"), teams, identities, official
+    )
+    kept = previous.filter(~touched)
+
+    # Z-scores are moments of a whole league-season, so every season that
+    # gained a rebuilt row is standardised again over all of its rows.
+    restandardise = pl.col("season_id").is_in(rebuilt["season_id"].unique().to_list())
+    pool = pl.concat(
+        [kept.filter(restandardise).select(rebuilt.columns), rebuilt], how="vertical_relaxed"
+    ).sort(_PLAYER_SEASON_ORDER)
+    player_seasons = pl.concat(
+        [
+            kept.filter(~restandardise),
+            gold.standardize_within_league_season(pool, metrics).select(previous.columns),
+        ],
+        how="vertical_relaxed",
+    ).sort(_PLAYER_SEASON_ORDER)
+
+    in_affected = pl.col("person_id").is_in(affected)
+    previous_pairs = state.gold("transition_pairs")
+    fresh_pairs = gold.build_transition_pairs(player_seasons.filter(in_affected))
+    pairs = pl.concat(
+        [
+            previous_pairs.filter(~in_affected),
+            fresh_pairs.select(previous_pairs.columns),
+        ],
+        how="vertical_relaxed",
+    ).sort(_PAIR_ORDER)
+
+    return teams, player_seasons, pairs, len(affected)
+
+
+def table_hashes(tables: dict[str, pl.DataFrame]) -> dict[str, str]:
+    return {name: contracts.content_hash(frame) for name, frame in tables.items()}
+
+
+def compare_builds(
+    incremental: dict[str, pl.DataFrame], full: dict[str, pl.DataFrame]
+) -> list[str]:
+    """Tables whose contents differ between two builds. Empty means equivalent."""
+    ours, theirs = table_hashes(incremental), table_hashes(full)
+    return [
+        f"{name}: incremental {ours.get(name)} != full {theirs.get(name)}"
+        for name in sorted(ours.keys() | theirs.keys())
+        if ours.get(name) != theirs.get(name)
+    ]
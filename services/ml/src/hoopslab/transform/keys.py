@@ -0,0 +1,105 @@
+"""Integer keys behind the string identifiers gold is keyed on.
+
+``person_id``, ``season_id`` and ``direction`` are strings in gold, and stay
+strings there: ``nba_1629029`` and ``EL_2023`` are what the contracts hash,
+what DuckDB and D1 read, and what a reviewer can make sense of. In memory they
+are the keys of every join in the feature, model and evidence code, and
+hashing and comparing a ten-byte string per row is most of what those joins
+cost — a cost that grows with every league added.
+
+So the frames those layers work on carry polars ``Enum`` columns instead: a
+frozen dictionary of every identifier, with a small unsigned integer per row.
+Joins, group-bys and ``over`` windows then run on the integers, filters
+against a string literal still work, and ``to_list`` still hands back
+strings, so nothing downstream has to know.
+
+The dictionaries are sorted, which keeps one property the code relies on
+without saying so: sorting by an encoded column orders rows exactly as
+sorting the strings did, so every fit sees its rows in the same order.
+
+Two frames join on an ``Enum`` column only if they share the dictionary. The
+person and season dictionaries are therefore taken from gold as a whole —
+``persons`` and ``player_seasons`` — rather than from whichever table is being
+loaded, and the direction dictionary is fixed by the leagues.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import polars as pl
+
+from hoopslab.paths import DataPaths
+from hoopslab.seasons import LEAGUES
+
+#: Every ordered pair of distinct leagues, whether or not anyone has made it.
+DIRECTIONS: tuple[str, ...] = tuple(
+    sorted(f"{source}->{target}" for source in LEAGUES for target in LEAGUES if source != target)
+)
+DIRECTION = pl.Enum(DIRECTIONS)
+
+#: Columns holding each kind of identifier, wherever they appear.
+PERSON_COLUMNS = ("person_id", "neighbour_person_id")
+SEASON_COLUMNS = ("season_id", "source_season_id", "target_season_id", "neighbour_season_id")
+DIRECTION_COLUMNS = ("direction",)
+
+
+@dataclass(frozen=True)
+class GoldKeys:
+    """The frozen person and season dictionaries of one gold snapshot."""
+
+    person: pl.Enum
+    season: pl.Enum
+
+    @classmethod
+    def from_frames(cls, *frames: pl.DataFrame) -> GoldKeys:
+        """Dictionaries covering every identifier in ``frames``."""
+        return cls(
+            person=pl.Enum(_distinct(frames, PERSON_COLUMNS)),
+            season=pl.Enum(_distinct(frames, SEASON_COLUMNS)),
+        )
+
+    @classmethod
+    def for_gold(cls, paths: DataPaths) -> GoldKeys:
+        """Dictionaries for the committed gold, read from two columns only."""
+        return cls.from_frames(
+            pl.read_parquet(paths.gold / "persons.parquet", columns=["person_id"]),
+            pl.read_parquet(paths.gold / "player_seasons.parquet", columns=["season_id"]),
+        )
+
+    def encode(self, frame: pl.DataFrame) -> pl.DataFrame:
+        """Replace each string identifier column in ``frame`` with its key."""
+        dtypes = {
+            **dict.fromkeys(PERSON_COLUMNS, self.person),
+            **dict.fromkeys(SEASON_COLUMNS, self.season),
+            **dict.fromkeys(DIRECTION_COLUMNS, DIRECTION),
+        }
+        return frame.with_columns(
+            pl.col(name).cast(dtype)
+            for name, dtype in dtypes.items()
+            if frame.schema.get(name) == pl.Utf8
+        )
+
+
+def decode(frame: pl.DataFrame) -> pl.DataFrame:
+    """Back to the string forms, for anything written out."""
+    return frame.with_columns(
+        pl.col(name).cast(pl.Utf8)
+        for name, dtype in frame.schema.items()
+        if isinstance(dtype, pl.Enum)
+    )
+
+
+def load_gold(paths: DataPaths, *names: str) -> tuple[pl.DataFrame, ...]:
+    """Gold tables with their identifiers encoded against one shared dictionary."""
+    keys = GoldKeys.for_gold(paths)
+    return tuple(keys.encode(pl.read_parquet(paths.gold / f"{name}.parquet")) for name in names)
+
+
+def _distinct(frames: tuple[pl.DataFrame, ...], columns: tuple[str, ...]) -> list[str]:
+    values: set[str] = set()
+    for frame in frames:
+        for name in columns:
+            if name in frame.columns:
+                values.update(frame[name].cast(pl.Utf8).drop_nulls().unique().to_list())
+    return sorted(values)
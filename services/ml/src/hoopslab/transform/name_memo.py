@@ -0,0 +1,171 @@
+"""Name normalisation for whole columns, memoised across builds.
+
+:mod:`hoopslab.transform.names` defines the rules, one string at a time, and
+stays the single source of truth for them. Applying those functions row by row
+through ``map_elements`` was the slowest part of silver: every call does an
+NFKD decomposition and four regex passes, tens of thousands of player-seasons
+pay it, and most of them repeat a name already seen in the previous season.
+
+So the work is arranged around the distinct names instead:
+
+* Only **unique raw values** are resolved, and each resolution is joined back.
+* Resolutions go into a **memo table**, a parquet file beside the published
+  bronze datasets, so the next build resolves only names it has never seen.
+  The file is named by a digest of ``names.py`` itself: change a rule and the
+  old memo is simply never read again, with no version number to forget.
+* Misses are resolved with **native polars expressions** wherever that is
+  provably the same computation. For printable ASCII it is — no diacritics to
+  decompose, and the regex classes and case mapping agree exactly between
+  Python and polars — which covers nearly every NBA name. Anything else goes
+  through the reference functions, which is also how the EuroLeague display
+  name is produced: its title-casing rules are fiddly and it only ever sees a
+  few thousand unique values.
+
+The test suite checks the result against the reference functions value for
+value, including the cases the fast path deliberately declines.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Literal
+
+import polars as pl
+
+from hoopslab.io.bronze import BronzeCache
+from hoopslab.transform import names
+from hoopslab.transform.consolidate import DATASETS_DIR
+
+log = logging.getLogger(__name__)
+
+#: How the raw value becomes a display name before it is normalised.
+#: ``plain`` keeps it as written; ``euroleague`` reorders ``LAST, FIRST``.
+Style = Literal["plain", "euroleague"]
+
+#: Identifies the rules a memo was computed under.
+RULES_DIGEST = hashlib.sha256(Path(names.__file__).read_bytes()).hexdigest()[:16]
+
+MEMO_DIR = "names"
+
+#: Column order of a resolved lookup; ``raw`` is the join key.
+LOOKUP_COLUMNS = ["raw", "player_name", "normalized_name", "match_key"]
+
+_SCHEMA = {"style": pl.Utf8, **dict.fromkeys(LOOKUP_COLUMNS, pl.Utf8)}
+
+#: Values the native path reproduces exactly. Outside this range Python and
+#: polars disagree at the edges (what counts as whitespace or a word
+#: character), and NFKD folding is needed anyway.
+_PRINTABLE_ASCII = r"^[ -~]*$"
+
+_INITIAL = r"^[a-z]$"
+
+
+def normalized_name_expr(value: pl.Expr) -> pl.Expr:
+    """:func:`names.normalize_name` as an expression, for printable ASCII only."""
+    tokens = (
+        value.str.to_lowercase()
+        .str.replace_all(r"[.'`]", "")
+        .str.replace_all(r"[^a-z0-9_ ]", " ")
+        .str.split(" ")
+        .list.eval(
+            pl.element().filter((pl.element() != "") & ~pl.element().is_in(sorted(names._SUFFIXES)))
+        )
+    )
+    # Each token is glued to the previous one when both are single letters,
+    # which is how a run of initials collapses; everything else is spaced.
+    initial = pl.element().str.contains(_INITIAL)
+    return (
+        tokens.list.eval(
+            pl.when(initial & initial.shift(1))
+            .then(pl.element())
+            .otherwise(pl.lit(" ") + pl.element())
+        )
+        .list.join("")
+        .str.strip_prefix(" ")
+    )
+
+
+def match_key_expr(normalized: pl.Expr) -> pl.Expr:
+    """:func:`names.match_key` from an already-normalised name.
+
+    Valid for every normalised value, ASCII or not: a normalised name is
+    single-spaced, and polars sorts strings by code point as Python does.
+    """
+    return normalized.str.split(" ").list.sort().list.join(" ")
+
+
+def resolve(raw: pl.Series, style: Style) -> pl.DataFrame:
+    """Resolve distinct non-null ``raw`` values, without a memo."""
+    distinct = raw.cast(pl.Utf8).drop_nulls().unique(maintain_order=True)
+    frame = pl.DataFrame({"raw": distinct})
+    if style == "euroleague":
+        display = [names.from_euroleague(v) for v in distinct.to_list()]
+        frame = frame.with_columns(pl.Series("player_name", display, dtype=pl.Utf8))
+    else:
+        frame = frame.with_columns(pl.col("raw").alias("player_name"))
+
+    fast = pl.col("player_name").str.contains(_PRINTABLE_ASCII)
+    frame = frame.with_columns(
+        pl.when(fast).then(normalized_name_expr(pl.col("player_name"))).alias("normalized_name")
+    )
+    slow = frame.filter(pl.col("normalized_name").is_null())
+    if not slow.is_empty():
+        reference = [names.normalize_name(v) for v in slow["player_name"].to_list()]
+        frame = frame.update(
+            slow.select("raw", pl.Series("normalized_name", reference, dtype=pl.Utf8)),
+            on="raw",
+        )
+    return frame.with_columns(match_key_expr(pl.col("normalized_name")).alias("match_key")).select(
+        LOOKUP_COLUMNS
+    )
+
+
+class NameMemo:
+    """Resolved names, kept on disk between builds.
+
+    ``path=None`` keeps the memo in memory only.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._table = pl.DataFrame(schema=_SCHEMA)
+        if path is not None and path.is_file():
+            self._table = pl.read_parquet(path).select(list(_SCHEMA))
+        self._dirty = False
+
+    @classmethod
+    def for_cache(cls, cache: BronzeCache) -> NameMemo:
+        return cls(cache.root / DATASETS_DIR / MEMO_DIR / f"{RULES_DIGEST}.parquet")
+
+    def __len__(self) -> int:
+        return self._table.height
+
+    def lookup(self, raw: pl.Series, style: Style) -> pl.DataFrame:
+        """One row per distinct non-null value of ``raw``, resolving any not yet seen."""
+        distinct = raw.cast(pl.Utf8).drop_nulls().unique().to_frame("raw")
+        known = self._table.filter(pl.col("style") == style).drop("style")
+        misses = distinct.join(known, on="raw", how="anti")
+        if not misses.is_empty():
+            resolved = resolve(misses["raw"], style)
+            log.info("resolved %d new %s names", resolved.height, style)
+            self._table = pl.concat(
+                [self._table, resolved.select(pl.lit(style).alias("style"), *LOOKUP_COLUMNS)]
+            )
+            known = pl.concat([known, resolved])
+            self._dirty = True
+        return known.join(distinct, on="raw", how="semi")
+
+    def save(self) -> None:
+        """Write the memo if it gained entries, and drop memos of older rules."""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        staging = self.path.with_suffix(".tmp")
+        self._table.write_parquet(staging)
+        staging.replace(self.path)
+        for stale in self.path.parent.glob("*.parquet"):
+            if stale != self.path:
+                stale.unlink(missing_ok=True)
+        self._dirty = False
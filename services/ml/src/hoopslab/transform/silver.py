@@ -6,19 +6,25 @@ implementation — see :mod:`hoopslab.transform.rates` for why that separation
 is load-bearing rather than tidiness.
 
 This module imports no client library, so silver and gold can be rebuilt on a
-machine that never installed the optional ``ingest`` extra.
+machine that never installed the optional ``ingest`` extra. It reads bronze
+straight into polars, through the per-endpoint datasets
+:mod:`hoopslab.transform.consolidate` publishes: each table is one lazy scan,
+not a loop of per-season reads. Pandas stays at the ingest boundary, where the
+client libraries return it.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Collection
 
-import pandas as pd
 import polars as pl
 
 from hoopslab.io.bronze import BronzeCache
-from hoopslab.seasons import Season, seasons_for
-from hoopslab.transform import names
+from hoopslab.seasons import seasons_for
+from hoopslab.transform import consolidate
+from hoopslab.transform.consolidate import ORDER_COLUMNS
+from hoopslab.transform.name_memo import NameMemo, Style
 
 log = logging.getLogger(__name__)
 
@@ -76,68 +82,58 @@ def _is_text(column: str) -> bool:
 # ---------------------------------------------------------------- NBA / G League
 
 
-def nba_player_seasons(cache: BronzeCache, league: str = "NBA") -> pl.DataFrame:
-    """Merge Base, Advanced and (for the NBA) Bio payloads into one row per player-season."""
-    frames: list[pl.DataFrame] = []
+def nba_player_seasons(
+    cache: BronzeCache, league: str = "NBA", seasons: Collection[str] | None = None
+) -> pl.DataFrame:
+    """Merge Base, Advanced and (for the NBA) Bio payloads into one row per player-season.
 
-    for season in seasons_for(league):  # type: ignore[arg-type]
-        base = cache.load(
-            "nba_stats",
-            "player_season_stats",
-            {
-                "season": season.nba_stats_season,
-                "measure_type": "Base",
-                "league_id": "00" if league == "NBA" else "20",
-            },
-        )
-        if base is None or base.empty:
-            log.warning("no Base payload for %s", season.season_id)
-            continue
+    ``seasons`` restricts the read to those season ids; partition pruning means
+    the others are never opened.
+    """
+    base = consolidate.scan(cache, "nba_player_stats")
+    if base is None:
+        _warn_missing(set(), league, "Base", seasons)
+        return _empty_player_season()
 
-        frame = _nba_base_to_silver(base, season)
-
-        # Age comes from the bio endpoint, which serves both leagues. Anyone it
-        # still misses is picked up by `fill_missing_age` from the same person's
-        # observation in another league.
-        bio = cache.load(
-            "nba_stats",
-            "player_bio_stats",
-            {
-                "season": season.nba_stats_season,
-                "league_id": "00" if league == "NBA" else "20",
-            },
-        )
-        if bio is not None and not bio.empty:
-            ages = pl.from_pandas(bio[["PLAYER_ID", "AGE"]]).select(
-                pl.col("PLAYER_ID").cast(pl.Utf8).alias("source_player_id"),
-                pl.col("AGE").cast(pl.Float64).alias("age"),
+    players = _with_names(
+        cache,
+        _nba_base_to_silver(
+            base.filter(
+                (pl.col("measure_type") == "Base")
+                & (pl.col("league") == league)
+                & _in_seasons(seasons)
             )
-            frame = frame.drop("age").join(ages, on="source_player_id", how="left")
+        ),
+        "plain",
+    )
 
-        frames.append(frame.select(PLAYER_SEASON_COLUMNS))
+    # Age comes from the bio endpoint, which serves both leagues. Anyone it
+    # still misses is picked up by `fill_missing_age` from the same person's
+    # observation in another league.
+    bio = consolidate.scan(cache, "nba_player_bio")
+    if bio is not None:
+        ages = bio.filter((pl.col("league") == league) & _in_seasons(seasons)).select(
+            "season_id",
+            pl.col("PLAYER_ID").cast(pl.Utf8).alias("source_player_id"),
+            pl.col("AGE").cast(pl.Float64).alias("age"),
+        )
+        players = players.drop("age").join(ages, on=["season_id", "source_player_id"], how="left")
 
-    if not frames:
+    frame = _in_payload_order(players).select(PLAYER_SEASON_COLUMNS)
+    _warn_missing(set(frame["season_id"].unique()), league, "Base", seasons)
+    if frame.is_empty():
         return _empty_player_season()
-    return pl.concat(frames, how="vertical_relaxed")
-
+    return frame
 
-def _nba_base_to_silver(base: pd.DataFrame, season: Season) -> pl.DataFrame:
-    frame = pl.from_pandas(base)
 
-    return frame.select(
-        pl.lit(season.season_id).alias("season_id"),
-        pl.lit(season.league).alias("league"),
-        pl.lit(season.start_year).cast(pl.Float64).alias("start_year"),
+def _nba_base_to_silver(base: pl.LazyFrame) -> pl.LazyFrame:
+    return base.select(
+        *ORDER_COLUMNS,
+        pl.col("season_id"),
+        pl.col("league"),
+        pl.col("start_year").cast(pl.Float64).alias("start_year_f"),
         pl.col("PLAYER_ID").cast(pl.Utf8).alias("source_player_id"),
-        pl.col("PLAYER_NAME").cast(pl.Utf8).alias("player_name"),
-        pl.col("PLAYER_NAME")
-        .cast(pl.Utf8)
-        .map_elements(names.normalize_name, return_dtype=pl.Utf8)
-        .alias("normalized_name"),
-        pl.col("PLAYER_NAME")
-        .cast(pl.Utf8)
-        .map_elements(names.match_key, return_dtype=pl.Utf8)
-        .alias("match_key"),
+        pl.col("PLAYER_NAME").cast(pl.Utf8).alias("_raw_name"),
         pl.col("TEAM_ID").cast(pl.Utf8).alias("source_team_id"),
         pl.col("TEAM_ABBREVIATION").cast(pl.Utf8).alias("team_name"),
         pl.col("GP").cast(pl.Float64).alias("gp"),
@@ -161,7 +157,50 @@ def _nba_base_to_silver(base: pd.DataFrame, season: Season) -> pl.DataFrame:
     )
 
 
-def nba_official_rates(cache: BronzeCache, league: str = "NBA") -> pl.DataFrame:
+def _with_names(cache: BronzeCache, frame: pl.LazyFrame, style: Style) -> pl.LazyFrame:
+    """Swap ``_raw_name`` for the display, normalised and match-key columns.
+
+    Names are resolved once per distinct value through the memo, not per row.
+    """
+    memo = NameMemo.for_cache(cache)
+    lookup = memo.lookup(frame.select("_raw_name").unique().collect().to_series(), style)
+    memo.save()
+    return frame.join(lookup.lazy().rename({"raw": "_raw_name"}), on="_raw_name", how="left").drop(
+        "_raw_name"
+    )
+
+
+def _in_payload_order(frame: pl.LazyFrame) -> pl.DataFrame:
+    """Collect in the order the per-season, per-payload reads used to produce.
+
+    ``start_year`` arrives as the published integer and leaves as the Float64
+    the silver schema has always used.
+    """
+    return (
+        frame.sort(ORDER_COLUMNS, maintain_order=True)
+        .drop(ORDER_COLUMNS)
+        .rename({"start_year_f": "start_year"}, strict=False)
+        .collect()
+    )
+
+
+def _in_seasons(seasons: Collection[str] | None) -> pl.Expr:
+    return pl.lit(True) if seasons is None else pl.col("season_id").is_in(sorted(seasons))
+
+
+def _warn_missing(
+    present: set[str], league: str, what: str, seasons: Collection[str] | None = None
+) -> None:
+    for season in seasons_for(league):  # type: ignore[arg-type]
+        if seasons is not None and season.season_id not in seasons:
+            continue
+        if season.season_id not in present:
+            log.warning("no %s payload for %s", what, season.season_id)
+
+
+def nba_official_rates(
+    cache: BronzeCache, league: str = "NBA", seasons: Collection[str] | None = None
+) -> pl.DataFrame:
     """The league's own USG%/TS%, carried through purely to validate ours.
 
     These are never served and never used as model features. A data-contract
@@ -169,24 +208,17 @@ def nba_official_rates(cache: BronzeCache, league: str = "NBA") -> pl.DataFrame:
     derives from counting stats; a divergence means the shared formula is
     wrong, which would otherwise be invisible inside a fitted coefficient.
     """
-    frames: list[pl.DataFrame] = []
-
-    for season in seasons_for(league):  # type: ignore[arg-type]
-        advanced = cache.load(
-            "nba_stats",
-            "player_season_stats",
-            {
-                "season": season.nba_stats_season,
-                "measure_type": "Advanced",
-                "league_id": "00" if league == "NBA" else "20",
-            },
-        )
-        if advanced is None or advanced.empty:
-            continue
-
-        frames.append(
-            pl.from_pandas(advanced).select(
-                pl.lit(season.season_id).alias("season_id"),
+    stats = consolidate.scan(cache, "nba_player_stats")
+    # Without a single Advanced payload the dataset has no rate columns at all.
+    if stats is not None and "USG_PCT" in stats.collect_schema().names():
+        official = _in_payload_order(
+            stats.filter(
+                (pl.col("measure_type") == "Advanced")
+                & (pl.col("league") == league)
+                & _in_seasons(seasons)
+            ).select(
+                *ORDER_COLUMNS,
+                pl.col("season_id"),
                 pl.col("PLAYER_ID").cast(pl.Utf8).alias("source_player_id"),
                 pl.col("USG_PCT").cast(pl.Float64).alias("official_usg_pct"),
                 pl.col("TS_PCT").cast(pl.Float64).alias("official_ts_pct"),
@@ -195,20 +227,20 @@ def nba_official_rates(cache: BronzeCache, league: str = "NBA") -> pl.DataFrame:
                 pl.col("DREB_PCT").cast(pl.Float64).alias("official_dreb_pct"),
             )
         )
+        if not official.is_empty():
+            return official
 
-    if not frames:
-        return pl.DataFrame(
-            schema={
-                "season_id": pl.Utf8,
-                "source_player_id": pl.Utf8,
-                "official_usg_pct": pl.Float64,
-                "official_ts_pct": pl.Float64,
-                "official_ast_pct": pl.Float64,
-                "official_oreb_pct": pl.Float64,
-                "official_dreb_pct": pl.Float64,
-            }
-        )
-    return pl.concat(frames, how="vertical_relaxed")
+    return pl.DataFrame(
+        schema={
+            "season_id": pl.Utf8,
+            "source_player_id": pl.Utf8,
+            "official_usg_pct": pl.Float64,
+            "official_ts_pct": pl.Float64,
+            "official_ast_pct": pl.Float64,
+            "official_oreb_pct": pl.Float64,
+            "official_dreb_pct": pl.Float64,
+        }
+    )
 
 
 def team_seasons_from_players(player_seasons: pl.DataFrame) -> pl.DataFrame:
@@ -255,49 +287,37 @@ def nba_team_seasons(cache: BronzeCache, league: str = "NBA") -> pl.DataFrame:
     there about the two incompatible definitions of team minutes. Not used as
     the usage-rate denominator.
     """
-    frames: list[pl.DataFrame] = []
-
-    for season in seasons_for(league):  # type: ignore[arg-type]
-        base = cache.load(
-            "nba_stats",
-            "team_season_stats",
-            {
-                "season": season.nba_stats_season,
-                "measure_type": "Base",
-                "league_id": "00" if league == "NBA" else "20",
-            },
-        )
-        if base is None or base.empty:
-            continue
+    stats = consolidate.scan(cache, "nba_team_stats")
+    if stats is None:
+        return pl.DataFrame()
 
-        frames.append(
-            pl.from_pandas(base).select(
-                pl.lit(season.season_id).alias("season_id"),
-                pl.lit(season.league).alias("league"),
-                pl.col("TEAM_ID").cast(pl.Utf8).alias("source_team_id"),
-                pl.col("TEAM_NAME").cast(pl.Utf8).alias("team_name"),
-                pl.col("GP").cast(pl.Float64).alias("team_gp"),
-                pl.col("MIN").cast(pl.Float64).alias("team_minutes"),
-                pl.col("FGA").cast(pl.Float64).alias("team_fga"),
-                pl.col("FGM").cast(pl.Float64).alias("team_fgm"),
-                pl.col("FTA").cast(pl.Float64).alias("team_fta"),
-                pl.col("TOV").cast(pl.Float64).alias("team_tov"),
-                pl.col("PTS").cast(pl.Float64).alias("team_pts"),
-                pl.col("AST").cast(pl.Float64).alias("team_ast"),
-                pl.col("OREB").cast(pl.Float64).alias("team_oreb"),
-                pl.col("DREB").cast(pl.Float64).alias("team_dreb"),
-            )
+    return _in_payload_order(
+        stats.filter((pl.col("measure_type") == "Base") & (pl.col("league") == league)).select(
+            *ORDER_COLUMNS,
+            pl.col("season_id"),
+            pl.col("league"),
+            pl.col("TEAM_ID").cast(pl.Utf8).alias("source_team_id"),
+            pl.col("TEAM_NAME").cast(pl.Utf8).alias("team_name"),
+            pl.col("GP").cast(pl.Float64).alias("team_gp"),
+            pl.col("MIN").cast(pl.Float64).alias("team_minutes"),
+            pl.col("FGA").cast(pl.Float64).alias("team_fga"),
+            pl.col("FGM").cast(pl.Float64).alias("team_fgm"),
+            pl.col("FTA").cast(pl.Float64).alias("team_fta"),
+            pl.col("TOV").cast(pl.Float64).alias("team_tov"),
+            pl.col("PTS").cast(pl.Float64).alias("team_pts"),
+            pl.col("AST").cast(pl.Float64).alias("team_ast"),
+            pl.col("OREB").cast(pl.Float64).alias("team_oreb"),
+            pl.col("DREB").cast(pl.Float64).alias("team_dreb"),
         )
-
-    if not frames:
-        return pl.DataFrame()
-    return pl.concat(frames, how="vertical_relaxed")
+    )
 
 
 # ------------------------------------------------------------------ EuroLeague
 
 
-def euroleague_player_seasons(cache: BronzeCache) -> pl.DataFrame:
+def euroleague_player_seasons(
+    cache: BronzeCache, seasons: Collection[str] | None = None
+) -> pl.DataFrame:
     """EuroLeague accumulated stats, mapped into the shared schema.
 
     Two source quirks are handled here:
@@ -307,36 +327,21 @@ def euroleague_player_seasons(cache: BronzeCache) -> pl.DataFrame:
       from counting stats anyway.
     * ``minutesPlayed`` is a decimal number of minutes, not ``MM:SS``.
     """
-    frames: list[pl.DataFrame] = []
-
-    for season in seasons_for("EL"):
-        raw = cache.load(
-            "euroleague",
-            "player_season_stats",
-            {"season": season.euroleague_season, "statistic_mode": "Accumulated"},
-        )
-        if raw is None or raw.empty:
-            log.warning("no EuroLeague payload for %s", season.season_id)
-            continue
-
-        frame = pl.from_pandas(raw)
-        display = (
-            pl.col("player.name")
-            .cast(pl.Utf8)
-            .map_elements(names.from_euroleague, return_dtype=pl.Utf8)
-        )
+    raw = consolidate.scan(cache, "euroleague_player_stats")
+    if raw is None:
+        _warn_missing(set(), "EL", "EuroLeague", seasons)
+        return _empty_player_season()
 
-        frames.append(
-            frame.select(
-                pl.lit(season.season_id).alias("season_id"),
+    frame = _in_payload_order(
+        _with_names(
+            cache,
+            raw.filter(_in_seasons(seasons)).select(
+                *ORDER_COLUMNS,
+                pl.col("season_id"),
                 pl.lit("EL").alias("league"),
-                pl.lit(season.start_year).cast(pl.Float64).alias("start_year"),
+                pl.col("start_year").cast(pl.Float64).alias("start_year_f"),
                 pl.col("player.code").cast(pl.Utf8).alias("source_player_id"),
-                display.alias("player_name"),
-                display.map_elements(names.normalize_name, return_dtype=pl.Utf8).alias(
-                    "normalized_name"
-                ),
-                display.map_elements(names.match_key, return_dtype=pl.Utf8).alias("match_key"),
+                pl.col("player.name").cast(pl.Utf8).alias("_raw_name"),
                 pl.col("player.team.code").cast(pl.Utf8).alias("source_team_id"),
                 pl.col("player.team.name").cast(pl.Utf8).alias("team_name"),
                 pl.col("gamesPlayed").cast(pl.Float64).alias("gp"),
@@ -363,12 +368,15 @@ def euroleague_player_seasons(cache: BronzeCache) -> pl.DataFrame:
                 pl.col("blocks").cast(pl.Float64).alias("blk"),
                 pl.col("foulsCommited").cast(pl.Float64).alias("pf"),
                 pl.col("player.age").cast(pl.Float64).alias("age"),
-            )
+            ),
+            "euroleague",
         )
+    ).select(PLAYER_SEASON_COLUMNS)
 
-    if not frames:
+    _warn_missing(set(frame["season_id"].unique()), "EL", "EuroLeague", seasons)
+    if frame.is_empty():
         return _empty_player_season()
-    return pl.concat(frames, how="vertical_relaxed").select(PLAYER_SEASON_COLUMNS)
+    return frame
 
 
 def euroleague_team_seasons(cache: BronzeCache) -> pl.DataFrame:
@@ -2,11 +2,23 @@
 
 These are the checks that catch real bugs, and each one exists because of a
 specific failure this project already had or narrowly avoided.
+
+Each check is written as the reductions it needs from one table and a verdict
+on their values, rather than as its own pass over the data. :func:`run_all`
+gathers every check's reductions on a table into one lazy ``select`` and
+collects it once, so the cost of verifying gold grows with its size, not with
+its size times the number of checks. A check that needs a second table — an
+identity's person, a pair's seasons — reads only that table's key column,
+joined onto its own before the scan.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
 
 import polars as pl
 
@@ -36,31 +48,124 @@ class CheckResult:
         return f"[{'PASS' if self.passed else 'FAIL'}] {self.name}: {self.detail}"
 
 
-def run_all(tables: dict[str, pl.DataFrame]) -> list[CheckResult]:
-    players = tables["player_seasons"]
-    identities = tables["player_identities"]
-    persons = tables["persons"]
-    pairs = tables["transition_pairs"]
-
-    return [
-        *rate_agreement(players),
-        no_non_finite(players),
-        rates_in_range(players),
-        identities_are_unique(identities),
-        every_identity_has_a_person(identities, persons),
-        unnamed_persons_are_rare(persons),
-        every_player_season_resolves(players),
-        pairs_change_league(pairs),
-        pairs_respect_gap(pairs),
-        pairs_have_one_row_per_landing(pairs),
-        pairs_have_one_row_per_departure(pairs),
-        pairs_reference_real_seasons(pairs, players),
-        minutes_are_non_negative(players),
-        shots_made_not_exceed_attempts(players),
-    ]
-
-
-def rate_agreement(players: pl.DataFrame) -> list[CheckResult]:
+@dataclass(frozen=True)
+class Rule:
+    """What a check reads from its table, and what it concludes from it.
+
+    ``reductions`` are scalar expressions over the table; ``verdict`` receives
+    their values under the same names and returns ``(passed, detail)``.
+    """
+
+    reductions: dict[str, pl.Expr]
+    verdict: Callable[[dict[str, Any]], tuple[bool, str]]
+
+
+@dataclass(frozen=True)
+class Check:
+    name: str
+    table: str
+    rule: Callable[[pl.Schema], Rule]
+
+
+@dataclass
+class CheckReport:
+    """Results in check order, with where the time went."""
+
+    results: list[CheckResult]
+    #: Seconds to scan each table once for every check on it.
+    table_seconds: dict[str, float] = field(default_factory=dict)
+    #: Seconds each check's reductions take when collected alone. Only
+    #: measured on request, since it costs one more pass per check.
+    check_seconds: dict[str, float] = field(default_factory=dict)
+
+    def render_timings(self) -> str:
+        lines = [
+            f"  {name:<36} {seconds * 1000:>8.1f} ms  (one scan)"
+            for name, seconds in self.table_seconds.items()
+        ]
+        lines.extend(
+            f"    {name:<34} {seconds * 1000:>8.1f} ms  (alone)"
+            for name, seconds in sorted(self.check_seconds.items(), key=lambda kv: -kv[1])
+        )
+        return "\n".join(lines)
+
+
+def run_all(tables: Mapping[str, pl.DataFrame | pl.LazyFrame]) -> list[CheckResult]:
+    return run_checks(tables).results
+
+
+def run_checks(
+    tables: Mapping[str, pl.DataFrame | pl.LazyFrame], *, time_checks: bool = False
+) -> CheckReport:
+    """Every check, with one scan per table.
+
+    ``time_checks`` additionally collects each check's reductions on their own,
+    for a per-check breakdown of what the fused scan is spending.
+    """
+    frames = _prepared(tables)
+    schemas = {name: frame.collect_schema() for name, frame in frames.items()}
+    rules = {check.name: check.rule(schemas[check.table]) for check in CHECKS}
+
+    report = CheckReport(results=[])
+    values: dict[str, dict[str, Any]] = {check.name: {} for check in CHECKS}
+    for table, frame in frames.items():
+        on_table = [check for check in CHECKS if check.table == table]
+        reductions = [
+            expr.alias(f"{check.name}/{key}")
+            for check in on_table
+            for key, expr in rules[check.name].reductions.items()
+        ]
+        if not reductions:
+            continue
+        started = time.perf_counter()
+        row = frame.select(reductions).collect().row(0, named=True)
+        report.table_seconds[table] = time.perf_counter() - started
+        for column, value in row.items():
+            check_name, _, key = column.partition("/")
+            values[check_name][key] = value
+
+        if time_checks:
+            for check in on_table:
+                if not rules[check.name].reductions:
+                    continue
+                started = time.perf_counter()
+                frame.select(
+                    expr.alias(key) for key, expr in rules[check.name].reductions.items()
+                ).collect()
+                report.check_seconds[check.name] = time.perf_counter() - started
+
+    for check in CHECKS:
+        passed, detail = rules[check.name].verdict(values[check.name])
+        report.results.append(CheckResult(check.name, passed, detail))
+    return report
+
+
+def _prepared(tables: Mapping[str, pl.DataFrame | pl.LazyFrame]) -> dict[str, pl.LazyFrame]:
+    """One lazy frame per table, with the keys of the tables it refers to attached.
+
+    A left join against the other table's distinct keys adds one flag column
+    and keeps every row, so the reductions still see the table as it is.
+    """
+    frames = {name: frame.lazy() for name, frame in tables.items()}
+
+    def known(table: str, column: str, flag: str) -> pl.LazyFrame:
+        return frames[table].select(column).unique().with_columns(pl.lit(True).alias(flag))
+
+    persons = known("persons", "person_id", "_person_known")
+    frames["player_identities"] = frames["player_identities"].join(
+        persons, on="person_id", how="left"
+    )
+    for side in ("source", "target"):
+        seasons = known("player_seasons", "season_id", f"_{side}_known").rename(
+            {"season_id": f"{side}_season_id"}
+        )
+        frames["transition_pairs"] = frames["transition_pairs"].join(
+            seasons, on=f"{side}_season_id", how="left"
+        )
+    return frames
+
+
+def rate_agreement(metric: str, schema: pl.Schema) -> Rule:
     """Our formulas must reproduce the league's own published rates.
 
     The single most valuable check in the project. Cross-league coefficients
@@ -68,101 +173,103 @@ def rate_agreement(players: pl.DataFrame) -> list[CheckResult]:
     formula error would otherwise be absorbed silently into the estimate rather
     than surfacing as a failure.
     """
-    results: list[CheckResult] = []
-
-    for metric, tolerance in MAX_RATE_DISAGREEMENT.items():
-        official = f"official_{metric}"
-        if official not in players.columns:
-            results.append(
-                CheckResult(f"rate_agreement:{metric}", False, "official series missing")
-            )
-            continue
-
-        cohort = players.filter(
-            pl.col("qualified") & pl.col(metric).is_not_null() & pl.col(official).is_not_null()
-        )
-        if cohort.is_empty():
-            results.append(CheckResult(f"rate_agreement:{metric}", False, "no comparable rows"))
-            continue
-
-        mad = cohort.select((pl.col(metric) - pl.col(official)).abs().mean()).item()
-        results.append(
-            CheckResult(
-                f"rate_agreement:{metric}",
-                mad <= tolerance,
-                f"MAD {mad:.5f} against tolerance {tolerance} over n={cohort.height}",
-            )
+    official = f"official_{metric}"
+    tolerance = MAX_RATE_DISAGREEMENT[metric]
+    if official not in schema:
+        return Rule({}, lambda _: (False, "official series missing"))
+
+    cohort = pl.col("qualified") & pl.col(metric).is_not_null() & pl.col(official).is_not_null()
+
+    def verdict(v: dict[str, Any]) -> tuple[bool, str]:
+        if not v["n"]:
+            return False, "no comparable rows"
+        return (
+            v["mad"] <= tolerance,
+            f"MAD {v['mad']:.5f} against tolerance {tolerance} over n={v['n']}",
         )
 
-    return results
+    return Rule(
+        {
+            "n": cohort.sum(),
+            "mad": (pl.col(metric) - pl.col(official)).abs().filter(cohort).mean(),
+        },
+        verdict,
+    )
 
 
-def no_non_finite(players: pl.DataFrame) -> CheckResult:
+def no_non_finite(schema: pl.Schema) -> Rule:
     """NaN and infinity are illegal in gold.
 
     The previous version's SQL writer serialised them as the bare tokens
     ``nan`` and ``inf``, which are not valid SQLite and would abort a load
     partway through, leaving the database half-updated.
     """
-    numeric = [c for c, t in zip(players.columns, players.dtypes, strict=True) if t.is_numeric()]
-    offenders = {
-        c: n
-        for c in numeric
-        if (n := players.select(pl.col(c).is_infinite().sum()).item() or 0) > 0
-    }
-    return CheckResult(
-        "no_non_finite",
-        not offenders,
-        "clean" if not offenders else f"infinite values in {offenders}",
-    )
+    numeric = [name for name, dtype in schema.items() if dtype.is_numeric()]
 
+    def verdict(v: dict[str, Any]) -> tuple[bool, str]:
+        offenders = {c: n for c in numeric if (n := v[c] or 0) > 0}
+        return not offenders, "clean" if not offenders else f"infinite values in {offenders}"
 
-def rates_in_range(players: pl.DataFrame) -> CheckResult:
-    """Rates that are fractions must lie in [0, 1]."""
-    bounds = {"ts_pct": (0.0, 1.2), "usg_pct": (0.0, 1.0), "tov_rate": (0.0, 1.0)}
-    problems = []
+    return Rule({c: pl.col(c).is_infinite().sum() for c in numeric}, verdict)
 
-    qualified = players.filter(pl.col("qualified"))
-    for column, (low, high) in bounds.items():
-        if column not in players.columns:
-            continue
-        out = qualified.filter(
-            pl.col(column).is_not_null() & ((pl.col(column) < low) | (pl.col(column) > high))
-        ).height
-        if out:
-            problems.append(f"{column}: {out} rows outside [{low}, {high}]")
 
-    return CheckResult("rates_in_range", not problems, "; ".join(problems) or "all within bounds")
+#: Bounds for the rates that are fractions; true shooting can exceed one.
+RATE_BOUNDS = {"ts_pct": (0.0, 1.2), "usg_pct": (0.0, 1.0), "tov_rate": (0.0, 1.0)}
 
 
-def identities_are_unique(identities: pl.DataFrame) -> CheckResult:
+def rates_in_range(schema: pl.Schema) -> Rule:
+    """Rates that are fractions must lie in [0, 1]."""
+    bounds = {c: b for c, b in RATE_BOUNDS.items() if c in schema}
+
+    def verdict(v: dict[str, Any]) -> tuple[bool, str]:
+        problems = [
+            f"{column}: {v[column]} rows outside [{low}, {high}]"
+            for column, (low, high) in bounds.items()
+            if v[column]
+        ]
+        return not problems, "; ".join(problems) or "all within bounds"
+
+    return Rule(
+        {
+            column: (
+                pl.col("qualified")
+                & pl.col(column).is_not_null()
+                & ((pl.col(column) < low) | (pl.col(column) > high))
+            ).sum()
+            for column, (low, high) in bounds.items()
+        },
+        verdict,
+    )
+
+
+def identities_are_unique(_: pl.Schema) -> Rule:
     """Each (league, source id) maps to exactly one person.
 
     Injectivity in this direction is what stops one human being being counted
     twice in a transition cohort.
     """
-    duplicated = (
-        identities.group_by(["league", "source_player_id"])
-        .agg(pl.n_unique("person_id").alias("n"))
-        .filter(pl.col("n") > 1)
-    )
-    return CheckResult(
-        "identities_are_unique",
-        duplicated.is_empty(),
-        "one person per source id"
-        if duplicated.is_empty()
-        else f"{duplicated.height} source ids map to multiple persons",
-    )
+    key = ["league", "source_player_id"]
+
+    def verdict(v: dict[str, Any]) -> tuple[bool, str]:
+        return (
+            v["n"] == 0,
+            "one person per source id"
+            if v["n"] == 0
+            else f"{v['n']} source ids map to multiple persons",
+        )
 
+    return Rule({"n": _groups_where(pl.col("person_id").n_unique().over(key) > 1, key)}, verdict)
 
-def every_identity_has_a_person(identities: pl.DataFrame, persons: pl.DataFrame) -> CheckResult:
-    known = set(persons["person_id"].to_list())
-    orphans = [p for p in identities["person_id"].unique().to_list() if p not in known]
-    return CheckResult(
-        "every_identity_has_a_person",
-        not orphans,
-        "all resolve" if not orphans else f"{len(orphans)} person ids missing from persons",
-    )
+
+def every_identity_has_a_person(_: pl.Schema) -> Rule:
+    def verdict(v: dict[str, Any]) -> tuple[bool, str]:
+        return (
+            v["n"] == 0,
+            "all resolve" if v["n"] == 0 else f"{v['n']} person ids missing from persons",
+        )
+
+    orphans = pl.col("person_id").filter(pl.col("_person_known").is_null()).n_unique()
+    return Rule({"n": orphans}, verdict)
 
 
 #: A handful of G League rows arrive from the source with no name at all. They
@@ -173,78 +280,80 @@ def every_identity_has_a_person(identities: pl.DataFrame, persons: pl.DataFrame)
 MAX_UNNAMED_PERSONS = 10
 
 
-def unnamed_persons_are_rare(persons: pl.DataFrame) -> CheckResult:
+def unnamed_persons_are_rare(_: pl.Schema) -> Rule:
     """Missing names are tolerated, but only at the scale the source actually has.
 
     Inventing a placeholder name would be fabrication; the honest handling is a
     null display name plus a ceiling on how many of them there may be.
     """
-    unnamed = persons.filter(
-        pl.col("display_name").is_null() | (pl.col("display_name").str.strip_chars() == "")
-    ).height
-    return CheckResult(
-        "unnamed_persons_are_rare",
-        unnamed <= MAX_UNNAMED_PERSONS,
-        f"{unnamed} of {persons.height} persons have no name (ceiling {MAX_UNNAMED_PERSONS})",
-    )
+    unnamed = pl.col("display_name").is_null() | (pl.col("display_name").str.strip_chars() == "")
 
+    def verdict(v: dict[str, Any]) -> tuple[bool, str]:
+        return (
+            v["unnamed"] <= MAX_UNNAMED_PERSONS,
+            f"{v['unnamed']} of {v['n']} persons have no name (ceiling {MAX_UNNAMED_PERSONS})",
+        )
 
-def every_player_season_resolves(players: pl.DataFrame) -> CheckResult:
-    unresolved = players.filter(pl.col("person_id").is_null()).height
-    return CheckResult(
-        "every_player_season_resolves",
-        unresolved == 0,
-        "all seasons carry a person id"
-        if unresolved == 0
-        else f"{unresolved} player-seasons have no person id",
-    )
+    return Rule({"unnamed": unnamed.sum(), "n": pl.len()}, verdict)
 
 
-def pairs_change_league(pairs: pl.DataFrame) -> CheckResult:
-    same = pairs.filter(pl.col("source_league") == pl.col("target_league")).height
-    return CheckResult(
-        "pairs_change_league",
-        same == 0,
-        "every pair crosses leagues" if same == 0 else f"{same} pairs share a league",
-    )
+def every_player_season_resolves(_: pl.Schema) -> Rule:
+    def verdict(v: dict[str, Any]) -> tuple[bool, str]:
+        return (
+            v["n"] == 0,
+            "all seasons carry a person id"
+            if v["n"] == 0
+            else f"{v['n']} player-seasons have no person id",
+        )
+
+    return Rule({"n": pl.col("person_id").is_null().sum()}, verdict)
+
+
+def pairs_change_league(_: pl.Schema) -> Rule:
+    def verdict(v: dict[str, Any]) -> tuple[bool, str]:
+        return (
+            v["n"] == 0,
+            "every pair crosses leagues" if v["n"] == 0 else f"{v['n']} pairs share a league",
+        )
 
+    return Rule({"n": (pl.col("source_league") == pl.col("target_league")).sum()}, verdict)
 
-def pairs_respect_gap(pairs: pl.DataFrame) -> CheckResult:
+
+def pairs_respect_gap(_: pl.Schema) -> Rule:
     """A transition must move forward in time, by one or two seasons.
 
     A zero or negative gap would mean the target season is being used to
     predict the source, which is leakage in its most direct form.
     """
-    bad = pairs.filter(~pl.col("gap_seasons").is_between(1, 2)).height
-    return CheckResult(
-        "pairs_respect_gap",
-        bad == 0,
-        "all gaps in [1, 2]" if bad == 0 else f"{bad} pairs have an invalid gap",
-    )
 
+    def verdict(v: dict[str, Any]) -> tuple[bool, str]:
+        return (
+            v["n"] == 0,
+            "all gaps in [1, 2]" if v["n"] == 0 else f"{v['n']} pairs have an invalid gap",
+        )
+
+    return Rule({"n": (~pl.col("gap_seasons").is_between(1, 2)).sum()}, verdict)
 
-def pairs_have_one_row_per_landing(pairs: pl.DataFrame) -> CheckResult:
+
+def pairs_have_one_row_per_landing(_: pl.Schema) -> Rule:
     """Each observed arrival appears exactly once.
 
     A player with two qualifying seasons before a move otherwise produces two
     rows sharing one target season, which duplicates the response variable and
     silently doubles that player's weight in the fit.
     """
-    duplicated = (
-        pairs.group_by(["person_id", "target_season_id", "direction"])
-        .agg(pl.len().alias("n"))
-        .filter(pl.col("n") > 1)
-    )
-    return CheckResult(
-        "pairs_have_one_row_per_landing",
-        duplicated.is_empty(),
-        "one row per arrival"
-        if duplicated.is_empty()
-        else f"{duplicated.height} arrivals appear more than once",
-    )
+    key = ["person_id", "target_season_id", "direction"]
+
+    def verdict(v: dict[str, Any]) -> tuple[bool, str]:
+        return (
+            v["n"] == 0,
+            "one row per arrival" if v["n"] == 0 else f"{v['n']} arrivals appear more than once",
+        )
 
+    return Rule({"n": _groups_where(pl.len().over(key) > 1, key)}, verdict)
 
-def pairs_have_one_row_per_departure(pairs: pl.DataFrame) -> CheckResult:
+
+def pairs_have_one_row_per_departure(_: pl.Schema) -> Rule:
     """Each source season is used at most once per direction.
 
     The mirror of the landing check. One source season with both a one- and a
@@ -252,50 +361,81 @@ def pairs_have_one_row_per_departure(pairs: pl.DataFrame) -> CheckResult:
     departure twice — and would collide with the serving primary key, which is
     how this was found.
     """
-    duplicated = (
-        pairs.group_by(["person_id", "source_season_id", "direction"])
-        .agg(pl.len().alias("n"))
-        .filter(pl.col("n") > 1)
-    )
-    return CheckResult(
-        "pairs_have_one_row_per_departure",
-        duplicated.is_empty(),
-        "one row per departure"
-        if duplicated.is_empty()
-        else f"{duplicated.height} departures appear more than once",
-    )
+    key = ["person_id", "source_season_id", "direction"]
+
+    def verdict(v: dict[str, Any]) -> tuple[bool, str]:
+        return (
+            v["n"] == 0,
+            "one row per departure"
+            if v["n"] == 0
+            else f"{v['n']} departures appear more than once",
+        )
 
+    return Rule({"n": _groups_where(pl.len().over(key) > 1, key)}, verdict)
 
-def pairs_reference_real_seasons(pairs: pl.DataFrame, players: pl.DataFrame) -> CheckResult:
-    known = set(players["season_id"].unique().to_list())
-    missing = {
-        s
-        for column in ("source_season_id", "target_season_id")
-        for s in pairs[column].unique().to_list()
-        if s not in known
-    }
-    return CheckResult(
-        "pairs_reference_real_seasons",
-        not missing,
-        "all seasons exist" if not missing else f"unknown seasons: {sorted(missing)[:5]}",
-    )
 
+def pairs_reference_real_seasons(_: pl.Schema) -> Rule:
+    def unknown(side: str) -> pl.Expr:
+        column = pl.col(f"{side}_season_id")
+        return column.filter(pl.col(f"_{side}_known").is_null()).unique().implode()
 
-def minutes_are_non_negative(players: pl.DataFrame) -> CheckResult:
-    bad = players.filter(pl.col("minutes") < 0).height
-    return CheckResult(
-        "minutes_are_non_negative", bad == 0, "clean" if bad == 0 else f"{bad} negative rows"
-    )
+    def verdict(v: dict[str, Any]) -> tuple[bool, str]:
+        missing = {*v["source"], *v["target"]}
+        return (
+            not missing,
+            "all seasons exist"
+            if not missing
+            else f"unknown seasons: {sorted(missing, key=str)[:5]}",
+        )
+
+    return Rule({"source": unknown("source"), "target": unknown("target")}, verdict)
+
+
+def minutes_are_non_negative(_: pl.Schema) -> Rule:
+    def verdict(v: dict[str, Any]) -> tuple[bool, str]:
+        return v["n"] == 0, "clean" if v["n"] == 0 else f"{v['n']} negative rows"
 
+    return Rule({"n": (pl.col("minutes") < 0).sum()}, verdict)
 
-def shots_made_not_exceed_attempts(players: pl.DataFrame) -> CheckResult:
-    bad = players.filter(
+
+def shots_made_not_exceed_attempts(_: pl.Schema) -> Rule:
+    over = (
         (pl.col("fgm") > pl.col("fga"))
         | (pl.col("fg3m") > pl.col("fg3a"))
         | (pl.col("ftm") > pl.col("fta"))
-    ).height
-    return CheckResult(
-        "shots_made_not_exceed_attempts",
-        bad == 0,
-        "clean" if bad == 0 else f"{bad} rows make more than they attempt",
     )
+
+    def verdict(v: dict[str, Any]) -> tuple[bool, str]:
+        return (
+            v["n"] == 0,
+            "clean" if v["n"] == 0 else f"{v['n']} rows make more than they attempt",
+        )
+
+    return Rule({"n": over.sum()}, verdict)
+
+
+def _groups_where(condition: pl.Expr, key: list[str]) -> pl.Expr:
+    """How many distinct ``key`` groups satisfy a per-group ``condition``."""
+    return (condition & pl.struct(key).is_first_distinct()).sum()
+
+
+#: Every check, in the order results are reported.
+CHECKS: tuple[Check, ...] = (
+    *(
+        Check(f"rate_agreement:{metric}", "player_seasons", partial(rate_agreement, metric))
+        for metric in MAX_RATE_DISAGREEMENT
+    ),
+    Check("no_non_finite", "player_seasons", no_non_finite),
+    Check("rates_in_range", "player_seasons", rates_in_range),
+    Check("identities_are_unique", "player_identities", identities_are_unique),
+    Check("every_identity_has_a_person", "player_identities", every_identity_has_a_person),
+    Check("unnamed_persons_are_rare", "persons", unnamed_persons_are_rare),
+    Check("every_player_season_resolves", "player_seasons", every_player_season_resolves),
+    Check("pairs_change_league", "transition_pairs", pairs_change_league),
+    Check("pairs_respect_gap", "transition_pairs", pairs_respect_gap),
+    Check("pairs_have_one_row_per_landing", "transition_pairs", pairs_have_one_row_per_landing),
+    Check("pairs_have_one_row_per_departure", "transition_pairs", pairs_have_one_row_per_departure),
+    Check("pairs_reference_real_seasons", "transition_pairs", pairs_reference_real_seasons),
+    Check("minutes_are_non_negative", "player_seasons", minutes_are_non_negative),
+    Check("shots_made_not_exceed_attempts", "player_seasons", shots_made_not_exceed_attempts),
+)
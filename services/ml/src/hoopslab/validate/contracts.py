@@ -7,20 +7,40 @@ verify`` re-derives all of it and diffs, with no network access.
 The point is that data drift becomes a failed build. Without this, a source
 quietly changing a unit, dropping a season, or renaming a column produces
 different numbers in the README with nothing to indicate that anything moved.
+
+A contract can be derived three ways, from cheapest to most thorough:
+
+* :func:`derive_footer` reads only the parquet footer — row count, schema,
+  and each row group's null count and min/max — and so costs the same for a
+  table of a thousand rows as for one of a hundred million. It cannot see a
+  value that changed inside its column's range, so it carries no hash.
+* :func:`derive_file` scans the file once for the column statistics and hashes
+  it a batch at a time, so the table is never held in memory whole.
+* :func:`derive` does the same for a frame already in memory.
+
+All three produce identical contracts for the same table, and the last two
+identical hashes.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import math
+from collections.abc import Mapping
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import polars as pl
+import pyarrow.parquet as pq
 
 CONTRACT_VERSION = 1
 
+#: Rows read, hashed and digested per batch when fingerprinting a file.
+HASH_BATCH_ROWS = 65_536
+
 
 @dataclass
 class ColumnContract:
@@ -57,30 +77,135 @@ def content_hash(frame: pl.DataFrame) -> str:
     it across versions for grouped operations, so hashing sorted row hashes
     keeps the fingerprint stable against a reordering that changes nothing.
     """
-    row_hashes = frame.hash_rows(seed=0).sort().to_list()
+    return _digest(frame.hash_rows(seed=0).to_numpy())
+
+
+def file_content_hash(path: Path, *, batch_rows: int = HASH_BATCH_ROWS) -> str:
+    """:func:`content_hash` of a parquet file, without reading it whole.
+
+    A row's hash depends on nothing but the row, so hashing batch by batch and
+    sorting the lot gives the same answer as hashing the frame at once.
+    """
+    row_hashes = [
+        pl.DataFrame(batch).hash_rows(seed=0).to_numpy()
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_rows)
+    ]
+    return _digest(np.concatenate(row_hashes) if row_hashes else np.empty(0, dtype=np.uint64))
+
+
+def _digest(row_hashes: np.ndarray) -> str:
+    """SHA-256 over the sorted row hashes, written out as decimal digits.
+
+    The decimal rendering is what the committed hashes were made from, so it
+    stays; it is produced a batch at a time by polars rather than one Python
+    ``int`` per row.
+    """
+    ordered = pl.Series(np.sort(row_hashes))
     digest = hashlib.sha256()
-    for value in row_hashes:
-        digest.update(str(value).encode("ascii"))
+    for start in range(0, len(ordered), HASH_BATCH_ROWS):
+        batch = ordered.slice(start, HASH_BATCH_ROWS).cast(pl.Utf8).str.join("")
+        digest.update(str(batch.item()).encode("ascii"))
     return digest.hexdigest()[:32]
 
 
 def derive(table: str, frame: pl.DataFrame) -> TableContract:
+    return _contract(
+        table,
+        frame.schema,
+        frame.height,
+        nulls={name: frame[name].null_count() for name in frame.columns},
+        lows={name: frame[name].min() for name in _numeric(frame.schema)},
+        highs={name: frame[name].max() for name in _numeric(frame.schema)},
+        content_hash=content_hash(frame),
+    )
+
+
+def derive_file(table: str, path: Path) -> TableContract:
+    """The contract of a parquet file: one scan for statistics, one hashing pass."""
+    lazy = pl.scan_parquet(path)
+    schema = lazy.collect_schema()
+    numeric = _numeric(schema)
+    stats = lazy.select(
+        pl.len().alias("n_rows"),
+        *(pl.col(name).null_count().alias(f"nulls:{name}") for name in schema),
+        *(pl.col(name).min().alias(f"low:{name}") for name in numeric),
+        *(pl.col(name).max().alias(f"high:{name}") for name in numeric),
+    ).collect()
+    row = stats.row(0, named=True)
+    return _contract(
+        table,
+        schema,
+        int(row["n_rows"]),
+        nulls={name: row[f"nulls:{name}"] for name in schema},
+        lows={name: row[f"low:{name}"] for name in numeric},
+        highs={name: row[f"high:{name}"] for name in numeric},
+        content_hash=file_content_hash(path),
+    )
+
+
+def derive_footer(table: str, path: Path) -> TableContract:
+    """What the parquet footer alone says about a table. Carries no hash.
+
+    A column whose row groups were written without statistics gets a NaN null
+    rate and no range, which :func:`compare` treats as unknown rather than as
+    a difference.
+    """
+    metadata = pq.read_metadata(path)
+    schema = pl.read_parquet_schema(path)
+    nulls: dict[str, int | None] = {}
+    lows: dict[str, Any] = {}
+    highs: dict[str, Any] = {}
+
+    for index in range(metadata.num_columns):
+        name = metadata.schema.column(index).name
+        groups = [
+            metadata.row_group(g).column(index).statistics for g in range(metadata.num_row_groups)
+        ]
+        if any(s is None or not s.has_null_count for s in groups):
+            nulls[name] = None
+            continue
+        nulls[name] = sum(s.null_count for s in groups)
+        bounded = [s for s in groups if s.has_min_max]
+        if name in schema and schema[name].is_numeric() and bounded:
+            # Writers record a zero minimum as -0.0; adding 0.0 makes it 0.0.
+            lows[name] = min(s.min for s in bounded) + 0.0
+            highs[name] = max(s.max for s in bounded)
+
+    return _contract(
+        table, schema, metadata.num_rows, nulls=nulls, lows=lows, highs=highs, content_hash=""
+    )
+
+
+def _numeric(schema: Mapping[str, pl.DataType]) -> list[str]:
+    return [name for name, dtype in schema.items() if dtype.is_numeric()]
+
+
+def _contract(
+    table: str,
+    schema: Mapping[str, pl.DataType],
+    n_rows: int,
+    *,
+    nulls: Mapping[str, int | None],
+    lows: Mapping[str, Any],
+    highs: Mapping[str, Any],
+    content_hash: str,
+) -> TableContract:
     columns: list[ColumnContract] = []
 
-    for name in frame.columns:
-        series = frame[name]
-        null_rate = round(series.null_count() / max(frame.height, 1), 6)
+    for name, dtype in schema.items():
+        n_null = nulls.get(name)
+        null_rate = math.nan if n_null is None else round(n_null / max(n_rows, 1), 6)
         minimum = maximum = None
 
-        if series.dtype.is_numeric() and series.null_count() < frame.height:
-            low, high = series.min(), series.max()
-            minimum = round(float(low), 6) if low is not None else None  # type: ignore[arg-type]
-            maximum = round(float(high), 6) if high is not None else None  # type: ignore[arg-type]
+        if dtype.is_numeric() and n_null is not None and n_null < n_rows:
+            low, high = lows.get(name), highs.get(name)
+            minimum = round(float(low), 6) if low is not None else None
+            maximum = round(float(high), 6) if high is not None else None
 
         columns.append(
             ColumnContract(
                 name=name,
-                dtype=str(series.dtype),
+                dtype=str(dtype),
                 null_rate=null_rate,
                 minimum=minimum,
                 maximum=maximum,
@@ -90,13 +215,28 @@ def derive(table: str, frame: pl.DataFrame) -> TableContract:
     return TableContract(
         table=table,
         contract_version=CONTRACT_VERSION,
-        n_rows=frame.height,
-        n_columns=frame.width,
-        content_hash=content_hash(frame),
+        n_rows=n_rows,
+        n_columns=len(schema),
+        content_hash=content_hash,
         columns=columns,
     )
 
 
+def committed_hashes(directory: Path) -> dict[str, str]:
+    """Content hash of every committed sidecar, keyed by table name.
+
+    The fingerprint of a gold snapshot as a whole. Anything derived from gold
+    and keyed on these — the snapshot id, the run log, the fitted-model store —
+    changes exactly when a table's contents do.
+    """
+    hashes: dict[str, str] = {}
+    if directory.is_dir():
+        for sidecar in sorted(directory.glob("*.json")):
+            payload = json.loads(sidecar.read_text(encoding="utf-8"))
+            hashes[sidecar.stem] = payload.get("content_hash", "")
+    return hashes
+
+
 def write(contract: TableContract, directory: Path) -> Path:
     directory.mkdir(parents=True, exist_ok=True)
     path = directory / f"{contract.table}.json"
@@ -123,10 +263,16 @@ def compare(expected: TableContract, actual: TableContract) -> list[str]:
         want, got = expected_cols[name], actual_cols[name]
         if want.dtype != got.dtype:
             problems.append(f"{name}: dtype {want.dtype} -> {got.dtype}")
+        # NaN is a null rate the footer could not state; never a difference.
         if abs(want.null_rate - got.null_rate) > 1e-6:
             problems.append(f"{name}: null rate {want.null_rate:.4f} -> {got.null_rate:.4f}")
+        if _moved(want.minimum, got.minimum) or _moved(want.maximum, got.maximum):
+            problems.append(
+                f"{name}: range [{want.minimum}, {want.maximum}] -> [{got.minimum}, {got.maximum}]"
+            )
 
-    if expected.content_hash != actual.content_hash and not problems:
+    # An empty hash is a footer-only contract, which cannot speak to contents.
+    if actual.content_hash and expected.content_hash != actual.content_hash and not problems:
         # Same shape, same null rates, different values: a source revised its
         # history. Worth failing on, and worth saying precisely.
         problems.append(
@@ -135,3 +281,7 @@ def compare(expected: TableContract, actual: TableContract) -> list[str]:
         )
 
     return problems
+
+
+def _moved(want: float | None, got: float | None) -> bool:
+    return want is not None and got is not None and abs(want - got) > 1e-6
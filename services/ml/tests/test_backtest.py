@@ -0,0 +1,168 @@
+"""Walk-forward folds from running normal equations, and the player-clustered bootstrap."""
+
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+
+from hoopslab.eval import backtest
+from hoopslab.eval.backtest import cluster_bootstrap, cluster_bootstrap_ci, walk_forward
+from hoopslab.models.translation import PersistenceModel, fit_translation
+
+
+def transitions(n: int = 240, seed: int = 0) -> pl.DataFrame:
+    """Moves from 2008 to 2020, with most players moving twice, some in the same season."""
+    rng = np.random.default_rng(seed)
+    z_source = rng.normal(size=n)
+    z_target = 0.7 * z_source + rng.normal(scale=0.4, size=n)
+    return pl.DataFrame(
+        {
+            "person_id": [f"p{i}" for i in rng.integers(0, n * 2 // 3, size=n)],
+            "direction": rng.choice(["EL->NBA", "NBA->EL", "GL->NBA"], p=[0.45, 0.45, 0.1], size=n),
+            "z_source": z_source,
+            "z_target": z_target,
+            "source_value": 0.2 + 0.05 * z_source,
+            "target_value": 0.2 + 0.05 * z_target,
+            "age_at_source": rng.uniform(22, 32, size=n),
+            "log_source_minutes": rng.uniform(6.2, 7.6, size=n),
+            "gap_seasons": rng.integers(1, 3, size=n),
+            "target_mean": np.full(n, 0.20),
+            "target_sd": np.full(n, 0.05),
+            "target_season_order": rng.integers(2008, 2021, size=n),
+        }
+    )
+
+
+PERSISTENCE = PersistenceModel(
+    metric="usg_pct",
+    coefficients={
+        "intercept": 0.0,
+        "z": 0.8,
+        "age": -0.01,
+        "age_sq": 0.0,
+        "log_minutes": 0.1,
+        "log_minutes_mean": 7.0,
+    },
+    n_train=1_000,
+    r_squared=0.6,
+)
+
+
+class TestWalkForward:
+    def test_each_fold_is_the_refit_on_its_training_set(self) -> None:
+        frame = transitions()
+
+        result = walk_forward(frame, PERSISTENCE, "usg_pct", seed=1, first_season=2012)
+
+        assert len(result.folds) > 5
+        for fold in result.folds:
+            test = frame.filter(pl.col("target_season_order") == fold.target_season)
+            train = frame.filter(pl.col("target_season_order") < fold.target_season).join(
+                test.select("person_id"), on="person_id", how="anti"
+            )
+            refit = fit_translation(train, PERSISTENCE, "usg_pct")
+            expected = refit.predict_rate(test) - test["target_value"].to_numpy()
+
+            assert fold.n_train == train.height
+            assert fold.errors == pytest.approx(expected, abs=1e-10)
+
+    def test_the_leakage_assertions_run_on_every_fold(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        checked: list[tuple[int, int]] = []
+
+        def record(train: pl.DataFrame, test: pl.DataFrame) -> None:
+            assert not set(train["person_id"]) & set(test["person_id"])
+            checked.append((train.height, int(test["target_season_order"][0])))
+
+        monkeypatch.setattr(backtest, "assert_no_entity_overlap", record)
+
+        result = walk_forward(
+            transitions(), PERSISTENCE, "usg_pct", seed=1, run_shuffled_control=False
+        )
+
+        assert [season for _, season in checked] == [f.target_season for f in result.folds]
+        assert [n for n, _ in checked] == [f.n_train for f in result.folds]
+
+    def test_the_first_permutation_is_the_single_control(self) -> None:
+        frame = transitions()
+
+        single = walk_forward(frame, PERSISTENCE, "usg_pct", seed=4)
+        many = walk_forward(frame, PERSISTENCE, "usg_pct", seed=4, n_permutations=6)
+
+        assert many.shuffled_maes.size == 6
+        assert many.shuffled_mae == single.shuffled_mae
+        assert np.unique(many.shuffled_maes).size == 6
+
+    def test_permutations_do_not_depend_on_how_many_processes_score_them(self) -> None:
+        frame = transitions()
+
+        alone = walk_forward(frame, PERSISTENCE, "usg_pct", seed=4, n_permutations=4)
+        pooled = walk_forward(frame, PERSISTENCE, "usg_pct", seed=4, n_permutations=4, workers=2)
+
+        assert np.array_equal(alone.shuffled_maes, pooled.shuffled_maes)
+
+
+def sample(n: int = 400, seed: int = 0) -> tuple[np.ndarray, list[str]]:
+    rng = np.random.default_rng(seed)
+    persons = [f"p{i}" for i in rng.integers(0, n // 2, size=n)]
+    return rng.normal(0.0, 0.03, size=n), persons
+
+
+def resampled_one_draw_at_a_time(
+    errors: np.ndarray, person_ids: list[str], *, seed: int, n_boot: int
+) -> tuple[float, float]:
+    """The definition: draw players, pool their rows, take the mean."""
+    rng = np.random.default_rng(seed)
+    by_person: dict[str, list[float]] = {}
+    for person, value in zip(person_ids, np.abs(errors), strict=True):
+        by_person.setdefault(person, []).append(float(value))
+    people = list(by_person)
+
+    draws = np.empty(n_boot)
+    for i in range(n_boot):
+        sampled = rng.choice(len(people), size=len(people), replace=True)
+        draws[i] = np.mean([v for index in sampled for v in by_person[people[index]]])
+    return (float(np.quantile(draws, 0.025)), float(np.quantile(draws, 0.975)))
+
+
+def test_a_seed_gives_the_interval_drawing_one_resample_at_a_time_gives() -> None:
+    errors, persons = sample()
+
+    expected = resampled_one_draw_at_a_time(errors, persons, seed=7, n_boot=2_500)
+
+    assert cluster_bootstrap_ci(errors, persons, seed=7, n_boot=2_500) == pytest.approx(
+        expected, abs=1e-12
+    )
+
+
+def test_every_statistic_comes_from_the_same_draws() -> None:
+    errors, persons = sample()
+    covered = np.abs(errors) < 0.04
+
+    intervals = cluster_bootstrap(errors, persons, covered=covered, seed=7, n_boot=20_000)
+
+    assert set(intervals) == {"mae", "rmse", "coverage"}
+    assert intervals["mae"] == cluster_bootstrap_ci(errors, persons, seed=7, n_boot=20_000)
+    low, high = intervals["coverage"]
+    assert low < covered.mean() < high
+    assert intervals["rmse"][0] > intervals["mae"][0]
+
+
+def test_a_player_who_repeats_widens_the_interval() -> None:
+    """Rows of one player move together, so they carry less than independent rows."""
+    errors, _ = sample()
+    independent = [f"p{i}" for i in range(errors.size)]
+    paired = [f"p{i // 4}" for i in range(errors.size)]
+
+    narrow = cluster_bootstrap_ci(errors, independent, seed=1)
+    wide = cluster_bootstrap_ci(np.sort(errors), paired, seed=1)
+
+    assert wide[1] - wide[0] > narrow[1] - narrow[0]
+
+
+def test_one_player_has_no_interval() -> None:
+    intervals = cluster_bootstrap(np.array([0.1, -0.2]), ["p", "p"], seed=1)
+
+    assert all(np.isnan(bound) for bounds in intervals.values() for bound in bounds)
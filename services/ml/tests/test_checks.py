@@ -0,0 +1,168 @@
+"""Integrity checks, fused into one scan per table, still fail on what they should."""
+
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from hoopslab.validate import checks
+
+
+def gold() -> dict[str, pl.DataFrame]:
+    """Four tables small enough to break one row at a time, and clean to begin with."""
+    persons = pl.DataFrame(
+        {"person_id": ["nba_1", "nba_2", "el_A"], "display_name": ["A", "B", "C"]}
+    )
+    identities = pl.DataFrame(
+        {
+            "league": ["NBA", "NBA", "EL"],
+            "source_player_id": ["1", "2", "A"],
+            "person_id": ["nba_1", "nba_2", "el_A"],
+        }
+    )
+    player_seasons = pl.DataFrame(
+        {
+            "person_id": ["nba_1", "nba_2", "el_A", "nba_2"],
+            "season_id": ["NBA_2020", "NBA_2020", "EL_2019", "NBA_2021"],
+            "qualified": [True, True, True, False],
+            "minutes": [1500.0, 900.0, 1200.0, 40.0],
+            "fgm": [300, 100, 200, 5],
+            "fga": [600, 250, 400, 10],
+            "fg3m": [50, 10, 40, 1],
+            "fg3a": [150, 40, 100, 3],
+            "ftm": [100, 30, 60, 2],
+            "fta": [120, 40, 80, 2],
+            "usg_pct": [0.25, 0.18, 0.22, 0.3],
+            "official_usg_pct": [0.251, 0.18, 0.22, None],
+            "ts_pct": [0.56, 0.52, 0.6, 0.4],
+            "official_ts_pct": [0.56, 0.52, 0.6, None],
+            "ast_pct": [0.2, 0.1, 0.15, 0.0],
+            "official_ast_pct": [0.2, 0.1, 0.15, None],
+            "tov_rate": [0.1, 0.12, 0.11, 0.2],
+        }
+    )
+    pairs = pl.DataFrame(
+        {
+            "person_id": ["el_A", "nba_2"],
+            "source_season_id": ["EL_2019", "NBA_2020"],
+            "target_season_id": ["NBA_2020", "NBA_2021"],
+            "source_league": ["EL", "NBA"],
+            "target_league": ["NBA", "EL"],
+            "direction": ["EL->NBA", "NBA->EL"],
+            "gap_seasons": [1, 1],
+        }
+    )
+    return {
+        "persons": persons,
+        "player_identities": identities,
+        "player_seasons": player_seasons,
+        "transition_pairs": pairs,
+    }
+
+
+def failures(tables: dict[str, pl.DataFrame]) -> dict[str, str]:
+    return {r.name: r.detail for r in checks.run_all(tables) if not r.passed}
+
+
+def test_clean_gold_passes_every_check_in_order() -> None:
+    results = checks.run_all(gold())
+
+    assert [r.name for r in results] == [c.name for c in checks.CHECKS]
+    assert all(r.passed for r in results), [r.render() for r in results if not r.passed]
+    assert results[0].detail == "MAD 0.00033 against tolerance 0.01 over n=3"
+
+
+def test_lazy_and_eager_tables_give_the_same_results() -> None:
+    lazy = {name: frame.lazy() for name, frame in gold().items()}
+
+    assert checks.run_all(lazy) == checks.run_all(gold())
+
+
+@pytest.mark.parametrize(
+    ("table", "breakage", "name", "detail"),
+    [
+        (
+            "player_seasons",
+            pl.col("minutes").cast(pl.Float64) * -1,
+            "minutes_are_non_negative",
+            "4 negative rows",
+        ),
+        (
+            "player_seasons",
+            pl.col("tov_rate").replace(0.2, float("inf")),
+            "no_non_finite",
+            "infinite values in {'tov_rate': 1}",
+        ),
+        (
+            "player_seasons",
+            pl.col("tov_rate") + 1,
+            "rates_in_range",
+            "tov_rate: 3 rows outside [0.0, 1.0]",
+        ),
+        (
+            "player_seasons",
+            pl.col("fgm") * 3,
+            "shots_made_not_exceed_attempts",
+            "4 rows make more than they attempt",
+        ),
+        (
+            "transition_pairs",
+            pl.col("gap_seasons") - 1,
+            "pairs_respect_gap",
+            "2 pairs have an invalid gap",
+        ),
+        (
+            "transition_pairs",
+            pl.col("target_season_id").replace("NBA_2021", "NBA_2031"),
+            "pairs_reference_real_seasons",
+            "unknown seasons: ['NBA_2031']",
+        ),
+        (
+            "player_identities",
+            pl.col("person_id").replace("el_A", "el_Z"),
+            "every_identity_has_a_person",
+            "1 person ids missing from persons",
+        ),
+    ],
+)
+def test_each_breakage_fails_its_own_check_only(
+    table: str, breakage: pl.Expr, name: str, detail: str
+) -> None:
+    tables = gold()
+    column = breakage.meta.output_name()
+    tables[table] = tables[table].with_columns(breakage.alias(column))
+
+    assert failures(tables) == {name: detail}
+
+
+def test_duplicated_rows_are_counted_once_per_group() -> None:
+    tables = gold()
+    pairs = tables["transition_pairs"]
+    tables["transition_pairs"] = pl.concat([pairs, pairs.head(1), pairs.head(1)])
+    identities = tables["player_identities"]
+    tables["player_identities"] = pl.concat(
+        [identities, identities.head(1).with_columns(pl.lit("nba_2").alias("person_id"))]
+    )
+
+    assert failures(tables) == {
+        "identities_are_unique": "1 source ids map to multiple persons",
+        "pairs_have_one_row_per_landing": "1 arrivals appear more than once",
+        "pairs_have_one_row_per_departure": "1 departures appear more than once",
+    }
+
+
+def test_a_missing_official_series_fails_only_its_metric() -> None:
+    tables = gold()
+    tables["player_seasons"] = tables["player_seasons"].drop("official_ast_pct")
+
+    assert failures(tables) == {"rate_agreement:ast_pct": "official series missing"}
+
+
+def test_each_table_is_scanned_once_and_each_check_timed_on_request() -> None:
+    report = checks.run_checks(gold())
+    timed = checks.run_checks(gold(), time_checks=True)
+
+    assert set(report.table_seconds) == set(gold())
+    assert report.check_seconds == {}
+    assert set(timed.check_seconds) == {c.name for c in checks.CHECKS}
+    assert timed.results == report.results
@@ -0,0 +1,102 @@
+"""One index of player-seasons, searched within a season or across eras and leagues."""
+
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+
+from hoopslab.models.comparables import COMPARABLE_SCOPES, ComparableScope, ComparablesIndex
+
+
+def index(n: int = 400, seed: int = 0) -> ComparablesIndex:
+    """Players with careers of several seasons, in two leagues, over twelve years."""
+    rng = np.random.default_rng(seed)
+    people = rng.integers(0, n // 4, size=n)
+    orders = 2010 + rng.integers(0, 12, size=n)
+    leagues = np.where(people % 3 == 0, "EL", "NBA")
+    keys = pl.DataFrame(
+        {
+            "season_id": [f"{lg}_{o}" for lg, o in zip(leagues, orders, strict=True)],
+            "person_id": [f"p{p}" for p in people],
+            "league": leagues,
+            "season_order": orders,
+        }
+    ).unique(["season_id", "person_id"], keep="first", maintain_order=True)
+    return ComparablesIndex(keys=keys, coordinates=rng.normal(size=(keys.height, 4)))
+
+
+def one_row_at_a_time(idx: ComparablesIndex, scope: ComparableScope, top_k: int) -> list[list[int]]:
+    """The definition: every eligible row's distance, nearest ``top_k`` kept."""
+    persons = idx.keys["person_id"].to_list()
+    leagues = idx.keys["league"].to_list()
+    orders = idx.keys["season_order"].to_list()
+    expected = []
+    for i in range(idx.keys.height):
+        eligible = [
+            j
+            for j in range(idx.keys.height)
+            if persons[j] != persons[i]
+            and (not scope.same_league or leagues[j] == leagues[i])
+            and (scope.season_window is None or abs(orders[j] - orders[i]) <= scope.season_window)
+        ]
+        distance = np.linalg.norm(idx.coordinates[eligible] - idx.coordinates[i], axis=1)
+        expected.append([eligible[j] for j in np.argsort(distance, kind="stable")[:top_k]])
+    return expected
+
+
+@pytest.mark.parametrize("scope", COMPARABLE_SCOPES, ids=lambda s: s.name)
+def test_each_scope_is_the_exact_search_over_what_it_allows(scope: ComparableScope) -> None:
+    idx = index()
+
+    positions, distances = idx.query(scope, top_k=5)
+
+    expected = one_row_at_a_time(idx, scope, top_k=5)
+    for i, row in enumerate(expected):
+        assert positions[i, : len(row)].tolist() == row
+        assert (positions[i, len(row) :] == -1).all()
+        assert np.isinf(distances[i, len(row) :]).all()
+        assert distances[i, : len(row)] == pytest.approx(
+            np.linalg.norm(idx.coordinates[row] - idx.coordinates[i], axis=1)
+        )
+
+
+def test_a_player_is_never_his_own_comparable_in_any_season() -> None:
+    idx = index()
+
+    comps = idx.comparables(top_k=5)
+
+    assert set(comps["scope"]) == {s.name for s in COMPARABLE_SCOPES}
+    assert (comps["person_id"] != comps["neighbour_person_id"]).all()
+    season = comps.filter(pl.col("scope") == "season")
+    assert (season["season_id"] == season["neighbour_season_id"]).all()
+
+
+def test_a_season_too_small_to_fill_the_list_gives_what_it_has() -> None:
+    keys = pl.DataFrame(
+        {
+            "season_id": ["GL_2020", "GL_2020", "NBA_2020"],
+            "person_id": ["a", "b", "c"],
+            "league": ["GL", "GL", "NBA"],
+            "season_order": [2020, 2020, 2020],
+        }
+    )
+    idx = ComparablesIndex(keys=keys, coordinates=np.array([[0.0], [1.0], [0.1]]))
+
+    comps = idx.comparables(top_k=3)
+
+    season = comps.filter(pl.col("scope") == "season")
+    assert season.select("person_id", "neighbour_person_id", "rank").rows() == [
+        ("a", "b", 1),
+        ("b", "a", 1),
+    ]
+    assert comps.filter(pl.col("scope") == "all").height == 6
+
+
+def test_the_saved_index_reads_back_unchanged() -> None:
+    idx = index(n=40)
+
+    loaded = ComparablesIndex.from_frame(idx.to_frame())
+
+    assert loaded.keys.equals(idx.keys)
+    assert np.array_equal(loaded.coordinates, idx.coordinates)
@@ -0,0 +1,121 @@
+"""Contract sidecars, derived from a frame, a file, or a footer alone."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from hoopslab.paths import DataPaths
+from hoopslab.transform.build import GOLD_TABLES, verify_gold
+from hoopslab.validate import contracts
+
+
+def table(n: int = 1_000) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "person_id": [f"p{i % 97}" for i in range(n)],
+            "minutes": [float(i % 40) * 30.0 for i in range(n)],
+            "age": [None if i % 7 == 0 else 20.0 + i % 15 for i in range(n)],
+            "qualified": [i % 3 == 0 for i in range(n)],
+        }
+    )
+
+
+def written(frame: pl.DataFrame, path: Path, row_group_size: int = 128) -> Path:
+    frame.write_parquet(path, row_group_size=row_group_size)
+    return path
+
+
+def test_hashing_a_file_in_batches_matches_hashing_the_frame(tmp_path: Path) -> None:
+    frame = table()
+    path = written(frame, tmp_path / "t.parquet")
+
+    assert contracts.file_content_hash(path, batch_rows=100) == contracts.content_hash(frame)
+
+
+def test_the_hash_ignores_row_order() -> None:
+    frame = table()
+
+    assert contracts.content_hash(frame.reverse()) == contracts.content_hash(frame)
+
+
+def test_all_three_derivations_agree(tmp_path: Path) -> None:
+    frame = table()
+    path = written(frame, tmp_path / "t.parquet")
+
+    in_memory = contracts.derive("t", frame)
+
+    assert contracts.derive_file("t", path) == in_memory
+    footer = contracts.derive_footer("t", path)
+    assert footer.columns == in_memory.columns
+    assert footer.content_hash == ""
+    assert contracts.compare(in_memory, footer) == []
+
+
+def test_the_footer_alone_catches_a_value_outside_the_committed_range(tmp_path: Path) -> None:
+    expected = contracts.derive("t", table())
+    drifted = table().with_columns(pl.col("minutes") * 60.0)
+    path = written(drifted, tmp_path / "t.parquet")
+
+    problems = contracts.compare(expected, contracts.derive_footer("t", path))
+
+    assert problems == ["minutes: range [0.0, 1170.0] -> [0.0, 70200.0]"]
+
+
+def test_a_change_inside_the_range_needs_the_full_tier(tmp_path: Path) -> None:
+    expected = contracts.derive("t", table())
+    swapped = table().with_columns(pl.col("person_id").reverse())
+    path = written(swapped, tmp_path / "t.parquet")
+
+    assert contracts.compare(expected, contracts.derive_footer("t", path)) == []
+    assert "contents changed" in contracts.compare(expected, contracts.derive_file("t", path))[0]
+
+
+def test_a_footer_without_statistics_is_not_read_as_drift(tmp_path: Path) -> None:
+    frame = table()
+    path = tmp_path / "t.parquet"
+    frame.write_parquet(path, statistics=False)
+
+    assert contracts.compare(contracts.derive("t", frame), contracts.derive_footer("t", path)) == []
+
+
+class TestVerifyGold:
+    @pytest.fixture
+    def paths(self, tmp_path: Path) -> DataPaths:
+        paths = DataPaths(root=tmp_path)
+        for name in GOLD_TABLES:
+            frame = table()
+            paths.gold.mkdir(parents=True, exist_ok=True)
+            written(frame, paths.gold / f"{name}.parquet")
+            contracts.write(contracts.derive(name, frame), paths.contracts)
+        return paths
+
+    def test_clean_gold_passes_both_tiers(self, paths: DataPaths) -> None:
+        assert verify_gold(paths) == []
+        assert verify_gold(paths, full=False) == []
+
+    def test_footer_drift_is_reported_without_a_full_scan(
+        self, paths: DataPaths, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        written(table(900), paths.gold / "persons.parquet")
+
+        def no_scan(*_: object) -> contracts.TableContract:
+            raise AssertionError("scanned a table although its footer had already failed")
+
+        monkeypatch.setattr(contracts, "derive_file", no_scan)
+
+        problems = verify_gold(paths)
+
+        assert problems[0] == "persons: row count 1000 -> 900"
+        assert all(p.startswith("persons: ") for p in problems)
+
+    def test_every_table_is_scanned_when_the_footers_agree(self, paths: DataPaths) -> None:
+        for name in ("persons", "transition_pairs"):
+            shuffled = table().with_columns(pl.col("person_id").reverse())
+            written(shuffled, paths.gold / f"{name}.parquet")
+
+        problems = verify_gold(paths)
+
+        assert [p.split(":")[0] for p in problems] == ["persons", "transition_pairs"]
@@ -7,13 +7,20 @@ player who never reached the NBA.
 
 from __future__ import annotations
 
+import random
+
 import polars as pl
+import pytest
 
 from hoopslab.transform.crosswalk import (
+    BIRTH_YEAR_TOLERANCE,
     CONFIDENCE,
     MODELLING_CONFIDENCE_FLOOR,
+    WIDE_POLICY,
     build_crosswalk,
+    fuzzy_candidates,
     implied_birth_year,
+    match_players,
     verify_shared_id_space,
 )
 from hoopslab.transform.names import match_key, normalize_name
@@ -194,3 +201,194 @@ class TestBuildCrosswalk:
             pl.n_unique("person_id").alias("n")
         )
         assert counts["n"].max() == 1
+
+    def test_a_euroleague_player_can_match_a_g_league_only_career(self) -> None:
+        """Under the wide policy the registry is every stats.nba.com person."""
+        nba = frame([player_season("NBA", "1", "NBA Guy", 2018)])
+        gl = frame([player_season("GL", "77", "Cliff Hammonds", 2009, age=24.0)])
+        el = frame([player_season("EL", "9", "Cliff Hammonds", 2012, age=27.0)])
+
+        persons, identities, report = build_crosswalk(nba, gl, el, policy=WIDE_POLICY)
+
+        el_row = identities.filter(pl.col("league") == "EL").row(0, named=True)
+        assert el_row["person_id"] == "nba_77"
+        assert el_row["match_method"] == "name_and_age"
+        assert report.n_matched_name_and_age == 1
+        assert persons.filter(pl.col("person_id") == "nba_77")["birth_year"].item() == 1985.0
+
+    def test_by_default_only_nba_persons_are_matched(self) -> None:
+        """The committed gold: a G League-only career is not a match, nor its age evidence."""
+        nba = frame([player_season("NBA", "1", "NBA Guy", 2018)])
+        gl = frame([player_season("GL", "77", "Cliff Hammonds", 2009, age=24.0)])
+        el = frame([player_season("EL", "9", "Cliff Hammonds", 2012, age=27.0)])
+
+        persons, identities, _ = build_crosswalk(nba, gl, el)
+
+        assert identities.filter(pl.col("league") == "EL")["person_id"].item() == "el_9"
+        assert persons.filter(pl.col("person_id") == "nba_77")["birth_year"].item() is None
+
+
+class TestNearSpellings:
+    def test_a_transliterated_name_with_agreeing_age_is_found_but_not_modelled(self) -> None:
+        nba = frame([player_season("NBA", "1", "Sergei Monia", 2004, age=21.0)])
+        el = frame([player_season("EL", "9", "Sergey Monia", 2010, age=27.0)])
+
+        _, identities, report = build_crosswalk(nba, pl.DataFrame(), el, policy=WIDE_POLICY)
+
+        el_row = identities.filter(pl.col("league") == "EL").row(0, named=True)
+        assert el_row["person_id"] == "nba_1"
+        assert el_row["match_method"] == "fuzzy_name_and_age"
+        assert el_row["confidence"] < MODELLING_CONFIDENCE_FLOOR
+        assert report.n_matched_fuzzy == 1
+
+    def test_near_spellings_are_not_tried_by_default(self) -> None:
+        nba = frame([player_season("NBA", "1", "Sergei Monia", 2004, age=21.0)])
+        el = frame([player_season("EL", "9", "Sergey Monia", 2010, age=27.0)])
+
+        _, identities, report = build_crosswalk(nba, pl.DataFrame(), el)
+
+        assert identities.filter(pl.col("league") == "EL")["person_id"].item() == "el_9"
+        assert report.n_matched_fuzzy == 0
+
+    def test_a_near_spelling_needs_an_agreeing_age(self) -> None:
+        nba = frame([player_season("NBA", "1", "Sergei Monia", 2004, age=21.0)])
+        el = frame([player_season("EL", "9", "Sergey Monia", 2010, age=35.0)])
+
+        _, identities, _ = build_crosswalk(nba, pl.DataFrame(), el, policy=WIDE_POLICY)
+
+        assert identities.filter(pl.col("league") == "EL")["person_id"].item() == "el_9"
+
+    def test_a_person_already_matched_exactly_is_not_offered_again(self) -> None:
+        nba = frame([player_season("NBA", "1", "Sergei Monia", 2004, age=21.0)])
+        el = frame(
+            [
+                player_season("EL", "8", "Sergei Monia", 2010, age=27.0),
+                player_season("EL", "9", "Sergey Monia", 2010, age=27.0),
+            ]
+        )
+
+        _, identities, _ = build_crosswalk(nba, pl.DataFrame(), el, policy=WIDE_POLICY)
+
+        by_id = {
+            r["source_player_id"]: r
+            for r in identities.filter(pl.col("league") == "EL").iter_rows(named=True)
+        }
+        assert by_id["8"]["match_method"] == "name_and_age"
+        assert by_id["9"]["person_id"] == "el_9"
+
+    def test_two_competing_near_spellings_are_not_guessed_between(self) -> None:
+        nba = frame(
+            [
+                player_season("NBA", "1", "Victor Khryapa", 2004, age=22.0),
+                player_season("NBA", "2", "Vyktor Khryapa", 2004, age=22.0),
+            ]
+        )
+        el = frame([player_season("EL", "9", "Viktor Khryapa", 2010, age=28.0)])
+
+        _, identities, _ = build_crosswalk(nba, pl.DataFrame(), el, policy=WIDE_POLICY)
+
+        assert identities.filter(pl.col("league") == "EL")["person_id"].item() == "el_9"
+
+    def test_blocking_finds_every_pair_an_exhaustive_comparison_does(self) -> None:
+        rng = random.Random(7)
+        people, registry = random_people(rng, 150, "e"), random_people(rng, 300, "n")
+
+        found = fuzzy_candidates(people, registry, floor=0.5)
+
+        assert found.select("source_player_id", "_candidate").rows() == exhaustive_pairs(
+            people, registry, floor=0.5
+        )
+        assert found.height > 0
+
+
+class TestExactTiers:
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_the_joined_tiers_match_the_per_player_loop(self, seed: int) -> None:
+        """Name collisions, missing ages and overrides all drawn at random."""
+        rng = random.Random(seed)
+        people, registry = random_people(rng, 300, "e"), random_people(rng, 400, "n")
+        overrides = pl.DataFrame(
+            {
+                "source_player_id": [f"e{i}" for i in rng.sample(range(300), 10)],
+                "nba_player_id": [f"n{i}" for i in rng.sample(range(400), 10)],
+            }
+        )
+
+        matched = match_players(people, registry, overrides, league="EL", fuzzy_floor=None)
+
+        assert sorted(matched.rows()) == sorted(reference_match(people, registry, overrides))
+
+
+SURNAMES = ["Jokic", "Petrovic", "Smith", "Teodosic", "Larkin", "Papanikolaou", "Ayon"]
+FORENAMES = ["Nikola", "Nikolas", "Milos", "Shane", "Kostas", "Gustavo", "Drazen", "Dra"]
+
+
+def random_people(rng: random.Random, n: int, prefix: str) -> pl.DataFrame:
+    names = [f"{rng.choice(FORENAMES)} {rng.choice(SURNAMES)}" for _ in range(n)]
+    return pl.DataFrame(
+        {
+            "source_player_id": [f"{prefix}{i}" for i in range(n)],
+            "match_key": [match_key(name) for name in names],
+            "birth_year": [
+                None if rng.random() < 0.2 else float(rng.randint(1985, 1990)) for _ in range(n)
+            ],
+        },
+        schema={"source_player_id": pl.Utf8, "match_key": pl.Utf8, "birth_year": pl.Float64},
+    )
+
+
+def trigrams(key: str) -> set[str]:
+    padded = f" {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def exhaustive_pairs(
+    people: pl.DataFrame, registry: pl.DataFrame, *, floor: float
+) -> list[tuple[str, str]]:
+    pairs = []
+    for a in people.iter_rows(named=True):
+        for b in registry.iter_rows(named=True):
+            if a["birth_year"] is None or b["birth_year"] is None:
+                continue
+            if abs(a["birth_year"] - b["birth_year"]) > BIRTH_YEAR_TOLERANCE:
+                continue
+            left, right = trigrams(a["match_key"]), trigrams(b["match_key"])
+            if 2 * len(left & right) / (len(left) + len(right)) >= floor:
+                pairs.append((a["source_player_id"], b["source_player_id"]))
+    return sorted(pairs)
+
+
+def reference_match(
+    people: pl.DataFrame, registry: pl.DataFrame, overrides: pl.DataFrame
+) -> list[tuple[object, ...]]:
+    """The per-player loop the exact tiers used to be, kept as an oracle."""
+    override_map = dict(overrides.select("source_player_id", "nba_player_id").rows())
+    by_key: dict[str, list[dict[str, object]]] = {}
+    for row in registry.iter_rows(named=True):
+        by_key.setdefault(str(row["match_key"]), []).append(row)
+
+    def agree(a: object, b: object) -> bool:
+        if not isinstance(a, float) or not isinstance(b, float):
+            return False
+        return abs(a - b) <= BIRTH_YEAR_TOLERANCE
+
+    rows: list[tuple[object, ...]] = []
+    for row in people.iter_rows(named=True):
+        el_id = row["source_player_id"]
+        if el_id in override_map:
+            method, chosen = "manual_override", override_map[el_id]
+        else:
+            candidates = by_key.get(str(row["match_key"]), [])
+            corroborated = [c for c in candidates if agree(row["birth_year"], c["birth_year"])]
+            if len(corroborated) == 1:
+                method, chosen = "name_and_age", corroborated[0]["source_player_id"]
+            elif len(candidates) == 1:
+                method, chosen = "name_only_unique", candidates[0]["source_player_id"]
+            elif len(candidates) > 1:
+                method, chosen = "name_ambiguous", None
+            else:
+                method, chosen = "euroleague_only", None
+        confidence = CONFIDENCE.get(method, 1.0)
+        person = f"nba_{chosen}" if chosen is not None else f"el_{el_id}"
+        rows.append((person, "EL", el_id, method, confidence))
+    return rows
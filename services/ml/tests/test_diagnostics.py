@@ -0,0 +1,100 @@
+"""Leave-one-player-out residuals without refits, and the intervals built from them."""
+
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+
+from hoopslab.eval.diagnostics import conformal_half_width, interval_diagnostics
+from hoopslab.models.translation import PersistenceModel, fit_translation
+
+PERSISTENCE = PersistenceModel(
+    metric="usg_pct",
+    coefficients={
+        "intercept": 0.0,
+        "z": 0.8,
+        "age": -0.01,
+        "age_sq": 0.0,
+        "log_minutes": 0.1,
+        "log_minutes_mean": 7.0,
+    },
+    n_train=1_000,
+    r_squared=0.6,
+)
+
+
+def transitions(n: int = 180, seed: int = 0) -> pl.DataFrame:
+    """Most players move once, some twice or three times, in two directions."""
+    rng = np.random.default_rng(seed)
+    z_source = rng.normal(size=n)
+    return pl.DataFrame(
+        {
+            "person_id": [f"p{i}" for i in rng.integers(0, n * 3 // 4, size=n)],
+            "direction": rng.choice(["EL->NBA", "NBA->EL"], size=n),
+            "z_source": z_source,
+            "z_target": 0.7 * z_source + rng.normal(scale=0.4, size=n),
+            "age_at_source": rng.uniform(22, 32, size=n),
+            "log_source_minutes": rng.uniform(6.2, 7.6, size=n),
+            "gap_seasons": rng.integers(1, 3, size=n),
+            "target_mean": np.full(n, 0.20),
+            "target_sd": rng.uniform(0.04, 0.06, size=n),
+        }
+    )
+
+
+def test_each_residual_is_the_one_a_refit_without_the_player_gives() -> None:
+    frame = transitions()
+    model = fit_translation(frame, PERSISTENCE, "usg_pct")
+
+    residuals = interval_diagnostics(frame, model).residuals
+
+    for person in frame["person_id"].unique().to_list():
+        held_out = (frame["person_id"] == person).to_numpy()
+        refit = fit_translation(frame.filter(~pl.Series(held_out)), PERSISTENCE, "usg_pct")
+        test = frame.filter(pl.Series(held_out))
+        expected = test["z_target"].to_numpy() - refit.predict_z(test)
+        assert residuals[held_out] == pytest.approx(expected, abs=1e-10)
+
+
+def test_the_only_player_to_make_a_move_has_no_held_out_residual() -> None:
+    frame = pl.concat(
+        [
+            transitions(),
+            transitions(n=2, seed=5).with_columns(
+                pl.lit("GL->NBA").alias("direction"), pl.lit("rare").alias("person_id")
+            ),
+        ]
+    )
+    model = fit_translation(frame, PERSISTENCE, "usg_pct")
+
+    diagnostics = interval_diagnostics(frame, model)
+
+    rare = (frame["person_id"] == "rare").to_numpy()
+    assert np.isnan(diagnostics.residuals[rare]).all()
+    assert np.isfinite(diagnostics.residuals[~rare]).all()
+    row = next(r for r in diagnostics.coverage if r.direction == "GL->NBA")
+    assert (row.n, row.n_held_out) == (2, 0)
+
+
+def test_the_conformal_width_is_the_finite_sample_quantile() -> None:
+    residuals = np.array([0.5, -1.0, 2.0, -3.0, 4.0, np.nan, -5.0, 6.0, -7.0, 8.0, 9.0])
+
+    assert conformal_half_width(residuals, 0.80) == 8.0
+    assert conformal_half_width(residuals, 0.70) == 7.0
+    assert np.isnan(conformal_half_width(residuals, 0.95))
+
+
+def test_conformal_intervals_are_served_in_rate_units_per_direction() -> None:
+    frame = transitions()
+    model = fit_translation(frame, PERSISTENCE, "usg_pct")
+    diagnostics = interval_diagnostics(frame, model)
+
+    interval = diagnostics.conformal_interval(frame, model, level=0.80)
+
+    widths = diagnostics.half_widths(0.80)
+    expected = np.array([widths[d] for d in frame["direction"]]) * frame["target_sd"].to_numpy()
+    assert interval[:, 1] - interval[:, 0] == pytest.approx(2 * expected)
+    assert (interval[:, 0] + interval[:, 1]) / 2 == pytest.approx(model.predict_rate(frame))
+    assert diagnostics.coverage[0].direction == "all"
+    assert [r["direction"] for r in diagnostics.records()] == ["all", "EL->NBA", "NBA->EL"]
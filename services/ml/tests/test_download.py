@@ -0,0 +1,230 @@
+"""Streaming, resumable downloads and the ESPN client built on them."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+from pathlib import Path
+
+import httpx
+import pandas as pd
+import pytest
+
+from hoopslab.ingest.espn_mirror import ESPNMirrorClient
+from hoopslab.ingest.retry import is_retryable
+from hoopslab.io.bronze import BronzeCache
+from hoopslab.io.download import DownloadIntegrityError, download, part_path, validator_path
+from hoopslab.seasons import seasons_for
+
+URL = "https://example.test/asset.parquet"
+ETAG = '"0x8DC"'
+
+
+def payload(n: int = 10_000) -> bytes:
+    return bytes(i % 251 for i in range(n))
+
+
+def serving(  # type: ignore[no-untyped-def]
+    body: bytes,
+    *,
+    honour_range: bool = True,
+    honour_if_range: bool = True,
+    md5: str | None = None,
+):
+    """A transport serving ``body`` under a fixed ETag, recording each Range header."""
+    seen: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("if-none-match") == ETAG:
+            return httpx.Response(304)
+        requested = request.headers.get("range")
+        seen.append(requested)
+        headers = {"etag": ETAG}
+        if md5:
+            headers["x-ms-blob-content-md5"] = md5
+        if honour_if_range and request.headers.get("if-range", ETAG) != ETAG:
+            requested = None  # the partial copy is of another version: send it all
+        if requested and honour_range:
+            start = int(requested.removeprefix("bytes=").rstrip("-"))
+            headers["content-range"] = f"bytes {start}-{len(body) - 1}/{len(body)}"
+            return httpx.Response(206, content=body[start:], headers=headers)
+        return httpx.Response(200, content=body, headers=headers)
+
+    return httpx.Client(transport=httpx.MockTransport(handler)), seen
+
+
+def test_downloads_to_dest_and_leaves_no_partial(tmp_path: Path) -> None:
+    body = payload()
+    client, _ = serving(body)
+
+    fetched = download(URL, tmp_path / "a.parquet", client=client, chunk_size=1024)
+
+    assert (tmp_path / "a.parquet").read_bytes() == body
+    assert fetched.sha256 == hashlib.sha256(body).hexdigest()
+    assert fetched.n_bytes == len(body)
+    assert not part_path(tmp_path / "a.parquet").exists()
+    assert not validator_path(tmp_path / "a.parquet").exists()
+
+
+def test_a_partial_download_resumes_with_a_range_request(tmp_path: Path) -> None:
+    body = payload()
+    dest = tmp_path / "a.parquet"
+    part_path(dest).write_bytes(body[:4000])
+    validator_path(dest).write_text(ETAG, encoding="utf-8")
+    client, seen = serving(body)
+
+    fetched = download(URL, dest, client=client)
+
+    assert seen == ["bytes=4000-"]
+    assert fetched.resumed_from == 4000
+    assert dest.read_bytes() == body
+
+
+def test_a_partial_download_without_a_validator_restarts(tmp_path: Path) -> None:
+    """Nothing says the bytes on disk are from the object being served now."""
+    body = payload()
+    dest = tmp_path / "a.parquet"
+    part_path(dest).write_bytes(b"x" * 4000)
+    client, seen = serving(body)
+
+    fetched = download(URL, dest, client=client)
+
+    assert seen == [None]
+    assert fetched.resumed_from == 0
+    assert dest.read_bytes() == body
+
+
+def test_an_asset_replaced_between_attempts_is_not_spliced(tmp_path: Path) -> None:
+    body = payload()
+    dest = tmp_path / "a.parquet"
+    part_path(dest).write_bytes(b"old version " * 300)
+    validator_path(dest).write_text('"0x7AB"', encoding="utf-8")
+    client, _ = serving(body)
+
+    fetched = download(URL, dest, client=client)
+
+    assert fetched.resumed_from == 0
+    assert dest.read_bytes() == body
+
+
+def test_a_range_answered_under_another_validator_is_discarded(tmp_path: Path) -> None:
+    """A server that honours Range but ignores If-Range still cannot splice."""
+    body = payload()
+    dest = tmp_path / "a.parquet"
+    part_path(dest).write_bytes(b"old version " * 300)
+    validator_path(dest).write_text('"0x7AB"', encoding="utf-8")
+    client, _ = serving(body, honour_if_range=False)
+
+    with pytest.raises(DownloadIntegrityError, match="changed while resuming"):
+        download(URL, dest, client=client)
+
+    assert not part_path(dest).exists()
+    assert not validator_path(dest).exists()
+    assert download(URL, dest, client=client).sha256 == hashlib.sha256(body).hexdigest()
+
+
+def test_a_server_ignoring_the_range_restarts_cleanly(tmp_path: Path) -> None:
+    body = payload()
+    dest = tmp_path / "a.parquet"
+    part_path(dest).write_bytes(b"garbage that must not be spliced in")
+    client, _ = serving(body, honour_range=False)
+
+    fetched = download(URL, dest, client=client)
+
+    assert fetched.resumed_from == 0
+    assert dest.read_bytes() == body
+
+
+def test_a_published_md5_is_checked(tmp_path: Path) -> None:
+    body = payload()
+    good = base64.b64encode(hashlib.md5(body).digest()).decode()
+    bad = base64.b64encode(hashlib.md5(b"other").digest()).decode()
+
+    client, _ = serving(body, md5=good)
+    download(URL, tmp_path / "good.parquet", client=client)
+
+    client, _ = serving(body, md5=bad)
+    with pytest.raises(DownloadIntegrityError, match="md5"):
+        download(URL, tmp_path / "bad.parquet", client=client)
+    # A corrupt file is discarded, not kept around to be resumed.
+    assert not part_path(tmp_path / "bad.parquet").exists()
+    assert not (tmp_path / "bad.parquet").exists()
+
+
+def test_a_known_sha256_is_checked(tmp_path: Path) -> None:
+    client, _ = serving(payload())
+    with pytest.raises(DownloadIntegrityError, match="sha256"):
+        download(URL, tmp_path / "a.parquet", client=client, expected_sha256="0" * 64)
+
+
+def test_a_short_file_is_kept_for_resumption(tmp_path: Path) -> None:
+    body = payload()
+    dest = tmp_path / "a.parquet"
+    part_path(dest).write_bytes(body[:100])
+    validator_path(dest).write_text(ETAG, encoding="utf-8")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # Claims the object is longer than what it actually sends.
+        return httpx.Response(
+            206,
+            content=body[100:5000],
+            headers={"content-range": f"bytes 100-{len(body) - 1}/{len(body)}", "etag": ETAG},
+        )
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    with pytest.raises(DownloadIntegrityError, match="expected 10000"):
+        download(URL, dest, client=client)
+
+    assert part_path(dest).stat().st_size == 5000
+    assert validator_path(dest).read_text(encoding="utf-8") == ETAG
+
+
+def test_a_matching_etag_is_answered_without_a_body(tmp_path: Path) -> None:
+    client, _ = serving(payload())
+
+    fetched = download(URL, tmp_path / "a.parquet", client=client, etag=ETAG)
+
+    assert fetched.not_modified
+    assert not (tmp_path / "a.parquet").exists()
+
+
+def test_integrity_failures_are_retried() -> None:
+    assert is_retryable(DownloadIntegrityError("short"))
+
+
+def box_frame() -> pd.DataFrame:
+    return pd.DataFrame({"game_id": [1, 2, 3], "team_score": [101, 99, 120]})
+
+
+def espn_serving(tmp_path: Path) -> tuple[ESPNMirrorClient, BronzeCache, list[str | None]]:
+    buffer = io.BytesIO()
+    box_frame().to_parquet(buffer, index=False)
+    client, seen = serving(buffer.getvalue())
+    cache = BronzeCache(tmp_path)
+    return ESPNMirrorClient(cache, client=client), cache, seen
+
+
+def test_espn_season_file_lands_in_bronze_from_a_stream(tmp_path: Path) -> None:
+    espn, cache, _ = espn_serving(tmp_path)
+    season = seasons_for("NBA", game_grain=True)[-1]
+
+    fetched = espn.season_file("team_box", season)
+
+    pd.testing.assert_frame_equal(fetched.frame, box_frame())
+    assert [entry["endpoint"] for entry in cache.manifest()] == ["team_box"]
+    assert cache.manifest()[0]["etag"] == ETAG
+    assert list(espn.downloads.iterdir()) == []
+
+
+def test_espn_refresh_revalidates_instead_of_downloading(tmp_path: Path) -> None:
+    espn, cache, seen = espn_serving(tmp_path)
+    season = seasons_for("NBA", game_grain=True)[-1]
+    espn.season_file("team_box", season)
+
+    refreshed = espn.season_file("team_box", season, refresh=True)
+
+    assert refreshed.unchanged
+    assert len(seen) == 1  # the 304 carried no body
+    pd.testing.assert_frame_equal(refreshed.frame, box_frame())
+    assert [entry["status"] for entry in cache.manifest()] == ["new", "unchanged"]
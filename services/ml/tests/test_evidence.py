@@ -12,15 +12,26 @@ import pytest
 
 from hoopslab.llm.evidence import BundleSource, actual_outcome, build_bundle
 from hoopslab.llm.harness import select_eval_set
+from hoopslab.models.store import FittedModelStore
+from hoopslab.models.train import latest_run
 from hoopslab.paths import DataPaths
+from hoopslab.validate.contracts import committed_hashes
 
 
 @pytest.fixture(scope="module")
-def source() -> BundleSource:
+def source(tmp_path_factory: pytest.TempPathFactory) -> BundleSource:
     paths = DataPaths.discover()
     if not (paths.gold / "transition_pairs.parquet").is_file():
         pytest.skip("no committed gold snapshot")
-    return BundleSource.load(paths)
+    run = latest_run(paths)
+    assert run is not None
+    # Fitted into a scratch store, so a test run leaves nothing under data/.
+    store = FittedModelStore(
+        tmp_path_factory.mktemp("models"),
+        contract_hashes=committed_hashes(paths.contracts),
+        model_version=run["model_version"],
+    )
+    return BundleSource.load(paths, store=store)
 
 
 @pytest.fixture(scope="module")
@@ -0,0 +1,423 @@
+"""Transition pairs, and the one-to-one matching that reduces candidates to them."""
+
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+from typer.testing import CliRunner
+
+from hoopslab.cli import app
+from hoopslab.io.bronze import BronzeCache
+from hoopslab.paths import DataPaths
+from hoopslab.seasons import Season, seasons_for
+from hoopslab.transform import gold, incremental
+from hoopslab.transform.build import BuildResult, build_gold, write_gold
+from hoopslab.transform.crosswalk import WIDE_POLICY
+from hoopslab.transform.identity_store import IdentityStore
+
+log = logging.getLogger(__name__)
+
+LEAGUES = ["NBA", "EL", "GL"]
+
+
+def reference_greedy_match(candidates: pl.DataFrame) -> pl.DataFrame:
+    """The row-by-row walk the vectorised matching replaced, kept as the oracle."""
+    if candidates.is_empty():
+        return candidates
+
+    ordered = candidates.sort(
+        ["person_id", "source_league", "target_league", "gap_seasons_raw", "target_season_order"]
+    )
+    used_sources: set[tuple] = set()
+    used_targets: set[tuple] = set()
+    keep: list[bool] = []
+    for row in ordered.iter_rows(named=True):
+        direction = (row["person_id"], row["source_league"], row["target_league"])
+        source_key = (*direction, row["source_season_id"])
+        target_key = (*direction, row["target_season_id"])
+        if source_key in used_sources or target_key in used_targets:
+            keep.append(False)
+            continue
+        used_sources.add(source_key)
+        used_targets.add(target_key)
+        keep.append(True)
+    return ordered.filter(pl.Series("_keep", keep))
+
+
+def synthetic_player_seasons(n_people: int, seed: int = 0) -> pl.DataFrame:
+    """Careers that hop between leagues often, so candidates conflict a lot.
+
+    Each person plays a run of consecutive seasons, each spent in one or two
+    leagues, with minutes either side of the pair thresholds.
+    """
+    rng = np.random.default_rng(seed)
+    rows: dict[str, list] = {
+        k: [] for k in ("person_id", "league", "season_id", "season_order", "minutes", "age")
+    }
+    for person in range(n_people):
+        first = int(rng.integers(2000, 2020))
+        for year in range(first, first + int(rng.integers(1, 9))):
+            for league in rng.choice(LEAGUES, size=int(rng.integers(1, 3)), replace=False):
+                rows["person_id"].append(f"p{person:06d}")
+                rows["league"].append(str(league))
+                rows["season_id"].append(f"{league}_{year}")
+                rows["season_order"].append(year)
+                rows["minutes"].append(float(rng.integers(100, 2500)))
+                rows["age"].append(float(year - 1980))
+    return pl.DataFrame(rows).with_columns(
+        pl.col("season_order").cast(pl.Int32),
+        pl.lit(0.95).alias("confidence"),
+        pl.col("person_id").alias("player_name"),
+    )
+
+
+def with_reference(monkeypatch: pytest.MonkeyPatch, frame: pl.DataFrame) -> pl.DataFrame:
+    with monkeypatch.context() as patched:
+        patched.setattr(gold, "_greedy_match", reference_greedy_match)
+        return gold.build_transition_pairs(frame)
+
+
+def test_pairs_match_the_row_by_row_walk(monkeypatch: pytest.MonkeyPatch) -> None:
+    frame = synthetic_player_seasons(3000, seed=1)
+
+    pairs = gold.build_transition_pairs(frame)
+
+    assert pairs.height > 0
+    assert pairs.equals(with_reference(monkeypatch, frame))
+
+
+def test_a_shared_target_goes_to_the_nearest_source() -> None:
+    """Two qualifying EuroLeague seasons before one NBA season: one pair, gap 1."""
+    frame = pl.DataFrame(
+        {
+            "person_id": ["p1"] * 3,
+            "league": ["EL", "EL", "NBA"],
+            "season_id": ["EL_2018", "EL_2019", "NBA_2020"],
+            "season_order": [2018, 2019, 2020],
+            "minutes": [900.0, 900.0, 900.0],
+            "age": [22.0, 23.0, 24.0],
+            "confidence": [1.0] * 3,
+            "player_name": ["A"] * 3,
+        }
+    ).with_columns(pl.col("season_order").cast(pl.Int32))
+
+    pairs = gold.build_transition_pairs(frame)
+
+    assert pairs.select("source_season_id", "target_season_id", "gap_seasons").rows() == [
+        ("EL_2019", "NBA_2020", 1)
+    ]
+
+
+def test_conflict_chains_resolve_like_the_walk() -> None:
+    """Random candidates dense enough that conflicts chain across several rounds."""
+    rng = np.random.default_rng(3)
+    n = 5000
+    source = rng.integers(0, 6, n)
+    gap = rng.integers(1, 3, n)
+    candidates = pl.DataFrame(
+        {
+            "person_id": rng.integers(0, 200, n).astype(str),
+            "source_league": rng.choice(["NBA", "EL"], n),
+            "target_league": "GL",
+            "source_season_id": source.astype(str),
+            "target_season_id": (source + gap).astype(str),
+            "target_season_order": source + gap,
+            "gap_seasons_raw": gap,
+        }
+    ).unique(["person_id", "source_league", "source_season_id", "target_season_id"])
+
+    assert gold._greedy_match(candidates).equals(reference_greedy_match(candidates))
+
+
+@pytest.mark.slow
+def test_matching_benchmark_at_ten_times_the_real_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Gold holds about 22,000 player-seasons; this builds roughly 220,000.
+
+    Both timings are logged rather than compared, so a loaded runner cannot
+    fail it; ``pytest -m slow --log-cli-level=INFO`` shows them.
+    """
+    frame = synthetic_player_seasons(33_000, seed=2)
+    assert frame.height > 200_000
+
+    captured: list[pl.DataFrame] = []
+    match = gold._greedy_match
+    monkeypatch.setattr(gold, "_greedy_match", lambda c: captured.append(c) or match(c))
+    gold.build_transition_pairs(frame)
+    (candidates,) = captured
+
+    started = time.perf_counter()
+    pairs = match(candidates)
+    vectorised = time.perf_counter() - started
+
+    started = time.perf_counter()
+    expected = reference_greedy_match(candidates)
+    walked = time.perf_counter() - started
+
+    log.info(
+        "%s player-seasons, %s candidates, %s pairs: vectorised %.2fs, row-by-row %.2fs",
+        f"{frame.height:,}",
+        f"{candidates.height:,}",
+        f"{pairs.height:,}",
+        vectorised,
+        walked,
+    )
+    assert pairs.equals(expected)
+
+
+# ------------------------------------------------------------ incremental build
+
+NBA_COUNTING = ["GP", "MIN", "PTS", "FGA", "FGM", "FG3A", "FG3M", "FTA", "FTM"]
+NBA_COUNTING += ["OREB", "DREB", "REB", "AST", "TOV", "STL", "BLK", "PF"]
+EL_COUNTING = ["gamesPlayed", "minutesPlayed", "pointsScored", "twoPointersMade"]
+EL_COUNTING += ["twoPointersAttempted", "threePointersMade", "threePointersAttempted"]
+EL_COUNTING += ["freeThrowsMade", "freeThrowsAttempted", "offensiveRebounds"]
+EL_COUNTING += ["defensiveRebounds", "totalRebounds", "assists", "turnovers", "steals"]
+EL_COUNTING += ["blocks", "foulsCommited"]
+
+#: (id, name, birth year): a few careers that cross leagues over three seasons.
+NBA_ROSTER = [(1, "Luka Doncic", 1999), (2, "Alpha Guard", 1995), (3, "Beta Wing", 1997)]
+NBA_ROSTER += [(4, "Gamma Big", 1996), (5, "Delta Forward", 1998)]
+EL_ROSTER = [("E1", "DONCIC, LUKA", 1999), ("E2", "GUARD, ALPHA", 1995)]
+EL_ROSTER += [("E3", "CENTER, OMEGA", 1993), ("E4", "BIG, GAMMA", 1996)]
+EL_ROSTER += [("E5", "FORWARD, DELTA", 1998)]
+
+
+def _counting(columns: list[str], n: int, scale: float) -> dict[str, list[float]]:
+    return {c: [scale * (10 + 7 * i + 3 * k) for k in range(n)] for i, c in enumerate(columns)}
+
+
+def nba_frame(ids: list[int], scale: float = 1.0) -> pd.DataFrame:
+    roster = {i: name for i, name, _ in NBA_ROSTER}
+    frame = pd.DataFrame(
+        {
+            "PLAYER_ID": ids,
+            "PLAYER_NAME": [roster[i] for i in ids],
+            "TEAM_ID": [100 + i % 2 for i in ids],
+            "TEAM_ABBREVIATION": [f"T{i % 2}" for i in ids],
+            **_counting(NBA_COUNTING, len(ids), scale),
+        }
+    )
+    frame["MIN"] = [900.0 + 50 * k for k in range(len(ids))]
+    return frame
+
+
+def el_frame(codes: list[str], start_year: int) -> pd.DataFrame:
+    roster = {code: (name, born) for code, name, born in EL_ROSTER}
+    frame = pd.DataFrame(
+        {
+            "player.name": [roster[c][0] for c in codes],
+            "player.code": codes,
+            "player.team.code": ["RMB"] * len(codes),
+            "player.team.name": ["Real Madrid"] * len(codes),
+            "player.age": [float(start_year - roster[c][1]) for c in codes],
+            **_counting(EL_COUNTING, len(codes), 1.0),
+        }
+    )
+    frame["minutesPlayed"] = [700.0 + 40 * k for k in range(len(codes))]
+    return frame
+
+
+def put(cache: BronzeCache, source: str, endpoint: str, params: dict, frame: pd.DataFrame) -> None:
+    cache.fetch(
+        source=source, endpoint=endpoint, params=params, fetcher=lambda: frame, refresh=True
+    )
+
+
+def nba_params(season: Season, measure: str | None = None) -> dict:
+    params = {"season": season.nba_stats_season, "league_id": "00"}
+    if season.league == "GL":
+        params["league_id"] = "20"
+    if measure is not None:
+        params["measure_type"] = measure
+    return params
+
+
+def el_params(season: Season) -> dict:
+    return {"season": season.euroleague_season, "statistic_mode": "Accumulated"}
+
+
+def put_nba_season(cache: BronzeCache, season: Season, ids: list[int], scale: float = 1.0) -> None:
+    born = {i: year for i, _, year in NBA_ROSTER}
+    put(
+        cache, "nba_stats", "player_season_stats", nba_params(season, "Base"), nba_frame(ids, scale)
+    )
+    bio = pd.DataFrame({"PLAYER_ID": ids, "AGE": [float(season.start_year - born[i]) for i in ids]})
+    put(cache, "nba_stats", "player_bio_stats", nba_params(season), bio)
+
+
+@pytest.fixture
+def bronze_paths(tmp_path: Path) -> DataPaths:
+    """Three seasons a side, with Doncic and a guard moving EL -> NBA."""
+    paths = DataPaths(root=tmp_path)
+    cache = BronzeCache(paths.bronze)
+    nba = seasons_for("NBA")[-3:]
+    el = seasons_for("EL")[-3:]
+    gl = seasons_for("GL")[-1]
+    put_nba_season(cache, nba[0], [3, 4])
+    put_nba_season(cache, nba[1], [1, 3, 4])
+    put_nba_season(cache, nba[2], [1, 2, 3, 5])
+    put_nba_season(cache, gl, [5])
+    put(
+        cache,
+        "euroleague",
+        "player_season_stats",
+        el_params(el[0]),
+        el_frame(["E1", "E2", "E3"], el[0].start_year),
+    )
+    put(
+        cache,
+        "euroleague",
+        "player_season_stats",
+        el_params(el[1]),
+        el_frame(["E2", "E3"], el[1].start_year),
+    )
+    put(
+        cache,
+        "euroleague",
+        "player_season_stats",
+        el_params(el[2]),
+        el_frame(["E3", "E4"], el[2].start_year),
+    )
+    return paths
+
+
+def build(paths: DataPaths) -> BuildResult:
+    """A build as ``hoopslab build`` runs one: built, then written."""
+    result = build_gold(paths)
+    write_gold(result, paths)
+    return result
+
+
+def assert_matches_a_full_rebuild(paths: DataPaths, result: BuildResult) -> None:
+    reference = build_gold(paths, full=True, save_state=False)
+    assert incremental.compare_builds(result.tables, reference.tables) == []
+
+
+def test_a_first_build_is_full_and_an_unchanged_rebuild_does_nothing(
+    bronze_paths: DataPaths,
+) -> None:
+    first = build(bronze_paths)
+    assert first.plan is not None and first.plan.full
+    assert first.tables["transition_pairs"].height > 0
+
+    again = build(bronze_paths)
+
+    assert again.plan is not None
+    assert again.plan.dirty_seasons == []
+    assert again.plan.crosswalk_reused
+    assert again.plan.n_persons_rebuilt == 0
+    assert incremental.compare_builds(again.tables, first.tables) == []
+
+
+def test_a_changed_season_is_rebuilt_alone_and_matches_a_full_rebuild(
+    bronze_paths: DataPaths,
+) -> None:
+    build(bronze_paths)
+    current = seasons_for("NBA")[-1]
+    put_nba_season(BronzeCache(bronze_paths.bronze), current, [1, 2, 3, 5], scale=1.5)
+
+    result = build(bronze_paths)
+
+    assert result.plan is not None
+    assert result.plan.dirty_seasons == [current.season_id]
+    assert result.plan.crosswalk_reused
+    assert result.plan.gold_incremental
+    assert result.plan.n_persons_rebuilt == 4
+    assert_matches_a_full_rebuild(bronze_paths, result)
+
+
+def test_a_changed_age_reruns_the_crosswalk_but_not_all_of_gold(bronze_paths: DataPaths) -> None:
+    build(bronze_paths)
+    cache = BronzeCache(bronze_paths.bronze)
+    season = seasons_for("NBA")[-2]
+    bio = pd.DataFrame({"PLAYER_ID": [1, 3, 4], "AGE": [None, 27.0, 28.0]})
+    put(cache, "nba_stats", "player_bio_stats", nba_params(season), bio)
+
+    result = build(bronze_paths)
+
+    assert result.plan is not None
+    assert not result.plan.crosswalk_reused
+    assert result.plan.gold_incremental
+    assert_matches_a_full_rebuild(bronze_paths, result)
+
+
+def test_new_identities_rebuild_gold_in_full(bronze_paths: DataPaths) -> None:
+    build(bronze_paths)
+    cache = BronzeCache(bronze_paths.bronze)
+    season = seasons_for("EL")[-1]
+    put(
+        cache,
+        "euroleague",
+        "player_season_stats",
+        el_params(season),
+        el_frame(["E3", "E4", "E5"], season.start_year),
+    )
+
+    result = build(bronze_paths)
+
+    assert result.plan is not None
+    assert not result.plan.gold_incremental
+    assert_matches_a_full_rebuild(bronze_paths, result)
+
+
+def test_state_from_other_transform_code_is_ignored(
+    bronze_paths: DataPaths, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    build(bronze_paths)
+    monkeypatch.setattr(incremental, "code_digest", lambda: "something-else")
+
+    assert incremental.BuildState.load(bronze_paths.silver) is None
+    result = build(bronze_paths)
+    assert result.plan is not None and result.plan.full
+
+
+def test_a_build_that_fails_verification_records_nothing(
+    bronze_paths: DataPaths, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Neither the incremental state nor the identity store moves on a rejected build."""
+    build(bronze_paths)
+    recorded = incremental.BuildState.load(bronze_paths.silver)
+    assert recorded is not None
+    season = seasons_for("EL")[-1]
+    frame = el_frame(["E3", "E4", "E5"], season.start_year)
+    put(
+        BronzeCache(bronze_paths.bronze),
+        "euroleague",
+        "player_season_stats",
+        el_params(season),
+        frame,
+    )
+    monkeypatch.setattr(DataPaths, "discover", classmethod(lambda *_: bronze_paths))
+    monkeypatch.setattr(incremental, "compare_builds", lambda *_: ["persons: differs"])
+
+    result = CliRunner().invoke(app, ["build", "--verify-incremental"])
+
+    assert result.exit_code == 1
+    after = incremental.BuildState.load(bronze_paths.silver)
+    assert after is not None and after.seasons == recorded.seasons
+    assert IdentityStore.open(bronze_paths.identity_store).version == 1
+
+
+def test_the_match_policy_reaches_the_identity_store(
+    bronze_paths: DataPaths, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(DataPaths, "discover", classmethod(lambda *_: bronze_paths))
+
+    result = CliRunner().invoke(app, ["build", "--match-policy", "wide"])
+
+    assert result.exit_code == 0, result.stdout
+    assert IdentityStore.open(bronze_paths.identity_store, WIDE_POLICY).trusted
+    assert not IdentityStore.open(bronze_paths.identity_store).trusted
+
+    monkeypatch.setenv("HOOPSLAB_MATCH_POLICY", "default")
+    result = CliRunner().invoke(app, ["build"])
+
+    assert result.exit_code == 0, result.stdout
+    assert IdentityStore.open(bronze_paths.identity_store).trusted
+    assert CliRunner().invoke(app, ["build", "--match-policy", "loose"]).exit_code == 2
@@ -0,0 +1,248 @@
+"""The versioned identity store: only what moved is resolved again.
+
+Every incremental resolution here is checked against ``build_crosswalk`` run
+from scratch on the same players, since agreeing with it is the whole promise.
+"""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from hoopslab.transform import identity_store
+from hoopslab.transform.crosswalk import (
+    DEFAULT_POLICY,
+    WIDE_POLICY,
+    MatchPolicy,
+    People,
+    build_crosswalk,
+)
+from hoopslab.transform.identity_store import IdentityStore
+from hoopslab.transform.names import match_key, normalize_name
+
+
+def seasons(league: str, players: list[tuple[str, str, float | None]]) -> pl.DataFrame:
+    """One 2020 season per ``(source_player_id, name, age)``."""
+    return pl.DataFrame(
+        {
+            "league": [league] * len(players),
+            "source_player_id": [pid for pid, _, _ in players],
+            "player_name": [name for _, name, _ in players],
+            "normalized_name": [normalize_name(name) for _, name, _ in players],
+            "match_key": [match_key(name) for _, name, _ in players],
+            "start_year": [2020.0] * len(players),
+            "age": [age for _, _, age in players],
+        },
+        schema={
+            "league": pl.Utf8,
+            "source_player_id": pl.Utf8,
+            "player_name": pl.Utf8,
+            "normalized_name": pl.Utf8,
+            "match_key": pl.Utf8,
+            "start_year": pl.Float64,
+            "age": pl.Float64,
+        },
+    )
+
+
+NBA = [
+    ("1", "Nikola Mirotic", 29.0),
+    ("2", "Shane Larkin", 27.0),
+    ("3", "Gustavo Ayon", 35.0),
+    ("4", "Kostas Sloukas", 30.0),
+]
+GLEAGUE = [("4", "Kostas Sloukas", 29.0), ("9", "Tyler Dorsey", 24.0)]
+EUROLEAGUE = [
+    ("E1", "Nikola Mirotic", 29.0),
+    ("E2", "Shane Larkin", 27.0),
+    ("E3", "Kevin Punter", 27.0),
+    ("E9", "Tyler Dorsey", 24.0),
+]
+
+
+class League:
+    """Three leagues of players, resolved through a store in ``root``."""
+
+    def __init__(self, root: Path, policy: MatchPolicy = DEFAULT_POLICY) -> None:
+        self.directory = root / "_identity_store"
+        self.nba, self.gleague, self.euroleague = list(NBA), list(GLEAGUE), list(EUROLEAGUE)
+        self.overrides: pl.DataFrame | None = None
+        self.policy = policy
+
+    def frames(self) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+        return seasons("NBA", self.nba), seasons("GL", self.gleague), seasons("EL", self.euroleague)
+
+    def resolve(self, *, full: bool = False) -> identity_store.Resolution:
+        people = People.from_player_seasons(*self.frames())
+        store = IdentityStore.open(self.directory, self.policy)
+        return store.resolve(people, self.overrides, full=full)
+
+    def from_scratch(self) -> pl.DataFrame:
+        return build_crosswalk(*self.frames(), self.overrides, policy=self.policy)[1]
+
+
+@pytest.fixture
+def league(tmp_path: Path) -> League:
+    first = League(tmp_path)
+    first.resolve().commit()
+    return first
+
+
+def test_the_first_resolution_is_a_full_one(tmp_path: Path) -> None:
+    resolution = League(tmp_path).resolve()
+
+    assert resolution.diff.full
+    assert resolution.diff.n_resolved == len(EUROLEAGUE)
+    assert resolution.diff.count("added") == resolution.identities.height
+    assert resolution.identities.equals(League(tmp_path).from_scratch())
+
+
+def test_an_unchanged_build_resolves_nobody_and_commits_nothing(league: League) -> None:
+    resolution = league.resolve()
+
+    assert resolution.diff.n_resolved == 0
+    assert resolution.diff.empty
+    assert not resolution.commit()
+    assert IdentityStore.open(league.directory).version == 1
+
+
+def test_a_refresh_resolves_only_the_new_players(league: League) -> None:
+    league.nba.append(("5", "Will Clyburn", 29.0))
+    league.euroleague += [("E4", "Will Clyburn", 29.0), ("E5", "Mike James", 29.0)]
+
+    resolution = league.resolve()
+
+    assert resolution.diff.n_resolved == 2
+    assert resolution.identities.equals(league.from_scratch())
+    added = resolution.diff.changes.filter(pl.col("change") == "added")
+    assert set(added["source_player_id"]) == {"5", "E4", "E5"}
+
+
+def test_a_new_namesake_makes_a_settled_match_ambiguous_as_a_full_run_would(
+    league: League,
+) -> None:
+    """The stored link is re-examined because the registry around it moved."""
+    league.nba.append(("6", "Shane Larkin", 27.0))
+
+    resolution = league.resolve()
+
+    assert resolution.identities.equals(league.from_scratch())
+    relinked = resolution.diff.changes.filter(pl.col("change") == "changed").row(0, named=True)
+    assert relinked["source_player_id"] == "E2"
+    assert relinked["match_method_before"] == "name_and_age"
+    assert relinked["match_method_after"] == "name_ambiguous"
+
+
+def test_an_ambiguous_player_is_looked_at_again_every_time(league: League) -> None:
+    league.nba.append(("6", "Shane Larkin", 27.0))
+    league.resolve().commit()
+
+    resolution = league.resolve()
+
+    assert resolution.diff.n_resolved == 1
+    assert resolution.diff.empty
+
+
+def test_a_new_override_relinks_only_its_player(league: League) -> None:
+    league.overrides = pl.DataFrame({"euroleague_player_id": ["E3"], "nba_player_id": ["3"]})
+
+    resolution = league.resolve()
+
+    assert resolution.diff.n_resolved == 1
+    assert resolution.identities.equals(league.from_scratch())
+    assert resolution.diff.count("changed") == 1
+
+
+def test_any_earlier_version_can_be_replayed(league: League) -> None:
+    original = IdentityStore.open(league.directory).identities
+    league.nba.append(("6", "Shane Larkin", 27.0))
+    league.euroleague.append(("E5", "Mike James", 29.0))
+    league.resolve().commit()
+
+    store = IdentityStore.open(league.directory)
+
+    assert store.version == 2
+    assert original is not None and store.identities is not None
+    assert store.at(1).equals(original.sort("league", "source_player_id"))
+    assert store.at(2).equals(store.identities.sort("league", "source_player_id"))
+
+
+def test_a_change_of_rules_resolves_everyone_and_still_reports_the_diff(
+    league: League, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(identity_store, "RULES_DIGEST", "new rules")
+    league.euroleague.append(("E5", "Mike James", 29.0))
+
+    resolution = league.resolve()
+
+    assert resolution.diff.full
+    assert resolution.diff.n_resolved == len(league.euroleague)
+    assert resolution.diff.count("added") == 1
+    assert resolution.diff.count("changed") == 0
+
+
+def test_a_change_of_policy_resolves_everyone(league: League) -> None:
+    league.policy = WIDE_POLICY
+
+    resolution = league.resolve()
+
+    assert resolution.diff.full
+    assert resolution.identities.equals(league.from_scratch())
+    relinked = resolution.diff.changes.filter(pl.col("change") == "changed")
+    assert relinked.select("source_player_id", "person_id_after").rows() == [("E9", "nba_9")]
+
+
+#: Families of near-spellings of one another, so that players compete for
+#: the same registry person through both the exact and the fuzzy tier.
+NEAR_SPELLINGS = [
+    ["Aleksandar Vezenkov", "Aleksander Vezenkov", "Aleksandar Vesenkov"],
+    ["Kostas Papanikolaou", "Kostas Papanikolau", "Costas Papanikolaou"],
+    ["Nikola Kalinic", "Nikola Kalinich", "Nicola Kalinic"],
+]
+
+
+def random_player(rng: random.Random, pid: str) -> tuple[str, str, float | None]:
+    return pid, rng.choice(rng.choice(NEAR_SPELLINGS)), rng.choice([27.0, 27.0, 28.0, 31.0, None])
+
+
+def random_change(rng: random.Random, league: League, step: int) -> None:
+    """One refresh's worth of news: arrivals, departures, corrections, overrides."""
+    roster = rng.choice([league.nba, league.gleague, league.euroleague, league.euroleague])
+    prefix = "E" if roster is league.euroleague else ("" if roster is league.nba else "G")
+    action = rng.choice(["add", "add", "remove", "edit", "override"])
+    if action == "add" or not roster:
+        roster.append(random_player(rng, f"{prefix}{step}{rng.randint(0, 9)}"))
+    elif action == "remove":
+        roster.pop(rng.randrange(len(roster)))
+    elif action == "edit":
+        at = rng.randrange(len(roster))
+        roster[at] = random_player(rng, roster[at][0])
+    elif league.euroleague and league.nba:
+        league.overrides = pl.DataFrame(
+            {
+                "euroleague_player_id": [rng.choice(league.euroleague)[0]],
+                "nba_player_id": [rng.choice(league.nba)[0]],
+            }
+        )
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_every_incremental_resolution_agrees_with_a_full_one(tmp_path: Path, seed: int) -> None:
+    """Near-spelling links included, through a run of random refreshes."""
+    rng = random.Random(seed)
+    league = League(tmp_path, WIDE_POLICY)
+    league.nba = [random_player(rng, str(i)) for i in range(6)]
+    league.gleague = [random_player(rng, f"G{i}") for i in range(3)]
+    league.euroleague = [random_player(rng, f"E{i}") for i in range(6)]
+    league.resolve().commit()
+
+    for step in range(15):
+        random_change(rng, league, step)
+
+        resolution = league.resolve()
+
+        assert resolution.identities.equals(league.from_scratch()), f"step {step}"
+        resolution.commit()
@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import json
 import time
+from collections.abc import Callable
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
-from hoopslab.ingest.retry import RETRYABLE_STATUS, is_retryable
-from hoopslab.io.bronze import BronzeCache, cache_key, frame_digest
-from hoopslab.io.rate_limit import RateLimiter
+from hoopslab.ingest.retry import (
+    RETRYABLE_STATUS,
+    is_retryable,
+    is_throttle,
+    retry_after_of,
+    with_retries,
+)
+from hoopslab.io.bronze import BronzeCache, Payload, cache_key, frame_digest
+from hoopslab.io.manifest import ManifestIndex
+from hoopslab.io.rate_limit import AdaptiveRateLimiter, LearnedRates, RateLimiter
 
 
 def sample_frame() -> pd.DataFrame:
@@ -94,6 +103,65 @@ class TestBronzeCache:
         cache.fetch(source="s", endpoint="e", params={"x": 1}, fetcher=sample_frame)
         assert cache.load("s", "e", {"x": 1}) is not None
 
+    def test_a_refresh_with_identical_content_is_not_rewritten(self, tmp_path: Path) -> None:
+        cache = BronzeCache(tmp_path)
+        first = cache.fetch(source="s", endpoint="e", params={}, fetcher=sample_frame)
+        path = cache.path_for("s", "e", first.key)
+        written_at = path.stat().st_mtime_ns
+
+        again = cache.fetch(source="s", endpoint="e", params={}, fetcher=sample_frame, refresh=True)
+
+        assert first.status == "new"
+        assert again.unchanged
+        assert path.stat().st_mtime_ns == written_at
+        assert [entry["status"] for entry in cache.manifest()] == ["new", "unchanged"]
+
+    def test_a_refresh_with_new_content_is_rewritten(self, tmp_path: Path) -> None:
+        cache = BronzeCache(tmp_path)
+        cache.fetch(source="s", endpoint="e", params={}, fetcher=sample_frame)
+
+        def revised() -> pd.DataFrame:
+            frame = sample_frame()
+            frame.loc[0, "a"] = 99
+            return frame
+
+        result = cache.fetch(source="s", endpoint="e", params={}, fetcher=revised, refresh=True)
+
+        assert result.status == "changed"
+        assert cache.load("s", "e", {})["a"].iloc[0] == 99
+
+    def test_validators_are_recorded_and_offered_back(self, tmp_path: Path) -> None:
+        cache = BronzeCache(tmp_path)
+        assert cache.validators("s", "e", {}) is None
+
+        cache.fetch(
+            source="s",
+            endpoint="e",
+            params={},
+            fetcher=lambda: Payload(sample_frame(), etag='"v1"', last_modified="Tue, 01 Jul"),
+        )
+        validators = cache.validators("s", "e", {})
+
+        assert validators is not None
+        assert validators.etag == '"v1"'
+        assert validators.last_modified == "Tue, 01 Jul"
+        assert validators.digest == frame_digest(sample_frame())
+
+    def test_not_modified_serves_the_stored_payload(self, tmp_path: Path) -> None:
+        cache = BronzeCache(tmp_path)
+        cache.fetch(
+            source="s", endpoint="e", params={}, fetcher=lambda: Payload(sample_frame(), etag="x")
+        )
+
+        result = cache.fetch(
+            source="s", endpoint="e", params={}, fetcher=lambda: Payload(None), refresh=True
+        )
+
+        assert result.unchanged
+        pd.testing.assert_frame_equal(result.frame, sample_frame())
+        # A 304 has no validators of its own; the stored ones still apply.
+        assert cache.manifest()[-1]["etag"] == "x"
+
     def test_a_failing_fetch_leaves_nothing_behind(self, tmp_path: Path) -> None:
         cache = BronzeCache(tmp_path)
 
@@ -107,6 +175,93 @@ class TestBronzeCache:
         assert cache.manifest() == []
 
 
+class TestManifestIndex:
+    @staticmethod
+    def refetched(tmp_path: Path, times: int = 3) -> BronzeCache:
+        cache = BronzeCache(tmp_path)
+        for i in range(times):
+            cache.fetch(
+                source="s",
+                endpoint="e",
+                params={},
+                fetcher=lambda i=i: pd.DataFrame({"a": [i]}),
+                refresh=True,
+            )
+        cache.fetch(source="s", endpoint="other", params={}, fetcher=sample_frame)
+        return cache
+
+    def test_latest_is_the_most_recent_entry_for_the_payload(self, tmp_path: Path) -> None:
+        cache = self.refetched(tmp_path)
+        key = cache_key("s", "e", {})
+
+        latest = cache.latest("s", "e", key)
+
+        assert latest is not None
+        assert latest == cache.manifest()[2]
+        assert cache.latest("s", "e", "missing") is None
+
+    def test_history_is_every_entry_oldest_first(self, tmp_path: Path) -> None:
+        cache = self.refetched(tmp_path)
+        history = cache.history("s", "e", {})
+        assert [entry["status"] for entry in history] == ["new", "changed", "changed"]
+
+    def test_is_rebuilt_from_the_log_when_deleted(self, tmp_path: Path) -> None:
+        cache = self.refetched(tmp_path)
+        cache.index.sync()
+        cache.index.path.unlink()
+
+        assert len(ManifestIndex(cache.manifest_path)) == 4
+
+    def test_picks_up_lines_appended_by_anyone(self, tmp_path: Path) -> None:
+        cache = self.refetched(tmp_path)
+        assert len(cache.index) == 4
+
+        entry = {**cache.manifest()[0], "fetched_at": "later", "digest": "x"}
+        with cache.manifest_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry) + "\n")
+
+        assert cache.latest("s", "e", entry["key"])["fetched_at"] == "later"
+
+    def test_a_replaced_log_rebuilds_the_index(self, tmp_path: Path) -> None:
+        cache = self.refetched(tmp_path)
+        cache.index.sync()
+        lines = cache.manifest_path.read_text(encoding="utf-8").splitlines(keepends=True)
+        cache.manifest_path.write_text(lines[-1], encoding="utf-8")
+
+        assert len(cache.index) == 1
+
+    @pytest.mark.parametrize(
+        "restore",
+        [
+            lambda lines: lines[::-1],
+            lambda lines: lines[:1] + lines[:0:-1],
+            lambda lines: lines[::-1] + lines[:1],
+        ],
+        ids=["same_size", "same_first_line", "longer"],
+    )
+    def test_a_log_restored_in_place_rebuilds_the_index(
+        self, tmp_path: Path, restore: Callable[[list[str]], list[str]]
+    ) -> None:
+        """A restored log need not be shorter, so its length alone cannot tell."""
+        cache = self.refetched(tmp_path)
+        cache.index.sync()
+        lines = cache.manifest_path.read_text(encoding="utf-8").splitlines(keepends=True)
+        restored = restore(lines)
+        cache.manifest_path.write_text("".join(restored), encoding="utf-8")
+
+        entries = [json.loads(line) for line in restored]
+        assert cache.history("s", "e", {}) == [e for e in entries if e["endpoint"] == "e"]
+
+    def test_compaction_keeps_the_latest_and_leaves_the_log_alone(self, tmp_path: Path) -> None:
+        cache = self.refetched(tmp_path)
+        before = cache.manifest()
+
+        assert cache.index.compact() == 2
+        assert len(cache.index) == 2
+        assert cache.history("s", "e", {}) == [before[2]]
+        assert cache.manifest() == before
+
+
 class TestRateLimiter:
     def test_spaces_consecutive_acquisitions(self) -> None:
         limiter = RateLimiter(requests_per_second=20.0)  # 50 ms apart
@@ -141,6 +296,62 @@ class TestRateLimiter:
             RateLimiter(requests_per_second=0.0)
 
 
+class TestAdaptiveRateLimiter:
+    def test_ramps_up_additively_while_requests_succeed(self) -> None:
+        limiter = AdaptiveRateLimiter(1.0, increase_rps=0.1, max_rps=2.0)
+        for _ in range(5):
+            limiter.succeeded()
+        assert limiter.requests_per_second == pytest.approx(1.5)
+
+    def test_never_exceeds_the_ceiling(self) -> None:
+        limiter = AdaptiveRateLimiter(1.9, increase_rps=0.5, max_rps=2.0)
+        limiter.succeeded()
+        assert limiter.requests_per_second == 2.0
+
+    def test_halves_on_a_throttle_down_to_the_floor(self) -> None:
+        limiter = AdaptiveRateLimiter(1.0, min_rps=0.3)
+        limiter.throttled()
+        assert limiter.requests_per_second == pytest.approx(0.5)
+        limiter.throttled()
+        assert limiter.requests_per_second == pytest.approx(0.3)
+        assert limiter.n_throttled == 2
+
+    def test_retry_after_holds_off_the_next_acquisition(self) -> None:
+        limiter = AdaptiveRateLimiter(100.0, max_rps=100.0)
+        limiter.throttled(retry_after=0.1)
+        assert limiter.acquire() >= 0.09
+
+    def test_a_fixed_limiter_still_honours_retry_after(self) -> None:
+        limiter = RateLimiter(requests_per_second=100.0)
+        limiter.throttled(retry_after=0.1)
+        assert limiter.acquire() >= 0.09
+        assert limiter.requests_per_second == 100.0
+
+    def test_a_starting_rate_outside_the_bounds_is_clamped(self) -> None:
+        assert AdaptiveRateLimiter(9.0, max_rps=2.0).requests_per_second == 2.0
+
+    def test_rejects_an_increasing_decrease_factor(self) -> None:
+        with pytest.raises(ValueError, match="decrease_factor"):
+            AdaptiveRateLimiter(1.0, decrease_factor=1.5)
+
+
+class TestLearnedRates:
+    def test_round_trips_a_rate_per_source(self, tmp_path: Path) -> None:
+        rates = LearnedRates(tmp_path / "rate_limits.json")
+        rates.put("nba_stats", AdaptiveRateLimiter(1.25))
+        rates.put("euroleague", AdaptiveRateLimiter(0.5))
+
+        reread = LearnedRates(tmp_path / "rate_limits.json")
+        assert reread.get("nba_stats") == 1.25
+        assert reread.get("euroleague") == 0.5
+        assert reread.get("espn") is None
+
+    def test_an_unreadable_file_means_no_learned_rate(self, tmp_path: Path) -> None:
+        path = tmp_path / "rate_limits.json"
+        path.write_text("{not json", encoding="utf-8")
+        assert LearnedRates(path).get("nba_stats") is None
+
+
 class TestRetryPolicy:
     @pytest.mark.parametrize("status", sorted(RETRYABLE_STATUS))
     def test_retries_transient_statuses(self, status: int) -> None:
@@ -165,11 +376,62 @@ class TestRetryPolicy:
     def test_does_not_retry_a_programming_error(self) -> None:
         assert not is_retryable(TypeError("bad argument"))
 
+    def test_only_429_and_timeouts_count_as_throttling(self) -> None:
+        class ReadTimeout(Exception):
+            pass
+
+        assert is_throttle(_http_error(429))
+        assert is_throttle(ReadTimeout("slow"))
+        assert not is_throttle(_http_error(503))
+
+    def test_reads_retry_after_in_seconds(self) -> None:
+        assert retry_after_of(_http_error(429, {"Retry-After": "7"})) == 7.0
+        assert retry_after_of(_http_error(429)) is None
 
-def _http_error(status: int) -> Exception:
+    def test_an_absurd_retry_after_is_capped(self) -> None:
+        assert retry_after_of(_http_error(429, {"Retry-After": "86400"})) == 300.0
+
+    def test_outcomes_are_fed_back_to_the_limiter(self) -> None:
+        limiter = AdaptiveRateLimiter(1.0, increase_rps=0.1)
+        outcomes = iter([_http_error(404), None])
+
+        def call() -> str:
+            failure = next(outcomes)
+            if failure is not None:
+                raise failure
+            return "ok"
+
+        guarded = with_retries(limiter=limiter)(call)
+        with pytest.raises(Exception, match="HTTP 404"):
+            guarded()
+        # Not a throttle, so the rate is untouched.
+        assert limiter.requests_per_second == 1.0
+
+        assert guarded() == "ok"
+        assert limiter.requests_per_second == pytest.approx(1.1)
+
+    def test_a_429_slows_the_limiter_before_the_retry(self) -> None:
+        limiter = AdaptiveRateLimiter(1.0)
+        guarded = with_retries(attempts=1, limiter=limiter)(_raise(_http_error(429)))
+
+        with pytest.raises(Exception, match="HTTP 429"):
+            guarded()
+        assert limiter.requests_per_second == pytest.approx(0.5)
+
+
+def _raise(exc: Exception):  # type: ignore[no-untyped-def]
+    def call() -> None:
+        raise exc
+
+    return call
+
+
+def _http_error(status: int, headers: dict[str, str] | None = None) -> Exception:
     class Response:
         status_code = status
 
+    Response.headers = headers or {}  # type: ignore[attr-defined]
+
     class HTTPError(Exception):
         response = Response()
 
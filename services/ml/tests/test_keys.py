@@ -0,0 +1,80 @@
+"""Integer keys behind the string identifiers: same answers, smaller columns."""
+
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from hoopslab.features.translation import build_transition_frame
+from hoopslab.transform.keys import DIRECTION, DIRECTIONS, GoldKeys, decode
+
+
+def player_seasons() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "person_id": ["nba_2", "nba_10", "el_A", "nba_2", "el_A", None],
+            "season_id": ["EL_2019", "NBA_2020", "EL_2019", "NBA_2020", "NBA_2021", "GL_2020"],
+            "z_usg_pct": [0.5, -0.2, 1.1, 0.3, 0.9, 0.0],
+            "usg_pct": [0.25, 0.18, 0.28, 0.22, 0.26, 0.2],
+            "age": [24.0, 30.0, 22.0, 25.0, 24.0, 21.0],
+        }
+    )
+
+
+def pairs() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "person_id": ["nba_2", "el_A"],
+            "source_season_id": ["EL_2019", "EL_2019"],
+            "target_season_id": ["NBA_2020", "NBA_2021"],
+            "target_season_order": [2020, 2021],
+            "source_minutes": [900.0, 1200.0],
+            "direction": ["EL->NBA", "EL->NBA"],
+        }
+    )
+
+
+def test_every_identifier_column_is_encoded_and_decodes_unchanged() -> None:
+    keys = GoldKeys.from_frames(player_seasons(), pairs())
+
+    encoded = keys.encode(pairs())
+
+    assert encoded.schema["person_id"] == keys.person
+    assert encoded.schema["target_season_id"] == keys.season
+    assert encoded.schema["direction"] == DIRECTION
+    assert decode(encoded).equals(pairs())
+
+
+def test_sorting_on_keys_orders_rows_as_the_strings_did() -> None:
+    """``nba_10`` sorts before ``nba_2`` as a string, and must as a key too."""
+    frame = player_seasons()
+
+    encoded = GoldKeys.from_frames(frame).encode(frame)
+
+    assert decode(encoded.sort("person_id", "season_id")).equals(
+        frame.sort("person_id", "season_id")
+    )
+
+
+def test_joins_on_keys_give_the_same_frame_as_joins_on_strings() -> None:
+    keys = GoldKeys.from_frames(player_seasons(), pairs())
+
+    on_strings = build_transition_frame(pairs(), player_seasons(), "usg_pct")
+    on_keys = build_transition_frame(keys.encode(pairs()), keys.encode(player_seasons()), "usg_pct")
+
+    assert on_keys.height == 2
+    assert decode(on_keys).equals(on_strings)
+
+
+def test_frames_encoded_against_different_dictionaries_refuse_to_join() -> None:
+    """A shared dictionary is what makes two codes mean the same person."""
+    left = GoldKeys.from_frames(pairs()).encode(pairs())
+    right = GoldKeys.from_frames(player_seasons()).encode(player_seasons())
+
+    with pytest.raises(pl.exceptions.SchemaError):
+        left.join(right, on="person_id")
+
+
+def test_every_direction_between_the_leagues_has_a_key() -> None:
+    assert len(DIRECTIONS) == 6
+    assert {"EL->NBA", "NBA->EL", "GL->NBA"} <= set(DIRECTIONS)
@@ -0,0 +1,153 @@
+"""The fitted-model store shared by training, export and the report layer."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+
+from hoopslab.models import store as model_store
+from hoopslab.models.store import (
+    FittedModelStore,
+    load_or_fit,
+    load_or_fit_all,
+    model_from_json,
+    model_to_json,
+)
+from hoopslab.models.translation import TranslationModel, fit_persistence, fit_translation
+
+
+def persistence_frame(n: int = 400, seed: int = 0) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    z_from = rng.normal(size=n)
+    return pl.DataFrame(
+        {
+            "z_from": z_from,
+            "z_to": 0.8 * z_from + rng.normal(scale=0.3, size=n),
+            "age": rng.uniform(22, 33, size=n),
+            "log_minutes": rng.uniform(6.5, 7.8, size=n),
+        }
+    )
+
+
+def transition_frame(n: int = 150, seed: int = 1) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    z_source = rng.normal(size=n)
+    return pl.DataFrame(
+        {
+            "person_id": [f"p{i}" for i in range(n)],
+            "direction": rng.choice(["EL->NBA", "NBA->EL"], size=n),
+            "z_source": z_source,
+            "z_target": 0.7 * z_source + rng.normal(scale=0.4, size=n),
+            "age_at_source": rng.uniform(22, 32, size=n),
+            "log_source_minutes": rng.uniform(6.2, 7.6, size=n),
+            "gap_seasons": rng.integers(1, 3, size=n),
+            "target_mean": np.full(n, 0.20),
+            "target_sd": np.full(n, 0.05),
+        }
+    )
+
+
+def fitted() -> tuple[TranslationModel, pl.DataFrame]:
+    frame = transition_frame()
+    model = fit_translation(frame, fit_persistence(persistence_frame(), "usg_pct"), "usg_pct")
+    return model, frame
+
+
+def store_at(directory: Path, content_hash: str = "aaa") -> FittedModelStore:
+    return FittedModelStore(
+        directory,
+        contract_hashes={"player_seasons": content_hash, "transition_pairs": "bbb"},
+        model_version="translation-v1.0",
+    )
+
+
+def test_a_serialised_model_predicts_exactly_what_the_fit_did() -> None:
+    model, frame = fitted()
+    restored = model_from_json(model_to_json(model))
+
+    assert np.array_equal(restored.predict_rate(frame), model.predict_rate(frame))
+    assert np.array_equal(
+        restored.prediction_interval(frame, level=0.95),
+        model.prediction_interval(frame, level=0.95),
+    )
+
+
+def test_a_stored_model_is_read_back_by_a_fresh_store(tmp_path: Path) -> None:
+    model, frame = fitted()
+    store_at(tmp_path).put(model)
+
+    restored = store_at(tmp_path).get("usg_pct")
+
+    assert restored is not None
+    assert restored.intercepts == model.intercepts
+    assert np.array_equal(restored.predict_z(frame), model.predict_z(frame))
+
+
+def test_a_contract_hash_change_is_a_miss(tmp_path: Path) -> None:
+    model, _ = fitted()
+    store_at(tmp_path, "aaa").put(model)
+
+    assert store_at(tmp_path, "changed").get("usg_pct") is None
+
+
+def test_storing_under_a_new_snapshot_removes_the_old_entries(tmp_path: Path) -> None:
+    model, _ = fitted()
+    store_at(tmp_path, "aaa").put(model)
+    store_at(tmp_path, "changed").put(model)
+
+    assert len(list(tmp_path.glob("*.json"))) == 1
+    assert store_at(tmp_path, "aaa").get("usg_pct") is None
+
+
+def test_metrics_are_keyed_separately(tmp_path: Path) -> None:
+    store = store_at(tmp_path)
+    assert store.key_for("usg_pct") != store.key_for("ts_pct")
+
+
+def test_load_or_fit_reads_a_stored_model_instead_of_fitting(tmp_path: Path) -> None:
+    """An empty frame cannot be fitted, so getting a model back proves it was read."""
+    model, frame = fitted()
+    store_at(tmp_path).put(model)
+
+    loaded = load_or_fit(pl.DataFrame(), frame, "usg_pct", store=store_at(tmp_path))
+
+    assert loaded.beta == model.beta
+
+
+def test_refit_ignores_the_stored_model(tmp_path: Path) -> None:
+    model, frame = fitted()
+    store_at(tmp_path).put(model)
+
+    with pytest.raises(pl.exceptions.ColumnNotFoundError):
+        load_or_fit(pl.DataFrame(), frame, "usg_pct", store=store_at(tmp_path), refit=True)
+
+
+def test_only_the_metrics_the_store_lacks_are_fitted(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    model, frame = fitted()
+    store_at(tmp_path).put(model)
+    frame = frame.with_columns(
+        pl.lit("EL_2019").alias("source_season_id"), pl.lit("NBA_2020").alias("target_season_id")
+    )
+    asked: list[list[str]] = []
+
+    def fit_missing(_: pl.DataFrame, metrics: list[str]) -> dict[str, object]:
+        asked.append(list(metrics))
+        return {"ts_pct": model.persistence}
+
+    monkeypatch.setattr(model_store, "build_persistence_panel", lambda *_: pl.DataFrame())
+    monkeypatch.setattr(model_store, "fit_persistence_all", fit_missing)
+
+    models = load_or_fit_all(
+        pl.DataFrame(), {"usg_pct": frame, "ts_pct": frame}, store=store_at(tmp_path)
+    )
+
+    assert asked == [["ts_pct"]]
+    assert list(models) == ["usg_pct", "ts_pct"]
+    assert models["usg_pct"].beta == model.beta
+    assert models["ts_pct"].beta == pytest.approx(model.beta, abs=1e-12)
+    assert store_at(tmp_path).get("ts_pct") is not None
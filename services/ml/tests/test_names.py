@@ -5,8 +5,13 @@ Every case here is a real name from the ingested data, not an invented one.
 
 from __future__ import annotations
 
+import random
+from pathlib import Path
+
+import polars as pl
 import pytest
 
+from hoopslab.transform.name_memo import NameMemo, resolve
 from hoopslab.transform.names import from_euroleague, match_key, normalize_name, strip_diacritics
 
 
@@ -91,3 +96,74 @@ class TestEuroLeagueNames:
     def test_result_matches_the_nba_spelling(self) -> None:
         """The property that actually matters for the crosswalk."""
         assert normalize_name(from_euroleague("DONCIC, LUKA")) == normalize_name("Luka Doncic")
+
+
+# ---------------------------------------------------------------- column engine
+
+#: Real spellings plus the edges the native path has to get exactly right:
+#: suffixes, initials in every punctuation, digits and underscores that are
+#: single characters but not letters, and runs of separators.
+PARITY_NAMES = [
+    "Nikola Jokić",
+    "P.J. Washington",
+    "PJ Washington",
+    "P J Washington",
+    "Gary Payton II",
+    "Jaren Jackson Jr.",
+    "Karl-Anthony Towns",
+    "Shaquille O'Neal",
+    "Shaquille O’Neal",  # noqa: RUF001
+    "Royce O`Neale",
+    "DONCIC, LUKA",
+    "O'NEAL, SHAQUILLE",
+    "TOWNS, KARL-ANTHONY",
+    "JR",
+    "A.J. B. C.D. Smith V",
+    "x 1 y _ z",
+    "  double   spaced , name ",
+    "semi;colon/slash&amp",
+    "",
+    "Ðorđe Petrović",
+    "ŁUKASZ, KOWALSKI",
+    "tab\there",
+    "Ĳsbrand ﬁnal",
+]
+
+
+def _random_names(n: int) -> list[str]:
+    alphabet = "abcdeXYZ .'-,_`9 jrivšđØ’\t"  # noqa: RUF001
+    rng = random.Random(7)
+    return ["".join(rng.choices(alphabet, k=rng.randint(0, 14))) for _ in range(n)]
+
+
+@pytest.mark.parametrize("style", ["plain", "euroleague"])
+def test_column_engine_matches_the_reference_functions(style: str) -> None:
+    raw = [*PARITY_NAMES, *_random_names(2000)]
+    resolved = {row["raw"]: row for row in resolve(pl.Series(raw), style).iter_rows(named=True)}  # type: ignore[arg-type]
+
+    assert len(resolved) == len(set(raw))
+    for value in raw:
+        display = from_euroleague(value) if style == "euroleague" else value
+        assert resolved[value]["player_name"] == display, value
+        assert resolved[value]["normalized_name"] == normalize_name(display), value
+        assert resolved[value]["match_key"] == match_key(display), value
+
+
+def test_name_memo_persists_and_only_resolves_new_names(tmp_path: Path) -> None:
+    path = tmp_path / "names.parquet"
+    memo = NameMemo(path)
+    first = memo.lookup(pl.Series(["Luka Dončić", "P.J. Washington", None, "Luka Dončić"]), "plain")
+    memo.save()
+
+    assert sorted(first["raw"].to_list()) == ["Luka Dončić", "P.J. Washington"]
+
+    reopened = NameMemo(path)
+    assert len(reopened) == 2
+    again = reopened.lookup(pl.Series(["P.J. Washington", "DONCIC, LUKA"]), "euroleague")
+    # The same raw value under another style is a different resolution.
+    assert len(reopened) == 4
+    assert again.filter(pl.col("raw") == "DONCIC, LUKA")["normalized_name"].item() == "luka doncic"
+
+    known = reopened.lookup(pl.Series(["P.J. Washington"]), "plain")
+    assert len(reopened) == 4
+    assert known["normalized_name"].to_list() == ["pj washington"]
@@ -48,7 +48,7 @@ def test_paths_are_absolute(repo_root: Path) -> None:
 
 
 def test_only_gold_and_crosswalk_are_committed(repo_root: Path) -> None:
-    """Bronze and silver must stay ignored; committing them would bloat the clone.
+    """Bronze, silver and local model state stay ignored; committing them bloats the clone.
 
     Gold is committed on purpose, which is what lets a fresh clone reproduce
     every reported number with no network access.
@@ -64,6 +64,8 @@ def test_only_gold_and_crosswalk_are_committed(repo_root: Path) -> None:
 
     assert "data/bronze/" in patterns
     assert "data/silver/" in patterns
+    assert "data/models/" in patterns
+    assert "data/pipeline/" in patterns
     assert "data/gold/" not in patterns
     assert "data/crosswalk/" not in patterns
 
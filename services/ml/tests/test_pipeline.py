@@ -0,0 +1,245 @@
+"""The stage runner behind ``hoopslab run``.
+
+Exercised on toy stages that write text files, so what is under test is the
+scheduling and the skip rule rather than any model.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from hoopslab import pipeline
+from hoopslab.paths import DataPaths
+from hoopslab.pipeline import Context, Stage, run_pipeline
+
+
+class Toy:
+    """A small graph: ``a`` feeds ``b`` and ``c``, which both feed ``d``."""
+
+    def __init__(self, root: Path) -> None:
+        self.context = Context(paths=DataPaths(root=root))
+        self.source = root / "source.txt"
+        self.source.write_text("1", encoding="utf-8")
+        self.calls: Counter[str] = Counter()
+        self.fail: set[str] = set()
+
+    def out(self, name: str) -> Path:
+        return self.context.paths.root / f"{name}.txt"
+
+    def stage(self, name: str, reads: list[Path], after: tuple[str, ...] = ()) -> Stage:
+        def run(_: Context) -> list[Path]:
+            self.calls[name] += 1
+            if name in self.fail:
+                raise RuntimeError(f"{name} broke")
+            text = "+".join(p.read_text(encoding="utf-8") for p in reads)
+            self.out(name).write_text(text, encoding="utf-8")
+            return [self.out(name)]
+
+        def inputs(_: Context) -> dict[str, str]:
+            return {str(p.name): p.read_text(encoding="utf-8") for p in reads}
+
+        return Stage(name, run, inputs, after=after)
+
+    def stages(self) -> list[Stage]:
+        return [
+            self.stage("a", [self.source]),
+            self.stage("b", [self.out("a")], after=("a",)),
+            self.stage("c", [self.out("a")], after=("a",)),
+            self.stage("d", [self.out("b"), self.out("c")], after=("b", "c")),
+        ]
+
+    def run(self, **kwargs) -> pipeline.PipelineReport:  # type: ignore[no-untyped-def]
+        return run_pipeline(self.context, self.stages(), **kwargs)
+
+
+@pytest.fixture
+def toy(tmp_path: Path) -> Toy:
+    return Toy(tmp_path)
+
+
+def test_a_second_run_skips_every_stage(toy: Toy) -> None:
+    first = toy.run()
+    second = toy.run()
+
+    assert first.succeeded
+    assert [o.status for o in first.outcomes] == ["ran"] * 4
+    assert [o.status for o in second.outcomes] == ["skipped"] * 4
+    assert toy.calls == Counter({"a": 1, "b": 1, "c": 1, "d": 1})
+
+
+def test_a_changed_input_reruns_its_stage_and_everything_downstream(toy: Toy) -> None:
+    toy.run()
+    toy.source.write_text("2", encoding="utf-8")
+
+    report = toy.run()
+
+    assert [o.status for o in report.outcomes] == ["ran"] * 4
+    assert toy.out("d").read_text(encoding="utf-8") == "2+2"
+
+
+def test_an_upstream_rerun_with_identical_output_skips_downstream(toy: Toy) -> None:
+    """Fingerprints are over content, so rerunning ``a`` alone costs nothing below it."""
+    toy.run()
+
+    report = toy.run(targets=["a"], force=True)
+    downstream = toy.run()
+
+    assert report.status("a") == "ran"
+    assert [o.status for o in downstream.outcomes] == ["skipped"] * 4
+
+
+def test_a_missing_output_forces_a_rerun(toy: Toy) -> None:
+    toy.run()
+    toy.out("c").unlink()
+
+    report = toy.run()
+
+    assert report.status("c") == "ran"
+    assert report.status("b") == "skipped"
+
+
+def test_independent_stages_run_at_the_same_time(tmp_path: Path) -> None:
+    """Each waits for the other; run one after the other, both would time out."""
+    barrier = threading.Barrier(2, timeout=10)
+
+    def meet(name: str) -> Stage:
+        def run(context: Context) -> list[Path]:
+            barrier.wait()
+            path = context.paths.root / name
+            path.touch()
+            return [path]
+
+        return Stage(name, run, lambda _: {})
+
+    report = run_pipeline(Context(paths=DataPaths(root=tmp_path)), [meet("x"), meet("y")])
+
+    assert report.succeeded
+
+
+def test_a_failure_blocks_its_dependents_and_nothing_else(toy: Toy) -> None:
+    toy.fail.add("b")
+
+    report = toy.run()
+
+    assert report.status("b") == "failed"
+    assert report.status("c") == "ran"
+    assert report.status("d") == "blocked"
+    assert not report.succeeded
+    assert "b broke" in next(o.detail for o in report.outcomes if o.name == "b")
+
+
+def test_a_failed_stage_is_retried_on_the_next_run(toy: Toy) -> None:
+    toy.fail.add("b")
+    toy.run()
+    toy.fail.clear()
+
+    report = toy.run()
+
+    assert report.status("b") == "ran"
+    assert report.status("c") == "skipped"
+    assert report.status("d") == "ran"
+
+
+def test_targets_bring_only_their_upstream(toy: Toy) -> None:
+    report = toy.run(targets=["b"])
+
+    assert [o.name for o in report.outcomes] == ["a", "b"]
+
+
+def test_unknown_stages_and_cycles_are_rejected(toy: Toy) -> None:
+    with pytest.raises(ValueError, match="unknown"):
+        toy.run(targets=["nope"])
+
+    looped = [
+        Stage("p", lambda _: [], lambda _: {}, after=("q",)),
+        Stage("q", lambda _: [], lambda _: {}, after=("p",)),
+    ]
+    with pytest.raises(ValueError, match="cycle"):
+        run_pipeline(toy.context, looped)
+
+
+def test_an_unavailable_stage_is_skipped_with_its_reason(tmp_path: Path) -> None:
+    stage = Stage("s", lambda _: [], lambda _: {}, unavailable=lambda _: "no bronze")
+
+    report = run_pipeline(Context(paths=DataPaths(root=tmp_path)), [stage])
+
+    assert report.outcomes[0].status == "skipped"
+    assert report.outcomes[0].detail == "no bronze"
+
+
+def test_roles_are_fitted_beside_the_translation_model() -> None:
+    """The archetypes read player_seasons only, so nothing orders them after ``train``."""
+    stages = {stage.name: stage for stage in pipeline.STAGES}
+
+    assert stages["roles"].after == ("build",)
+    assert stages["train"].after == ("build",)
+    assert set(stages["export"].after) == {"train", "roles"}
+    assert pipeline.order_stages(pipeline.STAGES)[0].name == "build"
+
+
+#: Whether a change to each module reruns each code-fingerprinted stage.
+STAGE_CODE = {
+    "train": {
+        "models/train.py": True,
+        "transform/keys.py": True,
+        "validate/contracts.py": True,
+        "seasons.py": True,
+        "serve/d1_export.py": False,
+        "cli.py": False,
+    },
+    "export": {
+        "serve/d1_export.py": True,
+        "eval/diagnostics.py": True,
+        "transform/keys.py": True,
+        "transform/names.py": True,
+        "validate/contracts.py": True,
+        "cli.py": False,
+    },
+    "report-eval": {
+        "llm/harness.py": True,
+        "eval/resample.py": True,
+        "transform/keys.py": True,
+        "validate/contracts.py": True,
+        "serve/d1_export.py": False,
+        "cli.py": False,
+    },
+}
+
+
+@pytest.mark.parametrize(
+    ("stage_name", "module", "reruns"),
+    [
+        (stage, module, reruns)
+        for stage, code in STAGE_CODE.items()
+        for module, reruns in code.items()
+    ],
+)
+def test_a_stage_reruns_for_any_code_it_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, stage_name: str, module: str, reruns: bool
+) -> None:
+    package = tmp_path / "hoopslab"
+    for name in STAGE_CODE[stage_name]:
+        (package / name).parent.mkdir(parents=True, exist_ok=True)
+        (package / name).write_text("x = 1\n", encoding="utf-8")
+    monkeypatch.setattr(pipeline, "_PACKAGE_ROOT", package)
+    stage = {stage.name: stage for stage in pipeline.STAGES}[stage_name]
+    context = Context(paths=DataPaths(root=tmp_path / "data"))
+    before = stage.inputs(context)
+
+    (package / module).write_text("x = 2\n", encoding="utf-8")
+
+    assert (stage.inputs(context) != before) is reruns
+
+
+def test_a_different_match_policy_rebuilds_gold(tmp_path: Path) -> None:
+    build = {stage.name: stage for stage in pipeline.STAGES}["build"]
+    paths = DataPaths(root=tmp_path)
+
+    default = build.inputs(Context(paths=paths))
+    wide = build.inputs(Context(paths=paths, match_policy="wide"))
+
+    assert default != wide
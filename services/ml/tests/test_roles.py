@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import numpy as np
 import polars as pl
 import pytest
 
-from hoopslab.models.archetypes import clr_transform, standardize_within_season
+from hoopslab.models.archetypes import (
+    ROLE_FEATURES,
+    SHOT_MIX_FEATURES,
+    best_jaccard,
+    clr_transform,
+    cluster_stability,
+    design_matrix,
+    standardize_within_season,
+)
+from hoopslab.models.roles import RolesResult, load_roles, save_roles
 from hoopslab.models.shooting import fit_beta_prior, shrink_three_point
 
 
@@ -63,6 +74,99 @@ class TestWithinSeasonStandardisation:
         assert np.allclose(out, 0.0)
 
 
+def design_one_season_at_a_time(frame: pl.DataFrame) -> np.ndarray:
+    """The definition: log-ratios of the shares, then z-scores season by season."""
+    raw = np.column_stack(
+        [
+            frame.select(ROLE_FEATURES).to_numpy(),
+            clr_transform(frame.select(SHOT_MIX_FEATURES).to_numpy()),
+        ]
+    )
+    seasons = frame["season_id"].to_numpy()
+    out = np.zeros_like(raw)
+    for season in np.unique(seasons):
+        rows = seasons == season
+        spread = raw[rows].std(axis=0)
+        out[rows] = np.where(spread > 0, (raw[rows] - raw[rows].mean(axis=0)) / spread, 0.0)
+    return out
+
+
+class TestDesignMatrix:
+    def test_is_the_per_season_construction_in_one_contiguous_array(self) -> None:
+        frame = role_frame().with_columns(
+            pl.when(pl.col("season_id") == "NBA_2020")
+            .then(pl.col(SHOT_MIX_FEATURES[0]) * 1.5)
+            .otherwise(pl.col(SHOT_MIX_FEATURES[0]))
+        )
+
+        design, names = design_matrix(frame)
+
+        assert names == [*ROLE_FEATURES, *(f"clr_{c}" for c in SHOT_MIX_FEATURES)]
+        assert design.dtype == np.float64
+        assert design.flags["C_CONTIGUOUS"]
+        assert design == pytest.approx(design_one_season_at_a_time(frame), abs=1e-12)
+
+
+def role_frame(n: int = 300, seed: int = 0) -> pl.DataFrame:
+    """Three well-separated kinds of player across two seasons."""
+    rng = np.random.default_rng(seed)
+    kind = np.arange(n) % 3
+    centres = rng.normal(scale=4.0, size=(3, len(ROLE_FEATURES)))
+    role = centres[kind] + rng.normal(size=(n, len(ROLE_FEATURES)))
+    mix = np.array([[0.7, 0.1, 0.2], [0.3, 0.5, 0.2], [0.45, 0.35, 0.2]])[kind]
+    return pl.DataFrame(
+        {
+            "season_id": np.where(np.arange(n) < n // 2, "NBA_2019", "NBA_2020"),
+            **{name: role[:, i] for i, name in enumerate(ROLE_FEATURES)},
+            **{name: mix[:, i] for i, name in enumerate(SHOT_MIX_FEATURES)},
+        }
+    )
+
+
+class TestClusterStability:
+    def test_overlap_is_the_jaccard_index_of_the_drawn_rows(self) -> None:
+        rng = np.random.default_rng(2)
+        reference = rng.integers(0, 4, size=60)
+        sample = rng.integers(0, 60, size=60)
+        by_row = dict(zip(sample.tolist(), rng.integers(0, 4, size=60).tolist(), strict=True))
+        labels = np.array([by_row[row] for row in sample.tolist()])
+
+        expected = []
+        for cluster in range(4):
+            members = set(np.flatnonzero(reference == cluster).tolist())
+            drawn = [
+                {int(r) for r, b in zip(sample, labels, strict=True) if b == c} for c in range(4)
+            ]
+            expected.append(max(len(members & d) / len(members | d) for d in drawn))
+
+        assert best_jaccard(reference, sample, labels, 4) == pytest.approx(expected)
+
+    def test_a_cluster_with_no_rows_scores_nan(self) -> None:
+        overlap = best_jaccard(np.array([0, 0, 2]), np.array([0, 1, 2]), np.array([0, 0, 2]), 3)
+
+        assert overlap[0] == 1.0
+        assert np.isnan(overlap[1])
+
+    def test_separated_clusters_are_stable_however_many_processes_score_them(self) -> None:
+        frame = role_frame()
+
+        alone = cluster_stability(frame, k=3, seed=5, n_boot=6)
+        pooled = cluster_stability(frame, k=3, seed=5, n_boot=6, workers=2)
+
+        assert alone == pooled
+        # Reference clusters keep the rows a resample never drew, so perfect
+        # agreement scores the share drawn: about 1 - 1/e.
+        assert all(v == pytest.approx(1 - np.exp(-1), abs=0.03) for v in alone.values())
+
+    def test_a_warm_start_agrees_where_the_clusters_are_unambiguous(self) -> None:
+        frame = role_frame()
+
+        cold = cluster_stability(frame, k=3, seed=5, n_boot=6)
+        warm = cluster_stability(frame, k=3, seed=5, n_boot=6, warm_start=True)
+
+        assert warm == pytest.approx(cold, abs=1e-12)
+
+
 class TestBetaPrior:
     def test_recovers_the_population_mean(self) -> None:
         rng = np.random.default_rng(0)
@@ -206,3 +310,32 @@ class TestShrinkage:
         for column in ("fg3_pct_shrunk", "shrinkage_weight", "spacing_score"):
             values = result[column].to_numpy().astype(float)
             assert np.isfinite(values).all()
+
+
+class TestPersistence:
+    def test_a_saved_result_reads_back_unchanged(self, tmp_path: Path) -> None:
+        """What the pipeline hands the export in place of a second fit."""
+        frame = pl.DataFrame({"person_id": ["a", "b"], "cluster": [0, 1]})
+        result = RolesResult(
+            assignments=frame,
+            neighbours=frame.rename({"cluster": "rank"}),
+            cluster_descriptions=pl.DataFrame({"cluster": [0, 1], "label": ["x", "y"]}),
+            shooting=pl.DataFrame({"person_id": ["a"], "spacing_score": [0.5]}),
+            embedding=pl.DataFrame({"person_id": ["a", "b"], "axis_0": [0.1, -0.2]}),
+            explained_variance=0.61,
+            stability={0: 0.5, 1: 0.4},
+            k_selection={4: -6.5, 5: -6.4},
+        )
+
+        loaded = load_roles(save_roles(result, tmp_path / "roles"))
+
+        assert loaded is not None
+        assert loaded.assignments.equals(result.assignments)
+        assert loaded.neighbours.equals(result.neighbours)
+        assert loaded.embedding.equals(result.embedding)
+        assert loaded.stability == result.stability
+        assert loaded.k_selection == result.k_selection
+        assert loaded.explained_variance == result.explained_variance
+
+    def test_nothing_saved_reads_as_none(self, tmp_path: Path) -> None:
+        assert load_roles(tmp_path / "roles") is None
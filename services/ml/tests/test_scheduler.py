@@ -0,0 +1,147 @@
+"""Concurrent per-source ingest scheduling."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from hoopslab.ingest.run import IngestReport, _guard, summarise
+from hoopslab.ingest.scheduler import FetchTask, SourcePlan, run_concurrently, run_plan
+from hoopslab.io.bronze import BronzeCache
+
+
+def sleeping_tasks(prefix: str, n: int, seconds: float) -> list[FetchTask]:
+    return [FetchTask(f"{prefix}/{i}", lambda: time.sleep(seconds)) for i in range(n)]
+
+
+def recording(report: IngestReport):  # type: ignore[no-untyped-def]
+    return lambda task: _guard(report, task.what, task.call)
+
+
+def test_sources_run_side_by_side() -> None:
+    """Three sources of 0.1 s each finish together, not one after another."""
+    plans = [SourcePlan(name, sleeping_tasks(name, 1, 0.1)) for name in ("a", "b", "c")]
+
+    started = time.monotonic()
+    run_concurrently(plans, recording(IngestReport()))
+
+    assert time.monotonic() - started < 0.25
+
+
+def test_one_worker_runs_a_source_strictly_in_sequence() -> None:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def task() -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+
+    plan = SourcePlan("nba", [FetchTask(f"nba/{i}", task) for i in range(6)], workers=1)
+    run_plan(plan, recording(IngestReport()))
+
+    assert peak == 1
+
+
+def test_every_task_lands_in_the_report() -> None:
+    report = IngestReport()
+    plans = [
+        SourcePlan("a", sleeping_tasks("a", 5, 0.0), workers=2),
+        SourcePlan("b", sleeping_tasks("b", 7, 0.0), workers=3),
+    ]
+
+    run_concurrently(plans, recording(report))
+
+    assert sorted(report.fetched) == sorted(t.what for p in plans for t in p.tasks)
+
+
+def test_unchanged_payloads_are_reported_separately(tmp_path: Path) -> None:
+    cache = BronzeCache(tmp_path)
+    frame = pd.DataFrame({"i": [1, 2]})
+    cache.fetch(source="s", endpoint="e", params={}, fetcher=lambda: frame)
+    report = IngestReport()
+
+    task = FetchTask(
+        "s/e",
+        lambda: cache.fetch(
+            source="s", endpoint="e", params={}, fetcher=lambda: frame, refresh=True
+        ),
+    )
+    run_concurrently([SourcePlan("s", [task])], recording(report))
+
+    assert report.unchanged == ["s/e"]
+    assert report.fetched == []
+    assert "unchanged 1" in summarise(report)
+
+
+def test_a_failure_is_recorded_without_stopping_the_source() -> None:
+    def broken() -> None:
+        raise RuntimeError("source unavailable")
+
+    report = IngestReport()
+    tasks = [FetchTask("a/0", broken), *sleeping_tasks("a", 3, 0.0)]
+
+    run_concurrently([SourcePlan("a", tasks)], recording(report))
+
+    assert len(report.fetched) == 3
+    assert report.failed == [("a/0", "RuntimeError: source unavailable")]
+
+
+def test_stats_come_back_in_plan_order_with_queue_depth() -> None:
+    plans = [SourcePlan("slow", sleeping_tasks("slow", 4, 0.02)), SourcePlan("empty", [])]
+
+    stats = run_concurrently(plans, recording(IngestReport()))
+
+    assert [s.source for s in stats] == ["slow", "empty"]
+    assert stats[0].n_tasks == 4
+    # One worker picks up the first task with three still waiting behind it.
+    assert stats[0].max_queue_depth == 3
+    assert stats[0].depth_samples == [3, 2, 1, 0]
+    assert stats[0].wall_seconds >= 0.08
+    assert stats[1].mean_queue_depth == 0.0
+
+
+def test_summary_lists_each_source() -> None:
+    report = IngestReport()
+    report.sources = run_concurrently(
+        [SourcePlan("espn", sleeping_tasks("espn", 2, 0.0), workers=2)], recording(report)
+    )
+
+    text = summarise(report)
+
+    assert "per source:" in text
+    assert "espn" in text
+    assert "2 tasks" in text
+
+
+def test_workers_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        SourcePlan("a", [], workers=0)
+
+
+def test_concurrent_fetches_through_one_cache_all_reach_the_manifest(tmp_path: Path) -> None:
+    cache = BronzeCache(tmp_path)
+
+    def fetch(i: int) -> None:
+        cache.fetch(
+            source="s",
+            endpoint="e",
+            params={"i": i},
+            fetcher=lambda: pd.DataFrame({"i": [i] * 50}),
+        )
+
+    tasks = [FetchTask(f"s/{i}", lambda i=i: fetch(i)) for i in range(40)]
+    run_concurrently([SourcePlan("s", tasks, workers=8)], recording(IngestReport()))
+
+    manifest = cache.manifest()
+    assert len(manifest) == 40
+    assert sorted(entry["params"]["i"] for entry in manifest) == list(range(40))
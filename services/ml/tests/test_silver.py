@@ -0,0 +1,225 @@
+"""Bronze to silver, reading payloads straight into polars."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from hoopslab.io.bronze import BronzeCache
+from hoopslab.seasons import Season, seasons_for
+from hoopslab.transform import consolidate, silver
+
+NBA_COUNTING = ["GP", "MIN", "PTS", "FGA", "FGM", "FG3A", "FG3M", "FTA", "FTM"]
+NBA_COUNTING += ["OREB", "DREB", "REB", "AST", "TOV", "STL", "BLK", "PF"]
+
+
+def put(cache: BronzeCache, source: str, endpoint: str, params: dict, frame: pd.DataFrame) -> None:
+    cache.fetch(source=source, endpoint=endpoint, params=params, fetcher=lambda: frame)
+
+
+def nba_params(season: Season, measure: str | None = None) -> dict:
+    params = {
+        "season": season.nba_stats_season,
+        "league_id": "00" if season.league == "NBA" else "20",
+    }
+    if measure is not None:
+        params["measure_type"] = measure
+    return params
+
+
+def nba_base_frame(ids: tuple[int, ...] = (201939, 2544, 1629029)) -> pd.DataFrame:
+    players = {
+        201939: ("Stephen Curry", 1610612744, "GSW"),
+        2544: ("LeBron James", 1610612747, "LAL"),
+        1629029: ("Luka Dončić", 1610612742, "DAL"),
+        1630000: ("Some Prospect", 1612709890, "SXF"),
+    }
+    frame = pd.DataFrame(
+        {
+            "PLAYER_ID": list(ids),
+            "PLAYER_NAME": [players[i][0] for i in ids],
+            "TEAM_ID": [players[i][1] for i in ids],
+            "TEAM_ABBREVIATION": [players[i][2] for i in ids],
+        }
+    )
+    for i, column in enumerate(NBA_COUNTING):
+        frame[column] = [10 * (k + 1) + i for k in range(len(ids))]
+    return frame
+
+
+@pytest.fixture
+def nba_cache(tmp_path: Path) -> tuple[BronzeCache, Season]:
+    cache = BronzeCache(tmp_path)
+    season = seasons_for("NBA")[-1]
+    put(cache, "nba_stats", "player_season_stats", nba_params(season, "Base"), nba_base_frame())
+    put(
+        cache,
+        "nba_stats",
+        "player_bio_stats",
+        nba_params(season),
+        pd.DataFrame({"PLAYER_ID": [201939, 2544], "AGE": [35.0, 39.0], "COUNTRY": ["USA"] * 2}),
+    )
+    put(
+        cache,
+        "nba_stats",
+        "player_season_stats",
+        nba_params(season, "Advanced"),
+        pd.DataFrame(
+            {
+                "PLAYER_ID": [201939],
+                "USG_PCT": [0.3],
+                "TS_PCT": [0.62],
+                "AST_PCT": [0.25],
+                "OREB_PCT": [0.02],
+                "DREB_PCT": [0.1],
+                "PIE": [0.15],
+            }
+        ),
+    )
+    return cache, season
+
+
+def test_load_polars_matches_the_pandas_read(tmp_path: Path) -> None:
+    """Including a mixed-type column the writer had to coerce to strings."""
+    cache = BronzeCache(tmp_path)
+    frame = nba_base_frame()
+    frame["MIXED"] = [1.5, "", None]
+    put(cache, "s", "e", {}, frame)
+
+    direct = cache.load_polars("s", "e", {})
+
+    assert direct is not None
+    assert direct.equals(pl.from_pandas(cache.load("s", "e", {})))
+    assert cache.load_polars("s", "e", {"missing": True}) is None
+
+
+def test_scan_reads_only_the_selected_columns(tmp_path: Path) -> None:
+    cache = BronzeCache(tmp_path)
+    put(cache, "s", "e", {}, nba_base_frame())
+
+    lazy = cache.scan("s", "e", {})
+
+    assert lazy is not None
+    assert lazy.select("PTS").collect()["PTS"].to_list() == [12, 22, 32]
+    assert cache.scan("s", "e", {"missing": True}) is None
+
+
+def test_nba_player_seasons_maps_counting_stats_and_joins_age(nba_cache) -> None:  # type: ignore[no-untyped-def]
+    cache, season = nba_cache
+
+    players = silver.nba_player_seasons(cache, "NBA")
+
+    assert players.columns == silver.PLAYER_SEASON_COLUMNS
+    assert players.height == 3
+    by_id = {row["source_player_id"]: row for row in players.iter_rows(named=True)}
+    assert by_id["201939"]["season_id"] == season.season_id
+    assert by_id["201939"]["pts"] == 12.0
+    assert by_id["2544"]["age"] == 39.0
+    assert by_id["1629029"]["age"] is None
+    assert by_id["1629029"]["normalized_name"] == "luka doncic"
+
+
+def test_nba_official_rates_projects_the_rate_columns(nba_cache) -> None:  # type: ignore[no-untyped-def]
+    cache, season = nba_cache
+
+    official = silver.nba_official_rates(cache, "NBA")
+
+    assert official.to_dicts() == [
+        {
+            "season_id": season.season_id,
+            "source_player_id": "201939",
+            "official_usg_pct": 0.3,
+            "official_ts_pct": 0.62,
+            "official_ast_pct": 0.25,
+            "official_oreb_pct": 0.02,
+            "official_dreb_pct": 0.1,
+        }
+    ]
+
+
+def test_an_empty_bronze_gives_empty_typed_silver(tmp_path: Path) -> None:
+    cache = BronzeCache(tmp_path)
+
+    assert silver.nba_player_seasons(cache, "NBA").columns == silver.PLAYER_SEASON_COLUMNS
+    assert silver.euroleague_player_seasons(cache).is_empty()
+    assert silver.nba_official_rates(cache, "NBA").is_empty()
+
+
+def test_rows_keep_season_then_payload_order(tmp_path: Path) -> None:
+    """The order the per-season loop produced, which crosswalk tie-breaks rely on."""
+    cache = BronzeCache(tmp_path)
+    early, late = seasons_for("NBA")[-2:]
+    # Written late season first, and with ids deliberately out of sorted order.
+    put(cache, "nba_stats", "player_season_stats", nba_params(late, "Base"), nba_base_frame())
+    put(
+        cache,
+        "nba_stats",
+        "player_season_stats",
+        nba_params(early, "Base"),
+        nba_base_frame((2544, 201939)),
+    )
+    gl = seasons_for("GL")[-1]
+    put(
+        cache,
+        "nba_stats",
+        "player_season_stats",
+        nba_params(gl, "Base"),
+        nba_base_frame((1630000,)),
+    )
+
+    players = silver.nba_player_seasons(cache, "NBA")
+
+    assert players.select("season_id", "source_player_id").rows() == [
+        (early.season_id, "2544"),
+        (early.season_id, "201939"),
+        (late.season_id, "201939"),
+        (late.season_id, "2544"),
+        (late.season_id, "1629029"),
+    ]
+    assert players["start_year"].dtype == pl.Float64
+    assert silver.nba_player_seasons(cache, "GL")["source_player_id"].to_list() == ["1630000"]
+
+
+class TestConsolidate:
+    def test_publishes_hive_partitions_per_league_and_season(self, nba_cache) -> None:  # type: ignore[no-untyped-def]
+        cache, season = nba_cache
+
+        assert consolidate.publish(cache, "nba_player_stats")
+
+        root = consolidate.dataset_path(cache, "nba_player_stats")
+        partition = root / "measure_type=Base" / "league=NBA" / f"season_id={season.season_id}"
+        assert any(partition.glob("*.parquet"))
+        assert any((root / "measure_type=Advanced").rglob("*.parquet"))
+
+    def test_an_unchanged_bronze_is_not_republished(self, nba_cache) -> None:  # type: ignore[no-untyped-def]
+        cache, _ = nba_cache
+        consolidate.publish_all(cache)
+
+        assert consolidate.publish_all(cache) == []
+
+    def test_a_changed_payload_is_picked_up(self, nba_cache) -> None:  # type: ignore[no-untyped-def]
+        cache, season = nba_cache
+        silver.nba_player_seasons(cache, "NBA")
+
+        frame = nba_base_frame()
+        frame["PTS"] = [1, 2, 3]
+        cache.fetch(
+            source="nba_stats",
+            endpoint="player_season_stats",
+            params=nba_params(season, "Base"),
+            fetcher=lambda: frame,
+            refresh=True,
+        )
+
+        assert silver.nba_player_seasons(cache, "NBA")["pts"].to_list() == [1.0, 2.0, 3.0]
+
+    def test_scan_prunes_to_the_selected_partition(self, nba_cache) -> None:  # type: ignore[no-untyped-def]
+        cache, _ = nba_cache
+        lazy = consolidate.scan(cache, "nba_player_stats")
+
+        assert lazy is not None
+        advanced = lazy.filter(pl.col("measure_type") == "Advanced").select("USG_PCT").collect()
+        assert advanced["USG_PCT"].to_list() == [0.3]
@@ -11,11 +11,16 @@ from hoopslab.eval.leakage import (
     assert_no_entity_overlap,
     assert_temporal_disjoint,
 )
+from hoopslab.eval.resample import person_codes
+from hoopslab.features.translation import persistence_view
 from hoopslab.models.baselines import FOLK_MULTIPLIER, folk_rule, z_preservation
 from hoopslab.models.translation import (
     AGE_REFERENCE,
+    bootstrap_translation,
     fit_persistence,
+    fit_persistence_all,
     fit_translation,
+    fit_translation_all,
 )
 
 
@@ -177,3 +182,134 @@ class TestTranslationFit:
         model = fit_translation(transition_frame(), persistence, "usg_pct")
 
         assert model.residual_sd > 0
+
+
+class TestCoefficientBootstrap:
+    @staticmethod
+    def repeat_movers(frame: pl.DataFrame) -> pl.DataFrame:
+        """Two transitions per player, as a third of the real cohort has."""
+        return frame.with_columns(pl.format("p{}", pl.int_range(pl.len()) // 2).alias("person_id"))
+
+    def test_each_replicate_is_the_refit_on_its_resampled_players(self) -> None:
+        persistence = fit_persistence(persistence_frame(), "usg_pct")
+        frame = self.repeat_movers(transition_frame())
+
+        bootstrap = bootstrap_translation(frame, persistence, seed=3, n_boot=4)
+
+        codes, n_people = person_codes(frame["person_id"].to_list())
+        rng = np.random.default_rng(3)
+        for draw in bootstrap.draws:
+            sampled = rng.choice(n_people, size=n_people, replace=True)
+            rows = np.concatenate([np.flatnonzero(codes == person) for person in sampled])
+            refit = fit_translation(frame[rows], persistence, "usg_pct")
+            expected = [
+                *(refit.intercepts[d] for d in ("EL->NBA", "NBA->EL")),
+                refit.beta,
+                refit.gamma_log_minutes,
+                refit.eta_gap,
+            ]
+            assert draw == pytest.approx(expected, abs=1e-9)
+
+    def test_the_interval_brackets_the_full_sample_estimate(self) -> None:
+        persistence = fit_persistence(persistence_frame(), "usg_pct")
+        frame = transition_frame()
+        model = fit_translation(frame, persistence, "usg_pct")
+
+        bootstrap = bootstrap_translation(frame, persistence, seed=3)
+        low, high = bootstrap.interval("beta")
+
+        assert bootstrap.summary()["beta"]["estimate"] == pytest.approx(model.beta)
+        assert low < model.beta < high
+
+    def test_a_direction_missing_from_a_resample_is_not_estimated_there(self) -> None:
+        persistence = fit_persistence(persistence_frame(), "usg_pct")
+        frame = pl.concat(
+            [
+                transition_frame(),
+                transition_frame(n=1, seed=9).with_columns(
+                    pl.lit("GL->NBA").alias("direction"), pl.lit("rare").alias("person_id")
+                ),
+            ]
+        )
+
+        bootstrap = bootstrap_translation(frame, persistence, seed=3, n_boot=500)
+        rare = bootstrap.draws[:, bootstrap.columns.index("alpha[GL->NBA]")]
+
+        assert 0 < np.isnan(rare).sum() < rare.size
+        assert not np.isnan(bootstrap.draws[:, bootstrap.columns.index("beta")]).any()
+        assert bootstrap.summary()["alpha[GL->NBA]"]["n_draws"] == (~np.isnan(rare)).sum()
+
+
+class TestBatchedFit:
+    @staticmethod
+    def panel() -> pl.DataFrame:
+        """Two metrics over the same player-seasons; assists missing for some of them."""
+        usg = persistence_frame(seed=0)
+        ast = persistence_frame(slope=0.9, seed=1)
+        return usg.select(
+            "person_id",
+            pl.lit("NBA").alias("league"),
+            "season_order",
+            pl.lit(1_500.0).alias("minutes"),
+            "age",
+            "log_minutes",
+            pl.col("z_from").alias("z_from_usg_pct"),
+            pl.col("z_to").alias("z_to_usg_pct"),
+            pl.when(pl.int_range(pl.len()) % 7 != 0).then(ast["z_from"]).alias("z_from_ast_pct"),
+            ast["z_to"].alias("z_to_ast_pct"),
+        )
+
+    @staticmethod
+    def keyed(frame: pl.DataFrame) -> pl.DataFrame:
+        return frame.with_columns(
+            pl.lit("EL_2019").alias("source_season_id"),
+            pl.format("NBA_{}", pl.int_range(pl.len())).alias("target_season_id"),
+        )
+
+    def test_each_persistence_fit_is_the_metrics_own(self) -> None:
+        panel = self.panel()
+
+        batched = fit_persistence_all(panel, ["usg_pct", "ast_pct"])
+
+        for metric in ("usg_pct", "ast_pct"):
+            single = fit_persistence(persistence_view(panel, metric), metric)
+            assert batched[metric].n_train == single.n_train
+            assert batched[metric].r_squared == pytest.approx(single.r_squared, abs=1e-12)
+            for name, value in single.coefficients.items():
+                assert batched[metric].coefficients[name] == pytest.approx(value, abs=1e-12)
+
+    def test_each_translation_fit_is_the_metrics_own(self) -> None:
+        usg = self.keyed(transition_frame(seed=1))
+        ast = usg.with_columns(z_target=-0.5 * pl.col("z_source") + 0.1 * pl.col("gap_seasons"))
+        frames = {"usg_pct": usg, "ast_pct": ast, "tov_rate": usg.head(150)}
+        persistence = fit_persistence_all(self.panel(), ["usg_pct", "ast_pct"])
+        persistence["tov_rate"] = persistence["usg_pct"]
+
+        batched = fit_translation_all(frames, persistence)
+
+        assert list(batched) == list(frames)
+        for metric, frame in frames.items():
+            single = fit_translation(frame, persistence[metric], metric)
+            model = batched[metric]
+            assert model.n_train == single.n_train
+            assert model.directions == single.directions
+            assert model.beta == pytest.approx(single.beta, abs=1e-12)
+            assert model.residual_sd == pytest.approx(single.residual_sd, abs=1e-12)
+            for direction, value in single.intercepts.items():
+                assert model.intercepts[direction] == pytest.approx(value, abs=1e-12)
+
+    def test_a_collinear_subset_fits_as_the_single_metric_fit_does(self) -> None:
+        """Every gap one season: the gap column duplicates the direction intercepts."""
+        usg = self.keyed(transition_frame(seed=1)).with_columns(pl.lit(1).alias("gap_seasons"))
+        frames = {"usg_pct": usg, "ast_pct": usg.with_columns(z_target=-0.5 * pl.col("z_source"))}
+        persistence = fit_persistence_all(self.panel(), ["usg_pct", "ast_pct"])
+
+        batched = fit_translation_all(frames, persistence)
+
+        for metric, frame in frames.items():
+            single = fit_translation(frame, persistence[metric], metric)
+            assert batched[metric].beta == pytest.approx(single.beta, abs=1e-10)
+            assert batched[metric].eta_gap == pytest.approx(single.eta_gap, abs=1e-10)
+            assert batched[metric].residual_sd == pytest.approx(single.residual_sd, abs=1e-10)
+            for direction, value in single.intercepts.items():
+                assert batched[metric].intercepts[direction] == pytest.approx(value, abs=1e-10)